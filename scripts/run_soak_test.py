@@ -21,7 +21,7 @@ Scenarios:
     - scheduler: Scheduler heartbeat and status monitoring
     - database: Connection pool stability and query performance
     - api: Rate limit recovery and endpoint availability
-    - memory: Memory growth detection over time
+    - memory: Memory growth detection over time (per-ticker state churn, flat RSS)
 
 Related:
     - Issue #282: Set up 24-hour local soak testing infrastructure
@@ -99,6 +99,7 @@ class SoakTestConfig:
     ci_mode: bool = False
     output_dir: Path = field(default_factory=lambda: Path("soak_test_results"))
     memory_growth_threshold_mb: float = 100.0  # Alert if memory grows by this much
+    flat_rss_tolerance_mb: float = 25.0  # Memory scenario: allowed RSS drift after warm-up
     error_rate_threshold: float = 0.01  # Alert if error rate exceeds 1%
     verbose: bool = False
 
@@ -448,6 +449,12 @@ class DatabaseScenario(SoakTestScenario):
 class MemoryScenario(SoakTestScenario):
     """Test memory stability and garbage collection.
 
+    Every run also drives CHURN_ENTITIES fresh markets and games through a
+    full lifecycle (live, then settled/final) in long-lived validators and a
+    team code registry, the way a weeks-long poller does. Their per-ticker
+    state must stay bounded and process RSS must stay flat (within
+    flat_rss_tolerance_mb of the post-warm-up baseline).
+
     Educational Note:
         Memory leaks in Python often come from:
         - Circular references not collected
@@ -458,15 +465,101 @@ class MemoryScenario(SoakTestScenario):
 
     name = "memory"
 
+    # Markets and games opened (and settled) per run
+    CHURN_ENTITIES: ClassVar[int] = 500
+    # Runs before the RSS baseline is taken (imports and caches warming up)
+    RSS_WARMUP_RUNS: ClassVar[int] = 3
+
     def __init__(self, config: SoakTestConfig) -> None:
         super().__init__(config)
         self.previous_gc_stats: dict[str, int] = {}
+        self.baseline_rss_mb: float | None = None
+        self._process: Any = None
+        self._kalshi_validator: Any = None
+        self._espn_validator: Any = None
+        self._team_registry: Any = None
+
+    def _rss_mb(self) -> float | None:
+        """Current process RSS in MB, or None when psutil is unavailable."""
+        if self._process is None:
+            try:
+                import psutil
+            except ImportError:
+                return None
+            self._process = psutil.Process()
+        return float(self._process.memory_info().rss) / (1024 * 1024)
+
+    def _churn_lifecycle_state(self) -> dict[str, int]:
+        """Open, validate and settle a batch of markets and games; return state gauges."""
+        import logging
+
+        from precog.matching.team_code_registry import TeamCodeRegistry
+        from precog.validation.espn_validation import ESPNDataValidator
+        from precog.validation.kalshi_validation import KalshiDataValidator
+
+        if self._kalshi_validator is None:
+            self._kalshi_validator = KalshiDataValidator()
+            self._espn_validator = ESPNDataValidator()
+            self._team_registry = TeamCodeRegistry()
+
+        prefix = f"SOAK{self.run_count}"
+        live_markets = [
+            {
+                "ticker": f"KX{prefix}-{i}",
+                "status": "active",
+                "yes_bid_dollars": Decimal("0.40"),
+                "yes_ask_dollars": Decimal("0.70"),  # wide spread -> anomaly entry
+                "no_bid_dollars": Decimal("0.30"),
+                "no_ask_dollars": Decimal("0.60"),
+            }
+            for i in range(self.CHURN_ENTITIES)
+        ]
+        settled_markets = [
+            {
+                **market,
+                "status": "settled",
+                "yes_bid_dollars": Decimal("1"),
+                "yes_ask_dollars": Decimal("1"),
+                "no_bid_dollars": Decimal("0"),
+                "no_ask_dollars": Decimal("0.5"),  # not at 0/1 -> anomaly entry
+            }
+            for market in live_markets
+        ]
+        self._kalshi_validator.validate_market_batch(live_markets)
+        self._kalshi_validator.validate_market_batch(settled_markets)
+
+        # Negative scores are flagged on every poll; silence the per-game log lines
+        espn_logger = logging.getLogger("precog.validation.espn_validation")
+        previous_level = espn_logger.level
+        espn_logger.setLevel(logging.CRITICAL)
+        try:
+            for i in range(self.CHURN_ENTITIES):
+                for status in ("in", "final"):
+                    self._espn_validator.validate_game_state(
+                        {
+                            "metadata": {"espn_event_id": f"{prefix}{i}", "league": "nfl"},
+                            "state": {"game_status": status, "home_score": -1, "away_score": 0},
+                        }
+                    )
+        finally:
+            espn_logger.setLevel(previous_level)
+
+        for i in range(self.CHURN_ENTITIES):
+            self._team_registry.record_unknown_code(f"{prefix}{i}", "nfl")
+
+        return {
+            **self._kalshi_validator.get_state_stats(),
+            **{f"espn_{k}": v for k, v in self._espn_validator.get_state_stats().items()},
+            **self._team_registry.get_state_stats(),
+        }
 
     def run(self) -> ScenarioResult:
         start = time.perf_counter()
         self.run_count += 1
 
         try:
+            state_stats = self._churn_lifecycle_state()
+
             # Force garbage collection to get accurate measurements
             gc.collect()
 
@@ -484,14 +577,42 @@ class MemoryScenario(SoakTestScenario):
                 "gc_uncollectable_gen0": gc_stats[0].get("uncollectable", 0),
                 "gc_uncollectable_gen1": gc_stats[1].get("uncollectable", 0),
                 "gc_uncollectable_gen2": gc_stats[2].get("uncollectable", 0),
+                **state_stats,
             }
 
             # Check for uncollectable objects (potential memory leak)
             total_uncollectable = sum(gc_stats[i].get("uncollectable", 0) for i in range(3))
 
+            # Flat-RSS assertion: after warm-up, churning per-ticker state
+            # must not grow the process
+            rss_mb = self._rss_mb()
+            rss_error: str | None = None
+            if rss_mb is not None:
+                metrics["rss_mb"] = rss_mb
+                if self.run_count == self.RSS_WARMUP_RUNS:
+                    self.baseline_rss_mb = rss_mb
+                elif self.baseline_rss_mb is not None:
+                    growth = rss_mb - self.baseline_rss_mb
+                    metrics["rss_growth_mb"] = growth
+                    if growth > self.config.flat_rss_tolerance_mb:
+                        rss_error = (
+                            f"RSS grew {growth:.1f}MB since warm-up "
+                            f"(tolerance: {self.config.flat_rss_tolerance_mb}MB)"
+                        )
+
             duration_ms = (time.perf_counter() - start) * 1000
             self.total_duration_ms += duration_ms
 
+            if rss_error is not None:
+                self.error_count += 1
+                return ScenarioResult(
+                    scenario_name=self.name,
+                    success=False,
+                    duration_ms=duration_ms,
+                    metrics=metrics,
+                    error_message=rss_error,
+                )
+
             # Warn if uncollectable objects detected
             if total_uncollectable > 0:
                 return ScenarioResult(
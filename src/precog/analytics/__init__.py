@@ -6,6 +6,7 @@ This module contains analytics-related functionality including:
 - Performance metrics tracking
 - TypedDict definitions for analytics responses
 - Elo rating computation engine (FiveThirtyEight methodology)
+- Vectorized Elo replay for bulk recomputation
 
 Reference: docs/foundation/DEVELOPMENT_PHASES_V1.5.md Phase 1.5
 Reference: docs/guides/ELO_COMPUTATION_GUIDE_V1.1.md (Elo engine)
@@ -33,6 +34,8 @@ from precog.analytics.elo_engine import (
     get_elo_engine,
     win_probability_to_elo_difference,
 )
+from precog.analytics.elo_live_updater import LiveEloUpdater
+from precog.analytics.elo_replay import EloReplayEngine, EloReplayResult
 from precog.analytics.model_manager import (
     ImmutabilityError,
     InvalidStatusTransitionError,
@@ -64,6 +67,8 @@ __all__ = [
     "EloEngine",
     "EloHistoryEntry",
     "EloRating",
+    "EloReplayEngine",
+    "EloReplayResult",
     "EloState",
     "EloUpdateLog",
     "EloUpdateResult",
@@ -71,6 +76,7 @@ __all__ = [
     "ImmutabilityError",
     "InvalidStatusTransitionError",
     "League",
+    "LiveEloUpdater",
     "ModelCalibrationBucket",
     "ModelManager",
     "ModelPerformanceMetrics",
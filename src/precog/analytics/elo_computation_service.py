@@ -7,7 +7,7 @@ This is the orchestration layer that connects the EloEngine to the database.
 Key Features:
     - Chronological game processing (required for Elo correctness)
     - Season-to-season rating regression (configurable)
-    - Batch processing with progress tracking
+    - Batch processing with progress tracking (log rows written by COPY in chunks)
     - Full audit trail in elo_calculation_log table
     - Support for incremental computation (skip already-processed games)
 
@@ -34,6 +34,8 @@ Created: 2025-12-26
 Phase: 2.6 (Elo Rating Computation)
 """
 
+import csv
+import io
 from dataclasses import dataclass, field
 from datetime import date
 from decimal import ROUND_HALF_UP, Decimal
@@ -44,11 +46,45 @@ from precog.analytics.elo_engine import (
     EloEngine,
     EloUpdateResult,
 )
+from precog.analytics.elo_replay import EloReplayEngine
 from precog.database.crud_lookups import get_league_id_or_none
 from precog.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# elo_calculation_log rows per COPY chunk
+DEFAULT_LOG_CHUNK_SIZE = 5000
+
+# Columns written by _write_elo_logs(), in _elo_log_row() order
+ELO_LOG_COLUMNS = (
+    "game_id",
+    "league",
+    "game_date",
+    "home_team_code",
+    "away_team_code",
+    "home_score",
+    "away_score",
+    "home_elo_before",
+    "away_elo_before",
+    "k_factor",
+    "home_advantage",
+    "mov_multiplier",
+    "home_expected",
+    "away_expected",
+    "home_actual",
+    "away_actual",
+    "home_elo_change",
+    "away_elo_change",
+    "home_elo_after",
+    "away_elo_after",
+    "calculation_source",
+    "calculation_version",
+    "league_id",
+)
+
+# Identity of a log row for the skip_computed=False upsert path
+ELO_LOG_KEY = ("game_id", "calculation_source", "calculation_version")
+
 
 # =============================================================================
 # Result Types
@@ -171,6 +207,8 @@ class EloComputationService:
         apply_season_regression: bool = True,
         calculation_source: str = "bootstrap",
         calculation_version: str = "1.0",
+        use_fast_replay: bool = True,
+        log_chunk_size: int = DEFAULT_LOG_CHUNK_SIZE,
     ) -> None:
         """Initialize the Elo computation service.
 
@@ -180,12 +218,29 @@ class EloComputationService:
             apply_season_regression: Whether to regress ratings at season boundaries
             calculation_source: Source label for audit trail
             calculation_version: Algorithm version for audit trail
+            use_fast_replay: Compute ratings with the NumPy replay engine
+                (EloReplayEngine) instead of one Decimal update per game.
+                Results are identical; False forces the Decimal path.
+            log_chunk_size: elo_calculation_log rows written (and committed)
+                per COPY
+
+        Raises:
+            ValueError: If log_chunk_size is not positive
         """
+        if log_chunk_size <= 0:
+            raise ValueError(f"log_chunk_size must be positive, got {log_chunk_size}")
+
         self.conn = conn
         self.initial_rating = initial_rating
         self.apply_season_regression = apply_season_regression
         self.calculation_source = calculation_source
         self.calculation_version = calculation_version
+        self.use_fast_replay = use_fast_replay
+        self.log_chunk_size = log_chunk_size
+
+        # Per-run log buffer (reset by compute_ratings)
+        self._log_buffer: list[tuple[Any, ...]] = []
+        self._upsert_logs = False
 
         # Team ratings cache: league -> team_code -> TeamRatingState
         self._ratings: dict[str, dict[str, TeamRatingState]] = {}
@@ -331,56 +386,24 @@ class EloComputationService:
 
         return {row[0] for row in cursor.fetchall()}
 
-    def _insert_elo_log(
+    def _elo_log_row(
         self,
         game: dict[str, Any],
         result: EloUpdateResult,
-    ) -> None:
-        """Insert an entry into elo_calculation_log.
+    ) -> tuple[Any, ...]:
+        """Build one elo_calculation_log row in ELO_LOG_COLUMNS order.
 
         Args:
             game: Game dictionary from games table
             result: EloUpdateResult from the calculation
-        """
-        cursor = self.conn.cursor()
 
-        query = """
-            INSERT INTO elo_calculation_log (
-                game_id,
-                league,
-                game_date,
-                home_team_code,
-                away_team_code,
-                home_score,
-                away_score,
-                home_elo_before,
-                away_elo_before,
-                k_factor,
-                home_advantage,
-                mov_multiplier,
-                home_expected,
-                away_expected,
-                home_actual,
-                away_actual,
-                home_elo_change,
-                away_elo_change,
-                home_elo_after,
-                away_elo_after,
-                calculation_source,
-                calculation_version,
-                league_id
-            ) VALUES (
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                %s, %s, %s, %s, %s, %s, %s, %s
-            )
+        Returns:
+            Row tuple for _write_elo_logs()
         """
-
         # Determine league from game data
         league = game.get("league") or self._current_league
-        # Dual-write (#738 A1): also populate league_id FK.
-        league_id_value = get_league_id_or_none(league)
 
-        params = [
+        return (
             game["id"],
             league,
             game["game_date"],
@@ -403,10 +426,87 @@ class EloComputationService:
             result.away_elo_after,
             self.calculation_source,
             self.calculation_version,
-            league_id_value,
-        ]
+            # Dual-write (#738 A1): also populate league_id FK.
+            get_league_id_or_none(league),
+        )
 
-        cursor.execute(query, params)
+    def _write_elo_logs(self, rows: list[tuple[Any, ...]], upsert: bool) -> None:
+        """Write buffered log rows with COPY FROM STDIN (CSV).
+
+        Educational Note:
+            One COPY streams a whole chunk in a single round trip, versus one
+            INSERT round trip per game. elo_calculation_log has no unique key
+            to ON CONFLICT against, so the upsert path COPYs into a temp stage
+            and then updates rows matching (game_id, calculation_source,
+            calculation_version) and inserts the rest. Re-running the same
+            computation therefore rewrites its rows instead of duplicating
+            them; a different source/version still gets its own rows.
+
+        Args:
+            rows: Row tuples from _elo_log_row()
+            upsert: Replace existing rows for the same game/source/version
+                (used when skip_computed=False)
+        """
+        if not rows:
+            return
+
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)  # None -> empty field -> NULL
+        buffer.seek(0)
+
+        columns = ", ".join(ELO_LOG_COLUMNS)
+        cursor = self.conn.cursor()
+        if not upsert:
+            cursor.copy_expert(
+                f"COPY elo_calculation_log ({columns}) FROM STDIN WITH (FORMAT csv)",
+                buffer,
+            )
+            return
+
+        cursor.execute(
+            f"""
+            CREATE TEMP TABLE _elo_log_stage ON COMMIT DROP AS
+            SELECT {columns} FROM elo_calculation_log WITH NO DATA
+            """  # noqa: S608
+        )
+        cursor.copy_expert(
+            f"COPY _elo_log_stage ({columns}) FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+        key_match = (
+            "l.game_id = s.game_id"
+            " AND l.calculation_source = s.calculation_source"
+            " AND l.calculation_version = s.calculation_version"
+        )
+        assignments = ", ".join(
+            f"{column} = s.{column}" for column in ELO_LOG_COLUMNS if column not in ELO_LOG_KEY
+        )
+        cursor.execute(
+            f"""
+            UPDATE elo_calculation_log l
+            SET {assignments}
+            FROM _elo_log_stage s
+            WHERE {key_match}
+            """  # noqa: S608
+        )
+        cursor.execute(
+            f"""
+            INSERT INTO elo_calculation_log ({columns})
+            SELECT {columns} FROM _elo_log_stage s
+            WHERE NOT EXISTS (
+                SELECT 1 FROM elo_calculation_log l WHERE {key_match}
+            )
+            """  # noqa: S608
+        )
+
+    def _flush_elo_logs(self, result: ComputationResult) -> None:
+        """Write and commit the buffered log rows."""
+        if not self._log_buffer:
+            return
+        self._write_elo_logs(self._log_buffer, upsert=self._upsert_logs)
+        self.conn.commit()
+        result.logs_inserted += len(self._log_buffer)
+        self._log_buffer = []
 
     def compute_ratings(
         self,
@@ -431,7 +531,8 @@ class EloComputationService:
             league: League code (nfl, nba, nhl, mlb)
             seasons: Optional list of seasons to process (default: all)
             skip_computed: If True, skip games already in elo_calculation_log
-            commit_interval: Commit after this many games (for large datasets)
+            commit_interval: Log progress after this many games (rows are
+                committed per log_chunk_size COPY chunk)
             sync_to_teams: If True, update teams.current_elo_rating after computation
 
         Returns:
@@ -451,6 +552,8 @@ class EloComputationService:
 
         # Store current league for log insertion
         self._current_league = league
+        self._log_buffer = []
+        self._upsert_logs = not skip_computed
 
         # Initialize result
         result = ComputationResult(
@@ -486,18 +589,73 @@ class EloComputationService:
                 count=len(computed_ids),
             )
 
-        # Track current season for regression
-        current_season: int | None = None
+        pending = [g for g in games if not (skip_computed and g["id"] in computed_ids)]
+        result.games_skipped = len(games) - len(pending)
 
         # Process games chronologically
-        for i, game in enumerate(games):
-            game_id = game["id"]
+        replayed = False
+        if self.use_fast_replay and pending:
+            replayed = self._process_games_replay(
+                league, engine, pending, result, len(games), commit_interval
+            )
+        if not replayed:
+            self._process_games_sequential(
+                league, engine, pending, result, len(games), commit_interval
+            )
 
-            # Skip if already computed
-            if skip_computed and game_id in computed_ids:
-                result.games_skipped += 1
-                continue
+        # Final chunk + commit
+        self._flush_elo_logs(result)
+        self.conn.commit()
+
+        # Count unique teams
+        if league in self._ratings:
+            result.teams_updated = len(self._ratings[league])
+
+        # Optionally sync to teams table
+        if sync_to_teams:
+            synced = self.sync_ratings_to_teams(league)
+            logger.info(
+                "elo_synced_to_teams_table",
+                league=league,
+                teams_synced=synced,
+            )
+
+        result.duration_seconds = time.time() - start_time
 
+        logger.info(
+            "elo_computation_complete",
+            league=league,
+            games_processed=result.games_processed,
+            games_skipped=result.games_skipped,
+            teams=result.teams_updated,
+            duration_s=round(result.duration_seconds, 2),
+        )
+
+        return result
+
+    def _process_games_sequential(
+        self,
+        league: str,
+        engine: EloEngine,
+        games: list[dict[str, Any]],
+        result: ComputationResult,
+        total: int,
+        commit_interval: int,
+    ) -> None:
+        """Process games one at a time through the Decimal EloEngine.
+
+        Args:
+            league: League code
+            engine: EloEngine instance for this league
+            games: Chronologically ordered games still to compute
+            result: ComputationResult to update
+            total: Total games fetched (for progress logging)
+            commit_interval: Commit after this many games
+        """
+        # Track current season for regression
+        current_season: int | None = None
+
+        for game in games:
             # Check for season boundary (apply regression)
             game_season = game["season"]
             if (
@@ -538,50 +696,97 @@ class EloComputationService:
             home_state.update_after_game(elo_result.home_elo_after, game["game_date"])
             away_state.update_after_game(elo_result.away_elo_after, game["game_date"])
 
-            # Insert log entry
-            self._insert_elo_log(game, elo_result)
-            result.games_processed += 1
-            result.logs_inserted += 1
+            self._record_game(league, game, elo_result, result, total, commit_interval)
 
-            # Commit periodically
-            if result.games_processed % commit_interval == 0:
-                self.conn.commit()
-                logger.info(
-                    "elo_computation_progress",
-                    league=league,
-                    processed=result.games_processed,
-                    total=len(games),
-                    pct=round(100 * result.games_processed / len(games), 1),
-                )
+    def _process_games_replay(
+        self,
+        league: str,
+        engine: EloEngine,
+        games: list[dict[str, Any]],
+        result: ComputationResult,
+        total: int,
+        commit_interval: int,
+    ) -> bool:
+        """Process games through the NumPy replay engine, then persist.
+
+        Produces the same ratings and log rows as _process_games_sequential()
+        (see EloReplayEngine). Ratings are computed for the whole batch first;
+        Decimal results are built per game only as log rows are written.
 
-        # Final commit
-        self.conn.commit()
+        Args:
+            league: League code
+            engine: EloEngine instance for this league
+            games: Chronologically ordered games still to compute
+            result: ComputationResult to update
+            total: Total games fetched (for progress logging)
+            commit_interval: Commit after this many games
 
-        # Count unique teams
-        if league in self._ratings:
-            result.teams_updated = len(self._ratings[league])
+        Returns:
+            False if the replay cannot represent the current ratings exactly
+            (nothing is written; caller falls back to the sequential path)
+        """
+        states = self._ratings.setdefault(league, {})
+        try:
+            replay = EloReplayEngine(engine).replay(
+                games,
+                ratings={code: state.rating for code, state in states.items()},
+                initial_rating=self.initial_rating,
+                apply_season_regression=self.apply_season_regression,
+            )
+        except ValueError as e:
+            logger.info("elo_fast_replay_unavailable", league=league, reason=str(e))
+            return False
 
-        # Optionally sync to teams table
-        if sync_to_teams:
-            synced = self.sync_ratings_to_teams(league)
+        for from_season, to_season in replay.season_boundaries:
             logger.info(
-                "elo_synced_to_teams_table",
+                "applied_season_regression",
                 league=league,
-                teams_synced=synced,
+                from_season=from_season,
+                to_season=to_season,
             )
 
-        result.duration_seconds = time.time() - start_time
+        # Fold per-team results back into states (new teams in first-appearance order)
+        for slot, team_code in enumerate(replay.team_codes):
+            state = self.get_or_create_rating(league, team_code)
+            state.rating = replay.rating(team_code)
+            games_played = int(replay.games_played[slot])
+            if games_played:
+                state.games_played += games_played
+                state.last_game_date = games[int(replay.last_game[slot])]["game_date"]
+                state.peak_rating = max(state.peak_rating, replay.peak_rating(team_code))
+                state.lowest_rating = min(state.lowest_rating, replay.lowest_rating(team_code))
+
+        for index, game in enumerate(games):
+            self._record_game(
+                league, game, replay.update_result(index), result, total, commit_interval
+            )
+        return True
 
-        logger.info(
-            "elo_computation_complete",
-            league=league,
-            games_processed=result.games_processed,
-            games_skipped=result.games_skipped,
-            teams=result.teams_updated,
-            duration_s=round(result.duration_seconds, 2),
-        )
+    def _record_game(
+        self,
+        league: str,
+        game: dict[str, Any],
+        elo_result: EloUpdateResult,
+        result: ComputationResult,
+        total: int,
+        commit_interval: int,
+    ) -> None:
+        """Buffer the log row for one game; flush full chunks and log progress."""
+        self._log_buffer.append(self._elo_log_row(game, elo_result))
+        result.games_processed += 1
 
-        return result
+        if len(self._log_buffer) >= self.log_chunk_size:
+            self._flush_elo_logs(result)
+
+        # Report progress periodically
+        if result.games_processed % commit_interval == 0:
+            logger.info(
+                "elo_computation_progress",
+                league=league,
+                processed=result.games_processed,
+                total=total,
+                pct=round(100 * result.games_processed / total, 1),
+            )
 
     def _apply_season_regression(self, league: str, engine: EloEngine) -> None:
         """Apply season-to-season regression for all teams in a league.
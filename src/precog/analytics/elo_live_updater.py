@@ -0,0 +1,289 @@
+"""
+Live (Incremental) Elo Updater.
+
+Applies one EloEngine.update_ratings() step when a game goes final, instead
+of waiting for a full `precog data compute-elo` replay. Used by
+ESPNGamePoller so teams.current_elo_rating is fresh within one poll interval.
+
+Key Features:
+    - In-memory rating state keyed by team_id, warmed once from
+      teams.current_elo_rating (one query for all polled leagues)
+    - One log row + both team ratings written in a single transaction
+      (crud_elo.apply_game_elo_update)
+    - Idempotent per game: a game already in elo_calculation_log is never
+      applied again (restarts, re-polled finals, prior backfills)
+    - Era-aware configuration (EloEngine game_date selection)
+    - Season regression: a team's first final game of a new season is rated
+      from its regressed rating, as in the batch recompute
+
+Design Decisions:
+    - The database is the source of truth. If a game was already applied
+      (the write returns None), the cached ratings for both teams are
+      dropped and re-read on next use rather than trusted.
+    - Teams missing from the warm set (NULL rating, added after startup)
+      are lazily loaded, falling back to DEFAULT_INITIAL_RATING.
+    - Each team's last rated season comes from elo_calculation_log joined to
+      games. Regression is applied per team when that team's next game is in
+      a later season, which gives the same ratings as the batch recompute
+      regressing every team at the season boundary.
+
+Example Usage:
+    >>> updater = LiveEloUpdater()
+    >>> updater.warm(["nfl", "nba"])
+    >>> result = updater.apply_final_game(
+    ...     game_id=101, league="nfl", game_date=date(2025, 9, 7),
+    ...     home_team_id=12, away_team_id=7,
+    ...     home_team_code="KC", away_team_code="BAL",
+    ...     home_score=27, away_score=20,
+    ... )
+
+Reference: docs/guides/ELO_COMPUTATION_GUIDE_V1.2.md
+Related ADR: ADR-109 (Elo Rating Computation Engine)
+Related Requirements: REQ-ELO-001 through REQ-ELO-007
+"""
+
+import threading
+from datetime import date
+from decimal import Decimal
+from typing import Any
+
+from precog.analytics.elo_engine import (
+    DEFAULT_INITIAL_RATING,
+    EloEngine,
+    EloUpdateResult,
+    League,
+)
+from precog.database.crud_elo import (
+    apply_game_elo_update,
+    get_team_elo_rating,
+    get_team_elo_ratings,
+    get_team_elo_season,
+    get_team_elo_seasons,
+)
+from precog.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# ESPN season types that count as playoff games for the K-factor multiplier
+PLAYOFF_SEASON_TYPES = frozenset({"playoff", "bowl"})
+
+
+class LiveEloUpdater:
+    """Incremental Elo updates for games as they go final.
+
+    Educational Note:
+        A full replay recomputes every rating from the first game; that is
+        the right tool for backfills and algorithm changes, but ratings then
+        only move when someone runs it. Elo is an online algorithm: the new
+        ratings depend only on the two current ratings and the result, so a
+        single update step per finished game keeps ratings current.
+
+    Thread Safety:
+        ESPNGamePoller polls leagues from scheduler worker threads, so
+        apply_final_game() holds a lock across read-compute-write to keep the
+        in-memory state consistent with the database.
+
+    Example:
+        >>> updater = LiveEloUpdater(calculation_source="realtime")
+        >>> updater.warm(["nfl"])
+        >>> updater.rating(12)
+        Decimal('1612.40')
+    """
+
+    def __init__(
+        self,
+        calculation_source: str = "realtime",
+        calculation_version: str = "1.0",
+    ) -> None:
+        """Initialize the updater with empty rating state.
+
+        Args:
+            calculation_source: Source label for elo_calculation_log rows
+            calculation_version: Algorithm version for elo_calculation_log rows
+        """
+        self.calculation_source = calculation_source
+        self.calculation_version = calculation_version
+
+        self._ratings: dict[int, Decimal] = {}
+        # team_id -> season of the team's last rated game (None = never rated)
+        self._seasons: dict[int, int | None] = {}
+        self._lock = threading.Lock()
+        self._stats: dict[str, int] = {
+            "elo_updates_applied": 0,
+            "elo_updates_duplicate": 0,
+            "elo_updates_skipped": 0,
+            "elo_season_regressions": 0,
+        }
+
+    def warm(self, leagues: list[str]) -> int:
+        """Load current ratings and last rated seasons for the given leagues.
+
+        Args:
+            leagues: League codes to load
+
+        Returns:
+            Number of team ratings loaded
+        """
+        supported = [lg for lg in leagues if self._supported(lg)]
+        ratings = get_team_elo_ratings(supported)
+        seasons = get_team_elo_seasons(supported)
+        with self._lock:
+            self._ratings.update(ratings)
+            self._seasons.update(seasons)
+        logger.info("live_elo_warmed", leagues=leagues, teams=len(ratings))
+        return len(ratings)
+
+    def rating(self, team_id: int) -> Decimal | None:
+        """Cached rating for team_id (None if not loaded yet)."""
+        with self._lock:
+            return self._ratings.get(team_id)
+
+    def get_stats(self) -> dict[str, int]:
+        """Return update counters (applied, duplicate, skipped, regressions)."""
+        with self._lock:
+            return dict(self._stats)
+
+    def apply_final_game(
+        self,
+        *,
+        game_id: int,
+        league: str,
+        game_date: date,
+        home_team_id: int | None,
+        away_team_id: int | None,
+        home_team_code: str,
+        away_team_code: str,
+        home_score: int,
+        away_score: int,
+        season: int | None = None,
+        season_type: str | None = None,
+        neutral_site: bool = False,
+    ) -> EloUpdateResult | None:
+        """Apply one Elo update for a game that just went final.
+
+        Args:
+            game_id: games.id of the finished game
+            league: League code
+            game_date: Date of the game (selects the Elo era config)
+            home_team_id / away_team_id: teams.team_id (None = unresolved)
+            home_team_code / away_team_code: Team abbreviations
+            home_score / away_score: Final scores
+            season: games.season of the game (default: game_date.year, as
+                get_or_create_game() derives it). A team whose last rated
+                game is in an earlier season is regressed to the mean first.
+            season_type: ESPN season type ('playoff'/'bowl' use the playoff K)
+            neutral_site: No home advantage when True
+
+        Returns:
+            EloUpdateResult if ratings moved, None if skipped (unsupported
+            league, unresolved team) or the game was already applied
+        """
+        if home_team_id is None or away_team_id is None or not self._supported(league):
+            with self._lock:
+                self._stats["elo_updates_skipped"] += 1
+            return None
+
+        if season is None:
+            season = game_date.year
+        engine = EloEngine(league, game_date=game_date)
+        with self._lock:
+            home_elo, home_regressed = self._season_rating(engine, home_team_id, season)
+            away_elo, away_regressed = self._season_rating(engine, away_team_id, season)
+            result = engine.update_ratings(
+                home_elo=home_elo,
+                away_elo=away_elo,
+                home_score=home_score,
+                away_score=away_score,
+                is_playoff=season_type in PLAYOFF_SEASON_TYPES,
+                neutral_site=neutral_site,
+            )
+
+            log_id = apply_game_elo_update(
+                game_id=game_id,
+                league=league,
+                game_date=game_date,
+                home_team_id=home_team_id,
+                away_team_id=away_team_id,
+                home_team_code=home_team_code,
+                away_team_code=away_team_code,
+                home_score=home_score,
+                away_score=away_score,
+                calculation_source=self.calculation_source,
+                calculation_version=self.calculation_version,
+                **self._result_fields(result),
+            )
+            if log_id is None:
+                # Already applied elsewhere: re-read both teams on next use
+                for team_id in (home_team_id, away_team_id):
+                    self._ratings.pop(team_id, None)
+                    self._seasons.pop(team_id, None)
+                self._stats["elo_updates_duplicate"] += 1
+                return None
+
+            self._ratings[home_team_id] = result.home_elo_after
+            self._ratings[away_team_id] = result.away_elo_after
+            for team_id in (home_team_id, away_team_id):
+                last_season = self._seasons.get(team_id)
+                if last_season is None or season > last_season:
+                    self._seasons[team_id] = season
+            self._stats["elo_season_regressions"] += home_regressed + away_regressed
+            self._stats["elo_updates_applied"] += 1
+
+        logger.info(
+            "live_elo_applied",
+            game_id=game_id,
+            league=league,
+            home=home_team_code,
+            away=away_team_code,
+            home_change=str(result.home_elo_change),
+            away_change=str(result.away_elo_change),
+        )
+        return result
+
+    def _season_rating(self, engine: EloEngine, team_id: int, season: int) -> tuple[Decimal, bool]:
+        """Rating entering a game in season, and whether it was regressed (caller holds the lock).
+
+        The regressed rating is not cached: it becomes the team's rating only
+        once the game's update is written.
+        """
+        rating = self._load_rating(team_id)
+        if team_id not in self._seasons:
+            self._seasons[team_id] = get_team_elo_season(team_id)
+        last_season = self._seasons[team_id]
+        if last_season is not None and season > last_season:
+            return engine.apply_season_regression(rating), True
+        return rating, False
+
+    def _load_rating(self, team_id: int) -> Decimal:
+        """Cached rating, lazily loaded from teams (caller holds the lock)."""
+        rating = self._ratings.get(team_id)
+        if rating is None:
+            rating = get_team_elo_rating(team_id)
+            if rating is None:
+                rating = DEFAULT_INITIAL_RATING
+            self._ratings[team_id] = rating
+        return rating
+
+    @staticmethod
+    def _result_fields(result: EloUpdateResult) -> dict[str, Any]:
+        """EloUpdateResult fields persisted by apply_game_elo_update()."""
+        return {
+            "home_elo_before": result.home_elo_before,
+            "away_elo_before": result.away_elo_before,
+            "k_factor": result.k_factor,
+            "home_advantage": result.home_advantage,
+            "mov_multiplier": result.mov_multiplier,
+            "home_expected": result.home_expected,
+            "away_expected": result.away_expected,
+            "home_actual": result.home_actual,
+            "away_actual": result.away_actual,
+            "home_elo_change": result.home_elo_change,
+            "away_elo_change": result.away_elo_change,
+            "home_elo_after": result.home_elo_after,
+            "away_elo_after": result.away_elo_after,
+        }
+
+    @staticmethod
+    def _supported(league: str) -> bool:
+        """True if EloEngine has a configuration for league."""
+        return league.lower() in {lg.value for lg in League}
@@ -0,0 +1,470 @@
+"""
+Vectorized Elo Replay Engine.
+
+Replays a chronological list of games through the same FiveThirtyEight update
+as EloEngine.update_ratings(), for bulk recomputation (EloComputationService).
+The Decimal engine is kept as the reference implementation; this module is a
+fast path that produces the same numbers.
+
+Key Features:
+    - Team ratings held in a NumPy array indexed by integer team slots
+    - Expected score and margin-of-victory multiplier computed in float64
+    - Per-game inputs (K, home advantage, actual score, MOV log term) prepared
+      as array operations before the replay loop
+    - Season regression applied to all active teams as one array operation
+    - Decimal values produced only at the persistence boundary
+      (EloReplayResult.update_result())
+
+Design Decisions:
+    EloEngine quantizes at three points (ROUND_HALF_UP): expected score to
+    0.0001, MOV multiplier to 0.01, rating change to 0.01. The replay keeps
+    those quantized values as integers (expected in 1e-4 units, MOV and
+    ratings in 1e-2 "centi-Elo" units), so only the transcendental step
+    (10**x, ln) runs in float64 and everything after it is exact integer
+    arithmetic. Ratings never accumulate float drift over decades of games.
+    A float64 result that lands within 1e-6 of a rounding tie (or of the MOV
+    cap/floor) is recomputed through EloEngine itself, so results match the
+    Decimal engine exactly rather than approximately.
+
+Example Usage:
+    >>> from precog.analytics.elo_engine import EloEngine
+    >>> from precog.analytics.elo_replay import EloReplayEngine
+    >>>
+    >>> replay = EloReplayEngine(EloEngine("nfl")).replay(games)
+    >>> replay.rating("KC")
+    Decimal('1613.42')
+    >>> replay.update_result(0).home_elo_after  # EloUpdateResult for game 0
+
+Reference: docs/guides/ELO_COMPUTATION_GUIDE_V1.2.md
+Related ADR: ADR-109 (Elo Rating Computation Engine), ADR-002 (Decimal Precision)
+Related Requirements: REQ-ELO-001 through REQ-ELO-007
+"""
+
+import math
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from precog.analytics.elo_engine import (
+    DEFAULT_CARRYOVER_WEIGHT,
+    DEFAULT_INITIAL_RATING,
+    DEFAULT_REGRESSION_TARGET,
+    EloEngine,
+    EloUpdateResult,
+)
+
+# Fixed-point scales: ratings/MOV in hundredths, expected score in ten-thousandths
+RATING_PLACES = 2
+EXPECTED_PLACES = 4
+_EXPECTED_SCALE: int = 10**EXPECTED_PLACES
+_HALF_POINT = _EXPECTED_SCALE // 2
+
+# Float results this close to a rounding boundary are recomputed in Decimal
+_TIE_EPSILON = 1e-6
+
+# Actual score by home half-points (0 = loss, 1 = tie, 2 = win)
+_ACTUAL_SCORES = (Decimal("0"), Decimal("0.5"), Decimal("1"))
+
+IntArray = npt.NDArray[np.int64]
+
+
+def _to_units(value: Decimal, places: int, name: str) -> int:
+    """Convert a Decimal to an integer count of 10**-places units, exactly."""
+    scaled = value.scaleb(places)
+    if scaled != scaled.to_integral_value():
+        msg = f"{name}={value} has more than {places} decimal places"
+        raise ValueError(msg)
+    return int(scaled)
+
+
+def _from_units(units: int, places: int) -> Decimal:
+    """Convert an integer count of 10**-places units back to Decimal."""
+    return Decimal(units).scaleb(-places)
+
+
+@dataclass
+class EloReplayResult:
+    """Per-game and per-team output of EloReplayEngine.replay().
+
+    Ratings, changes and MOV multipliers are centi-Elo integers; expected
+    scores are in 1e-4 units. Use update_result() / rating() for Decimal
+    values.
+
+    Attributes:
+        team_codes: Team code per slot (input ratings first, then by first appearance)
+        ratings: Final rating per slot
+        games_played: Games replayed per slot
+        peak: Highest rating per slot (starting rating or any post-game rating)
+        lowest: Lowest rating per slot
+        last_game: Index of each slot's last replayed game (-1 if none)
+        home_slot / away_slot: Team slots per game
+        home_before / away_before: Ratings before each game
+        home_change: Home rating change per game (away change is its negation)
+        home_expected: Home expected score per game
+        home_points: Home half-points per game (0 loss, 1 tie, 2 win)
+        mov: MOV multiplier per game
+        k: K-factor per game
+        home_advantage: Home advantage applied per game
+        season_boundaries: (from_season, to_season) for each regression applied
+    """
+
+    team_codes: list[str]
+    ratings: IntArray
+    games_played: IntArray
+    peak: IntArray
+    lowest: IntArray
+    last_game: IntArray
+    home_slot: IntArray
+    away_slot: IntArray
+    home_before: IntArray
+    away_before: IntArray
+    home_change: IntArray
+    home_expected: IntArray
+    home_points: IntArray
+    mov: IntArray
+    k: IntArray
+    home_advantage: IntArray
+    season_boundaries: list[tuple[int, int]]
+
+    def __len__(self) -> int:
+        return len(self.home_slot)
+
+    def __post_init__(self) -> None:
+        self._slots = {code: slot for slot, code in enumerate(self.team_codes)}
+
+    def rating(self, team_code: str) -> Decimal:
+        """Final rating for team_code as Decimal."""
+        return _from_units(int(self.ratings[self._slots[team_code]]), RATING_PLACES)
+
+    def peak_rating(self, team_code: str) -> Decimal:
+        """Highest rating for team_code as Decimal."""
+        return _from_units(int(self.peak[self._slots[team_code]]), RATING_PLACES)
+
+    def lowest_rating(self, team_code: str) -> Decimal:
+        """Lowest rating for team_code as Decimal."""
+        return _from_units(int(self.lowest[self._slots[team_code]]), RATING_PLACES)
+
+    def update_result(self, index: int) -> EloUpdateResult:
+        """Build the Decimal EloUpdateResult for game ``index`` (persistence boundary)."""
+        home_before = int(self.home_before[index])
+        away_before = int(self.away_before[index])
+        change = int(self.home_change[index])
+        expected = int(self.home_expected[index])
+        points = int(self.home_points[index])
+        return EloUpdateResult(
+            home_elo_before=_from_units(home_before, RATING_PLACES),
+            away_elo_before=_from_units(away_before, RATING_PLACES),
+            home_elo_after=_from_units(home_before + change, RATING_PLACES),
+            away_elo_after=_from_units(away_before - change, RATING_PLACES),
+            home_expected=_from_units(expected, EXPECTED_PLACES),
+            away_expected=_from_units(_EXPECTED_SCALE - expected, EXPECTED_PLACES),
+            home_actual=_ACTUAL_SCORES[points],
+            away_actual=_ACTUAL_SCORES[2 - points],
+            home_elo_change=_from_units(change, RATING_PLACES),
+            away_elo_change=_from_units(-change, RATING_PLACES),
+            k_factor=int(self.k[index]),
+            home_advantage=_from_units(int(self.home_advantage[index]), RATING_PLACES),
+            mov_multiplier=_from_units(int(self.mov[index]), RATING_PLACES),
+        )
+
+
+class EloReplayEngine:
+    """Float64/NumPy fast path for replaying many games through an EloEngine.
+
+    Educational Note:
+        An Elo replay is inherently sequential: each game's expected score
+        depends on ratings produced by earlier games. What vectorizes is
+        everything that does not depend on ratings (per-game K, home
+        advantage, actual score, the ln(margin + 1) MOV term), the season
+        regression, and the per-team aggregates (games played, peak/lowest).
+        The remaining loop is a handful of float64 and integer operations per
+        game instead of a chain of 28-digit Decimal operations.
+
+    Example:
+        >>> replay_engine = EloReplayEngine(EloEngine("nba"))
+        >>> result = replay_engine.replay(games, ratings={"BOS": Decimal("1620.50")})
+        >>> result.rating("BOS")
+    """
+
+    def __init__(
+        self,
+        engine: EloEngine,
+        carryover_weight: Decimal = DEFAULT_CARRYOVER_WEIGHT,
+        regression_target: Decimal = DEFAULT_REGRESSION_TARGET,
+    ) -> None:
+        """Initialize from an EloEngine's configuration.
+
+        Args:
+            engine: Reference Decimal engine (config source and tie fallback)
+            carryover_weight: Season regression carryover (as in apply_season_regression)
+            regression_target: Season regression mean (as in apply_season_regression)
+
+        Raises:
+            ValueError: If home_advantage or regression_target has more than
+                two decimal places (not representable in centi-Elo)
+        """
+        config = engine.config
+        self.engine = engine
+        self._k = config.k_factor
+        self._playoff_k = int(config.k_factor * float(config.playoff_k_multiplier))
+        self._home_advantage = _to_units(config.home_advantage, RATING_PLACES, "home_advantage")
+        self._mov_enabled = config.mov_enabled
+        self._mov_cap = float(config.mov_cap)
+        self._mov_cap_units = _to_units(
+            config.mov_cap.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP),
+            RATING_PLACES,
+            "mov_cap",
+        )
+
+        # Regression: new = (rating * w + target * (1 - w)), w = num / den exactly
+        weight_places = max(0, -int(carryover_weight.as_tuple().exponent))
+        self._carryover_den = 10**weight_places
+        self._carryover_num = _to_units(carryover_weight, weight_places, "carryover_weight")
+        self._regression_target = _to_units(regression_target, RATING_PLACES, "regression_target")
+
+    def regress(self, ratings: IntArray) -> IntArray:
+        """Season regression for an array of centi-Elo ratings (one array operation)."""
+        den = self._carryover_den
+        weighted = ratings * self._carryover_num + self._regression_target * (
+            den - self._carryover_num
+        )
+        magnitude = (np.abs(weighted) * 2 + den) // (2 * den)
+        regressed: IntArray = np.where(weighted >= 0, magnitude, -magnitude)
+        return regressed
+
+    def replay(
+        self,
+        games: Sequence[Mapping[str, Any]],
+        ratings: Mapping[str, Decimal] | None = None,
+        initial_rating: Decimal = DEFAULT_INITIAL_RATING,
+        apply_season_regression: bool = True,
+    ) -> EloReplayResult:
+        """Replay games in order and return per-game and per-team results.
+
+        Args:
+            games: Chronologically ordered game dicts with home_team_code,
+                away_team_code, home_score, away_score, season, and optional
+                game_type ("regular" = not playoff) and is_neutral_site.
+            ratings: Current ratings of teams already active before the first
+                game. These teams are regressed at every season boundary;
+                other teams join (at initial_rating) on first appearance.
+            initial_rating: Starting rating for teams not in ``ratings``.
+            apply_season_regression: Regress active teams when the season changes.
+
+        Returns:
+            EloReplayResult
+
+        Raises:
+            ValueError: If a starting rating has more than two decimal places.
+        """
+        ratings = ratings or {}
+        team_codes = list(ratings)
+        slots = {code: slot for slot, code in enumerate(team_codes)}
+        n_games = len(games)
+
+        # Team slots in first-appearance order (home before away)
+        home_slot = np.empty(n_games, dtype=np.int64)
+        away_slot = np.empty(n_games, dtype=np.int64)
+        for i, game in enumerate(games):
+            for code, target in (
+                (game["home_team_code"], home_slot),
+                (game["away_team_code"], away_slot),
+            ):
+                slot = slots.get(code)
+                if slot is None:
+                    slot = slots[code] = len(team_codes)
+                    team_codes.append(code)
+                target[i] = slot
+
+        n_slots = len(team_codes)
+        initial_units = _to_units(initial_rating, RATING_PLACES, "initial_rating")
+        current = np.full(n_slots, initial_units, dtype=np.int64)
+        for slot, value in enumerate(ratings.values()):
+            current[slot] = _to_units(value, RATING_PLACES, f"ratings[{team_codes[slot]!r}]")
+        # Teams regressed at a season boundary: input teams plus any seen so far
+        active = [slot < len(ratings) for slot in range(n_slots)]
+        peak = current.copy()
+        lowest = current.copy()
+
+        # Rating-independent per-game inputs, as array operations
+        home_score = np.fromiter((g["home_score"] for g in games), dtype=np.int64, count=n_games)
+        away_score = np.fromiter((g["away_score"] for g in games), dtype=np.int64, count=n_games)
+        is_playoff = np.fromiter(
+            (g.get("game_type", "regular") != "regular" for g in games), dtype=bool, count=n_games
+        )
+        is_neutral = np.fromiter(
+            (bool(g.get("is_neutral_site", False)) for g in games), dtype=bool, count=n_games
+        )
+        k = np.where(is_playoff, self._playoff_k, self._k).astype(np.int64)
+        home_advantage = np.where(is_neutral, 0, self._home_advantage).astype(np.int64)
+        home_points = (np.sign(home_score - away_score) + 1).astype(np.int64)
+        margin = np.abs(home_score - away_score)
+        # ln(margin + 1) via math.log on each distinct margin, so the float
+        # matches EloEngine.margin_of_victory_multiplier() bit for bit
+        log_table = np.array(
+            [math.log(d + 1) for d in range(int(margin.max(initial=0)) + 1)], dtype=np.float64
+        )
+        mov_log = log_table[margin]
+        mov_active = (margin != 0) & self._mov_enabled
+
+        seasons = [g["season"] for g in games]
+        season_boundaries: list[tuple[int, int]] = []
+        current_season: int | None = None
+
+        # The loop reads and writes Python scalars: per-element NumPy indexing
+        # costs more than the arithmetic. ``ratings_now`` mirrors ``current``
+        # and is synced around each season regression (one array operation).
+        ratings_now = current.tolist()
+        home_slots = home_slot.tolist()
+        away_slots = away_slot.tolist()
+        ks = k.tolist()
+        advantages = home_advantage.tolist()
+        actual = (home_points * _HALF_POINT).tolist()
+        mov_logs = mov_log.tolist()
+        mov_flags = mov_active.tolist()
+        home_wins = (home_points == 2).tolist()
+        scores = list(zip(home_score.tolist(), away_score.tolist(), strict=True))
+        home_before: list[int] = [0] * n_games
+        away_before: list[int] = [0] * n_games
+        home_change: list[int] = [0] * n_games
+        home_expected: list[int] = [0] * n_games
+        mov: list[int] = [100] * n_games
+        expected_units = self._expected_units
+        mov_units_for = self._mov_units
+        scale = _EXPECTED_SCALE
+
+        for i in range(n_games):
+            season = seasons[i]
+            if current_season is not None and season != current_season and apply_season_regression:
+                current[:] = ratings_now
+                mask = np.array(active, dtype=bool)
+                current[mask] = self.regress(current[mask])
+                ratings_now = current.tolist()
+                season_boundaries.append((current_season, season))
+            current_season = season
+
+            h = home_slots[i]
+            a = away_slots[i]
+            active[h] = True
+            active[a] = True
+            hr = ratings_now[h]
+            ar = ratings_now[a]
+            home_before[i] = hr
+            away_before[i] = ar
+
+            expected = expected_units(hr + advantages[i], ar)
+            home_expected[i] = expected
+
+            mov_units = 100
+            if mov_flags[i]:
+                if home_wins[i]:
+                    mov_units = mov_units_for(mov_logs[i], hr, ar, scores[i])
+                else:
+                    mov_units = mov_units_for(mov_logs[i], ar, hr, scores[i])
+                mov[i] = mov_units
+
+            # k * mov * (S - E) in 1e-6 units, rounded half-up to centi-Elo
+            raw = ks[i] * mov_units * (actual[i] - expected)
+            change = (
+                (2 * raw + scale) // (2 * scale)
+                if raw >= 0
+                else -((scale - 2 * raw) // (2 * scale))
+            )
+            home_change[i] = change
+            ratings_now[h] = hr + change
+            ratings_now[a] = ar - change
+
+        current[:] = ratings_now
+
+        # Per-team aggregates, as array operations
+        before_home = np.array(home_before, dtype=np.int64)
+        before_away = np.array(away_before, dtype=np.int64)
+        change_home = np.array(home_change, dtype=np.int64)
+        home_after = before_home + change_home
+        away_after = before_away - change_home
+        games_played = np.bincount(home_slot, minlength=n_slots) + np.bincount(
+            away_slot, minlength=n_slots
+        )
+        np.maximum.at(peak, home_slot, home_after)
+        np.maximum.at(peak, away_slot, away_after)
+        np.minimum.at(lowest, home_slot, home_after)
+        np.minimum.at(lowest, away_slot, away_after)
+        last_game = np.full(n_slots, -1, dtype=np.int64)
+        game_index = np.arange(n_games, dtype=np.int64)
+        np.maximum.at(last_game, home_slot, game_index)
+        np.maximum.at(last_game, away_slot, game_index)
+
+        return EloReplayResult(
+            team_codes=team_codes,
+            ratings=current,
+            games_played=games_played.astype(np.int64),
+            peak=peak,
+            lowest=lowest,
+            last_game=last_game,
+            home_slot=home_slot,
+            away_slot=away_slot,
+            home_before=before_home,
+            away_before=before_away,
+            home_change=change_home,
+            home_expected=np.array(home_expected, dtype=np.int64),
+            home_points=home_points,
+            mov=np.array(mov, dtype=np.int64),
+            k=k,
+            home_advantage=home_advantage,
+            season_boundaries=season_boundaries,
+        )
+
+    def _expected_units(self, team: int, opponent: int) -> int:
+        """Expected score in 1e-4 units for centi-Elo ratings (EloEngine.expected_score)."""
+        # (opponent - team) / 400 in Elo points; int / int is correctly rounded
+        power: float = 10.0 ** ((opponent - team) / (400 * 100))
+        scaled = _EXPECTED_SCALE / (1.0 + power)
+        rounded = math.floor(scaled + 0.5)
+        if abs(scaled - rounded) > 0.5 - _TIE_EPSILON:
+            return _to_units(
+                self.engine.expected_score(
+                    _from_units(team, RATING_PLACES), _from_units(opponent, RATING_PLACES)
+                ),
+                EXPECTED_PLACES,
+                "expected_score",
+            )
+        return rounded
+
+    def _mov_units(
+        self, log_component: float, winner: int, loser: int, scores: tuple[int, int]
+    ) -> int:
+        """MOV multiplier in centi units (EloEngine.margin_of_victory_multiplier)."""
+        elo_diff = (winner - loser) / 100
+        if elo_diff > 0:
+            autocorr = 2.2 / (elo_diff * 0.001 + 2.2)
+        else:
+            autocorr = 2.2 / (-elo_diff * 0.001 + 2.2)
+        multiplier = log_component * autocorr
+
+        scaled = multiplier * 100
+        rounded = math.floor(scaled + 0.5)
+        if (
+            abs(scaled - rounded) > 0.5 - _TIE_EPSILON
+            or abs(multiplier - self._mov_cap) < _TIE_EPSILON
+            or abs(multiplier - 1.0) < _TIE_EPSILON
+        ):
+            winner_score, loser_score = max(scores), min(scores)
+            return _to_units(
+                self.engine.margin_of_victory_multiplier(
+                    winner_score,
+                    loser_score,
+                    _from_units(winner, RATING_PLACES),
+                    _from_units(loser, RATING_PLACES),
+                ),
+                RATING_PLACES,
+                "mov_multiplier",
+            )
+        if multiplier > self._mov_cap:
+            return self._mov_cap_units
+        if multiplier < 1.0:
+            return 100
+        return rounded
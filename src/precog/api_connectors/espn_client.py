@@ -12,6 +12,8 @@ Key Features:
 - Automatic retries with exponential backoff
 - Comprehensive error handling
 - TypedDict return types for type safety
+- Conditional requests (ETag / Last-Modified) and per-event payload hashing,
+  so unchanged scoreboards and events are neither re-parsed nor re-synced
 
 Educational Notes:
 ------------------
@@ -39,7 +41,10 @@ Related Requirements:
     - ESPN API Client deliverable
 """
 
+import hashlib
+import json
 import logging
+import threading
 import time
 from datetime import datetime
 from decimal import Decimal
@@ -82,6 +87,15 @@ class RateLimitExceededError(ESPNAPIError):
 RateLimitExceeded = RateLimitExceededError
 
 
+class ScoreboardNotModifiedError(ESPNAPIError):
+    """Raised by _make_request when ESPN answers a conditional request with 304.
+
+    Educational Note:
+        Internal control flow only: get_scoreboard_delta() catches it and
+        serves the cached scoreboard, so callers never see it.
+    """
+
+
 # =============================================================================
 # TypedDict Response Types - Normalized ESPN Data Model
 # =============================================================================
@@ -413,6 +427,24 @@ class GameState(TypedDict, total=False):
     away_rank: int | None
 
 
+class ESPNScoreboardDelta(TypedDict):
+    """Scoreboard plus the games whose raw ESPN payload changed since the last fetch.
+
+    Fields:
+        games: Every game on the scoreboard (unchanged games are the same
+            objects returned by the previous fetch; treat them as read-only)
+        changed: Games that are new or whose event payload hash changed
+        not_modified: True if ESPN answered 304 (games is the cached list,
+            changed is empty)
+        parse_seconds: Time spent hashing and parsing events (0.0 on 304)
+    """
+
+    games: list[ESPNGameFull]
+    changed: list[ESPNGameFull]
+    not_modified: bool
+    parse_seconds: float
+
+
 # =============================================================================
 # ESPN Client
 # =============================================================================
@@ -526,7 +558,17 @@ class ESPNClient:
             # Convert requests/hour to tokens/second for TokenBucket
             capacity = rate_limit_per_hour
             refill_rate = rate_limit_per_hour / 3600.0
-            self.rate_limiter = TokenBucket(capacity=capacity, refill_rate=refill_rate)
+            self.rate_limiter = TokenBucket(capacity=capacity, refill_rate=refill_rate, name="espn")
+
+        # Conditional-request validators, last scoreboard and per-event
+        # (payload hash, parsed game) of each league's undated (live)
+        # scoreboard. Dated fetches keep no state, so backfills over many
+        # dates cannot grow these. Guarded by _cache_lock: per-league poll
+        # jobs share one client.
+        self._validators: dict[str, dict[str, str]] = {}
+        self._scoreboards: dict[str, list[ESPNGameFull]] = {}
+        self._event_cache: dict[str, dict[str, tuple[str, ESPNGameFull]]] = {}
+        self._cache_lock = threading.Lock()
 
         # Session for connection pooling
         self.session = requests.Session()
@@ -705,6 +747,68 @@ class ESPNClient:
             )
         return self._get_scoreboard(league, date)
 
+    def get_scoreboard_delta(
+        self, league: str, date: datetime | None = None
+    ) -> ESPNScoreboardDelta:
+        """
+        Fetch a scoreboard and report which games changed since the last fetch.
+
+        Sends the ETag / Last-Modified validators from the previous response.
+        A 304 returns the cached scoreboard with no changed games; otherwise
+        each event's raw payload is hashed and only new or changed events
+        are parsed.
+
+        Only the undated (live) scoreboard is tracked between calls. With a
+        date every game is parsed and reported as changed.
+
+        Args:
+            league: One of "nfl", "ncaaf", "nba", "ncaab", "nhl", "wnba"
+            date: Target date for scoreboard (default: today)
+
+        Returns:
+            ESPNScoreboardDelta with all games and the changed subset
+
+        Raises:
+            ValueError: If league is not supported
+            RateLimitExceeded: If rate limit would be exceeded
+            ESPNAPIError: If API request fails after retries
+
+        Educational Note:
+            During a long pregame window the scoreboard is byte-for-byte
+            identical poll after poll. ESPN's CDN honors If-None-Match, and
+            even when it does not, hashing the raw event dicts is much
+            cheaper than parsing them and re-running change detection in
+            the database.
+
+        Example:
+            >>> delta = client.get_scoreboard_delta("nfl")
+            >>> for game in delta["changed"]:
+            ...     sync(game)  # unchanged games need no work
+        """
+        if league not in self.ENDPOINTS:
+            raise ValueError(
+                f"Unsupported league: {league}. Supported: {list(self.ENDPOINTS.keys())}"
+            )
+        return self._get_scoreboard_delta(league, date)
+
+    def forget_events(self, league: str, event_ids: list[str]) -> None:
+        """
+        Drop cached hashes for events so the next fetch reports them as changed.
+
+        Callers use this when syncing an event failed. The league's
+        conditional validators are dropped too, so a 304 cannot hide the
+        retry.
+
+        Args:
+            league: League code
+            event_ids: ESPN event IDs to forget
+        """
+        with self._cache_lock:
+            events = self._event_cache.get(league, {})
+            for event_id in event_ids:
+                events.pop(event_id, None)
+            self._validators.pop(league, None)
+
     def get_live_games(self, league: str = "nfl") -> list[ESPNGameFull]:
         """
         Get only games currently in progress (excludes scheduled and final).
@@ -785,6 +889,21 @@ class ESPNClient:
         Returns:
             List of parsed ESPNGameFull dicts with metadata/state structure
         """
+        return self._get_scoreboard_delta(league, date)["games"]
+
+    def _get_scoreboard_delta(
+        self, league: str, date: datetime | None = None
+    ) -> ESPNScoreboardDelta:
+        """
+        Internal method to fetch a scoreboard, reusing unchanged parsed events.
+
+        Args:
+            league: League code (nfl, ncaaf, nba, etc.)
+            date: Target date (default: today)
+
+        Returns:
+            ESPNScoreboardDelta (see get_scoreboard_delta)
+        """
         # Non-blocking acquire: raise immediately if bucket empty (preserves old contract)
         if not self.rate_limiter.acquire(block=False):
             raise RateLimitExceededError(
@@ -796,32 +915,95 @@ class ESPNClient:
         params = {}
         if date:
             params["dates"] = date.strftime("%Y%m%d")
+        cache_key = self._scoreboard_cache_key(league, params)
 
-        # Make request with retries
-        response_data = self._make_request(url, params)
+        # Make request with retries (conditional if we hold validators)
+        try:
+            response_data = self._make_request(url, params)
+        except ScoreboardNotModifiedError:
+            with self._cache_lock:
+                cached_games = list(self._scoreboards.get(cache_key or "", []))
+            logger.debug("%s scoreboard not modified (304)", league.upper())
+            return {
+                "games": cached_games,
+                "changed": [],
+                "not_modified": True,
+                "parse_seconds": 0.0,
+            }
 
-        # Parse events from response
-        events = response_data.get("events", [])
-        if not events:
-            return []
+        parse_start = time.perf_counter()
+        previous: dict[str, tuple[str, ESPNGameFull]] = {}
+        if cache_key is not None:
+            with self._cache_lock:
+                previous = self._event_cache.get(cache_key, {})
 
-        # Parse each event into ESPNGameFull
+        # Parse each new or changed event into ESPNGameFull; reuse the rest
         games: list[ESPNGameFull] = []
-        for event in events:
+        changed: list[ESPNGameFull] = []
+        current: dict[str, tuple[str, ESPNGameFull]] = {}
+        events = response_data.get("events", []) or []
+        for event in events if isinstance(events, list) else []:
+            if not isinstance(event, dict):
+                continue
             try:
+                event_id = str(event.get("id") or "")
+                digest = self._event_digest(event)
+                cached = previous.get(event_id) if event_id else None
+                if cached is not None and cached[0] == digest:
+                    games.append(cached[1])
+                    current[event_id] = cached
+                    continue
                 game_full = self._parse_event(event, league)
-                if game_full:
-                    games.append(game_full)
             except Exception as e:
                 logger.warning(f"Failed to parse event {event.get('id', 'unknown')}: {e}")
                 continue
+            if game_full:
+                games.append(game_full)
+                changed.append(game_full)
+                if event_id:
+                    current[event_id] = (digest, game_full)
+
+        if cache_key is not None:
+            with self._cache_lock:
+                self._event_cache[cache_key] = current
+                self._scoreboards[cache_key] = games
+
+        return {
+            "games": list(games),
+            "changed": changed,
+            "not_modified": False,
+            "parse_seconds": time.perf_counter() - parse_start,
+        }
+
+    @staticmethod
+    def _scoreboard_cache_key(league: str, params: dict[str, Any] | None) -> str | None:
+        """Key for validators and event hashes: the league, or None for a dated request."""
+        if (params or {}).get("dates"):
+            return None
+        return league
+
+    @classmethod
+    def _league_for_url(cls, url: str) -> str | None:
+        """League whose scoreboard endpoint is url (None for other URLs)."""
+        for league, endpoint in cls.ENDPOINTS.items():
+            if endpoint == url:
+                return league
+        return None
 
-        return games
+    @staticmethod
+    def _event_digest(event: dict[str, Any]) -> str:
+        """Stable hash of a raw ESPN event payload."""
+        payload = json.dumps(event, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
 
     def _make_request(self, url: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
         """
         Make HTTP request with retries and exponential backoff.
 
+        Undated scoreboard requests are conditional: the ETag /
+        Last-Modified validators of the league's previous response are
+        sent, and the new response's validators are stored.
+
         Args:
             url: Request URL
             params: Query parameters
@@ -830,27 +1012,45 @@ class ESPNClient:
             Parsed JSON response
 
         Raises:
+            ScoreboardNotModifiedError: If a conditional request returned 304
             ESPNAPIError: After all retries exhausted
         """
         last_exception: Exception | None = None
 
+        league = self._league_for_url(url)
+        cache_key = self._scoreboard_cache_key(league, params) if league else None
+        conditional_headers: dict[str, str] = {}
+        if cache_key is not None:
+            with self._cache_lock:
+                validators = dict(self._validators.get(cache_key, {}))
+            if "ETag" in validators:
+                conditional_headers["If-None-Match"] = validators["ETag"]
+            if "Last-Modified" in validators:
+                conditional_headers["If-Modified-Since"] = validators["Last-Modified"]
+
         for attempt in range(self.max_retries + 1):
             try:
                 response = self.session.get(
                     url,
                     params=params,
                     timeout=self.timeout_seconds,
+                    headers=conditional_headers or None,
                 )
 
+                if conditional_headers and response.status_code == 304:
+                    raise ScoreboardNotModifiedError(f"Not modified: {url}")
+
                 # Check for HTTP errors
                 response.raise_for_status()
 
                 # Parse JSON
                 try:
                     result: dict[str, Any] = response.json()
-                    return result
                 except ValueError as e:
                     raise ESPNAPIError(f"Invalid JSON response: {e}") from e
+                if cache_key is not None:
+                    self._store_validators(cache_key, response)
+                return result
 
             except requests.Timeout as e:
                 last_exception = e
@@ -917,6 +1117,20 @@ class ESPNClient:
             f"Request failed after {self.max_retries + 1} attempts"
         ) from last_exception
 
+    def _store_validators(self, cache_key: str, response: requests.Response) -> None:
+        """Remember the response's ETag / Last-Modified for the next conditional request."""
+        headers = getattr(response, "headers", None) or {}
+        validators = {
+            name: value
+            for name in ("ETag", "Last-Modified")
+            if isinstance(value := headers.get(name), str) and value
+        }
+        with self._cache_lock:
+            if validators:
+                self._validators[cache_key] = validators
+            else:
+                self._validators.pop(cache_key, None)
+
     def _parse_event(self, event: dict[str, Any], league: str = "nfl") -> ESPNGameFull | None:
         """
         Parse ESPN event into normalized ESPNGameFull structure.
@@ -33,7 +33,11 @@ Related Requirements:
 
 import logging
 import os
+import queue
+import threading
 import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 from typing import Any, ClassVar, cast
 from urllib.parse import urlparse
@@ -46,6 +50,7 @@ from precog.config.environment import MarketMode, get_market_mode
 from .kalshi_auth import KalshiAuth
 from .rate_limiter import RateLimiter
 from .types import (
+    MarketPage,
     OrderData,
     ProcessedFillData,
     ProcessedMarketData,
@@ -272,7 +277,9 @@ class KalshiClient:
         # Rate limiting (Kalshi Basic tier: 20 req/sec = 1,200 req/min)
         # Reference: https://docs.kalshi.com/getting_started/rate_limits
         self.rate_limiter = (
-            rate_limiter if rate_limiter is not None else RateLimiter(requests_per_minute=1200)
+            rate_limiter
+            if rate_limiter is not None
+            else RateLimiter(requests_per_minute=1200, name="kalshi")
         )
 
         logger.info(
@@ -1500,6 +1507,7 @@ class KalshiClient:
         series_tickers: list[str] | None = None,
         sports: list[str] | None = None,
         max_pages: int = 100,
+        max_workers: int = 1,
     ) -> list[ProcessedMarketData]:
         """
         Fetch ALL markets with automatic pagination.
@@ -1515,6 +1523,10 @@ class KalshiClient:
                    Takes precedence over series_tickers if both provided.
             max_pages: Maximum pages to fetch (default 100, safety limit).
                       At 200 markets/page, this allows up to 20,000 markets.
+                      Applied per series when filtering by series.
+            max_workers: Number of series to paginate concurrently (default 1,
+                        sequential). Values > 1 fan out via iter_market_pages();
+                        results are still returned in series order.
 
         Returns:
             List of all markets matching the filter criteria.
@@ -1569,8 +1581,21 @@ class KalshiClient:
         elif series_tickers:
             target_series = series_tickers
 
+        # A series listed twice (or shared by two sports) is fetched once
+        target_series = list(dict.fromkeys(target_series))
+
         # If filtering by series, fetch each series separately
-        if target_series:
+        if target_series and max_workers > 1 and len(target_series) > 1:
+            by_series: dict[str, list[ProcessedMarketData]] = {}
+            for page in self.iter_market_pages(
+                target_series, max_workers=max_workers, max_pages=max_pages
+            ):
+                if page["error"] is not None:
+                    raise page["error"]
+                by_series.setdefault(page["series_ticker"], []).extend(page["markets"])
+            for series_ticker in target_series:
+                all_markets.extend(by_series.get(series_ticker, []))
+        elif target_series:
             for series_ticker in target_series:
                 cursor: str | None = None
                 pages_fetched = 0
@@ -1632,6 +1657,106 @@ class KalshiClient:
 
         return all_markets
 
+    def iter_market_pages(
+        self,
+        series_tickers: list[str],
+        max_workers: int = 4,
+        max_pages: int = 100,
+    ) -> Iterator[MarketPage]:
+        """
+        Stream market pages for several series, paginating series concurrently.
+
+        Each series walks its own cursor chain on a worker thread; pages are
+        yielded to the caller as soon as they arrive, so the caller can
+        process (e.g. sync to the database) page N while later pages are
+        still in flight.
+
+        Args:
+            series_tickers: Series tickers to fetch (e.g., ["KXNFLGAME", "KXNBAGAME"])
+            max_workers: Maximum number of series fetched at once (default 4)
+            max_pages: Maximum pages to fetch per series (default 100, safety limit)
+
+        Yields:
+            MarketPage dicts in arrival order. Every series produces exactly
+            one page with is_last=True. Errors are not raised; a failing
+            series yields a final page with ``error`` set so the remaining
+            series keep streaming.
+
+        Example:
+            >>> for page in client.iter_market_pages(["KXNFLGAME", "KXNBAGAME"]):
+            ...     if page["error"] is None:
+            ...         sync(page["markets"])
+
+        Educational Note:
+            All workers share this client's RateLimiter (a thread-safe token
+            bucket), so concurrency overlaps network latency but never
+            exceeds the configured request rate. The bounded pool keeps the
+            number of in-flight requests (and open connections) predictable.
+
+            If the consumer stops iterating early (or raises), queued series
+            are cancelled and in-flight workers stop before their next page
+            request. The generator returns without waiting for them, so an
+            early exit costs at most the requests already on the wire.
+
+        Reference: REQ-API-001 (Kalshi API Integration)
+        """
+        series_tickers = list(dict.fromkeys(series_tickers))
+        if not series_tickers or max_pages < 1:
+            return
+
+        pages: queue.Queue[MarketPage] = queue.Queue()
+        stopped = threading.Event()
+
+        def _walk_series(series_ticker: str) -> None:
+            cursor: str | None = None
+            page_number = 0
+            try:
+                while page_number < max_pages and not stopped.is_set():
+                    markets, cursor = self._get_markets_page(
+                        series_ticker=series_ticker,
+                        limit=200,
+                        cursor=cursor,
+                    )
+                    page_number += 1
+                    is_last = not markets or not cursor or page_number >= max_pages
+                    pages.put(
+                        {
+                            "series_ticker": series_ticker,
+                            "markets": markets,
+                            "page_number": page_number,
+                            "is_last": is_last,
+                            "error": None,
+                        }
+                    )
+                    if is_last:
+                        return
+            except Exception as e:
+                pages.put(
+                    {
+                        "series_ticker": series_ticker,
+                        "markets": [],
+                        "page_number": page_number + 1,
+                        "is_last": True,
+                        "error": e,
+                    }
+                )
+
+        workers = max(1, min(max_workers, len(series_tickers)))
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="kalshi-markets")
+        try:
+            for series_ticker in series_tickers:
+                executor.submit(_walk_series, series_ticker)
+
+            remaining = len(series_tickers)
+            while remaining:
+                page = pages.get()
+                if page["is_last"]:
+                    remaining -= 1
+                yield page
+        finally:
+            stopped.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def get_sports_series(
         self,
         sports: list[str] | None = None,
@@ -34,8 +34,23 @@ import logging
 import threading
 import time
 
+from precog.utils.metrics import get_metrics_registry
+
 logger = logging.getLogger(__name__)
 
+_metrics = get_metrics_registry()
+_WAIT_SECONDS = _metrics.histogram(
+    "precog_rate_limit_wait_seconds", "Time spent waiting for rate limit tokens", ("limiter",)
+)
+_REJECTIONS = _metrics.counter(
+    "precog_rate_limit_rejections_total",
+    "Non-blocking token requests denied by the rate limiter",
+    ("limiter",),
+)
+_THROTTLED = _metrics.counter(
+    "precog_rate_limit_429_total", "429 responses handled by the rate limiter", ("limiter",)
+)
+
 
 class TokenBucket:
     """
@@ -68,13 +83,14 @@ class TokenBucket:
         - Lock prevents this data race
     """
 
-    def __init__(self, capacity: int, refill_rate: float):
+    def __init__(self, capacity: int, refill_rate: float, name: str = "default"):
         """
         Initialize token bucket.
 
         Args:
             capacity: Maximum tokens (e.g., 1200 for Kalshi Basic tier)
             refill_rate: Tokens per second (e.g., 20 for 1200/min)
+            name: Label for this limiter's wait-time metrics (e.g., "kalshi")
 
         Example:
             >>> # Kalshi Basic tier: 1,200 requests per minute (20/sec)
@@ -82,6 +98,7 @@ class TokenBucket:
         """
         self.capacity = capacity
         self.refill_rate = refill_rate
+        self.name = name
         self.tokens = float(capacity)  # Start with full bucket
         self.last_refill = time.time()
         self._lock = threading.Lock()  # Thread safety
@@ -195,6 +212,7 @@ class TokenBucket:
                     f"Cannot acquire {tokens} token(s), only {self.tokens:.1f} available",
                     extra={"tokens_requested": tokens, "tokens_available": self.tokens},
                 )
+                _REJECTIONS.labels(self.name).inc()
                 return False
 
         # Blocking mode: Wait and retry
@@ -208,6 +226,7 @@ class TokenBucket:
         )
 
         time.sleep(wait_time)
+        _WAIT_SECONDS.labels(self.name).observe(wait_time)
 
         # Retry acquisition after waiting
         return self.acquire(tokens=tokens, block=True)
@@ -256,13 +275,16 @@ class RateLimiter:
         - Provides simple wait_if_needed() interface
     """
 
-    def __init__(self, requests_per_minute: int, burst_size: int | None = None):
+    def __init__(
+        self, requests_per_minute: int, burst_size: int | None = None, name: str = "default"
+    ):
         """
         Initialize rate limiter.
 
         Args:
             requests_per_minute: Maximum requests per minute (e.g., 100)
             burst_size: Maximum burst size (defaults to requests_per_minute)
+            name: Label for this limiter's metrics (e.g., "kalshi")
 
         Example:
             >>> # Kalshi Basic tier: 1,200 requests per minute (20/sec)
@@ -274,7 +296,7 @@ class RateLimiter:
         # Convert to token bucket parameters
         refill_rate = requests_per_minute / 60.0  # tokens per second
 
-        self.bucket = TokenBucket(capacity=self.burst_size, refill_rate=refill_rate)
+        self.bucket = TokenBucket(capacity=self.burst_size, refill_rate=refill_rate, name=name)
 
         logger.info(
             f"RateLimiter initialized: {requests_per_minute} req/min (burst: {self.burst_size})",
@@ -325,6 +347,7 @@ class RateLimiter:
             f"Rate limit (429) error, waiting {wait_time}s before retry",
             extra={"retry_after_seconds": wait_time},
         )
+        _THROTTLED.labels(self.bucket.name).inc()
 
         time.sleep(wait_time)
 
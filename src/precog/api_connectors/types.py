@@ -492,6 +492,27 @@ class SeriesResponse(TypedDict):
     cursor: str | None
 
 
+# =============================================================================
+# Market Page Streaming Types (for iter_market_pages)
+# =============================================================================
+
+
+class MarketPage(TypedDict):
+    """One page of markets streamed by KalshiClient.iter_market_pages().
+
+    Pages from different series arrive interleaved in completion order.
+    Within a series, pages arrive in cursor order and exactly one page has
+    is_last=True. A failed series yields a single final page with the
+    exception in ``error`` and no markets.
+    """
+
+    series_ticker: str
+    markets: list[ProcessedMarketData]
+    page_number: int
+    is_last: bool
+    error: Exception | None
+
+
 # =============================================================================
 # ESPN Odds Types (DraftKings via ESPN Scoreboard API)
 # =============================================================================
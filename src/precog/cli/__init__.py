@@ -35,6 +35,13 @@ Architecture:
         -> cli/__init__.py (this file, app assembly)
             -> cli/kalshi.py, cli/espn.py, etc. (command implementations)
 
+    Command groups are registered lazily: register_commands() records each
+    group's module path, and LazyTyperGroup imports a module only when its
+    group is resolved. `precog system version` therefore imports cli/system.py
+    and nothing else; cron jobs and health probes no longer pay for importing
+    every group. Listing all groups (`precog --help`, shell completion)
+    still imports them all.
+
 Related:
     - Issue #204: Refactor main.py into modular CLI
     - docs/planning/CLI_REFACTOR_COMPREHENSIVE_PLAN_V1.0.md
@@ -44,10 +51,68 @@ Related:
 
 from __future__ import annotations
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 import typer
+import typer.main
+from typer.core import TyperGroup
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# Registered command groups: name -> (module path, help). Filled by
+# register_commands(); modules are imported by LazyTyperGroup on first use.
+_COMMAND_GROUPS: dict[str, tuple[str, str]] = {}
+
+
+class LazyTyperGroup(TyperGroup):
+    """Root command group that imports registered sub-apps on demand.
+
+    Eagerly added commands (app.add_typer) behave as usual. Names in
+    _COMMAND_GROUPS are listed without importing anything and loaded
+    the first time click resolves them.
+    """
+
+    def list_commands(self, ctx: Any) -> list[str]:
+        """List loaded commands, then registered groups not loaded yet."""
+        loaded = super().list_commands(ctx)
+        return loaded + [name for name in _COMMAND_GROUPS if name not in self.commands]
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Any:
+        """Return a command, importing its module if it is a lazy group."""
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in _COMMAND_GROUPS:
+            command = _load_command_group(cmd_name, self.rich_markup_mode)
+            self.add_command(command, cmd_name)
+        return command
+
+    def resolve_command(self, ctx: Any, args: Sequence[str]) -> Any:
+        """Load every group before failing on an unknown name.
+
+        Typer's "Did you mean ...?" hint only considers loaded commands.
+        """
+        if args and args[0] not in self.commands and args[0] not in _COMMAND_GROUPS:
+            for name in self.list_commands(ctx):
+                self.get_command(ctx, name)
+        return super().resolve_command(ctx, list(args))
+
+
+def _load_command_group(name: str, rich_markup_mode: Any) -> Any:
+    """Import a registered group's module and build its click command."""
+    module_path, help_text = _COMMAND_GROUPS[name]
+    sub_app = importlib.import_module(module_path).app
+
+    # Build the group the way app.add_typer() would, so help text and
+    # markup mode match an eagerly registered group.
+    holder = typer.Typer(rich_markup_mode=rich_markup_mode)
+    holder.add_typer(sub_app, name=name, help=help_text)
+    return typer.main.get_command(holder).commands[name]  # type: ignore[attr-defined]
+
 
 # Create the main CLI app
 app = typer.Typer(
+    cls=LazyTyperGroup,
     name="precog",
     help="Precog - Prediction Market Trading System",
     no_args_is_help=True,
@@ -58,9 +123,9 @@ app = typer.Typer(
 def register_commands() -> None:
     """Register all command groups with the main app.
 
-    This function is called during app initialization to register
-    all sub-applications. Import is deferred to avoid circular imports
-    and improve startup time.
+    Only the module path of each group is recorded; the module itself is
+    imported when the group is invoked (see LazyTyperGroup). Safe to call
+    more than once.
 
     Command groups are registered in order of typical usage:
     1. Data access (kalshi, espn)
@@ -68,57 +133,23 @@ def register_commands() -> None:
     3. Operations (scheduler, config, system)
     4. Future stubs (strategy, model, position, trade)
     """
-    # Import command modules (deferred for performance)
-    from precog.cli import backup as backup_cmd
-    from precog.cli import circuit_breaker as circuit_breaker_cmd
-    from precog.cli import config as config_cmd
-    from precog.cli import data as data_cmd
-    from precog.cli import db as db_cmd
-    from precog.cli import espn as espn_cmd
-    from precog.cli import kalshi as kalshi_cmd
-    from precog.cli import scheduler as scheduler_cmd
-    from precog.cli import system as system_cmd
-
-    # Register command groups
-    app.add_typer(kalshi_cmd.app, name="kalshi", help="Kalshi market operations")
-    app.add_typer(espn_cmd.app, name="espn", help="ESPN data operations")
-    app.add_typer(data_cmd.app, name="data", help="Data seeding and management")
-    app.add_typer(db_cmd.app, name="db", help="Database operations")
-    app.add_typer(backup_cmd.app, name="backup", help="Database backup and restore")
-    app.add_typer(scheduler_cmd.app, name="scheduler", help="Service management")
-    app.add_typer(config_cmd.app, name="config", help="Configuration management")
-    app.add_typer(system_cmd.app, name="system", help="System utilities")
-    app.add_typer(
-        circuit_breaker_cmd.app,
-        name="circuit-breaker",
-        help="Circuit breaker management",
-    )
-
-    # Register future command stubs (Phase 4-5)
-    from precog.cli._future import model as model_cmd
-    from precog.cli._future import position as position_cmd
-    from precog.cli._future import strategy as strategy_cmd
-    from precog.cli._future import trade as trade_cmd
-
-    app.add_typer(
-        strategy_cmd.app,
-        name="strategy",
-        help="[Phase 4] Strategy management",
-    )
-    app.add_typer(
-        model_cmd.app,
-        name="model",
-        help="[Phase 4] Model management",
-    )
-    app.add_typer(
-        position_cmd.app,
-        name="position",
-        help="[Phase 5] Position management",
-    )
-    app.add_typer(
-        trade_cmd.app,
-        name="trade",
-        help="[Phase 5] Trading operations",
+    _COMMAND_GROUPS.update(
+        {
+            "kalshi": ("precog.cli.kalshi", "Kalshi market operations"),
+            "espn": ("precog.cli.espn", "ESPN data operations"),
+            "data": ("precog.cli.data", "Data seeding and management"),
+            "db": ("precog.cli.db", "Database operations"),
+            "backup": ("precog.cli.backup", "Database backup and restore"),
+            "scheduler": ("precog.cli.scheduler", "Service management"),
+            "config": ("precog.cli.config", "Configuration management"),
+            "system": ("precog.cli.system", "System utilities"),
+            "circuit-breaker": ("precog.cli.circuit_breaker", "Circuit breaker management"),
+            # Future command stubs (Phase 4-5)
+            "strategy": ("precog.cli._future.strategy", "[Phase 4] Strategy management"),
+            "model": ("precog.cli._future.model", "[Phase 4] Model management"),
+            "position": ("precog.cli._future.position", "[Phase 5] Position management"),
+            "trade": ("precog.cli._future.trade", "[Phase 5] Trading operations"),
+        }
     )
 
 
@@ -166,4 +197,4 @@ def main() -> None:
     app()
 
 
-__all__ = ["app", "main", "register_commands"]
+__all__ = ["LazyTyperGroup", "app", "main", "register_commands"]
@@ -36,9 +36,10 @@ from typing import TYPE_CHECKING, Any, NoReturn
 
 import typer
 from rich.console import Console
-from rich.table import Table
 
 if TYPE_CHECKING:
+    from rich.table import Table
+
     from precog.api_connectors.espn_client import ESPNClient
     from precog.api_connectors.kalshi_client import KalshiClient
 
@@ -284,6 +285,8 @@ def format_table(
         ... )
         >>> console.print(table)
     """
+    from rich.table import Table
+
     table = Table(title=title, show_header=show_header)
 
     for col in columns:
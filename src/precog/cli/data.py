@@ -156,6 +156,7 @@ def seed(
         precog data seed --type stats --seasons 2023,2024 --stat-type weekly
         precog data seed --type stats --seasons 2024 --stat-type team
     """
+    _use_backfill_timeouts()
     console.print(f"\n[bold cyan]Seeding {seed_type.value} data...[/bold cyan]\n")
 
     try:
@@ -182,6 +183,14 @@ def seed(
         )
 
 
+def _use_backfill_timeouts() -> None:
+    """Run this command's queries under the BACKFILL statement timeout."""
+    from precog.database.connection import set_default_usage_class
+    from precog.database.connection_pool import UsageClass
+
+    set_default_usage_class(UsageClass.BACKFILL)
+
+
 def _seed_teams(sports: str, dry_run: bool, verbose: bool) -> None:
     """Seed team reference data."""
     from precog.database.seeding import SeedingConfig, SeedingManager
@@ -946,6 +955,13 @@ def seed_espn(
         "--fetch/--cache-only",
         help="Fetch from ESPN API (default) or use cache only",
     ),
+    workers: int = typer.Option(
+        4,
+        "--workers",
+        "-w",
+        min=1,
+        help="Concurrent ESPN requests for uncached dates",
+    ),
     verbose: bool = typer.Option(
         False,
         "--verbose",
@@ -959,13 +975,17 @@ def seed_espn(
     Subsequent runs with --cache-only skip API calls.
 
     Caching:
-        Data cached to data/historical/espn/{sport}/{YYYY-MM-DD}.json
+        Data cached to data/historical/espn/{sport}/{season}.pack
+        (one compressed, indexed file per season).
         Use --cache-only to load from cache without API calls.
         Useful for reproducibility and offline development.
+        An interrupted run can simply be rerun: dates already fetched are
+        read from the cache and only the missing ones are requested.
 
     Rate Limiting:
-        ESPN allows ~500 requests/hour. With 7.5s between requests,
-        a full season (~180 days) takes ~22 minutes.
+        Uncached dates are fetched by --workers concurrent requests that
+        share the ESPN client's token bucket, so the hourly limit holds
+        regardless of the worker count.
 
     Examples:
         # Seed NFL 2023 regular season (fetch from API + cache)
@@ -982,6 +1002,7 @@ def seed_espn(
         - ESPNClient: API client with rate limiting
         - data/historical/espn/: Cache directory
     """
+    _use_backfill_timeouts()
     from datetime import datetime as dt
 
     from precog.database.seeding.batch_result import ErrorHandlingMode
@@ -1031,6 +1052,7 @@ def seed_espn(
             fetch_missing=fetch,  # Only fetch if --fetch
             error_mode=ErrorHandlingMode.COLLECT,
             show_progress=True,
+            max_workers=workers,
         )
     except Exception as e:
         cli_error(
@@ -1431,6 +1453,7 @@ def seed_lib(
         - Issue #229: Expanded Historical Data Sources
         - docs/guides/: Data source adapter documentation
     """
+    _use_backfill_timeouts()
 
     # Parse seasons
     try:
@@ -1634,6 +1657,7 @@ def compute_elo(
         precog data compute-elo nfl --recompute  # Force recomputation
         precog data compute-elo nfl --sync       # Also update teams table
     """
+    _use_backfill_timeouts()
     from precog.analytics.elo_computation_service import (
         EloComputationService,
         get_elo_computation_stats,
@@ -1977,6 +2001,7 @@ def matching_backfill(
         precog data matching backfill
         precog data matching backfill --league nfl
     """
+    _use_backfill_timeouts()
     console.print("\n[bold cyan]Matching Backfill[/bold cyan]\n")
 
     try:
@@ -198,12 +198,16 @@ def _create_priority_calculator() -> Any:
         # Cache TTL
         cache_ttl = int(priority_config.get("market_count_cache_ttl", 300))
 
+        # Down-weighting for leagues with unchanged scoreboards
+        quiet_factor = float(priority_config.get("quiet_priority_factor", "0.5"))
+
         return LeaguePriorityCalculator(
             weights=weights,
             league_priorities=league_priorities,
             market_thresholds=market_thresholds,
             market_count_cache_ttl=cache_ttl,
             market_count_fn=count_open_markets_by_subcategory,
+            quiet_priority_factor=quiet_factor,
         )
     except Exception:
         # Config missing, YAML error, or import failure — fall back to uniform allocation
@@ -224,6 +228,11 @@ def _start_supervised_mode(
     foreground: bool,
     force: bool,
     verbose: bool,
+    metrics_port: int | None = None,
+    kalshi_batch_sync: bool = False,
+    kalshi_fetch_workers: int = 1,
+    espn_live_elo: bool = False,
+    streaming_alignment: bool = False,
 ) -> None:
     """Start services using ServiceSupervisor for production-grade management.
 
@@ -244,6 +253,11 @@ def _start_supervised_mode(
         foreground: Run in foreground (blocks until Ctrl+C)
         force: Override startup guard if another scheduler is detected
         verbose: Enable verbose output
+        metrics_port: Serve Prometheus metrics on 127.0.0.1:<port> (None = off)
+        kalshi_batch_sync: Sync Kalshi markets with the batched per-series path
+        kalshi_fetch_workers: Kalshi series paginated concurrently (1 = sequential)
+        espn_live_elo: Update Elo ratings incrementally as ESPN games go final
+        streaming_alignment: Run the streaming temporal aligner alongside the pollers
 
     Educational Note:
         ServiceSupervisor implements the "let it crash" philosophy from Erlang/OTP,
@@ -281,12 +295,18 @@ def _start_supervised_mode(
     console.print("[bold]Configuration:[/bold]")
     if espn:
         console.print(f"  ESPN: {', '.join(league_list)} (interval: {espn_interval}s)")
+        if espn_live_elo:
+            console.print("  Live Elo: enabled")
     if kalshi:
         console.print(
             f"  Kalshi: {', '.join(series_list)} ({kalshi_env}, interval: {kalshi_interval}s)"
         )
     console.print(f"  Health check interval: {health_interval}s")
     console.print(f"  Max restarts: {max_restarts}")
+    if metrics_port is not None:
+        console.print(f"  Metrics endpoint: http://127.0.0.1:{metrics_port}/metrics")
+    if streaming_alignment:
+        console.print("  Temporal alignment: streaming")
     console.print()
 
     # Validate system readiness before starting
@@ -308,6 +328,11 @@ def _start_supervised_mode(
             kalshi_poll_interval=kalshi_interval,
             health_check_interval=health_interval,
             priority_calculator=priority_calculator,
+            metrics_port=metrics_port,
+            kalshi_batch_sync=kalshi_batch_sync,
+            kalshi_fetch_workers=kalshi_fetch_workers,
+            espn_live_elo=espn_live_elo,
+            streaming_alignment=streaming_alignment,
         )
 
         # Register alert callback for console output
@@ -497,6 +522,11 @@ def start(
         "--espn-interval",
         help="ESPN poll interval in seconds (default: 30, adaptive idle: 300)",
     ),
+    espn_live_elo: bool = typer.Option(
+        False,
+        "--live-elo/--no-live-elo",
+        help="Update team Elo ratings as ESPN games go final",
+    ),
     kalshi_interval: int = typer.Option(
         15,
         "--kalshi-interval",
@@ -517,6 +547,17 @@ def start(
         "--series",
         help="Comma-separated list of Kalshi series to poll",
     ),
+    kalshi_batch_sync: bool = typer.Option(
+        False,
+        "--kalshi-batch-sync/--no-kalshi-batch-sync",
+        help="Sync each Kalshi series page with one batched DB round trip",
+    ),
+    kalshi_fetch_workers: int = typer.Option(
+        1,
+        "--kalshi-fetch-workers",
+        min=1,
+        help="Kalshi series paginated concurrently (default: 1, sequential)",
+    ),
     foreground: bool = typer.Option(
         False,
         "--foreground",
@@ -545,6 +586,16 @@ def start(
         "--health-interval",
         help="Health check interval in seconds (supervised mode)",
     ),
+    metrics_port: int | None = typer.Option(
+        None,
+        "--metrics-port",
+        help="Serve Prometheus metrics on 127.0.0.1:<port>/metrics (supervised mode)",
+    ),
+    streaming_alignment: bool = typer.Option(
+        False,
+        "--streaming-alignment/--no-streaming-alignment",
+        help="Align market snapshots to game states as they are written (supervised mode)",
+    ),
     force: bool = typer.Option(
         False,
         "--force",
@@ -583,6 +634,8 @@ def start(
         - Auto-restart with exponential backoff on failures
         - Circuit breaker (stops restarting after max_restarts)
         - Aggregate metrics across all services
+        - Prometheus /metrics endpoint (--metrics-port)
+        - Streaming temporal alignment (--streaming-alignment)
 
     Examples:
         precog scheduler start
@@ -590,14 +643,21 @@ def start(
         precog scheduler start --espn-interval 30 --kalshi-interval 60
         precog scheduler start --foreground
         precog scheduler start --kalshi-env prod
+        precog scheduler start --kalshi-batch-sync --kalshi-fetch-workers 4
+        precog scheduler start --supervised --live-elo
         precog scheduler start --supervised --foreground
+        precog scheduler start --supervised --metrics-port 9464
+        precog scheduler start --supervised --streaming-alignment
     """
     global _espn_updater, _kalshi_poller
 
+    from precog.database.connection import set_default_usage_class
+    from precog.database.connection_pool import UsageClass
     from precog.schedulers import ESPNGamePoller, KalshiMarketPoller
     from precog.utils.logger import get_logger
 
     logger = get_logger(__name__)
+    set_default_usage_class(UsageClass.POLLER)
 
     if verbose:
         logger.info("Verbose mode enabled")
@@ -642,6 +702,11 @@ def start(
             foreground=foreground,
             force=force,
             verbose=verbose,
+            metrics_port=metrics_port,
+            kalshi_batch_sync=kalshi_batch_sync,
+            kalshi_fetch_workers=kalshi_fetch_workers,
+            espn_live_elo=espn_live_elo,
+            streaming_alignment=streaming_alignment,
         )
         return
 
@@ -659,6 +724,8 @@ def start(
         console.print("[1/2] Starting ESPN game state polling...")
         console.print(f"  Leagues: {', '.join(league_list)}")
         console.print(f"  Interval: {espn_interval} seconds")
+        if espn_live_elo:
+            console.print("  Live Elo: enabled")
 
         try:
             # Wire priority-based adaptive polling (#560)
@@ -667,6 +734,7 @@ def start(
                 leagues=league_list,
                 poll_interval=espn_interval,
                 priority_calculator=priority_calculator,
+                live_elo=espn_live_elo,
             )
             _espn_updater.start()
             console.print("[green][OK] ESPN polling started[/green]")
@@ -688,6 +756,8 @@ def start(
                 series_tickers=series_list,
                 poll_interval=kalshi_interval,
                 environment=kalshi_env,
+                batch_sync=kalshi_batch_sync,
+                fetch_workers=kalshi_fetch_workers,
             )
             _kalshi_poller.start()
             console.print("[green][OK] Kalshi polling started[/green]")
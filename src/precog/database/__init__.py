@@ -19,23 +19,27 @@ Environment Safety (Issue #161):
 """
 
 from .connection import (
+    execute_prepared,
     execute_query,
     fetch_all,
     fetch_one,
     get_connection,
     get_cursor,
     get_environment,
+    get_pool_stats,
     protect_dangerous_operation,
     require_environment,
 )
 
 __all__ = [
+    "execute_prepared",
     "execute_query",
     "fetch_all",
     "fetch_one",
     "get_connection",
     "get_cursor",
     "get_environment",
+    "get_pool_stats",
     "protect_dangerous_operation",
     "require_environment",
 ]
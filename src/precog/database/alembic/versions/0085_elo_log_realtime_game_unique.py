@@ -0,0 +1,67 @@
+"""Unique realtime Elo log row per game (partial unique index).
+
+Live Elo (LiveEloUpdater via crud_elo.apply_game_elo_update) logs one
+elo_calculation_log row per finished game and moves both teams' ratings in
+the same transaction. Its "not already logged" check was a WHERE NOT EXISTS
+with no constraint behind it, so two poller processes that saw the same
+final could both pass the check and apply the game twice.
+
+This adds a partial unique index on elo_calculation_log(game_id) for
+calculation_source = 'realtime'. apply_game_elo_update() inserts with
+ON CONFLICT ... DO NOTHING against it, so the second writer inserts nothing
+and leaves the ratings alone. Batch recomputes (bootstrap / backfill /
+manual) keep one row per game per source and version, so the index does
+not cover them.
+
+Revision ID: 0085
+Revises: 0084
+Create Date: 2026-10-16
+
+Related:
+- Migration 0013: elo_calculation_log table (calculation_source CHECK)
+- Migration 0018: partial unique index + ON CONFLICT precedent
+
+WARNING: The upgrade fails if a game already has more than one realtime
+row. Find them first with:
+
+    SELECT game_id, COUNT(*) FROM elo_calculation_log
+    WHERE calculation_source = 'realtime' AND game_id IS NOT NULL
+    GROUP BY game_id HAVING COUNT(*) > 1;
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0085"
+down_revision: str = "0084"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the partial unique index on realtime Elo log rows.
+
+    Educational Note:
+        Rows with a NULL game_id never conflict (NULLs are distinct in a
+        unique index), and rows outside the WHERE clause are not indexed,
+        so only live updates are constrained. The index is also the arbiter
+        for ON CONFLICT (game_id) WHERE calculation_source = 'realtime'.
+    """
+    op.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_elo_log_realtime_game
+        ON elo_calculation_log(game_id)
+        WHERE calculation_source = 'realtime'
+    """)
+
+    op.execute("""
+        COMMENT ON INDEX idx_elo_log_realtime_game IS
+        'At most one realtime (live) Elo update per game. '
+        'Batch sources may log a game once per source and version.'
+    """)
+
+
+def downgrade() -> None:
+    """Drop the partial unique index."""
+    op.execute("DROP INDEX IF EXISTS idx_elo_log_realtime_game")
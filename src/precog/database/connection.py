@@ -25,6 +25,28 @@ Performance Metrics:
 - Configurable via DB_POOL_MIN_CONN / DB_POOL_MAX_CONN env vars
 - Idle behavior: Connections returned to pool immediately after use
 - Connection lifetime: Reused indefinitely (until close_pool() called)
+- Checkout waits up to DB_POOL_CHECKOUT_TIMEOUT seconds (default 30) when
+  every connection is in use, then raises PoolCheckoutTimeout
+- Warm size adapts to recent peak concurrency (see connection_pool.py)
+- get_pool_stats(): in-use/waiting counts, checkout waits, timeouts and
+  hold times per caller; holders over DB_POOL_SLOW_HOLD_SECONDS (default
+  10) are logged
+
+Statement Timeouts:
+- Optional server-side statement_timeout per usage class, from
+  DB_STATEMENT_TIMEOUT_MS_POLLER / _CLI / _BACKFILL (unset = server default)
+- Processes are CLI unless they call set_default_usage_class() (the
+  scheduler sets POLLER, seeding/backfill commands set BACKFILL)
+
+Prepared Statements:
+- Hot CRUD queries opt in by name (fetch_one(..., prepared="name") or
+  execute_prepared(cur, "name", query, params) inside get_cursor())
+- Each pooled connection PREPAREs a statement lazily on first use and then
+  only sends EXECUTE name (params), skipping parse/plan on every call
+- Which names a connection has prepared is tracked by the pool
+  (ConnectionSession), so the cache survives checkout/return
+- Cursors not backed by the pool (tests, get_connection() callers outside
+  the pool) fall back to a plain execute
 
 Architecture Pattern:
 This module uses the **Singleton Pattern** for the connection pool.
@@ -41,12 +63,14 @@ Related Requirements: REQ-DB-002 (Connection Pooling)
 Related ADR: ADR-008 (PostgreSQL Connection Strategy)
 """
 
+import re
+import sys
 from contextlib import contextmanager
-from typing import cast
+from typing import TYPE_CHECKING, Any, cast
 
 import psycopg2
 from dotenv import load_dotenv
-from psycopg2 import extras, pool
+from psycopg2 import errors, extras, pool
 
 from precog.config.environment import (
     AppEnvironment,
@@ -54,15 +78,34 @@ from precog.config.environment import (
     get_database_name,
     get_prefixed_env,
 )
+from precog.database.connection_pool import (
+    ConnectionSession,
+    InstrumentedConnectionPool,
+    UsageClass,
+)
 from precog.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from types import FrameType
+
 logger = get_logger(__name__)
 
 # Load environment variables from .env file
 load_dotenv()
 
 # Connection pool (global singleton)
-_connection_pool: pool.ThreadedConnectionPool | None = None
+_connection_pool: InstrumentedConnectionPool | None = None
+
+# Usage class for checkouts that do not pass one (see set_default_usage_class)
+_default_usage_class: UsageClass = UsageClass.CLI
+
+# Frames skipped when naming the caller of get_connection()/get_cursor()
+_INTERNAL_MODULES = frozenset({__name__, "contextlib"})
+
+# Prepared statement name -> (query as written, server-side SQL, parameter count)
+_prepared_queries: dict[str, tuple[str, str, int]] = {}
+_PREPARED_NAME = re.compile(r"^[a-z_][a-z0-9_]*$")
+_PLACEHOLDER = re.compile(r"%[%s]")
 
 # Valid environments (kept for backwards compatibility)
 VALID_ENVIRONMENTS = ("dev", "test", "staging", "prod")
@@ -218,6 +261,9 @@ def initialize_pool(
     database: str | None = None,
     user: str | None = None,
     password: str | None = None,
+    checkout_timeout: float | None = None,
+    slow_hold_seconds: float | None = None,
+    statement_timeouts: dict[UsageClass, int] | None = None,
 ):
     """
     Initialize PostgreSQL connection pool.
@@ -230,9 +276,15 @@ def initialize_pool(
         database: Database name (defaults to .env DB_NAME)
         user: Database user (defaults to .env DB_USER)
         password: Database password (defaults to .env DB_PASSWORD)
+        checkout_timeout: Seconds to wait for a free connection
+            (defaults to DB_POOL_CHECKOUT_TIMEOUT env or 30)
+        slow_hold_seconds: Hold time that logs a slow-holder warning
+            (defaults to DB_POOL_SLOW_HOLD_SECONDS env or 10)
+        statement_timeouts: Milliseconds per UsageClass (defaults to
+            DB_STATEMENT_TIMEOUT_MS_<CLASS> env vars; unset = server default)
 
     Returns:
-        Connection pool instance
+        Connection pool instance (InstrumentedConnectionPool)
 
     Educational Note:
         Pool sizing guidelines:
@@ -263,13 +315,23 @@ def initialize_pool(
     database = database or get_database_name()
     user = user or get_prefixed_env("DB_USER", "postgres")
     password = password or get_prefixed_env("DB_PASSWORD")
+    if checkout_timeout is None:
+        checkout_timeout = float(get_prefixed_env("DB_POOL_CHECKOUT_TIMEOUT", "30"))
+    if slow_hold_seconds is None:
+        slow_hold_seconds = float(get_prefixed_env("DB_POOL_SLOW_HOLD_SECONDS", "10"))
+    if statement_timeouts is None:
+        statement_timeouts = {}
+        for usage_class in UsageClass:
+            value = get_prefixed_env(f"DB_STATEMENT_TIMEOUT_MS_{usage_class.name}")
+            if value:
+                statement_timeouts[usage_class] = int(value)
 
     if not password:
         msg = "Database password not found in environment variables"
         raise ValueError(msg)
 
     try:
-        _connection_pool = pool.ThreadedConnectionPool(
+        inner = pool.ThreadedConnectionPool(
             minconn,
             maxconn,
             host=host,
@@ -282,6 +344,14 @@ def initialize_pool(
             keepalives_interval=30,
             keepalives_count=5,
         )
+        _connection_pool = InstrumentedConnectionPool(
+            inner,
+            minconn=minconn,
+            maxconn=maxconn,
+            checkout_timeout=checkout_timeout,
+            slow_hold_seconds=slow_hold_seconds,
+            statement_timeouts=statement_timeouts,
+        )
         logger.info(f"Database connection pool initialized ({minconn}-{maxconn} connections)")
         logger.info(f"Connected to: {user}@{host}:{port}/{database}")
         return _connection_pool
@@ -291,20 +361,27 @@ def initialize_pool(
         raise
 
 
-def get_connection():
+def get_connection(usage_class: UsageClass | None = None, caller: str | None = None):
     """
     Get a connection from the pool.
 
-    IMPORTANT: Must call putconn() when done, or use get_cursor() context manager.
+    IMPORTANT: Must call release_connection() when done, or use get_cursor().
+
+    Args:
+        usage_class: Statement-timeout class (default: set_default_usage_class())
+        caller: Name for hold-time tracking (default: calling module.function)
 
     Returns:
         Database connection from pool
 
+    Raises:
+        PoolCheckoutTimeout: If no connection is freed within the checkout timeout
+
     Example:
         >>> conn = get_connection()
         >>> cursor = conn.cursor()
         >>> cursor.execute("SELECT 1")
-        >>> _connection_pool.putconn(conn)  # Return to pool!
+        >>> release_connection(conn)  # Return to pool!
     """
     global _connection_pool
 
@@ -312,7 +389,10 @@ def get_connection():
         initialize_pool()
 
     assert _connection_pool is not None, "Connection pool initialization failed"
-    return _connection_pool.getconn()
+    return _connection_pool.getconn(
+        caller=caller or _caller_name(),
+        usage_class=usage_class or _default_usage_class,
+    )
 
 
 def release_connection(conn):
@@ -333,8 +413,52 @@ def release_connection(conn):
         _connection_pool.putconn(conn)
 
 
+def get_pool_stats() -> dict[str, Any]:
+    """
+    Get connection pool statistics.
+
+    Returns:
+        pool_* counters (sizes, in-use, waiting, checkout waits, timeouts,
+        slow holds), current holders and per-caller hold times, or
+        {"pool_initialized": False} before the pool exists.
+
+    Example:
+        >>> stats = get_pool_stats()
+        >>> stats["pool_in_use"], stats["pool_max_size"]
+        (3, 25)
+    """
+    db_pool = _connection_pool
+    if db_pool is None:
+        return {"pool_initialized": False}
+    return {"pool_initialized": True, **db_pool.get_stats()}
+
+
+def set_default_usage_class(usage_class: UsageClass) -> None:
+    """
+    Set the usage class for checkouts that do not pass one.
+
+    Call once at process start: the scheduler uses POLLER, seeding and
+    backfill commands BACKFILL; everything else stays CLI.
+
+    Args:
+        usage_class: Class whose statement timeout new checkouts get
+    """
+    global _default_usage_class
+    _default_usage_class = usage_class
+
+
+def _caller_name() -> str:
+    """Name the first frame outside this module and contextlib."""
+    frame: FrameType | None = sys._getframe(1)
+    while frame is not None and frame.f_globals.get("__name__") in _INTERNAL_MODULES:
+        frame = frame.f_back
+    if frame is None:
+        return "unknown"
+    return f"{frame.f_globals.get('__name__', '?')}.{frame.f_code.co_qualname}"
+
+
 @contextmanager
-def get_cursor(commit: bool = False):
+def get_cursor(commit: bool = False, usage_class: UsageClass | None = None):
     """
     Context manager for database cursor with automatic cleanup.
 
@@ -343,6 +467,7 @@ def get_cursor(commit: bool = False):
 
     Args:
         commit: Whether to commit transaction on success (default: False)
+        usage_class: Statement-timeout class (default: set_default_usage_class())
 
     Yields:
         Database cursor (RealDictCursor - returns rows as dictionaries)
@@ -388,7 +513,7 @@ def get_cursor(commit: bool = False):
         (pool overhead ~1ms per call). For bulk operations with 1000+ queries,
         consider using get_connection() directly and reusing the same connection.
     """
-    conn = get_connection()
+    conn = get_connection(usage_class=usage_class)
     cursor = conn.cursor(cursor_factory=extras.RealDictCursor)
 
     try:
@@ -403,7 +528,102 @@ def get_cursor(commit: bool = False):
         release_connection(conn)
 
 
-def execute_query(query: str, params: tuple | None = None, commit: bool = True) -> int:
+def _register_prepared(name: str, query: str) -> tuple[str, int]:
+    """Register name for query; return the $n-placeholder SQL and parameter count."""
+    registered = _prepared_queries.get(name)
+    if registered is None:
+        if not _PREPARED_NAME.match(name):
+            raise ValueError(f"Invalid prepared statement name: {name!r}")
+        if "%(" in query:
+            raise ValueError(f"Prepared statement {name} must use positional %s placeholders")
+        count = 0
+
+        def _number(match: re.Match[str]) -> str:
+            nonlocal count
+            if match.group() == "%%":
+                return "%"
+            count += 1
+            return f"${count}"
+
+        registered = (query, _PLACEHOLDER.sub(_number, query), count)
+        registered = _prepared_queries.setdefault(name, registered)
+    if registered[0] != query:
+        raise ValueError(f"Prepared statement {name} is already registered with different SQL")
+    return registered[1], registered[2]
+
+
+def execute_prepared(cur: Any, name: str, query: str, params: tuple | None = None) -> None:
+    """
+    Execute query as the server-side prepared statement name.
+
+    The first execution on a pooled connection sends PREPARE name AS <query>;
+    every later one, including after the connection has been returned and
+    checked out again, only sends EXECUTE name (params). Results are read
+    from cur as usual.
+
+    Args:
+        cur: Cursor from get_cursor()
+        name: Statement name, unique per query text (lowercase identifier)
+        query: SQL with positional %s placeholders
+        params: Parameters to substitute
+
+    Raises:
+        ValueError: If name is invalid, reused for different SQL, or params
+            do not match the placeholder count
+
+    Example:
+        >>> with get_cursor() as cur:
+        ...     execute_prepared(
+        ...         cur, "market_by_ticker",
+        ...         "SELECT * FROM markets WHERE ticker = %s", ("NFL-KC-YES",),
+        ...     )
+        ...     market = cur.fetchone()
+
+    Educational Note:
+        A plain execute makes PostgreSQL parse, analyze and plan the
+        statement on every call. For short primary-key lookups and
+        single-row inserts that overhead is a large share of the round
+        trip. Prepared statements are per session, so names are tracked per
+        connection; a cursor not backed by the pool executes plainly.
+    """
+    sql, param_count = _register_prepared(name, query)
+    values = tuple(params or ())
+    if len(values) != param_count:
+        raise ValueError(
+            f"Prepared statement {name} expects {param_count} parameters, got {len(values)}"
+        )
+
+    db_pool = _connection_pool
+    session: ConnectionSession | None = None
+    if db_pool is not None:
+        session = db_pool.session(getattr(cur, "connection", None))
+    if session is None:
+        cur.execute(query, params)
+        return
+
+    if name in session.invalidated:
+        cur.execute(f"DEALLOCATE {name}")
+        session.prepared.discard(name)
+        session.invalidated.discard(name)
+    if name not in session.prepared:
+        cur.execute(f"PREPARE {name} AS {sql}")
+        session.prepared.add(name)
+
+    try:
+        if values:
+            cur.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(values))})", values)
+        else:
+            cur.execute(f"EXECUTE {name}")
+    except errors.FeatureNotSupported:
+        # "cached plan must not change result type": the table changed
+        # under the statement. Re-prepare on the next call.
+        session.invalidated.add(name)
+        raise
+
+
+def execute_query(
+    query: str, params: tuple | None = None, commit: bool = True, *, prepared: str | None = None
+) -> int:
     """
     Execute a query that doesn't return results (INSERT, UPDATE, DELETE).
 
@@ -411,6 +631,7 @@ def execute_query(query: str, params: tuple | None = None, commit: bool = True)
         query: SQL query with %s placeholders
         params: Parameters to substitute (prevents SQL injection)
         commit: Whether to commit transaction (default: True)
+        prepared: Run as this prepared statement (see execute_prepared())
 
     Returns:
         Number of rows affected
@@ -424,17 +645,20 @@ def execute_query(query: str, params: tuple | None = None, commit: bool = True)
         1
     """
     with get_cursor(commit=commit) as cur:
-        cur.execute(query, params)
+        _execute(cur, query, params, prepared)
         return cast("int", cur.rowcount)
 
 
-def fetch_one(query: str, params: tuple | None = None) -> dict | None:
+def fetch_one(
+    query: str, params: tuple | None = None, *, prepared: str | None = None
+) -> dict | None:
     """
     Fetch single row from database.
 
     Args:
         query: SQL query with %s placeholders
         params: Parameters to substitute
+        prepared: Run as this prepared statement (see execute_prepared())
 
     Returns:
         Dictionary of column:value pairs, or None if no rows
@@ -447,17 +671,20 @@ def fetch_one(query: str, params: tuple | None = None) -> dict | None:
         >>> print(market['yes_ask_price'])  # Decimal('0.5200')
     """
     with get_cursor() as cur:
-        cur.execute(query, params)
+        _execute(cur, query, params, prepared)
         return cast("dict | None", cur.fetchone())
 
 
-def fetch_all(query: str, params: tuple | None = None) -> list[dict]:
+def fetch_all(
+    query: str, params: tuple | None = None, *, prepared: str | None = None
+) -> list[dict]:
     """
     Fetch all rows from database.
 
     Args:
         query: SQL query with %s placeholders
         params: Parameters to substitute
+        prepared: Run as this prepared statement (see execute_prepared())
 
     Returns:
         List of dictionaries (column:value pairs)
@@ -471,10 +698,17 @@ def fetch_all(query: str, params: tuple | None = None) -> list[dict]:
         ...     print(market['ticker'], market['yes_ask_price'])
     """
     with get_cursor() as cur:
-        cur.execute(query, params)
+        _execute(cur, query, params, prepared)
         return cast("list[dict]", cur.fetchall())
 
 
+def _execute(cur: Any, query: str, params: tuple | None, prepared: str | None) -> None:
+    if prepared is None:
+        cur.execute(query, params)
+    else:
+        execute_prepared(cur, prepared, query, params)
+
+
 def close_pool():
     """
     Close all connections in the pool.
@@ -0,0 +1,398 @@
+"""
+Bounded, instrumented wrapper around psycopg2's ThreadedConnectionPool.
+
+ThreadedConnectionPool raises PoolError("connection pool exhausted") the
+moment every connection is checked out, and says nothing about who holds
+them or for how long. In supervised mode the ESPN poller, Kalshi REST
+poller, WebSocket write thread and alignment writers all share one pool, so
+a burst from one service turned into exceptions in another.
+
+InstrumentedConnectionPool adds:
+    - Bounded blocking checkout: callers queue on a semaphore sized to
+      maxconn and get PoolCheckoutTimeout (a PoolError) after
+      checkout_timeout seconds instead of failing immediately
+    - Hold-time tracking per caller (module.function), with a warning when a
+      connection is held longer than slow_hold_seconds
+    - Optional server-side statement_timeout per UsageClass, applied with SET
+      only when a connection changes class
+    - Per-connection ConnectionSession (statement_timeout, PREPAREd statement
+      names) that survives checkout/return and is dropped when psycopg2
+      closes the connection; connection.execute_prepared() reads it through
+      session()
+    - Adaptive warm size: psycopg2 closes every returned connection beyond
+      minconn, so sustained concurrency above minconn reconnects (~50ms) on
+      almost every checkout. The wrapper raises the inner pool's minconn to
+      the peak concurrency of the last two resize windows (capped at maxconn)
+      and lets it fall back when demand drops
+    - get_stats() with pool_* counters for get_pool_stats() and the
+      supervisor, plus precog_db_pool_* Prometheus metrics
+
+Reference: REQ-DB-002 (Connection Pooling), ADR-008
+"""
+
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+
+from psycopg2 import pool
+
+from precog.utils.logger import get_logger
+from precog.utils.metrics import get_metrics_registry
+
+logger = get_logger(__name__)
+
+_metrics = get_metrics_registry()
+_CHECKOUT_SECONDS = _metrics.histogram(
+    "precog_db_pool_checkout_seconds", "Time to check a connection out of the pool"
+)
+_HOLD_SECONDS = _metrics.histogram(
+    "precog_db_pool_hold_seconds", "Time a connection was held before release"
+)
+_IN_USE = _metrics.gauge("precog_db_pool_in_use", "Connections currently checked out")
+_EXHAUSTED = _metrics.counter(
+    "precog_db_pool_exhausted_total", "Checkouts that failed because the pool was exhausted"
+)
+
+
+class UsageClass(str, Enum):
+    """
+    Workload class of a connection checkout, used to pick a statement timeout.
+
+    POLLER: short, frequent queries from long-running services
+    CLI: interactive one-shot commands
+    BACKFILL: seeding and historical backfills (long bulk statements)
+    """
+
+    POLLER = "poller"
+    CLI = "cli"
+    BACKFILL = "backfill"
+
+
+class PoolCheckoutTimeout(pool.PoolError):
+    """No connection became free within the checkout timeout."""
+
+
+@dataclass
+class ConnectionSession:
+    """
+    Server-side state of one pooled connection, kept across checkouts.
+
+    statement_timeout: Value applied by the pool (None = server default)
+    prepared: Names of statements PREPAREd on this connection
+    invalidated: Prepared names the server refused to run with their cached
+        plan (schema changed); they are DEALLOCATEd and prepared again on
+        next use
+    """
+
+    statement_timeout: int | None = None
+    prepared: set[str] = field(default_factory=set)
+    invalidated: set[str] = field(default_factory=set)
+
+
+@dataclass
+class _Checkout:
+    caller: str
+    started: float  # time.monotonic()
+
+
+class InstrumentedConnectionPool:
+    """
+    Thread-safe pool wrapper with bounded waits and hold-time tracking.
+
+    Drop-in for the getconn()/putconn()/closeall() subset of
+    ThreadedConnectionPool that connection.py uses.
+
+    Usage:
+        >>> inner = pool.ThreadedConnectionPool(2, 25, host=..., ...)
+        >>> db_pool = InstrumentedConnectionPool(inner, minconn=2, maxconn=25)
+        >>> conn = db_pool.getconn(caller="crud_markets.get_current_market")
+        >>> db_pool.putconn(conn)
+        >>> db_pool.get_stats()["pool_in_use"]
+        0
+    """
+
+    def __init__(
+        self,
+        inner: Any,
+        minconn: int,
+        maxconn: int,
+        checkout_timeout: float = 30.0,
+        slow_hold_seconds: float = 10.0,
+        statement_timeouts: Mapping[UsageClass, int] | None = None,
+        resize_window: float = 300.0,
+    ) -> None:
+        """
+        Wrap an initialized ThreadedConnectionPool.
+
+        Args:
+            inner: The psycopg2 pool (must have been created with maxconn).
+            minconn: Baseline warm connections (never shrinks below this).
+            maxconn: Maximum concurrent checkouts.
+            checkout_timeout: Seconds a caller waits for a free connection.
+            slow_hold_seconds: Hold time that logs a slow-holder warning.
+            statement_timeouts: Milliseconds per usage class; classes not
+                listed run with the server default.
+            resize_window: Seconds of peak history per adaptive resize step.
+
+        Raises:
+            ValueError: If sizes or timeouts are not positive.
+        """
+        if minconn < 0 or maxconn < 1 or minconn > maxconn:
+            raise ValueError(f"Invalid pool size: minconn={minconn}, maxconn={maxconn}")
+        if checkout_timeout <= 0:
+            raise ValueError("checkout_timeout must be > 0")
+        if slow_hold_seconds <= 0:
+            raise ValueError("slow_hold_seconds must be > 0")
+        if resize_window <= 0:
+            raise ValueError("resize_window must be > 0")
+
+        self._inner = inner
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.checkout_timeout = checkout_timeout
+        self.slow_hold_seconds = slow_hold_seconds
+        self.statement_timeouts: dict[UsageClass, int] = dict(statement_timeouts or {})
+        self.resize_window = resize_window
+
+        self._slots = threading.BoundedSemaphore(maxconn)
+        self._lock = threading.Lock()
+        self._checkouts: dict[int, _Checkout] = {}
+        # id(conn) -> server-side session state, for every open connection
+        self._sessions: dict[int, ConnectionSession] = {}
+        self._callers: dict[str, dict[str, float]] = {}
+        self._waiting = 0
+        self._window_start = time.monotonic()
+        self._window_peak = 0
+        self._previous_peak = 0
+
+        self._stats: dict[str, int | float] = {
+            "pool_checkouts": 0,
+            "pool_waited_checkouts": 0,
+            "pool_timeouts": 0,
+            "pool_slow_holds": 0,
+            "pool_checkout_wait_total_ms": 0.0,
+            "pool_checkout_wait_max_ms": 0.0,
+        }
+
+    @property
+    def closed(self) -> bool:
+        """True once closeall() has been called."""
+        return bool(self._inner.closed)
+
+    def getconn(self, caller: str = "unknown", usage_class: UsageClass | None = None) -> Any:
+        """
+        Check out a connection, waiting up to checkout_timeout for one.
+
+        Args:
+            caller: Name recorded for hold-time tracking.
+            usage_class: Selects the statement timeout (None = server default).
+
+        Returns:
+            A psycopg2 connection.
+
+        Raises:
+            PoolCheckoutTimeout: If no connection is freed in time.
+            psycopg2.Error: If a new connection cannot be opened.
+        """
+        start = time.monotonic()
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._waiting += 1
+            try:
+                acquired = self._slots.acquire(timeout=self.checkout_timeout)
+            finally:
+                with self._lock:
+                    self._waiting -= 1
+            if not acquired:
+                _EXHAUSTED.inc()
+                with self._lock:
+                    self._stats["pool_timeouts"] += 1
+                    holder = self._longest_holder_locked()
+                msg = (
+                    f"No database connection free within {self.checkout_timeout:.1f}s "
+                    f"({self.maxconn} in use; longest held by {holder})"
+                )
+                raise PoolCheckoutTimeout(msg)
+
+        try:
+            conn = self._inner.getconn()
+        except BaseException:
+            self._slots.release()
+            raise
+
+        try:
+            self._apply_statement_timeout(conn, usage_class)
+        except BaseException:
+            self._discard(conn)
+            self._slots.release()
+            raise
+
+        now = time.monotonic()
+        wait = now - start
+        _CHECKOUT_SECONDS.observe(wait)
+        _IN_USE.inc()
+        with self._lock:
+            self._checkouts[id(conn)] = _Checkout(caller=caller, started=now)
+            self._stats["pool_checkouts"] += 1
+            wait_ms = wait * 1000
+            self._stats["pool_checkout_wait_total_ms"] += wait_ms
+            if wait_ms > self._stats["pool_checkout_wait_max_ms"]:
+                self._stats["pool_checkout_wait_max_ms"] = round(wait_ms, 3)
+            if wait_ms >= 1.0:
+                self._stats["pool_waited_checkouts"] += 1
+            self._resize_locked(now)
+        return conn
+
+    def putconn(self, conn: Any, close: bool = False) -> None:
+        """
+        Return a connection and record how long it was held.
+
+        Args:
+            conn: Connection obtained from getconn().
+            close: Close the connection instead of keeping it warm.
+        """
+        with self._lock:
+            checkout = self._checkouts.pop(id(conn), None)
+        try:
+            self._inner.putconn(conn, close=close)
+        finally:
+            if checkout is not None:
+                self._slots.release()
+                _IN_USE.dec()
+
+        if getattr(conn, "closed", 0):
+            with self._lock:
+                self._sessions.pop(id(conn), None)
+        if checkout is None:
+            return
+
+        now = time.monotonic()
+        held = now - checkout.started
+        _HOLD_SECONDS.observe(held)
+        with self._lock:
+            caller = self._callers.setdefault(
+                checkout.caller, {"checkouts": 0, "total_hold_ms": 0.0, "max_hold_ms": 0.0}
+            )
+            caller["checkouts"] += 1
+            caller["total_hold_ms"] += held * 1000
+            caller["max_hold_ms"] = max(caller["max_hold_ms"], round(held * 1000, 3))
+            slow = held >= self.slow_hold_seconds
+            if slow:
+                self._stats["pool_slow_holds"] += 1
+            self._resize_locked(now)
+        if slow:
+            logger.warning(
+                "Slow database connection holder",
+                caller=checkout.caller,
+                held_seconds=round(held, 3),
+                threshold_seconds=self.slow_hold_seconds,
+            )
+
+    def closeall(self) -> None:
+        """Close every connection, including checked-out ones."""
+        self._inner.closeall()
+        with self._lock:
+            released = len(self._checkouts)
+            self._checkouts.clear()
+            self._sessions.clear()
+        _IN_USE.dec(released)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Return pool size, wait, timeout and hold statistics.
+
+        Returns:
+            pool_* counters plus pool_holders (caller -> seconds held so far,
+            longest first) and pool_callers (caller -> checkouts,
+            total/max hold ms).
+        """
+        now = time.monotonic()
+        with self._lock:
+            stats: dict[str, Any] = dict(self._stats)
+            stats["pool_checkout_wait_total_ms"] = round(stats["pool_checkout_wait_total_ms"], 3)
+            stats.update(
+                {
+                    "pool_min_size": self.minconn,
+                    "pool_max_size": self.maxconn,
+                    "pool_warm_target": getattr(self._inner, "minconn", self.minconn),
+                    "pool_in_use": len(self._checkouts),
+                    "pool_waiting": self._waiting,
+                    "pool_prepared_statements": sum(
+                        len(session.prepared) for session in self._sessions.values()
+                    ),
+                    "pool_holders": {
+                        c.caller: round(now - c.started, 3)
+                        for c in sorted(self._checkouts.values(), key=lambda c: c.started)
+                    },
+                    "pool_callers": {
+                        name: {**values, "total_hold_ms": round(values["total_hold_ms"], 3)}
+                        for name, values in self._callers.items()
+                    },
+                }
+            )
+        return stats
+
+    def session(self, conn: Any) -> ConnectionSession | None:
+        """
+        Return the session state of a connection checked out from this pool.
+
+        Only the thread holding the checkout may modify the returned object.
+
+        Args:
+            conn: Connection obtained from getconn().
+
+        Returns:
+            The connection's ConnectionSession, or None if conn is not
+            currently checked out from this pool.
+        """
+        key = id(conn)
+        with self._lock:
+            if key not in self._checkouts:
+                return None
+            return self._sessions.get(key)
+
+    def _apply_statement_timeout(self, conn: Any, usage_class: UsageClass | None) -> None:
+        """SET/RESET statement_timeout when the connection changes class."""
+        timeout_ms = self.statement_timeouts.get(usage_class) if usage_class else None
+        with self._lock:
+            session = self._sessions.setdefault(id(conn), ConnectionSession())
+            if session.statement_timeout == timeout_ms:
+                return
+        with conn.cursor() as cur:
+            if timeout_ms is None:
+                cur.execute("RESET statement_timeout")
+            else:
+                cur.execute("SET statement_timeout = %s", (timeout_ms,))
+        conn.commit()
+        session.statement_timeout = timeout_ms
+
+    def _discard(self, conn: Any) -> None:
+        """Close and drop a connection that failed setup after checkout."""
+        try:
+            self._inner.putconn(conn, close=True)
+        except Exception as e:
+            logger.warning("Failed to discard connection", error=str(e))
+        with self._lock:
+            self._sessions.pop(id(conn), None)
+
+    def _longest_holder_locked(self) -> str:
+        if not self._checkouts:
+            return "nobody"
+        oldest = min(self._checkouts.values(), key=lambda c: c.started)
+        return f"{oldest.caller} for {time.monotonic() - oldest.started:.1f}s"
+
+    def _resize_locked(self, now: float) -> None:
+        """Keep the inner pool's warm size at recent peak concurrency."""
+        in_use = len(self._checkouts)
+        if now - self._window_start >= self.resize_window:
+            self._previous_peak = self._window_peak
+            self._window_peak = in_use
+            self._window_start = now
+        elif in_use > self._window_peak:
+            self._window_peak = in_use
+        target = max(self.minconn, min(self.maxconn, max(self._window_peak, self._previous_peak)))
+        if getattr(self._inner, "minconn", target) != target:
+            self._inner.minconn = target
@@ -500,7 +500,7 @@ def get_edge_lifecycle(
 #   update_order_status, update_order_fill, cancel_order, get_open_orders
 #   create_ledger_entry, get_ledger_entries, get_running_balance,
 #   insert_temporal_alignment, insert_temporal_alignment_batch,
-#   get_alignments_by_market, upsert_market_trade, upsert_market_trades_batch,
+#   get_alignments_by_event, upsert_market_trade, upsert_market_trades_batch,
 #   get_market_trades, get_latest_trade_time
 # They now live in crud_orders.py and crud_ledger.py respectively.
 # All are re-exported from this module for backward compatibility.
@@ -31,9 +31,11 @@ THE RESTRICTED API SURFACE — APPEND-ONLY VIA APPLICATION DISCIPLINE:
           throughput is anti-pattern; #1085-finding flavor).
         - General SELECT helpers (``get_observation_by_id``,
           ``query_observations_by_event``, etc.) are added Cohort 5+ as
-          consumers materialize.  Slot 0078 ships only the write surface
-          because there is no Cohort 4 reader yet (reconciler is a
-          separate slot/PR after writer soak per V2.43 micro-delta MD1).
+          consumers materialize.  Slot 0078 shipped only the write
+          surface because there was no Cohort 4 reader yet (reconciler is
+          a separate slot/PR after writer soak per V2.43 micro-delta MD1).
+          The first consumer, the temporal alignment writer, adds the two
+          read helpers at the bottom of this module.
 
     The trigger-enforced version (BEFORE INSERT/UPDATE/DELETE → ``RAISE
     EXCEPTION 'canonical_observations is append-only'``) is queued for
@@ -118,10 +120,11 @@ import json
 import logging
 from typing import TYPE_CHECKING, Any, cast
 
-from .connection import get_cursor
+from .connection import execute_prepared, fetch_all, fetch_one, get_cursor
 from .constants import OBSERVATION_KIND_VALUES
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -367,7 +370,9 @@ def append_observation_row(
     """
 
     with get_cursor(commit=True) as cur:
-        cur.execute(
+        execute_prepared(
+            cur,
+            "append_observation_row",
             query,
             (
                 observation_kind,
@@ -382,3 +387,78 @@ def append_observation_row(
         row = cur.fetchone()
 
     return cast("int", row["id"]), cast("datetime", row["ingested_at"])
+
+
+# =============================================================================
+# CANONICAL OBSERVATIONS — READ HELPERS
+# =============================================================================
+
+
+def get_observation_source_id(source_key: str) -> int | None:
+    """Return ``observation_source.id`` for a source key, or None if unseeded.
+
+    Args:
+        source_key: Business key of the source (e.g., ``'espn'``,
+            ``'kalshi'``; Phase 1 seeds are ``PHASE_1_SOURCE_KEYS``).
+
+    Returns:
+        The source's surrogate id, or None if no row has that key.
+
+    Example:
+        >>> espn_source_id = get_observation_source_id("espn")
+
+    Reference:
+        - Migration 0075 (``observation_source`` lookup + Phase 1 seeds)
+    """
+    row = fetch_one("SELECT id FROM observation_source WHERE source_key = %s", (source_key,))
+    return cast("int", row["id"]) if row else None
+
+
+def get_observations_by_payload(
+    source_id: int,
+    payloads: Sequence[dict[str, Any]],
+) -> list[tuple[int, datetime] | None]:
+    """Look up already-appended observations by source and payload.
+
+    The read-side counterpart of the ``(source_id, payload_hash)`` dedup
+    key: hashes each payload with the same rule as
+    ``append_observation_row()`` and returns the earliest matching row.
+    Callers that append one observation per projection row (e.g., one per
+    ``market_snapshots.id``) use this to reuse the existing observation
+    instead of appending a second one on a retry.
+
+    Args:
+        source_id: BIGINT FK into ``observation_source.id``.
+        payloads: Payload dicts, hashed exactly as on append.
+
+    Returns:
+        One entry per payload, in order: the ``(id, ingested_at)``
+        composite PK of the earliest matching observation, or None if
+        none has been appended.
+
+    Raises:
+        TypeError: a payload contains non-JSON-serializable values.
+
+    Example:
+        >>> found = get_observations_by_payload(2, [{"market_snapshot_id": 1001}])
+        >>> found[0]  # (obs_id, ingested_at) or None
+
+    Educational Note:
+        The lookup has no ``ingested_at`` bound, so it probes the
+        ``(source_id, payload_hash, ingested_at)`` UNIQUE index of every
+        partition.  One query covers the whole batch.
+    """
+    if not payloads:
+        return []
+    hashes = [_compute_payload_hash(payload) for payload in payloads]
+    rows = fetch_all(
+        """
+        SELECT DISTINCT ON (payload_hash) payload_hash, id, ingested_at
+        FROM canonical_observations
+        WHERE source_id = %s AND payload_hash = ANY(%s::bytea[])
+        ORDER BY payload_hash, ingested_at, id
+        """,
+        (source_id, hashes),
+    )
+    found = {bytes(row["payload_hash"]): (row["id"], row["ingested_at"]) for row in rows}
+    return [found.get(h) for h in hashes]
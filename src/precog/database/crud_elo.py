@@ -453,6 +453,229 @@ def get_elo_calculation_logs(
     return fetch_all(query, tuple(params))
 
 
+def get_team_elo_ratings(leagues: list[str]) -> dict[int, Decimal]:
+    """
+    Get current Elo ratings for every rated team in the given leagues.
+
+    One query for all leagues; used to warm in-memory rating state (e.g.
+    LiveEloUpdater at poller startup) instead of a lookup per team.
+
+    Args:
+        leagues: League codes to load (e.g., ['nfl', 'nba'])
+
+    Returns:
+        Dict mapping team_id to current_elo_rating. Teams with a NULL
+        rating are omitted.
+
+    Example:
+        >>> ratings = get_team_elo_ratings(["nfl", "nba"])
+        >>> ratings.get(42)
+        Decimal('1567.25')
+    """
+    if not leagues:
+        return {}
+    rows = fetch_all(
+        """
+        SELECT team_id, current_elo_rating
+        FROM teams
+        WHERE league = ANY(%s) AND current_elo_rating IS NOT NULL
+        """,
+        (list(leagues),),
+    )
+    return {int(row["team_id"]): Decimal(str(row["current_elo_rating"])) for row in rows}
+
+
+def get_team_elo_season(team_id: int) -> int | None:
+    """
+    Get the season of a team's most recent game in elo_calculation_log.
+
+    Args:
+        team_id: Primary key of the team
+
+    Returns:
+        games.season of the team's latest logged Elo game, or None if the
+        team has no logged games
+
+    Example:
+        >>> get_team_elo_season(team_id=42)
+        2024
+    """
+    result = fetch_one(
+        """
+        SELECT MAX(g.season) AS season
+        FROM elo_calculation_log l
+        JOIN games g ON g.id = l.game_id
+        WHERE %s IN (l.home_team_id, l.away_team_id)
+        """,
+        (team_id,),
+    )
+    if not result or result.get("season") is None:
+        return None
+    return int(result["season"])
+
+
+def get_team_elo_seasons(leagues: list[str]) -> dict[int, int]:
+    """
+    Get the season of each team's most recent logged Elo game.
+
+    Companion to get_team_elo_ratings(): a team whose next game falls in a
+    later season is due a season regression before that game is rated.
+
+    Args:
+        leagues: League codes to load (e.g., ['nfl', 'nba'])
+
+    Returns:
+        Dict mapping team_id to games.season. Teams with no logged games
+        are omitted.
+
+    Example:
+        >>> get_team_elo_seasons(["nfl"]).get(42)
+        2024
+    """
+    if not leagues:
+        return {}
+    rows = fetch_all(
+        """
+        SELECT t.team_id, MAX(g.season) AS season
+        FROM elo_calculation_log l
+        JOIN games g ON g.id = l.game_id
+        CROSS JOIN LATERAL (VALUES (l.home_team_id), (l.away_team_id)) AS t(team_id)
+        WHERE l.league = ANY(%s)
+        GROUP BY t.team_id
+        """,
+        (list(leagues),),
+    )
+    return {int(row["team_id"]): int(row["season"]) for row in rows}
+
+
+def apply_game_elo_update(
+    *,
+    game_id: int,
+    league: str,
+    game_date: date,
+    home_team_id: int,
+    away_team_id: int,
+    home_team_code: str,
+    away_team_code: str,
+    home_score: int,
+    away_score: int,
+    home_elo_before: Decimal,
+    away_elo_before: Decimal,
+    k_factor: int,
+    home_advantage: Decimal,
+    mov_multiplier: Decimal | None,
+    home_expected: Decimal,
+    away_expected: Decimal,
+    home_actual: Decimal,
+    away_actual: Decimal,
+    home_elo_change: Decimal,
+    away_elo_change: Decimal,
+    home_elo_after: Decimal,
+    away_elo_after: Decimal,
+    calculation_source: str = "realtime",
+    calculation_version: str = "1.0",
+) -> int | None:
+    """
+    Log one game's Elo update and move both teams' ratings, atomically.
+
+    The incremental counterpart of a full recompute: the elo_calculation_log
+    row and the two teams.current_elo_rating updates commit in a single
+    transaction. The log row is only inserted if no log row exists for
+    game_id yet, and the teams are only updated when it was inserted, so a
+    game that is re-reported as final is never applied twice. For
+    'realtime' rows the partial unique index idx_elo_log_realtime_game
+    (migration 0085) backs the NOT EXISTS check: when two processes insert
+    the same game concurrently, the second conflicts and inserts nothing.
+
+    Args:
+        game_id: FK to games.id (the idempotency key)
+        league: League code
+        game_date: Date of the game
+        home_team_id / away_team_id: FKs to teams.team_id
+        home_team_code / away_team_code: Team abbreviations
+        home_score / away_score: Final scores
+        home_elo_before ... away_elo_after: EloUpdateResult fields
+        calculation_source: Audit source label (default 'realtime')
+        calculation_version: Elo algorithm version
+
+    Returns:
+        elo_log_id of the inserted row, or None if the game was already logged
+
+    Example:
+        >>> log_id = apply_game_elo_update(game_id=101, league="nfl", ...)
+        >>> if log_id is None:
+        ...     print("Game already applied")
+    """
+    # Dual-write (#738 A1): populate league_id FK alongside the VARCHAR.
+    league_id_value = get_league_id_or_none(league)
+    insert_query = """
+        INSERT INTO elo_calculation_log (
+            league, game_date, home_team_id, away_team_id, game_id,
+            home_team_code, away_team_code,
+            home_score, away_score,
+            home_elo_before, away_elo_before,
+            k_factor, home_advantage, mov_multiplier,
+            home_expected, away_expected,
+            home_actual, away_actual,
+            home_elo_change, away_elo_change,
+            home_elo_after, away_elo_after,
+            calculation_source, calculation_version, league_id
+        )
+        SELECT
+            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
+            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
+            %s, %s, %s, %s, %s
+        WHERE NOT EXISTS (
+            SELECT 1 FROM elo_calculation_log WHERE game_id = %s
+        )
+        ON CONFLICT (game_id) WHERE calculation_source = 'realtime' DO NOTHING
+        RETURNING elo_log_id
+    """
+    params = (
+        league,
+        game_date,
+        home_team_id,
+        away_team_id,
+        game_id,
+        home_team_code,
+        away_team_code,
+        home_score,
+        away_score,
+        home_elo_before,
+        away_elo_before,
+        k_factor,
+        home_advantage,
+        mov_multiplier,
+        home_expected,
+        away_expected,
+        home_actual,
+        away_actual,
+        home_elo_change,
+        away_elo_change,
+        home_elo_after,
+        away_elo_after,
+        calculation_source,
+        calculation_version,
+        league_id_value,
+        game_id,
+    )
+    with get_cursor(commit=True) as cur:
+        cur.execute(insert_query, params)
+        row = cur.fetchone()
+        if row is None:
+            return None
+        cur.execute(
+            """
+            UPDATE teams
+            SET current_elo_rating = CASE WHEN team_id = %s THEN %s ELSE %s END,
+                updated_at = NOW()
+            WHERE team_id IN (%s, %s)
+            """,
+            (home_team_id, home_elo_after, away_elo_after, home_team_id, away_team_id),
+        )
+        return cast("int", row["elo_log_id"])
+
+
 # =============================================================================
 # ALERT CRUD OPERATIONS
 # =============================================================================
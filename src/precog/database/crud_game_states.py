@@ -11,11 +11,14 @@ Tables covered:
 import json
 import logging
 import uuid
+from collections.abc import Iterable
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 from typing import Any, cast
 
-from .connection import fetch_all, fetch_one, get_cursor
+from psycopg2.extras import execute_values
+
+from .connection import execute_prepared, fetch_all, fetch_one, get_cursor
 from .crud_lookups import (
     get_league_id_or_none,
     get_sport_id_or_none,
@@ -252,7 +255,7 @@ def get_current_game_state(espn_event_id: str) -> dict[str, Any] | None:
         WHERE gs.espn_event_id = %s
           AND gs.row_current_ind = TRUE
     """
-    return fetch_one(query, (espn_event_id,))
+    return fetch_one(query, (espn_event_id,), prepared="get_current_game_state")
 
 
 def game_state_changed(
@@ -528,7 +531,7 @@ def upsert_game_state(
             # Step 1: Lock current row (if any) and fetch its game_state_key.
             # On the first-insert path this returns zero rows; on retry the
             # sibling caller's row is now visible and gets locked.
-            cur.execute(lock_query, (espn_event_id,))
+            execute_prepared(cur, "upsert_game_state_lock", lock_query, (espn_event_id,))
             locked = cur.fetchone()
 
             # Determine the game_state_key for the new row.
@@ -556,11 +559,13 @@ def upsert_game_state(
                 is_first_insert = True
 
             # Step 2: Close current row (no-op if no current row exists).
-            cur.execute(close_query, (now, espn_event_id))
+            execute_prepared(cur, "upsert_game_state_close", close_query, (now, espn_event_id))
 
             # Step 3: Insert new row with matching row_start_ts and the
             # carried-forward (or TEMP) game_state_key.
-            cur.execute(
+            execute_prepared(
+                cur,
+                "upsert_game_state_insert",
                 insert_query,
                 (
                     espn_event_id,
@@ -619,6 +624,105 @@ def upsert_game_state(
     )
 
 
+def get_current_game_states(espn_event_ids: Iterable[str]) -> dict[str, dict[str, Any]]:
+    """
+    Get the current game state row for many events in one query.
+
+    Returns only the columns game_state_changed() compares, keyed by
+    espn_event_id. Events without a current row are absent from the result.
+
+    Args:
+        espn_event_ids: ESPN event identifiers
+
+    Returns:
+        Dictionary mapping espn_event_id to its current state columns
+
+    Example:
+        >>> current = get_current_game_states(["401547417", "401547418"])
+        >>> current["401547417"]["home_score"]
+        14
+    """
+    ids = list(dict.fromkeys(espn_event_ids))
+    if not ids:
+        return {}
+    query = """
+        SELECT espn_event_id, home_score, away_score, period, game_status, situation
+        FROM game_states
+        WHERE espn_event_id = ANY(%s)
+          AND row_current_ind = TRUE
+    """
+    return {row["espn_event_id"]: row for row in fetch_all(query, (ids,))}
+
+
+def upsert_game_states_batch(states: list[dict[str, Any]]) -> dict[str, int | None]:
+    """
+    Upsert a whole scoreboard of game states, writing only the changed games.
+
+    Reads the current row of every event in one query, runs the same change
+    detection as upsert_game_state() (game_state_changed) in Python, and
+    performs the SCD Type 2 close+insert only for games whose state moved.
+
+    Args:
+        states: One dict per game with upsert_game_state() keyword arguments
+            (espn_event_id required). skip_if_unchanged is ignored.
+
+    Returns:
+        Dictionary mapping espn_event_id to the new row id, or None when the
+        game was unchanged. A game whose write failed is logged and left out,
+        so one bad row never loses the rest of the scoreboard; callers retry
+        or count the missing games.
+
+    Raises:
+        psycopg2.Error: If the current-state read fails (nothing written).
+
+    Educational Note:
+        During a 15-game slate polled every 15 seconds, nearly every poll
+        finds most games unchanged (clock ticks are not state changes).
+        upsert_game_state() spends one SELECT per game to learn that; here
+        the whole scoreboard costs one SELECT, and the per-game write path
+        (row lock, close, insert, #623 retry) is reused unchanged for the
+        few games that did change.
+
+    Example:
+        >>> results = upsert_game_states_batch([
+        ...     {"espn_event_id": "401547417", "home_score": 7, "period": 1,
+        ...      "game_status": "in_progress", "league": "nfl"},
+        ... ])
+        >>> results["401547417"] is None  # changed, new SCD row id returned
+        False
+
+    References:
+        - Issue #234: State Change Detection
+        - REQ-DATA-001: Game State Data Collection (SCD Type 2)
+    """
+    current = get_current_game_states(state["espn_event_id"] for state in states)
+
+    results: dict[str, int | None] = {}
+    for state in states:
+        espn_event_id = state["espn_event_id"]
+        if not game_state_changed(
+            current.get(espn_event_id),
+            state.get("home_score", 0),
+            state.get("away_score", 0),
+            state.get("period", 0),
+            state.get("game_status", "pre"),
+            state.get("situation"),
+            league=state.get("league"),
+        ):
+            results[espn_event_id] = None
+            continue
+        kwargs = {key: value for key, value in state.items() if key != "skip_if_unchanged"}
+        try:
+            results[espn_event_id] = upsert_game_state(**kwargs, skip_if_unchanged=False)
+        except Exception:
+            logger.warning(
+                "Batched game state write failed for espn_event_id=%s",
+                espn_event_id,
+                exc_info=True,
+            )
+    return results
+
+
 def get_game_state_history(espn_event_id: str, limit: int = 100) -> list[dict[str, Any]]:
     """
     Get historical game state versions for an event.
@@ -1033,6 +1137,10 @@ def update_bracket_counts() -> int:
     value (or is NULL when it shouldn't be) are updated, avoiding
     unnecessary writes.
 
+    This scans the whole markets table; use
+    update_bracket_counts_for_events() for per-cycle maintenance and keep
+    this for full reconciliation.
+
     Returns:
         Number of market rows actually updated.
 
@@ -1071,6 +1179,50 @@ def update_bracket_counts() -> int:
     return updated_with_event + updated_without_event
 
 
+def update_bracket_counts_for_events(event_ids: Iterable[int]) -> int:
+    """
+    Recompute bracket_count only for markets under the given events.
+
+    Incremental counterpart to update_bracket_counts(): the recount is
+    restricted to ``event_ids`` (via idx_markets_event), so its cost is
+    proportional to the markets in those events rather than the whole
+    markets table. Callers pass the events whose market sets changed, e.g.
+    events that gained a market in the current poll cycle.
+
+    Args:
+        event_ids: events.id values whose markets should be recounted.
+            Duplicates are ignored; an empty iterable is a no-op.
+
+    Returns:
+        Number of market rows actually updated.
+
+    Example:
+        >>> updated = update_bracket_counts_for_events({42, 43})
+    """
+    ids = sorted(set(event_ids))
+    if not ids:
+        return 0
+
+    query = """
+        WITH counts AS (
+            SELECT event_id, COUNT(*) AS cnt
+            FROM markets
+            WHERE event_id = ANY(%s)
+            GROUP BY event_id
+        )
+        UPDATE markets m
+        SET bracket_count = c.cnt,
+            updated_at = NOW()
+        FROM counts c
+        WHERE m.event_id = c.event_id
+          AND (m.bracket_count IS DISTINCT FROM c.cnt)
+    """
+    with get_cursor(commit=True) as cur:
+        cur.execute(query, (ids,))
+        updated: int = cur.rowcount
+    return updated
+
+
 # =============================================================================
 # TEAM KALSHI CODE OPERATIONS (Issue #462 - Event-to-Game Matching)
 # =============================================================================
@@ -1442,6 +1594,104 @@ def find_game_by_matchup(
     return None
 
 
+def get_games_for_matching(
+    date_from: date,
+    date_to: date,
+    updated_since: datetime | None = None,
+) -> list[dict[str, Any]]:
+    """Read the natural keys of games in a date window for in-memory matching.
+
+    Returns only what GameIndex needs to answer find_game_by_matchup()
+    lookups without a query per event. With ``updated_since`` the read is
+    incremental: only games inserted or upserted at or after that instant
+    (get_or_create_game bumps updated_at on every upsert).
+
+    Args:
+        date_from: First game_date to include (inclusive).
+        date_to: Last game_date to include (inclusive).
+        updated_since: Optional watermark; None reads the whole window.
+
+    Returns:
+        List of dicts with keys: id, sport, game_date, home_team_code,
+        away_team_code, updated_at. Ordered by updated_at.
+
+    Example:
+        >>> from datetime import date
+        >>> rows = get_games_for_matching(date(2026, 1, 4), date(2026, 2, 17))
+        >>> rows[0]["sport"]
+        'football'
+
+    Related:
+        - GameIndex.refresh(): Primary consumer
+        - Migration 0035: idx_games_date
+    """
+    if updated_since is None:
+        query = """
+            SELECT id, sport, game_date, home_team_code, away_team_code, updated_at
+            FROM games
+            WHERE game_date BETWEEN %s AND %s
+            ORDER BY updated_at
+        """
+        return fetch_all(query, (date_from, date_to))
+
+    query = """
+        SELECT id, sport, game_date, home_team_code, away_team_code, updated_at
+        FROM games
+        WHERE game_date BETWEEN %s AND %s
+          AND updated_at >= %s
+        ORDER BY updated_at
+    """
+    return fetch_all(query, (date_from, date_to, updated_since))
+
+
+def update_event_game_ids_batch(links: Iterable[tuple[int, int]]) -> list[int]:
+    """Link many events to games in a single UPDATE. Returns the updated event ids.
+
+    Bulk counterpart to update_event_game_id(): the (event_id, game_id) pairs
+    are sent as one ``UPDATE events ... FROM (VALUES ...)`` statement, so a
+    backfill of N matches costs one round trip instead of N.
+
+    Args:
+        links: (events.id, games.id) pairs. Later pairs for the same event
+            replace earlier ones; an empty iterable is a no-op.
+
+    Returns:
+        events.id values that were actually changed (events already linked
+        to the same game, or missing, are left out).
+
+    Example:
+        >>> updated = update_event_game_ids_batch([(42, 15), (43, 16)])
+        >>> len(updated)
+        2
+
+    Related:
+        - EventGameMatcher.backfill_unlinked_events(): Primary consumer
+        - Issue #462: Event-to-game matching
+    """
+    pairs = list(dict(links).items())
+    if not pairs:
+        return []
+
+    query = """
+        UPDATE events e
+        SET game_id = v.game_id, updated_at = NOW()
+        FROM (VALUES %s) AS v(event_id, game_id)
+        WHERE e.id = v.event_id
+          AND (e.game_id IS NULL OR e.game_id != v.game_id)
+        RETURNING e.id
+    """
+    with get_cursor(commit=True) as cur:
+        rows = execute_values(
+            cur,
+            query,
+            pairs,
+            template="(%s::integer, %s::integer)",
+            page_size=len(pairs),
+            fetch=True,
+        )
+    return [row["id"] for row in rows]
+
+
 # =============================================================================
 # Game Odds (ESPN DraftKings Odds) — SCD Type 2
 # =============================================================================
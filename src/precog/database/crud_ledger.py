@@ -6,7 +6,7 @@ These are append-only tables with zero cross-domain dependencies.
 
 Tables covered:
     - account_ledger (Migration 0026): Transaction-level balance tracking
-    - temporal_alignment (Migration 0027): Market snapshot <-> game state linking
+    - temporal_alignment (Migration 0084): Canonical observation pair linking
     - market_trades (Migration 0028): Public Kalshi trade tape
 """
 
@@ -276,14 +276,18 @@ def get_running_balance(platform_id: str) -> Decimal | None:
 # TEMPORAL ALIGNMENT CRUD
 # =============================================================================
 #
-# Migration 0027: temporal_alignment
-# Links market snapshots to game state snapshots by timestamp proximity.
-# Enables cross-source queries like "what was the market price when the score
+# Migration 0084: temporal_alignment (pure linkage shape, ADR-118 V2.45 Item 6)
+# Pairs two canonical_observations rows by timestamp proximity. Enables
+# cross-source queries like "what was the market price when the score
 # changed?" Critical for Phase 4 backtesting accuracy.
 #
 # Design:
 #   - Append-only: rows are never updated once created.
-#   - Denormalizes key snapshot/game-state fields for query convenience.
+#   - No denormalized payload: prices and scores are read back through the
+#     observations' projection rows (market_snapshots / game_states).
+#   - Both observation references are composite (id, ingested_at) because
+#     canonical_observations is partitioned on ingested_at.
+#   - Dedup via UNIQUE uq_alignment_pair + ON CONFLICT DO NOTHING.
 #   - alignment_quality categorizes the time delta between the two sources.
 # =============================================================================
 
@@ -293,135 +297,119 @@ VALID_ALIGNMENT_QUALITIES = frozenset({"exact", "good", "fair", "poor", "stale"}
 _ALIGNMENT_QUALITY_ORDER = ["stale", "poor", "fair", "good", "exact"]
 
 
+def _validate_alignment_pair(
+    observation_a: tuple[int, datetime],
+    observation_b: tuple[int, datetime],
+    alignment_quality: str,
+    label: str = "",
+) -> None:
+    """Raise ValueError for a self-pair or an unknown quality tier."""
+    if observation_a == observation_b:
+        raise ValueError(
+            f"observation_a and observation_b must be different observations, "
+            f"got {observation_a!r}{label}"
+        )
+    if alignment_quality not in VALID_ALIGNMENT_QUALITIES:
+        raise ValueError(
+            f"alignment_quality must be one of {VALID_ALIGNMENT_QUALITIES}, "
+            f"got '{alignment_quality}'{label}"
+        )
+
+
 def insert_temporal_alignment(
-    market_id: int,
-    market_snapshot_id: int,
-    game_state_id: int,
-    snapshot_time: datetime,
-    game_state_time: datetime,
+    observation_a_id: int,
+    observation_a_ingested_at: datetime,
+    observation_b_id: int,
+    observation_b_ingested_at: datetime,
     time_delta_seconds: Decimal,
     alignment_quality: str = "good",
-    yes_ask_price: Decimal | None = None,
-    no_ask_price: Decimal | None = None,
-    spread: Decimal | None = None,
-    volume: int | None = None,
-    game_status: str | None = None,
-    home_score: int | None = None,
-    away_score: int | None = None,
-    period: str | None = None,
-    clock: str | None = None,
-    game_id: int | None = None,
-) -> int:
+    canonical_event_id: int | None = None,
+    aligned_at: datetime | None = None,
+) -> int | None:
     """
-    Insert a temporal alignment linking a market snapshot to a game state.
+    Insert a temporal alignment pairing two canonical observations.
 
     The temporal_alignment table bridges Kalshi price polls (every 15s) and
     ESPN game-state polls (every 30s) by matching them on timestamp proximity.
-    Each row records a SPECIFIC market_snapshot <-> game_state pairing with
-    the time delta and denormalized values for query convenience.
+    Each row records one observation pair with the time delta and quality
+    tier; the typed values live on the observations' projection rows.
 
     Args:
-        market_id: FK to markets(id)
-        market_snapshot_id: FK to market_snapshots(id) -- the specific snapshot row
-        game_state_id: FK to game_states(id) -- the specific game state row
-        snapshot_time: Timestamp of the market snapshot
-        game_state_time: Timestamp of the game state
-        time_delta_seconds: Absolute time difference as DECIMAL(10,2)
+        observation_a_id: canonical_observations.id of the first observation
+            (the market snapshot, by writer convention)
+        observation_a_ingested_at: canonical_observations.ingested_at of the
+            first observation (partition key half of the composite FK)
+        observation_b_id: canonical_observations.id of the second observation
+            (the game state, by writer convention)
+        observation_b_ingested_at: canonical_observations.ingested_at of the
+            second observation
+        time_delta_seconds: Absolute time difference as DECIMAL(10,3)
         alignment_quality: One of 'exact', 'good', 'fair', 'poor', 'stale'
             (default 'good')
-        yes_ask_price: Denormalized YES ask price as DECIMAL(10,4)
-        no_ask_price: Denormalized NO ask price as DECIMAL(10,4)
-        spread: Denormalized bid-ask spread as DECIMAL(10,4)
-        volume: Denormalized trade volume
-        game_status: Denormalized game status string
-        home_score: Denormalized home team score
-        away_score: Denormalized away team score
-        period: Denormalized game period (e.g., '1st', '2nd', 'OT')
-        clock: Denormalized game clock (e.g., '12:00', '05:32')
-        game_id: Optional FK to games(id). Denormalized from events.game_id
-            for direct game-level queries without joining through events.
+        canonical_event_id: Optional FK to canonical_events(id). Denormalized
+            hot-path tag for per-event queries.
+        aligned_at: When the pair was made (default: NOW())
 
     Returns:
-        Integer surrogate PK (temporal_alignment.id) of the newly created row.
+        Integer surrogate PK (temporal_alignment.id) if inserted,
+        None if the pair was already aligned (conflict).
 
     Raises:
-        TypeError: If Decimal fields are not Decimal type
-        ValueError: If alignment_quality is not a valid value
+        TypeError: If time_delta_seconds is not Decimal
+        ValueError: If alignment_quality is not a valid value, or both
+            observations are the same row
 
     Example:
         >>> alignment_id = insert_temporal_alignment(
-        ...     market_id=42,
-        ...     market_snapshot_id=1001,
-        ...     game_state_id=501,
-        ...     snapshot_time=datetime(2026, 1, 15, 20, 30, 0, tzinfo=UTC),
-        ...     game_state_time=datetime(2026, 1, 15, 20, 30, 5, tzinfo=UTC),
-        ...     time_delta_seconds=Decimal("5.00"),
+        ...     observation_a_id=1001,
+        ...     observation_a_ingested_at=datetime(2026, 1, 15, 20, 30, 1, tzinfo=UTC),
+        ...     observation_b_id=501,
+        ...     observation_b_ingested_at=datetime(2026, 1, 15, 20, 30, 6, tzinfo=UTC),
+        ...     time_delta_seconds=Decimal("5.000"),
         ...     alignment_quality='good',
-        ...     yes_ask_price=Decimal("0.5500"),
-        ...     no_ask_price=Decimal("0.4500"),
-        ...     game_id=15,
+        ...     canonical_event_id=15,
         ... )
 
     References:
-        - Migration 0027: temporal_alignment
-        - Migration 0035: game_id FK added to temporal_alignment
-        - Migration 0038: events.game_id FK (structural source for this value)
+        - Migration 0084: temporal_alignment pure linkage redesign
+        - Migration 0078: canonical_observations (composite PK)
         - Issue #375: Temporal alignment table
-        - Issue #462: Structural market-to-game linking
     """
     # Runtime type validation (enforces Decimal precision)
     time_delta_seconds = validate_decimal(time_delta_seconds, "time_delta_seconds")
-    if yes_ask_price is not None:
-        yes_ask_price = validate_decimal(yes_ask_price, "yes_ask_price")
-    if no_ask_price is not None:
-        no_ask_price = validate_decimal(no_ask_price, "no_ask_price")
-    if spread is not None:
-        spread = validate_decimal(spread, "spread")
-
-    # Runtime enum-like validation
-    if alignment_quality not in VALID_ALIGNMENT_QUALITIES:
-        raise ValueError(
-            f"alignment_quality must be one of {VALID_ALIGNMENT_QUALITIES}, "
-            f"got '{alignment_quality}'"
-        )
+    _validate_alignment_pair(
+        (observation_a_id, observation_a_ingested_at),
+        (observation_b_id, observation_b_ingested_at),
+        alignment_quality,
+    )
 
     insert_query = """
         INSERT INTO temporal_alignment (
-            market_id, market_snapshot_id, game_state_id,
-            snapshot_time, game_state_time, time_delta_seconds,
-            alignment_quality,
-            yes_ask_price, no_ask_price, spread, volume,
-            game_status, home_score, away_score, period, clock,
-            game_id
+            observation_a_id, observation_a_ingested_at,
+            observation_b_id, observation_b_ingested_at,
+            canonical_event_id, time_delta_seconds, alignment_quality,
+            aligned_at
         )
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, COALESCE(%s, NOW()))
+        ON CONFLICT ON CONSTRAINT uq_alignment_pair DO NOTHING
         RETURNING id
     """
 
     params = (
-        market_id,
-        market_snapshot_id,
-        game_state_id,
-        snapshot_time,
-        game_state_time,
+        observation_a_id,
+        observation_a_ingested_at,
+        observation_b_id,
+        observation_b_ingested_at,
+        canonical_event_id,
         time_delta_seconds,
         alignment_quality,
-        yes_ask_price,
-        no_ask_price,
-        spread,
-        volume,
-        game_status,
-        home_score,
-        away_score,
-        period,
-        clock,
-        game_id,
+        aligned_at,
     )
 
     with get_cursor(commit=True) as cur:
         cur.execute(insert_query, params)
         result = cur.fetchone()
-        return cast("int", result["id"])
+        return cast("int", result["id"]) if result else None
 
 
 def insert_temporal_alignment_batch(alignments: list[dict]) -> int:
@@ -429,66 +417,55 @@ def insert_temporal_alignment_batch(alignments: list[dict]) -> int:
     Bulk insert temporal alignment rows.
 
     Accepts a list of dictionaries, each with the same keys as
-    insert_temporal_alignment parameters. Uses executemany for efficiency.
+    insert_temporal_alignment parameters. Uses execute_values for efficiency.
 
     Args:
         alignments: List of dicts, each containing:
-            - market_id (int, required)
-            - market_snapshot_id (int, required)
-            - game_state_id (int, required)
-            - snapshot_time (datetime, required)
-            - game_state_time (datetime, required)
+            - observation_a_id (int, required)
+            - observation_a_ingested_at (datetime, required)
+            - observation_b_id (int, required)
+            - observation_b_ingested_at (datetime, required)
             - time_delta_seconds (Decimal, required)
             - alignment_quality (str, default 'good')
-            - yes_ask_price (Decimal | None)
-            - no_ask_price (Decimal | None)
-            - spread (Decimal | None)
-            - volume (int | None)
-            - game_status (str | None)
-            - home_score (int | None)
-            - away_score (int | None)
-            - period (str | None)
-            - clock (str | None)
-            - game_id (int | None) -- FK to games(id), denormalized from events
+            - canonical_event_id (int | None)
+            - aligned_at (datetime | None, default NOW())
 
     Returns:
-        Count of rows actually inserted (not rows submitted). Duplicates
-        on the unique constraint uq_alignment_snapshot_game are silently
+        Count of rows actually inserted (not rows submitted). Pairs already
+        present on the unique constraint uq_alignment_pair are silently
         skipped via ON CONFLICT DO NOTHING. The returned count comes from
         psycopg2's cur.rowcount after execute_values, so retry cycles that
         catch up within the lookback window correctly report the net-new
         row count rather than the submitted count.
 
     Raises:
-        TypeError: If Decimal fields are not Decimal type
-        ValueError: If alignment_quality is not a valid value
+        TypeError: If time_delta_seconds is not Decimal type
+        ValueError: If alignment_quality is not a valid value, or a row
+            pairs an observation with itself
 
     Example:
         >>> rows = [
         ...     {
-        ...         "market_id": 42,
-        ...         "market_snapshot_id": 1001,
-        ...         "game_state_id": 501,
-        ...         "snapshot_time": datetime(2026, 1, 15, 20, 30, 0, tzinfo=UTC),
-        ...         "game_state_time": datetime(2026, 1, 15, 20, 30, 5, tzinfo=UTC),
-        ...         "time_delta_seconds": Decimal("5.00"),
+        ...         "observation_a_id": 1001,
+        ...         "observation_a_ingested_at": datetime(2026, 1, 15, 20, 30, 1, tzinfo=UTC),
+        ...         "observation_b_id": 501,
+        ...         "observation_b_ingested_at": datetime(2026, 1, 15, 20, 30, 6, tzinfo=UTC),
+        ...         "time_delta_seconds": Decimal("5.000"),
         ...     },
         ...     {
-        ...         "market_id": 42,
-        ...         "market_snapshot_id": 1002,
-        ...         "game_state_id": 502,
-        ...         "snapshot_time": datetime(2026, 1, 15, 20, 30, 15, tzinfo=UTC),
-        ...         "game_state_time": datetime(2026, 1, 15, 20, 30, 10, tzinfo=UTC),
-        ...         "time_delta_seconds": Decimal("5.00"),
+        ...         "observation_a_id": 1002,
+        ...         "observation_a_ingested_at": datetime(2026, 1, 15, 20, 30, 16, tzinfo=UTC),
+        ...         "observation_b_id": 502,
+        ...         "observation_b_ingested_at": datetime(2026, 1, 15, 20, 30, 11, tzinfo=UTC),
+        ...         "time_delta_seconds": Decimal("5.000"),
         ...     },
         ... ]
         >>> count = insert_temporal_alignment_batch(rows)
         >>> # count == 2
 
     References:
-        - Migration 0027: temporal_alignment
-        - Migration 0035: game_id FK added to temporal_alignment
-        - migration_batch_plan_v1.md: Migration 0027 spec
+        - Migration 0084: temporal_alignment pure linkage redesign
+        - Migration 0078: canonical_observations (composite PK)
     """
     if not alignments:
         return 0
@@ -499,61 +476,38 @@ def insert_temporal_alignment_batch(alignments: list[dict]) -> int:
         time_delta = validate_decimal(
             row["time_delta_seconds"], f"alignments[{i}].time_delta_seconds"
         )
-
-        yes_price = row.get("yes_ask_price")
-        if yes_price is not None:
-            yes_price = validate_decimal(yes_price, f"alignments[{i}].yes_ask_price")
-
-        no_price = row.get("no_ask_price")
-        if no_price is not None:
-            no_price = validate_decimal(no_price, f"alignments[{i}].no_ask_price")
-
-        sprd = row.get("spread")
-        if sprd is not None:
-            sprd = validate_decimal(sprd, f"alignments[{i}].spread")
-
         quality = row.get("alignment_quality", "good")
-        if quality not in VALID_ALIGNMENT_QUALITIES:
-            raise ValueError(
-                f"alignment_quality must be one of {VALID_ALIGNMENT_QUALITIES}, "
-                f"got '{quality}' in alignments[{i}]"
-            )
+        _validate_alignment_pair(
+            (row["observation_a_id"], row["observation_a_ingested_at"]),
+            (row["observation_b_id"], row["observation_b_ingested_at"]),
+            quality,
+            f" in alignments[{i}]",
+        )
 
         validated_params.append(
             (
-                row["market_id"],
-                row["market_snapshot_id"],
-                row["game_state_id"],
-                row["snapshot_time"],
-                row["game_state_time"],
+                row["observation_a_id"],
+                row["observation_a_ingested_at"],
+                row["observation_b_id"],
+                row["observation_b_ingested_at"],
+                row.get("canonical_event_id"),
                 time_delta,
                 quality,
-                yes_price,
-                no_price,
-                sprd,
-                row.get("volume"),
-                row.get("game_status"),
-                row.get("home_score"),
-                row.get("away_score"),
-                row.get("period"),
-                row.get("clock"),
-                row.get("game_id"),
+                row.get("aligned_at"),
             )
         )
 
     insert_query = """
         INSERT INTO temporal_alignment (
-            market_id, market_snapshot_id, game_state_id,
-            snapshot_time, game_state_time, time_delta_seconds,
-            alignment_quality,
-            yes_ask_price, no_ask_price, spread, volume,
-            game_status, home_score, away_score, period, clock,
-            game_id
+            observation_a_id, observation_a_ingested_at,
+            observation_b_id, observation_b_ingested_at,
+            canonical_event_id, time_delta_seconds, alignment_quality,
+            aligned_at
         )
         VALUES %s
-        ON CONFLICT (market_snapshot_id, game_state_id) DO NOTHING
+        ON CONFLICT ON CONSTRAINT uq_alignment_pair DO NOTHING
     """
-    template = "(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"
+    template = "(%s, %s, %s, %s, %s, %s, %s, COALESCE(%s, NOW()))"
 
     # Use execute_values + cur.rowcount (mirrors upsert_market_trades_batch)
     # so the return value reflects rows *actually inserted* rather than rows
@@ -575,16 +529,16 @@ def insert_temporal_alignment_batch(alignments: list[dict]) -> int:
         return cast("int", cur.rowcount)
 
 
-def get_alignments_by_market(
-    market_id: int,
+def get_alignments_by_event(
+    canonical_event_id: int,
     limit: int = 100,
     min_quality: str | None = None,
 ) -> list[dict]:
     """
-    Retrieve temporal alignments for a market, ordered by snapshot_time DESC.
+    Retrieve temporal alignments for a canonical event, newest first.
 
     Args:
-        market_id: FK to markets(id)
+        canonical_event_id: FK to canonical_events(id)
         limit: Maximum rows to return (default 100)
         min_quality: Optional minimum quality filter. Returns entries at this
             quality level or better. Quality ordering (worst to best):
@@ -592,27 +546,26 @@ def get_alignments_by_market(
 
     Returns:
         List of dictionaries, one per alignment row, ordered by
-        snapshot_time DESC, id DESC.
+        aligned_at DESC, id DESC (served by idx_alignment_canonical_event).
 
     Raises:
         ValueError: If min_quality is not a valid alignment quality value
 
     Example:
-        >>> # Get all alignments for market 42
-        >>> alignments = get_alignments_by_market(42)
+        >>> # Get all alignments for canonical event 42
+        >>> alignments = get_alignments_by_event(42)
 
         >>> # Get only good or better alignments
-        >>> good_alignments = get_alignments_by_market(42, min_quality='good')
+        >>> good_alignments = get_alignments_by_event(42, min_quality='good')
 
         >>> # Get latest 10 alignments
-        >>> recent = get_alignments_by_market(42, limit=10)
+        >>> recent = get_alignments_by_event(42, limit=10)
 
     References:
-        - Migration 0027: temporal_alignment
-        - migration_batch_plan_v1.md: Migration 0027 spec
+        - Migration 0084: temporal_alignment pure linkage redesign
     """
-    query = "SELECT * FROM temporal_alignment WHERE market_id = %s"
-    params: list = [market_id]
+    query = "SELECT * FROM temporal_alignment WHERE canonical_event_id = %s"
+    params: list = [canonical_event_id]
 
     if min_quality is not None:
         if min_quality not in VALID_ALIGNMENT_QUALITIES:
@@ -626,7 +579,7 @@ def get_alignments_by_market(
         query += f" AND alignment_quality IN ({placeholders})"
         params.extend(acceptable)
 
-    query += " ORDER BY snapshot_time DESC, id DESC LIMIT %s"
+    query += " ORDER BY aligned_at DESC, id DESC LIMIT %s"
     params.append(limit)
 
     return fetch_all(query, tuple(params))
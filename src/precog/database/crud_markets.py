@@ -13,7 +13,9 @@ import uuid
 from decimal import Decimal
 from typing import Any, cast
 
-from .connection import fetch_all, fetch_one, get_cursor
+from psycopg2.extras import execute_values
+
+from .connection import execute_prepared, fetch_all, fetch_one, get_cursor
 from .crud_shared import (
     retry_on_scd_unique_conflict,
     validate_decimal,
@@ -38,6 +40,59 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 
 
+# Dimension + current snapshot projection shared by get_current_market() and
+# get_current_markets_by_tickers(). Callers append their own WHERE clause.
+# Migration 0033: enrichment columns added to dimension table.
+# Migration 0046: depth signals + daily movement columns.
+_CURRENT_MARKET_SELECT = """
+        SELECT
+            m.id,
+            m.platform_id,
+            m.event_id,
+            m.external_id,
+            m.ticker,
+            m.title,
+            m.subtitle,
+            m.market_type,
+            m.status,
+            m.settlement_value,
+            m.open_time,
+            m.close_time,
+            m.expiration_time,
+            m.outcome_label,
+            m.subcategory,
+            m.bracket_count,
+            m.source_url,
+            m.expiration_value,
+            m.notional_value,
+            m.metadata,
+            m.created_at,
+            m.updated_at,
+            ms.yes_ask_price,
+            ms.no_ask_price,
+            ms.yes_bid_price,
+            ms.no_bid_price,
+            ms.last_price,
+            ms.spread,
+            ms.volume,
+            ms.open_interest,
+            ms.liquidity,
+            ms.volume_24h,
+            ms.previous_yes_bid,
+            ms.previous_yes_ask,
+            ms.previous_price,
+            ms.yes_bid_size,
+            ms.yes_ask_size,
+            ms.row_start_ts,
+            ms.row_end_ts,
+            ms.row_current_ind
+        FROM markets m
+        LEFT JOIN market_snapshots ms
+            ON ms.market_id = m.id
+            AND ms.row_current_ind = TRUE
+"""
+
+
 def create_market(
     platform_id: str,
     event_id: int | None,
@@ -309,57 +364,39 @@ def get_current_market(ticker: str) -> dict[str, Any] | None:
         - Migration 0021: markets dimension + market_snapshots fact
     """
     # Migration 0022: market_id VARCHAR dropped. Use ticker for lookup.
-    # Migration 0033: enrichment columns added to dimension table.
-    # Migration 0046: depth signals + daily movement columns.
-    query = """
-        SELECT
-            m.id,
-            m.platform_id,
-            m.event_id,
-            m.external_id,
-            m.ticker,
-            m.title,
-            m.subtitle,
-            m.market_type,
-            m.status,
-            m.settlement_value,
-            m.open_time,
-            m.close_time,
-            m.expiration_time,
-            m.outcome_label,
-            m.subcategory,
-            m.bracket_count,
-            m.source_url,
-            m.expiration_value,
-            m.notional_value,
-            m.metadata,
-            m.created_at,
-            m.updated_at,
-            ms.yes_ask_price,
-            ms.no_ask_price,
-            ms.yes_bid_price,
-            ms.no_bid_price,
-            ms.last_price,
-            ms.spread,
-            ms.volume,
-            ms.open_interest,
-            ms.liquidity,
-            ms.volume_24h,
-            ms.previous_yes_bid,
-            ms.previous_yes_ask,
-            ms.previous_price,
-            ms.yes_bid_size,
-            ms.yes_ask_size,
-            ms.row_start_ts,
-            ms.row_end_ts,
-            ms.row_current_ind
-        FROM markets m
-        LEFT JOIN market_snapshots ms
-            ON ms.market_id = m.id
-            AND ms.row_current_ind = TRUE
-        WHERE m.ticker = %s
+    # Prepared: called for every market on every poll (and inside
+    # update_market_with_versioning), so parse/plan is skipped per call.
+    query = _CURRENT_MARKET_SELECT + " WHERE m.ticker = %s"
+    return fetch_one(query, (ticker,), prepared="get_current_market")
+
+
+def get_current_markets_by_tickers(tickers: list[str]) -> dict[str, dict[str, Any]]:
+    """
+    Get current market dimension + latest snapshot for many tickers at once.
+
+    Bulk counterpart of get_current_market(): one round trip instead of one
+    query per ticker. Used by the batched poller sync path to diff an entire
+    series page against the database in memory.
+
+    Args:
+        tickers: Market tickers to look up. Duplicates are harmless.
+
+    Returns:
+        Dictionary mapping ticker -> row (same shape as get_current_market()).
+        Tickers not present in the database are absent from the result.
+
+    Example:
+        >>> current = get_current_markets_by_tickers(["NFL-KC-BUF-YES", "NFL-KC-BUF-NO"])
+        >>> current["NFL-KC-BUF-YES"]["yes_ask_price"]  # Decimal('0.5200')
+
+    Reference:
+        - Migration 0021: markets dimension + market_snapshots fact
     """
-    return fetch_one(query, (ticker,))
+    if not tickers:
+        return {}
+    query = _CURRENT_MARKET_SELECT + " WHERE m.ticker = ANY(%s)"
+    rows = fetch_all(query, (list(tickers),))
+    return {row["ticker"]: row for row in rows}
 
 
 def count_open_markets() -> int:
@@ -637,7 +674,9 @@ def update_market_with_versioning(
             # Step 0: Lock the current snapshot row (if any) for the target
             # market. FOR UPDATE serializes concurrent updates; on retry the
             # sibling caller's committed row is visible and gets locked.
-            cur.execute(
+            execute_prepared(
+                cur,
+                "update_market_lock_snapshot",
                 """
                 SELECT id FROM market_snapshots
                 WHERE market_id = %s
@@ -651,7 +690,9 @@ def update_market_with_versioning(
             # status/metadata/enrichment if they changed.
             # Migration 0033: enrichment columns updated on dimension row.
             # Migration 0046: expiration_value, notional_value added.
-            cur.execute(
+            execute_prepared(
+                cur,
+                "update_market_dimension",
                 """
                 UPDATE markets
                 SET status = %s,
@@ -692,7 +733,9 @@ def update_market_with_versioning(
             # Step 2: Create new snapshot (SCD Type 2 on market_snapshots)
             # Mark current snapshot as historical using the captured timestamp
             # so the close/insert pair share one temporal boundary.
-            cur.execute(
+            execute_prepared(
+                cur,
+                "update_market_close_snapshot",
                 """
                 UPDATE market_snapshots
                 SET row_current_ind = FALSE,
@@ -706,7 +749,9 @@ def update_market_with_versioning(
             # Insert new snapshot
             # Migration 0021: yes_bid_price, no_bid_price, last_price, liquidity
             # Migration 0046: volume_24h, previous_*, yes_bid_size, yes_ask_size
-            cur.execute(
+            execute_prepared(
+                cur,
+                "update_market_insert_snapshot",
                 """
                 INSERT INTO market_snapshots (
                     market_id, yes_ask_price, no_ask_price,
@@ -750,6 +795,308 @@ def update_market_with_versioning(
     )
 
 
+# Row keys accepted by update_markets_with_versioning_batch(), split by the
+# table they land in. Each entry is (row key, column name); only
+# market_metadata differs from its column name, mirroring the keyword names
+# of update_market_with_versioning().
+_BATCH_DIMENSION_FIELDS: tuple[tuple[str, str], ...] = (
+    ("status", "status"),
+    ("market_metadata", "metadata"),
+    ("subtitle", "subtitle"),
+    ("open_time", "open_time"),
+    ("close_time", "close_time"),
+    ("expiration_time", "expiration_time"),
+    ("outcome_label", "outcome_label"),
+    ("subcategory", "subcategory"),
+    ("bracket_count", "bracket_count"),
+    ("source_url", "source_url"),
+    ("settlement_value", "settlement_value"),
+    ("expiration_value", "expiration_value"),
+    ("notional_value", "notional_value"),
+)
+_BATCH_SNAPSHOT_FIELDS: tuple[str, ...] = (
+    "yes_ask_price",
+    "no_ask_price",
+    "yes_bid_price",
+    "no_bid_price",
+    "last_price",
+    "spread",
+    "volume",
+    "open_interest",
+    "liquidity",
+    "volume_24h",
+    "previous_yes_bid",
+    "previous_yes_ask",
+    "previous_price",
+    "yes_bid_size",
+    "yes_ask_size",
+)
+_BATCH_DECIMAL_FIELDS: frozenset[str] = frozenset(
+    {
+        "yes_ask_price",
+        "no_ask_price",
+        "spread",
+        "yes_bid_price",
+        "no_bid_price",
+        "last_price",
+        "liquidity",
+        "settlement_value",
+        "notional_value",
+        "previous_yes_bid",
+        "previous_yes_ask",
+        "previous_price",
+    }
+)
+_BATCH_ALLOWED_KEYS: frozenset[str] = frozenset(
+    {"ticker"} | {key for key, _ in _BATCH_DIMENSION_FIELDS} | set(_BATCH_SNAPSHOT_FIELDS)
+)
+
+
+def update_markets_with_versioning_batch(rows: list[dict[str, Any]]) -> dict[str, int]:
+    """
+    Bulk update_market_with_versioning(): N markets, one transaction.
+
+    Applies the same dimension UPDATE + snapshot close + snapshot INSERT as
+    update_market_with_versioning(), but for every row at once. Rows are
+    staged into an ON COMMIT DROP temp table with one execute_values()
+    INSERT, then resolved, merged and written with set-based statements
+    inside a single get_cursor(commit=True) block. A batch costs a fixed
+    eight statements whatever its size, instead of five statements and a
+    pooled connection per market.
+
+    Each row uses the keyword names of update_market_with_versioning() plus
+    ``ticker``. As in the single-row function, a key that is missing or None
+    falls back to the market's current value.
+
+    Args:
+        rows: List of dicts, each containing:
+            - ticker (str, required)
+            - any of: yes_ask_price, no_ask_price, status, volume,
+              open_interest, market_metadata, subtitle, open_time, close_time,
+              expiration_time, outcome_label, subcategory, bracket_count,
+              source_url, spread, yes_bid_price, no_bid_price, last_price,
+              liquidity, settlement_value, expiration_value, notional_value,
+              volume_24h, previous_yes_bid, previous_yes_ask, previous_price,
+              yes_bid_size, yes_ask_size
+            If the same ticker appears more than once, the last row wins.
+
+    Returns:
+        Dictionary mapping ticker -> markets.id for every versioned market.
+
+    Raises:
+        TypeError: If a price field is not Decimal (validated before any write)
+        ValueError: If a row has no ticker, carries an unknown key, or names a
+            market that does not exist (nothing is written in that case)
+
+    Example:
+        >>> pks = update_markets_with_versioning_batch([
+        ...     {"ticker": "NFL-KC-BUF-YES", "yes_ask_price": Decimal("0.5500"),
+        ...      "no_ask_price": Decimal("0.4600")},
+        ...     {"ticker": "NFL-KC-BUF-NO", "status": "closed"},
+        ... ])
+
+    Educational Note:
+        Concurrency mirrors the single-row path (Issue #625): the current
+        snapshot rows are locked FOR UPDATE before they are read, in
+        market_id order so two overlapping batches cannot deadlock, and the
+        whole attempt is wrapped in retry_on_scd_unique_conflict() on
+        idx_market_snapshots_unique_current. The close runs before the
+        insert, so the partial unique index never sees two current rows for
+        a market. NOW() is the transaction timestamp, fresh on each attempt
+        and shared by every close/insert pair in the batch.
+
+    Reference:
+        - Migration 0021: markets dimension + market_snapshots fact
+        - Migration 0046: depth signals + daily movement columns
+    """
+    if not rows:
+        return {}
+
+    # Validate all rows before writing any (mirrors insert_temporal_alignment_batch)
+    updates: dict[str, dict[str, Any]] = {}
+    for i, row in enumerate(rows):
+        ticker = row.get("ticker")
+        if not ticker:
+            raise ValueError(f"rows[{i}] is missing 'ticker'")
+        unknown_keys = set(row) - _BATCH_ALLOWED_KEYS
+        if unknown_keys:
+            raise ValueError(f"rows[{i}] has unknown keys: {sorted(unknown_keys)}")
+        validated = dict(row)
+        for field in _BATCH_DECIMAL_FIELDS:
+            if validated.get(field) is not None:
+                validated[field] = validate_decimal(validated[field], f"rows[{i}].{field}")
+        updates[ticker] = validated
+
+    tickers = list(updates)
+
+    # Raw row values are staged as-is: NULL means "keep the current value",
+    # resolved in SQL with COALESCE against the locked current rows.
+    stage_params: list[tuple[Any, ...]] = []
+    for ticker, row in updates.items():
+        metadata = row.get("market_metadata")
+        stage_params.append(
+            (
+                ticker,
+                *(
+                    (json.dumps(metadata) if metadata else None)
+                    if key == "market_metadata"
+                    else row.get(key)
+                    for key, _ in _BATCH_DIMENSION_FIELDS
+                ),
+                *(row.get(field) for field in _BATCH_SNAPSHOT_FIELDS),
+            )
+        )
+
+    dimension_columns = [column for _, column in _BATCH_DIMENSION_FIELDS]
+    stage_columns = ", ".join(["ticker", *dimension_columns, *_BATCH_SNAPSHOT_FIELDS])
+    dimension_set = ",\n            ".join(
+        f"{column} = COALESCE(s.{column}, m.{column})" for column in dimension_columns
+    )
+    snapshot_merge = ",\n            ".join(
+        f"{field} = COALESCE(s.{field}, c.{field})" for field in _BATCH_SNAPSHOT_FIELDS
+    )
+    snapshot_columns = ", ".join(_BATCH_SNAPSHOT_FIELDS)
+
+    def _attempt_batch() -> dict[str, int]:
+        """One attempt at the staged dimension UPDATE + snapshot close+insert.
+
+        Like _attempt_update_and_snapshot(), opens its own
+        get_cursor(commit=True) block so a retry gets a fresh transaction,
+        a fresh NOW(), and re-reads the current rows a sibling caller may
+        have committed. The staging table is ON COMMIT DROP, so a rolled
+        back attempt leaves nothing behind either.
+        """
+        with get_cursor(commit=True) as cur:
+            # Column types match markets / market_snapshots so the set-based
+            # statements below need no per-value casts.
+            cur.execute(
+                """
+                CREATE TEMP TABLE _market_version_stage (
+                    ticker VARCHAR NOT NULL PRIMARY KEY,
+                    market_id INTEGER,
+                    status VARCHAR,
+                    metadata JSONB,
+                    subtitle VARCHAR,
+                    open_time TIMESTAMPTZ,
+                    close_time TIMESTAMPTZ,
+                    expiration_time TIMESTAMPTZ,
+                    outcome_label VARCHAR,
+                    subcategory VARCHAR,
+                    bracket_count INTEGER,
+                    source_url VARCHAR,
+                    settlement_value NUMERIC,
+                    expiration_value VARCHAR,
+                    notional_value NUMERIC,
+                    yes_ask_price DECIMAL(10,4),
+                    no_ask_price DECIMAL(10,4),
+                    yes_bid_price DECIMAL(10,4),
+                    no_bid_price DECIMAL(10,4),
+                    last_price DECIMAL(10,4),
+                    spread DECIMAL(10,4),
+                    volume INTEGER,
+                    open_interest INTEGER,
+                    liquidity DECIMAL(10,4),
+                    volume_24h INTEGER,
+                    previous_yes_bid DECIMAL(10,4),
+                    previous_yes_ask DECIMAL(10,4),
+                    previous_price DECIMAL(10,4),
+                    yes_bid_size INTEGER,
+                    yes_ask_size INTEGER
+                ) ON COMMIT DROP
+                """
+            )
+            execute_values(
+                cur,
+                f"INSERT INTO _market_version_stage ({stage_columns}) VALUES %s",  # noqa: S608
+                stage_params,
+                page_size=len(stage_params),
+            )
+
+            # Step 0: Resolve tickers to market ids; unknown tickers abort
+            # the batch before anything is written.
+            cur.execute(
+                """
+                UPDATE _market_version_stage s
+                SET market_id = m.id
+                FROM markets m
+                WHERE m.ticker = s.ticker
+                RETURNING s.ticker, s.market_id
+                """
+            )
+            market_pks = {r["ticker"]: cast("int", r["market_id"]) for r in cur.fetchall()}
+            missing = [t for t in tickers if t not in market_pks]
+            if missing:
+                msg = f"Markets not found: {', '.join(sorted(missing))}"
+                raise ValueError(msg)
+
+            # Step 1: Lock every current snapshot in the batch, in market_id
+            # order so two overlapping batches cannot deadlock.
+            cur.execute(
+                """
+                SELECT ms.id FROM market_snapshots ms
+                JOIN _market_version_stage s ON s.market_id = ms.market_id
+                WHERE ms.row_current_ind = TRUE
+                ORDER BY ms.market_id
+                FOR UPDATE OF ms
+                """
+            )
+
+            # Step 2: Fill unset snapshot values from the (now locked)
+            # current snapshot, the same fallback the single-row path applies.
+            cur.execute(
+                f"""
+                UPDATE _market_version_stage s
+                SET {snapshot_merge}
+                FROM market_snapshots c
+                WHERE c.market_id = s.market_id
+                  AND c.row_current_ind = TRUE
+                """  # noqa: S608
+            )
+
+            # Step 3: Update dimension rows, always bumping updated_at.
+            cur.execute(
+                f"""
+                UPDATE markets m
+                SET {dimension_set},
+                    updated_at = NOW()
+                FROM _market_version_stage s
+                WHERE m.id = s.market_id
+                """  # noqa: S608
+            )
+
+            # Step 4: Close current snapshots and insert the new ones. NOW()
+            # is the transaction timestamp, so every close/insert pair in the
+            # batch shares one temporal boundary.
+            cur.execute(
+                """
+                UPDATE market_snapshots ms
+                SET row_current_ind = FALSE,
+                    row_end_ts = NOW()
+                FROM _market_version_stage s
+                WHERE ms.market_id = s.market_id
+                  AND ms.row_current_ind = TRUE
+                """
+            )
+            cur.execute(
+                f"""
+                INSERT INTO market_snapshots (
+                    market_id, {snapshot_columns},
+                    row_current_ind, row_start_ts, updated_at
+                )
+                SELECT market_id, {snapshot_columns}, TRUE, NOW(), NOW()
+                FROM _market_version_stage
+                """  # noqa: S608
+            )
+            return market_pks
+
+    return retry_on_scd_unique_conflict(
+        _attempt_batch,
+        "idx_market_snapshots_unique_current",
+        business_key={"batch_size": len(tickers)},
+        logger_override=logger,
+    )
+
+
 def get_market_history(ticker: str, limit: int = 100) -> list[dict[str, Any]]:
     """
     Get price snapshot history for a market (all versions).
@@ -956,6 +1303,96 @@ def insert_orderbook_snapshot(
         return cast("int", result["id"])
 
 
+_ORDERBOOK_SNAPSHOT_FIELDS: tuple[str, ...] = (
+    "market_id",
+    "best_bid",
+    "best_ask",
+    "spread",
+    "bid_depth_total",
+    "ask_depth_total",
+    "depth_imbalance",
+    "weighted_mid",
+    "bid_prices",
+    "bid_quantities",
+    "ask_prices",
+    "ask_quantities",
+    "levels",
+)
+_ORDERBOOK_DECIMAL_FIELDS: tuple[str, ...] = (
+    "best_bid",
+    "best_ask",
+    "spread",
+    "depth_imbalance",
+    "weighted_mid",
+)
+
+
+def insert_orderbook_snapshots_batch(snapshots: list[dict[str, Any]]) -> list[int]:
+    """
+    Bulk insert_orderbook_snapshot(): N snapshots, one statement.
+
+    Each snapshot dict uses the keyword names of insert_orderbook_snapshot()
+    (market_id required, everything else optional). All rows are inserted
+    with a single execute_values() INSERT in one transaction and share one
+    snapshot_time.
+
+    Args:
+        snapshots: Snapshot dicts keyed like insert_orderbook_snapshot() kwargs
+
+    Returns:
+        ids of the inserted rows, in input order
+
+    Raises:
+        ValueError: If a snapshot lacks market_id or has unknown keys
+        TypeError: If a price field is not a Decimal
+
+    Example:
+        >>> ids = insert_orderbook_snapshots_batch([
+        ...     {"market_id": 42, "best_bid": Decimal("0.5000"), "best_ask": Decimal("0.5200")},
+        ...     {"market_id": 43, "best_bid": Decimal("0.3100"), "best_ask": Decimal("0.3300")},
+        ... ])
+
+    References:
+        - Migration 0034: orderbook_snapshots table
+    """
+    if not snapshots:
+        return []
+
+    params: list[tuple[Any, ...]] = []
+    for i, snapshot in enumerate(snapshots):
+        if snapshot.get("market_id") is None:
+            raise ValueError(f"snapshots[{i}] missing market_id")
+        unknown_keys = set(snapshot) - set(_ORDERBOOK_SNAPSHOT_FIELDS)
+        if unknown_keys:
+            raise ValueError(f"snapshots[{i}] has unknown keys: {sorted(unknown_keys)}")
+        for field in _ORDERBOOK_DECIMAL_FIELDS:
+            if snapshot.get(field) is not None:
+                validate_decimal(snapshot[field], f"snapshots[{i}].{field}")
+        params.append(tuple(snapshot.get(field) for field in _ORDERBOOK_SNAPSHOT_FIELDS))
+
+    # Explicit array casts: psycopg2 adapts [] to '{}', which needs a type
+    query = """
+        INSERT INTO orderbook_snapshots (
+            market_id, best_bid, best_ask, spread,
+            bid_depth_total, ask_depth_total, depth_imbalance, weighted_mid,
+            bid_prices, bid_quantities, ask_prices, ask_quantities, levels,
+            snapshot_time
+        )
+        VALUES %s
+        RETURNING id
+    """
+    template = (
+        "(%s, %s, %s, %s, %s, %s, %s, %s, "
+        "%s::DECIMAL(10,4)[], %s::INTEGER[], %s::DECIMAL(10,4)[], %s::INTEGER[], %s, NOW())"
+    )
+
+    with get_cursor(commit=True) as cur:
+        rows = execute_values(
+            cur, query, params, template=template, page_size=len(params), fetch=True
+        )
+        return [cast("int", row["id"]) for row in rows]
+
+
 def get_latest_orderbook(market_id: int) -> dict[str, Any] | None:
     """
     Get the most recent order book snapshot for a market.
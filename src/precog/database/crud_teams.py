@@ -189,13 +189,13 @@ def get_team_by_espn_id(espn_team_id: str, league: str | None = None) -> dict[st
             FROM teams
             WHERE espn_team_id = %s AND league = %s
         """
-        return fetch_one(query, (espn_team_id, league))
+        return fetch_one(query, (espn_team_id, league), prepared="get_team_by_espn_id_league")
     query = """
             SELECT *
             FROM teams
             WHERE espn_team_id = %s
         """
-    return fetch_one(query, (espn_team_id,))
+    return fetch_one(query, (espn_team_id,), prepared="get_team_by_espn_id")
 
 
 def create_team(
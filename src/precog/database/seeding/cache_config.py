@@ -7,8 +7,8 @@ Supports reproducibility, backtesting, and TimescaleDB migration.
 Directory Structure:
     data/historical/
     ├── *.csv                    # FiveThirtyEight Elo data
-    ├── espn/{sport}/           # ESPN game cache
-    ├── kalshi/{type}/          # Kalshi API cache
+    ├── espn/{sport}/           # ESPN game cache (one .pack per season)
+    ├── kalshi/{type}/          # Kalshi API cache (one .pack per date)
     └── python_libs/            # External library documentation
 
 Educational Note:
@@ -30,6 +30,8 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
+from precog.database.seeding.packed_cache import PACK_SUFFIX, read_pack_index
+
 # =============================================================================
 # Base Cache Directory
 # =============================================================================
@@ -183,13 +185,19 @@ def _get_espn_stats_summary() -> dict[str, Any]:
 
     for sport_dir in ESPN_CACHE_DIR.iterdir():
         if sport_dir.is_dir():
+            # Season packs: dates come from the index, not one file per date
+            pack_files = list(sport_dir.glob(f"*{PACK_SUFFIX}"))
+            cached_dates = sum(len(read_pack_index(f)) for f in pack_files)
+            size = sum(f.stat().st_size for f in pack_files)
+            # Legacy per-date files not yet packed
             cache_files = list(sport_dir.glob("*.json"))
-            size = sum(f.stat().st_size for f in cache_files)
+            cached_dates += len(cache_files)
+            size += sum(f.stat().st_size for f in cache_files)
             sports_stats[sport_dir.name] = {
-                "cached_dates": len(cache_files),
+                "cached_dates": cached_dates,
                 "size_mb": size / (1024 * 1024),
             }
-            total_dates += len(cache_files)
+            total_dates += cached_dates
             total_size += size
 
     return {
@@ -210,7 +218,8 @@ def _get_kalshi_stats_summary() -> dict[str, Any]:
 
     for type_dir in KALSHI_CACHE_DIR.iterdir():
         if type_dir.is_dir():
-            cache_files = list(type_dir.glob("*.json"))
+            # One pack per date, plus legacy single-document JSON files
+            cache_files = list(type_dir.glob(f"*{PACK_SUFFIX}")) + list(type_dir.glob("*.json"))
             size = sum(f.stat().st_size for f in cache_files)
             types_stats[type_dir.name] = {
                 "cached_dates": len(cache_files),
@@ -42,6 +42,7 @@ import json
 import logging
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, TypedDict
@@ -58,11 +59,18 @@ from precog.database.seeding.batch_result import (
 from precog.database.seeding.historical_elo_loader import (
     normalize_team_code,
 )
+from precog.database.seeding.packed_cache import (
+    PACK_SUFFIX,
+    PackedCache,
+    read_pack_index,
+)
 from precog.database.seeding.progress import print_load_summary, seeding_progress
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
+    from precog.api_connectors.espn_client import ESPNClient
+
 logger = logging.getLogger(__name__)
 
 # Maps league codes to sport names for the games.sport column (Phase B of #460).
@@ -1120,12 +1128,16 @@ def get_historical_games_stats() -> dict[str, Any]:
 # Design Philosophy:
 #   1. Cache-first: Always check local cache before making API calls
 #   2. Persistent: Save all ESPN responses to local files for reproducibility
-#   3. Rate-aware: Respect ESPN's rate limits with automatic retry
-#   4. TimescaleDB-ready: Standard PostgreSQL schema works with hypertables
+#   3. Rate-aware: Concurrent fetches share one ESPN token bucket
+#   4. Resumable: Every fetched date is checkpointed in its season index
+#   5. TimescaleDB-ready: Standard PostgreSQL schema works with hypertables
 #
 # Cache Structure:
 #   data/historical/espn/{sport}/
-#     └── {YYYY-MM-DD}.json  (one file per date with all games)
+#     ├── {season}.pack      (one zlib-compressed JSONL block per date)
+#     ├── {season}.pack.idx  (date -> offset, length, game count)
+#     └── {YYYY-MM-DD}.json  (legacy per-date files, read-only; see
+#                             pack_legacy_espn_cache)
 #
 # Usage Modes:
 #   - fetch: API calls + cache (default for new data)
@@ -1135,29 +1147,78 @@ def get_historical_games_stats() -> dict[str, Any]:
 # Default cache directory for ESPN data
 ESPN_CACHE_DIR = Path("data/historical/espn")
 
+# Sports whose season spans New Year; dates before July belong to the
+# previous season's pack (e.g. the Feb 2024 Super Bowl is in nfl/2023.pack)
+SPLIT_YEAR_SPORTS = frozenset({"nfl", "ncaaf", "cfb", "nba", "ncaab", "cbb", "nhl"})
+SEASON_ROLLOVER_MONTH = 7
 
-def get_espn_cache_path(sport: str, game_date: date) -> Path:
-    """Get the cache file path for a specific sport and date.
+# Backfill concurrency and rate-limit retry budget
+DEFAULT_ESPN_WORKERS = 4
+ESPN_RATE_LIMIT_RETRIES = 10
+
+
+def espn_season_for_date(sport: str, game_date: date) -> int:
+    """Return the season year whose pack file holds a date.
 
     Args:
-        sport: Sport code (nfl, nba, nhl, mlb, etc.)
+        sport: Sport code
         game_date: Date of the games
 
     Returns:
-        Path to the JSON cache file
+        Season start year for split-year sports, calendar year otherwise
+    """
+    if sport.lower() in SPLIT_YEAR_SPORTS and game_date.month < SEASON_ROLLOVER_MONTH:
+        return game_date.year - 1
+    return game_date.year
+
+
+def get_espn_pack_path(sport: str, season: int) -> Path:
+    """Get the packed cache file path for a sport and season.
+
+    Args:
+        sport: Sport code (nfl, nba, nhl, mlb, etc.)
+        season: Season year (see espn_season_for_date)
+
+    Returns:
+        Path to the .pack file (its index sits next to it as .pack.idx)
 
     Educational Note:
-        Cache files are organized by sport and date for easy navigation:
-        data/historical/espn/nfl/2024-01-15.json
+        A multi-season backfill used to leave one small JSON file per date
+        (tens of thousands of files). Packing a season into one file keeps
+        the directory small, and the index answers "which dates are cached"
+        without opening or stat-ing any per-date file.
+    """
+    return ESPN_CACHE_DIR / sport.lower() / f"{season}{PACK_SUFFIX}"
+
+
+def open_espn_pack(sport: str, season: int) -> PackedCache:
+    """Open the packed cache for a sport and season."""
+    return PackedCache(get_espn_pack_path(sport, season))
 
-        This structure allows:
-        - Easy manual inspection of cached data
-        - Simple date-range operations (glob patterns)
-        - Efficient incremental updates (only fetch missing dates)
+
+def _season_pack(packs: dict[int, PackedCache], sport: str, season: int) -> PackedCache:
+    """Return the open pack for season from packs, opening it on first use."""
+    pack = packs.get(season)
+    if pack is None:
+        pack = packs[season] = open_espn_pack(sport, season)
+    return pack
+
+
+def get_espn_cache_path(sport: str, game_date: date) -> Path:
+    """Get the legacy per-date cache file path for a sport and date.
+
+    Args:
+        sport: Sport code (nfl, nba, nhl, mlb, etc.)
+        game_date: Date of the games
+
+    Returns:
+        Path to the legacy JSON cache file (data/historical/espn/nfl/2024-01-15.json)
+
+    Note:
+        New data is written to season packs (get_espn_pack_path). Legacy
+        files are still read, and pack_legacy_espn_cache folds them into packs.
     """
-    cache_dir = ESPN_CACHE_DIR / sport.lower()
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    return cache_dir / f"{game_date.isoformat()}.json"
+    return ESPN_CACHE_DIR / sport.lower() / f"{game_date.isoformat()}.json"
 
 
 def is_date_cached(sport: str, game_date: date) -> bool:
@@ -1168,51 +1229,68 @@ def is_date_cached(sport: str, game_date: date) -> bool:
         game_date: Date to check
 
     Returns:
-        True if cache file exists and is non-empty
+        True if the date is in its season index or has a non-empty legacy file
     """
+    pack_path = get_espn_pack_path(sport, espn_season_for_date(sport, game_date))
+    if game_date.isoformat() in read_pack_index(pack_path):
+        return True
     cache_path = get_espn_cache_path(sport, game_date)
     return cache_path.exists() and cache_path.stat().st_size > 0
 
 
-def save_espn_cache(sport: str, game_date: date, games: list[dict[str, Any]]) -> None:
-    """Save ESPN game data to local cache file.
+def save_espn_cache(
+    sport: str,
+    game_date: date,
+    games: list[dict[str, Any]],
+    *,
+    pack: PackedCache | None = None,
+) -> None:
+    """Save ESPN game data to the season's packed cache.
 
     Args:
         sport: Sport code
         game_date: Date of the games
         games: List of ESPNGameFull dicts from API
+        pack: Already-open season pack (avoids re-reading the index per date)
 
     Educational Note:
         We save the raw API response to preserve all data fields,
         even those we don't currently use. This future-proofs the cache
         for potential feature additions (e.g., play-by-play data).
     """
-    cache_path = get_espn_cache_path(sport, game_date)
-    with open(cache_path, "w", encoding="utf-8") as f:
-        json.dump(
-            {
-                "sport": sport,
-                "date": game_date.isoformat(),
-                "fetched_at": datetime.now().isoformat(),
-                "games": games,
-            },
-            f,
-            indent=2,
-            default=str,  # Handle datetime, Decimal, etc.
-        )
+    if pack is None:
+        pack = open_espn_pack(sport, espn_season_for_date(sport, game_date))
+    pack.write_block(
+        game_date.isoformat(),
+        games,
+        meta={"fetched_at": datetime.now().isoformat()},
+    )
     logger.debug("Cached %d games for %s on %s", len(games), sport, game_date)
 
 
-def load_espn_cache(sport: str, game_date: date) -> list[dict[str, Any]] | None:
-    """Load ESPN game data from local cache file.
+def load_espn_cache(
+    sport: str,
+    game_date: date,
+    *,
+    pack: PackedCache | None = None,
+) -> list[dict[str, Any]] | None:
+    """Load ESPN game data from the packed cache (or a legacy file).
 
     Args:
         sport: Sport code
         game_date: Date to load
+        pack: Already-open season pack (avoids re-reading the index per date)
 
     Returns:
-        List of game dicts if cache exists, None otherwise
+        List of game dicts if cached, None otherwise
     """
+    if pack is None:
+        pack = open_espn_pack(sport, espn_season_for_date(sport, game_date))
+    key = game_date.isoformat()
+    if key in pack:
+        games: list[dict[str, Any]] = pack.read_block(key)
+        return games
+
     cache_path = get_espn_cache_path(sport, game_date)
     if not cache_path.exists():
         return None
@@ -1220,13 +1298,51 @@ def load_espn_cache(sport: str, game_date: date) -> list[dict[str, Any]] | None:
     try:
         with open(cache_path, encoding="utf-8") as f:
             data = json.load(f)
-            games: list[dict[str, Any]] = data.get("games", [])
-            return games
+            legacy_games: list[dict[str, Any]] = data.get("games", [])
+            return legacy_games
     except (json.JSONDecodeError, KeyError) as e:
         logger.warning("Invalid cache file %s: %s", cache_path, e)
         return None
 
 
+def pack_legacy_espn_cache(sport: str, *, remove: bool = True) -> int:
+    """Fold legacy per-date JSON cache files into season packs.
+
+    Args:
+        sport: Sport code
+        remove: Delete each legacy file once its date is in a pack
+
+    Returns:
+        Number of dates packed
+    """
+    cache_dir = ESPN_CACHE_DIR / sport.lower()
+    if not cache_dir.exists():
+        return 0
+
+    packs: dict[int, PackedCache] = {}
+    packed = 0
+    for cache_file in sorted(cache_dir.glob("*.json")):
+        try:
+            game_date = date.fromisoformat(cache_file.stem)
+        except ValueError:
+            continue
+        season = espn_season_for_date(sport, game_date)
+        pack = _season_pack(packs, sport, season)
+        if game_date.isoformat() not in pack:
+            games = load_espn_cache(sport, game_date, pack=pack)
+            if games is None:
+                continue
+            save_espn_cache(sport, game_date, games, pack=pack)
+        packed += 1
+        if remove:
+            cache_file.unlink()
+
+    for pack in packs.values():
+        pack.close()
+    logger.info("Packed %d legacy ESPN cache files for %s", packed, sport)
+    return packed
+
+
 def espn_game_to_historical_record(
     game: dict[str, Any],
     sport: str,
@@ -1335,6 +1451,41 @@ def espn_game_to_historical_record(
         return None
 
 
+def _fetch_scoreboard(
+    client: ESPNClient,
+    sport: str,
+    game_date: date,
+    *,
+    rate_limit_wait: float = 7.5,
+    max_retries: int = ESPN_RATE_LIMIT_RETRIES,
+) -> list[dict[str, Any]]:
+    """Fetch one date's scoreboard, waiting out an empty rate-limit bucket.
+
+    Args:
+        client: ESPN client (its token bucket is shared by all workers)
+        sport: Sport code
+        game_date: Date to fetch
+        rate_limit_wait: Seconds to wait after RateLimitExceeded
+        max_retries: Retries before RateLimitExceeded propagates
+
+    Returns:
+        List of ESPNGameFull dicts as plain dicts
+    """
+    from precog.api_connectors.espn_client import RateLimitExceeded
+
+    game_datetime = datetime.combine(game_date, datetime.min.time())
+    for attempt in range(max_retries + 1):
+        try:
+            # Convert to serializable dicts (ESPNGameFull is TypedDict)
+            return [dict(g) for g in client.get_scoreboard(sport, game_datetime)]
+        except RateLimitExceeded:
+            if attempt == max_retries:
+                raise
+            logger.debug("Rate limit hit, waiting %.1f seconds...", rate_limit_wait)
+            time.sleep(rate_limit_wait)
+    raise AssertionError("unreachable")  # pragma: no cover
+
+
 def fetch_espn_games_for_date(
     sport: str,
     game_date: date,
@@ -1363,48 +1514,102 @@ def fetch_espn_games_for_date(
         - Best case (all cached): 0 API calls
         - Worst case (nothing cached): 180 calls = ~22 minutes
         - Rate limited: Automatic retry after 7.5s delay
+
+        For date ranges, load_espn_historical_games fetches concurrently
+        through one shared client instead of calling this per date.
     """
     # Check cache first if enabled
-    if use_cache and is_date_cached(sport, game_date):
+    if use_cache:
         cached = load_espn_cache(sport, game_date)
         if cached is not None:
             logger.debug("Loaded %d games from cache for %s on %s", len(cached), sport, game_date)
             return cached
 
     # Import ESPN client here to avoid circular imports
-    from precog.api_connectors.espn_client import ESPNClient, RateLimitExceeded
+    from precog.api_connectors.espn_client import ESPNClient
 
-    # Fetch from API
     client = ESPNClient()
     try:
-        # Convert date to datetime for API call
-        game_datetime = datetime.combine(game_date, datetime.min.time())
-        games = client.get_scoreboard(sport, game_datetime)
+        games_list = _fetch_scoreboard(client, sport, game_date, rate_limit_wait=rate_limit_wait)
+    finally:
+        client.close()
 
-        # Convert to serializable dicts (ESPNGameFull is TypedDict)
-        games_list = [dict(g) for g in games]
+    if use_cache:
+        save_espn_cache(sport, game_date, games_list)
 
-        # Cache the results if enabled
-        if use_cache:
-            save_espn_cache(sport, game_date, games_list)
+    logger.debug("Fetched %d games from ESPN API for %s on %s", len(games_list), sport, game_date)
+    return games_list
 
-        logger.debug(
-            "Fetched %d games from ESPN API for %s on %s", len(games_list), sport, game_date
-        )
-        return games_list
-
-    except RateLimitExceeded:
-        logger.warning("Rate limit hit, waiting %.1f seconds...", rate_limit_wait)
-        time.sleep(rate_limit_wait)
-        # Retry once after waiting
-        games = client.get_scoreboard(sport, datetime.combine(game_date, datetime.min.time()))
-        games_list = [dict(g) for g in games]
-        if use_cache:
-            save_espn_cache(sport, game_date, games_list)
-        return games_list
 
+def fetch_espn_dates(
+    sport: str,
+    dates: list[date],
+    *,
+    max_workers: int = DEFAULT_ESPN_WORKERS,
+    use_cache: bool = True,
+    rate_limit_wait: float = 7.5,
+    client: ESPNClient | None = None,
+) -> Iterator[tuple[date, list[dict[str, Any]] | None]]:
+    """Fetch many dates concurrently, checkpointing each one as it completes.
+
+    A bounded pool of worker threads shares one ESPNClient, so every request
+    draws from the same ESPN token bucket. Results are written to the season
+    packs from the calling thread (packs have a single writer), and each write
+    persists the season index; an interrupted backfill therefore resumes with
+    exactly the dates that never reached an index.
+
+    Args:
+        sport: Sport code
+        dates: Dates to fetch (callers pass only uncached dates)
+        max_workers: Maximum concurrent requests
+        use_cache: Save each fetched date to its season pack
+        rate_limit_wait: Seconds a worker waits after RateLimitExceeded
+        client: ESPN client to use (default: a new one, closed on return)
+
+    Yields:
+        (date, games) in completion order; games is None if the fetch failed
+        (the failure is logged and the date stays uncached)
+    """
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+    if not dates:
+        return
+
+    from precog.api_connectors.espn_client import ESPNClient
+
+    owns_client = client is None
+    espn = client if client is not None else ESPNClient()
+    packs: dict[int, PackedCache] = {}
+    executor = ThreadPoolExecutor(
+        max_workers=min(max_workers, len(dates)), thread_name_prefix="espn-backfill"
+    )
+    try:
+        futures = {
+            executor.submit(
+                _fetch_scoreboard, espn, sport, game_date, rate_limit_wait=rate_limit_wait
+            ): game_date
+            for game_date in dates
+        }
+        for future in as_completed(futures):
+            game_date = futures[future]
+            try:
+                games = future.result()
+            except Exception as e:
+                logger.warning("ESPN fetch failed for %s on %s: %s", sport, game_date, e)
+                yield game_date, None
+                continue
+            if use_cache:
+                season = espn_season_for_date(sport, game_date)
+                pack = _season_pack(packs, sport, season)
+                save_espn_cache(sport, game_date, games, pack=pack)
+            yield game_date, games
     finally:
-        client.close()
+        # Generator closed early (or KeyboardInterrupt): drop queued dates
+        executor.shutdown(wait=True, cancel_futures=True)
+        for pack in packs.values():
+            pack.close()
+        if owns_client:
+            espn.close()
 
 
 def generate_date_range(start_date: date, end_date: date) -> list[date]:
@@ -1434,6 +1639,7 @@ def load_espn_historical_games(
     fetch_missing: bool = True,
     error_mode: ErrorHandlingMode = ErrorHandlingMode.SKIP,
     show_progress: bool = True,
+    max_workers: int = DEFAULT_ESPN_WORKERS,
 ) -> BatchInsertResult:
     """Load historical games from ESPN API with caching support.
 
@@ -1448,6 +1654,7 @@ def load_espn_historical_games(
                        If False, only load from cache (no API calls)
         error_mode: How to handle insertion errors
         show_progress: If True, show progress bar
+        max_workers: Concurrent ESPN requests for uncached dates
 
     Returns:
         BatchInsertResult with insertion statistics
@@ -1457,9 +1664,11 @@ def load_espn_historical_games(
 
         1. Fetch Mode (fetch_missing=True):
            - Check cache for each date
-           - Fetch from ESPN API if not cached
-           - Save fetched data to cache
+           - Fetch uncached dates concurrently (see fetch_espn_dates)
+           - Save each fetched date to its season pack as it arrives
            - Insert into database
+           An interrupted run loses no fetched dates: rerunning it only
+           requests the dates missing from the season indexes.
            Use for: Initial seeding, updating with new games
 
         2. Cache Mode (fetch_missing=False):
@@ -1499,10 +1708,12 @@ def load_espn_historical_games(
     # Generate date range
     dates = generate_date_range(start_date, end_date)
 
-    # Collect all games from dates
-    all_records: list[HistoricalGameRecord] = []
+    # Collect games per date; records are built in date order afterwards
+    games_by_date: dict[date, list[dict[str, Any]]] = {}
+    missing: list[date] = []
     cached_count = 0
     fetched_count = 0
+    failed_count = 0
     skipped_count = 0
 
     # Create progress description
@@ -1512,36 +1723,56 @@ def load_espn_historical_games(
         progress,
         task,
     ):
+        packs: dict[int, PackedCache] = {}
         for game_date in dates:
-            # Check if we should fetch or skip
-            if use_cache and is_date_cached(sport, game_date):
-                games = load_espn_cache(sport, game_date)
+            season = espn_season_for_date(sport, game_date)
+            pack = _season_pack(packs, sport, season)
+            games = load_espn_cache(sport, game_date, pack=pack) if use_cache else None
+            if games is not None:
+                games_by_date[game_date] = games
                 if games:
                     cached_count += 1
             elif fetch_missing:
-                games = fetch_espn_games_for_date(sport, game_date, use_cache=use_cache)
-                fetched_count += 1
+                missing.append(game_date)
+                continue
             else:
-                # Cache mode but no cache file - skip
+                # Cache mode but no cache entry - skip
                 skipped_count += 1
-                if progress and task is not None:
-                    progress.advance(task)
-                continue
-
-            # Convert games to records
-            if games:
-                for game in games:
-                    record = espn_game_to_historical_record(game, sport)
-                    if record:
-                        all_records.append(record)
-
             if progress and task is not None:
                 progress.advance(task)
+        for pack in packs.values():
+            pack.close()
+
+        for game_date, fetched in fetch_espn_dates(
+            sport, missing, max_workers=max_workers, use_cache=use_cache
+        ):
+            if fetched is None:
+                failed_count += 1
+            else:
+                games_by_date[game_date] = fetched
+                fetched_count += 1
+            if progress and task is not None:
+                progress.advance(task)
+
+    # Convert games to records
+    all_records: list[HistoricalGameRecord] = []
+    for game_date in sorted(games_by_date):
+        for game in games_by_date[game_date]:
+            record = espn_game_to_historical_record(game, sport)
+            if record:
+                all_records.append(record)
+
+    if failed_count:
+        logger.warning(
+            "%d ESPN dates failed to fetch; rerun to resume (cached dates are skipped)",
+            failed_count,
+        )
 
     logger.info(
-        "ESPN data collection complete: %d dates cached, %d fetched, %d skipped",
+        "ESPN data collection complete: %d dates cached, %d fetched, %d failed, %d skipped",
         cached_count,
         fetched_count,
+        failed_count,
         skipped_count,
     )
 
@@ -1581,15 +1812,16 @@ def load_espn_historical_games(
     return result
 
 
-def list_cached_dates(sport: str) -> list[date]:
-    """List all dates that have cached ESPN data for a sport.
+def _list_espn_packs(sport: str) -> list[Path]:
+    """Return the season pack files for a sport (one per season, not per date)."""
+    cache_dir = ESPN_CACHE_DIR / sport.lower()
+    if not cache_dir.exists():
+        return []
+    return sorted(cache_dir.glob(f"*{PACK_SUFFIX}"))
 
-    Args:
-        sport: Sport code
 
-    Returns:
-        Sorted list of dates with cache files
-    """
+def _list_legacy_cache_dates(sport: str) -> list[date]:
+    """Return dates that still have a legacy per-date JSON file (names only, no stat)."""
     cache_dir = ESPN_CACHE_DIR / sport.lower()
     if not cache_dir.exists():
         return []
@@ -1597,55 +1829,86 @@ def list_cached_dates(sport: str) -> list[date]:
     dates = []
     for cache_file in cache_dir.glob("*.json"):
         try:
-            date_str = cache_file.stem  # e.g., "2024-01-15"
-            dates.append(date.fromisoformat(date_str))
+            dates.append(date.fromisoformat(cache_file.stem))  # e.g., "2024-01-15"
         except ValueError:
             continue
+    return dates
+
+
+def list_cached_dates(sport: str) -> list[date]:
+    """List all dates that have cached ESPN data for a sport.
+
+    Reads the season indexes (plus the names of any legacy per-date files).
+
+    Args:
+        sport: Sport code
 
+    Returns:
+        Sorted list of cached dates
+    """
+    dates = set(_list_legacy_cache_dates(sport))
+    for pack_path in _list_espn_packs(sport):
+        dates.update(date.fromisoformat(key) for key in read_pack_index(pack_path))
     return sorted(dates)
 
 
+def _get_sport_cache_stats(sport: str) -> dict[str, Any]:
+    """Cache statistics for one sport, computed from the season indexes."""
+    dates: set[date] = set()
+    total_games = 0
+    size_bytes = 0
+    pack_paths = _list_espn_packs(sport)
+    for pack_path in pack_paths:
+        blocks = read_pack_index(pack_path)
+        dates.update(date.fromisoformat(key) for key in blocks)
+        total_games += sum(block.count for block in blocks.values())
+        size_bytes += pack_path.stat().st_size
+
+    legacy_dates = _list_legacy_cache_dates(sport)
+    dates.update(legacy_dates)
+
+    return {
+        "cached_dates": len(dates),
+        "total_games": total_games,
+        "seasons": len(pack_paths),
+        "legacy_files": len(legacy_dates),
+        "total_size_mb": round(size_bytes / (1024 * 1024), 2),
+        "date_range": (min(dates), max(dates)) if dates else None,
+    }
+
+
 def get_cache_stats(sport: str | None = None) -> dict[str, Any]:
     """Get statistics about cached ESPN data.
 
+    Statistics come from the season pack indexes, so this stays fast no
+    matter how many dates are cached. Games in legacy per-date files are not
+    counted (their dates are); run pack_legacy_espn_cache to include them.
+
     Args:
         sport: Specific sport to check, or None for all sports
 
     Returns:
-        Dict with cache statistics
+        Dict with cached_dates, total_games, total_size_mb and date_range
+        totals across the selected sports, plus per-sport stats in "by_sport"
     """
     if sport:
         sports = [sport.lower()]
+    elif ESPN_CACHE_DIR.exists():
+        sports = sorted(d.name for d in ESPN_CACHE_DIR.iterdir() if d.is_dir())
     else:
-        # Find all sport directories
-        if not ESPN_CACHE_DIR.exists():
-            return {"total_files": 0, "total_size_mb": 0, "sports": {}}
-        sports = [d.name for d in ESPN_CACHE_DIR.iterdir() if d.is_dir()]
+        sports = []
 
-    stats: dict[str, Any] = {"total_files": 0, "total_size_mb": 0.0, "sports": {}}
+    by_sport = {s: _get_sport_cache_stats(s) for s in sports}
+    by_sport = {s: stats for s, stats in by_sport.items() if stats["cached_dates"]}
+    ranges = [stats["date_range"] for stats in by_sport.values()]
 
-    for s in sports:
-        cache_dir = ESPN_CACHE_DIR / s
-        if not cache_dir.exists():
-            continue
-
-        files = list(cache_dir.glob("*.json"))
-        size_bytes = sum(f.stat().st_size for f in files)
-        size_mb = size_bytes / (1024 * 1024)
-
-        dates = list_cached_dates(s)
-        date_range = f"{min(dates)} to {max(dates)}" if dates else "none"
-
-        stats["sports"][s] = {
-            "files": len(files),
-            "size_mb": round(size_mb, 2),
-            "date_range": date_range,
-        }
-        stats["total_files"] += len(files)
-        stats["total_size_mb"] += size_mb
-
-    stats["total_size_mb"] = round(stats["total_size_mb"], 2)
-    return stats
+    return {
+        "cached_dates": sum(stats["cached_dates"] for stats in by_sport.values()),
+        "total_games": sum(stats["total_games"] for stats in by_sport.values()),
+        "total_size_mb": round(sum(stats["total_size_mb"] for stats in by_sport.values()), 2),
+        "date_range": ((min(r[0] for r in ranges), max(r[1] for r in ranges)) if ranges else None),
+        "by_sport": by_sport,
+    }
 
 
 # =============================================================================
@@ -10,13 +10,13 @@ Provides local file caching for Kalshi API data to support:
 Cache Structure:
     data/historical/kalshi/
     ├── markets/           # Market snapshots by date
-    │   └── 2024-12-25.json
+    │   ├── 2024-12-25.pack       # one compressed JSONL block per series
+    │   └── 2024-12-25.pack.idx   # series -> offset/count/tickers index
     ├── series/            # Series definitions by date
-    │   └── 2024-12-25.json
     ├── positions/         # Position snapshots by date
-    │   └── 2024-12-25.json
     └── orders/            # Order history by date
-        └── 2024-12-25.json
+
+    Legacy {YYYY-MM-DD}.json files (one JSON document per day) are still read.
 
 Usage:
     # Fetch and cache markets
@@ -25,12 +25,21 @@ Usage:
     # Load from cache only (no API)
     markets = load_cached_markets(date.today())
 
+    # Stream one series without decoding the rest of the day
+    for market in iter_cached_markets(date.today(), series="KXNFLGAME"):
+        ...
+
+    # Replay a date range one market at a time
+    for snapshot_date, market in iter_cached_market_range(start, end, series="KXNFLGAME"):
+        ...
+
     # Get cache statistics
     stats = get_kalshi_cache_stats()
 
 Related:
     - ADR-048: Decimal-First Response Parsing
     - historical_games_loader.py: ESPN caching pattern (inspiration)
+    - packed_cache.py: Compressed, indexed pack format
     - Issue #229: Expanded Historical Data Sources
 """
 
@@ -38,12 +47,24 @@ from __future__ import annotations
 
 import json
 import logging
-from datetime import UTC, date, datetime
+from datetime import date, datetime
 from decimal import Decimal
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from precog.database.seeding.packed_cache import (
+    INDEX_SUFFIX,
+    PACK_SUFFIX,
+    PackBlock,
+    PackedCache,
+    get_index_path,
+    read_pack_index,
+    write_pack,
+)
+
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     from precog.api_connectors.kalshi_client import KalshiClient
 
 logger = logging.getLogger(__name__)
@@ -61,6 +82,9 @@ SERIES_CACHE_DIR = KALSHI_CACHE_DIR / "series"
 POSITIONS_CACHE_DIR = KALSHI_CACHE_DIR / "positions"
 ORDERS_CACHE_DIR = KALSHI_CACHE_DIR / "orders"
 
+# Block key for cache types that are not split by series
+ALL_RECORDS_KEY = "_all"
+
 
 # =============================================================================
 # JSON Encoding for Decimal Types
@@ -125,6 +149,18 @@ def decimal_decoder(dct: dict[str, Any]) -> dict[str, Any]:
 # =============================================================================
 
 
+def _get_cache_dir(cache_type: str) -> Path:
+    """Return the directory holding one cache type."""
+    cache_dirs = {
+        "markets": MARKETS_CACHE_DIR,
+        "series": SERIES_CACHE_DIR,
+        "positions": POSITIONS_CACHE_DIR,
+        "orders": ORDERS_CACHE_DIR,
+    }
+
+    return cache_dirs.get(cache_type, KALSHI_CACHE_DIR / cache_type)
+
+
 def get_cache_path(cache_type: str, cache_date: date) -> Path:
     """Get the cache file path for a given type and date.
 
@@ -133,17 +169,14 @@ def get_cache_path(cache_type: str, cache_date: date) -> Path:
         cache_date: Date for the cache file
 
     Returns:
-        Path to the cache file
+        Path to the pack file (its index sits next to it as .pack.idx)
     """
-    cache_dirs = {
-        "markets": MARKETS_CACHE_DIR,
-        "series": SERIES_CACHE_DIR,
-        "positions": POSITIONS_CACHE_DIR,
-        "orders": ORDERS_CACHE_DIR,
-    }
+    return _get_cache_dir(cache_type) / f"{cache_date.isoformat()}{PACK_SUFFIX}"
+
 
-    cache_dir = cache_dirs.get(cache_type, KALSHI_CACHE_DIR / cache_type)
-    return cache_dir / f"{cache_date.isoformat()}.json"
+def get_legacy_cache_path(cache_type: str, cache_date: date) -> Path:
+    """Get the legacy single-document JSON cache path for a type and date."""
+    return _get_cache_dir(cache_type) / f"{cache_date.isoformat()}.json"
 
 
 def ensure_cache_dir(cache_type: str) -> Path:
@@ -155,7 +188,7 @@ def ensure_cache_dir(cache_type: str) -> Path:
     Returns:
         Path to the cache directory
     """
-    cache_path = get_cache_path(cache_type, datetime.now(UTC).date()).parent
+    cache_path = _get_cache_dir(cache_type)
     cache_path.mkdir(parents=True, exist_ok=True)
     return cache_path
 
@@ -168,9 +201,12 @@ def is_cached(cache_type: str, cache_date: date) -> bool:
         cache_date: Date to check
 
     Returns:
-        True if cache file exists
+        True if a pack index or legacy cache file exists
     """
-    return get_cache_path(cache_type, cache_date).exists()
+    return (
+        get_index_path(get_cache_path(cache_type, cache_date)).exists()
+        or get_legacy_cache_path(cache_type, cache_date).exists()
+    )
 
 
 # =============================================================================
@@ -178,6 +214,32 @@ def is_cached(cache_type: str, cache_date: date) -> bool:
 # =============================================================================
 
 
+def _block_key(cache_type: str, record: dict[str, Any]) -> str:
+    """Return the pack block a record belongs to (its series for markets)."""
+    if cache_type != "markets":
+        return ALL_RECORDS_KEY
+    series = record.get("series_ticker") or str(record.get("event_ticker", "")).split("-")[0]
+    return series or ALL_RECORDS_KEY
+
+
+def _group_blocks(
+    cache_type: str, data: list[dict[str, Any]]
+) -> Iterator[tuple[str, list[dict[str, Any]], dict[str, Any]]]:
+    """Split records into pack blocks with their ticker and Decimal-field index."""
+    groups: dict[str, list[dict[str, Any]]] = {}
+    for record in data:
+        groups.setdefault(_block_key(cache_type, record), []).append(record)
+
+    for key, records in groups.items():
+        decimal_fields = sorted(
+            {field for record in records for field, v in record.items() if isinstance(v, Decimal)}
+        )
+        block_meta: dict[str, Any] = {"decimal_fields": decimal_fields}
+        if cache_type == "markets":
+            block_meta["tickers"] = [r["ticker"] for r in records if r.get("ticker")]
+        yield key, records, block_meta
+
+
 def save_to_cache(
     cache_type: str,
     cache_date: date,
@@ -194,32 +256,34 @@ def save_to_cache(
         metadata: Optional metadata (fetch time, count, etc.)
 
     Returns:
-        Path to the saved cache file
+        Path to the saved pack file
 
     Educational Note:
-        We wrap the data with metadata for traceability:
+        Records are written one per line into a compressed pack. Markets are
+        grouped into one block per series, and the index lists each block's
+        tickers and which top-level fields held Decimal values, so readers
+        can decode a single series and restore exact Decimal types
+        (ADR-048) without parsing the rest of the day.
+
+        The index also carries traceability metadata:
         - cached_at: When this cache was created
         - source: "kalshi_api"
         - count: Number of records
-        - data: The actual records
     """
     ensure_cache_dir(cache_type)
     cache_path = get_cache_path(cache_type, cache_date)
 
-    cache_content = {
+    file_meta: dict[str, Any] = {
         "cached_at": datetime.now().isoformat(),
         "cache_date": cache_date.isoformat(),
         "cache_type": cache_type,
         "source": "kalshi_api",
         "count": len(data),
-        "data": data,
     }
-
     if metadata:
-        cache_content["metadata"] = metadata
+        file_meta["metadata"] = metadata
 
-    with open(cache_path, "w", encoding="utf-8") as f:
-        json.dump(cache_content, f, cls=DecimalEncoder, indent=2)
+    write_pack(cache_path, _group_blocks(cache_type, data), meta=file_meta, encoder=DecimalEncoder)
 
     logger.info(
         "Saved %d %s records to cache",
@@ -231,6 +295,73 @@ def save_to_cache(
     return cache_path
 
 
+def _restore_decimals(record: dict[str, Any], decimal_fields: list[str]) -> dict[str, Any]:
+    """Convert fields that were Decimal when cached back from their string form."""
+    for field in decimal_fields:
+        value = record.get(field)
+        if isinstance(value, str):
+            record[field] = Decimal(value)
+    return record
+
+
+def _select_blocks(
+    blocks: dict[str, PackBlock],
+    keys: set[str] | None,
+    tickers: set[str] | None,
+) -> list[str]:
+    """Return the block keys to read for a key and/or ticker filter."""
+    return [
+        key
+        for key, block in sorted(blocks.items())
+        if (keys is None or key in keys)
+        and (tickers is None or not tickers.isdisjoint(block.meta.get("tickers", ())))
+    ]
+
+
+def iter_cached_records(
+    cache_type: str,
+    cache_date: date,
+    *,
+    keys: Iterable[str] | None = None,
+    tickers: Iterable[str] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Stream cached records for a type and date, one record at a time.
+
+    Args:
+        cache_type: Type of cache
+        cache_date: Date to read
+        keys: Only read these blocks (series tickers for markets)
+        tickers: Only yield records with these tickers
+
+    Yields:
+        Cached records with Decimal fields restored. Nothing if not cached.
+
+    Educational Note:
+        Only the selected blocks are decompressed, and records are decoded
+        lazily, so reading a handful of tickers from a day with tens of
+        thousands of markets touches a few kilobytes of the file.
+    """
+    key_set = set(keys) if keys is not None else None
+    ticker_set = set(tickers) if tickers is not None else None
+    pack_path = get_cache_path(cache_type, cache_date)
+    if not get_index_path(pack_path).exists():
+        legacy = _load_legacy_cache(cache_type, cache_date)
+        for record in legacy or []:
+            if key_set is not None and _block_key(cache_type, record) not in key_set:
+                continue
+            if ticker_set is None or record.get("ticker") in ticker_set:
+                yield record
+        return
+
+    with PackedCache(pack_path) as pack:
+        blocks = pack.blocks()
+        for key in _select_blocks(blocks, key_set, ticker_set):
+            decimal_fields = blocks[key].meta.get("decimal_fields", [])
+            for record in pack.iter_block(key):
+                if ticker_set is None or record.get("ticker") in ticker_set:
+                    yield _restore_decimals(record, decimal_fields)
+
+
 def load_from_cache(
     cache_type: str,
     cache_date: date,
@@ -247,8 +378,26 @@ def load_from_cache(
     Educational Note:
         Returns None (not empty list) when cache doesn't exist,
         so callers can distinguish "no cache" from "empty cache".
+        Use iter_cached_records() to avoid materializing a whole day.
     """
-    cache_path = get_cache_path(cache_type, cache_date)
+    if not is_cached(cache_type, cache_date):
+        return None
+
+    data = list(iter_cached_records(cache_type, cache_date))
+
+    logger.debug(
+        "Loaded %d %s records from cache",
+        len(data),
+        cache_type,
+        extra={"cache_path": str(get_cache_path(cache_type, cache_date))},
+    )
+
+    return data
+
+
+def _load_legacy_cache(cache_type: str, cache_date: date) -> list[dict[str, Any]] | None:
+    """Load a legacy single-document JSON cache file."""
+    cache_path = get_legacy_cache_path(cache_type, cache_date)
 
     if not cache_path.exists():
         return None
@@ -258,14 +407,6 @@ def load_from_cache(
             content = json.load(f, object_hook=decimal_decoder)
 
         data: list[dict[str, Any]] = content.get("data", [])
-
-        logger.debug(
-            "Loaded %d %s records from cache",
-            len(data),
-            cache_type,
-            extra={"cache_path": str(cache_path)},
-        )
-
         return data
 
     except (json.JSONDecodeError, OSError) as e:
@@ -344,6 +485,56 @@ def load_cached_markets(cache_date: date) -> list[dict[str, Any]] | None:
     return load_from_cache("markets", cache_date)
 
 
+def iter_cached_markets(
+    cache_date: date,
+    *,
+    series: str | Iterable[str] | None = None,
+    tickers: Iterable[str] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Stream cached markets for one date (no API call).
+
+    Args:
+        cache_date: Date to read
+        series: Series ticker(s) to read; other series are not decompressed
+        tickers: Only yield these market tickers
+
+    Yields:
+        Market records with Decimal prices
+    """
+    keys = [series] if isinstance(series, str) else series
+    yield from iter_cached_records("markets", cache_date, keys=keys, tickers=tickers)
+
+
+def iter_cached_market_range(
+    start_date: date,
+    end_date: date,
+    *,
+    series: str | Iterable[str] | None = None,
+    tickers: Iterable[str] | None = None,
+) -> Iterator[tuple[date, dict[str, Any]]]:
+    """Stream cached markets across a date range, oldest date first.
+
+    Only one block is decompressed at a time, so memory stays flat no matter
+    how many dates are replayed (e.g. a season into the backtester).
+
+    Args:
+        start_date: First date (inclusive)
+        end_date: Last date (inclusive)
+        series: Series ticker(s) to read
+        tickers: Only yield these market tickers
+
+    Yields:
+        (snapshot date, market record) pairs; uncached dates are skipped
+    """
+    series_keys = [series] if isinstance(series, str) else series
+    series_list = list(series_keys) if series_keys is not None else None
+    ticker_list = list(tickers) if tickers is not None else None
+    for cache_date in list_cached_dates("markets"):
+        if start_date <= cache_date <= end_date:
+            for market in iter_cached_markets(cache_date, series=series_list, tickers=ticker_list):
+                yield cache_date, market
+
+
 # =============================================================================
 # Series Caching
 # =============================================================================
@@ -518,7 +709,7 @@ def _get_type_stats(cache_type: str) -> dict[str, Any]:
     Returns:
         Dictionary with type-specific stats
     """
-    cache_dir = get_cache_path(cache_type, datetime.now(UTC).date()).parent
+    cache_dir = _get_cache_dir(cache_type)
 
     if not cache_dir.exists():
         return {
@@ -528,12 +719,22 @@ def _get_type_stats(cache_type: str) -> dict[str, Any]:
             "date_range": None,
         }
 
-    cache_files = list(cache_dir.glob("*.json"))
     dates: list[date] = []
     total_records = 0
     total_size = 0
 
-    for cache_file in cache_files:
+    # Packs: record counts come from the index
+    for index_file in cache_dir.glob(f"*{PACK_SUFFIX}{INDEX_SUFFIX}"):
+        pack_path = index_file.with_name(index_file.name.removesuffix(INDEX_SUFFIX))
+        try:
+            dates.append(date.fromisoformat(pack_path.name.removesuffix(PACK_SUFFIX)))
+        except ValueError:
+            continue
+        total_records += sum(block.count for block in read_pack_index(pack_path).values())
+        total_size += pack_path.stat().st_size if pack_path.exists() else 0
+
+    # Legacy single-document files
+    for cache_file in cache_dir.glob("*.json"):
         # Parse date from filename (YYYY-MM-DD.json)
         try:
             file_date = datetime.strptime(cache_file.stem, "%Y-%m-%d").date()  # noqa: DTZ007
@@ -553,7 +754,7 @@ def _get_type_stats(cache_type: str) -> dict[str, Any]:
                 pass
 
     return {
-        "cached_dates": len(dates),
+        "cached_dates": len(set(dates)),
         "total_records": total_records,
         "total_size_bytes": total_size,
         "date_range": (min(dates), max(dates)) if dates else None,
@@ -569,16 +770,21 @@ def list_cached_dates(cache_type: str) -> list[date]:
     Returns:
         Sorted list of dates with cached data
     """
-    cache_dir = get_cache_path(cache_type, datetime.now(UTC).date()).parent
+    cache_dir = _get_cache_dir(cache_type)
 
     if not cache_dir.exists():
         return []
 
-    dates: list[date] = []
+    dates: set[date] = set()
+    for index_file in cache_dir.glob(f"*{PACK_SUFFIX}{INDEX_SUFFIX}"):
+        try:
+            dates.add(date.fromisoformat(index_file.name.removesuffix(PACK_SUFFIX + INDEX_SUFFIX)))
+        except ValueError:
+            continue
     for cache_file in cache_dir.glob("*.json"):
         try:
             file_date = datetime.strptime(cache_file.stem, "%Y-%m-%d").date()  # noqa: DTZ007
-            dates.append(file_date)
+            dates.add(file_date)
         except ValueError:
             continue
 
@@ -0,0 +1,411 @@
+"""
+Packed, Indexed Cache Files for Historical Data.
+
+Stores many small cache documents (one ESPN scoreboard per date, one Kalshi
+series per snapshot) in a single append-only file plus a small JSON index,
+instead of one pretty-printed JSON file per document.
+
+File Layout:
+    {name}.pack      Concatenated blocks. Each block is one zlib stream of
+                     JSON Lines (one record per line).
+    {name}.pack.idx  JSON index: block key -> offset, length, record count
+                     and optional metadata, plus file-level metadata.
+                     Rewritten atomically after every write.
+
+Design:
+    - Random access: a block is located through the index and read from a
+      read-only memory map of the pack, so a lookup touches only its bytes
+    - Streaming: iter_block() decompresses the block incrementally and yields
+      one record at a time; a block is never materialized as one document
+    - Crash safety: the index is the source of truth. A block whose bytes were
+      appended but whose index entry was never written (interrupted run) is
+      truncated away on the next write. Callers that persist one block per
+      unit of work can use the index as their resume checkpoint.
+    - Rewriting a key appends a new block and repoints the index; the old
+      bytes stay until the pack is rebuilt
+    - Thread-safe: one lock guards the index, the memory map and appends
+
+Educational Note:
+    Compression uses the standard library's zlib, so reading a cache needs no
+    extra dependency. Each block is compressed independently, which is what
+    makes offset-based random access possible: a single stream over the whole
+    file would have to be decompressed from the start to reach any record.
+
+Related:
+    - historical_games_loader.py: ESPN scoreboard cache (one pack per season)
+    - kalshi_historical_cache.py: Kalshi snapshots (one pack per date, one
+      block per series)
+    - cache_config.py: Cache statistics aggregation
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import os
+import threading
+import zlib
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+PACK_SUFFIX = ".pack"
+INDEX_SUFFIX = ".idx"
+PACK_FORMAT_VERSION = 1
+PACK_CODEC = "zlib"
+
+# Bytes fed to the decompressor per step when streaming a block
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass(frozen=True)
+class PackBlock:
+    """Location and size of one block inside a pack file.
+
+    Attributes:
+        offset: Byte offset of the compressed block in the pack file
+        length: Compressed length in bytes
+        count: Number of records in the block
+        meta: Caller-defined metadata (e.g. fetched_at)
+    """
+
+    offset: int
+    length: int
+    count: int
+    meta: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def end(self) -> int:
+        """Byte offset just past the block."""
+        return self.offset + self.length
+
+
+def get_index_path(pack_path: Path) -> Path:
+    """Return the index file path that belongs to a pack file."""
+    return pack_path.with_name(pack_path.name + INDEX_SUFFIX)
+
+
+def _load_index(pack_path: Path) -> tuple[dict[str, PackBlock], dict[str, Any]]:
+    """Return (blocks, file metadata) from a pack's index; empty if missing or unreadable."""
+    index_path = get_index_path(pack_path)
+    if not index_path.exists():
+        return {}, {}
+    try:
+        with open(index_path, encoding="utf-8") as f:
+            data = json.load(f)
+        blocks = {
+            key: PackBlock(
+                offset=entry["offset"],
+                length=entry["length"],
+                count=entry["count"],
+                meta=entry.get("meta", {}),
+            )
+            for key, entry in data.get("blocks", {}).items()
+        }
+        return blocks, data.get("meta", {})
+    except (OSError, json.JSONDecodeError, KeyError, TypeError, AttributeError) as e:
+        logger.warning("Invalid pack index %s: %s", index_path, e)
+        return {}, {}
+
+
+def read_pack_index(pack_path: Path) -> dict[str, PackBlock]:
+    """Read a pack's index without opening the pack itself.
+
+    Args:
+        pack_path: Path to the .pack file
+
+    Returns:
+        Block key -> PackBlock. Empty if the index is missing or unreadable.
+    """
+    return _load_index(pack_path)[0]
+
+
+def write_pack(
+    pack_path: Path,
+    blocks: Iterable[tuple[str, Iterable[Any], dict[str, Any] | None]],
+    *,
+    meta: dict[str, Any] | None = None,
+    encoder: type[json.JSONEncoder] | None = None,
+    compress_level: int = 6,
+) -> dict[str, PackBlock]:
+    """Write a complete pack, replacing any existing pack at pack_path.
+
+    The new pack is built under a temporary name and moved into place; the
+    old index is removed first, so a crash leaves either the complete new
+    pack or no cache entry at all, never an index pointing into the wrong file.
+
+    Args:
+        pack_path: Path to the .pack file
+        blocks: (key, records, block meta) for each block
+        meta: File-level metadata stored in the index
+        encoder: JSONEncoder subclass used to serialize records
+        compress_level: zlib compression level (1-9)
+
+    Returns:
+        Block key -> PackBlock of the written pack
+    """
+    tmp_path = pack_path.with_name(pack_path.name + ".tmp")
+    for stale in (tmp_path, get_index_path(tmp_path)):
+        stale.unlink(missing_ok=True)
+
+    with PackedCache(tmp_path, encoder=encoder, compress_level=compress_level) as pack:
+        pack.write_blocks(blocks, meta=meta)
+        written = pack.blocks()
+
+    get_index_path(pack_path).unlink(missing_ok=True)
+    tmp_path.replace(pack_path)
+    get_index_path(tmp_path).replace(get_index_path(pack_path))
+    return written
+
+
+class PackedCache:
+    """
+    One pack file of compressed JSON Lines blocks with a key index.
+
+    Usage:
+        >>> with PackedCache(Path("data/historical/espn/nfl/2023.pack")) as pack:
+        ...     pack.write_block("2023-09-07", games, meta={"fetched_at": now})
+        ...     "2023-09-07" in pack
+        ...     for game in pack.iter_block("2023-09-07"):
+        ...         process(game)
+        True
+
+    Not safe for concurrent writers in different processes; within a process
+    all access goes through one lock.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        encoder: type[json.JSONEncoder] | None = None,
+        object_hook: Callable[[dict[str, Any]], Any] | None = None,
+        compress_level: int = 6,
+    ) -> None:
+        """
+        Open (or lazily create) a pack file.
+
+        Args:
+            path: Path to the .pack file. The directory is created on first write.
+            encoder: JSONEncoder subclass used to serialize records
+                (e.g. one that writes Decimal as a string).
+            object_hook: json.loads object_hook used to decode records.
+            compress_level: zlib compression level (1-9).
+        """
+        self.path = path
+        self.index_path = get_index_path(path)
+        self._encoder = encoder
+        self._object_hook = object_hook
+        self._compress_level = compress_level
+        self._blocks, self.meta = _load_index(path)
+        self._lock = threading.Lock()
+        self._file: Any = None
+        self._mmap: mmap.mmap | None = None
+
+    def __enter__(self) -> PackedCache:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._blocks
+
+    def __len__(self) -> int:
+        return len(self._blocks)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self.path)!r}, blocks={len(self._blocks)})"
+
+    def keys(self) -> list[str]:
+        """Return block keys in sorted order."""
+        return sorted(self._blocks)
+
+    def blocks(self) -> dict[str, PackBlock]:
+        """Return a copy of the index (key -> PackBlock)."""
+        with self._lock:
+            return dict(self._blocks)
+
+    def get_block(self, key: str) -> PackBlock | None:
+        """Return the index entry for key, or None if it is not cached."""
+        return self._blocks.get(key)
+
+    def size_bytes(self) -> int:
+        """Return the size of the pack file on disk (0 if not created yet)."""
+        return self.path.stat().st_size if self.path.exists() else 0
+
+    def close(self) -> None:
+        """Release the memory map. The cache can still be used afterwards."""
+        with self._lock:
+            self._close_map()
+
+    # -------------------------------------------------------------------------
+    # Writing
+    # -------------------------------------------------------------------------
+
+    def write_block(
+        self,
+        key: str,
+        records: Iterable[Any],
+        meta: dict[str, Any] | None = None,
+    ) -> PackBlock:
+        """Append records as one compressed block and persist the index.
+
+        Args:
+            key: Block key (e.g. an ISO date or a series ticker)
+            records: JSON-serializable records, one per line
+            meta: Optional metadata stored in the index entry
+
+        Returns:
+            The new PackBlock
+        """
+        return self.write_blocks([(key, records, meta)])[0]
+
+    def write_blocks(
+        self,
+        blocks: Iterable[tuple[str, Iterable[Any], dict[str, Any] | None]],
+        *,
+        meta: dict[str, Any] | None = None,
+    ) -> list[PackBlock]:
+        """Append several blocks and persist the index once.
+
+        Blocks are compressed and written one at a time, so only one block's
+        records are held in memory.
+
+        Args:
+            blocks: (key, records, block meta) for each block
+            meta: File-level metadata to merge into the index
+
+        Returns:
+            The new PackBlocks, in input order
+        """
+        written: list[PackBlock] = []
+        with self._lock:
+            self._close_map()
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            end = max((block.end for block in self._blocks.values()), default=0)
+            with open(self.path, "ab") as f:
+                if f.tell() != end:
+                    # Bytes past the last indexed block belong to a write that
+                    # never reached the index (interrupted run): drop them.
+                    logger.warning(
+                        "Truncating %d unindexed bytes from %s", f.tell() - end, self.path
+                    )
+                    f.truncate(end)
+                    f.seek(end)
+                for key, records, block_meta in blocks:
+                    payload, count = self._compress(records)
+                    f.write(payload)
+                    block = PackBlock(end, len(payload), count, block_meta or {})
+                    self._blocks[key] = block
+                    written.append(block)
+                    end = block.end
+                f.flush()
+                os.fsync(f.fileno())
+            if meta:
+                self.meta.update(meta)
+            self._write_index()
+        return written
+
+    def _compress(self, records: Iterable[Any]) -> tuple[bytes, int]:
+        """Serialize records as JSON Lines into one zlib stream; return (bytes, count)."""
+        compressor = zlib.compressobj(self._compress_level)
+        chunks: list[bytes] = []
+        count = 0
+        for record in records:
+            line = json.dumps(record, cls=self._encoder, separators=(",", ":"), default=str)
+            chunks.append(compressor.compress(line.encode("utf-8") + b"\n"))
+            count += 1
+        chunks.append(compressor.flush())
+        return b"".join(chunks), count
+
+    def _write_index(self) -> None:
+        """Atomically replace the index file (caller holds the lock)."""
+        data = {
+            "format": PACK_FORMAT_VERSION,
+            "codec": PACK_CODEC,
+            "meta": self.meta,
+            "blocks": {
+                key: {
+                    "offset": block.offset,
+                    "length": block.length,
+                    "count": block.count,
+                    "meta": block.meta,
+                }
+                for key, block in sorted(self._blocks.items())
+            },
+        }
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"), default=str)
+        tmp_path.replace(self.index_path)
+
+    # -------------------------------------------------------------------------
+    # Reading
+    # -------------------------------------------------------------------------
+
+    def _open_map(self) -> mmap.mmap:
+        """Return the read-only memory map of the pack (caller holds the lock)."""
+        if self._mmap is None:
+            self._file = open(self.path, "rb")  # noqa: SIM115 - closed in _close_map
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def _close_map(self) -> None:
+        """Close the memory map and its file (caller holds the lock)."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _read_compressed(self, block: PackBlock) -> Iterator[bytes]:
+        """Yield the compressed bytes of a block in chunks.
+
+        Each chunk is copied out of the map under the lock and yielded after
+        releasing it, so a caller may use the cache (another iter_block(),
+        blocks(), write_block()) between records.
+        """
+        for start in range(block.offset, block.end, _STREAM_CHUNK_SIZE):
+            stop = min(start + _STREAM_CHUNK_SIZE, block.end)
+            with self._lock:
+                chunk = self._open_map()[start:stop]
+            yield chunk
+
+    def iter_block(self, key: str) -> Iterator[Any]:
+        """Yield the records of a block one at a time.
+
+        Args:
+            key: Block key
+
+        Raises:
+            KeyError: If key is not in the index
+        """
+        block = self._blocks[key]
+        if block.length == 0:
+            return
+        decompressor = zlib.decompressobj()
+        pending = b""
+        for chunk in self._read_compressed(block):
+            pending += decompressor.decompress(chunk)
+            *lines, pending = pending.split(b"\n")
+            for line in lines:
+                yield json.loads(line, object_hook=self._object_hook)
+        pending += decompressor.flush()
+        if pending.strip():
+            yield json.loads(pending, object_hook=self._object_hook)
+
+    def read_block(self, key: str) -> list[Any]:
+        """Return all records of a block.
+
+        Raises:
+            KeyError: If key is not in the index
+        """
+        return list(self.iter_block(key))
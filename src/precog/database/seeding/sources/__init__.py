@@ -9,6 +9,7 @@ Architecture:
     - fivethirtyeight.py: FiveThirtyEight Elo + game data
     - betting_csv.py: Betting/odds CSV files
     - nfl_data_py_source.py: NFL player/team stats via nfl_data_py library
+    - columnar.py: Column-wise DataFrame normalization shared by library adapters
 
 Record Types:
     - GameRecord: Historical game results
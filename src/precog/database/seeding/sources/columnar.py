@@ -0,0 +1,314 @@
+"""
+Columnar Normalization for DataFrame-Backed Sources.
+
+The library adapters (nfl_data_py, nflreadpy, pybaseball) receive whole
+seasons as DataFrames. Walking those frames with iterrows() and normalizing
+each cell in Python dominated seeding time on full retrosheet and
+play-by-play loads. This module normalizes a frame column by column and
+only drops to Python at the very end, when rows are emitted.
+
+Design:
+    - Team codes and other repetitive values are normalized once per unique
+      value and mapped back onto the column
+    - Dates are parsed with pd.to_datetime(format=..., errors="coerce"),
+      trying each accepted format in turn on the rows still unparsed
+    - Decimals are quantized once per unique value (ADR-002 precision rules)
+    - Missing values (None, NaN, NaT, pd.NA) become "" for text columns and
+      None for optional fields, never the strings "None"/"nan"
+    - iter_records() emits one dict per row, so adapters keep the
+      BaseDataSource Iterator[...Record] contract
+
+Usage:
+    >>> frame = normalize_nfl_schedules(schedules, normalize_team=..., source="nflreadpy")
+    >>> records = iter_records(frame, GAME_RECORD_FIELDS)  # GameRecord dicts
+
+Related:
+    - ADR-106: Historical Data Collection Architecture
+    - ADR-002: Decimal precision for statistical values
+    - base_source.py: GameRecord / StatsRecord definitions
+"""
+
+from __future__ import annotations
+
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+from precog.database.seeding.sources.base_source import GameRecord
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+
+# Field order of GameRecord (columns of a normalized game frame)
+GAME_RECORD_FIELDS: tuple[str, ...] = tuple(GameRecord.__annotations__)
+
+ISO_DATE_FORMATS: tuple[str, ...] = ("%Y-%m-%d",)
+
+# nflverse game_type codes -> our game_type values ("" and unknown handled separately)
+NFL_GAME_TYPES: dict[str, str] = {
+    "REG": "regular",
+    "WC": "wildcard",
+    "DIV": "divisional",
+    "CON": "conference",
+    "SB": "superbowl",
+}
+
+_INTEGER_TEXT = r"^\s*[+-]?\d+\s*$"
+
+
+# =============================================================================
+# Column Helpers
+# =============================================================================
+
+
+def column(frame: pd.DataFrame, name: str, default: Any = None) -> pd.Series:
+    """Return frame[name], or a column filled with default if it is absent."""
+    if name in frame.columns:
+        return frame[name]
+    return pd.Series(default, index=frame.index, dtype=object)
+
+
+def from_polars(frame: Any) -> pd.DataFrame:
+    """Convert a Polars DataFrame to pandas column by column.
+
+    Goes through to_dict(as_series=False) rather than to_pandas(), which
+    would require pyarrow, or to_dicts(), which builds one dict per row.
+    """
+    return pd.DataFrame(frame.to_dict(as_series=False))
+
+
+def as_text(values: pd.Series) -> pd.Series:
+    """Convert a column to str, with missing values as "".
+
+    Equivalent to str(value) per cell, except that None/NaN/NaT become ""
+    instead of "None"/"nan"/"NaT".
+    """
+    present = values.notna()
+    return values.astype(object).where(present, "").astype(str)
+
+
+def optional_text(values: pd.Series) -> pd.Series:
+    """Convert a column to str, with missing and empty values as None."""
+    text = as_text(values)
+    return text.astype(object).where(text != "", None)
+
+
+def map_unique(values: pd.Series, func: Callable[[Any], Any]) -> pd.Series:
+    """Apply func once per distinct value and map the results back.
+
+    Args:
+        values: Column to transform; missing cells map to None
+        func: Per-value transform (e.g. a team code normalizer)
+
+    Returns:
+        Object column of func(value), aligned with values
+    """
+    codes, uniques = pd.factorize(values)
+    results = np.empty(len(uniques) + 1, dtype=object)
+    results[:-1] = [func(value) for value in uniques]
+    results[-1] = None  # factorize marks missing cells with code -1
+    return pd.Series(results[codes], index=values.index, dtype=object)
+
+
+def normalize_codes(values: pd.Series, normalize: Callable[[str], str]) -> pd.Series:
+    """Normalize a team code column, calling normalize once per distinct code."""
+    return map_unique(as_text(values), normalize)
+
+
+def parse_dates(
+    values: pd.Series,
+    formats: Sequence[str] = ISO_DATE_FORMATS,
+) -> pd.Series:
+    """Parse a column to datetime64, trying each strptime format in turn.
+
+    datetime/Timestamp values pass through unchanged; strings must match one
+    of formats exactly. Anything else becomes NaT.
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+
+    parsed = pd.Series(pd.NaT, index=values.index, dtype="datetime64[us]")
+    pending = values.notna()
+    for fmt in formats:
+        if not pending.any():
+            break
+        attempt = pd.to_datetime(values[pending], format=fmt, errors="coerce")
+        parsed = parsed.fillna(attempt)
+        pending &= parsed.isna()
+    return parsed
+
+
+def to_dates(parsed: pd.Series) -> pd.Series:
+    """Convert a parse_dates() column to datetime.date objects (None for NaT)."""
+    return parsed.dt.date.astype(object).where(parsed.notna(), None)
+
+
+def to_int(values: pd.Series) -> pd.Series:
+    """Coerce a column to float, truncating toward zero; non-numeric cells become NaN.
+
+    Callers mask NaN rows before casting the result with astype("int64").
+    """
+    return np.trunc(pd.to_numeric(values, errors="coerce").astype("float64"))
+
+
+def optional_int(values: pd.Series) -> pd.Series:
+    """Coerce a column to Python ints, with missing/non-numeric cells as None."""
+    numbers = to_int(values)
+    present = numbers.notna()
+    return numbers.fillna(0).astype("int64").astype(object).where(present, None)
+
+
+def is_integer_text(text: pd.Series) -> pd.Series:
+    """True where a str column holds an integer literal (what int(str) accepts)."""
+    return text.str.match(_INTEGER_TEXT)
+
+
+def _quantize(text: str, quantum: Decimal) -> Decimal | None:
+    try:
+        return Decimal(text).quantize(quantum, rounding=ROUND_HALF_UP)
+    except (InvalidOperation, ValueError):
+        return None
+
+
+def quantize_decimals(values: pd.Series, precision: str = "0.0001") -> pd.Series:
+    """Convert a column to Decimal quantized to precision (ROUND_HALF_UP).
+
+    Matches Decimal(str(value)).quantize(...) per cell: numeric columns are
+    rendered with their shortest repr, so 0.1 becomes Decimal("0.1000"),
+    not the binary expansion. Missing and non-numeric cells become None.
+    """
+    quantum = Decimal(precision)
+    return map_unique(as_text(values), lambda text: _quantize(text, quantum))
+
+
+def sparse_rows(frame: pd.DataFrame, fields: Sequence[str]) -> list[dict[str, Any]]:
+    """Per row, the fields that are present and non-zero, as Python values.
+
+    Zero is skipped only for numeric cells (so the string "0" is kept).
+    Fields missing from the frame are ignored. Field order follows fields.
+
+    Returns:
+        One dict per frame row (possibly empty), in frame order
+    """
+    cols = [field for field in fields if field in frame.columns]
+    if not cols:
+        return [{} for _ in range(len(frame))]
+
+    sub = frame[cols]
+    keep = sub.notna()
+    for col in cols:
+        if pd.api.types.is_numeric_dtype(sub[col]):
+            keep[col] &= sub[col] != 0
+        else:
+            keep[col] &= ~sub[col].map(
+                lambda v: isinstance(v, (int, float, np.number)) and v == 0
+            ).astype(bool)
+
+    values = sub.astype(object).to_numpy().tolist()
+    flags = keep.to_numpy().tolist()
+    return [
+        {col: value for col, value, ok in zip(cols, row, row_ok, strict=True) if ok}
+        for row, row_ok in zip(values, flags, strict=True)
+    ]
+
+
+# =============================================================================
+# Row Emission
+# =============================================================================
+
+
+def iter_records(frame: pd.DataFrame, fields: Sequence[str]) -> Iterator[dict[str, Any]]:
+    """Yield one dict per row keyed by fields (e.g. GameRecord-shaped dicts).
+
+    Values are Python objects: numpy scalars are converted by Series.tolist().
+    """
+    columns = [frame[field].tolist() for field in fields]
+    for row in zip(*columns, strict=True):
+        yield dict(zip(fields, row, strict=True))
+
+
+def record_frame(fields: Sequence[str], index: pd.Index, **columns: Any) -> pd.DataFrame:
+    """Assemble a frame with exactly fields as columns; scalar values are broadcast.
+
+    Raises:
+        ValueError: If a field has no column
+    """
+    missing = set(fields) - set(columns)
+    if missing:
+        raise ValueError(f"Missing record columns: {sorted(missing)}")
+    frame = pd.DataFrame(index=index)
+    for field in fields:
+        value = columns[field]
+        if isinstance(value, pd.Series):
+            frame[field] = value
+        else:
+            frame[field] = pd.Series([value] * len(index), index=index, dtype=object)
+    return frame
+
+
+# =============================================================================
+# Sport-Specific Normalization
+# =============================================================================
+
+
+def normalize_nfl_schedules(
+    schedules: pd.DataFrame,
+    *,
+    normalize_team: Callable[[str], str],
+    source: str,
+) -> pd.DataFrame:
+    """Normalize an nflverse schedules frame into GameRecord columns.
+
+    Shared by the nfl_data_py and nflreadpy adapters. Keeps completed games
+    only: rows missing a score, a parseable gameday or either team are
+    dropped.
+
+    Args:
+        schedules: Schedules as returned by import_schedules()/load_schedules()
+        normalize_team: Adapter-specific team code normalizer
+        source: Value for the source column
+
+    Returns:
+        Frame with GAME_RECORD_FIELDS columns, one row per completed game
+    """
+    home_score = to_int(column(schedules, "home_score"))
+    away_score = to_int(column(schedules, "away_score"))
+    game_dates = parse_dates(column(schedules, "gameday"))
+    home_team = normalize_codes(column(schedules, "home_team"), normalize_team)
+    away_team = normalize_codes(column(schedules, "away_team"), normalize_team)
+
+    keep = (
+        home_score.notna()
+        & away_score.notna()
+        & game_dates.notna()
+        & (home_team != "")
+        & (away_team != "")
+    )
+    games = schedules[keep]
+    index = games.index
+
+    game_type_raw = as_text(column(games, "game_type")).str.upper()
+    game_type = game_type_raw.map(NFL_GAME_TYPES).astype(object)
+    game_type = game_type.where(game_type.notna() | (game_type_raw == ""), "playoff")
+    game_type = game_type.where(game_type.notna(), None)
+
+    return record_frame(
+        GAME_RECORD_FIELDS,
+        index,
+        sport="nfl",
+        season=to_int(column(games, "season", 0)).fillna(0).astype("int64"),
+        game_date=to_dates(game_dates[keep]),
+        home_team_code=home_team[keep],
+        away_team_code=away_team[keep],
+        home_score=home_score[keep].astype("int64"),
+        away_score=away_score[keep].astype("int64"),
+        is_neutral_site=as_text(column(games, "location")).str.upper() == "NEUTRAL",
+        is_playoff=~game_type_raw.isin(["REG", ""]),
+        game_type=game_type,
+        venue_name=optional_text(column(games, "stadium")),
+        source=source,
+        source_file=None,
+        external_game_id=optional_text(column(games, "game_id")),
+    )
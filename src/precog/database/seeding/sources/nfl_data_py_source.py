@@ -31,28 +31,44 @@ Related:
     - Migration 0009: historical_stats and historical_rankings tables
 
 Educational Note:
-    nfl_data_py uses pandas DataFrames internally, which we convert to
-    Iterator[StatsRecord] for memory-efficient processing. This allows
-    loading seasons one at a time rather than loading entire datasets
-    into memory. The JSONB stats field enables storing different stat
+    nfl_data_py uses pandas DataFrames internally, which we normalize
+    column-wise (see columnar.py) and emit as Iterator[StatsRecord]. This
+    allows loading seasons one at a time rather than loading entire
+    datasets into memory. The JSONB stats field enables storing different stat
     schemas (passing vs rushing vs receiving) without schema changes.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 from precog.database.seeding.sources.base_source import (
     BaseDataSource,
     DataSourceConfigError,
+    GameRecord,
     StatsRecord,
 )
+from precog.database.seeding.sources.columnar import (
+    GAME_RECORD_FIELDS,
+    as_text,
+    column,
+    iter_records,
+    optional_int,
+    optional_text,
+    parse_dates,
+    record_frame,
+    sparse_rows,
+    to_dates,
+    to_int,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
     from pathlib import Path
 
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 
@@ -270,42 +286,13 @@ class NFLDataPySource(BaseDataSource):
 
         self._logger.info("Processing %d weekly stat rows", len(df))
 
-        for _, row in df.iterrows():
-            # Filter postseason if requested
-            week = int(row.get("week", 0))
-            if not include_postseason and week > 17:
-                continue
-
-            player_id = str(row.get("player_id", "")) or None
-            player_name = str(row.get("player_name", "")) or None
-            team_code = str(row.get("recent_team", "")) or None
-            season = int(row.get("season", 0))
+        weeks = to_int(column(df, "week", 0)).fillna(0).astype("int64")
+        # Filter postseason if requested
+        if not include_postseason:
+            df = df[weeks <= 17]
+            weeks = weeks[weeks <= 17]
 
-            # Skip rows without player info
-            if not player_id and not player_name:
-                continue
-
-            # Extract stats by category and yield separate records
-            # This allows querying by stat category
-            for category, stat_fields in [
-                ("passing", self.PASSING_STATS),
-                ("rushing", self.RUSHING_STATS),
-                ("receiving", self.RECEIVING_STATS),
-            ]:
-                stats = self._extract_stats(row, stat_fields)
-                if stats:  # Only yield if player has stats in this category
-                    yield StatsRecord(
-                        sport="nfl",
-                        season=season,
-                        week=week,
-                        team_code=team_code,
-                        player_id=player_id,
-                        player_name=player_name,
-                        stat_category=category,
-                        stats=stats,
-                        source=self.source_name,
-                        source_file=None,
-                    )
+        yield from self._iter_player_stats(df, weeks)
 
     def _load_seasonal_stats(
         self,
@@ -333,30 +320,63 @@ class NFLDataPySource(BaseDataSource):
 
         self._logger.info("Processing %d seasonal stat rows", len(df))
 
-        for _, row in df.iterrows():
-            player_id = str(row.get("player_id", "")) or None
-            player_name = str(row.get("player_name", "")) or None
-            team_code = str(row.get("recent_team", "")) or None
-            season = int(row.get("season", 0))
+        # Seasonal stats don't have week
+        yield from self._iter_player_stats(df, None)
 
-            if not player_id and not player_name:
-                continue
+    def _iter_player_stats(
+        self,
+        df: pd.DataFrame,
+        weeks: pd.Series | None,
+    ) -> Iterator[StatsRecord]:
+        """Emit per-category StatsRecords from a player stats frame.
+
+        Identity columns and the stat dicts are built column-wise; only the
+        final records are assembled per row. Rows without a player ID or
+        name are skipped, and a category is emitted only if the player has
+        at least one non-null, non-zero stat in it.
+
+        Args:
+            df: Weekly or seasonal player stats DataFrame
+            weeks: Week per row, or None for seasonal stats
 
-            # Extract stats by category
-            for category, stat_fields in [
-                ("passing", self.PASSING_STATS),
-                ("rushing", self.RUSHING_STATS),
-                ("receiving", self.RECEIVING_STATS),
-            ]:
-                stats = self._extract_stats(row, stat_fields)
-                if stats:
+        Yields:
+            StatsRecord per player row and stat category, in frame order
+        """
+        player_id = optional_text(column(df, "player_id"))
+        player_name = optional_text(column(df, "player_name"))
+
+        # Skip rows without player info
+        has_player = player_id.notna() | player_name.notna()
+        df = df[has_player]
+        week_values = weeks[has_player].tolist() if weeks is not None else [None] * len(df)
+
+        # Extract stats by category so records can be queried per category
+        categories = [
+            ("passing", sparse_rows(df, self.PASSING_STATS)),
+            ("rushing", sparse_rows(df, self.RUSHING_STATS)),
+            ("receiving", sparse_rows(df, self.RECEIVING_STATS)),
+        ]
+
+        rows = zip(
+            to_int(column(df, "season", 0)).fillna(0).astype("int64").tolist(),
+            week_values,
+            optional_text(column(df, "recent_team")).tolist(),
+            player_id[has_player].tolist(),
+            player_name[has_player].tolist(),
+            range(len(df)),
+            strict=True,
+        )
+        for season, week, team_code, pid, name, position in rows:
+            for category, stats_by_row in categories:
+                stats = stats_by_row[position]
+                if stats:  # Only yield if player has stats in this category
                     yield StatsRecord(
                         sport="nfl",
                         season=season,
-                        week=None,  # Seasonal stats don't have week
+                        week=week,
                         team_code=team_code,
-                        player_id=player_id,
-                        player_name=player_name,
+                        player_id=pid,
+                        player_name=name,
                         stat_category=category,
                         stats=stats,
                         source=self.source_name,
@@ -480,41 +500,6 @@ class NFLDataPySource(BaseDataSource):
                     source_file=None,
                 )
 
-    def _extract_stats(self, row: Any, stat_fields: list[str]) -> dict[str, Any]:
-        """Extract stat fields from a DataFrame row.
-
-        Only includes fields that have non-null, non-zero values.
-
-        Args:
-            row: pandas DataFrame row
-            stat_fields: List of field names to extract
-
-        Returns:
-            Dictionary of stat name to value (only non-empty stats)
-        """
-        stats: dict[str, Any] = {}
-        for field in stat_fields:
-            value = row.get(field)
-            # Skip null/empty values
-            if value is None:
-                continue
-            # Handle pandas NA
-            try:
-                import pandas as pd
-
-                if pd.isna(value):
-                    continue
-            except (ImportError, TypeError):
-                pass
-            # Skip zero values for cleaner data
-            if isinstance(value, (int, float)) and value == 0:
-                continue
-            # Convert numpy types to Python types
-            if hasattr(value, "item"):
-                value = value.item()
-            stats[field] = value
-        return stats
-
     # -------------------------------------------------------------------------
     # Capability Overrides
     # -------------------------------------------------------------------------
@@ -548,7 +533,7 @@ class NFLDataPySource(BaseDataSource):
         sport: str = "nfl",
         seasons: list[int] | None = None,
         **_kwargs: Any,
-    ) -> Iterator[Any]:
+    ) -> Iterator[GameRecord]:
         """Load NFL game schedules/results.
 
         Args:
@@ -563,8 +548,6 @@ class NFLDataPySource(BaseDataSource):
             This is a basic implementation. For full GameRecord support,
             consider using the schedule data more comprehensively.
         """
-        from precog.database.seeding.sources.base_source import GameRecord
-
         self._validate_sport(sport)
 
         if seasons is None:
@@ -581,32 +564,26 @@ class NFLDataPySource(BaseDataSource):
         if df is None or df.empty:
             return
 
-        for _, row in df.iterrows():
-            game_date_str = row.get("gameday")
-            if game_date_str is None:
-                continue
-
-            from datetime import date
-
-            try:
-                # date.fromisoformat is cleaner for YYYY-MM-DD format
-                game_date = date.fromisoformat(str(game_date_str))
-            except ValueError:
-                continue
-
-            yield GameRecord(
-                sport="nfl",
-                season=int(row.get("season", 0)),
-                game_date=game_date,
-                home_team_code=str(row.get("home_team", "")),
-                away_team_code=str(row.get("away_team", "")),
-                home_score=int(row["home_score"]) if row.get("home_score") is not None else None,
-                away_score=int(row["away_score"]) if row.get("away_score") is not None else None,
-                is_neutral_site=False,
-                is_playoff=str(row.get("game_type", "")).lower() in ("post", "playoff"),
-                game_type=str(row.get("game_type", "REG")),
-                venue_name=str(row.get("stadium", "")) or None,
-                source=self.source_name,
-                source_file=None,
-                external_game_id=str(row.get("game_id", "")) or None,
-            )
+        game_dates = parse_dates(column(df, "gameday"))
+        games = df[game_dates.notna()]
+        game_type = as_text(column(games, "game_type", "REG"))
+
+        records = record_frame(
+            GAME_RECORD_FIELDS,
+            games.index,
+            sport="nfl",
+            season=to_int(column(games, "season", 0)).fillna(0).astype("int64"),
+            game_date=to_dates(game_dates[games.index]),
+            home_team_code=as_text(column(games, "home_team")),
+            away_team_code=as_text(column(games, "away_team")),
+            home_score=optional_int(column(games, "home_score")),
+            away_score=optional_int(column(games, "away_score")),
+            is_neutral_site=False,
+            is_playoff=game_type.str.lower().isin(["post", "playoff"]),
+            game_type=game_type,
+            venue_name=optional_text(column(games, "stadium")),
+            source=self.source_name,
+            source_file=None,
+            external_game_id=optional_text(column(games, "game_id")),
+        )
+        yield from cast("Iterator[GameRecord]", iter_records(records, GAME_RECORD_FIELDS))
@@ -27,7 +27,7 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 from precog.database.seeding.sources.base_source import (
     APIBasedSourceMixin,
@@ -36,6 +36,11 @@ from precog.database.seeding.sources.base_source import (
     DataSourceError,
     GameRecord,
 )
+from precog.database.seeding.sources.columnar import (
+    GAME_RECORD_FIELDS,
+    iter_records,
+    normalize_nfl_schedules,
+)
 from precog.database.seeding.team_history import resolve_team_code
 
 if TYPE_CHECKING:
@@ -156,7 +161,8 @@ class NFLDataPySource(APIBasedSourceMixin, BaseDataSource):
         """Load NFL game schedules and results.
 
         Uses nfl_data_py.import_schedules() to fetch game data.
-        Returns completed games with final scores.
+        Returns completed games with final scores. The schedule frame is
+        normalized column-wise (see columnar.normalize_nfl_schedules).
 
         Args:
             sport: Must be "nfl"
@@ -195,81 +201,12 @@ class NFLDataPySource(APIBasedSourceMixin, BaseDataSource):
             self._logger.warning("No schedule data returned")
             return
 
-        for _, row in schedules.iterrows():
-            # Skip games without scores (not yet played)
-            home_score = row.get("home_score")
-            away_score = row.get("away_score")
-
-            if home_score is None or away_score is None:
-                continue
-
-            # Parse date
-            game_date_val = row.get("gameday")
-            if game_date_val is None:
-                continue
-
-            # Convert to date object
-            if hasattr(game_date_val, "date"):
-                game_date = game_date_val.date()
-            elif isinstance(game_date_val, str):
-                try:
-                    game_date = datetime.strptime(game_date_val, "%Y-%m-%d").date()  # noqa: DTZ007
-                except ValueError:
-                    continue
-            else:
-                continue
-
-            # Get team codes
-            home_team = normalize_nfl_team_code(str(row.get("home_team", "")))
-            away_team = normalize_nfl_team_code(str(row.get("away_team", "")))
-
-            if not home_team or not away_team:
-                continue
-
-            # Parse season
-            season = int(row.get("season", 0))
-
-            # Determine game type
-            game_type_raw = str(row.get("game_type", "")).upper()
-            is_playoff = game_type_raw not in ("REG", "")
-
-            game_type: str | None = None
-            if game_type_raw == "REG":
-                game_type = "regular"
-            elif game_type_raw == "WC":
-                game_type = "wildcard"
-            elif game_type_raw == "DIV":
-                game_type = "divisional"
-            elif game_type_raw == "CON":
-                game_type = "conference"
-            elif game_type_raw == "SB":
-                game_type = "superbowl"
-            elif game_type_raw:
-                game_type = "playoff"
-
-            # Check for neutral site
-            location = str(row.get("location", ""))
-            is_neutral_site = location.upper() == "NEUTRAL"
-
-            # External game ID
-            external_id = str(row.get("game_id", "")) or None
-
-            yield GameRecord(
-                sport="nfl",
-                season=season,
-                game_date=game_date,
-                home_team_code=home_team,
-                away_team_code=away_team,
-                home_score=int(home_score),
-                away_score=int(away_score),
-                is_neutral_site=is_neutral_site,
-                is_playoff=is_playoff,
-                game_type=game_type,
-                venue_name=str(row.get("stadium", "")) or None,
-                source=self.source_name,
-                source_file=None,
-                external_game_id=external_id,
-            )
+        games = normalize_nfl_schedules(
+            schedules,
+            normalize_team=normalize_nfl_team_code,
+            source=self.source_name,
+        )
+        yield from cast("Iterator[GameRecord]", iter_records(games, GAME_RECORD_FIELDS))
 
     # -------------------------------------------------------------------------
     # Capability Overrides
@@ -42,7 +42,9 @@ from __future__ import annotations
 import logging
 from datetime import datetime
 from decimal import ROUND_HALF_UP, Decimal
-from typing import TYPE_CHECKING, Any, ClassVar, TypedDict
+from typing import TYPE_CHECKING, Any, ClassVar, TypedDict, cast
+
+import pandas as pd
 
 from precog.database.seeding.sources.base_source import (
     APIBasedSourceMixin,
@@ -51,6 +53,19 @@ from precog.database.seeding.sources.base_source import (
     DataSourceError,
     GameRecord,
 )
+from precog.database.seeding.sources.columnar import (
+    GAME_RECORD_FIELDS,
+    as_text,
+    column,
+    from_polars,
+    iter_records,
+    normalize_codes,
+    normalize_nfl_schedules,
+    optional_int,
+    quantize_decimals,
+    record_frame,
+    to_int,
+)
 from precog.database.seeding.team_history import resolve_team_code
 
 if TYPE_CHECKING:
@@ -92,6 +107,20 @@ class EPARecord(TypedDict):
     source: str
 
 
+# Field order of EPARecord (tuple layout for execute_values)
+EPA_RECORD_FIELDS: tuple[str, ...] = tuple(EPARecord.__annotations__)
+
+# Per-play EPA averages quantized to 4 decimal places
+EPA_VALUE_FIELDS: tuple[str, ...] = (
+    "off_epa_per_play",
+    "pass_epa_per_play",
+    "rush_epa_per_play",
+    "def_epa_per_play",
+    "def_pass_epa_per_play",
+    "def_rush_epa_per_play",
+)
+
+
 # =============================================================================
 # Team Code Mapping
 # =============================================================================
@@ -282,92 +311,21 @@ class NFLReadPySource(APIBasedSourceMixin, BaseDataSource):
 
         try:
             nfl = self._get_nfl_module()
-            # nflreadpy returns Polars DataFrame
-            schedules_pl = nfl.load_schedules(seasons)
-            # Convert to list of dicts for iteration
-            schedules = schedules_pl.to_dicts()
+            # nflreadpy returns Polars DataFrame; normalize it column-wise in pandas
+            schedules = from_polars(nfl.load_schedules(seasons))
         except Exception as e:
             raise DataSourceConnectionError(f"Failed to fetch NFL schedules: {e}") from e
 
-        if not schedules:
+        if schedules.empty:
             self._logger.warning("No schedule data returned")
             return
 
-        for row in schedules:
-            # Skip games without scores (not yet played)
-            home_score = row.get("home_score")
-            away_score = row.get("away_score")
-
-            if home_score is None or away_score is None:
-                continue
-
-            # Parse date
-            game_date_val = row.get("gameday")
-            if game_date_val is None:
-                continue
-
-            # Convert to date object
-            if hasattr(game_date_val, "date"):
-                game_date = game_date_val.date()
-            elif isinstance(game_date_val, str):
-                try:
-                    game_date = datetime.strptime(game_date_val, "%Y-%m-%d").date()  # noqa: DTZ007
-                except ValueError:
-                    continue
-            else:
-                continue
-
-            # Get team codes
-            home_team = normalize_nflreadpy_team_code(str(row.get("home_team", "")))
-            away_team = normalize_nflreadpy_team_code(str(row.get("away_team", "")))
-
-            if not home_team or not away_team:
-                continue
-
-            # Parse season
-            season = int(row.get("season", 0))
-
-            # Determine game type
-            game_type_raw = str(row.get("game_type", "")).upper()
-            is_playoff = game_type_raw not in ("REG", "")
-
-            game_type: str | None = None
-            if game_type_raw == "REG":
-                game_type = "regular"
-            elif game_type_raw == "WC":
-                game_type = "wildcard"
-            elif game_type_raw == "DIV":
-                game_type = "divisional"
-            elif game_type_raw == "CON":
-                game_type = "conference"
-            elif game_type_raw == "SB":
-                game_type = "superbowl"
-            elif game_type_raw:
-                game_type = "playoff"
-
-            # Check for neutral site
-            location = str(row.get("location", ""))
-            is_neutral_site = location.upper() == "NEUTRAL"
-
-            # External game ID
-            external_id = str(row.get("game_id", "")) or None
-
-            yield GameRecord(
-                sport="nfl",
-                season=season,
-                game_date=game_date,
-                home_team_code=home_team,
-                away_team_code=away_team,
-                home_score=int(home_score),
-                away_score=int(away_score),
-                is_neutral_site=is_neutral_site,
-                is_playoff=is_playoff,
-                game_type=game_type,
-                venue_name=str(row.get("stadium", "")) or None,
-                source=self.source_name,
-                source_file=None,
-                external_game_id=external_id,
-            )
+        games = normalize_nfl_schedules(
+            schedules,
+            normalize_team=normalize_nflreadpy_team_code,
+            source=self.source_name,
+        )
+        yield from cast("Iterator[GameRecord]", iter_records(games, GAME_RECORD_FIELDS))
 
     # -------------------------------------------------------------------------
     # EPA Data Loading
@@ -473,46 +431,44 @@ class NFLReadPySource(APIBasedSourceMixin, BaseDataSource):
                 how="outer",
             )
 
-            # Convert to dicts for iteration
-            records = combined.to_dicts()
+            epa = from_polars(combined)
 
         except Exception as e:
             self._logger.error("Failed to aggregate EPA: %s", e)
             raise DataSourceConnectionError(f"EPA aggregation failed: {e}") from e
 
-        for row in records:
-            team_code = row.get("posteam") or row.get("defteam")
-            if not team_code:
-                continue
-
-            team_code = normalize_nflreadpy_team_code(str(team_code))
-            week_num = row.get("week")
-
-            # Calculate EPA differential
-            off_epa_val = _to_decimal(row.get("off_epa_per_play"))
-            def_epa_val = _to_decimal(row.get("def_epa_per_play"))
-
-            epa_diff: Decimal | None = None
-            if off_epa_val is not None and def_epa_val is not None:
-                # Offensive - Defensive (lower defensive is better)
-                epa_diff = off_epa_val - def_epa_val
-
-            yield EPARecord(
-                team_id=None,  # Resolved later during database insert
-                team_name="",  # Resolved later
-                team_code=team_code,
-                season=season,
-                week=int(week_num) if week_num is not None else None,
-                off_epa_per_play=off_epa_val,
-                pass_epa_per_play=_to_decimal(row.get("pass_epa_per_play")),
-                rush_epa_per_play=_to_decimal(row.get("rush_epa_per_play")),
-                def_epa_per_play=def_epa_val,
-                def_pass_epa_per_play=_to_decimal(row.get("def_pass_epa_per_play")),
-                def_rush_epa_per_play=_to_decimal(row.get("def_rush_epa_per_play")),
-                epa_differential=epa_diff,
-                games_played=int(row.get("games_played", 1)),
-                source=self.source_name,
-            )
+        # Team is the offense, or the defense for defense-only rows of the outer join
+        team_raw = column(epa, "posteam")
+        team_raw = team_raw.where(as_text(team_raw) != "", column(epa, "defteam"))
+        present = as_text(team_raw) != ""
+        epa = epa[present]
+
+        values = {field: quantize_decimals(column(epa, field)) for field in EPA_VALUE_FIELDS}
+        off_values = values["off_epa_per_play"].tolist()
+        def_values = values["def_epa_per_play"].tolist()
+
+        records = record_frame(
+            EPA_RECORD_FIELDS,
+            epa.index,
+            team_id=None,  # Resolved later during database insert
+            team_name="",  # Resolved later
+            team_code=normalize_codes(team_raw[present], normalize_nflreadpy_team_code),
+            season=season,
+            week=optional_int(column(epa, "week")),
+            **values,
+            # Offensive - Defensive (lower defensive is better)
+            epa_differential=pd.Series(
+                [
+                    off - dfn if off is not None and dfn is not None else None
+                    for off, dfn in zip(off_values, def_values, strict=True)
+                ],
+                index=epa.index,
+                dtype=object,
+            ),
+            games_played=to_int(column(epa, "games_played", 1)).fillna(1).astype("int64"),
+            source=self.source_name,
+        )
+        yield from cast("Iterator[EPARecord]", iter_records(records, EPA_RECORD_FIELDS))
 
     def load_season_epa(self, season: int) -> Iterator[EPARecord]:
         """Load season-level EPA aggregates for all teams.
@@ -37,7 +37,9 @@ import logging
 import time
 from datetime import datetime
 from decimal import ROUND_HALF_UP, Decimal
-from typing import TYPE_CHECKING, Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar, cast
+
+import pandas as pd
 
 from precog.database.seeding.sources.base_source import (
     APIBasedSourceMixin,
@@ -45,6 +47,18 @@ from precog.database.seeding.sources.base_source import (
     DataSourceError,
     GameRecord,
 )
+from precog.database.seeding.sources.columnar import (
+    GAME_RECORD_FIELDS,
+    as_text,
+    column,
+    is_integer_text,
+    iter_records,
+    normalize_codes,
+    parse_dates,
+    record_frame,
+    to_dates,
+    to_int,
+)
 from precog.database.seeding.team_history import resolve_team_code
 
 if TYPE_CHECKING:
@@ -125,45 +139,15 @@ def normalize_mlb_team_code(code: str) -> str:
 # =============================================================================
 
 
-def _parse_mlb_date(date_val: Any) -> datetime | None:
-    """Parse MLB date to datetime.
-
-    pybaseball returns dates in various formats depending on the source.
-
-    Args:
-        date_val: Date value from pybaseball (string, datetime, or pandas Timestamp)
-
-    Returns:
-        Parsed datetime or None
-    """
-    if date_val is None:
-        return None
-
-    # Handle pandas Timestamp
-    if hasattr(date_val, "to_pydatetime"):
-        result: datetime = date_val.to_pydatetime()
-        return result
-
-    if isinstance(date_val, datetime):
-        return date_val
-
-    if not isinstance(date_val, str):
-        date_val = str(date_val)
-
-    formats = [
-        "%Y-%m-%d",
-        "%m/%d/%Y",
-        "%Y-%m-%dT%H:%M:%S",
-    ]
-
-    for fmt in formats:
-        try:
-            return datetime.strptime(date_val, fmt)  # noqa: DTZ007
-        except ValueError:
-            continue
+# Date formats seen across pybaseball sources; Timestamps pass through
+MLB_DATE_FORMATS: tuple[str, ...] = (
+    "%Y-%m-%d",
+    "%m/%d/%Y",
+    "%Y-%m-%dT%H:%M:%S",
+)
 
-    logger.warning("Could not parse MLB date: %s", date_val)
-    return None
+# Gm# markers of postseason games in schedule_and_record frames
+MLB_PLAYOFF_MARKERS: tuple[str, ...] = ("WC", "DS", "CS", "WS")
 
 
 def _to_decimal(value: Any, precision: str = "0.0001") -> Decimal | None:
@@ -324,9 +308,7 @@ class PybaseballSource(APIBasedSourceMixin, BaseDataSource):
             # Get list of all teams for this season
             teams = self._get_teams_for_season(season)
 
-            # Track games we've already seen (to avoid duplicates)
-            seen_games: set[str] = set()
-
+            schedules: list[pd.DataFrame] = []
             for team in teams:
                 try:
                     self._rate_limit_wait()
@@ -338,16 +320,25 @@ class PybaseballSource(APIBasedSourceMixin, BaseDataSource):
                         self._logger.debug("No schedule for %s in %d", team, season)
                         continue
 
-                    # Iterate through games
-                    for _, row in schedule.iterrows():
-                        game_record = self._parse_schedule_row(row, season, seen_games)
-                        if game_record:
-                            yield game_record
+                    schedules.append(schedule)
 
                 except Exception as e:
                     self._logger.warning("Error fetching %s for %d: %s", team, season, e)
                     continue
 
+            if not schedules:
+                continue
+
+            # One pass over the whole season: a single team's frame is only
+            # ~162 rows, so normalizing team by team would pay the fixed
+            # per-call cost of every column operation thirty times over
+            try:
+                games = self._normalize_schedule(pd.concat(schedules, ignore_index=True), season)
+            except Exception as e:
+                self._logger.warning("Error normalizing MLB season %d: %s", season, e)
+                continue
+            yield from cast("Iterator[GameRecord]", iter_records(games, GAME_RECORD_FIELDS))
+
     def _get_teams_for_season(self, season: int) -> list[str]:
         """Get list of MLB team abbreviations for a given season.
 
@@ -403,105 +394,74 @@ class PybaseballSource(APIBasedSourceMixin, BaseDataSource):
         # For now, return current teams (pybaseball will handle missing data)
         return current_teams
 
-    def _parse_schedule_row(
+    def _normalize_schedule(
         self,
-        row: Any,
+        schedule: pd.DataFrame,
         season: int,
-        seen_games: set[str],
-    ) -> GameRecord | None:
-        """Parse a schedule row from pybaseball.
+    ) -> pd.DataFrame:
+        """Normalize a schedule_and_record frame into GameRecord columns.
 
         Args:
-            row: Row from schedule DataFrame
+            schedule: Schedule DataFrame (one team's, or several teams' concatenated)
             season: Season year
-            seen_games: Set of game IDs already processed
 
         Returns:
-            GameRecord or None if game should be skipped
+            Frame with GAME_RECORD_FIELDS columns, one row per new, scored home game
 
         Educational Note:
             We only emit home games to avoid duplicates, since each game
             appears in both teams' schedules.
         """
-        # Only process home games to avoid duplicates
-        home_away = str(row.get("Home_Away", ""))
-        if home_away.upper() not in ("H", "HOME", ""):
-            return None
-
-        # Get opponent
-        opp = str(row.get("Opp", ""))
-        if not opp:
-            return None
-
-        # Get the team from the Tm column (if available) or infer from context
-        team_code = str(row.get("Tm", ""))
-        if not team_code:
-            # If no Tm column, this might be a team-specific schedule
-            # where we already know the team
-            return None
-
-        # Skip if this appears to be an away game (starts with @)
-        if opp.startswith("@"):
-            return None
-
-        home_team = normalize_mlb_team_code(team_code)
-        away_team = normalize_mlb_team_code(opp.replace("@", "").strip())
-
-        # Create unique game ID for deduplication
-        game_date_val = row.get("Date")
-        game_date_dt = _parse_mlb_date(game_date_val)
-        if not game_date_dt:
-            return None
-
-        game_date = game_date_dt.date()
-        game_id = f"{game_date}_{away_team}_{home_team}"
-
-        if game_id in seen_games:
-            return None
-        seen_games.add(game_id)
-
-        # Get scores
-        runs = row.get("R")  # Team's runs
-        runs_allowed = row.get("RA")  # Opponent's runs
-
-        if runs is None or runs_allowed is None:
-            return None
-
-        try:
-            home_score = int(runs)
-            away_score = int(runs_allowed)
-        except (ValueError, TypeError):
-            return None
+        # Only process home games ("@" marks away games in either column)
+        home_away = as_text(column(schedule, "Home_Away")).str.upper()
+        opp = as_text(column(schedule, "Opp"))
+        team = as_text(column(schedule, "Tm"))
+        game_dates = parse_dates(column(schedule, "Date"), MLB_DATE_FORMATS)
+
+        candidate = (
+            home_away.isin(["H", "HOME", ""])
+            & (opp != "")
+            & (team != "")
+            & ~opp.str.startswith("@")
+            & game_dates.notna()
+        )
+        games = schedule[candidate]
+        home_team = normalize_codes(team[candidate], normalize_mlb_team_code)
+        away_team = normalize_codes(opp[candidate], normalize_mlb_team_code)
+        game_date = to_dates(game_dates[candidate])
+
+        # Unique game ID for deduplication across both teams' schedules
+        game_id = game_date.astype(str) + "_" + away_team + "_" + home_team
+        first_seen = ~game_id.duplicated()
+
+        home_score = to_int(column(games, "R"))  # Team's runs
+        away_score = to_int(column(games, "RA"))  # Opponent's runs
+        keep = first_seen & home_score.notna() & away_score.notna()
+
+        # MLB regular season is 162 games; non-numeric Gm# may mark a playoff round
+        gm = as_text(column(games, "Gm#"))
+        numeric_gm = is_integer_text(gm)
+        is_playoff = (numeric_gm & (pd.to_numeric(gm.where(numeric_gm, "0")) > 162)) | (
+            ~numeric_gm & gm.str.upper().str.contains("|".join(MLB_PLAYOFF_MARKERS))
+        )
 
-        # Determine if playoff
-        # Look for playoff indicator in game number or other fields
-        gm = str(row.get("Gm#", ""))
-        is_playoff = False
-        if gm:
-            # Regular season games are numbered; playoff games might have different format
-            try:
-                game_num = int(gm)
-                # MLB regular season is 162 games
-                is_playoff = game_num > 162
-            except ValueError:
-                # Non-numeric game number might indicate playoff
-                is_playoff = any(x in gm.upper() for x in ["WC", "DS", "CS", "WS"])
-
-        return GameRecord(
+        return record_frame(
+            GAME_RECORD_FIELDS,
+            games.index[keep],
             sport="mlb",
             season=season,
-            game_date=game_date,
-            home_team_code=home_team,
-            away_team_code=away_team,
-            home_score=home_score,
-            away_score=away_score,
+            game_date=game_date[keep],
+            home_team_code=home_team[keep],
+            away_team_code=away_team[keep],
+            home_score=home_score[keep].astype("int64"),
+            away_score=away_score[keep].astype("int64"),
             is_neutral_site=False,
-            is_playoff=is_playoff,
-            game_type="playoff" if is_playoff else "regular",
+            is_playoff=is_playoff[keep],
+            game_type=is_playoff[keep].map({True: "playoff", False: "regular"}).astype(object),
             venue_name=None,  # Not readily available in schedule
             source=self.source_name,
             source_file=None,
-            external_game_id=game_id,
+            external_game_id=game_id[keep],
         )
 
     # -------------------------------------------------------------------------
@@ -550,71 +510,61 @@ class PybaseballSource(APIBasedSourceMixin, BaseDataSource):
                     self._logger.warning("No Retrosheet data for %d", season)
                     continue
 
-                for _, row in game_logs.iterrows():
-                    game_record = self._parse_retrosheet_row(row, season)
-                    if game_record:
-                        yield game_record
+                games = self._normalize_retrosheet(game_logs, season)
+                yield from cast("Iterator[GameRecord]", iter_records(games, GAME_RECORD_FIELDS))
 
             except Exception as e:
                 self._logger.warning("Error fetching Retrosheet for %d: %s", season, e)
                 continue
 
-    def _parse_retrosheet_row(
+    def _normalize_retrosheet(
         self,
-        row: Any,
+        game_logs: pd.DataFrame,
         season: int,
-    ) -> GameRecord | None:
-        """Parse a Retrosheet game log row.
+    ) -> pd.DataFrame:
+        """Normalize a Retrosheet game log frame into GameRecord columns.
 
         Args:
-            row: Row from Retrosheet DataFrame
+            game_logs: Retrosheet game logs DataFrame
             season: Season year
 
         Returns:
-            GameRecord or None
+            Frame with GAME_RECORD_FIELDS columns, one row per scored game
         """
         # Retrosheet has detailed column names
-        home_team = str(row.get("Home", ""))
-        away_team = str(row.get("Away", ""))
-
-        if not home_team or not away_team:
-            return None
-
-        home_team = normalize_mlb_team_code(home_team)
-        away_team = normalize_mlb_team_code(away_team)
-
-        # Get date
-        date_val = row.get("Date")
-        game_date_dt = _parse_mlb_date(date_val)
-        if not game_date_dt:
-            return None
-
-        game_date = game_date_dt.date()
-
-        # Get scores
-        home_score = row.get("HomeRuns")
-        away_score = row.get("AwayRuns")
-
-        if home_score is None or away_score is None:
-            return None
-
-        try:
-            home_score = int(home_score)
-            away_score = int(away_score)
-        except (ValueError, TypeError):
-            return None
-
-        # External game ID
-        external_id = str(row.get("GameID", "")) or f"{game_date}_{away_team}_{home_team}"
-
-        return GameRecord(
+        home_raw = as_text(column(game_logs, "Home"))
+        away_raw = as_text(column(game_logs, "Away"))
+        game_dates = parse_dates(column(game_logs, "Date"), MLB_DATE_FORMATS)
+        home_score = to_int(column(game_logs, "HomeRuns"))
+        away_score = to_int(column(game_logs, "AwayRuns"))
+
+        keep = (
+            (home_raw != "")
+            & (away_raw != "")
+            & game_dates.notna()
+            & home_score.notna()
+            & away_score.notna()
+        )
+        games = game_logs[keep]
+        home_team = normalize_codes(home_raw[keep], normalize_mlb_team_code)
+        away_team = normalize_codes(away_raw[keep], normalize_mlb_team_code)
+        game_date = to_dates(game_dates[keep])
+
+        # External game ID, falling back to date/teams
+        external_id = as_text(column(games, "GameID"))
+        fallback_id = game_date.astype(str) + "_" + away_team + "_" + home_team
+        external_id = external_id.where(external_id != "", fallback_id)
+
+        return record_frame(
+            GAME_RECORD_FIELDS,
+            games.index,
             sport="mlb",
             season=season,
             game_date=game_date,
             home_team_code=home_team,
             away_team_code=away_team,
-            home_score=home_score,
-            away_score=away_score,
+            home_score=home_score[keep].astype("int64"),
+            away_score=away_score[keep].astype("int64"),
             is_neutral_site=False,
             is_playoff=False,  # Would need additional logic to determine
             game_type="regular",
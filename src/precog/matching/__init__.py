@@ -9,6 +9,7 @@ Public API:
     - ParsedTicker: Structured result from ticker parsing
     - parse_event_ticker(): Parse a Kalshi event ticker into components
     - TeamCodeRegistry: In-memory cache of team code mappings
+    - GameIndex: In-memory index of games for O(1) matchup lookups
     - EventGameMatcher: Orchestrates the full matching flow
 
 Example:
@@ -24,11 +25,13 @@ Related:
 """
 
 from precog.matching.event_game_matcher import EventGameMatcher, MatchReason
+from precog.matching.game_index import GameIndex
 from precog.matching.team_code_registry import TeamCodeRegistry
 from precog.matching.ticker_parser import ParsedTicker, parse_event_ticker
 
 __all__ = [
     "EventGameMatcher",
+    "GameIndex",
     "MatchReason",
     "ParsedTicker",
     "TeamCodeRegistry",
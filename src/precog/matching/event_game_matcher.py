@@ -14,7 +14,8 @@ Flow:
     1. Parse ticker -> league, date, away_code, home_code (Kalshi codes)
     2. Resolve Kalshi codes to ESPN codes via TeamCodeRegistry
     3. Look up sport from LEAGUE_SPORT_CATEGORY mapping
-    4. Query games table by (sport, game_date, home_team_code, away_team_code)
+    4. Look up (sport, game_date, home_team_code, away_team_code) in the
+       in-memory GameIndex (falls back to the games table outside its window)
     5. Return games.id or None
 
 Educational Note:
@@ -27,6 +28,7 @@ Related:
     - Issue #462: Event-to-game matching
     - Migration 0038: events.game_id FK to games(id)
     - crud_operations.find_game_by_matchup(): Game lookup
+    - game_index.GameIndex: In-memory game lookup
     - crud_operations.LEAGUE_SPORT_CATEGORY: League-to-sport mapping
 """
 
@@ -34,6 +36,7 @@ import logging
 from datetime import date
 from enum import Enum
 
+from precog.matching.game_index import GameIndex
 from precog.matching.team_code_registry import TeamCodeRegistry
 from precog.matching.ticker_parser import ParsedTicker, parse_event_ticker
 
@@ -64,6 +67,7 @@ class EventGameMatcher:
 
     Attributes:
         registry: TeamCodeRegistry for resolving team codes.
+        game_index: GameIndex for resolving matchups to games.id.
 
     Usage:
         >>> matcher = EventGameMatcher()
@@ -79,15 +83,23 @@ class EventGameMatcher:
         mock team data.
     """
 
-    def __init__(self, registry: TeamCodeRegistry | None = None) -> None:
+    def __init__(
+        self,
+        registry: TeamCodeRegistry | None = None,
+        game_index: GameIndex | None = None,
+    ) -> None:
         """Initialize matcher with optional pre-configured registry.
 
         Args:
             registry: Pre-configured TeamCodeRegistry. If None, creates
                       a new empty one (caller must call registry.load()
                       before matching).
+            game_index: Pre-configured GameIndex. If None, creates one
+                        that loads itself from the games table on the
+                        first lookup.
         """
         self.registry = registry or TeamCodeRegistry()
+        self.game_index = game_index or GameIndex()
 
     def match_event(self, event_ticker: str, title: str | None = None) -> int | None:
         """Try to match an event to a game. Returns games.id or None.
@@ -273,10 +285,11 @@ class EventGameMatcher:
         home_team_code: str,
         away_team_code: str,
     ) -> int | None:
-        """Look up a game in the games dimension table.
+        """Look up a game by its natural key.
 
-        Uses the CRUD function find_game_by_matchup() which queries by
-        the natural key: (league, game_date, home_team_code, away_team_code).
+        Served from the in-memory GameIndex, which applies the same
+        exact-then-+/-1-day rules as find_game_by_matchup() and falls back
+        to that query for dates outside its window.
 
         Args:
             league: League code (e.g., "nfl")
@@ -287,20 +300,13 @@ class EventGameMatcher:
         Returns:
             games.id or None.
         """
-        from precog.database.crud_game_states import find_game_by_matchup
-
-        return find_game_by_matchup(
-            league=league,
-            game_date=game_date,
-            home_team_code=home_team_code,
-            away_team_code=away_team_code,
-        )
+        return self.game_index.lookup(league, game_date, home_team_code, away_team_code)
 
     def backfill_unlinked_events(self, league: str | None = None) -> int:
         """Find events with game_id=NULL and attempt matching.
 
-        Queries for unlinked sports events, attempts ticker-based matching
-        for each, and updates events.game_id where matches are found.
+        Queries for unlinked sports events, resolves every match in memory
+        (see GameIndex), then links all matches with a single bulk UPDATE.
 
         Args:
             league: Optional league filter. If None, processes all leagues.
@@ -316,11 +322,11 @@ class EventGameMatcher:
         """
         from precog.database.crud_game_states import (
             find_unlinked_sports_events,
-            update_event_game_id,
+            update_event_game_ids_batch,
         )
 
         unlinked = find_unlinked_sports_events(league=league)
-        linked_count = 0
+        matches: dict[int, tuple[str, int]] = {}
 
         for event in unlinked:
             event_ticker = event.get("external_id", "")
@@ -332,15 +338,24 @@ class EventGameMatcher:
 
             game_id = self.match_event(event_ticker, title=title)
             if game_id is not None:
-                success = update_event_game_id(event_id, game_id)
-                if success:
-                    linked_count += 1
-                    logger.info(
-                        "Linked event %s (id=%d) to game_id=%d",
-                        event_ticker,
-                        event_id,
-                        game_id,
-                    )
+                matches[event_id] = (event_ticker, game_id)
+
+        linked_ids = (
+            update_event_game_ids_batch(
+                (event_id, game_id) for event_id, (_ticker, game_id) in matches.items()
+            )
+            if matches
+            else []
+        )
+        for event_id in linked_ids:
+            event_ticker, game_id = matches[event_id]
+            logger.info(
+                "Linked event %s (id=%d) to game_id=%d",
+                event_ticker,
+                event_id,
+                game_id,
+            )
+        linked_count = len(linked_ids)
 
         logger.info(
             "Backfill complete: %d/%d events linked (league=%s)",
@@ -0,0 +1,311 @@
+"""
+In-memory index of upcoming and recent games for event-to-game matching.
+
+EventGameMatcher used to call find_game_by_matchup() for every Kalshi event,
+which costs one to two SQL queries (exact date, then a +/-1 day window). The
+Kalshi poller matches every new event and backfills every unlinked event each
+cycle, so the same handful of games were queried over and over. GameIndex
+keeps the natural keys of games in a rolling date window in a dict and
+answers the same lookups in O(1).
+
+Design:
+    - Keyed by the games natural key (sport, game_date, home_team_code,
+      away_team_code); leagues map to sports via LEAGUE_SPORT_CATEGORY,
+      exactly as find_game_by_matchup() does
+    - Window: today - days_back .. today + days_ahead. Dates outside the
+      window fall back to find_game_by_matchup() (historical backfills)
+    - Incremental refresh: after the first full load only games whose
+      updated_at is at or after the watermark are re-read (minus a small
+      overlap for transactions that commit out of order); newly entered
+      window days are read in full and days that left it are pruned
+    - A full reload every full_reload_seconds drops deleted or re-keyed rows
+    - Thread-safe: the Kalshi poller matches from its polling thread while
+      the CLI may backfill from another
+
+Educational Note:
+    Kalshi tickers carry Eastern Time dates while ESPN stores UTC dates, so a
+    late-night game can sit one day off. The index reproduces the cascading
+    lookup of find_game_by_matchup(): exact date first, then the +/-1 day
+    neighbours, returning None when both neighbours hold a game (back-to-back
+    playoff games) rather than guessing.
+
+Related:
+    - Issue #462: Event-to-game matching
+    - Issue #524: Fuzzy date matching for ET/UTC offset
+    - crud_game_states.get_games_for_matching(): Data source
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from datetime import date, datetime, timedelta
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DAYS_BACK = 14
+DEFAULT_DAYS_AHEAD = 45
+DEFAULT_REFRESH_SECONDS = 60.0
+DEFAULT_FULL_RELOAD_SECONDS = 3600.0
+
+# Re-read rows this far behind the watermark: updated_at is the transaction
+# start time, so a slow upsert can commit after a faster, later one was read.
+WATERMARK_OVERLAP = timedelta(minutes=5)
+
+GameKey = tuple[str, date, str, str]
+
+
+class GameIndex:
+    """Hash index of games in a rolling date window.
+
+    Usage:
+        >>> index = GameIndex()
+        >>> index.lookup("nfl", date(2026, 1, 18), "NE", "HOU")  # loads on first use
+        42
+        >>> index.get_stats()["game_index_hits"]
+        1
+    """
+
+    def __init__(
+        self,
+        days_back: int = DEFAULT_DAYS_BACK,
+        days_ahead: int = DEFAULT_DAYS_AHEAD,
+        refresh_seconds: float = DEFAULT_REFRESH_SECONDS,
+        full_reload_seconds: float = DEFAULT_FULL_RELOAD_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        today: Callable[[], date] = date.today,
+    ) -> None:
+        """Initialize an empty index. Rows are loaded on first lookup.
+
+        Args:
+            days_back: Days before today kept in the index.
+            days_ahead: Days after today kept in the index.
+            refresh_seconds: Minimum seconds between incremental refreshes.
+            full_reload_seconds: Seconds between full window reloads.
+            clock: Monotonic time source (injectable for tests).
+            today: Current-date source (injectable for tests).
+
+        Raises:
+            ValueError: If a window bound or interval is negative.
+        """
+        if days_back < 0 or days_ahead < 0:
+            raise ValueError("days_back and days_ahead must be >= 0")
+        if refresh_seconds < 0 or full_reload_seconds < 0:
+            raise ValueError("refresh_seconds and full_reload_seconds must be >= 0")
+
+        self.days_back = days_back
+        self.days_ahead = days_ahead
+        self.refresh_seconds = refresh_seconds
+        self.full_reload_seconds = full_reload_seconds
+        self._clock = clock
+        self._today = today
+        self._lock = threading.Lock()
+        self._games: dict[GameKey, int] = {}
+        self._keys_by_id: dict[int, GameKey] = {}
+        self._window: tuple[date, date] | None = None
+        self._watermark: datetime | None = None
+        self._refreshed_at: float | None = None
+        self._full_loaded_at: float | None = None
+        self._hits = 0
+        self._misses = 0
+        self._fallbacks = 0
+        self._refreshes = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._games)
+
+    def lookup(
+        self,
+        league: str,
+        game_date: date,
+        home_team_code: str,
+        away_team_code: str,
+    ) -> int | None:
+        """Return games.id for a matchup, with find_game_by_matchup() semantics.
+
+        Refreshes the index first when it is older than refresh_seconds.
+        Dates whose +/-1 day neighbourhood is not fully inside the window
+        are delegated to find_game_by_matchup().
+
+        Args:
+            league: League code (e.g., "nfl")
+            game_date: Game date from the Kalshi ticker (Eastern Time)
+            home_team_code: ESPN/canonical home team code
+            away_team_code: ESPN/canonical away team code
+
+        Returns:
+            games.id, or None if no game or an ambiguous +/-1 day match.
+        """
+        from precog.database.crud_game_states import LEAGUE_SPORT_CATEGORY, find_game_by_matchup
+
+        sport = LEAGUE_SPORT_CATEGORY.get(league)
+        self.refresh_if_stale()
+
+        with self._lock:
+            window = self._window
+            if (
+                sport is not None
+                and window is not None
+                and window[0] <= game_date - timedelta(days=1)
+                and game_date + timedelta(days=1) <= window[1]
+            ):
+                game_id = self._lookup_locked(sport, game_date, home_team_code, away_team_code)
+                if game_id is None:
+                    self._misses += 1
+                else:
+                    self._hits += 1
+                return game_id
+            self._fallbacks += 1
+
+        return find_game_by_matchup(
+            league=league,
+            game_date=game_date,
+            home_team_code=home_team_code,
+            away_team_code=away_team_code,
+        )
+
+    def refresh_if_stale(self) -> None:
+        """Refresh when the last refresh is older than refresh_seconds."""
+        refreshed_at = self._refreshed_at
+        if refreshed_at is not None and self._clock() - refreshed_at < self.refresh_seconds:
+            return
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Bring the index up to date with the games table.
+
+        The first call (and every full_reload_seconds afterwards) reads the
+        whole window. Other calls read only games updated since the
+        watermark, plus any days that entered the window since last time.
+        """
+        from precog.database.crud_game_states import get_games_for_matching
+
+        now = self._clock()
+        today = self._today()
+        window = (today - timedelta(days=self.days_back), today + timedelta(days=self.days_ahead))
+
+        with self._lock:
+            previous = self._window
+            watermark = self._watermark
+            full_loaded_at = self._full_loaded_at
+
+        full = (
+            previous is None
+            or watermark is None
+            or full_loaded_at is None
+            or now - full_loaded_at >= self.full_reload_seconds
+        )
+        if full or previous is None or watermark is None:
+            rows = get_games_for_matching(window[0], window[1])
+        else:
+            rows = get_games_for_matching(window[0], window[1], watermark - WATERMARK_OVERLAP)
+            if window[1] > previous[1]:
+                # Days that just entered the window may hold games created
+                # long before the watermark.
+                start = max(previous[1] + timedelta(days=1), window[0])
+                rows.extend(get_games_for_matching(start, window[1]))
+
+        with self._lock:
+            if full:
+                self._games.clear()
+                self._keys_by_id.clear()
+                self._full_loaded_at = now
+            for row in rows:
+                self._add_locked(row)
+            self._prune_locked(window[0])
+            self._window = window
+            self._refreshed_at = now
+            self._refreshes += 1
+            size = len(self._games)
+
+        logger.debug(
+            "Game index %s refresh: %d rows read, %d games in %s..%s",
+            "full" if full else "incremental",
+            len(rows),
+            size,
+            window[0],
+            window[1],
+        )
+
+    def clear(self) -> None:
+        """Drop all games so the next lookup performs a full load. Counters are kept."""
+        with self._lock:
+            self._games.clear()
+            self._keys_by_id.clear()
+            self._window = None
+            self._watermark = None
+            self._refreshed_at = None
+            self._full_loaded_at = None
+
+    def get_stats(self) -> dict[str, int]:
+        """Return hit/miss/fallback/refresh counters and size, prefixed for get_stats() merges."""
+        with self._lock:
+            return {
+                "game_index_hits": self._hits,
+                "game_index_misses": self._misses,
+                "game_index_fallbacks": self._fallbacks,
+                "game_index_refreshes": self._refreshes,
+                "game_index_size": len(self._games),
+            }
+
+    def _lookup_locked(
+        self,
+        sport: str,
+        game_date: date,
+        home_team_code: str,
+        away_team_code: str,
+    ) -> int | None:
+        """Exact date, then a unique +/-1 day match (caller holds the lock)."""
+        game_id = self._games.get((sport, game_date, home_team_code, away_team_code))
+        if game_id is not None:
+            return game_id
+
+        candidates = [
+            candidate
+            for offset in (-1, 1)
+            if (
+                candidate := self._games.get(
+                    (sport, game_date + timedelta(days=offset), home_team_code, away_team_code)
+                )
+            )
+            is not None
+        ]
+        if len(candidates) == 1:
+            return candidates[0]
+        if candidates:
+            logger.debug(
+                "Ambiguous fuzzy date match: %s %s@%s on %s found %d games in +/-1d window",
+                sport,
+                away_team_code,
+                home_team_code,
+                game_date,
+                len(candidates),
+            )
+        return None
+
+    def _add_locked(self, row: dict[str, Any]) -> None:
+        """Insert or re-key one games row (caller holds the lock)."""
+        game_id = int(row["id"])
+        key: GameKey = (
+            row["sport"],
+            row["game_date"],
+            row["home_team_code"],
+            row["away_team_code"],
+        )
+        old_key = self._keys_by_id.get(game_id)
+        if old_key is not None and old_key != key and self._games.get(old_key) == game_id:
+            del self._games[old_key]
+        self._games[key] = game_id
+        self._keys_by_id[game_id] = key
+
+        updated_at = row.get("updated_at")
+        if updated_at is not None and (self._watermark is None or updated_at > self._watermark):
+            self._watermark = updated_at
+
+    def _prune_locked(self, oldest: date) -> None:
+        """Forget games dated before the window (caller holds the lock)."""
+        stale = [key for key in self._games if key[1] < oldest]
+        for key in stale:
+            self._keys_by_id.pop(self._games.pop(key), None)
@@ -29,7 +29,9 @@ Related:
 
 import logging
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, ClassVar
+
+from precog.utils.bounded_state import BoundedStateMap
 
 logger = logging.getLogger(__name__)
 
@@ -70,6 +72,9 @@ class TeamCodeRegistry:
         >>> "JAX" in codes  # False (ESPN code, not in Kalshi set)
     """
 
+    # Cap on distinct unknown "CODE:league" entries kept between reloads
+    MAX_UNKNOWN_CODES: ClassVar[int] = 1_000
+
     def __init__(self) -> None:
         """Initialize empty registry. Call load() before use."""
         self._kalshi_to_espn: dict[str, dict[str, str]] = {}
@@ -77,7 +82,11 @@ class TeamCodeRegistry:
         self._classification: dict[str, dict[str, str | None]] = {}
         self._loaded: bool = False
         self._last_loaded_at: datetime | None = None
-        self._unknown_codes_seen: set[str] = set()
+        # Bounded so a long-running poller seeing ever-new junk codes
+        # cannot grow it without limit (cleared on each reload anyway)
+        self._unknown_codes_seen: BoundedStateMap[str, None] = BoundedStateMap(
+            "unknown_team_codes", max_size=self.MAX_UNKNOWN_CODES
+        )
 
     @property
     def is_loaded(self) -> bool:
@@ -96,7 +105,7 @@ class TeamCodeRegistry:
         Format: "CODE:league" (e.g., "ZZZ:nfl"). Cleared on each reload.
         Used by the poller to decide when a registry refresh might help.
         """
-        return self._unknown_codes_seen
+        return set(self._unknown_codes_seen)
 
     def needs_refresh(self, max_age_seconds: int = 3600) -> bool:
         """Check whether the registry should be reloaded.
@@ -137,7 +146,11 @@ class TeamCodeRegistry:
             code: The Kalshi team code that was not found.
             league: The league context for the lookup.
         """
-        self._unknown_codes_seen.add(f"{code.upper()}:{league}")
+        self._unknown_codes_seen[f"{code.upper()}:{league}"] = None
+
+    def get_state_stats(self) -> dict[str, int]:
+        """Return size/eviction gauges for the unknown-code set, for poller get_stats() merges."""
+        return self._unknown_codes_seen.get_stats()
 
     def load(self, league: str | None = None) -> None:
         """Load team codes from DB into in-memory cache.
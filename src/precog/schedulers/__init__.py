@@ -83,9 +83,15 @@ Related: docs/guides/ESPN_DATA_MODEL_V1.0.md
 Related: ADR-100 (Service Supervisor Pattern)
 """
 
+# In-process "row written" notifications for streaming temporal alignment
+from precog.schedulers.alignment_bus import AlignmentEventBus, get_alignment_event_bus
+
 # Base poller infrastructure
 from precog.schedulers.base_poller import BasePoller, PollerStats
 
+# Dimension ID cache (ESPN poller team/venue/game lookups)
+from precog.schedulers.dimension_cache import DimensionCache
+
 # ESPN game polling (new naming)
 from precog.schedulers.espn_game_poller import (
     ESPNGamePoller,
@@ -94,6 +100,9 @@ from precog.schedulers.espn_game_poller import (
     run_single_espn_poll,
 )
 
+# Kalshi in-memory order books (orderbook_delta channel)
+from precog.schedulers.kalshi_orderbook import OrderBook, OrderBookSampler, OrderBookStore
+
 # Kalshi market polling
 from precog.schedulers.kalshi_poller import (
     KalshiMarketPoller,
@@ -115,6 +124,9 @@ from precog.schedulers.market_data_manager import (
     create_market_data_manager,
 )
 
+# Shared last-persisted-price cache (poller + WebSocket write-through)
+from precog.schedulers.market_price_cache import MarketPriceCache, get_market_price_cache
+
 # Service supervision
 from precog.schedulers.service_supervisor import (
     Environment,
@@ -127,12 +139,17 @@ from precog.schedulers.service_supervisor import (
     create_supervisor,
 )
 
+# Per-stage poll latency histograms (ESPN fetch / parse / sync)
+from precog.utils.latency_histogram import LatencyHistogram
+
 __all__ = [
+    "AlignmentEventBus",
     # Base infrastructure
     "BasePoller",
     # Connection and status enums
     "ConnectionState",
     "DataSourceStatus",
+    "DimensionCache",
     # ESPN services
     "ESPNGamePoller",
     "Environment",
@@ -141,8 +158,13 @@ __all__ = [
     # Kalshi services
     "KalshiMarketPoller",
     "KalshiWebSocketHandler",
+    "LatencyHistogram",
     # Market data services
     "MarketDataManager",
+    "MarketPriceCache",
+    "OrderBook",
+    "OrderBookSampler",
+    "OrderBookStore",
     "PollerStats",
     # Configuration dataclasses
     "RunnerConfig",
@@ -157,6 +179,8 @@ __all__ = [
     "create_services",
     "create_supervisor",
     "create_websocket_handler",
+    "get_alignment_event_bus",
+    "get_market_price_cache",
     # Utility functions
     "refresh_all_scoreboards",
     "run_single_espn_poll",
@@ -0,0 +1,170 @@
+"""
+In-process event bus for "row written" notifications used by temporal alignment.
+
+The pollers announce what they just persisted so a streaming consumer can
+react at write time instead of rediscovering the rows from Postgres:
+
+    ESPNGamePoller         --GameStateWritten-->  \
+                                                   AlignmentEventBus --> StreamingTemporalAligner
+    KalshiMarketPoller     --SnapshotsWritten-->  /
+    KalshiWebSocketHandler --SnapshotsWritten--> /
+
+Design:
+    - Same callback-list shape as KalshiWebSocketHandler.add_callback():
+      listeners run synchronously on the publishing thread, so they must
+      only hand work off (enqueue), never do I/O
+    - A listener that raises is logged and skipped; publishing never fails
+      the poller's write path
+    - Publishing with no listeners is a cheap no-op (has_listeners lets
+      publishers skip building events entirely)
+    - One process-wide bus (get_alignment_event_bus()), like
+      get_market_price_cache(), so pollers need no extra wiring
+
+Reference: Issue #722 (temporal alignment)
+"""
+
+import logging
+import threading
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class GameStateWritten:
+    """A new game_states row was written for a game.
+
+    Attributes:
+        game_id: games.id the state belongs to.
+        game_state_id: game_states.id of the new row.
+        state_time: When the row was written (approximates row_start_ts).
+    """
+
+    game_id: int
+    game_state_id: int
+    state_time: datetime
+
+
+@dataclass(frozen=True)
+class SnapshotsWritten:
+    """New market_snapshots rows became current for these markets.
+
+    Attributes:
+        market_ids: markets.id values that were versioned.
+        written_at: When the write committed (for alignment lag).
+    """
+
+    market_ids: tuple[int, ...]
+    written_at: datetime
+
+
+GameStateListener = Callable[[GameStateWritten], None]
+SnapshotListener = Callable[[SnapshotsWritten], None]
+
+
+class AlignmentEventBus:
+    """
+    Thread-safe publish/subscribe for game state and market snapshot writes.
+
+    Usage:
+        >>> bus = AlignmentEventBus()
+        >>> bus.add_snapshot_listener(lambda event: print(event.market_ids))
+        >>> bus.publish_snapshots([42, 43])
+        (42, 43)
+    """
+
+    def __init__(self) -> None:
+        """Initialize a bus with no listeners."""
+        self._lock = threading.Lock()
+        self._game_state_listeners: list[GameStateListener] = []
+        self._snapshot_listeners: list[SnapshotListener] = []
+        self._listener_errors = 0
+
+    @property
+    def has_listeners(self) -> bool:
+        """True if anything is subscribed (publishers may skip work otherwise)."""
+        return bool(self._game_state_listeners or self._snapshot_listeners)
+
+    def add_game_state_listener(self, listener: GameStateListener) -> None:
+        """Subscribe to GameStateWritten events."""
+        with self._lock:
+            self._game_state_listeners.append(listener)
+
+    def remove_game_state_listener(self, listener: GameStateListener) -> None:
+        """Unsubscribe a game state listener (no-op if not subscribed)."""
+        with self._lock:
+            if listener in self._game_state_listeners:
+                self._game_state_listeners.remove(listener)
+
+    def add_snapshot_listener(self, listener: SnapshotListener) -> None:
+        """Subscribe to SnapshotsWritten events."""
+        with self._lock:
+            self._snapshot_listeners.append(listener)
+
+    def remove_snapshot_listener(self, listener: SnapshotListener) -> None:
+        """Unsubscribe a snapshot listener (no-op if not subscribed)."""
+        with self._lock:
+            if listener in self._snapshot_listeners:
+                self._snapshot_listeners.remove(listener)
+
+    def publish_game_state(self, event: GameStateWritten) -> None:
+        """Deliver a game state write to every game state listener."""
+        with self._lock:
+            listeners = list(self._game_state_listeners)
+        for listener in listeners:
+            self._deliver(listener, event)
+
+    def publish_snapshots(self, market_ids: Iterable[int]) -> None:
+        """Deliver a snapshot write for market_ids (no-op without listeners or ids)."""
+        with self._lock:
+            listeners = list(self._snapshot_listeners)
+        if not listeners:
+            return
+        ids = tuple(dict.fromkeys(market_ids))
+        if not ids:
+            return
+        event = SnapshotsWritten(market_ids=ids, written_at=datetime.now(UTC))
+        for listener in listeners:
+            self._deliver(listener, event)
+
+    def get_stats(self) -> dict[str, int]:
+        """Return listener counts and delivery errors."""
+        with self._lock:
+            return {
+                "alignment_bus_game_state_listeners": len(self._game_state_listeners),
+                "alignment_bus_snapshot_listeners": len(self._snapshot_listeners),
+                "alignment_bus_listener_errors": self._listener_errors,
+            }
+
+    def _deliver(self, listener: Callable[[Any], None], event: object) -> None:
+        try:
+            listener(event)
+        except Exception:
+            with self._lock:
+                self._listener_errors += 1
+            logger.warning(
+                "Alignment bus listener %s failed",
+                getattr(listener, "__name__", repr(listener)),
+                exc_info=True,
+            )
+
+
+_shared_bus: AlignmentEventBus | None = None
+_shared_bus_lock = threading.Lock()
+
+
+def get_alignment_event_bus() -> AlignmentEventBus:
+    """
+    Return the process-wide AlignmentEventBus the pollers publish to.
+
+    Created lazily on first use; every caller in the process gets the same
+    instance.
+    """
+    global _shared_bus
+    with _shared_bus_lock:
+        if _shared_bus is None:
+            _shared_bus = AlignmentEventBus()
+        return _shared_bus
@@ -45,6 +45,17 @@ from typing import Any, ClassVar, TypedDict
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
+from precog.utils.metrics import get_metrics_registry
+
+_metrics = get_metrics_registry()
+_POLL_SECONDS = _metrics.histogram(
+    "precog_poll_duration_seconds", "Duration of one poll cycle", ("poller",)
+)
+_POLL_ITEMS = _metrics.counter(
+    "precog_poll_items_total", "Items processed by poll cycles", ("poller", "result")
+)
+_POLL_ERRORS = _metrics.counter("precog_poll_errors_total", "Poll cycles that raised", ("poller",))
+
 # =============================================================================
 # Type Definitions
 # =============================================================================
@@ -484,6 +495,11 @@ class BasePoller(ABC):
             elapsed = (datetime.now(UTC) - start_time).total_seconds()
             updated = result.get("items_updated", 0)
             created = result.get("items_created", 0)
+            poller = self.__class__.__name__
+            _POLL_SECONDS.labels(poller).observe(elapsed)
+            _POLL_ITEMS.labels(poller, "fetched").inc(result.get("items_fetched", 0))
+            _POLL_ITEMS.labels(poller, "updated").inc(updated)
+            _POLL_ITEMS.labels(poller, "created").inc(created)
             # Demote no-change polls to DEBUG to reduce steady-state noise
             log_fn = self.logger.info if (updated or created) else self.logger.debug
             log_fn(
@@ -496,6 +512,7 @@ class BasePoller(ABC):
 
         except Exception as e:
             self.logger.exception("Error in poll cycle: %s", e)
+            _POLL_ERRORS.labels(self.__class__.__name__).inc()
             with self._lock:
                 self._stats["errors"] += 1
                 self._stats["last_error"] = str(e)
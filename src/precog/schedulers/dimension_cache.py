@@ -0,0 +1,150 @@
+"""
+Process-local TTL cache of dimension IDs resolved by ESPNGamePoller.
+
+Every scoreboard poll resolves the same handful of dimension rows for every
+game: two teams (get_team_by_espn_id), a venue (create_venue upsert) and the
+games row (get_or_create_game upsert). During a live slate those lookups
+return the same IDs poll after poll, so the poller keeps them here and only
+goes back to the database when an entry expires or its inputs change.
+
+Design:
+    - Keyed by any hashable tuple chosen by the caller, e.g.
+      ("team", league, espn_team_id) or ("game", <upsert arguments>)
+    - Entries expire ttl_seconds after they were stored (time.monotonic)
+    - Negative results are cached too (an unknown ESPN team ID is looked up
+      once per TTL, not once per poll)
+    - Loader exceptions propagate and nothing is cached
+    - Bounded: least-recently-used keys are evicted beyond max_size
+    - Thread-safe: per-league poll jobs run on separate APScheduler threads
+
+Educational Note:
+    Keying upserts by their full argument tuple keeps write-through semantics:
+    when a game moves from 'pre' to 'in_progress' the key changes, the cache
+    misses, and get_or_create_game runs once to record the new status. An
+    identical call within the TTL is the only thing skipped.
+
+Reference: REQ-DATA-001 (Game State Data Collection)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar, cast
+
+T = TypeVar("T")
+
+DEFAULT_DIMENSION_CACHE_TTL = 900  # 15 minutes
+
+
+class DimensionCache:
+    """
+    Bounded TTL cache of dimension lookups keyed by caller-defined tuples.
+
+    Usage:
+        >>> cache = DimensionCache(ttl_seconds=900)
+        >>> cache.get_or_load(("team", "nfl", "12"), lambda: 42)
+        42
+        >>> cache.get_or_load(("team", "nfl", "12"), lambda: 99)  # cached
+        42
+        >>> cache.get_stats()["dimension_cache_hits"]
+        1
+    """
+
+    DEFAULT_MAX_SIZE = 10_000
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_DIMENSION_CACHE_TTL,
+        max_size: int = DEFAULT_MAX_SIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            ttl_seconds: Seconds an entry stays valid. 0 disables caching
+                (every lookup calls the loader).
+            max_size: Maximum number of keys kept before LRU eviction.
+            clock: Monotonic time source (injectable for tests).
+
+        Raises:
+            ValueError: If ttl_seconds < 0 or max_size < 1.
+        """
+        if ttl_seconds < 0:
+            raise ValueError("ttl_seconds must be >= 0")
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], T]) -> T:
+        """
+        Return the cached value for key, calling loader() on a miss or expiry.
+
+        The loader runs outside the lock, so two threads missing the same key
+        may both load it; the later result wins. That is harmless for the
+        idempotent lookups and upserts this cache fronts.
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[1] < self.ttl_seconds:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return cast("T", entry[0])
+            self._misses += 1
+
+        value = loader()
+        self.put(key, value)
+        return value
+
+    def contains(self, key: Hashable) -> bool:
+        """Return True if key holds an unexpired entry (does not count a hit or miss)."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and now - entry[1] < self.ttl_seconds
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store value for key with a fresh TTL (no-op when caching is disabled)."""
+        if self.ttl_seconds <= 0:
+            return
+        now = self._clock()
+        with self._lock:
+            self._entries[key] = (value, now)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """Forget key so the next lookup reads the database."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries. Counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> dict[str, int]:
+        """Return hit/miss/eviction counters and current size, prefixed for get_stats() merges."""
+        with self._lock:
+            return {
+                "dimension_cache_hits": self._hits,
+                "dimension_cache_misses": self._misses,
+                "dimension_cache_evictions": self._evictions,
+                "dimension_cache_size": len(self._entries),
+            }
@@ -51,7 +51,10 @@ Related ADR: ADR-100 (Service Supervisor Pattern)
 """
 
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from enum import Enum
 from typing import Any, ClassVar
@@ -60,12 +63,14 @@ from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
+from precog.analytics.elo_live_updater import LiveEloUpdater
 from precog.api_connectors.espn_client import (
     ESPNAPIError,
     ESPNClient,
     ESPNGameFull,
     ESPNTeamInfo,
     ESPNVenueInfo,
+    RateLimitExceededError,
     extract_espn_odds,
 )
 from precog.database.crud_game_states import (
@@ -75,12 +80,16 @@ from precog.database.crud_game_states import (
     update_game_result,
     upsert_game_odds,
     upsert_game_state,
+    upsert_game_states_batch,
 )
 from precog.database.crud_teams import (
     create_venue,
     get_team_by_espn_id,
 )
+from precog.schedulers.alignment_bus import GameStateWritten, get_alignment_event_bus
 from precog.schedulers.base_poller import BasePoller
+from precog.schedulers.dimension_cache import DEFAULT_DIMENSION_CACHE_TTL, DimensionCache
+from precog.utils.latency_histogram import LatencyHistogram
 from precog.validation.espn_validation import ESPNDataValidator
 
 # Set up logging
@@ -118,6 +127,26 @@ class GameSyncReason(str, Enum):
     API_ERROR = "api_error"
 
 
+@dataclass
+class _GameSync:
+    """One game between dimension resolution and its follow-up writes.
+
+    Built by ESPNGamePoller._prepare_game_sync(); state_row holds the
+    upsert_game_state() keyword arguments.
+    """
+
+    game: ESPNGameFull
+    league: str
+    espn_event_id: str
+    game_id: int | None
+    home_team_id: int | None
+    away_team_id: int | None
+    home_team_info: ESPNTeamInfo
+    away_team_info: ESPNTeamInfo
+    game_date: datetime | None
+    state_row: dict[str, Any]
+
+
 class ESPNGamePoller(BasePoller):
     """
     ESPN game state polling service.
@@ -189,6 +218,11 @@ class ESPNGamePoller(BasePoller):
     # ESPN rate limit budget (configurable via constructor or YAML)
     DEFAULT_RATE_BUDGET: ClassVar[int] = 250  # requests per hour
 
+    # Multi-league fan-out (poll_once / refresh_scoreboards): scoreboards are
+    # fetched concurrently, database sync is limited to a few leagues at once
+    DEFAULT_SYNC_WORKERS: ClassVar[int] = 2
+    LATENCY_STAGES: ClassVar[tuple[str, ...]] = ("fetch", "parse", "sync")
+
     # Validation frequency: run game state validation every N polls.
     # ESPN polls per-league at 30s, so 20 polls = ~10 minutes.
     # Validates raw API data before DB sync (soft validation, never blocks).
@@ -220,6 +254,11 @@ class ESPNGamePoller(BasePoller):
         rate_budget_per_hour: int | None = None,
         max_throttled_interval: int | None = None,
         priority_calculator: Any | None = None,
+        live_elo: bool = False,
+        dimension_cache_ttl: float = DEFAULT_DIMENSION_CACHE_TTL,
+        fetch_workers: int | None = None,
+        sync_workers: int | None = None,
+        scoreboard_delta: bool = True,
     ) -> None:
         """
         Initialize the ESPNGamePoller.
@@ -237,10 +276,26 @@ class ESPNGamePoller(BasePoller):
             validate_teams_on_start: If True, validate ESPN team IDs against the
                 database at startup. Mismatches are logged as warnings but do not
                 prevent the poller from starting. Default True.
+            live_elo: If True, apply an incremental Elo update (LiveEloUpdater)
+                when a game transitions to final, writing elo_calculation_log
+                and teams.current_elo_rating. Default False.
+            dimension_cache_ttl: Seconds team, venue and games-dimension IDs
+                are cached between polls (DimensionCache). 0 disables the
+                cache. Default 900.
+            fetch_workers: Maximum concurrent scoreboard requests when
+                poll_once() or refresh_scoreboards() polls several leagues.
+                Default: one per configured league.
+            sync_workers: Maximum leagues syncing to the database at once
+                during those fan-outs. Default DEFAULT_SYNC_WORKERS (2).
+            scoreboard_delta: If True, fetch through the client's
+                get_scoreboard_delta() (ETag + per-event hashes) when it
+                provides one, so unchanged games skip parsing and sync.
+                Clients without it report every game as changed. Default True.
 
         Raises:
             ValueError: If poll_interval < 15 or idle_interval < 15.
             ValueError: If persist_jobs=True but job_store_url not provided.
+            ValueError: If fetch_workers or sync_workers < 1.
 
         Educational Note:
             Per-league polling (vs single-interval polling):
@@ -285,6 +340,15 @@ class ESPNGamePoller(BasePoller):
             raise ValueError(
                 f"max_throttled_interval must be >= 15, got {self.max_throttled_interval}"
             )
+
+        # Multi-league fan-out concurrency
+        self.fetch_workers = fetch_workers if fetch_workers is not None else len(self.leagues)
+        self.sync_workers = sync_workers if sync_workers is not None else self.DEFAULT_SYNC_WORKERS
+        if self.fetch_workers < 1:
+            raise ValueError(f"fetch_workers must be >= 1, got {self.fetch_workers}")
+        if self.sync_workers < 1:
+            raise ValueError(f"sync_workers must be >= 1, got {self.sync_workers}")
+        self._sync_slots = threading.BoundedSemaphore(self.sync_workers)
         tracking_interval = self.poll_interval or self.DEFAULT_TRACKING_INTERVAL
         discovery_overhead = len(self.leagues) * (3600 // self.DEFAULT_DISCOVERY_INTERVAL)
         available_for_tracking = max(0, self.rate_budget_per_hour - discovery_overhead)
@@ -307,6 +371,9 @@ class ESPNGamePoller(BasePoller):
         # Priority-based adaptive polling (#560)
         # Stores last scoreboard games per league for priority calculation
         self._league_last_games: dict[str, list[ESPNGameFull]] = {}
+        # Leagues whose last poll had no changed games (304 or identical
+        # event payloads); down-weighted by allocate_budget()
+        self._league_quiet: set[str] = set()
         # Optional priority calculator for non-uniform throttling
         self._priority_calculator = priority_calculator
 
@@ -319,6 +386,27 @@ class ESPNGamePoller(BasePoller):
 
         # Initialize ESPN client (or use provided mock)
         self.espn_client = espn_client or ESPNClient()
+        # Scoreboard deltas (ETag + per-event hashes) when the client has
+        # them; _fetch_scoreboard() turns this off if the result is not a
+        # delta dict, and other clients report every game as changed
+        self._use_scoreboard_delta = scoreboard_delta and callable(
+            getattr(self.espn_client, "get_scoreboard_delta", None)
+        )
+
+        # Per-league stage latency (fetch / parse / sync), reported in get_stats()
+        self._latency: dict[str, dict[str, LatencyHistogram]] = {
+            league: {stage: LatencyHistogram() for stage in self.LATENCY_STAGES}
+            for league in self.leagues
+        }
+
+        # Team/venue/game dimension IDs reused across polls (TTL-invalidated)
+        self._dimension_cache = DimensionCache(ttl_seconds=dimension_cache_ttl)
+
+        # Incremental Elo on game finalization (warmed in _on_start)
+        self._live_elo: LiveEloUpdater | None = LiveEloUpdater() if live_elo else None
+        # espn_event_ids of final games whose result or Elo write failed;
+        # re-armed in the client so the next poll syncs them again
+        self._unfinished_finals: set[str] = set()
 
         # Initialize data validator (instance-level, NOT module-level singleton,
         # because _anomaly_counts is stateful per-poller)
@@ -363,6 +451,8 @@ class ESPNGamePoller(BasePoller):
     def get_stats(self) -> dict[str, Any]:
         """Return polling stats merged with sync categorization, validation, and gap detection.
 
+        Also includes size/eviction gauges of the validator's per-game state.
+
         The ``last_successful_poll`` key is consumed by the supervisor's
         ``_determine_health()`` for staleness detection (degraded at 2x
         poll interval, down at 5x). Per-league timestamps are included
@@ -374,7 +464,25 @@ class ESPNGamePoller(BasePoller):
             stats.update(self._validation_stats)
             stats["last_successful_poll"] = self._last_successful_poll
             stats["league_last_successful_poll"] = dict(self._league_last_successful_poll)
-            return stats
+            latency = dict(self._latency)
+        stats["league_latency"] = {
+            league: {stage: hist.snapshot() for stage, hist in stages.items()}
+            for league, stages in latency.items()
+        }
+        stats.update(self._dimension_cache.get_stats())
+        stats.update(self._validator.get_state_stats())
+        if self._live_elo is not None:
+            stats.update(self._live_elo.get_stats())
+        return stats
+
+    def _observe_latency(self, league: str, stage: str, seconds: float) -> None:
+        """Record a fetch/parse/sync duration for league (ad-hoc leagues added lazily)."""
+        with self._lock:
+            stages = self._latency.get(league)
+            if stages is None:
+                stages = {name: LatencyHistogram() for name in self.LATENCY_STAGES}
+                self._latency[league] = stages
+        stages[stage].observe(seconds)
 
     def _record_sync(self, reason: GameSyncReason) -> None:
         """Increment a categorized sync outcome counter."""
@@ -397,17 +505,17 @@ class ESPNGamePoller(BasePoller):
         total_updated = 0
         total_created = 0  # ESPN uses upsert, so created = 0 for now
 
-        for league in self.leagues:
-            try:
-                fetched, updated = self._poll_league(league)
-                total_fetched += fetched
-                total_updated += updated
-            except Exception as e:
-                # Log but don't re-raise - allow other leagues to continue
-                logger.error("Error polling %s: %s", league, e)
+        for league, outcome in zip(self.leagues, self._poll_leagues(self.leagues), strict=True):
+            if isinstance(outcome, Exception):
+                # Log but don't re-raise - other leagues already completed
+                logger.error("Error polling %s: %s", league, outcome)
                 with self._lock:
                     self._stats["errors"] += 1
-                    self._stats["last_error"] = str(e)
+                    self._stats["last_error"] = str(outcome)
+                continue
+            fetched, updated = outcome
+            total_fetched += fetched
+            total_updated += updated
 
         return {
             "items_fetched": total_fetched,
@@ -534,6 +642,13 @@ class ESPNGamePoller(BasePoller):
         Related:
             - precog.api_connectors.espn_team_validator.validate_espn_teams
         """
+        if self._live_elo is not None:
+            try:
+                self._live_elo.warm(self.leagues)
+            except Exception as e:
+                # Ratings are lazily loaded per team if warming fails
+                logger.warning("Live Elo warm-up failed (non-fatal): %s", e)
+
         if not self.validate_teams_on_start:
             return
 
@@ -670,8 +785,9 @@ class ESPNGamePoller(BasePoller):
                 self._polls_since_validation = 0
 
         try:
-            # Poll the league and get games for state evaluation
-            games = self.espn_client.get_scoreboard(league)
+            # Poll the league; all games feed state evaluation, only changed
+            # games are synced to the database
+            games, changed = self._fetch_scoreboard(league)
 
             # Validate fetched game data (soft validation -- log issues, never block).
             # Runs on raw API data before any DB sync.
@@ -749,18 +865,23 @@ class ESPNGamePoller(BasePoller):
 
             games_updated = 0
             sync_errors = 0
-            for game in games:
-                try:
-                    if self._sync_game_to_db(game, league):
-                        games_updated += 1
-                        self._record_sync(GameSyncReason.SYNCED)
-                    else:
-                        self._record_sync(GameSyncReason.UNCHANGED)
-                except Exception as e:
+            failed_event_ids: list[str] = []
+            for game, outcome in zip(changed, self._timed_sync(changed, league), strict=True):
+                if isinstance(outcome, Exception):
                     sync_errors += 1
                     self._record_sync(GameSyncReason.STATE_UPSERT_FAILED)
                     event_id = game.get("metadata", {}).get("espn_event_id", "unknown")
-                    logger.error("Error syncing game %s: %s", event_id, e)
+                    failed_event_ids.append(event_id)
+                    logger.error("Error syncing game %s: %s", event_id, outcome)
+                elif outcome:
+                    games_updated += 1
+                    self._record_sync(GameSyncReason.SYNCED)
+                else:
+                    self._record_sync(GameSyncReason.UNCHANGED)
+            # Games whose ESPN payload did not change were not synced at all
+            for _ in range(len(games) - len(changed)):
+                self._record_sync(GameSyncReason.UNCHANGED)
+            self._after_league_sync(league, changed, failed_event_ids)
 
             poll_timestamp = datetime.now(UTC).isoformat()
             with self._lock:
@@ -1005,6 +1126,7 @@ class ESPNGamePoller(BasePoller):
                     base_interval=base_interval,
                     max_throttled_interval=self.max_throttled_interval,
                     league_games=self._league_last_games,
+                    quiet_leagues=self._league_quiet,
                 )
                 if priority_intervals is not None:
                     logger.info(
@@ -1129,8 +1251,10 @@ class ESPNGamePoller(BasePoller):
         total_fetched = 0
         total_updated = 0
 
-        for league in target_leagues:
-            fetched, updated = self._poll_league(league)
+        for outcome in self._poll_leagues(target_leagues):
+            if isinstance(outcome, Exception):
+                raise outcome
+            fetched, updated = outcome
             total_fetched += fetched
             total_updated += updated
 
@@ -1203,9 +1327,12 @@ class ESPNGamePoller(BasePoller):
         total_updated = 0
         active_count = 0
 
-        for league in target_leagues:
+        outcomes = self._poll_leagues(target_leagues)
+        for league, outcome in zip(target_leagues, outcomes, strict=True):
             try:
-                fetched, updated = self._poll_league(league)
+                if isinstance(outcome, Exception):
+                    raise outcome
+                fetched, updated = outcome
                 games_by_league[league] = fetched
                 total_fetched += fetched
                 total_updated += updated
@@ -1272,19 +1399,25 @@ class ESPNGamePoller(BasePoller):
 
         try:
             # Use scoreboard API - returns ESPNGameFull TypedDicts
-            games = self.espn_client.get_scoreboard(league)
+            games, changed = self._fetch_scoreboard(league)
         except ESPNAPIError as e:
             logger.warning("ESPN API error for %s: %s", league, e)
             raise
 
+        # Bounded sync concurrency: at most sync_workers leagues write at once
+        with self._sync_slots:
+            outcomes = self._timed_sync(changed, league)
+
         games_updated = 0
-        for game in games:
-            try:
-                if self._sync_game_to_db(game, league):
-                    games_updated += 1
-            except Exception as e:
+        failed_event_ids: list[str] = []
+        for game, outcome in zip(changed, outcomes, strict=True):
+            if isinstance(outcome, Exception):
                 event_id = game.get("metadata", {}).get("espn_event_id", "unknown")
-                logger.error("Error syncing game %s: %s", event_id, e)
+                failed_event_ids.append(event_id)
+                logger.error("Error syncing game %s: %s", event_id, outcome)
+            elif outcome:
+                games_updated += 1
+        self._after_league_sync(league, changed, failed_event_ids)
 
         logger.info(
             "%s: fetched %d games, updated %d",
@@ -1295,6 +1428,153 @@ class ESPNGamePoller(BasePoller):
 
         return len(games), games_updated
 
+    def _fetch_scoreboard(self, league: str) -> tuple[list[ESPNGameFull], list[ESPNGameFull]]:
+        """
+        Fetch a league scoreboard and the subset of games that need syncing.
+
+        When the client provides get_scoreboard_delta() this uses it: a 304
+        or an unchanged event payload means the game is left out of the
+        changed list and skips parsing and database sync entirely. A client
+        whose get_scoreboard_delta() does not return a delta dict (test
+        doubles) is switched to get_scoreboard(), and every game it returns
+        is treated as changed.
+
+        Args:
+            league: League code (nfl, ncaaf, nba, etc.)
+
+        Returns:
+            Tuple of (all games, changed games)
+
+        Raises:
+            ESPNAPIError: If API request fails after retries.
+        """
+        start = time.perf_counter()
+        if self._use_scoreboard_delta:
+            delta = self.espn_client.get_scoreboard_delta(league)
+            if isinstance(delta, dict):
+                elapsed = time.perf_counter() - start
+                parse_seconds = delta.get("parse_seconds", 0.0)
+                self._observe_latency(league, "fetch", max(0.0, elapsed - parse_seconds))
+                if not delta["not_modified"]:
+                    self._observe_latency(league, "parse", parse_seconds)
+                return delta["games"], delta["changed"]
+            logger.debug("ESPN client returned no scoreboard delta; using get_scoreboard()")
+            self._use_scoreboard_delta = False
+            start = time.perf_counter()
+        games = self.espn_client.get_scoreboard(league)
+        # Opaque clients parse inside get_scoreboard(); count it all as fetch
+        self._observe_latency(league, "fetch", time.perf_counter() - start)
+        return games, games
+
+    def _available_request_tokens(self) -> float | None:
+        """Requests the client's rate limiter can pay for now (None if it has none)."""
+        rate_limiter = getattr(self.espn_client, "rate_limiter", None)
+        get_tokens = getattr(rate_limiter, "get_available_tokens", None)
+        if not callable(get_tokens):
+            return None
+        tokens = get_tokens()
+        return tokens if isinstance(tokens, int | float) else None
+
+    def _timed_sync(self, games: list[ESPNGameFull], league: str) -> list[bool | Exception]:
+        """_sync_games_to_db() with its duration recorded as the league's sync latency."""
+        start = time.perf_counter()
+        try:
+            return self._sync_games_to_db(games, league)
+        finally:
+            self._observe_latency(league, "sync", time.perf_counter() - start)
+
+    def _poll_leagues(self, leagues: list[str]) -> list[tuple[int, int] | Exception]:
+        """
+        Poll several leagues concurrently via _poll_league().
+
+        Leagues are ordered by priority (shortest current interval first, as
+        set by _recalculate_league_intervals / LeaguePriorityCalculator). When
+        the client has a rate limiter, only as many leagues as its hourly
+        token bucket can pay for right now are requested; the rest are deferred
+        with RateLimitExceededError instead of racing for tokens, so a
+        depleted budget is spent on the highest-priority leagues.
+
+        Args:
+            leagues: League codes to poll
+
+        Returns:
+            One entry per input league, in input order: (games_fetched,
+            games_updated) or the exception that league's poll raised.
+
+        Educational Note:
+            Each league fetches on its own thread (up to fetch_workers), so
+            one slow ESPN endpoint does not hold the others' HTTP calls. The
+            sync phase inside _poll_league() is bounded by sync_workers so a
+            fan-out never takes more than a few database connections.
+        """
+        with self._lock:
+            intervals = dict(self._league_intervals)
+        # Positions into leagues, highest priority first (stable for ties)
+        ordered = sorted(
+            range(len(leagues)),
+            key=lambda i: intervals.get(leagues[i], self.DEFAULT_DISCOVERY_INTERVAL),
+        )
+
+        allowance = len(ordered)
+        tokens = self._available_request_tokens()
+        if tokens is not None:
+            allowance = min(allowance, int(tokens))
+        runnable, deferred = ordered[:allowance], ordered[allowance:]
+
+        results: list[tuple[int, int] | Exception | None] = [None] * len(leagues)
+        for i in deferred:
+            results[i] = RateLimitExceededError(
+                f"ESPN request budget exhausted; {leagues[i].upper()} deferred to next poll"
+            )
+        if deferred:
+            logger.warning(
+                "ESPN budget allows %d of %d league requests; deferred: %s",
+                len(runnable),
+                len(ordered),
+                ", ".join(leagues[i].upper() for i in deferred),
+            )
+
+        if len(runnable) <= 1:
+            for i in runnable:
+                try:
+                    results[i] = self._poll_league(leagues[i])
+                except Exception as e:
+                    results[i] = e
+        else:
+            workers = min(self.fetch_workers, len(runnable))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="espn-poll") as pool:
+                futures = {i: pool.submit(self._poll_league, leagues[i]) for i in runnable}
+            for i, future in futures.items():
+                exc = future.exception()
+                results[i] = exc if isinstance(exc, Exception) else future.result()
+
+        return [outcome for outcome in results if outcome is not None]
+
+    def _after_league_sync(
+        self, league: str, changed: list[ESPNGameFull], failed_event_ids: list[str]
+    ) -> None:
+        """
+        Record whether the league was quiet and re-arm failed events.
+
+        Events that failed to sync, and final games whose result or live Elo
+        write failed, are forgotten by the client so the next poll reports
+        them as changed again instead of hashing them as seen.
+        """
+        with self._lock:
+            unfinished = [
+                game.get("metadata", {}).get("espn_event_id", "")
+                for game in changed
+                if game.get("metadata", {}).get("espn_event_id") in self._unfinished_finals
+            ]
+        rearm = failed_event_ids + unfinished
+        if rearm and self._use_scoreboard_delta:
+            self.espn_client.forget_events(league, rearm)
+        with self._lock:
+            if changed:
+                self._league_quiet.discard(league)
+            else:
+                self._league_quiet.add(league)
+
     def _sync_game_to_db(self, game: ESPNGameFull, league: str) -> bool:
         """
         Sync a single game state to the database.
@@ -1304,6 +1584,10 @@ class ESPNGamePoller(BasePoller):
         - Venue creation/lookup
         - Game state upsert with SCD Type 2
 
+        Scoreboard polls use _sync_games_to_db(), which shares the same
+        preparation and follow-up steps but writes all game states in one
+        batch.
+
         Args:
             game: Game data in normalized ESPNGameFull format
             league: League code for team lookups
@@ -1320,6 +1604,86 @@ class ESPNGamePoller(BasePoller):
             goes to various lookup tables and state goes to game_states
             with SCD Type 2 versioning.
         """
+        sync = self._prepare_game_sync(game, league)
+        if sync is None:
+            return False
+
+        # Upsert game state (SCD Type 2 handles versioning)
+        # Returns new row ID if state changed, or None if unchanged
+        result_id = upsert_game_state(**sync.state_row)
+        return self._finish_game_sync(sync, result_id)
+
+    def _sync_games_to_db(self, games: list[ESPNGameFull], league: str) -> list[bool | Exception]:
+        """
+        Sync a whole scoreboard to the database with one batched state upsert.
+
+        Dimension rows are resolved per game (mostly from the dimension
+        cache), then every game state goes through upsert_game_states_batch(),
+        which reads all current rows in one query and writes only the changed
+        games.
+
+        Args:
+            games: Scoreboard games in normalized ESPNGameFull format
+            league: League code for team lookups
+
+        Returns:
+            One outcome per game, in order: True if a new state row was
+            written, False if skipped/unchanged, or the exception that
+            failed that game's sync
+
+        Educational Note:
+            A failure is isolated to its game, as with one _sync_game_to_db()
+            call per game. If the batched read fails, every game falls back to
+            upsert_game_state(); games whose write failed inside the batch
+            (absent from its result) are retried the same way.
+        """
+        outcomes: list[bool | Exception] = [False] * len(games)
+        prepared: list[tuple[int, _GameSync]] = []
+        for index, game in enumerate(games):
+            try:
+                sync = self._prepare_game_sync(game, league)
+            except Exception as e:
+                outcomes[index] = e
+                continue
+            if sync is not None:
+                prepared.append((index, sync))
+
+        results: dict[str, int | None] = {}
+        if prepared:
+            try:
+                results = upsert_game_states_batch([sync.state_row for _, sync in prepared])
+            except Exception:
+                logger.warning(
+                    "Batched game state upsert failed for %s, falling back to per-game upserts",
+                    league.upper(),
+                    exc_info=True,
+                )
+
+        for index, sync in prepared:
+            try:
+                if sync.espn_event_id in results:
+                    result_id = results[sync.espn_event_id]
+                else:
+                    result_id = upsert_game_state(**sync.state_row)
+                outcomes[index] = self._finish_game_sync(sync, result_id)
+            except Exception as e:
+                outcomes[index] = e
+        return outcomes
+
+    def _prepare_game_sync(self, game: ESPNGameFull, league: str) -> _GameSync | None:
+        """
+        Resolve dimension rows for a game and build its game_states row.
+
+        Team, venue and games-dimension lookups go through the dimension
+        cache, so an unchanged game costs no queries here within the TTL.
+
+        Args:
+            game: Game data in normalized ESPNGameFull format
+            league: League code for team lookups
+
+        Returns:
+            Prepared sync, or None if the game has no espn_event_id
+        """
         metadata = game.get("metadata", {})
         state = game.get("state", {})
 
@@ -1327,7 +1691,7 @@ class ESPNGamePoller(BasePoller):
         if not espn_event_id:
             logger.warning("Game missing espn_event_id, skipping")
             self._record_sync(GameSyncReason.MISSING_EVENT_ID)
-            return False
+            return None
 
         # Extract team info from normalized structure
         home_team_info: ESPNTeamInfo = metadata.get("home_team", {})
@@ -1371,29 +1735,35 @@ class ESPNGamePoller(BasePoller):
         game_week_number = metadata.get("week_number")
         normalized_status = self._normalize_game_status(state.get("game_status", "pre"))
 
-        # Create or update the games dimension row (idempotent)
+        # Create or update the games dimension row (idempotent). Cached by the
+        # full argument tuple: a status or venue change is a new key and
+        # reaches the database; an identical re-poll does not.
         game_id = None
         if game_date and home_team_info.get("team_code") and away_team_info.get("team_code"):
+            game_kwargs: dict[str, Any] = {
+                "sport": LEAGUE_SPORT_CATEGORY.get(league, league),
+                "game_date": game_date.date() if hasattr(game_date, "date") else game_date,
+                "home_team_code": home_team_info.get("team_code", ""),
+                "away_team_code": away_team_info.get("team_code", ""),
+                "season": game_season,
+                "league": league,
+                "season_type": game_season_type,
+                "week_number": game_week_number,
+                "home_team_id": home_team_id,
+                "away_team_id": away_team_id,
+                "venue_id": venue_id,
+                "venue_name": venue_info.get("venue_name"),
+                "neutral_site": metadata.get("neutral_site", False),
+                "espn_event_id": espn_event_id,
+                "game_status": normalized_status,
+                "game_time": game_date,
+                "data_source": "espn_poller",
+                "attendance": metadata.get("attendance"),
+            }
             try:
-                game_id = get_or_create_game(
-                    sport=LEAGUE_SPORT_CATEGORY.get(league, league),
-                    game_date=game_date.date() if hasattr(game_date, "date") else game_date,
-                    home_team_code=home_team_info.get("team_code", ""),
-                    away_team_code=away_team_info.get("team_code", ""),
-                    season=game_season,
-                    league=league,
-                    season_type=game_season_type,
-                    week_number=game_week_number,
-                    home_team_id=home_team_id,
-                    away_team_id=away_team_id,
-                    venue_id=venue_id,
-                    venue_name=venue_info.get("venue_name"),
-                    neutral_site=metadata.get("neutral_site", False),
-                    espn_event_id=espn_event_id,
-                    game_status=normalized_status,
-                    game_time=game_date,
-                    data_source="espn_poller",
-                    attendance=metadata.get("attendance"),
+                game_id = self._dimension_cache.get_or_load(
+                    ("game", *sorted(game_kwargs.items())),
+                    lambda: get_or_create_game(**game_kwargs),
                 )
             except Exception:
                 self._record_sync(GameSyncReason.GAME_DIMENSION_FAILED)
@@ -1403,58 +1773,93 @@ class ESPNGamePoller(BasePoller):
                     exc_info=True,
                 )
 
-        # Upsert game state (SCD Type 2 handles versioning)
-        # Returns new row ID if state changed, or existing ID/None if unchanged
-        result_id = upsert_game_state(
+        return _GameSync(
+            game=game,
+            league=league,
             espn_event_id=espn_event_id,
+            game_id=game_id,
             home_team_id=home_team_id,
             away_team_id=away_team_id,
-            venue_id=venue_id,
-            home_score=state.get("home_score", 0),
-            away_score=state.get("away_score", 0),
-            period=state.get("period", 0),
-            clock_seconds=clock_seconds,
-            clock_display=state.get("clock_display"),
-            game_status=normalized_status,
+            home_team_info=home_team_info,
+            away_team_info=away_team_info,
             game_date=game_date,
-            broadcast=metadata.get("broadcast"),
-            neutral_site=metadata.get("neutral_site", False),
-            season_type=game_season_type,
-            week_number=game_week_number,
-            league=league,
-            situation=situation,
-            linescores=state.get("linescores"),
-            game_id=game_id,
+            state_row={
+                "espn_event_id": espn_event_id,
+                "home_team_id": home_team_id,
+                "away_team_id": away_team_id,
+                "venue_id": venue_id,
+                "home_score": state.get("home_score", 0),
+                "away_score": state.get("away_score", 0),
+                "period": state.get("period", 0),
+                "clock_seconds": clock_seconds,
+                "clock_display": state.get("clock_display"),
+                "game_status": normalized_status,
+                "game_date": game_date,
+                "broadcast": metadata.get("broadcast"),
+                "neutral_site": metadata.get("neutral_site", False),
+                "season_type": game_season_type,
+                "week_number": game_week_number,
+                "league": league,
+                "situation": situation,
+                "linescores": state.get("linescores"),
+                "game_id": game_id,
+            },
         )
 
-        # Update final result in games dimension if game is complete
-        if game_id and normalized_status == "final":
-            try:
-                update_game_result(
-                    game_id=game_id,
-                    home_score=state.get("home_score", 0),
-                    away_score=state.get("away_score", 0),
-                )
-            except Exception:
-                logger.warning(
-                    "Failed to update game result for game_id=%s",
-                    game_id,
-                    exc_info=True,
-                )
+    def _finish_game_sync(self, sync: _GameSync, result_id: int | None) -> bool:
+        """
+        Run the follow-up writes for a game after its state upsert.
+
+        Records the final result (and live Elo) for completed games and
+        upserts odds. Both are non-blocking.
+
+        Args:
+            sync: Prepared sync from _prepare_game_sync()
+            result_id: New game_states row id, or None if unchanged
+
+        Returns:
+            True if a new game_states row was written
+        """
+        state = sync.game.get("state", {})
+        game_id = sync.game_id
+        home_score = state.get("home_score", 0)
+        away_score = state.get("away_score", 0)
+
+        if result_id is not None and game_id:
+            self._publish_game_state(game_id, result_id)
+
+        # Record the final result (and live Elo) if the game is complete. A
+        # re-polled final with the same score was already recorded; the key
+        # is only cached once both steps succeed, so a failure is retried on
+        # the next poll that syncs the game.
+        result_key = ("result", game_id, home_score, away_score)
+        if (
+            game_id
+            and sync.state_row["game_status"] == "final"
+            and (result_id is not None or not self._dimension_cache.contains(result_key))
+        ):
+            finished = self._record_final_result(sync, game_id, home_score, away_score)
+            if finished:
+                self._dimension_cache.put(result_key, True)
+            with self._lock:
+                if finished:
+                    self._unfinished_finals.discard(sync.espn_event_id)
+                else:
+                    self._unfinished_finals.add(sync.espn_event_id)
 
         # Extract and upsert DraftKings odds (if available).
         # Wrapped in try/except — odds failure NEVER blocks game state sync.
         if game_id:
             try:
                 self._extract_and_upsert_odds(
-                    game=game,
+                    game=sync.game,
                     game_id=game_id,
-                    league=league,
-                    game_date=game_date,
-                    home_team_code=home_team_info.get("team_code"),
-                    away_team_code=away_team_info.get("team_code"),
-                    home_team_id=home_team_id,
-                    away_team_id=away_team_id,
+                    league=sync.league,
+                    game_date=sync.game_date,
+                    home_team_code=sync.home_team_info.get("team_code"),
+                    away_team_code=sync.away_team_info.get("team_code"),
+                    home_team_id=sync.home_team_id,
+                    away_team_id=sync.away_team_id,
                 )
             except Exception:
                 logger.warning(
@@ -1468,6 +1873,82 @@ class ESPNGamePoller(BasePoller):
         # Only count as "updated" when a new SCD row was actually created.
         return result_id is not None
 
+    def _publish_game_state(self, game_id: int, game_state_id: int) -> None:
+        """Announce a new game_states row on the alignment bus (no-op without listeners)."""
+        bus = get_alignment_event_bus()
+        if not bus.has_listeners:
+            return
+        bus.publish_game_state(
+            GameStateWritten(
+                game_id=game_id,
+                game_state_id=game_state_id,
+                state_time=datetime.now(UTC),
+            )
+        )
+
+    def _record_final_result(
+        self, sync: _GameSync, game_id: int, home_score: int, away_score: int
+    ) -> bool:
+        """
+        Write a final game's result and apply its live Elo update.
+
+        Both steps are idempotent per game (update_game_result overwrites,
+        apply_game_elo_update skips a game already logged), so this is safe
+        to repeat on every poll that sees the final until it succeeds.
+
+        Returns:
+            True if both steps succeeded (non-blocking: failures are logged)
+        """
+        try:
+            update_game_result(
+                game_id=game_id,
+                home_score=home_score,
+                away_score=away_score,
+            )
+        except Exception:
+            logger.warning(
+                "Failed to update game result for game_id=%s",
+                game_id,
+                exc_info=True,
+            )
+            return False
+        return self._apply_live_elo(sync)
+
+    def _apply_live_elo(self, sync: _GameSync) -> bool:
+        """
+        Apply the incremental Elo update for a final game (non-blocking).
+
+        Returns:
+            False if the update failed, True otherwise (applied, already
+            applied, skipped, or live Elo disabled)
+        """
+        if self._live_elo is None or sync.game_id is None or sync.game_date is None:
+            return True
+        state = sync.game.get("state", {})
+        try:
+            self._live_elo.apply_final_game(
+                game_id=sync.game_id,
+                league=sync.league,
+                game_date=sync.game_date.date(),
+                home_team_id=sync.home_team_id,
+                away_team_id=sync.away_team_id,
+                home_team_code=sync.home_team_info.get("team_code", ""),
+                away_team_code=sync.away_team_info.get("team_code", ""),
+                home_score=state.get("home_score", 0),
+                away_score=state.get("away_score", 0),
+                season=sync.game_date.year,  # the games.season written for this game
+                season_type=sync.state_row["season_type"],
+                neutral_site=bool(sync.state_row["neutral_site"]),
+            )
+        except Exception:
+            logger.warning(
+                "Live Elo update failed for game_id=%s (non-blocking)",
+                sync.game_id,
+                exc_info=True,
+            )
+            return False
+        return True
+
     def _extract_and_upsert_odds(
         self,
         game: ESPNGameFull,
@@ -1481,7 +1962,7 @@ class ESPNGamePoller(BasePoller):
     ) -> None:
         """Extract DraftKings odds from ESPN data and upsert to game_odds.
 
-        Called from _sync_game_to_db after game dimension upsert succeeds.
+        Called from _finish_game_sync after the game state upsert.
         Uses extract_espn_odds() to parse the raw competition odds, then
         upsert_game_odds() with SCD Type 2 versioning.
 
@@ -1572,21 +2053,29 @@ class ESPNGamePoller(BasePoller):
 
         Returns:
             Database team_id, or None if not found
+
+        Educational Note:
+            Results, including "not found", are held in the dimension cache,
+            so an unmapped team is looked up (and warned about) once per TTL
+            instead of on every poll.
         """
         if not espn_team_id:
             return None
 
-        team = get_team_by_espn_id(espn_team_id, league)
-        if team:
-            return int(team["team_id"])
+        def load() -> int | None:
+            team = get_team_by_espn_id(espn_team_id, league)
+            if team:
+                return int(team["team_id"])
 
-        logger.warning(
-            "Team not found: espn_id=%s, league=%s, code=%s",
-            espn_team_id,
-            league,
-            team_code,
-        )
-        return None
+            logger.warning(
+                "Team not found: espn_id=%s, league=%s, code=%s",
+                espn_team_id,
+                league,
+                team_code,
+            )
+            return None
+
+        return self._dimension_cache.get_or_load(("team", league, espn_team_id), load)
 
     def _ensure_venue_normalized(self, venue_info: ESPNVenueInfo) -> int | None:
         """
@@ -1611,14 +2100,18 @@ class ESPNGamePoller(BasePoller):
         if not venue_name:
             return None
 
+        venue_kwargs: dict[str, Any] = {
+            "espn_venue_id": venue_info.get("espn_venue_id", venue_name),
+            "venue_name": venue_name,
+            "city": venue_info.get("city"),
+            "state": venue_info.get("state"),
+            "capacity": venue_info.get("capacity"),
+            "indoor": venue_info.get("indoor", False),
+        }
         try:
-            return create_venue(
-                espn_venue_id=venue_info.get("espn_venue_id", venue_name),
-                venue_name=venue_name,
-                city=venue_info.get("city"),
-                state=venue_info.get("state"),
-                capacity=venue_info.get("capacity"),
-                indoor=venue_info.get("indoor", False),
+            return self._dimension_cache.get_or_load(
+                ("venue", *sorted(venue_kwargs.items())),
+                lambda: create_venue(**venue_kwargs),
             )
         except Exception as e:
             logger.warning("Could not create/get venue %s: %s", venue_name, e)
@@ -1682,6 +2175,7 @@ def create_espn_poller(
     persist_jobs: bool = False,
     job_store_url: str | None = None,
     priority_calculator: Any | None = None,
+    live_elo: bool = False,
 ) -> ESPNGamePoller:
     """
     Factory function to create a configured ESPNGamePoller.
@@ -1692,6 +2186,7 @@ def create_espn_poller(
         idle_interval: Seconds between polls when idle (default: 300)
         persist_jobs: If True, persist scheduled jobs to database.
         job_store_url: SQLAlchemy URL for job store (required if persist_jobs=True).
+        live_elo: If True, update Elo ratings incrementally as games go final.
 
     Returns:
         Configured ESPNGamePoller instance
@@ -1721,6 +2216,7 @@ def create_espn_poller(
         persist_jobs=persist_jobs,
         job_store_url=job_store_url,
         priority_calculator=priority_calculator,
+        live_elo=live_elo,
     )
 
 
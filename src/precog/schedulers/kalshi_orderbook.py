@@ -0,0 +1,499 @@
+"""
+In-memory Kalshi order books built from WebSocket orderbook channel messages.
+
+KalshiWebSocketHandler subscribes to the ``orderbook_delta`` channel, which
+sends one ``orderbook_snapshot`` per market followed by incremental
+``orderbook_delta`` messages. This module keeps a live book per market and
+periodically persists depth snapshots to ``orderbook_snapshots`` (migration
+0034) without writing every delta.
+
+Components:
+    OrderBook: One market's book. Both sides are compact sorted arrays of
+        integer price ticks (1 tick = $0.0001) with parallel quantities, so a
+        level update is a bisect plus an in-place edit, and best bid/ask,
+        depth totals, imbalance and weighted mid are O(1).
+    OrderBookStore: Thread-safe ticker -> OrderBook map fed by the handler.
+    OrderBookSampler: Background thread that writes throttled snapshots of
+        books that changed since their last sample via
+        insert_orderbook_snapshots_batch().
+
+Educational Note:
+    Kalshi books are two bid ladders: YES bids and NO bids. A NO bid at price
+    p is equivalent to a YES ask at 1 - p, so the YES-denominated view is:
+        best_bid = highest YES bid
+        best_ask = 1 - highest NO bid
+    Storing ticks as integers keeps the hot path free of Decimal arithmetic;
+    Decimal values (ADR-002) are produced only when a snapshot is taken.
+
+Reference: Issue #443 (Orderbook depth storage)
+Related:
+    - Migration 0034: orderbook_snapshots table
+    - ADR-002: Decimal Precision for All Financial Data
+"""
+
+import itertools
+import logging
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable
+from decimal import ROUND_HALF_EVEN, Decimal
+from typing import Any, ClassVar
+
+from precog.database.crud_markets import (
+    get_current_markets_by_tickers,
+    insert_orderbook_snapshots_batch,
+)
+from precog.utils.bounded_state import BoundedStateMap
+
+logger = logging.getLogger(__name__)
+
+# Price ticks per dollar: matches DECIMAL(10,4) storage precision
+PRICE_SCALE = 10_000
+_FOUR_PLACES = Decimal("0.0001")
+
+# Process-wide book versions: a book recreated after clear() never reuses a
+# version the sampler has already persisted
+_BOOK_VERSIONS = itertools.count(1)
+
+
+def _ticks_to_decimal(ticks: int) -> Decimal:
+    """Convert integer price ticks to a 4-place Decimal dollar price."""
+    return Decimal(ticks).scaleb(-4)
+
+
+def _dollars_to_ticks(value: str | Decimal) -> int:
+    """Convert a dollar price ("0.4550") to integer ticks (4550)."""
+    return int((Decimal(value) * PRICE_SCALE).to_integral_value(rounding=ROUND_HALF_EVEN))
+
+
+def _parse_levels(msg: dict[str, Any], side: str) -> list[tuple[int, int]]:
+    """
+    Extract (price_ticks, quantity) levels for one side of a snapshot message.
+
+    Prefers sub-penny ``{side}_dollars`` levels, falling back to integer cents.
+    """
+    dollar_levels = msg.get(f"{side}_dollars")
+    if dollar_levels is not None:
+        return [(_dollars_to_ticks(price), int(qty)) for price, qty in dollar_levels]
+    return [(int(price) * 100, int(qty)) for price, qty in msg.get(side) or []]
+
+
+class _BookSide:
+    """One bid ladder: ascending price ticks with parallel quantities and a running total."""
+
+    __slots__ = ("prices", "quantities", "total")
+
+    def __init__(self) -> None:
+        self.prices: array[int] = array("q")
+        self.quantities: array[int] = array("q")
+        self.total = 0
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def replace(self, levels: Iterable[tuple[int, int]]) -> None:
+        """Replace all levels (snapshot). Duplicate prices are summed; non-positive dropped."""
+        merged: dict[int, int] = {}
+        for price, quantity in levels:
+            merged[price] = merged.get(price, 0) + quantity
+        ordered = sorted((p, q) for p, q in merged.items() if q > 0)
+        self.prices = array("q", (p for p, _ in ordered))
+        self.quantities = array("q", (q for _, q in ordered))
+        self.total = sum(self.quantities)
+
+    def apply(self, price: int, delta: int) -> None:
+        """Add delta contracts at price, removing the level when it reaches zero."""
+        i = bisect_left(self.prices, price)
+        if i < len(self.prices) and self.prices[i] == price:
+            quantity = self.quantities[i] + delta
+            if quantity <= 0:
+                self.total -= self.quantities[i]
+                del self.prices[i]
+                del self.quantities[i]
+            else:
+                self.quantities[i] = quantity
+                self.total += delta
+        elif delta > 0:
+            self.prices.insert(i, price)
+            self.quantities.insert(i, delta)
+            self.total += delta
+
+    def best(self) -> tuple[int, int] | None:
+        """Highest bid as (price_ticks, quantity), or None if empty."""
+        if not self.prices:
+            return None
+        return self.prices[-1], self.quantities[-1]
+
+    def top(self, levels: int) -> tuple[list[int], list[int]]:
+        """Best ``levels`` bids, best first."""
+        start = max(len(self.prices) - levels, 0)
+        return list(reversed(self.prices[start:])), list(reversed(self.quantities[start:]))
+
+
+class OrderBook:
+    """
+    Live order book for one market, in YES-denominated terms.
+
+    All accessors are O(1): they read the ends of the sorted arrays and the
+    running depth totals maintained by each update.
+
+    Example:
+        >>> book = OrderBook("KXNFLGAME-25NOV29-BUF")
+        >>> book.apply_snapshot([(5000, 200), (4900, 300)], [(4800, 150), (4700, 150)])
+        >>> book.best_bid, book.best_ask
+        (Decimal('0.5000'), Decimal('0.5200'))
+    """
+
+    __slots__ = ("no", "ticker", "updated_at", "version", "yes")
+
+    def __init__(self, ticker: str) -> None:
+        self.ticker = ticker
+        self.yes = _BookSide()
+        self.no = _BookSide()
+        self.version = 0
+        self.updated_at = 0.0
+
+    def apply_snapshot(
+        self, yes_levels: Iterable[tuple[int, int]], no_levels: Iterable[tuple[int, int]]
+    ) -> None:
+        """Replace both ladders from (price_ticks, quantity) levels."""
+        self.yes.replace(yes_levels)
+        self.no.replace(no_levels)
+        self._touch()
+
+    def apply_delta(self, side: str, price: int, delta: int) -> None:
+        """Apply a quantity change at price_ticks on the "yes" or "no" ladder."""
+        if side == "yes":
+            self.yes.apply(price, delta)
+        elif side == "no":
+            self.no.apply(price, delta)
+        else:
+            raise ValueError(f"Unknown orderbook side: {side!r}")
+        self._touch()
+
+    def _touch(self) -> None:
+        self.version = next(_BOOK_VERSIONS)
+        self.updated_at = time.monotonic()
+
+    @property
+    def best_bid(self) -> Decimal | None:
+        """Highest YES bid."""
+        best = self.yes.best()
+        return _ticks_to_decimal(best[0]) if best else None
+
+    @property
+    def best_ask(self) -> Decimal | None:
+        """Lowest YES ask (1 - highest NO bid)."""
+        best = self.no.best()
+        return _ticks_to_decimal(PRICE_SCALE - best[0]) if best else None
+
+    @property
+    def spread(self) -> Decimal | None:
+        """best_ask - best_bid, or None if either side is empty."""
+        bid = self.yes.best()
+        ask = self.no.best()
+        if bid is None or ask is None:
+            return None
+        return _ticks_to_decimal(PRICE_SCALE - ask[0] - bid[0])
+
+    @property
+    def bid_depth_total(self) -> int:
+        """Total contracts resting on the YES bid ladder."""
+        return self.yes.total
+
+    @property
+    def ask_depth_total(self) -> int:
+        """Total contracts resting on the YES ask side (NO bid ladder)."""
+        return self.no.total
+
+    @property
+    def depth_imbalance(self) -> Decimal | None:
+        """(bid_depth - ask_depth) / total depth in [-1, 1]; negative = ask-heavy."""
+        total = self.yes.total + self.no.total
+        if total == 0:
+            return None
+        return (Decimal(self.yes.total - self.no.total) / total).quantize(_FOUR_PLACES)
+
+    @property
+    def weighted_mid(self) -> Decimal | None:
+        """Best bid and best ask weighted by their side's total depth."""
+        bid = self.yes.best()
+        ask = self.no.best()
+        total = self.yes.total + self.no.total
+        if bid is None or ask is None or total == 0:
+            return None
+        weighted_ticks = Decimal(bid[0] * self.yes.total + (PRICE_SCALE - ask[0]) * self.no.total)
+        return (weighted_ticks / total).scaleb(-4).quantize(_FOUR_PLACES)
+
+    def to_snapshot(self, levels: int) -> dict[str, Any]:
+        """
+        Build insert_orderbook_snapshot() kwargs (minus market_id) for the top levels.
+
+        Bid arrays are ordered best (highest) first; ask arrays best (lowest) first.
+        """
+        bid_ticks, bid_quantities = self.yes.top(levels)
+        no_ticks, ask_quantities = self.no.top(levels)
+        return {
+            "best_bid": self.best_bid,
+            "best_ask": self.best_ask,
+            "spread": self.spread,
+            "bid_depth_total": self.bid_depth_total,
+            "ask_depth_total": self.ask_depth_total,
+            "depth_imbalance": self.depth_imbalance,
+            "weighted_mid": self.weighted_mid,
+            "bid_prices": [_ticks_to_decimal(t) for t in bid_ticks],
+            "bid_quantities": bid_quantities,
+            "ask_prices": [_ticks_to_decimal(PRICE_SCALE - t) for t in no_ticks],
+            "ask_quantities": ask_quantities,
+            "levels": max(len(bid_ticks), len(no_ticks)),
+        }
+
+
+class OrderBookStore:
+    """
+    Thread-safe collection of live order books keyed by market ticker.
+
+    Fed from the WebSocket event loop thread; read by OrderBookSampler's
+    thread. Deltas for a market without a snapshot are dropped (and counted)
+    because they cannot be applied to an unknown base state.
+    """
+
+    def __init__(self) -> None:
+        self._books: dict[str, OrderBook] = {}
+        self._lock = threading.Lock()
+        self._stats: dict[str, int] = {
+            "orderbook_snapshots_applied": 0,
+            "orderbook_deltas_applied": 0,
+            "orderbook_deltas_dropped": 0,
+        }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._books)
+
+    def apply_snapshot_message(self, msg: dict[str, Any]) -> bool:
+        """Apply an ``orderbook_snapshot`` msg body. Returns False if it has no ticker."""
+        ticker = msg.get("market_ticker")
+        if not ticker:
+            return False
+        yes_levels = _parse_levels(msg, "yes")
+        no_levels = _parse_levels(msg, "no")
+        with self._lock:
+            book = self._books.get(ticker)
+            if book is None:
+                book = self._books[ticker] = OrderBook(ticker)
+            book.apply_snapshot(yes_levels, no_levels)
+            self._stats["orderbook_snapshots_applied"] += 1
+        return True
+
+    def apply_delta_message(self, msg: dict[str, Any]) -> bool:
+        """Apply an ``orderbook_delta`` msg body. Returns False if it was dropped."""
+        ticker = msg.get("market_ticker")
+        side = msg.get("side")
+        price_dollars = msg.get("price_dollars")
+        if price_dollars is not None:
+            price = _dollars_to_ticks(price_dollars)
+        elif msg.get("price") is not None:
+            price = int(msg["price"]) * 100
+        else:
+            price = None
+        delta = msg.get("delta")
+
+        with self._lock:
+            book = self._books.get(ticker) if ticker else None
+            if book is None or side not in ("yes", "no") or price is None or delta is None:
+                self._stats["orderbook_deltas_dropped"] += 1
+                return False
+            book.apply_delta(side, price, int(delta))
+            self._stats["orderbook_deltas_applied"] += 1
+        return True
+
+    def get(self, ticker: str) -> OrderBook | None:
+        """Return the live book for ticker (shared, do not mutate), or None."""
+        with self._lock:
+            return self._books.get(ticker)
+
+    def remove(self, tickers: Iterable[str]) -> None:
+        """Drop books (e.g. after unsubscribing)."""
+        with self._lock:
+            for ticker in tickers:
+                self._books.pop(ticker, None)
+
+    def clear(self) -> None:
+        """Drop every book (e.g. on reconnect, before fresh snapshots arrive)."""
+        with self._lock:
+            self._books.clear()
+
+    def changed_since(
+        self, versions: dict[str, int], levels: int
+    ) -> list[tuple[str, int, dict[str, Any]]]:
+        """
+        Snapshot every book whose version differs from ``versions``.
+
+        Returns:
+            List of (ticker, version, snapshot kwargs) built under the lock,
+            so each snapshot is internally consistent.
+        """
+        with self._lock:
+            return [
+                (ticker, book.version, book.to_snapshot(levels))
+                for ticker, book in self._books.items()
+                if versions.get(ticker) != book.version
+            ]
+
+    def get_stats(self) -> dict[str, int]:
+        """Return message counters and the number of live books."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["orderbook_books"] = len(self._books)
+            return stats
+
+
+class OrderBookSampler:
+    """
+    Throttled persistence of OrderBookStore depth snapshots.
+
+    Every ``interval`` seconds, books that changed since their last sample are
+    written with one insert_orderbook_snapshots_batch() call, so each market
+    produces at most one orderbook_snapshots row per interval no matter how
+    many deltas arrive. Markets not yet in the database are skipped until
+    the poller creates them.
+
+    Crossed books (best bid above best ask, i.e. a negative spread) are not
+    persisted: orderbook_snapshots enforces spread >= 0, and one such row
+    would fail the whole batch on every interval. A crossed book is
+    re-sampled once a later delta changes it.
+    """
+
+    DEFAULT_INTERVAL: ClassVar[float] = 5.0  # seconds
+    DEFAULT_LEVELS: ClassVar[int] = 10  # depth levels per side
+
+    def __init__(
+        self,
+        store: OrderBookStore,
+        interval: float = DEFAULT_INTERVAL,
+        levels: int = DEFAULT_LEVELS,
+    ) -> None:
+        """
+        Initialize an idle sampler (call start() to begin sampling).
+
+        Args:
+            store: Books to sample.
+            interval: Seconds between samples.
+            levels: Depth levels captured per side.
+
+        Raises:
+            ValueError: If interval <= 0 or levels < 1.
+        """
+        if interval <= 0:
+            raise ValueError("interval must be > 0")
+        if levels < 1:
+            raise ValueError("levels must be >= 1")
+
+        self.store = store
+        self.interval = interval
+        self.levels = levels
+
+        # ticker -> book version last persisted
+        self._sampled_versions: dict[str, int] = {}
+        # ticker -> markets.id (surrogate keys never change)
+        self._market_ids: BoundedStateMap[str, int] = BoundedStateMap("orderbook_market_ids")
+        self._sample_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._stats: dict[str, int | float] = {
+            "orderbook_samples_written": 0,
+            "orderbook_sample_errors": 0,
+            "orderbook_crossed_skipped": 0,
+            "orderbook_last_sample_ms": 0.0,
+        }
+
+    def start(self) -> None:
+        """Start the background sampling thread (no-op if already running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="kalshi-orderbook-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Stop sampling and persist one final sample of changed books."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+        self.sample()
+
+    def sample(self) -> int:
+        """
+        Persist every book changed since its last sample.
+
+        Returns:
+            Number of snapshot rows written.
+        """
+        with self._sample_lock:
+            start = time.perf_counter()
+            changed = self.store.changed_since(self._sampled_versions, self.levels)
+            if not changed:
+                return 0
+
+            try:
+                unknown = [ticker for ticker, _, _ in changed if ticker not in self._market_ids]
+                if unknown:
+                    for ticker, row in get_current_markets_by_tickers(unknown).items():
+                        self._market_ids[ticker] = row["id"]
+
+                rows: list[dict[str, Any]] = []
+                versions: dict[str, int] = {}
+                crossed = 0
+                for ticker, version, snapshot in changed:
+                    market_id = self._market_ids.get(ticker)
+                    if market_id is None:
+                        continue
+                    versions[ticker] = version
+                    if snapshot["spread"] is not None and snapshot["spread"] < 0:
+                        crossed += 1
+                        continue
+                    rows.append({"market_id": market_id, **snapshot})
+
+                if rows:
+                    insert_orderbook_snapshots_batch(rows)
+                self._sampled_versions.update(versions)
+            except Exception as e:
+                # Versions not advanced: the books are re-sampled next interval
+                with self._stats_lock:
+                    self._stats["orderbook_sample_errors"] += 1
+                logger.error("Orderbook sample of %d books failed: %s", len(changed), e)
+                return 0
+
+            if crossed:
+                logger.debug("Skipped %d crossed orderbooks", crossed)
+            with self._stats_lock:
+                self._stats["orderbook_samples_written"] += len(rows)
+                self._stats["orderbook_crossed_skipped"] += crossed
+                self._stats["orderbook_last_sample_ms"] = round(
+                    (time.perf_counter() - start) * 1000, 3
+                )
+            return len(rows)
+
+    def forget(self, tickers: Iterable[str]) -> None:
+        """Drop sampling state for tickers no longer tracked."""
+        with self._sample_lock:
+            for ticker in tickers:
+                self._sampled_versions.pop(ticker, None)
+                self._market_ids.pop(ticker, None)
+
+    def get_stats(self) -> dict[str, int | float]:
+        """Return sample counters and market id cache gauges."""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats.update(self._market_ids.get_stats())
+        return stats
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
@@ -55,6 +55,7 @@ from precog.database.crud_game_states import (
     build_event_result,
     check_event_fully_settled,
     update_bracket_counts,
+    update_bracket_counts_for_events,
     update_event,
     update_event_game_id,
 )
@@ -62,11 +63,16 @@ from precog.database.crud_markets import (
     count_open_markets,
     create_market,
     get_current_market,
+    get_current_markets_by_tickers,
     update_market_with_versioning,
+    update_markets_with_versioning_batch,
 )
 from precog.database.crud_system import create_alert
 from precog.matching.event_game_matcher import EventGameMatcher
+from precog.schedulers.alignment_bus import get_alignment_event_bus
 from precog.schedulers.base_poller import BasePoller
+from precog.schedulers.market_price_cache import MarketPriceCache, get_market_price_cache
+from precog.utils.bounded_state import BoundedStateMap
 from precog.validation.kalshi_validation import KalshiDataValidator
 
 # Set up logging
@@ -192,9 +198,9 @@ class KalshiMarketPoller(BasePoller):
     REGISTRY_REFRESH_INTERVAL: ClassVar[int] = 40
 
     # Validation frequency: run full market validation every N polls.
-    # At 15s interval, 10 polls = ~2.5 minutes. Validation checks all
-    # markets per series (~7K+) so running every cycle is wasteful.
-    VALIDATION_INTERVAL: ClassVar[int] = 10
+    # Columnar validation (KalshiDataValidator.validate_market_batch) is
+    # cheap enough for the ~7K+ markets per series to check every cycle.
+    VALIDATION_INTERVAL: ClassVar[int] = 1
 
     # Backfill frequency: run matching backfill every N polls.
     # At 15s interval, 40 polls = ~10 minutes. Backfill scans all
@@ -223,6 +229,9 @@ class KalshiMarketPoller(BasePoller):
         poll_interval: int | None = None,
         environment: str = "demo",
         kalshi_client: KalshiClient | None = None,
+        batch_sync: bool = False,
+        fetch_workers: int = 1,
+        price_cache: MarketPriceCache | None = None,
     ) -> None:
         """
         Initialize the KalshiMarketPoller.
@@ -233,12 +242,25 @@ class KalshiMarketPoller(BasePoller):
             poll_interval: Seconds between polls. Minimum 5 seconds.
             environment: Kalshi environment ("demo" or "prod").
             kalshi_client: Optional KalshiClient instance (for testing/mocking).
+            batch_sync: If True, sync each series page with one current-market
+                lookup and one write transaction (_sync_markets_batch) instead
+                of one lookup + one versioned write per market.
+            fetch_workers: Number of series paginated concurrently. 1 (default)
+                polls series sequentially; > 1 streams pages from
+                KalshiClient.iter_market_pages() and syncs each page as it
+                arrives (_poll_series_streaming).
+            price_cache: Cache of last persisted prices, written through after
+                every market read/write. Defaults to the process-wide cache
+                shared with KalshiWebSocketHandler.
 
         Raises:
-            ValueError: If poll_interval < 5 or environment invalid.
+            ValueError: If poll_interval < 5, fetch_workers < 1, or
+                environment invalid.
         """
         if environment not in ("demo", "prod"):
             raise ValueError("environment must be 'demo' or 'prod'")
+        if fetch_workers < 1:
+            raise ValueError("fetch_workers must be >= 1")
 
         # Initialize base class (handles scheduler, stats, etc.)
         super().__init__(poll_interval=poll_interval, logger=logger)
@@ -246,6 +268,9 @@ class KalshiMarketPoller(BasePoller):
         # Kalshi-specific configuration
         self.series_tickers = series_tickers or self.DEFAULT_SERIES_TICKERS.copy()
         self.environment = environment
+        self.batch_sync = batch_sync
+        self.fetch_workers = fetch_workers
+        self.price_cache = price_cache if price_cache is not None else get_market_price_cache()
 
         # Consecutive polls with no changes (for heartbeat logging)
         self._silent_poll_count: int = 0
@@ -267,7 +292,15 @@ class KalshiMarketPoller(BasePoller):
         # Populated by _sync_market_to_db() via get_or_create_event(), consumed
         # when creating markets (markets.event_id FK).
         # See migration 0020: events now uses SERIAL PK instead of VARCHAR PK.
-        self._event_id_map: dict[str, int] = {}
+        # An event's entry is retired once the event goes final.
+        self._event_id_map: BoundedStateMap[str, int] = BoundedStateMap("event_id_map")
+
+        # Events whose market set changed since bracket_count was last
+        # refreshed (a market was created under them). Only these events are
+        # recounted after each poll; the first cycle runs one full
+        # update_bracket_counts() to reconcile rows written elsewhere.
+        self._bracket_dirty_events: set[int] = set()
+        self._bracket_counts_reconciled: bool = False
 
         # Event-to-game matcher (Issue #462). Matches Kalshi events to ESPN
         # games by parsing team codes from event tickers. The registry is
@@ -311,19 +344,27 @@ class KalshiMarketPoller(BasePoller):
         self._should_validate: bool = False  # Set per-cycle in _poll_once
 
         logger.info(
-            "KalshiMarketPoller initialized: series=%s, poll_interval=%ds, env=%s",
+            "KalshiMarketPoller initialized: series=%s, poll_interval=%ds, env=%s, "
+            "batch_sync=%s, fetch_workers=%d",
             self.series_tickers,
             self.poll_interval,
             self.environment,
+            self.batch_sync,
+            self.fetch_workers,
         )
 
     def get_stats(self) -> dict[str, Any]:
-        """Get stats including validation and matching counters."""
+        """Get stats including validation, matching, price cache and per-ticker state gauges."""
         with self._lock:
             stats = dict(self._stats)
             stats.update(self._validation_stats)
             stats.update(self._matching_stats)
-            return stats
+        stats.update(self.price_cache.get_stats())
+        stats.update(self._validator.get_state_stats())
+        stats.update(self._event_id_map.get_stats())
+        if self._event_game_matcher is not None:
+            stats.update(self._event_game_matcher.registry.get_state_stats())
+        return stats
 
     def _get_job_name(self) -> str:
         """Return human-readable name for the polling job."""
@@ -361,28 +402,26 @@ class KalshiMarketPoller(BasePoller):
         total_updated = 0
         total_created = 0
 
-        for series in self.series_tickers:
-            try:
-                fetched, updated, created = self._poll_series(series)
-                total_fetched += fetched
-                total_updated += updated
-                total_created += created
-            except Exception as e:
-                # Log but don't re-raise - allow other series to continue
-                logger.error("Error polling series %s: %s", series, e)
-                with self._lock:
-                    self._stats["errors"] += 1
-                    self._stats["last_error"] = str(e)
-
-        # Post-poll batch: recompute bracket_count for all markets.
-        # bracket_count = number of markets sharing the same parent event.
-        # Only rows where the value actually changed are written.
-        try:
-            bracket_updated = update_bracket_counts()
-            if bracket_updated:
-                logger.debug("Updated bracket_count for %d markets", bracket_updated)
-        except Exception as e:
-            logger.warning("Failed to update bracket counts: %s", e)
+        if self._use_streaming_fetch(self.series_tickers):
+            # Concurrent fetch: errors are handled per series inside the stream
+            total_fetched, total_updated, total_created = self._poll_series_streaming(
+                self.series_tickers
+            )
+        else:
+            for series in self.series_tickers:
+                try:
+                    fetched, updated, created = self._poll_series(series)
+                    total_fetched += fetched
+                    total_updated += updated
+                    total_created += created
+                except Exception as e:
+                    # Log but don't re-raise - allow other series to continue
+                    logger.error("Error polling series %s: %s", series, e)
+                    self._record_series_error(e)
+
+        # Post-poll batch: recount bracket_count for events that gained
+        # markets this cycle (see _refresh_bracket_counts).
+        self._refresh_bracket_counts()
 
         # Post-poll batch: attempt to link unmatched events to games.
         # Rate-limited: only runs every BACKFILL_INTERVAL polls (~10 min).
@@ -670,19 +709,19 @@ class KalshiMarketPoller(BasePoller):
         total_updated = 0
         total_created = 0
 
-        for series in target_series:
-            fetched, updated, created = self._poll_series(series)
-            total_fetched += fetched
-            total_updated += updated
-            total_created += created
+        if self._use_streaming_fetch(target_series):
+            total_fetched, total_updated, total_created = self._poll_series_streaming(
+                target_series, raise_errors=True
+            )
+        else:
+            for series in target_series:
+                fetched, updated, created = self._poll_series(series)
+                total_fetched += fetched
+                total_updated += updated
+                total_created += created
 
-        # Post-poll batch: recompute bracket_count for all markets.
-        try:
-            bracket_updated = update_bracket_counts()
-            if bracket_updated:
-                logger.debug("Updated bracket_count for %d markets", bracket_updated)
-        except Exception as e:
-            logger.warning("Failed to update bracket counts: %s", e)
+        # Post-poll batch: recount bracket_count for changed events.
+        self._refresh_bracket_counts()
 
         return {
             "items_fetched": total_fetched,
@@ -690,6 +729,34 @@ class KalshiMarketPoller(BasePoller):
             "items_created": total_created,
         }
 
+    def _refresh_bracket_counts(self) -> None:
+        """
+        Bring bracket_count up to date after a poll cycle.
+
+        bracket_count = number of markets sharing the same parent event. It
+        only changes when an event gains a market, which in this poller
+        happens on the create path (existing markets are never re-parented),
+        so only events recorded in _bracket_dirty_events are recounted.
+        The first cycle runs one full update_bracket_counts() instead, to
+        reconcile markets written before this poller started. On failure
+        the dirty set is kept and retried next cycle.
+        """
+        try:
+            if not self._bracket_counts_reconciled:
+                bracket_updated = update_bracket_counts()
+                self._bracket_counts_reconciled = True
+            elif self._bracket_dirty_events:
+                bracket_updated = update_bracket_counts_for_events(
+                    sorted(self._bracket_dirty_events)
+                )
+            else:
+                return
+            self._bracket_dirty_events.clear()
+            if bracket_updated:
+                logger.debug("Updated bracket_count for %d markets", bracket_updated)
+        except Exception as e:
+            logger.warning("Failed to update bracket counts: %s", e)
+
     def _poll_series(self, series_ticker: str) -> tuple[int, int, int]:
         """
         Poll a single series and update market prices.
@@ -723,130 +790,264 @@ class KalshiMarketPoller(BasePoller):
         # Validate fetched market data (soft validation — log issues, never block ingestion).
         # Runs on raw API data before any DB mapping or filtering.
         # Rate-limited via self._should_validate (set in _poll_once every VALIDATION_INTERVAL polls).
-        # Wrapped in try/except: a validator bug must NEVER prevent market syncing.
         if self._should_validate:
+            self._validate_series_markets(series_ticker, all_markets)
+
+        markets_updated, markets_created = self._sync_markets(
+            all_markets, series_ticker=series_ticker
+        )
+        self._log_series_summary(series_ticker, len(all_markets), markets_updated, markets_created)
+
+        return len(all_markets), markets_updated, markets_created
+
+    def _use_streaming_fetch(self, series_tickers: list[str]) -> bool:
+        """Return True when series should be fetched concurrently and streamed."""
+        return self.fetch_workers > 1 and len(series_tickers) > 1
+
+    def _record_series_error(self, error: Exception) -> None:
+        """Count a failed series poll in the base poller stats."""
+        with self._lock:
+            self._stats["errors"] += 1
+            self._stats["last_error"] = str(error)
+
+    def _poll_series_streaming(
+        self, series_tickers: list[str], raise_errors: bool = False
+    ) -> tuple[int, int, int]:
+        """
+        Poll several series concurrently, syncing each page as it arrives.
+
+        Pages are pulled from KalshiClient.iter_market_pages(), which walks
+        up to fetch_workers series at once on worker threads. All DB work
+        stays on this (the polling) thread, so sync of page N overlaps the
+        network fetch of later pages without making the sync path
+        multi-threaded.
+
+        Args:
+            series_tickers: Series to poll
+            raise_errors: Re-raise the first series error (manual poll_once
+                semantics) instead of logging it and continuing.
+
+        Returns:
+            Tuple of (markets_fetched, markets_updated, markets_created)
+
+        Educational Note:
+            Validation still runs per series on the complete market list,
+            so pages are buffered until the series' last page arrives, but
+            only on cycles where validation is due.  Pages synced before a
+            series fails mid-pagination stay synced (the sequential path
+            would have synced none of that series).
+        """
+        total_fetched = 0
+        total_updated = 0
+        total_created = 0
+        # series -> [fetched, updated, created]
+        series_counts: dict[str, list[int]] = {}
+        validation_buffers: dict[str, list[ProcessedMarketData]] = {}
+        failed_series: set[str] = set()
+
+        for page in self.kalshi_client.iter_market_pages(
+            series_tickers, max_workers=self.fetch_workers
+        ):
+            series_ticker = page["series_ticker"]
+            if series_ticker in failed_series:
+                continue
+
+            markets = page["markets"]
             try:
-                validation_results = self._validator.validate_markets(
-                    cast("list[dict[str, Any]]", all_markets)
-                )
-                error_count = sum(1 for r in validation_results if r.has_errors)
-                # Markets with warnings but no errors (error markets are in error_count)
-                warning_only_count = sum(
-                    1 for r in validation_results if r.has_warnings and not r.has_errors
-                )
-                valid_count = len(all_markets) - error_count
-
-                # Build warning type breakdown by field (#485)
-                warning_breakdown: dict[str, int] = {}
-                if warning_only_count:
-                    for vr in validation_results:
-                        for issue in vr.warnings:
-                            warning_breakdown[issue.field] = (
-                                warning_breakdown.get(issue.field, 0) + 1
-                            )
-                warning_detail = (
-                    " ("
-                    + ", ".join(
-                        f"{f}={c}"
-                        for f, c in sorted(warning_breakdown.items(), key=lambda x: -x[1])
+                if page["error"] is not None:
+                    raise page["error"]
+                updated, created = self._sync_markets(markets, series_ticker=series_ticker)
+            except Exception as e:
+                if raise_errors:
+                    raise
+                # Log but don't re-raise - allow other series to continue
+                logger.error("Error polling series %s: %s", series_ticker, e)
+                self._record_series_error(e)
+                failed_series.add(series_ticker)
+                validation_buffers.pop(series_ticker, None)
+                series_counts.pop(series_ticker, None)
+                continue
+
+            counts = series_counts.setdefault(series_ticker, [0, 0, 0])
+            if self._should_validate:
+                validation_buffers.setdefault(series_ticker, []).extend(markets)
+
+            counts[0] += len(markets)
+            counts[1] += updated
+            counts[2] += created
+            total_fetched += len(markets)
+            total_updated += updated
+            total_created += created
+
+            if page["is_last"]:
+                if self._should_validate:
+                    self._validate_series_markets(
+                        series_ticker, validation_buffers.pop(series_ticker, [])
                     )
-                    + ")"
-                    if warning_breakdown
-                    else ""
+                fetched, updated, created = series_counts.pop(series_ticker)
+                self._log_series_summary(series_ticker, fetched, updated, created)
+
+        return total_fetched, total_updated, total_created
+
+    def _validate_series_markets(
+        self, series_ticker: str, all_markets: list[ProcessedMarketData]
+    ) -> None:
+        """
+        Validate one series' fetched markets and record validation stats.
+
+        Soft validation: issues are logged (and alerted on at high error
+        rates) but never block ingestion. Wrapped in try/except because a
+        validator bug must NEVER prevent market syncing.
+
+        Args:
+            series_ticker: Series ticker the markets belong to
+            all_markets: Every market fetched for the series this cycle
+        """
+        try:
+            batch = self._validator.validate_market_batch(cast("list[dict[str, Any]]", all_markets))
+            error_count = batch.error_count
+            # Markets with warnings but no errors (error markets are in error_count)
+            warning_only_count = batch.warning_only_count
+            valid_count = batch.valid_count
+
+            # Warning type breakdown by field (#485)
+            warning_breakdown = batch.warning_breakdown if warning_only_count else {}
+            warning_detail = (
+                " ("
+                + ", ".join(
+                    f"{f}={c}" for f, c in sorted(warning_breakdown.items(), key=lambda x: -x[1])
                 )
+                + ")"
+                if warning_breakdown
+                else ""
+            )
 
-                # Log individual issues with anomaly deduplication.
-                for vr in validation_results:
-                    if vr.has_errors:
-                        vr.log_issues(logger)
-                    elif vr.has_warnings and self._validator.should_log_anomaly(vr.entity_id):
-                        count = self._validator.get_anomaly_count(vr.entity_id)
-                        for issue in vr.issues:
-                            logger.debug(
-                                "[%s:%s] (occurrence #%d) %s",
-                                vr.entity_type,
-                                vr.entity_id,
-                                count,
-                                issue,
-                            )
-
-                # Error rate escalation
-                total_checked = len(all_markets)
-                error_rate = error_count / total_checked if total_checked > 0 else 0.0
-
-                if error_rate >= self.VALIDATION_ERROR_RATE:
-                    logger.error(
-                        "Validation [%s]: ERROR RATE %.1f%% - %d/%d markets failed "
-                        "(%d errors, %d warning-only%s) [ACTION: investigate data source]",
-                        series_ticker,
-                        error_rate * 100,
-                        error_count,
-                        total_checked,
-                        error_count,
-                        warning_only_count,
-                        warning_detail,
-                    )
-                    try:
-                        create_alert(
-                            alert_type="validation_error_rate",
-                            severity="error",
-                            message=(
-                                f"Error rate {error_rate * 100:.1f}% exceeds "
-                                f"{self.VALIDATION_ERROR_RATE * 100:.0f}% threshold "
-                                f"({error_count}/{total_checked} markets)"
-                            ),
-                            source=f"kalshi_poller:{series_ticker}",
+            # Log individual issues with anomaly deduplication (batch.results
+            # only holds markets that have issues).
+            for vr in batch.results:
+                if vr.has_errors:
+                    vr.log_issues(logger)
+                elif vr.has_warnings and self._validator.should_log_anomaly(vr.entity_id):
+                    count = self._validator.get_anomaly_count(vr.entity_id)
+                    for issue in vr.issues:
+                        logger.debug(
+                            "[%s:%s] (occurrence #%d) %s",
+                            vr.entity_type,
+                            vr.entity_id,
+                            count,
+                            issue,
                         )
-                    except Exception as alert_err:
-                        logger.debug("Failed to write alert to DB: %s", alert_err)
-                elif error_rate >= self.VALIDATION_WARN_RATE:
-                    logger.warning(
-                        "Validation [%s]: error rate %.1f%% - %d/%d markets failed "
-                        "(%d errors, %d warning-only%s)",
-                        series_ticker,
-                        error_rate * 100,
-                        error_count,
-                        total_checked,
-                        error_count,
-                        warning_only_count,
-                        warning_detail,
-                    )
-                elif error_count or warning_only_count:
-                    logger.info(
-                        "Validation [%s]: %d markets checked, %d valid, %d errors, %d warning-only%s",
-                        series_ticker,
-                        total_checked,
-                        valid_count,
-                        error_count,
-                        warning_only_count,
-                        warning_detail,
-                    )
-                else:
-                    logger.debug(
-                        "Validation [%s]: %d markets checked, all valid",
-                        series_ticker,
-                        total_checked,
-                    )
 
-                # Track validation stats
-                with self._lock:
-                    self._validation_stats["validation_errors"] += error_count
-                    self._validation_stats["validation_warnings"] += warning_only_count
-                    self._validation_stats["validation_errors_last_cycle"] = error_count
-                    self._validation_stats["validation_warnings_last_cycle"] = warning_only_count
-                    self._validation_stats["markets_checked_last_cycle"] = total_checked
-                    self._validation_stats["error_rate_pct_last_cycle"] = round(error_rate * 100, 1)
-            except Exception as e:
+            # Error rate escalation
+            total_checked = len(all_markets)
+            error_rate = error_count / total_checked if total_checked > 0 else 0.0
+
+            if error_rate >= self.VALIDATION_ERROR_RATE:
                 logger.error(
-                    "Validation failed for series %s (ingestion continues): %s",
+                    "Validation [%s]: ERROR RATE %.1f%% - %d/%d markets failed "
+                    "(%d errors, %d warning-only%s) [ACTION: investigate data source]",
+                    series_ticker,
+                    error_rate * 100,
+                    error_count,
+                    total_checked,
+                    error_count,
+                    warning_only_count,
+                    warning_detail,
+                )
+                try:
+                    create_alert(
+                        alert_type="validation_error_rate",
+                        severity="error",
+                        message=(
+                            f"Error rate {error_rate * 100:.1f}% exceeds "
+                            f"{self.VALIDATION_ERROR_RATE * 100:.0f}% threshold "
+                            f"({error_count}/{total_checked} markets)"
+                        ),
+                        source=f"kalshi_poller:{series_ticker}",
+                    )
+                except Exception as alert_err:
+                    logger.debug("Failed to write alert to DB: %s", alert_err)
+            elif error_rate >= self.VALIDATION_WARN_RATE:
+                logger.warning(
+                    "Validation [%s]: error rate %.1f%% - %d/%d markets failed "
+                    "(%d errors, %d warning-only%s)",
+                    series_ticker,
+                    error_rate * 100,
+                    error_count,
+                    total_checked,
+                    error_count,
+                    warning_only_count,
+                    warning_detail,
+                )
+            elif error_count or warning_only_count:
+                logger.info(
+                    "Validation [%s]: %d markets checked, %d valid, %d errors, %d warning-only%s",
                     series_ticker,
-                    e,
+                    total_checked,
+                    valid_count,
+                    error_count,
+                    warning_only_count,
+                    warning_detail,
                 )
+            else:
+                logger.debug(
+                    "Validation [%s]: %d markets checked, all valid",
+                    series_ticker,
+                    total_checked,
+                )
+
+            # Track validation stats
+            with self._lock:
+                self._validation_stats["validation_errors"] += error_count
+                self._validation_stats["validation_warnings"] += warning_only_count
+                self._validation_stats["validation_errors_last_cycle"] = error_count
+                self._validation_stats["validation_warnings_last_cycle"] = warning_only_count
+                self._validation_stats["markets_checked_last_cycle"] = total_checked
+                self._validation_stats["error_rate_pct_last_cycle"] = round(error_rate * 100, 1)
+        except Exception as e:
+            logger.error(
+                "Validation failed for series %s (ingestion continues): %s",
+                series_ticker,
+                e,
+            )
+
+    def _sync_markets(
+        self, markets: list[ProcessedMarketData], series_ticker: str = ""
+    ) -> tuple[int, int]:
+        """Sync markets via the batched or per-market path (see batch_sync)."""
+        if self.batch_sync:
+            return self._sync_markets_batch(markets, series_ticker=series_ticker)
+        return self._sync_markets_individually(markets, series_ticker=series_ticker)
+
+    @staticmethod
+    def _log_series_summary(series_ticker: str, fetched: int, updated: int, created: int) -> None:
+        """Log the per-series poll summary, demoted to DEBUG when nothing changed."""
+        log_fn = logger.info if (updated or created) else logger.debug
+        log_fn(
+            "Series %s: fetched %d markets, updated %d, created %d",
+            series_ticker,
+            fetched,
+            updated,
+            created,
+        )
+
+    def _sync_markets_individually(
+        self, markets: list[ProcessedMarketData], series_ticker: str = ""
+    ) -> tuple[int, int]:
+        """
+        Sync a page of markets one at a time via _sync_market_to_db().
+
+        Args:
+            markets: Market data from Kalshi API (with Decimal prices)
+            series_ticker: Series ticker the markets were fetched for
 
+        Returns:
+            Tuple of (markets_updated, markets_created)
+        """
         markets_updated = 0
         markets_created = 0
 
-        for market in all_markets:
+        for market in markets:
             try:
                 # Pass series_ticker explicitly - the API response may not include it
                 result = self._sync_market_to_db(market, series_ticker=series_ticker)
@@ -859,17 +1060,7 @@ class KalshiMarketPoller(BasePoller):
                 ticker = market.get("ticker", "unknown")
                 logger.error("Error syncing market %s: %s", ticker, e)
 
-        # Demote to DEBUG when nothing changed (steady-state)
-        log_fn = logger.info if (markets_updated or markets_created) else logger.debug
-        log_fn(
-            "Series %s: fetched %d markets, updated %d, created %d",
-            series_ticker,
-            len(all_markets),
-            markets_updated,
-            markets_created,
-        )
-
-        return len(all_markets), markets_updated, markets_created
+        return markets_updated, markets_created
 
     # =========================================================================
     # Event-to-Game Matching (Issue #462)
@@ -1037,9 +1228,169 @@ class KalshiMarketPoller(BasePoller):
             - So market.get("series_ticker") would return empty string
         """
         ticker = market.get("ticker", "")
+        db_status = self._map_market_status(market, ticker)
+        if not ticker:
+            logger.warning("Market missing ticker, skipping")
+            return False
+
+        fields = self._extract_market_fields(market, ticker, series_ticker)
+
+        # Check if market already exists
+        existing = get_current_market(ticker)
+
+        if existing is None:
+            self._create_market_from_api(market, ticker, db_status, fields)
+            self._remember_prices(ticker, fields)
+            return True
+
+        # Market exists - check if price changed (avoid unnecessary versioning)
+        if not self._market_changed(existing, fields, db_status):
+            # No changes, skip
+            self._remember_prices(ticker, existing)
+            return None
+
+        try:
+            market_pk = update_market_with_versioning(
+                ticker=ticker,
+                **self._versioning_kwargs(market, ticker, db_status, fields),
+            )
+        except Exception:
+            self.price_cache.invalidate(ticker)
+            raise
+        get_alignment_event_bus().publish_snapshots([market_pk])
+        self._remember_prices(ticker, fields)
+        logger.debug(
+            "Updated market: %s (yes: %s -> %s)",
+            ticker,
+            existing["yes_ask_price"],
+            fields["yes_ask_price"],
+        )
+        self._propagate_event_settlement(
+            existing, ticker, db_status, market.get("event_ticker", "")
+        )
+        return False  # Updated, not created
+
+    def _sync_markets_batch(
+        self, markets: list[ProcessedMarketData], series_ticker: str = ""
+    ) -> tuple[int, int]:
+        """
+        Sync a page of markets with one lookup and one write transaction.
+
+        Batched counterpart of calling _sync_market_to_db() per market. The
+        current snapshot of every ticker is loaded with a single query, prices
+        are diffed in memory, and every changed market is versioned through
+        update_markets_with_versioning_batch() in one transaction. New markets
+        still go through the per-market create path (they need event
+        get-or-create and matching), which is rare after the first poll.
+
+        Created/updated/skipped counts and settlement propagation are the same
+        as the per-market path. If the batched write fails, it falls back to
+        per-market update_market_with_versioning() so one bad row cannot drop
+        the whole page.
+
+        Args:
+            markets: Market data from Kalshi API (with Decimal prices)
+            series_ticker: Series ticker the markets were fetched for
+
+        Returns:
+            Tuple of (markets_updated, markets_created)
+        """
+        markets_updated = 0
+        markets_created = 0
+
+        prepared: list[tuple[ProcessedMarketData, str, str, dict[str, Any]]] = []
+        for market in markets:
+            ticker = market.get("ticker", "")
+            try:
+                db_status = self._map_market_status(market, ticker)
+                if not ticker:
+                    # Matches _sync_market_to_db, which reports this as updated
+                    logger.warning("Market missing ticker, skipping")
+                    markets_updated += 1
+                    continue
+                fields = self._extract_market_fields(market, ticker, series_ticker)
+                prepared.append((market, ticker, db_status, fields))
+            except Exception as e:
+                logger.error("Error syncing market %s: %s", ticker or "unknown", e)
+
+        existing_by_ticker = get_current_markets_by_tickers([p[1] for p in prepared])
+
+        pending: list[tuple[str, dict[str, Any], str, dict[str, Any], str]] = []
+        for market, ticker, db_status, fields in prepared:
+            try:
+                existing = existing_by_ticker.get(ticker)
+                if existing is None:
+                    self._create_market_from_api(market, ticker, db_status, fields)
+                    self._remember_prices(ticker, fields)
+                    markets_created += 1
+                elif self._market_changed(existing, fields, db_status):
+                    kwargs = self._versioning_kwargs(market, ticker, db_status, fields)
+                    pending.append(
+                        (ticker, existing, db_status, kwargs, market.get("event_ticker", ""))
+                    )
+                else:
+                    self._remember_prices(ticker, existing)
+            except Exception as e:
+                logger.error("Error syncing market %s: %s", ticker, e)
+
+        if not pending:
+            return markets_updated, markets_created
+
+        written = pending
+        try:
+            market_pks = list(
+                update_markets_with_versioning_batch(
+                    [{"ticker": ticker, **kwargs} for ticker, _, _, kwargs, _ in pending]
+                ).values()
+            )
+        except Exception as e:
+            logger.warning(
+                "Batched update of %d markets failed, retrying per market: %s",
+                len(pending),
+                e,
+            )
+            written = []
+            market_pks = []
+            for item in pending:
+                try:
+                    market_pks.append(update_market_with_versioning(ticker=item[0], **item[3]))
+                    written.append(item)
+                except Exception as row_err:
+                    self.price_cache.invalidate(item[0])
+                    logger.error("Error syncing market %s: %s", item[0], row_err)
+        get_alignment_event_bus().publish_snapshots(market_pks)
+
+        for ticker, existing, db_status, kwargs, event_ticker in written:
+            self._remember_prices(ticker, kwargs)
+            try:
+                logger.debug(
+                    "Updated market: %s (yes: %s -> %s)",
+                    ticker,
+                    existing["yes_ask_price"],
+                    kwargs["yes_ask_price"],
+                )
+                self._propagate_event_settlement(existing, ticker, db_status, event_ticker)
+                markets_updated += 1
+            except Exception as e:
+                logger.error("Error syncing market %s: %s", ticker, e)
 
-        # Map Kalshi API status to database schema status
-        # Kalshi returns 'active' but our DB constraint expects 'open'
+        return markets_updated, markets_created
+
+    def _remember_prices(self, ticker: str, prices: dict[str, Any]) -> None:
+        """Write the persisted yes/no ask prices for ticker through to the price cache."""
+        yes_ask_price = prices.get("yes_ask_price")
+        no_ask_price = prices.get("no_ask_price")
+        if yes_ask_price is None or no_ask_price is None:
+            self.price_cache.invalidate(ticker)
+            return
+        self.price_cache.put(ticker, yes_ask_price, no_ask_price)
+
+    def _map_market_status(self, market: ProcessedMarketData, ticker: str) -> str:
+        """Map a Kalshi API status to the database status, warning on unknowns.
+
+        Kalshi returns 'active' but our DB constraint expects 'open'; anything
+        not in STATUS_MAPPING defaults to 'halted'.
+        """
         api_status = market.get("status", "open")
         db_status = self.STATUS_MAPPING.get(api_status, "halted")
         if api_status not in self.STATUS_MAPPING:
@@ -1048,10 +1399,19 @@ class KalshiMarketPoller(BasePoller):
                 api_status,
                 ticker,
             )
-        if not ticker:
-            logger.warning("Market missing ticker, skipping")
-            return False
+        return db_status
 
+    @staticmethod
+    def _extract_market_fields(
+        market: ProcessedMarketData, ticker: str, series_ticker: str
+    ) -> dict[str, Any]:
+        """Derive prices and enrichment columns shared by the create and update paths.
+
+        Returns:
+            Dict with yes_ask_price, no_ask_price, yes_bid_price, no_bid_price,
+            last_price, liquidity, spread, effective_series, subcategory,
+            source_url and outcome_label.
+        """
         # Extract prices from sub-penny Decimal fields
         # Fall back to legacy cent fields divided by 100 if _dollars not available
         #
@@ -1134,255 +1494,285 @@ class KalshiMarketPoller(BasePoller):
             ticker_parts[-1] if len(ticker_parts) > 1 and not ticker_parts[-1].isdigit() else None
         )
 
-        # Check if market already exists
-        existing = get_current_market(ticker)
-
-        if existing is None:
-            # Create new market - first ensure the event exists
-            event_ticker = market.get("event_ticker", "")
-
-            # Default to 'sports' for game-related series, 'other' for unknown
-            category = "sports"  # Most Kalshi markets we poll are sports
+        return {
+            "yes_ask_price": yes_price,
+            "no_ask_price": no_price,
+            "yes_bid_price": yes_bid_price,
+            "no_bid_price": no_bid_price,
+            "last_price": last_price,
+            "liquidity": liquidity,
+            "spread": spread,
+            "effective_series": effective_series,
+            "subcategory": subcategory,
+            "source_url": source_url,
+            "outcome_label": outcome_label,
+        }
 
-            # Get or create the event before creating the market.
-            # This satisfies the FK constraint (markets.event_id -> events.id).
-            # get_or_create_event() returns (int_pk, created) per migration 0020.
-            event_pk: int | None = None
-            if event_ticker:
-                # Check cache first to avoid redundant DB lookups
-                if event_ticker in self._event_id_map:
-                    event_pk = self._event_id_map[event_ticker]
-                else:
-                    # Look up integer surrogate PK for the series. The mapping is
-                    # populated by sync_series() which runs before market polling.
-                    series_pk = self._series_id_map.get(effective_series)
-                    if effective_series and series_pk is None:
-                        logger.warning(
-                            "Series '%s' not in _series_id_map for event %s -- "
-                            "event will have NULL series_id",
-                            effective_series,
-                            event_ticker,
-                        )
+    @staticmethod
+    def _market_changed(existing: dict[str, Any], fields: dict[str, Any], db_status: str) -> bool:
+        """Return True if the ask prices or status differ from the current row."""
+        # Migration 0021: column renamed from yes_price → yes_ask_price
+        price_changed = (
+            existing["yes_ask_price"] != fields["yes_ask_price"]
+            or existing["no_ask_price"] != fields["no_ask_price"]
+        )
+        return bool(price_changed or existing["status"] != db_status)
 
-                    # Attempt event-to-game matching (Issue #462)
-                    # Try to match this event to an ESPN game BEFORE creation
-                    # so game_id can be passed to create_event().
-                    game_id = self._match_event_to_game(event_ticker, market.get("title"))
-
-                    event_pk, _created = get_or_create_event(
-                        event_id=event_ticker,
-                        platform_id=self.PLATFORM_ID,
-                        external_id=event_ticker,
-                        category=category,
-                        title=market.get("title", event_ticker),
-                        series_id=series_pk,  # Integer FK to series(id)
-                        subcategory=subcategory,
-                        game_id=game_id,  # Link to games table (may be None)
-                        # Event time proxies from market-level fields.
-                        # Uses the FIRST market seen in the event (subsequent
-                        # markets hit the _event_id_map cache and skip creation).
-                        start_time=market.get("open_time"),
-                        end_time=market.get("expiration_time"),
-                        # We only poll active markets, so new events are live.
-                        # Settlement detection (Task 5) transitions to 'final'.
-                        status="live",
-                        metadata={
-                            "series_ticker": effective_series,
-                        },
-                    )
-                    # Cache the integer PK for subsequent markets in the same event
-                    self._event_id_map[event_ticker] = event_pk
-
-                    # If event already existed with game_id=NULL and we found a
-                    # match, update it now (handles the TODO in get_or_create_event)
-                    if not _created and game_id is not None:
-                        update_event_game_id(event_pk, game_id)
-
-            # Settlement detection on create path: if a market arrives
-            # already settled (e.g., poller restart, new series backfill),
-            # read settlement_value_dollars directly from the API response.
-            # _convert_prices_to_decimal already converts it to Decimal.
-            # This handles binary (1.0/0.0) and scalar (fractional) markets.
-            create_settlement_value: Decimal | None = None
-            if db_status == "settled":
-                create_settlement_value = market.get("settlement_value_dollars")
-                # Fallback: legacy API may return settlement_value in cents
-                if create_settlement_value is None:
-                    sv_cents = market.get("settlement_value")
-                    if sv_cents is not None:
-                        create_settlement_value = Decimal(str(sv_cents)) / Decimal("100")
-                    else:
-                        logger.warning(
-                            "Market %s settled but settlement_value_dollars is absent, "
-                            "settlement_value will be NULL",
-                            ticker,
-                        )
+    @staticmethod
+    def _extract_settlement_value(
+        market: ProcessedMarketData, ticker: str, db_status: str
+    ) -> Decimal | None:
+        """Read the settlement value for a settled market, or None otherwise.
 
-            # Migration 0022: create_market returns int PK
-            # Migration 0033: subtitle, open_time, close_time, expiration_time
-            # promoted from metadata JSONB to proper dimension columns.
-            # can_close_early and series_ticker remain in metadata.
-            # Migration 0046: depth signals + daily movement columns.
-            create_market(
-                platform_id=self.PLATFORM_ID,
-                event_id=event_pk,  # Integer FK to events(id)
-                external_id=ticker,  # Use ticker as external_id
-                ticker=ticker,
-                title=market.get("title", ticker),
-                yes_ask_price=yes_price,
-                no_ask_price=no_price,
-                market_type="binary",
-                status=db_status,
-                volume=_parse_fp_int(market, "volume_fp"),
-                open_interest=_parse_fp_int(market, "open_interest_fp"),
-                spread=spread,
-                yes_bid_price=yes_bid_price,
-                no_bid_price=no_bid_price,
-                last_price=last_price,
-                liquidity=liquidity,
-                subtitle=market.get("subtitle"),
-                open_time=market.get("open_time"),
-                close_time=market.get("close_time"),
-                expiration_time=market.get("expiration_time"),
-                subcategory=subcategory,
-                source_url=source_url,
-                outcome_label=outcome_label,
-                settlement_value=create_settlement_value,
-                # Migration 0046: dimension enrichment
-                expiration_value=market.get("expiration_value"),
-                notional_value=market.get("notional_value_dollars"),
-                # Migration 0046: snapshot enrichment
-                volume_24h=_parse_fp_int(market, "volume_24h_fp"),
-                previous_yes_bid=market.get("previous_yes_bid_dollars"),
-                previous_yes_ask=market.get("previous_yes_ask_dollars"),
-                previous_price=market.get("previous_price_dollars"),
-                # Clamp to 0: Kalshi returns negative depth at settlement (#542)
-                yes_bid_size=_clamp_non_negative(_parse_fp_int(market, "yes_bid_size_fp")),
-                yes_ask_size=_clamp_non_negative(_parse_fp_int(market, "yes_ask_size_fp")),
-                metadata={
-                    k: v
-                    for k, v in {
-                        "series_ticker": effective_series,
-                        "can_close_early": market.get("can_close_early"),
-                    }.items()
-                    if v is not None
-                },
-            )
-            logger.debug("Created market: %s", ticker)
-
-            # Event propagation on create path: if created market is already
-            # settled and belongs to an event, check full event settlement.
-            if (
-                db_status == "settled"
-                and event_pk is not None
-                and check_event_fully_settled(event_pk)
-            ):
-                update_event(
-                    event_pk,
-                    status="final",
-                    result=build_event_result(event_pk),
-                )
-                logger.info(
-                    "Event %s fully settled (triggered by new market %s)",
-                    event_pk,
+        Reads settlement_value_dollars directly from the API response.
+        _convert_prices_to_decimal already converts it to Decimal.
+        This handles binary (1.0/0.0) and scalar (fractional) markets.
+        """
+        if db_status != "settled":
+            return None
+        settlement_value: Decimal | None = market.get("settlement_value_dollars")
+        # Fallback: legacy API may return settlement_value in cents
+        if settlement_value is None:
+            sv_cents = market.get("settlement_value")
+            if sv_cents is not None:
+                settlement_value = Decimal(str(sv_cents)) / Decimal("100")
+            else:
+                logger.warning(
+                    "Market %s settled but settlement_value_dollars is absent, "
+                    "settlement_value will be NULL",
                     ticker,
                 )
+        return settlement_value
 
-            return True
+    def _versioning_kwargs(
+        self,
+        market: ProcessedMarketData,
+        ticker: str,
+        db_status: str,
+        fields: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Build update_market_with_versioning() keyword arguments for a changed market.
+
+        Shared by the per-market and batched sync paths so both write
+        identical rows.
+        """
+        # Settlement detection: when a market transitions to settled,
+        # read settlement_value_dollars directly from the API response.
+        settlement_value = self._extract_settlement_value(market, ticker, db_status)
 
-        # Market exists - check if price changed (avoid unnecessary versioning)
-        # Migration 0021: column renamed from yes_price → yes_ask_price
-        price_changed = (
-            existing["yes_ask_price"] != yes_price or existing["no_ask_price"] != no_price
-        )
-        status_changed = existing["status"] != db_status
-
-        if price_changed or status_changed:
-            # Settlement detection: when a market transitions to settled,
-            # read settlement_value_dollars directly from the API response.
-            # _convert_prices_to_decimal already converts it to Decimal.
-            # This handles binary (1.0/0.0) and scalar (fractional) markets.
-            settlement_value: Decimal | None = None
-            if db_status == "settled":
-                settlement_value = market.get("settlement_value_dollars")
-                # Fallback: legacy API may return settlement_value in cents
-                if settlement_value is None:
-                    sv_cents = market.get("settlement_value")
-                    if sv_cents is not None:
-                        settlement_value = Decimal(str(sv_cents)) / Decimal("100")
-                    else:
-                        logger.warning(
-                            "Market %s settled but settlement_value_dollars is absent, "
-                            "settlement_value will be NULL",
-                            ticker,
-                        )
+        # Migration 0033: pass enrichment columns on update path too,
+        # so lifecycle timestamps are refreshed when prices change.
+        # Migration 0046: pass depth + daily movement columns too.
+        return {
+            "yes_ask_price": fields["yes_ask_price"],
+            "no_ask_price": fields["no_ask_price"],
+            "status": db_status,
+            "volume": _parse_fp_int(market, "volume_fp"),
+            "open_interest": _parse_fp_int(market, "open_interest_fp"),
+            "spread": fields["spread"],
+            "yes_bid_price": fields["yes_bid_price"],
+            "no_bid_price": fields["no_bid_price"],
+            "last_price": fields["last_price"],
+            "liquidity": fields["liquidity"],
+            "subtitle": market.get("subtitle"),
+            "open_time": market.get("open_time"),
+            "close_time": market.get("close_time"),
+            "expiration_time": market.get("expiration_time"),
+            "subcategory": fields["subcategory"],
+            "source_url": fields["source_url"],
+            "settlement_value": settlement_value,
+            # Migration 0046: dimension enrichment
+            "expiration_value": market.get("expiration_value"),
+            "notional_value": market.get("notional_value_dollars"),
+            # Migration 0046: snapshot enrichment
+            "volume_24h": _parse_fp_int(market, "volume_24h_fp"),
+            "previous_yes_bid": market.get("previous_yes_bid_dollars"),
+            "previous_yes_ask": market.get("previous_yes_ask_dollars"),
+            "previous_price": market.get("previous_price_dollars"),
+            # Clamp to 0: Kalshi returns negative depth at settlement (#542)
+            "yes_bid_size": _clamp_non_negative(_parse_fp_int(market, "yes_bid_size_fp")),
+            "yes_ask_size": _clamp_non_negative(_parse_fp_int(market, "yes_ask_size_fp")),
+        }
 
-            # Migration 0033: pass enrichment columns on update path too,
-            # so lifecycle timestamps are refreshed when prices change.
-            # Migration 0046: pass depth + daily movement columns too.
-            update_market_with_versioning(
-                ticker=ticker,
-                yes_ask_price=yes_price,
-                no_ask_price=no_price,
-                status=db_status,
-                volume=_parse_fp_int(market, "volume_fp"),
-                open_interest=_parse_fp_int(market, "open_interest_fp"),
-                spread=spread,
-                yes_bid_price=yes_bid_price,
-                no_bid_price=no_bid_price,
-                last_price=last_price,
-                liquidity=liquidity,
-                subtitle=market.get("subtitle"),
-                open_time=market.get("open_time"),
-                close_time=market.get("close_time"),
-                expiration_time=market.get("expiration_time"),
-                subcategory=subcategory,
-                source_url=source_url,
-                settlement_value=settlement_value,
-                # Migration 0046: dimension enrichment
-                expiration_value=market.get("expiration_value"),
-                notional_value=market.get("notional_value_dollars"),
-                # Migration 0046: snapshot enrichment
-                volume_24h=_parse_fp_int(market, "volume_24h_fp"),
-                previous_yes_bid=market.get("previous_yes_bid_dollars"),
-                previous_yes_ask=market.get("previous_yes_ask_dollars"),
-                previous_price=market.get("previous_price_dollars"),
-                # Clamp to 0: Kalshi returns negative depth at settlement (#542)
-                yes_bid_size=_clamp_non_negative(_parse_fp_int(market, "yes_bid_size_fp")),
-                yes_ask_size=_clamp_non_negative(_parse_fp_int(market, "yes_ask_size_fp")),
+    def _propagate_event_settlement(
+        self, existing: dict[str, Any], ticker: str, db_status: str, event_ticker: str = ""
+    ) -> None:
+        """Finalize the parent event once every sibling market has settled.
+
+        If this market just settled and belongs to an event, check whether ALL
+        sibling markets have also settled. If so, transition the parent event
+        to 'final', build a result summary from child market settlement
+        values, and retire the event's _event_id_map entry.
+        """
+        if (
+            db_status == "settled"
+            and existing.get("event_id")
+            and check_event_fully_settled(existing["event_id"])
+        ):
+            event_id_for_settlement = existing["event_id"]
+            update_event(
+                event_id_for_settlement,
+                status="final",
+                result=build_event_result(event_id_for_settlement),
             )
-            logger.debug(
-                "Updated market: %s (yes: %s -> %s)",
+            if event_ticker:
+                self._event_id_map.retire(event_ticker)
+            logger.info(
+                "Event %s fully settled (triggered by market %s)",
+                event_id_for_settlement,
                 ticker,
-                existing["yes_ask_price"],
-                yes_price,
             )
 
-            # Event settlement propagation: if this market just settled and
-            # belongs to an event, check whether ALL sibling markets have
-            # also settled.  If so, transition the parent event to 'final'
-            # and build a result summary from child market settlement values.
-            if (
-                db_status == "settled"
-                and existing.get("event_id")
-                and check_event_fully_settled(existing["event_id"])
-            ):
-                event_id_for_settlement = existing["event_id"]
-                update_event(
-                    event_id_for_settlement,
-                    status="final",
-                    result=build_event_result(event_id_for_settlement),
-                )
-                logger.info(
-                    "Event %s fully settled (triggered by market %s)",
-                    event_id_for_settlement,
-                    ticker,
-                )
+    def _create_market_from_api(
+        self,
+        market: ProcessedMarketData,
+        ticker: str,
+        db_status: str,
+        fields: dict[str, Any],
+    ) -> None:
+        """Create a market (and its event if needed) from API data.
 
-            return False  # Updated, not created
+        Create path shared by _sync_market_to_db() and _sync_markets_batch().
+        Ensures the parent event exists (with event-to-game matching), inserts
+        the market + initial snapshot, and propagates settlement to the event
+        when the market arrives already settled.
+        """
+        effective_series = fields["effective_series"]
+        subcategory = fields["subcategory"]
+
+        # Create new market - first ensure the event exists
+        event_ticker = market.get("event_ticker", "")
+
+        # Default to 'sports' for game-related series, 'other' for unknown
+        category = "sports"  # Most Kalshi markets we poll are sports
+
+        # Get or create the event before creating the market.
+        # This satisfies the FK constraint (markets.event_id -> events.id).
+        # get_or_create_event() returns (int_pk, created) per migration 0020.
+        event_pk: int | None = None
+        if event_ticker:
+            # Check cache first to avoid redundant DB lookups
+            if event_ticker in self._event_id_map:
+                event_pk = self._event_id_map[event_ticker]
+            else:
+                # Look up integer surrogate PK for the series. The mapping is
+                # populated by sync_series() which runs before market polling.
+                series_pk = self._series_id_map.get(effective_series)
+                if effective_series and series_pk is None:
+                    logger.warning(
+                        "Series '%s' not in _series_id_map for event %s -- "
+                        "event will have NULL series_id",
+                        effective_series,
+                        event_ticker,
+                    )
 
-        # No changes, skip
-        return None
+                # Attempt event-to-game matching (Issue #462)
+                # Try to match this event to an ESPN game BEFORE creation
+                # so game_id can be passed to create_event().
+                game_id = self._match_event_to_game(event_ticker, market.get("title"))
+
+                event_pk, _created = get_or_create_event(
+                    event_id=event_ticker,
+                    platform_id=self.PLATFORM_ID,
+                    external_id=event_ticker,
+                    category=category,
+                    title=market.get("title", event_ticker),
+                    series_id=series_pk,  # Integer FK to series(id)
+                    subcategory=subcategory,
+                    game_id=game_id,  # Link to games table (may be None)
+                    # Event time proxies from market-level fields.
+                    # Uses the FIRST market seen in the event (subsequent
+                    # markets hit the _event_id_map cache and skip creation).
+                    start_time=market.get("open_time"),
+                    end_time=market.get("expiration_time"),
+                    # We only poll active markets, so new events are live.
+                    # Settlement detection (Task 5) transitions to 'final'.
+                    status="live",
+                    metadata={
+                        "series_ticker": effective_series,
+                    },
+                )
+                # Cache the integer PK for subsequent markets in the same event
+                self._event_id_map[event_ticker] = event_pk
+
+                # If event already existed with game_id=NULL and we found a
+                # match, update it now (handles the TODO in get_or_create_event)
+                if not _created and game_id is not None:
+                    update_event_game_id(event_pk, game_id)
+
+        # Settlement detection on create path: if a market arrives
+        # already settled (e.g., poller restart, new series backfill),
+        # read settlement_value_dollars directly from the API response.
+        create_settlement_value = self._extract_settlement_value(market, ticker, db_status)
+
+        # Migration 0022: create_market returns int PK
+        # Migration 0033: subtitle, open_time, close_time, expiration_time
+        # promoted from metadata JSONB to proper dimension columns.
+        # can_close_early and series_ticker remain in metadata.
+        # Migration 0046: depth signals + daily movement columns.
+        create_market(
+            platform_id=self.PLATFORM_ID,
+            event_id=event_pk,  # Integer FK to events(id)
+            external_id=ticker,  # Use ticker as external_id
+            ticker=ticker,
+            title=market.get("title", ticker),
+            yes_ask_price=fields["yes_ask_price"],
+            no_ask_price=fields["no_ask_price"],
+            market_type="binary",
+            status=db_status,
+            volume=_parse_fp_int(market, "volume_fp"),
+            open_interest=_parse_fp_int(market, "open_interest_fp"),
+            spread=fields["spread"],
+            yes_bid_price=fields["yes_bid_price"],
+            no_bid_price=fields["no_bid_price"],
+            last_price=fields["last_price"],
+            liquidity=fields["liquidity"],
+            subtitle=market.get("subtitle"),
+            open_time=market.get("open_time"),
+            close_time=market.get("close_time"),
+            expiration_time=market.get("expiration_time"),
+            subcategory=subcategory,
+            source_url=fields["source_url"],
+            outcome_label=fields["outcome_label"],
+            settlement_value=create_settlement_value,
+            # Migration 0046: dimension enrichment
+            expiration_value=market.get("expiration_value"),
+            notional_value=market.get("notional_value_dollars"),
+            # Migration 0046: snapshot enrichment
+            volume_24h=_parse_fp_int(market, "volume_24h_fp"),
+            previous_yes_bid=market.get("previous_yes_bid_dollars"),
+            previous_yes_ask=market.get("previous_yes_ask_dollars"),
+            previous_price=market.get("previous_price_dollars"),
+            # Clamp to 0: Kalshi returns negative depth at settlement (#542)
+            yes_bid_size=_clamp_non_negative(_parse_fp_int(market, "yes_bid_size_fp")),
+            yes_ask_size=_clamp_non_negative(_parse_fp_int(market, "yes_ask_size_fp")),
+            metadata={
+                k: v
+                for k, v in {
+                    "series_ticker": effective_series,
+                    "can_close_early": market.get("can_close_early"),
+                }.items()
+                if v is not None
+            },
+        )
+        logger.debug("Created market: %s", ticker)
+        if event_pk is not None:
+            self._bracket_dirty_events.add(event_pk)
+
+        # Event propagation on create path: if created market is already
+        # settled and belongs to an event, check full event settlement.
+        if db_status == "settled" and event_pk is not None and check_event_fully_settled(event_pk):
+            update_event(
+                event_pk,
+                status="final",
+                result=build_event_result(event_pk),
+            )
+            self._event_id_map.retire(event_ticker)
+            logger.info(
+                "Event %s fully settled (triggered by new market %s)",
+                event_pk,
+                ticker,
+            )
 
     def get_active_market_count(self) -> int:
         """
@@ -1411,6 +1801,8 @@ def create_kalshi_poller(
     series_tickers: list[str] | None = None,
     poll_interval: int = 15,
     environment: str = "demo",
+    batch_sync: bool = False,
+    fetch_workers: int = 1,
 ) -> KalshiMarketPoller:
     """
     Factory function to create a configured KalshiMarketPoller.
@@ -1419,6 +1811,8 @@ def create_kalshi_poller(
         series_tickers: Series to poll (default: ["KXNFLGAME"])
         poll_interval: Seconds between polls (default: 15, minimum: 5)
         environment: Kalshi environment (default: "demo")
+        batch_sync: Use the batched per-series sync path (default: False)
+        fetch_workers: Series paginated concurrently (default: 1, sequential)
 
     Returns:
         Configured KalshiMarketPoller instance
@@ -1434,6 +1828,8 @@ def create_kalshi_poller(
         series_tickers=series_tickers,
         poll_interval=poll_interval,
         environment=environment,
+        batch_sync=batch_sync,
+        fetch_workers=fetch_workers,
     )
 
 
@@ -10,6 +10,7 @@ Key Features:
 - Automatic reconnection with exponential backoff
 - Same RSA-PSS authentication as REST API
 - Subscribes to ticker and orderbook channels
+- In-memory order books with throttled depth snapshots (kalshi_orderbook)
 - SCD Type 2 versioning for price history
 - Thread-safe callback system for price updates
 
@@ -64,12 +65,33 @@ from typing import Any, ClassVar, TypedDict
 from precog.api_connectors.kalshi_auth import KalshiAuth
 from precog.database.crud_markets import (
     get_current_market,
+    get_current_markets_by_tickers,
     update_market_with_versioning,
+    update_markets_with_versioning_batch,
 )
+from precog.schedulers.alignment_bus import get_alignment_event_bus
+from precog.schedulers.kalshi_orderbook import OrderBookSampler, OrderBookStore
+from precog.schedulers.market_price_cache import MarketPriceCache, get_market_price_cache
+from precog.utils.metrics import get_metrics_registry
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+_metrics = get_metrics_registry()
+_WS_MESSAGES = _metrics.counter(
+    "precog_ws_messages_total", "Kalshi WebSocket messages received", ("type",)
+)
+_WS_HANDLER_SECONDS = _metrics.histogram(
+    "precog_ws_handler_seconds",
+    "Time to handle one Kalshi WebSocket message",
+    ("type",),
+    buckets=(0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0),
+)
+# Message types reported as their own label value; anything else is "other"
+_WS_MESSAGE_TYPES = frozenset(
+    {"ticker", "orderbook_snapshot", "orderbook_delta", "subscribed", "error"}
+)
+
 
 # =============================================================================
 # Type Definitions
@@ -125,6 +147,276 @@ class OrderbookDelta(TypedDict):
     delta: int  # quantity change (positive = add, negative = remove)
 
 
+class _PendingPrice(TypedDict):
+    """Latest un-persisted ticker state held by PriceWriteBehindQueue."""
+
+    yes_ask_price: Decimal
+    no_ask_price: Decimal
+    volume: int | None
+    open_interest: int | None
+
+
+# =============================================================================
+# Write-Behind Queue
+# =============================================================================
+
+
+class PriceWriteBehindQueue:
+    """
+    Coalescing write-behind stage for WebSocket price updates.
+
+    Ticker updates are held in memory per market and flushed every ``window``
+    seconds. Only the latest state of each ticker is written, and one flush
+    writes every changed ticker in a single transaction via
+    update_markets_with_versioning_batch(). A burst of ticks for one market
+    therefore produces at most one SCD row per window instead of one per tick.
+
+    Usage:
+        >>> queue = PriceWriteBehindQueue(window=0.5)
+        >>> queue.start()
+        >>> queue.submit("KXNFLGAME-A", Decimal("0.52"), Decimal("0.49"))
+        >>> queue.close()  # flushes anything still pending
+
+    Educational Note:
+        Flushing runs on a dedicated thread (not the asyncio loop), so a slow
+        transaction never stalls message processing, and close() can drain
+        the queue even after the event loop has exited.
+
+        Backpressure: depth is bounded by the number of distinct tickers (not
+        ticks) thanks to coalescing. If depth reaches ``max_pending`` the
+        flusher is woken early instead of waiting out the window.
+
+        Tickers that are pending or mid-flush always enqueue, even when the
+        price cache says "unchanged": the cache describes the last persisted
+        state, and a tick that returns to it must still overwrite a newer
+        pending price.
+    """
+
+    DEFAULT_WINDOW: ClassVar[float] = 0.5  # seconds
+    DEFAULT_MAX_PENDING: ClassVar[int] = 5000  # distinct tickers
+
+    def __init__(
+        self,
+        window: float = DEFAULT_WINDOW,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        price_cache: MarketPriceCache | None = None,
+    ) -> None:
+        """
+        Initialize an idle queue (call start() to begin periodic flushing).
+
+        Args:
+            window: Coalescing window in seconds between flushes.
+            max_pending: Queue depth that triggers an early flush.
+            price_cache: Cache of last persisted prices (default: process-wide).
+
+        Raises:
+            ValueError: If window <= 0 or max_pending < 1.
+        """
+        if window <= 0:
+            raise ValueError("window must be > 0")
+        if max_pending < 1:
+            raise ValueError("max_pending must be >= 1")
+
+        self.window = window
+        self.max_pending = max_pending
+        self.price_cache = price_cache if price_cache is not None else get_market_price_cache()
+
+        self._pending: dict[str, _PendingPrice] = {}
+        self._in_flight: set[str] = set()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closing = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self._stats: dict[str, int | float] = {
+            "write_behind_queue_depth": 0,
+            "write_behind_max_queue_depth": 0,
+            "write_behind_enqueued": 0,
+            "write_behind_coalesced": 0,
+            "write_behind_flushes": 0,
+            "write_behind_rows_written": 0,
+            "write_behind_flush_errors": 0,
+            "write_behind_requeued": 0,
+            "write_behind_last_flush_ms": 0.0,
+            "write_behind_max_flush_ms": 0.0,
+        }
+
+    def start(self) -> None:
+        """Start the background flusher thread (no-op if already running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._closing.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="kalshi-ws-write-behind", daemon=True
+        )
+        self._thread.start()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Stop the flusher and drain every pending update.
+
+        Args:
+            timeout: Maximum seconds to wait for the flusher's final flush.
+        """
+        self._closing.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            if self._thread.is_alive():
+                logger.warning(
+                    "Write-behind flusher did not exit within %.1fs; draining inline", timeout
+                )
+        # Covers never-started queues and submits that raced the final flush
+        self.flush()
+
+    def submit(
+        self,
+        ticker: str,
+        yes_ask_price: Decimal,
+        no_ask_price: Decimal,
+        volume: int | None = None,
+        open_interest: int | None = None,
+    ) -> bool:
+        """
+        Queue the latest state for ticker, replacing any pending state.
+
+        Returns:
+            True if queued, False if dropped because the prices equal the
+            last persisted snapshot and nothing is pending for the ticker.
+        """
+        with self._lock:
+            if ticker in self._pending:
+                self._stats["write_behind_coalesced"] += 1
+            elif ticker not in self._in_flight and self.price_cache.is_unchanged(
+                ticker, yes_ask_price, no_ask_price
+            ):
+                return False
+            self._pending[ticker] = {
+                "yes_ask_price": yes_ask_price,
+                "no_ask_price": no_ask_price,
+                "volume": volume,
+                "open_interest": open_interest,
+            }
+            self._stats["write_behind_enqueued"] += 1
+            depth = len(self._pending)
+            self._stats["write_behind_queue_depth"] = depth
+            if depth > self._stats["write_behind_max_queue_depth"]:
+                self._stats["write_behind_max_queue_depth"] = depth
+
+        if depth >= self.max_pending:
+            self._wake.set()
+        return True
+
+    def flush(self) -> int:
+        """
+        Persist the latest pending state of every ticker in one transaction.
+
+        Tickers missing from the database are skipped (the poller creates
+        markets); tickers whose prices already match the current snapshot are
+        skipped. If the batched write fails, each row is retried individually.
+        If the flush fails as a whole (snapshot lookup or both write paths
+        raise), the batch is merged back into the pending set, with updates
+        submitted since the flush began taking precedence, and retried on
+        the next window.
+
+        Returns:
+            Number of markets versioned.
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                batch = self._pending
+                self._pending = {}
+                self._in_flight = set(batch)
+                self._stats["write_behind_queue_depth"] = 0
+
+            start = time.perf_counter()
+            written = 0
+            try:
+                written = self._write_batch(batch)
+            except Exception as e:
+                for ticker in batch:
+                    self.price_cache.invalidate(ticker)
+                with self._lock:
+                    self._pending = batch | self._pending
+                    self._stats["write_behind_flush_errors"] += 1
+                    self._stats["write_behind_requeued"] += len(batch)
+                    self._stats["write_behind_queue_depth"] = len(self._pending)
+                logger.error(
+                    "Write-behind flush of %d tickers failed, retrying next window: %s",
+                    len(batch),
+                    e,
+                )
+            finally:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                with self._lock:
+                    self._in_flight = set()
+                    self._stats["write_behind_flushes"] += 1
+                    self._stats["write_behind_rows_written"] += written
+                    self._stats["write_behind_last_flush_ms"] = round(elapsed_ms, 3)
+                    if elapsed_ms > self._stats["write_behind_max_flush_ms"]:
+                        self._stats["write_behind_max_flush_ms"] = round(elapsed_ms, 3)
+            return written
+
+    def get_stats(self) -> dict[str, int | float]:
+        """Return queue depth, coalescing and flush latency counters."""
+        with self._lock:
+            return dict(self._stats)
+
+    def _write_batch(self, batch: dict[str, _PendingPrice]) -> int:
+        """Diff batch against current snapshots and version the changed tickers."""
+        existing_by_ticker = get_current_markets_by_tickers(list(batch))
+
+        rows: list[dict[str, Any]] = []
+        for ticker, update in batch.items():
+            existing = existing_by_ticker.get(ticker)
+            if existing is None:
+                logger.debug("Market %s not in database, skipping WS update", ticker)
+                continue
+            if (
+                existing["yes_ask_price"] == update["yes_ask_price"]
+                and existing["no_ask_price"] == update["no_ask_price"]
+            ):
+                self.price_cache.put(ticker, existing["yes_ask_price"], existing["no_ask_price"])
+                continue
+            rows.append({"ticker": ticker, **update})
+
+        if not rows:
+            return 0
+
+        written = rows
+        try:
+            market_pks = list(update_markets_with_versioning_batch(rows).values())
+        except Exception as e:
+            logger.warning(
+                "Batched WS update of %d markets failed, retrying per market: %s", len(rows), e
+            )
+            written = []
+            market_pks = []
+            for row in rows:
+                try:
+                    market_pks.append(update_market_with_versioning(**row))
+                    written.append(row)
+                except Exception as row_err:
+                    self.price_cache.invalidate(row["ticker"])
+                    logger.error("Database sync error for %s: %s", row["ticker"], row_err)
+        get_alignment_event_bus().publish_snapshots(market_pks)
+
+        for row in written:
+            self.price_cache.put(row["ticker"], row["yes_ask_price"], row["no_ask_price"])
+        return len(written)
+
+    def _run(self) -> None:
+        """Flusher thread: flush every window (or early on backpressure), drain on close."""
+        while not self._closing.is_set():
+            self._wake.wait(self.window)
+            self._wake.clear()
+            self.flush()
+        self.flush()
+
+
 # =============================================================================
 # WebSocket Handler
 # =============================================================================
@@ -187,12 +479,22 @@ class KalshiWebSocketHandler:
     RECONNECT_MAX_DELAY: ClassVar[float] = 60.0  # seconds
     RECONNECT_MAX_ATTEMPTS: ClassVar[int] = 10  # before giving up
 
+    # Write-behind coalescing window for DB sync (0 disables: write per tick)
+    WRITE_BEHIND_WINDOW: ClassVar[float] = PriceWriteBehindQueue.DEFAULT_WINDOW
+
+    # Orderbook depth sampling to orderbook_snapshots (0 disables persistence)
+    ORDERBOOK_SAMPLE_INTERVAL: ClassVar[float] = OrderBookSampler.DEFAULT_INTERVAL
+    ORDERBOOK_SAMPLE_LEVELS: ClassVar[int] = OrderBookSampler.DEFAULT_LEVELS
+
     def __init__(
         self,
         environment: str = "demo",
         auth: KalshiAuth | None = None,
         auto_reconnect: bool = True,
         sync_to_database: bool = True,
+        price_cache: MarketPriceCache | None = None,
+        write_behind_window: float | None = None,
+        orderbook_sample_interval: float | None = None,
     ) -> None:
         """
         Initialize the KalshiWebSocketHandler.
@@ -203,6 +505,16 @@ class KalshiWebSocketHandler:
                 If not provided, will be created from environment variables.
             auto_reconnect: Whether to automatically reconnect on disconnect.
             sync_to_database: Whether to sync price updates to database.
+            price_cache: Cache of last persisted prices consulted before each DB
+                sync. Defaults to the process-wide cache shared with
+                KalshiMarketPoller.
+            write_behind_window: Seconds to coalesce price updates before a
+                batched DB flush (default WRITE_BEHIND_WINDOW). 0 writes each
+                changed tick immediately.
+            orderbook_sample_interval: Seconds between orderbook depth
+                snapshots written to orderbook_snapshots (default
+                ORDERBOOK_SAMPLE_INTERVAL). 0 keeps the in-memory books
+                without persisting them.
 
         Raises:
             ValueError: If environment is invalid.
@@ -211,10 +523,34 @@ class KalshiWebSocketHandler:
             raise ValueError("environment must be 'demo' or 'prod'")
 
         self.environment = environment
+        self.price_cache = price_cache if price_cache is not None else get_market_price_cache()
         self.ws_url = self.DEMO_WS_URL if environment == "demo" else self.PROD_WS_URL
         self.auto_reconnect = auto_reconnect
         self.sync_to_database = sync_to_database
 
+        # Write-behind stage for DB sync (None = immediate per-tick writes)
+        window = self.WRITE_BEHIND_WINDOW if write_behind_window is None else write_behind_window
+        self._write_behind: PriceWriteBehindQueue | None = (
+            PriceWriteBehindQueue(window=window, price_cache=self.price_cache)
+            if window > 0
+            else None
+        )
+
+        # Live order books from the orderbook_delta channel, sampled to the DB
+        self.orderbooks = OrderBookStore()
+        interval = (
+            self.ORDERBOOK_SAMPLE_INTERVAL
+            if orderbook_sample_interval is None
+            else orderbook_sample_interval
+        )
+        self._orderbook_sampler: OrderBookSampler | None = (
+            OrderBookSampler(
+                self.orderbooks, interval=interval, levels=self.ORDERBOOK_SAMPLE_LEVELS
+            )
+            if interval > 0
+            else None
+        )
+
         # Authentication (deferred initialization)
         self._auth = auth
         self._auth_initialized = auth is not None
@@ -302,9 +638,18 @@ class KalshiWebSocketHandler:
         Implements EventLoopService Protocol for ServiceSupervisor compatibility.
 
         Returns:
-            Dictionary with WebSocket statistics
+            Dictionary with WebSocket statistics, including price cache
+            hit/miss/eviction counters, write-behind queue metrics and
+            orderbook counters
         """
-        return dict(self.stats)
+        stats: dict[str, Any] = dict(self.stats)
+        stats.update(self.price_cache.get_stats())
+        if self._write_behind is not None:
+            stats.update(self._write_behind.get_stats())
+        stats.update(self.orderbooks.get_stats())
+        if self._orderbook_sampler is not None:
+            stats.update(self._orderbook_sampler.get_stats())
+        return stats
 
     def add_callback(self, callback: Callable[[str, Decimal, Decimal], None]) -> None:
         """
@@ -371,6 +716,10 @@ class KalshiWebSocketHandler:
                 self._send_unsubscribe(list(removed_tickers)), self._loop
             )
 
+        self.orderbooks.remove(removed_tickers)
+        if self._orderbook_sampler is not None:
+            self._orderbook_sampler.forget(removed_tickers)
+
         logger.info("Unsubscribed from %d tickers", len(removed_tickers))
 
     def start(self) -> None:
@@ -395,6 +744,11 @@ class KalshiWebSocketHandler:
             self._enabled = True
             self._state = ConnectionState.CONNECTING
 
+        if self._write_behind is not None:
+            self._write_behind.start()
+        if self._orderbook_sampler is not None and self.sync_to_database:
+            self._orderbook_sampler.start()
+
         # Start event loop in background thread
         self._thread = threading.Thread(target=self._run_event_loop, daemon=True)
         self._thread.start()
@@ -405,6 +759,9 @@ class KalshiWebSocketHandler:
         """
         Stop the WebSocket handler.
 
+        Pending write-behind updates are always flushed before returning,
+        whether or not ``wait`` is set.
+
         Args:
             wait: If True, wait for clean disconnect.
             timeout: Maximum seconds to wait for shutdown.
@@ -424,6 +781,12 @@ class KalshiWebSocketHandler:
             if wait and self._thread:
                 self._thread.join(timeout=timeout)
 
+        # Drain after the connection is closed so no new ticks race the flush
+        if self._write_behind is not None:
+            self._write_behind.close(timeout=timeout)
+        if self._orderbook_sampler is not None and self.sync_to_database:
+            self._orderbook_sampler.close(timeout=timeout)
+
         logger.info("KalshiWebSocketHandler stopped")
 
     def _init_auth(self) -> None:
@@ -577,6 +940,10 @@ class KalshiWebSocketHandler:
 
             logger.info("WebSocket connected to %s", self.ws_url)
 
+            # Books from a previous connection may have missed deltas; the
+            # subscription below delivers a fresh snapshot per market
+            self.orderbooks.clear()
+
             # Subscribe to stored tickers
             if self._subscribed_tickers:
                 await self._send_subscribe(list(self._subscribed_tickers))
@@ -636,9 +1003,10 @@ class KalshiWebSocketHandler:
         Messages can be:
         - Subscription confirmations
         - Ticker updates
-        - Orderbook deltas
+        - Orderbook snapshots and deltas
         - Error responses
         """
+        start = time.perf_counter()
         with self._lock:
             self._stats["messages_received"] += 1
             self._stats["last_message"] = datetime.now(UTC).isoformat()
@@ -647,13 +1015,24 @@ class KalshiWebSocketHandler:
             data = json.loads(message)
         except json.JSONDecodeError as e:
             logger.warning("Invalid JSON message: %s", e)
+            _WS_MESSAGES.labels("invalid").inc()
             return
 
         # Handle different message types
         msg_type = data.get("type")
+        label = msg_type if msg_type in _WS_MESSAGE_TYPES else "other"
+        try:
+            await self._dispatch_message(msg_type, data)
+        finally:
+            _WS_MESSAGES.labels(label).inc()
+            _WS_HANDLER_SECONDS.labels(label).observe(time.perf_counter() - start)
 
+    async def _dispatch_message(self, msg_type: Any, data: dict[str, Any]) -> None:
+        """Route a decoded message to its handler by type."""
         if msg_type == "ticker":
             await self._handle_ticker_update(data)
+        elif msg_type == "orderbook_snapshot":
+            await self._handle_orderbook_snapshot(data)
         elif msg_type == "orderbook_delta":
             await self._handle_orderbook_delta(data)
         elif msg_type == "subscribed":
@@ -703,9 +1082,21 @@ class KalshiWebSocketHandler:
             except Exception as e:
                 logger.error("Callback error: %s", e)
 
-        # Sync to database if enabled
+        # Sync to database if enabled. Prices equal to the last persisted
+        # snapshot (per the shared price cache) skip the thread hop and DB read.
+        # With write-behind enabled, changed ticks are coalesced per ticker and
+        # flushed in batches instead (see PriceWriteBehindQueue).
         if self.sync_to_database:
-            await asyncio.to_thread(self._sync_price_to_db, ticker, yes_price, no_price, msg)
+            if self._write_behind is not None:
+                self._write_behind.submit(
+                    ticker,
+                    yes_price,
+                    no_price,
+                    volume=msg.get("volume"),
+                    open_interest=msg.get("open_interest"),
+                )
+            elif not self.price_cache.is_unchanged(ticker, yes_price, no_price):
+                await asyncio.to_thread(self._sync_price_to_db, ticker, yes_price, no_price, msg)
 
         logger.debug(
             "Ticker update: %s YES=$%s NO=$%s",
@@ -714,17 +1105,28 @@ class KalshiWebSocketHandler:
             no_price,
         )
 
+    async def _handle_orderbook_snapshot(self, data: dict[str, Any]) -> None:
+        """
+        Handle orderbook snapshot (full book sent after subscribing).
+
+        Replaces the market's in-memory book; later deltas apply on top of it.
+        """
+        msg = data.get("msg", {})
+        if self.orderbooks.apply_snapshot_message(msg):
+            logger.debug("Orderbook snapshot for %s", msg.get("market_ticker"))
+
     async def _handle_orderbook_delta(self, data: dict[str, Any]) -> None:
         """
         Handle orderbook delta update.
 
         Orderbook deltas show changes to the order book (bids/asks added/removed).
-        Useful for market depth analysis but not directly used for price updates.
+        They are applied to the in-memory book in place; depth is persisted by
+        OrderBookSampler at most once per interval, not per delta. Deltas for
+        a market without a snapshot yet are dropped.
         """
-        # For now, just log orderbook deltas
-        # Full orderbook tracking is planned for Phase 3
-        ticker = data.get("msg", {}).get("market_ticker")
-        logger.debug("Orderbook delta for %s", ticker)
+        msg = data.get("msg", {})
+        if not self.orderbooks.apply_delta_message(msg):
+            logger.debug("Dropped orderbook delta for %s", msg.get("market_ticker"))
 
     def _sync_price_to_db(
         self,
@@ -737,6 +1139,8 @@ class KalshiWebSocketHandler:
         Sync price update to database.
 
         Uses SCD Type 2 versioning - creates new row if price changed.
+        Writes through self.price_cache so later duplicate messages can be
+        skipped by _handle_ticker_update without a database round trip.
 
         Args:
             ticker: Market ticker
@@ -757,7 +1161,9 @@ class KalshiWebSocketHandler:
                 existing["yes_ask_price"] != yes_price or existing["no_ask_price"] != no_price
             )
 
-            if price_changed:
+            if not price_changed:
+                self.price_cache.put(ticker, existing["yes_ask_price"], existing["no_ask_price"])
+            else:
                 # Note: enrichment fields (volume_24h, previous_*, depth signals)
                 # are not available in WebSocket messages — only price/volume data.
                 # Existing enrichment values are preserved via fallback logic in
@@ -770,6 +1176,7 @@ class KalshiWebSocketHandler:
                     volume=msg.get("volume"),
                     open_interest=msg.get("open_interest"),
                 )
+                self.price_cache.put(ticker, yes_price, no_price)
                 logger.debug(
                     "Updated market via WS: %s (yes: %s -> %s)",
                     ticker,
@@ -777,6 +1184,7 @@ class KalshiWebSocketHandler:
                     yes_price,
                 )
         except Exception as e:
+            self.price_cache.invalidate(ticker)
             logger.error("Database sync error for %s: %s", ticker, e)
 
     async def _close_connection(self) -> None:
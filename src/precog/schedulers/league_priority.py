@@ -55,6 +55,10 @@ DEFAULT_MARKET_THRESHOLDS: dict[str, int] = {
 
 DEFAULT_MARKET_COUNT_CACHE_TTL: int = 300  # 5 minutes
 
+# Priority multiplier for tracking leagues whose last scoreboard poll had no
+# changed games (304 or identical payloads); their share goes to live leagues
+DEFAULT_QUIET_PRIORITY_FACTOR: float = 0.5
+
 
 class LeaguePriorityCalculator:
     """Computes per-league polling priority from game phase, markets, and config.
@@ -70,6 +74,8 @@ class LeaguePriorityCalculator:
         market_count_cache_ttl: Seconds to cache market count queries.
         market_count_fn: Callable(subcategory: str) -> int for DB query.
             If None, active_markets signal always returns 0.0.
+        quiet_priority_factor: Multiplier (0.0-1.0) applied to the priority
+            of leagues passed as quiet_leagues to allocate_budget().
 
     Educational Note:
         The calculator is designed to be fast (runs under the poller's lock).
@@ -84,6 +90,7 @@ class LeaguePriorityCalculator:
         market_thresholds: dict[str, int] | None = None,
         market_count_cache_ttl: int = DEFAULT_MARKET_COUNT_CACHE_TTL,
         market_count_fn: Callable[[str], int] | None = None,
+        quiet_priority_factor: float = DEFAULT_QUIET_PRIORITY_FACTOR,
     ) -> None:
         self._weights = weights or DEFAULT_WEIGHTS.copy()
         self._league_priorities = league_priorities or DEFAULT_LEAGUE_PRIORITIES.copy()
@@ -95,6 +102,11 @@ class LeaguePriorityCalculator:
         for key, val in self._weights.items():
             if val < 0:
                 raise ValueError(f"Weight '{key}' must be non-negative, got {val}")
+        if not 0.0 <= quiet_priority_factor <= 1.0:
+            raise ValueError(
+                f"quiet_priority_factor must be between 0.0 and 1.0, got {quiet_priority_factor}"
+            )
+        self._quiet_priority_factor = quiet_priority_factor
 
         # Cache: subcategory -> (count, timestamp)
         self._market_count_cache: dict[str, tuple[int, float]] = {}
@@ -342,6 +354,7 @@ class LeaguePriorityCalculator:
         base_interval: int,
         max_throttled_interval: int,
         league_games: dict[str, list[dict[str, Any]]],
+        quiet_leagues: set[str] | None = None,
     ) -> dict[str, int]:
         """Allocate polling budget across tracking leagues by priority.
 
@@ -358,6 +371,10 @@ class LeaguePriorityCalculator:
             base_interval: Minimum polling interval (seconds).
             max_throttled_interval: Maximum polling interval cap (seconds).
             league_games: Dict mapping league -> list of ESPNGameFull dicts.
+            quiet_leagues: Leagues whose last poll returned no changed games.
+                Their priority is scaled by quiet_priority_factor so the
+                budget they would spend re-fetching an unchanged scoreboard
+                goes to leagues that are actually moving.
 
         Returns:
             Dict mapping league code -> polling interval in seconds.
@@ -374,6 +391,8 @@ class LeaguePriorityCalculator:
         for league in tracking_leagues:
             games = league_games.get(league, [])
             priorities[league] = self.compute_composite_priority(league, games)
+            if quiet_leagues and league in quiet_leagues:
+                priorities[league] *= self._quiet_priority_factor
 
         total_priority = sum(priorities.values())
 
@@ -0,0 +1,135 @@
+"""
+Process-local cache of the last persisted YES/NO ask price per market.
+
+Both write paths into market_snapshots (KalshiMarketPoller over REST and
+KalshiWebSocketHandler over WebSocket) write through this cache after every
+successful read or versioned write. The WebSocket handler consults it before
+touching Postgres, so a ticker message that repeats the last persisted prices
+never reaches the database.
+
+Design:
+    - Keyed by market ticker, value is (yes_ask_price, no_ask_price)
+    - Bounded: least-recently-used tickers are evicted beyond max_size
+    - Thread-safe: one lock guards the OrderedDict and counters (the poller
+      runs on an APScheduler thread, WebSocket DB sync on asyncio.to_thread)
+
+Educational Note:
+    The cache only ever holds values this process has read from or written to
+    the database, so a hit means "the current snapshot already has these
+    prices". It is not a source of truth: a miss always falls back to
+    get_current_market(), and a failed write invalidates the entry so the next
+    message re-reads the database. Writers in OTHER processes are not seen;
+    run the poller and WebSocket handler in the same process (as
+    ServiceSupervisor and MarketDataManager do) so they share one cache.
+
+Reference: REQ-DATA-005 (Market Price Data Collection)
+"""
+
+import threading
+from collections import OrderedDict
+from decimal import Decimal
+
+
+class MarketPriceCache:
+    """
+    Bounded LRU cache of last persisted (yes_ask_price, no_ask_price) by ticker.
+
+    Usage:
+        >>> cache = MarketPriceCache(max_size=2)
+        >>> cache.put("KXNFLGAME-A", Decimal("0.52"), Decimal("0.49"))
+        >>> cache.is_unchanged("KXNFLGAME-A", Decimal("0.52"), Decimal("0.49"))
+        True
+        >>> cache.get_stats()["price_cache_hits"]
+        1
+    """
+
+    DEFAULT_MAX_SIZE = 10_000
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_size: Maximum number of tickers kept before LRU eviction.
+
+        Raises:
+            ValueError: If max_size < 1.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+
+        self.max_size = max_size
+        self._prices: OrderedDict[str, tuple[Decimal, Decimal]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._prices)
+
+    def get(self, ticker: str) -> tuple[Decimal, Decimal] | None:
+        """
+        Return the last persisted (yes_ask, no_ask) for ticker, or None.
+
+        Counts a hit or miss and marks the ticker as recently used.
+        """
+        with self._lock:
+            prices = self._prices.get(ticker)
+            if prices is None:
+                self._misses += 1
+                return None
+            self._prices.move_to_end(ticker)
+            self._hits += 1
+            return prices
+
+    def is_unchanged(self, ticker: str, yes_ask_price: Decimal, no_ask_price: Decimal) -> bool:
+        """Return True if the cached prices for ticker equal the given prices."""
+        return self.get(ticker) == (yes_ask_price, no_ask_price)
+
+    def put(self, ticker: str, yes_ask_price: Decimal, no_ask_price: Decimal) -> None:
+        """Record the persisted prices for ticker, evicting the LRU entry if full."""
+        with self._lock:
+            self._prices[ticker] = (yes_ask_price, no_ask_price)
+            self._prices.move_to_end(ticker)
+            while len(self._prices) > self.max_size:
+                self._prices.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, ticker: str) -> None:
+        """Forget ticker (e.g. after a failed write) so the next lookup reads the DB."""
+        with self._lock:
+            self._prices.pop(ticker, None)
+
+    def clear(self) -> None:
+        """Drop all entries. Counters are kept."""
+        with self._lock:
+            self._prices.clear()
+
+    def get_stats(self) -> dict[str, int]:
+        """Return hit/miss/eviction counters and current size, prefixed for get_stats() merges."""
+        with self._lock:
+            return {
+                "price_cache_hits": self._hits,
+                "price_cache_misses": self._misses,
+                "price_cache_evictions": self._evictions,
+                "price_cache_size": len(self._prices),
+            }
+
+
+_shared_cache: MarketPriceCache | None = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_market_price_cache() -> MarketPriceCache:
+    """
+    Return the process-wide MarketPriceCache shared by the poller and WebSocket handler.
+
+    Created lazily on first use with the default size.
+    """
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = MarketPriceCache()
+        return _shared_cache
@@ -44,6 +44,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Protocol, cast
 
+from precog.database.connection import get_pool_stats
 from precog.database.crud_schedulers import (
     check_active_schedulers,
     cleanup_stale_schedulers,
@@ -62,11 +63,26 @@ from precog.schedulers.canonical_observations_writer import (
 from precog.schedulers.espn_game_poller import ESPNGamePoller, create_espn_poller
 from precog.schedulers.kalshi_poller import KalshiMarketPoller, create_kalshi_poller
 from precog.schedulers.kalshi_websocket import KalshiWebSocketHandler, create_websocket_handler
-from precog.schedulers.temporal_alignment_writer import TemporalAlignmentWriter
+from precog.schedulers.streaming_aligner import StreamingTemporalAligner
+from precog.schedulers.temporal_alignment_writer import (
+    TemporalAlignmentWriter,
+    create_temporal_alignment_writer,
+)
+from precog.utils.metrics import MetricsServer, get_metrics_registry
 
 # Set up logging early for helper functions
 logger = logging.getLogger(__name__)
 
+_metrics = get_metrics_registry()
+_UPTIME = _metrics.gauge("precog_supervisor_uptime_seconds", "Supervisor uptime")
+_SERVICE_UP = _metrics.gauge("precog_service_up", "1 if the service is healthy", ("service",))
+_SERVICE_RESTARTS = _metrics.gauge(
+    "precog_service_restarts", "Restarts since the supervisor started", ("service",)
+)
+_SERVICE_ERRORS = _metrics.gauge(
+    "precog_service_errors", "Errors since the supervisor started", ("service",)
+)
+
 # Service registry: maps service names to their health metadata.
 # Built at import time from class variables on poller classes.
 # Adding a new service requires only:
@@ -202,6 +218,8 @@ class RunnerConfig:
         log_backup_count: Number of rotated log files to keep
         health_check_interval: Seconds between health checks
         metrics_interval: Seconds between metrics output
+        metrics_port: Port for the local Prometheus /metrics endpoint
+            (None disables the endpoint)
         services: Per-service configuration
 
     Educational Note:
@@ -218,6 +236,7 @@ class RunnerConfig:
     log_backup_count: int = 5
     health_check_interval: int = 60
     metrics_interval: int = 300
+    metrics_port: int | None = None
     services: dict[str, ServiceConfig] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
@@ -359,6 +378,7 @@ class ServiceSupervisor:
         self._shutdown_event = threading.Event()
         self._health_thread: threading.Thread | None = None
         self._metrics_thread: threading.Thread | None = None
+        self._metrics_server: MetricsServer | None = None
         self._start_time: datetime | None = None
         self._alert_callbacks: list[Callable[[str, str, dict[str, Any]], None]] = []
 
@@ -629,6 +649,9 @@ class ServiceSupervisor:
         )
         self._metrics_thread.start()
 
+        if self.config.metrics_port is not None:
+            self._start_metrics_server(self.config.metrics_port)
+
         self.logger.info(
             "All services started. Health check every %ds, metrics every %ds",
             self.config.health_check_interval,
@@ -715,6 +738,7 @@ class ServiceSupervisor:
                     self.logger.warning(
                         "Metrics thread did not exit within 5s; proceeding with DB cleanup"
                     )
+            self._stop_metrics_server()
 
             # Step 3: stop each service, isolating failures per-service
             for name, state in self.services.items():
@@ -1143,6 +1167,48 @@ class ServiceSupervisor:
 
             self._output_metrics()
 
+    def _start_metrics_server(self, port: int) -> None:
+        """
+        Serve the process metrics registry on 127.0.0.1:port.
+
+        A bind failure (port in use) is logged; the services keep running
+        without the endpoint.
+        """
+        registry = get_metrics_registry()
+        registry.add_collect_hook(self._collect_metrics)
+        server = MetricsServer(registry, port=port)
+        try:
+            server.start()
+        except OSError as e:
+            registry.remove_collect_hook(self._collect_metrics)
+            self.logger.error("Failed to start metrics endpoint on port %d: %s", port, e)
+            return
+        self._metrics_server = server
+
+    def _stop_metrics_server(self) -> None:
+        """Stop the metrics endpoint if it is running."""
+        server, self._metrics_server = self._metrics_server, None
+        if server is None:
+            return
+        server.registry.remove_collect_hook(self._collect_metrics)
+        try:
+            server.stop()
+        except Exception as e:
+            self.logger.warning("Error stopping metrics endpoint: %s", e)
+
+    def _collect_metrics(self) -> None:
+        """
+        Collect hook: publish supervisor state as gauges at scrape time.
+
+        Reads only ServiceState fields (no get_stats() calls), so a scrape
+        never waits on a service lock.
+        """
+        _UPTIME.set(self.uptime_seconds)
+        for name, state in list(self.services.items()):
+            _SERVICE_UP.labels(name).set(1 if state.healthy else 0)
+            _SERVICE_RESTARTS.labels(name).set(state.restart_count)
+            _SERVICE_ERRORS.labels(name).set(state.error_count)
+
     def _output_metrics(self) -> None:
         """Collect and output aggregate metrics with per-service poll counts."""
         aggregate = self.get_aggregate_metrics()
@@ -1156,6 +1222,12 @@ class ServiceSupervisor:
             svc_parts.append(f"{name}={polls}polls/{errs}err")
 
         svc_summary = ", ".join(svc_parts) if svc_parts else "no services"
+        pool_stats = aggregate["database_pool"]
+        if pool_stats.get("pool_initialized"):
+            svc_summary += (
+                f" | db_pool={pool_stats['pool_in_use']}/{pool_stats['pool_max_size']}"
+                f" waiting={pool_stats['pool_waiting']} timeouts={pool_stats['pool_timeouts']}"
+            )
 
         self.logger.info(
             "Metrics: healthy=%d/%d, uptime=%.0fs | %s",
@@ -1176,7 +1248,8 @@ class ServiceSupervisor:
 
         Returns:
             Dictionary with metrics including uptime, service counts,
-            error totals, restart totals, and per-service stats.
+            error totals, restart totals, per-service stats and database
+            connection pool stats.
         """
         aggregate: dict[str, Any] = {
             "uptime_seconds": self.uptime_seconds,
@@ -1184,6 +1257,7 @@ class ServiceSupervisor:
             "services_healthy": sum(1 for s in self.services.values() if s.healthy),
             "total_restarts": sum(s.restart_count for s in self.services.values()),
             "total_errors": sum(s.error_count for s in self.services.values()),
+            "database_pool": get_pool_stats(),
             "per_service": {},
         }
 
@@ -1217,6 +1291,7 @@ def _create_espn(
     leagues: list[str] | None = None,
     espn_poll_interval: int = 30,
     priority_calculator: Any | None = None,
+    espn_live_elo: bool = False,
     **_kwargs: Any,
 ) -> EventLoopService:
     """Factory for ESPN Game Poller."""
@@ -1226,6 +1301,7 @@ def _create_espn(
             leagues=leagues,
             poll_interval=espn_poll_interval,
             priority_calculator=priority_calculator,
+            live_elo=espn_live_elo,
         ),
     )
 
@@ -1235,6 +1311,8 @@ def _create_kalshi_rest(
     kalshi_env: str = "demo",
     series_tickers: list[str] | None = None,
     kalshi_poll_interval: int = 15,
+    kalshi_batch_sync: bool = False,
+    kalshi_fetch_workers: int = 1,
     **_kwargs: Any,
 ) -> EventLoopService | None:
     """Factory for Kalshi REST Poller. Returns None if credentials missing."""
@@ -1249,6 +1327,8 @@ def _create_kalshi_rest(
             series_tickers=series_tickers,
             poll_interval=kalshi_poll_interval,
             environment=kalshi_env,
+            batch_sync=kalshi_batch_sync,
+            fetch_workers=kalshi_fetch_workers,
         ),
     )
 
@@ -1272,24 +1352,20 @@ def _create_kalshi_ws(
 
 
 def _create_temporal_alignment(
+    config: RunnerConfig,
+    streaming_alignment: bool = False,
     **_kwargs: Any,
-) -> EventLoopService | None:
-    """Factory for Temporal Alignment Writer — disabled post-V2.45.
-
-    Migration 0084 (ADR-118 V2.45 Item 6) redesigned ``temporal_alignment``
-    as a pure linkage table.  The legacy writer in
-    ``src/precog/schedulers/temporal_alignment_writer.py`` SELECTs/INSERTs
-    columns that no longer exist on the new shape (``market_snapshot_id``,
-    ``game_state_id``, ``home_score``, ``yes_ask_price``, etc.) and would
-    crash on first poll cycle if registered.  Cohort 5+ rewrite tracked at
-    issue #1141 will re-author the writer against the linkage shape +
-    canonical_observations source streams.
-
-    Returns ``None`` so ``create_services`` (lines ~1374-1378) silently
-    skips registration + disables the service config — same shape used
-    by future-service factories that aren't yet implemented.
+) -> EventLoopService:
+    """Factory for temporal alignment: batch writer, or the streaming aligner.
+
+    Both write the Migration 0084 linkage shape through
+    ``temporal_alignment_writer.write_alignments()``.  The streaming aligner
+    listens on the process-wide alignment bus, so it only sees writes from
+    pollers running in this process.
     """
-    return None
+    if streaming_alignment:
+        return cast("EventLoopService", StreamingTemporalAligner())
+    return cast("EventLoopService", create_temporal_alignment_writer())
 
 
 def _create_canonical_observations_writer(
@@ -1333,6 +1409,10 @@ def create_services(
     espn_poll_interval: int = 30,
     kalshi_poll_interval: int = 15,
     priority_calculator: Any | None = None,
+    espn_live_elo: bool = False,
+    kalshi_batch_sync: bool = False,
+    kalshi_fetch_workers: int = 1,
+    streaming_alignment: bool = False,
 ) -> dict[str, tuple[EventLoopService, ServiceConfig]]:
     """
     Create service instances based on configuration.
@@ -1348,6 +1428,11 @@ def create_services(
         series_tickers: Kalshi series to poll (None = use KalshiMarketPoller defaults)
         espn_poll_interval: ESPN poll interval in seconds
         kalshi_poll_interval: Kalshi poll interval in seconds
+        espn_live_elo: Update Elo ratings incrementally as ESPN games go final
+        kalshi_batch_sync: Sync Kalshi markets with the batched per-series path
+        kalshi_fetch_workers: Kalshi series paginated concurrently (1 = sequential)
+        streaming_alignment: Run temporal_alignment as the streaming aligner
+            instead of the 30-second batch writer
 
     Returns:
         Dict mapping service name to (service, config) tuple
@@ -1377,6 +1462,10 @@ def create_services(
                 espn_poll_interval=espn_poll_interval,
                 kalshi_poll_interval=kalshi_poll_interval,
                 priority_calculator=priority_calculator,
+                espn_live_elo=espn_live_elo,
+                kalshi_batch_sync=kalshi_batch_sync,
+                kalshi_fetch_workers=kalshi_fetch_workers,
+                streaming_alignment=streaming_alignment,
             )
 
             if service is not None:
@@ -1403,6 +1492,11 @@ def create_supervisor(
     health_check_interval: int = 60,
     metrics_interval: int = 300,
     priority_calculator: Any | None = None,
+    espn_live_elo: bool = False,
+    metrics_port: int | None = None,
+    kalshi_batch_sync: bool = False,
+    kalshi_fetch_workers: int = 1,
+    streaming_alignment: bool = False,
 ) -> ServiceSupervisor:
     """
     Create and configure a ServiceSupervisor with services.
@@ -1420,6 +1514,12 @@ def create_supervisor(
         kalshi_poll_interval: Kalshi poll interval in seconds
         health_check_interval: Seconds between health checks
         metrics_interval: Seconds between metrics output
+        espn_live_elo: Update Elo ratings incrementally as ESPN games go final
+        metrics_port: Serve Prometheus metrics on 127.0.0.1:<port> (None = off)
+        kalshi_batch_sync: Sync Kalshi markets with the batched per-series path
+        kalshi_fetch_workers: Kalshi series paginated concurrently (1 = sequential)
+        streaming_alignment: Also run temporal alignment, streamed from the
+            pollers' writes (adds the ``temporal_alignment`` service)
 
     Returns:
         Configured ServiceSupervisor with services registered
@@ -1437,7 +1537,12 @@ def create_supervisor(
         environment=Environment(environment),
         health_check_interval=health_check_interval,
         metrics_interval=metrics_interval,
+        metrics_port=metrics_port,
     )
+    if streaming_alignment:
+        config.services["temporal_alignment"] = ServiceConfig(name="Temporal Alignment")
+        if enabled_services:
+            enabled_services = {*enabled_services, "temporal_alignment"}
 
     # Create services with user-specified parameters
     services = create_services(
@@ -1449,6 +1554,10 @@ def create_supervisor(
         espn_poll_interval=espn_poll_interval,
         kalshi_poll_interval=kalshi_poll_interval,
         priority_calculator=priority_calculator,
+        espn_live_elo=espn_live_elo,
+        kalshi_batch_sync=kalshi_batch_sync,
+        kalshi_fetch_workers=kalshi_fetch_workers,
+        streaming_alignment=streaming_alignment,
     )
 
     # Create supervisor
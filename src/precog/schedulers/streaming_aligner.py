@@ -0,0 +1,291 @@
+"""
+Streaming temporal aligner fed by the in-process alignment bus.
+
+TemporalAlignmentWriter discovers snapshot/game-state pairs from Postgres on
+a 30-second cycle, so an alignment appears up to a poll interval after the
+snapshot was written. StreamingTemporalAligner instead listens on the
+AlignmentEventBus:
+
+    - GameStateWritten: remembered as the latest state of its game (memory only)
+    - SnapshotsWritten: the market ids are queued; a flusher thread wakes every
+      ``window`` seconds, resolves the new current snapshot of each queued
+      market in one indexed query, pairs it with the game's latest state and
+      writes all pairs with one write_alignments() call
+
+Alignment lag (snapshot write -> alignment row) is therefore about ``window``
+seconds instead of the writer's poll interval, and the lookback discovery
+query is not needed while streaming runs.
+
+Educational Note:
+    The streamed pairing is "latest state at or before the snapshot": at write
+    time the state after the snapshot does not exist yet. That is the state a
+    live strategy would have seen, which is what the alignment is for. The
+    batch writer's before/after probes remain the tool for reconstructing
+    history.
+
+    The snapshot writers return markets.id, not market_snapshots.id, so one
+    lookup per flush (current snapshot by market_id, a partial-index probe)
+    is still needed to get the snapshot row; it touches only the markets that
+    were just written.
+
+Reference: Issue #722 (temporal alignment)
+"""
+
+import logging
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Any, ClassVar
+
+from precog.database.connection import get_cursor
+from precog.schedulers.alignment_bus import (
+    AlignmentEventBus,
+    GameStateWritten,
+    SnapshotsWritten,
+    get_alignment_event_bus,
+)
+from precog.schedulers.temporal_alignment_writer import build_alignment_record, write_alignments
+from precog.utils.latency_histogram import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+# Current snapshot of each written market, with the game it belongs to.
+_CURRENT_SNAPSHOTS_QUERY = """
+    SELECT
+        ms.id AS market_snapshot_id,
+        ms.market_id,
+        ms.row_start_ts AS snapshot_time,
+        e.game_id,
+        g.canonical_event_id
+    FROM market_snapshots ms
+    JOIN markets m ON ms.market_id = m.id
+    JOIN events e ON m.event_id = e.id
+    JOIN games g ON e.game_id = g.id
+    WHERE ms.market_id = ANY(%s)
+      AND ms.row_current_ind = TRUE
+"""
+
+
+class StreamingTemporalAligner:
+    """
+    Aligns market snapshots to game states as they are written.
+
+    Implements the EventLoopService interface (start/stop/is_running/get_stats).
+
+    Usage:
+        >>> aligner = StreamingTemporalAligner(window=0.5)
+        >>> aligner.start()   # subscribes to get_alignment_event_bus()
+        >>> # ... pollers publish writes ...
+        >>> aligner.stop()    # unsubscribes and flushes what is pending
+    """
+
+    DEFAULT_WINDOW: ClassVar[float] = 0.5  # seconds
+    DEFAULT_MAX_PENDING: ClassVar[int] = 5000  # distinct markets
+    DEFAULT_MAX_STATE_AGE: ClassVar[float] = 6 * 3600.0  # seconds
+
+    def __init__(
+        self,
+        bus: AlignmentEventBus | None = None,
+        window: float = DEFAULT_WINDOW,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        max_state_age: float = DEFAULT_MAX_STATE_AGE,
+    ) -> None:
+        """
+        Initialize an idle aligner (call start() to subscribe and flush).
+
+        Args:
+            bus: Event bus to subscribe to (default: process-wide bus).
+            window: Seconds between flushes.
+            max_pending: Queued markets that trigger an early flush.
+            max_state_age: Game states older than this are forgotten, so
+                finished games do not accumulate in memory.
+
+        Raises:
+            ValueError: If window <= 0, max_pending < 1 or max_state_age <= 0.
+        """
+        if window <= 0:
+            raise ValueError("window must be > 0")
+        if max_pending < 1:
+            raise ValueError("max_pending must be >= 1")
+        if max_state_age <= 0:
+            raise ValueError("max_state_age must be > 0")
+
+        self.bus = bus if bus is not None else get_alignment_event_bus()
+        self.window = window
+        self.max_pending = max_pending
+        self.max_state_age = max_state_age
+
+        self._states: dict[int, GameStateWritten] = {}
+        # market_id -> earliest unflushed write time (for lag)
+        self._pending: dict[int, datetime] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closing = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lag = LatencyHistogram()
+
+        self._stats: dict[str, int | float] = {
+            "streaming_alignment_game_states_seen": 0,
+            "streaming_alignment_snapshots_queued": 0,
+            "streaming_alignment_flushes": 0,
+            "streaming_alignment_rows_written": 0,
+            "streaming_alignment_no_state": 0,
+            "streaming_alignment_flush_errors": 0,
+            "streaming_alignment_last_flush_ms": 0.0,
+        }
+
+    def start(self) -> None:
+        """Subscribe to the bus and start the flusher thread (no-op if running)."""
+        if self.is_running():
+            return
+        self._closing.clear()
+        self.bus.add_game_state_listener(self.on_game_state)
+        self.bus.add_snapshot_listener(self.on_snapshots)
+        self._thread = threading.Thread(
+            target=self._run, name="streaming-temporal-aligner", daemon=True
+        )
+        self._thread.start()
+        logger.info("Streaming temporal aligner started (window=%.2fs)", self.window)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Unsubscribe, stop the flusher and align everything still pending.
+
+        Args:
+            timeout: Maximum seconds to wait for the flusher's final flush.
+        """
+        self.bus.remove_game_state_listener(self.on_game_state)
+        self.bus.remove_snapshot_listener(self.on_snapshots)
+        self._closing.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            if self._thread.is_alive():
+                logger.warning(
+                    "Streaming aligner flusher did not exit within %.1fs; draining inline",
+                    timeout,
+                )
+            self._thread = None
+        self.flush()
+
+    def is_running(self) -> bool:
+        """Check if the flusher thread is active."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def on_game_state(self, event: GameStateWritten) -> None:
+        """Bus listener: keep the newest state per game."""
+        with self._lock:
+            current = self._states.get(event.game_id)
+            if current is None or event.state_time >= current.state_time:
+                self._states[event.game_id] = event
+            self._stats["streaming_alignment_game_states_seen"] += 1
+
+    def on_snapshots(self, event: SnapshotsWritten) -> None:
+        """Bus listener: queue written markets for the next flush."""
+        with self._lock:
+            for market_id in event.market_ids:
+                self._pending.setdefault(market_id, event.written_at)
+            self._stats["streaming_alignment_snapshots_queued"] += len(event.market_ids)
+            depth = len(self._pending)
+        if depth >= self.max_pending:
+            self._wake.set()
+
+    def flush(self) -> int:
+        """
+        Align every queued market against the latest known game state.
+
+        Markets whose game has no state in memory yet are skipped (counted as
+        no_state). A failed flush is logged and counted; those snapshots are
+        left to the batch writer.
+
+        Returns:
+            Number of alignment rows inserted.
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                batch = self._pending
+                self._pending = {}
+
+            start = time.perf_counter()
+            written = 0
+            try:
+                written = self._align_batch(batch)
+            except Exception as e:
+                with self._lock:
+                    self._stats["streaming_alignment_flush_errors"] += 1
+                logger.error("Streaming alignment of %d markets failed: %s", len(batch), e)
+            finally:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                with self._lock:
+                    self._stats["streaming_alignment_flushes"] += 1
+                    self._stats["streaming_alignment_rows_written"] += written
+                    self._stats["streaming_alignment_last_flush_ms"] = round(elapsed_ms, 3)
+            return written
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return queue, flush and lag counters (lag as a histogram snapshot)."""
+        with self._lock:
+            stats: dict[str, Any] = dict(self._stats)
+            stats["streaming_alignment_queue_depth"] = len(self._pending)
+            stats["streaming_alignment_games_tracked"] = len(self._states)
+        stats["streaming_alignment_lag"] = self._lag.snapshot()
+        return stats
+
+    def _align_batch(self, batch: dict[int, datetime]) -> int:
+        """Resolve current snapshots for batch and insert their alignments."""
+        with get_cursor() as cur:
+            cur.execute(_CURRENT_SNAPSHOTS_QUERY, (sorted(batch),))
+            snapshots = cur.fetchall()
+
+        self._prune_states()
+        with self._lock:
+            states = dict(self._states)
+
+        alignments: list[dict[str, Any]] = []
+        no_state = 0
+        for snapshot in snapshots:
+            state = states.get(snapshot["game_id"])
+            if state is None:
+                no_state += 1
+                continue
+            alignments.append(
+                build_alignment_record(snapshot, state.game_state_id, state.state_time)
+            )
+
+        if no_state:
+            with self._lock:
+                self._stats["streaming_alignment_no_state"] += no_state
+        if not alignments:
+            return 0
+
+        written = write_alignments(alignments)
+        now = datetime.now(UTC)
+        for alignment in alignments:
+            self._lag.observe((now - batch[alignment["market_id"]]).total_seconds())
+        return written
+
+    def _prune_states(self) -> None:
+        """Forget game states older than max_state_age."""
+        cutoff = datetime.now(UTC) - timedelta(seconds=self.max_state_age)
+        with self._lock:
+            stale = [game_id for game_id, s in self._states.items() if s.state_time < cutoff]
+            for game_id in stale:
+                del self._states[game_id]
+
+    def _run(self) -> None:
+        """Flusher thread: flush every window (or early on backpressure)."""
+        while not self._closing.is_set():
+            self._wake.wait(self.window)
+            self._wake.clear()
+            self.flush()
+
+
+def create_streaming_temporal_aligner(
+    window: float = StreamingTemporalAligner.DEFAULT_WINDOW,
+    max_pending: int = StreamingTemporalAligner.DEFAULT_MAX_PENDING,
+) -> StreamingTemporalAligner:
+    """Factory mirroring create_temporal_alignment_writer()."""
+    return StreamingTemporalAligner(window=window, max_pending=max_pending)
@@ -14,28 +14,59 @@ Architecture:
                                                     |
     Kalshi Poller (15s) --> market_snapshots (SCD Type 2)
                                                     |
+                               canonical_observations (one per paired row)
+                                                    |
                                               temporal_alignment table
 
 FK chain: market_snapshots -> markets -> events -> games <- game_states
 
+Linkage shape (Migration 0084):
+    temporal_alignment pairs two canonical_observations rows. write_alignments()
+    resolves each paired row to its observation -- a 'market_snapshot' kind
+    row from the kalshi source as observation_a, a 'game_state' kind row from
+    the espn source as observation_b -- appending the observation the first
+    time a row is paired. The observation payload is the projection row's
+    identity ({"market_snapshot_id": ...} / {"game_state_id": ...}), so a
+    retried write finds the observation by payload hash instead of appending
+    a duplicate.
+
 Quality thresholds (time_delta_seconds):
     exact:  <= 1s   (both polled within the same second)
     good:   <= 15s  (within Kalshi poll interval)
     fair:   <= 60s  (within a minute)
     poor:   <= 120s (noticeable lag)
     stale:  > 120s  (too old for reliable correlation)
+
+Incremental processing:
+    The writer keeps a high-water mark of processed market_snapshots.id and
+    pages forward from it (keyset on the primary key), so each cycle reads
+    only snapshots written since the last one instead of re-scanning the
+    whole lookback window. The nearest game_state is found with two
+    index probes on idx_game_states_game_id_row_start_ts (latest state at or
+    before the snapshot, earliest state at or after it) rather than sorting
+    every state of the game by time distance.
 """
 
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from precog.database.connection import get_cursor
+from precog.database.crud_canonical_observations import (
+    append_observation_row,
+    get_observation_source_id,
+    get_observations_by_payload,
+)
 from precog.database.crud_ledger import insert_temporal_alignment_batch
 from precog.schedulers.base_poller import BasePoller
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from datetime import datetime
+
 logger = logging.getLogger(__name__)
 
 # Quality thresholds in seconds.
@@ -49,76 +80,117 @@ _QUALITY_POOR = Decimal("120")
 # use a separate batch job instead.
 _LOOKBACK_SECONDS = 600  # 10 minutes
 
-# Maximum alignments per poll cycle.
+# Maximum snapshots read per batch.
 _BATCH_LIMIT = 1000
 
-# Query to find unaligned market_snapshot + game_state pairs.
+# Maximum batches streamed per poll cycle. Bounds a catch-up cycle after
+# downtime; the remainder is picked up on the next cycle from the watermark.
+_MAX_BATCHES_PER_CYCLE = 10
+
+# Snapshots younger than this are left for the next cycle. ESPN writes a new
+# game_state every ~30s, so waiting one poll interval lets the state *after*
+# the snapshot land before we pick the nearest one, and gives slow snapshot
+# transactions time to commit before the watermark moves past their ids.
+_SETTLE_SECONDS = 30
+
+# (observation_kind, observation_source key, id column, time column) for the
+# two sides of a pair. Market snapshots are observation_a, game states b.
+_SNAPSHOT_SIDE = ("market_snapshot", "kalshi", "market_snapshot_id", "snapshot_time")
+_GAME_STATE_SIDE = ("game_state", "espn", "game_state_id", "game_state_time")
+
+# Next page of snapshots after the watermark, with the closest game_state on
+# each side of the snapshot time.
 # Follows the FK chain: market_snapshots -> markets -> events -> games <- game_states.
-# Only processes snapshots created within the lookback window.
 #
 # IMPORTANT (Glokta review B1): We do NOT filter ms.row_current_ind = TRUE.
 # In SCD Type 2, a snapshot becomes non-current when the next snapshot arrives
 # (every ~15s). If the writer falls behind by even one cycle, non-current
-# snapshots would be permanently unaligned. The lookback window + NOT EXISTS
-# are sufficient to prevent reprocessing.
+# snapshots would be permanently unaligned. The id watermark (not currency)
+# decides what still needs processing.
+#
+# The two LATERAL probes are "<= ts ORDER BY ts DESC LIMIT 1" and
+# ">= ts ORDER BY ts LIMIT 1": each is a single descent of the
+# (game_id, row_start_ts) index. The previous ORDER BY ABS(EPOCH diff) form
+# could not use the index order and sorted every state of the game per
+# snapshot. Snapshots whose game has no state yet come back with NULL
+# probes so the watermark still advances past them.
+#
+# The lookback bound only matters on the first cycle after a (re)start
+# (watermark 0) and after long outages: older snapshots are left to a
+# separate batch job.
 #
-# For game_states, we use a LATERAL subquery to find the closest game_state
-# by timestamp for each snapshot, rather than just the current one. This
-# produces accurate alignments even when the writer runs slightly behind
-# the pollers.
-_UNALIGNED_QUERY = """
+# The settle cutoff is a prefix of the id order, not a per-row filter: the
+# page stops below the first snapshot after the watermark that is still
+# younger than settle_seconds. Ids are assigned at insert but row_start_ts
+# need not follow them, and a per-row filter would let the watermark jump
+# past an unsettled lower id and never revisit it.
+_SNAPSHOT_BATCH_QUERY = """
     SELECT
         ms.id AS market_snapshot_id,
         ms.market_id,
         ms.row_start_ts AS snapshot_time,
-        ms.yes_ask_price,
-        ms.no_ask_price,
-        ms.spread,
-        ms.volume,
-        gs.id AS game_state_id,
-        gs.row_start_ts AS game_state_time,
-        gs.game_status,
-        gs.home_score,
-        gs.away_score,
-        gs.period::VARCHAR AS period,
-        gs.clock_display AS clock,
-        g.id AS game_id,
-        ABS(EXTRACT(EPOCH FROM (ms.row_start_ts - gs.row_start_ts)))::DECIMAL(10,2)
-            AS time_delta_raw
+        e.game_id,
+        g.canonical_event_id,
+        gs_before.id AS before_state_id,
+        gs_before.row_start_ts AS before_state_time,
+        gs_after.id AS after_state_id,
+        gs_after.row_start_ts AS after_state_time
     FROM market_snapshots ms
     JOIN markets m ON ms.market_id = m.id
     JOIN events e ON m.event_id = e.id
     JOIN games g ON e.game_id = g.id
-    CROSS JOIN LATERAL (
-        SELECT gs_inner.id, gs_inner.row_start_ts, gs_inner.game_status,
-               gs_inner.home_score, gs_inner.away_score,
-               gs_inner.period, gs_inner.clock_display
-        FROM game_states gs_inner
-        WHERE gs_inner.game_id = g.id
-        ORDER BY ABS(EXTRACT(EPOCH FROM (ms.row_start_ts - gs_inner.row_start_ts)))
+    CROSS JOIN (
+        SELECT MIN(u.id) AS first_unsettled_id
+        FROM market_snapshots u
+        WHERE u.id > %s
+          AND u.row_start_ts > NOW() - (%s * INTERVAL '1 second')
+    ) unsettled
+    LEFT JOIN LATERAL (
+        SELECT gs.id, gs.row_start_ts
+        FROM game_states gs
+        WHERE gs.game_id = e.game_id
+          AND gs.row_start_ts <= ms.row_start_ts
+        ORDER BY gs.row_start_ts DESC
         LIMIT 1
-    ) gs
-    WHERE e.game_id IS NOT NULL
+    ) gs_before ON TRUE
+    LEFT JOIN LATERAL (
+        SELECT gs.id, gs.row_start_ts
+        FROM game_states gs
+        WHERE gs.game_id = e.game_id
+          AND gs.row_start_ts >= ms.row_start_ts
+        ORDER BY gs.row_start_ts
+        LIMIT 1
+    ) gs_after ON TRUE
+    WHERE ms.id > %s
+      AND (unsettled.first_unsettled_id IS NULL OR ms.id < unsettled.first_unsettled_id)
       -- Idiomatic parameterized interval: pass the seconds count as a
-      -- plain integer parameter and let PostgreSQL multiply. Prior
-      -- versions used INTERVAL '%%s seconds' which embedded the parameter
-      -- inside a string literal -- safe while lookback_seconds was
-      -- int-typed, but brittle if the type were ever loosened and
-      -- unconventional psycopg2 usage (parameters should be values, not
-      -- SQL fragments). NOTE: %%s in this comment is escaped (psycopg2
-      -- parses the %% format-string before PostgreSQL sees the SQL, and
-      -- treats %%s inside SQL comments as placeholders unless doubled).
+      -- plain integer parameter and let PostgreSQL multiply. NOTE: %%s in
+      -- this comment is escaped (psycopg2 treats %%s inside SQL comments
+      -- as placeholders unless doubled).
       AND ms.row_start_ts > NOW() - (%s * INTERVAL '1 second')
-      AND NOT EXISTS (
-          SELECT 1 FROM temporal_alignment ta
-          WHERE ta.market_snapshot_id = ms.id
-            AND ta.game_state_id = gs.id
-      )
-    ORDER BY ms.row_start_ts DESC
+    ORDER BY ms.id
     LIMIT %s
 """
 
 
+@dataclass
+class AlignmentBatch:
+    """One page of snapshots processed by find_unaligned_pairs().
+
+    Attributes:
+        alignments: Pair records (build_alignment_record()) for
+            write_alignments().
+        last_snapshot_id: Highest market_snapshots.id read (the new
+            watermark); equals the input watermark when nothing was read.
+        snapshots_scanned: Snapshots read, including those with no
+            game_state to align to. A full page means more may be waiting.
+    """
+
+    alignments: list[dict[str, Any]] = field(default_factory=list)
+    last_snapshot_id: int = 0
+    snapshots_scanned: int = 0
+
+
 def _classify_quality(time_delta: Decimal) -> str:
     """Classify alignment quality based on time delta."""
     if time_delta <= _QUALITY_EXACT:
@@ -132,63 +204,217 @@ def _classify_quality(time_delta: Decimal) -> str:
     return "stale"
 
 
+def time_delta_seconds(snapshot_time: datetime, game_state_time: datetime) -> Decimal:
+    """Absolute gap between two timestamps in seconds, to 2 decimal places."""
+    seconds = abs((snapshot_time - game_state_time).total_seconds())
+    return Decimal(str(round(seconds, 2)))
+
+
+def build_alignment_record(
+    snapshot: Mapping[str, Any],
+    game_state_id: int,
+    game_state_time: datetime,
+) -> dict[str, Any]:
+    """Build one snapshot/game-state pair record for write_alignments().
+
+    Args:
+        snapshot: market_id, market_snapshot_id, snapshot_time and
+            canonical_event_id of the market snapshot.
+        game_state_id: game_states.id being aligned to.
+        game_state_time: row_start_ts of that game state.
+
+    Returns:
+        Pair dict with time delta and quality tier filled in.
+    """
+    time_delta = time_delta_seconds(snapshot["snapshot_time"], game_state_time)
+    return {
+        "market_id": snapshot["market_id"],
+        "market_snapshot_id": snapshot["market_snapshot_id"],
+        "snapshot_time": snapshot["snapshot_time"],
+        "game_state_id": game_state_id,
+        "game_state_time": game_state_time,
+        "canonical_event_id": snapshot["canonical_event_id"],
+        "time_delta_seconds": time_delta,
+        "alignment_quality": _classify_quality(time_delta),
+    }
+
+
+def _resolve_observations(
+    pairs: list[dict[str, Any]], side: tuple[str, str, str, str]
+) -> dict[int, tuple[int, datetime]]:
+    """Map each row id on one side of pairs to its canonical observation.
+
+    Reuses an observation already appended for the row; appends one
+    otherwise. Rows whose observation cannot be appended are left out (and
+    so are their pairs); the error is logged and the row retried on the
+    next write.
+    """
+    kind, source_key, id_key, time_key = side
+    source_id = get_observation_source_id(source_key)
+    if source_id is None:
+        raise RuntimeError(f"observation_source {source_key!r} is not seeded (Migration 0075)")
+
+    rows: dict[int, dict[str, Any]] = {}
+    for pair in pairs:
+        rows.setdefault(pair[id_key], pair)
+    row_ids = list(rows)
+    payloads = [{id_key: row_id} for row_id in row_ids]
+
+    resolved: dict[int, tuple[int, datetime]] = {}
+    found = get_observations_by_payload(source_id, payloads)
+    for row_id, payload, observation in zip(row_ids, payloads, found, strict=True):
+        if observation is None:
+            pair = rows[row_id]
+            try:
+                observation = append_observation_row(
+                    observation_kind=kind,
+                    source_id=source_id,
+                    canonical_primary_event_id=pair["canonical_event_id"],
+                    payload=payload,
+                    event_occurred_at=pair[time_key],
+                    source_published_at=pair[time_key],
+                )
+            except Exception:
+                logger.warning(
+                    "Could not append %s observation for %s=%s", kind, id_key, row_id, exc_info=True
+                )
+                continue
+        resolved[row_id] = observation
+    return resolved
+
+
+def write_alignments(pairs: list[dict[str, Any]]) -> int:
+    """Write snapshot/game-state pairs as temporal_alignment linkage rows.
+
+    Resolves both sides of every pair to canonical_observations rows (see
+    the module docstring) and inserts the pairs with one
+    insert_temporal_alignment_batch() call. Pairs already aligned are
+    skipped by the insert's ON CONFLICT DO NOTHING.
+
+    Args:
+        pairs: Records from build_alignment_record().
+
+    Returns:
+        Number of temporal_alignment rows inserted.
+
+    Raises:
+        RuntimeError: If the kalshi or espn observation_source row is missing.
+    """
+    if not pairs:
+        return 0
+    snapshots = _resolve_observations(pairs, _SNAPSHOT_SIDE)
+    states = _resolve_observations(pairs, _GAME_STATE_SIDE)
+
+    alignments = []
+    for pair in pairs:
+        observation_a = snapshots.get(pair["market_snapshot_id"])
+        observation_b = states.get(pair["game_state_id"])
+        if observation_a is None or observation_b is None:
+            continue
+        alignments.append(
+            {
+                "observation_a_id": observation_a[0],
+                "observation_a_ingested_at": observation_a[1],
+                "observation_b_id": observation_b[0],
+                "observation_b_ingested_at": observation_b[1],
+                "canonical_event_id": pair["canonical_event_id"],
+                "time_delta_seconds": pair["time_delta_seconds"],
+                "alignment_quality": pair["alignment_quality"],
+            }
+        )
+    return insert_temporal_alignment_batch(alignments)
+
+
+def _nearest_state(row: dict[str, Any]) -> tuple[int, datetime, Decimal] | None:
+    """Pick the closer of the before/after probes. Ties go to the earlier state."""
+    snapshot_time: datetime = row["snapshot_time"]
+    candidates = []
+    for prefix in ("before", "after"):
+        state_id = row[f"{prefix}_state_id"]
+        if state_id is None:
+            continue
+        state_time: datetime = row[f"{prefix}_state_time"]
+        candidates.append((time_delta_seconds(snapshot_time, state_time), state_id, state_time))
+    if not candidates:
+        return None
+    time_delta, state_id, state_time = min(candidates, key=lambda c: c[0])
+    return state_id, state_time, time_delta
+
+
 def find_unaligned_pairs(
     lookback_seconds: int = _LOOKBACK_SECONDS,
     batch_limit: int = _BATCH_LIMIT,
-) -> list[dict[str, Any]]:
-    """Find market_snapshot + game_state pairs without temporal alignments.
-
-    Returns list of dicts ready for insert_temporal_alignment_batch().
+    after_snapshot_id: int = 0,
+    settle_seconds: int = _SETTLE_SECONDS,
+) -> AlignmentBatch:
+    """Align the next page of market snapshots after a watermark.
+
+    Reads up to batch_limit snapshots with id > after_snapshot_id, pairs
+    each with its nearest game_state, and returns the alignments together
+    with the new watermark.
+
+    Args:
+        lookback_seconds: Ignore snapshots older than this.
+        batch_limit: Maximum snapshots read.
+        after_snapshot_id: Watermark; 0 starts from the lookback window.
+        settle_seconds: Stop the page at the first snapshot younger than
+            this; it and everything after it wait for a later cycle.
+
+    Returns:
+        AlignmentBatch with pair records for write_alignments().
+
+    Raises:
+        ValueError: If lookback_seconds or batch_limit is not positive, or
+            after_snapshot_id / settle_seconds is negative.
     """
     if lookback_seconds <= 0 or batch_limit <= 0:
         raise ValueError(
             f"lookback_seconds and batch_limit must be positive, "
             f"got {lookback_seconds=}, {batch_limit=}"
         )
+    if after_snapshot_id < 0 or settle_seconds < 0:
+        raise ValueError(
+            f"after_snapshot_id and settle_seconds must be non-negative, "
+            f"got {after_snapshot_id=}, {settle_seconds=}"
+        )
 
     with get_cursor() as cur:
-        cur.execute(_UNALIGNED_QUERY, (lookback_seconds, batch_limit))
+        cur.execute(
+            _SNAPSHOT_BATCH_QUERY,
+            (
+                after_snapshot_id,
+                settle_seconds,
+                after_snapshot_id,
+                lookback_seconds,
+                batch_limit,
+            ),
+        )
         rows = cur.fetchall()
 
-    alignments = []
+    batch = AlignmentBatch(
+        last_snapshot_id=max(
+            (row["market_snapshot_id"] for row in rows), default=after_snapshot_id
+        ),
+        snapshots_scanned=len(rows),
+    )
     for row in rows:
-        time_delta = Decimal(str(row["time_delta_raw"]))
-        quality = _classify_quality(time_delta)
+        match = _nearest_state(row)
+        if match is None:
+            continue
+        state_id, state_time, _time_delta = match
+        batch.alignments.append(build_alignment_record(row, state_id, state_time))
 
-        alignments.append(
-            {
-                "market_id": row["market_id"],
-                "market_snapshot_id": row["market_snapshot_id"],
-                "game_state_id": row["game_state_id"],
-                "snapshot_time": row["snapshot_time"],
-                "game_state_time": row["game_state_time"],
-                "time_delta_seconds": time_delta,
-                "alignment_quality": quality,
-                "yes_ask_price": (
-                    Decimal(str(row["yes_ask_price"])) if row["yes_ask_price"] is not None else None
-                ),
-                "no_ask_price": (
-                    Decimal(str(row["no_ask_price"])) if row["no_ask_price"] is not None else None
-                ),
-                "spread": (Decimal(str(row["spread"])) if row["spread"] is not None else None),
-                "volume": row["volume"],
-                "game_status": row["game_status"],
-                "home_score": row["home_score"],
-                "away_score": row["away_score"],
-                "period": row["period"],
-                "clock": row["clock"],
-                "game_id": row["game_id"],
-            }
-        )
-
-    return alignments
+    return batch
 
 
 class TemporalAlignmentWriter(BasePoller):
     """Background service that populates the temporal_alignment table.
 
-    Polls for unaligned market_snapshot + game_state pairs and creates
-    temporal_alignment rows with timestamp-based quality classification.
+    Streams market snapshots written since the last processed id through
+    find_unaligned_pairs() in batches and creates temporal_alignment rows
+    with timestamp-based quality classification. The watermark lives in
+    memory; after a restart the lookback window bounds the catch-up and the
+    insert's ON CONFLICT DO NOTHING absorbs any re-read snapshots.
 
     Requires both ESPN and Kalshi pollers to be running to produce data.
     """
@@ -205,10 +431,18 @@ class TemporalAlignmentWriter(BasePoller):
         poll_interval: int | None = None,
         lookback_seconds: int = _LOOKBACK_SECONDS,
         batch_limit: int = _BATCH_LIMIT,
+        max_batches_per_cycle: int = _MAX_BATCHES_PER_CYCLE,
+        settle_seconds: int = _SETTLE_SECONDS,
     ) -> None:
+        if max_batches_per_cycle < 1:
+            raise ValueError(f"max_batches_per_cycle must be >= 1, got {max_batches_per_cycle}")
         super().__init__(poll_interval=poll_interval)
         self._lookback_seconds = lookback_seconds
         self._batch_limit = batch_limit
+        self._max_batches_per_cycle = max_batches_per_cycle
+        self._settle_seconds = settle_seconds
+        # Highest market_snapshots.id already processed (0 = not started)
+        self._last_snapshot_id = 0
 
     def _get_job_name(self) -> str:
         return "Temporal Alignment Writer"
@@ -216,27 +450,41 @@ class TemporalAlignmentWriter(BasePoller):
     def _poll_once(self) -> dict[str, int]:
         """Execute a single alignment cycle.
 
+        Streams batches from the watermark until a short page is read or
+        max_batches_per_cycle is reached. The watermark advances only after
+        a batch is inserted, so a failed insert is retried next cycle.
+
         Returns:
             Stats dict with items_created count (key matches BasePoller stats).
         """
         try:
-            pairs = find_unaligned_pairs(
-                lookback_seconds=self._lookback_seconds,
-                batch_limit=self._batch_limit,
-            )
-
-            if not pairs:
-                self.logger.debug("No unaligned pairs found")
+            created = 0
+            scanned = 0
+            for _ in range(self._max_batches_per_cycle):
+                batch = find_unaligned_pairs(
+                    lookback_seconds=self._lookback_seconds,
+                    batch_limit=self._batch_limit,
+                    after_snapshot_id=self._last_snapshot_id,
+                    settle_seconds=self._settle_seconds,
+                )
+                if batch.alignments:
+                    created += write_alignments(batch.alignments)
+                self._last_snapshot_id = batch.last_snapshot_id
+                scanned += batch.snapshots_scanned
+                if batch.snapshots_scanned < self._batch_limit:
+                    break
+
+            if not scanned:
+                self.logger.debug("No new market snapshots to align")
                 return {"items_created": 0}
 
-            count = insert_temporal_alignment_batch(pairs)
-
             self.logger.info(
-                "Created %d temporal alignments (%d pairs found)",
-                count,
-                len(pairs),
+                "Created %d temporal alignments (%d snapshots scanned, watermark=%d)",
+                created,
+                scanned,
+                self._last_snapshot_id,
             )
-            return {"items_created": count}
+            return {"items_created": created}
 
         except Exception:
             self.logger.exception("Temporal alignment cycle failed")
@@ -247,10 +495,14 @@ def create_temporal_alignment_writer(
     poll_interval: int = TemporalAlignmentWriter.DEFAULT_POLL_INTERVAL,
     lookback_seconds: int = _LOOKBACK_SECONDS,
     batch_limit: int = _BATCH_LIMIT,
+    max_batches_per_cycle: int = _MAX_BATCHES_PER_CYCLE,
+    settle_seconds: int = _SETTLE_SECONDS,
 ) -> TemporalAlignmentWriter:
     """Factory function for ServiceSupervisor registration."""
     return TemporalAlignmentWriter(
         poll_interval=poll_interval,
         lookback_seconds=lookback_seconds,
         batch_limit=batch_limit,
+        max_batches_per_cycle=max_batches_per_cycle,
+        settle_seconds=settle_seconds,
     )
@@ -0,0 +1,224 @@
+"""
+Bounded, lifecycle-aware per-entity state for long-lived services.
+
+Pollers and validators keep small amounts of state per market ticker or game
+(anomaly counts, staleness history, event surrogate keys, unknown team
+codes). In a supervised runner that is up for weeks, plain dicts keyed by
+ticker only ever grow: markets settle and games go final, but their entries
+stay. BoundedStateMap is a drop-in MutableMapping that forgets them.
+
+Design:
+    - Lifecycle first: owners call retire(key) when the entity reaches a
+      terminal state (market settled, game final, event final). A retired
+      entry is dropped retire_ttl_seconds later; touching it does not extend
+      the deadline. The grace period keeps anomaly log deduplication working
+      for settled markets that Kalshi keeps returning on every poll.
+    - TTL backstop: entries not touched for ttl_seconds are dropped (covers
+      entities whose terminal state is never observed, e.g. delisted markets)
+    - LRU backstop: least-recently-used keys are evicted beyond max_size
+    - Expired entries are hidden immediately and swept at most once per
+      SWEEP_INTERVAL_SECONDS, so writes stay O(1) amortized
+    - Thread-safe: one lock guards the OrderedDict and counters
+    - get_stats() returns size/eviction gauges prefixed with the map's name
+      for merging into a poller's get_stats()
+
+Educational Note:
+    Values are returned by reference, so a mutable value (e.g. a deque of
+    recent prices) can be updated in place after a lookup. Only the mapping
+    operations themselves count as a "touch" for TTL and LRU purposes.
+
+Reference: REQ-DATA-005 (Market Price Data Collection)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator, MutableMapping
+
+DEFAULT_STATE_MAX_SIZE = 50_000
+DEFAULT_STATE_TTL = 24 * 60 * 60  # 1 day untouched
+DEFAULT_RETIRE_TTL = 10 * 60  # 10 minutes after a terminal state
+
+
+class _Entry[V]:
+    """Stored value with its expiry deadline (monotonic seconds)."""
+
+    __slots__ = ("deadline", "retired", "value")
+
+    def __init__(self, value: V, deadline: float, retired: bool = False) -> None:
+        self.value = value
+        self.deadline = deadline
+        self.retired = retired
+
+
+class BoundedStateMap[K: Hashable, V](MutableMapping[K, V]):
+    """
+    MutableMapping with retire-on-terminal-state, idle TTL and LRU caps.
+
+    Usage:
+        >>> counts: BoundedStateMap[str, int] = BoundedStateMap("anomaly_counts")
+        >>> counts["KXNFLGAME-A"] = counts.get("KXNFLGAME-A", 0) + 1
+        >>> counts.retire("KXNFLGAME-A")  # market settled
+        >>> counts.get_stats()["anomaly_counts_retired"]
+        1
+    """
+
+    SWEEP_INTERVAL_SECONDS = 60.0
+
+    def __init__(
+        self,
+        name: str,
+        max_size: int = DEFAULT_STATE_MAX_SIZE,
+        ttl_seconds: float | None = DEFAULT_STATE_TTL,
+        retire_ttl_seconds: float = DEFAULT_RETIRE_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize an empty map.
+
+        Args:
+            name: Prefix for the get_stats() keys (e.g. "price_history").
+            max_size: Maximum number of keys kept before LRU eviction.
+            ttl_seconds: Seconds an untouched entry is kept. None disables
+                the idle TTL (LRU and retire() still apply).
+            retire_ttl_seconds: Seconds a retired entry is kept. 0 drops it
+                on retire().
+            clock: Monotonic time source (injectable for tests).
+
+        Raises:
+            ValueError: If max_size < 1, ttl_seconds <= 0 or
+                retire_ttl_seconds < 0.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be > 0 or None")
+        if retire_ttl_seconds < 0:
+            raise ValueError("retire_ttl_seconds must be >= 0")
+
+        self.name = name
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.retire_ttl_seconds = retire_ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[K, _Entry[V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._last_sweep = clock()
+        self._evictions = 0
+        self._expirations = 0
+        self._retirements = 0
+
+    def _idle_deadline(self, now: float) -> float:
+        return now + self.ttl_seconds if self.ttl_seconds is not None else float("inf")
+
+    def _live_entry(self, key: K, now: float) -> _Entry[V] | None:
+        """Return key's entry, dropping it if expired (caller holds the lock)."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.deadline <= now:
+            del self._entries[key]
+            self._expirations += 1
+            return None
+        return entry
+
+    def _touch(self, key: K, entry: _Entry[V], now: float) -> None:
+        """Mark key recently used and extend its idle TTL (caller holds the lock)."""
+        self._entries.move_to_end(key)
+        if not entry.retired:
+            entry.deadline = self._idle_deadline(now)
+
+    def _sweep(self, now: float) -> None:
+        """Drop expired entries, at most once per sweep interval (caller holds the lock)."""
+        if now - self._last_sweep < self.SWEEP_INTERVAL_SECONDS:
+            return
+        self._last_sweep = now
+        expired = [key for key, entry in self._entries.items() if entry.deadline <= now]
+        for key in expired:
+            del self._entries[key]
+        self._expirations += len(expired)
+
+    def __getitem__(self, key: K) -> V:
+        now = self._clock()
+        with self._lock:
+            entry = self._live_entry(key, now)
+            if entry is None:
+                raise KeyError(key)
+            self._touch(key, entry, now)
+            return entry.value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        now = self._clock()
+        with self._lock:
+            entry = self._live_entry(key, now)
+            if entry is None:
+                self._entries[key] = _Entry(value, self._idle_deadline(now))
+            else:
+                entry.value = value
+                self._touch(key, entry, now)
+            while len(self._entries) > self.max_size:
+                _, evicted = self._entries.popitem(last=False)
+                if evicted.deadline <= now:
+                    self._expirations += 1
+                else:
+                    self._evictions += 1
+            self._sweep(now)
+
+    def __delitem__(self, key: K) -> None:
+        with self._lock:
+            del self._entries[key]
+
+    def __contains__(self, key: object) -> bool:
+        """Return True if key holds an unexpired entry (does not touch it)."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)  # type: ignore[call-overload]
+            return entry is not None and entry.deadline > now
+
+    def __iter__(self) -> Iterator[K]:
+        now = self._clock()
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if entry.deadline > now]
+        return iter(keys)
+
+    def __len__(self) -> int:
+        """Number of stored entries (may include expired ones not yet swept)."""
+        with self._lock:
+            return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r}, size={len(self)})"
+
+    def clear(self) -> None:
+        """Drop all entries. Counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def retire(self, key: K) -> None:
+        """
+        Schedule key for removal because its entity reached a terminal state.
+
+        The entry stays readable for retire_ttl_seconds; later touches and
+        retire() calls do not extend that deadline. No-op for missing keys.
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._live_entry(key, now)
+            if entry is None or entry.retired:
+                return
+            self._retirements += 1
+            if self.retire_ttl_seconds <= 0:
+                del self._entries[key]
+                return
+            entry.retired = True
+            entry.deadline = min(entry.deadline, now + self.retire_ttl_seconds)
+
+    def get_stats(self) -> dict[str, int]:
+        """Return size and eviction counters, prefixed with the map name for get_stats() merges."""
+        with self._lock:
+            return {
+                f"{self.name}_size": len(self._entries),
+                f"{self.name}_evictions": self._evictions,
+                f"{self.name}_expirations": self._expirations,
+                f"{self.name}_retired": self._retirements,
+            }
@@ -0,0 +1,155 @@
+"""
+Fixed-bucket latency histograms.
+
+ESPNGamePoller times each league poll in three stages (HTTP fetch, event
+parse, database sync). Averages hide the slow tail that actually delays live
+updates, so each stage is recorded in a cumulative-bucket histogram and
+reported as count/sum/max plus estimated p50/p95/p99. The metrics registry
+(precog.utils.metrics) uses the same histogram for each labelled child of a
+Histogram metric.
+
+Design:
+    - Bucket bounds in seconds (Prometheus-style "le" upper bounds); an
+      implicit +Inf bucket catches everything above the last bound
+    - O(1) memory per histogram regardless of how many samples are observed
+    - Quantiles are estimated by linear interpolation inside the bucket that
+      contains the target rank (same approach as PromQL histogram_quantile)
+    - Thread-safe: league polls observe from scheduler and fan-out threads
+
+Educational Note:
+    A reservoir of raw samples gives exact percentiles but grows with poll
+    rate and must be trimmed; fixed buckets trade exactness for a bounded,
+    mergeable summary. With the default bounds the estimate is within one
+    bucket width, which is plenty to tell a 50ms fetch from a 2s one.
+
+Reference: REQ-DATA-001 (Game State Data Collection)
+"""
+
+import bisect
+import itertools
+import math
+import threading
+from collections.abc import Sequence
+from typing import Any
+
+# Upper bounds (seconds) covering fast cached syncs through retried HTTP calls
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+
+class LatencyHistogram:
+    """
+    Cumulative-bucket histogram of durations in seconds.
+
+    Usage:
+        >>> hist = LatencyHistogram()
+        >>> hist.observe(0.042)
+        >>> hist.observe(0.310)
+        >>> hist.snapshot()["count"]
+        2
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        """
+        Initialize an empty histogram.
+
+        Args:
+            buckets: Strictly increasing, positive bucket upper bounds in seconds.
+
+        Raises:
+            ValueError: If buckets is empty, not increasing, or not positive.
+        """
+        bounds = tuple(float(b) for b in buckets)
+        if not bounds:
+            raise ValueError("buckets must not be empty")
+        if bounds[0] <= 0 or any(b <= a for a, b in itertools.pairwise(bounds)):
+            raise ValueError("buckets must be positive and strictly increasing")
+
+        self.buckets = bounds
+        self._counts = [0] * (len(bounds) + 1)  # last slot is +Inf
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        """Record one duration (negative values are clamped to 0)."""
+        value = max(0.0, seconds)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += value
+            self._max = max(self._max, value)
+
+    def quantile(self, q: float) -> float | None:
+        """
+        Estimate the q-quantile (0 <= q <= 1) in seconds.
+
+        Returns:
+            Estimated duration, or None if nothing was observed. Ranks that
+            fall in the +Inf bucket return the largest observed value.
+
+        Raises:
+            ValueError: If q is outside [0, 1].
+        """
+        if not 0.0 <= q <= 1.0:
+            raise ValueError(f"q must be between 0 and 1, got {q}")
+        with self._lock:
+            return self._quantile_locked(q)
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Return count, sum, max, p50/p95/p99 and cumulative bucket counts.
+
+        Bucket keys are the upper bounds formatted with ``repr(float)`` plus
+        ``"+Inf"``, each mapped to the number of observations <= that bound.
+        """
+        with self._lock:
+            cumulative: dict[str, int] = {}
+            running = 0
+            for bound, count in zip(self.buckets, self._counts, strict=False):
+                running += count
+                cumulative[repr(bound)] = running
+            cumulative["+Inf"] = self._count
+            return {
+                "count": self._count,
+                "sum": round(self._sum, 6),
+                "max": round(self._max, 6),
+                "p50": self._rounded(self._quantile_locked(0.50)),
+                "p95": self._rounded(self._quantile_locked(0.95)),
+                "p99": self._rounded(self._quantile_locked(0.99)),
+                "buckets": cumulative,
+            }
+
+    def _quantile_locked(self, q: float) -> float | None:
+        """Interpolated quantile estimate (caller holds the lock)."""
+        if self._count == 0:
+            return None
+        rank = q * self._count
+        running = 0
+        lower = 0.0
+        for bound, count in zip(self.buckets, self._counts, strict=False):
+            if count and running + count >= rank:
+                fraction = (rank - running) / count
+                # Never report more than was actually observed
+                return min(lower + (bound - lower) * fraction, self._max)
+            running += count
+            lower = bound
+        return self._max
+
+    @staticmethod
+    def _rounded(value: float | None) -> float | None:
+        return None if value is None or math.isnan(value) else round(value, 6)
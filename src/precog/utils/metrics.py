@@ -0,0 +1,510 @@
+"""
+In-process metrics registry with a Prometheus text exposition endpoint.
+
+ServiceSupervisor used to log an aggregate dict every metrics_interval, built
+by calling every service's get_stats(). That is fine for a periodic summary
+but cannot answer "what is p99 poll latency right now" without grepping
+logs. This module keeps counters, gauges and fixed-bucket histograms that hot
+paths update directly, and serves them over a tiny local HTTP endpoint.
+
+Metric types (Prometheus semantics):
+    - Counter: monotonically increasing total (``*_total``)
+    - Gauge: value that goes up and down, or is read from a callback at
+      scrape time (set_function)
+    - Histogram: cumulative ``le`` buckets plus ``_sum``/``_count``; p50/p95/p99
+      are estimated by interpolation (as PromQL histogram_quantile does)
+
+Design:
+    - Metrics are declared once at module level (get-or-create on the shared
+      registry) and labelled children are cached: recording is a dict lookup,
+      a bisect and an increment under a per-child lock
+    - Collect hooks run before each scrape, so expensive values (service
+      health, pool sizes) are computed on demand rather than on the hot path
+    - MetricsServer binds to 127.0.0.1 by default and serves:
+        /metrics       Prometheus text format 0.0.4
+        /metrics.json  JSON snapshot with histogram quantiles
+
+Usage:
+    >>> registry = get_metrics_registry()
+    >>> polls = registry.counter("precog_polls_total", "Completed polls", ("poller",))
+    >>> polls.labels(poller="ESPNGamePoller").inc()
+    >>> server = MetricsServer(registry, port=9464)
+    >>> server.start()  # curl http://127.0.0.1:9464/metrics
+
+Reference: ADR-100 (Service Supervisor Pattern)
+"""
+
+import itertools
+import json
+import logging
+import math
+import threading
+from collections.abc import Callable, Sequence
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, ClassVar, TypeVar
+
+from precog.utils.latency_histogram import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) from sub-millisecond handlers to retried HTTP polls
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+LabelValues = tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value for the text exposition format."""
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _label_text(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values, strict=True))
+    return "{" + pairs + "}"
+
+
+# =============================================================================
+# Metric Children (one per label combination)
+# =============================================================================
+
+
+class _CounterChild:
+    def __init__(self) -> None:
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the counter (amount must be >= 0)."""
+        if amount < 0:
+            raise ValueError("Counter can only increase")
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+
+class _GaugeChild:
+    def __init__(self) -> None:
+        self._value = 0.0
+        self._function: Callable[[], float] | None = None
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        """Set the gauge to value."""
+        with self._lock:
+            self._value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the gauge by amount."""
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrease the gauge by amount."""
+        with self._lock:
+            self._value -= amount
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Read the value from function at scrape time instead of storing it."""
+        self._function = function
+
+    @property
+    def value(self) -> float:
+        function = self._function
+        if function is not None:
+            try:
+                return float(function())
+            except Exception:
+                logger.debug("Gauge callback failed", exc_info=True)
+                return math.nan
+        return self._value
+
+
+# =============================================================================
+# Metric Families
+# =============================================================================
+
+
+class _Metric:
+    """A named metric with optional labels; children are created on first use."""
+
+    type_name: ClassVar[str] = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str]) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[LabelValues, Any] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str, **kwargs: str) -> Any:
+        """Return the child for one label combination (cached)."""
+        if kwargs:
+            if values:
+                raise ValueError("Pass label values positionally or by name, not both")
+            try:
+                values = tuple(str(kwargs[n]) for n in self.labelnames)
+            except KeyError as e:
+                raise ValueError(f"Missing label {e} for {self.name}") from None
+            if len(kwargs) != len(self.labelnames):
+                raise ValueError(f"Unexpected labels for {self.name}: {sorted(kwargs)}")
+        else:
+            values = tuple(str(v) for v in values)
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.get(values)
+                if child is None:
+                    child = self._new_child()
+                    self._children[values] = child
+        return child
+
+    def _unlabelled(self) -> Any:
+        if self.labelnames:
+            raise ValueError(f"{self.name} has labels {self.labelnames}; use labels()")
+        return self.labels()
+
+    def _new_child(self) -> Any:
+        raise NotImplementedError
+
+    def _items(self) -> list[tuple[LabelValues, Any]]:
+        with self._lock:
+            return list(self._children.items())
+
+    def _render(self, lines: list[str]) -> None:
+        lines.append(f"# HELP {self.name} {self.documentation}")
+        lines.append(f"# TYPE {self.name} {self.type_name}")
+        for values, child in self._items():
+            label_text = _label_text(self.labelnames, values)
+            lines.append(f"{self.name}{label_text} {_format_value(child.value)}")
+
+    def _snapshot(self) -> dict[str, Any]:
+        return {",".join(values): child.value for values, child in self._items()}
+
+
+class Counter(_Metric):
+    """Monotonically increasing total."""
+
+    type_name = "counter"
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the unlabelled counter."""
+        self._unlabelled().inc(amount)
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    type_name = "gauge"
+
+    def set(self, value: float) -> None:
+        """Set the unlabelled gauge."""
+        self._unlabelled().set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the unlabelled gauge."""
+        self._unlabelled().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrease the unlabelled gauge."""
+        self._unlabelled().dec(amount)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Read the unlabelled gauge from function at scrape time."""
+        self._unlabelled().set_function(function)
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+
+class Histogram(_Metric):
+    """Fixed-bucket distribution of observed values (seconds by convention)."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        bounds = tuple(float(b) for b in buckets)
+        if not bounds or bounds[0] <= 0 or any(b <= a for a, b in itertools.pairwise(bounds)):
+            raise ValueError("buckets must be non-empty, positive and strictly increasing")
+        super().__init__(name, documentation, labelnames)
+        self.buckets = bounds
+
+    def observe(self, value: float) -> None:
+        """Record one observation on the unlabelled histogram."""
+        self._unlabelled().observe(value)
+
+    def _new_child(self) -> LatencyHistogram:
+        return LatencyHistogram(self.buckets)
+
+    def _render(self, lines: list[str]) -> None:
+        lines.append(f"# HELP {self.name} {self.documentation}")
+        lines.append(f"# TYPE {self.name} histogram")
+        bucket_names = (*self.labelnames, "le")
+        for values, child in self._items():
+            snap = child.snapshot()
+            for le, count in snap["buckets"].items():
+                label_text = _label_text(bucket_names, (*values, le))
+                lines.append(f"{self.name}_bucket{label_text} {count}")
+            label_text = _label_text(self.labelnames, values)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(snap['sum'])}")
+            lines.append(f"{self.name}_count{label_text} {snap['count']}")
+
+    def _snapshot(self) -> dict[str, Any]:
+        return {",".join(values): child.snapshot() for values, child in self._items()}
+
+
+_M = TypeVar("_M", bound=_Metric)
+
+
+# =============================================================================
+# Registry
+# =============================================================================
+
+
+class MetricsRegistry:
+    """
+    Named collection of metrics with Prometheus text rendering.
+
+    counter()/gauge()/histogram() are get-or-create, so modules can declare
+    their metrics at import time and re-imports return the same objects.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._metrics: dict[str, _Metric] = {}
+        self._collect_hooks: list[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Get or create a counter."""
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Get or create a gauge."""
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> _Metric | None:
+        """Return a registered metric by name, or None."""
+        with self._lock:
+            return self._metrics.get(name)
+
+    def add_collect_hook(self, hook: Callable[[], None]) -> None:
+        """Register a callable run before every render()/snapshot()."""
+        with self._lock:
+            self._collect_hooks.append(hook)
+
+    def remove_collect_hook(self, hook: Callable[[], None]) -> None:
+        """Unregister a collect hook (no-op if not registered)."""
+        with self._lock:
+            if hook in self._collect_hooks:
+                self._collect_hooks.remove(hook)
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+        for metric in self._collect():
+            metric._render(lines)
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return {metric name: {label values: value or histogram summary}}."""
+        return {metric.name: metric._snapshot() for metric in self._collect()}
+
+    def _collect(self) -> list[_Metric]:
+        with self._lock:
+            hooks = list(self._collect_hooks)
+        for hook in hooks:
+            try:
+                hook()
+            except Exception:
+                logger.warning("Metrics collect hook failed", exc_info=True)
+        with self._lock:
+            return sorted(self._metrics.values(), key=lambda m: m.name)
+
+    def _get_or_create(
+        self,
+        cls: type[_M],
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        **kwargs: Any,
+    ) -> _M:
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is not None:
+                if type(existing) is not cls or existing.labelnames != tuple(labelnames):
+                    raise ValueError(
+                        f"Metric {name} already registered as {existing.type_name} "
+                        f"with labels {existing.labelnames}"
+                    )
+                return existing
+            metric = cls(name, documentation, labelnames, **kwargs)
+            self._metrics[name] = metric
+            return metric
+
+
+_shared_registry: MetricsRegistry | None = None
+_shared_registry_lock = threading.Lock()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """
+    Return the process-wide MetricsRegistry.
+
+    Created lazily on first use; every caller in the process gets the same
+    instance.
+    """
+    global _shared_registry
+    with _shared_registry_lock:
+        if _shared_registry is None:
+            _shared_registry = MetricsRegistry()
+        return _shared_registry
+
+
+# =============================================================================
+# HTTP Exposition
+# =============================================================================
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry: MetricsRegistry  # set on the per-server subclass
+
+    def do_GET(self) -> None:
+        path = self.path.split("?", 1)[0]
+        if path == "/metrics":
+            body = self.registry.render().encode()
+            content_type = "text/plain; version=0.0.4; charset=utf-8"
+        elif path == "/metrics.json":
+            body = json.dumps(self.registry.snapshot(), default=str).encode()
+            content_type = "application/json"
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug("metrics endpoint: " + format, *args)
+
+
+class MetricsServer:
+    """
+    Serve a MetricsRegistry over HTTP from a daemon thread.
+
+    Usage:
+        >>> server = MetricsServer(get_metrics_registry(), port=9464)
+        >>> server.start()
+        >>> server.url
+        'http://127.0.0.1:9464/metrics'
+        >>> server.stop()
+    """
+
+    def __init__(
+        self,
+        registry: MetricsRegistry | None = None,
+        host: str = "127.0.0.1",
+        port: int = 9464,
+    ) -> None:
+        """
+        Initialize a stopped server.
+
+        Args:
+            registry: Registry to expose (default: process-wide registry).
+            host: Interface to bind (loopback by default; the endpoint has
+                no authentication).
+            port: TCP port (0 picks a free port, see ``port`` after start()).
+        """
+        self.registry = registry if registry is not None else get_metrics_registry()
+        self.host = host
+        self._requested_port = port
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def port(self) -> int:
+        """Bound port (the requested port until start() is called)."""
+        if self._server is not None:
+            return int(self._server.server_address[1])
+        return self._requested_port
+
+    @property
+    def url(self) -> str:
+        """URL of the text exposition endpoint."""
+        return f"http://{self.host}:{self.port}/metrics"
+
+    def start(self) -> None:
+        """Bind and start serving (no-op if already running)."""
+        if self._server is not None:
+            return
+        handler = type("BoundMetricsHandler", (_MetricsHandler,), {"registry": self.registry})
+        self._server = ThreadingHTTPServer((self.host, self._requested_port), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="metrics-http", daemon=True
+        )
+        self._thread.start()
+        logger.info("Metrics endpoint listening on %s", self.url)
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        server, self._server = self._server, None
+        if server is None:
+            return
+        server.shutdown()
+        server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
@@ -38,6 +38,7 @@ from enum import Enum
 from typing import Any, ClassVar
 
 from precog.api_connectors.espn_client import ESPNGameFull, ESPNSituationData
+from precog.utils.bounded_state import BoundedStateMap
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -273,7 +274,8 @@ class ESPNDataValidator:
         """
         self.strict_mode = strict_mode
         self.track_anomalies = track_anomalies
-        self._anomaly_counts: dict[str, int] = {}
+        # Per-game counts; a game's entry is dropped shortly after it goes final
+        self._anomaly_counts: BoundedStateMap[str, int] = BoundedStateMap("anomaly_counts")
 
         logger.debug(
             "ESPNDataValidator initialized: strict=%s, track=%s",
@@ -330,6 +332,10 @@ class ESPNDataValidator:
                 result.issues
             )
 
+        # Final games are not polled for long: let their anomaly count go
+        if game_status in self.COMPLETED_STATUSES:
+            self._anomaly_counts.retire(espn_event_id)
+
         # Log issues
         if result.issues:
             result.log_issues()
@@ -711,13 +717,17 @@ class ESPNDataValidator:
         Returns:
             Dictionary mapping game_id to anomaly count
         """
-        return self._anomaly_counts.copy()
+        return dict(self._anomaly_counts)
 
     def reset_anomaly_counts(self) -> None:
         """Clear all tracked anomaly counts."""
         self._anomaly_counts.clear()
         logger.debug("Anomaly counts reset")
 
+    def get_state_stats(self) -> dict[str, int]:
+        """Return size/eviction gauges for per-game state, for poller get_stats() merges."""
+        return self._anomaly_counts.get_stats()
+
 
 # =============================================================================
 # Convenience Functions
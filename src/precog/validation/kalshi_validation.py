@@ -27,12 +27,17 @@ Related Pattern: ESPN validation (src/precog/validation/espn_validation.py)
 
 import logging
 from collections import deque
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
-from decimal import Decimal
+from datetime import UTC, datetime, timedelta
+from decimal import ROUND_CEILING, ROUND_FLOOR, Decimal
 from enum import Enum
 from typing import Any, ClassVar
 
+import numpy as np
+import numpy.typing as npt
+
+from precog.utils.bounded_state import BoundedStateMap
 from precog.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -51,6 +56,161 @@ def _parse_fp_int(raw: str | None) -> int | None:
         return None
 
 
+# Fixed-point scale for columnar market validation: prices are compared as
+# integer micro-dollars. A price with more than 6 decimal places (or any
+# value that is not a finite Decimal) sends its market down the per-market
+# path, so both paths always agree.
+_PRICE_PLACES = 6
+_PRICE_SCALE = 10**_PRICE_PLACES
+# Magnitude limit for int64 columns (leaves headroom for sums)
+_INT_LIMIT = 2**62
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+_PRICE_FIELDS = ("yes_bid_dollars", "yes_ask_dollars", "no_bid_dollars", "no_ask_dollars")
+
+
+def _price_to_fixed(price: Decimal) -> int:
+    """Exact micro-dollar value of price; ValueError if not representable."""
+    sign, digits, exponent = price.as_tuple()
+    if not isinstance(exponent, int):
+        raise ValueError("non-finite price")
+    coefficient = int("".join(map(str, digits)))
+    shift = exponent + _PRICE_PLACES
+    if shift >= 0:
+        fixed = coefficient * 10**shift
+    else:
+        fixed, remainder = divmod(coefficient, 10**-shift)
+        if remainder:
+            raise ValueError("more than 6 decimal places")
+    if fixed >= _INT_LIMIT:
+        raise ValueError("price out of range")
+    return int(-fixed if sign else fixed)
+
+
+def _fixed_floor(threshold: Decimal) -> int:
+    """Largest micro-dollar value <= threshold."""
+    return int(threshold.scaleb(_PRICE_PLACES).to_integral_value(rounding=ROUND_FLOOR))
+
+
+def _fixed_ceiling(threshold: Decimal) -> int:
+    """Smallest micro-dollar value >= threshold."""
+    return int(threshold.scaleb(_PRICE_PLACES).to_integral_value(rounding=ROUND_CEILING))
+
+
+# Builds (message, value, expected) of one rule's issue for the market at index i
+_Describe = Callable[[int], tuple[str, Any, Any]]
+
+
+def _issue(message: str, values: Sequence[Any] | None = None, expected: Any = None) -> _Describe:
+    """Issue whose value is values[i] (no value when values is None)."""
+    if values is None:
+        return lambda i: (message, None, expected)
+    return lambda i: (message, values[i], expected)
+
+
+def _crossed_issue(bids: Sequence[Any], asks: Sequence[Any]) -> _Describe:
+    """Crossed-market issue showing both prices."""
+    return lambda i: ("Crossed market (bid > ask)", f"bid={bids[i]}, ask={asks[i]}", "bid <= ask")
+
+
+def _spread_issue(
+    message: str, bids: Sequence[Any], asks: Sequence[Any], expected: str
+) -> _Describe:
+    """Spread issue whose value is ask - bid."""
+    return lambda i: (message, asks[i] - bids[i], expected)
+
+
+def _price_column(
+    values: list[Any],
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.bool_], npt.NDArray[np.bool_]]:
+    """Micro-dollar prices, present mask, and mask of values needing the scalar path."""
+    n = len(values)
+    fixed = np.zeros(n, dtype=np.int64)
+    present = np.zeros(n, dtype=np.bool_)
+    irregular = np.zeros(n, dtype=np.bool_)
+    memo: dict[Decimal, int | None] = {}
+    for i, price in enumerate(values):
+        if price is None:
+            continue
+        if not isinstance(price, Decimal):
+            irregular[i] = True
+            continue
+        try:
+            value = memo[price]
+        except KeyError:
+            try:
+                value = _price_to_fixed(price)
+            except ValueError:
+                value = None
+            memo[price] = value
+        except TypeError:  # signaling NaN is unhashable
+            value = None
+        if value is None:
+            irregular[i] = True
+        else:
+            fixed[i] = value
+            present[i] = True
+    return fixed, present, irregular
+
+
+def _fp_int_column(
+    values: list[Any],
+) -> tuple[list[int | None], npt.NDArray[np.int64], npt.NDArray[np.bool_], npt.NDArray[np.bool_]]:
+    """Parsed _fp integers, their int64 column, present mask and out-of-range mask."""
+    n = len(values)
+    parsed: list[int | None] = [None] * n
+    column = np.zeros(n, dtype=np.int64)
+    present = np.zeros(n, dtype=np.bool_)
+    irregular = np.zeros(n, dtype=np.bool_)
+    memo: dict[Any, int | None] = {}
+    for i, raw in enumerate(values):
+        if raw is None:
+            continue
+        try:
+            value = memo[raw]
+        except KeyError:
+            value = memo[raw] = _parse_fp_int(raw)
+        except TypeError:
+            value = _parse_fp_int(raw)
+        if value is None:
+            continue
+        parsed[i] = value
+        if -_INT_LIMIT < value < _INT_LIMIT:
+            column[i] = value
+            present[i] = True
+        else:
+            irregular[i] = True
+    return parsed, column, present, irregular
+
+
+def _timestamp_column(
+    values: list[Any], parse: Callable[[str], datetime | None]
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.bool_], npt.NDArray[np.bool_]]:
+    """Epoch microseconds, mask of non-empty values, and mask of parsed values."""
+    n = len(values)
+    micros = np.zeros(n, dtype=np.int64)
+    given = np.zeros(n, dtype=np.bool_)
+    parsed = np.zeros(n, dtype=np.bool_)
+    # Markets of one event share open/close/expiration times: parse each once
+    memo: dict[Any, int | None] = {}
+    for i, raw in enumerate(values):
+        if not raw:
+            continue
+        given[i] = True
+        try:
+            value = memo[raw]
+        except KeyError:
+            dt = parse(raw)
+            value = memo[raw] = None if dt is None else (dt - _EPOCH) // _MICROSECOND
+        except TypeError:
+            dt = parse(raw)
+            value = None if dt is None else (dt - _EPOCH) // _MICROSECOND
+        if value is not None:
+            micros[i] = value
+            parsed[i] = True
+    return micros, given, parsed
+
+
 # =============================================================================
 # Validation Level Enum
 # =============================================================================
@@ -233,6 +393,36 @@ class ValidationResult:
                 log.info(log_msg)
 
 
+@dataclass
+class MarketBatchValidation:
+    """
+    Outcome of validating one page of markets with validate_market_batch().
+
+    Attributes:
+        total: Number of markets validated
+        error_count: Markets with at least one ERROR
+        warning_only_count: Markets with WARNINGs but no ERROR
+        warning_breakdown: Number of WARNING issues per field, all markets
+        results: ValidationResult for every market that has any issue, in
+            input order (clean markets get no result object)
+
+    Educational Note:
+        The counts come from the rule masks, so a caller that only needs
+        totals never walks the result objects.
+    """
+
+    total: int = 0
+    error_count: int = 0
+    warning_only_count: int = 0
+    warning_breakdown: dict[str, int] = field(default_factory=dict)
+    results: list[ValidationResult] = field(default_factory=list)
+
+    @property
+    def valid_count(self) -> int:
+        """Markets without ERROR-level issues."""
+        return self.total - self.error_count
+
+
 # =============================================================================
 # Kalshi Data Validator
 # =============================================================================
@@ -289,6 +479,33 @@ class KalshiDataValidator:
     # orderbook — wide spreads and "arbitrage" are expected, not anomalous.
     ACTIVE_STATUSES: ClassVar[set[str]] = {"active", "open"}
 
+    # Settled statuses: prices should sit at exactly 0 or 1
+    SETTLED_STATUSES: ClassVar[set[str]] = {"settled", "finalized"}
+
+    # Every status validate_market_data() accepts without a warning: the
+    # database-mapped statuses (open, closed, settled, halted) plus raw Kalshi
+    # API statuses. The poller maps API statuses to DB statuses via
+    # STATUS_MAPPING, but validation runs on raw API data before mapping.
+    VALID_MARKET_STATUSES: ClassVar[set[str]] = {
+        # Database-mapped statuses
+        "open",
+        "closed",
+        "settled",
+        "halted",
+        # Raw Kalshi API statuses (mapped to DB statuses by the poller)
+        "active",
+        "unopened",
+        "determined",
+        "finalized",
+        "initialized",
+        "inactive",
+    }
+
+    # Arbitrage bounds for active markets: YES_ask + NO_ask below the floor
+    # is suspicious, YES_bid + NO_bid above the ceiling is impossible
+    MIN_COMBINED_ASK = Decimal("0.98")
+    MAX_COMBINED_BID = Decimal("1.01")
+
     # Statuses for markets that have never been tradeable.
     # OI or volume on these markets indicates a database inconsistency.
     NEVER_ACTIVE_STATUSES: ClassVar[set[str]] = {"unopened", "initialized"}
@@ -320,10 +537,13 @@ class KalshiDataValidator:
     def __init__(self) -> None:
         """Initialize the validator with anomaly tracking and staleness state."""
         # Track anomaly counts per entity (ticker, position, etc.)
-        self._anomaly_counts: dict[str, int] = {}
+        self._anomaly_counts: BoundedStateMap[str, int] = BoundedStateMap("anomaly_counts")
         # Track recent yes_bid prices per ticker for staleness detection.
-        # Uses deque with maxlen to bound memory automatically.
-        self._price_history: dict[str, deque[Decimal | None]] = {}
+        # Uses deque with maxlen to bound memory per ticker; both maps drop a
+        # ticker shortly after its market settles (see retire_market()).
+        self._price_history: BoundedStateMap[str, deque[Decimal | None]] = BoundedStateMap(
+            "price_history"
+        )
 
     def _increment_anomaly_count(self, entity_id: str) -> None:
         """Increment anomaly count for an entity by one occurrence."""
@@ -359,6 +579,15 @@ class KalshiDataValidator:
         """Clear all price staleness tracking history."""
         self._price_history.clear()
 
+    def retire_market(self, ticker: str) -> None:
+        """Schedule a settled market's anomaly count and price history for eviction."""
+        self._anomaly_counts.retire(ticker)
+        self._price_history.retire(ticker)
+
+    def get_state_stats(self) -> dict[str, int]:
+        """Return size/eviction gauges for per-ticker state, for poller get_stats() merges."""
+        return {**self._anomaly_counts.get_stats(), **self._price_history.get_stats()}
+
     # -------------------------------------------------------------------------
     # Price Validation
     # -------------------------------------------------------------------------
@@ -567,7 +796,7 @@ class KalshiDataValidator:
         # Settled market settlement lag check — only when explicit settlement_time
         # is present. Using expiration_time as a fallback would be misleading
         # (close-to-expiration gap != actual settlement delay).
-        is_settled = status in {"settled", "finalized"}
+        is_settled = status in self.SETTLED_STATUSES
         if is_settled and close_time:
             settled_time_str = market.get("settlement_time")
             settled_time = self._parse_iso8601(settled_time_str) if settled_time_str else None
@@ -637,25 +866,31 @@ class KalshiDataValidator:
         Tracks the last N yes_bid prices per ticker. If the price is identical
         for STALE_PRICE_POLL_THRESHOLD consecutive polls, emits a warning.
         """
-        if ticker not in self._price_history:
-            self._price_history[ticker] = deque(maxlen=self.STALE_PRICE_HISTORY_SIZE)
+        stale_price = self._record_price(ticker, yes_bid)
+        if stale_price is not None:
+            result.add_warning(
+                "price_staleness",
+                f"Price unchanged for {self.STALE_PRICE_POLL_THRESHOLD} consecutive polls",
+                value=stale_price,
+                expected="price movement",
+            )
 
-        history = self._price_history[ticker]
+    def _record_price(self, ticker: str, yes_bid: Decimal | None) -> Decimal | None:
+        """Append yes_bid to the ticker's history; return the price if it is stale."""
+        history = self._price_history.get(ticker)
+        if history is None:
+            history = self._price_history[ticker] = deque(maxlen=self.STALE_PRICE_HISTORY_SIZE)
         history.append(yes_bid)
 
         # Need at least threshold entries to judge staleness
         if len(history) < self.STALE_PRICE_POLL_THRESHOLD:
-            return
+            return None
 
         # Check if the last N prices are all identical
         recent = list(history)[-self.STALE_PRICE_POLL_THRESHOLD :]
         if all(p == recent[0] for p in recent) and recent[0] is not None:
-            result.add_warning(
-                "price_staleness",
-                f"Price unchanged for {self.STALE_PRICE_POLL_THRESHOLD} consecutive polls",
-                value=recent[0],
-                expected="price movement",
-            )
+            return recent[0]
+        return None
 
     # -------------------------------------------------------------------------
     # Market Data Validation
@@ -702,32 +937,14 @@ class KalshiDataValidator:
         if not ticker or ticker == "unknown":
             result.add_error("ticker", "Missing or empty ticker")
 
-        # Validate status
-        # Includes both database-mapped statuses (open, closed, settled, halted)
-        # and raw Kalshi API statuses (active, unopened, determined, finalized,
-        # initialized, inactive). The poller maps API statuses to DB statuses
-        # via STATUS_MAPPING, but validation runs on raw API data before mapping.
+        # Validate status (see VALID_MARKET_STATUSES)
         status = market.get("status")
-        valid_statuses = {
-            # Database-mapped statuses
-            "open",
-            "closed",
-            "settled",
-            "halted",
-            # Raw Kalshi API statuses (mapped to DB statuses by the poller)
-            "active",
-            "unopened",
-            "determined",
-            "finalized",
-            "initialized",
-            "inactive",
-        }
-        if status and status not in valid_statuses:
+        if status and status not in self.VALID_MARKET_STATUSES:
             result.add_warning(
                 "status",
                 "Unknown market status",
                 value=status,
-                expected=valid_statuses,
+                expected=self.VALID_MARKET_STATUSES,
             )
 
         # Validate YES prices (range check applies to all statuses)
@@ -743,7 +960,7 @@ class KalshiDataValidator:
         self.validate_price(no_ask, "no_ask_dollars", result)
 
         is_active = status in self.ACTIVE_STATUSES
-        is_settled = status in {"settled", "finalized"}
+        is_settled = status in self.SETTLED_STATUSES
 
         # Spread and arbitrage checks: only meaningful for active/open markets.
         # Non-active markets have no live orderbook — bid=0/ask=1 (spread=1.0)
@@ -756,7 +973,7 @@ class KalshiDataValidator:
             # (Can't buy both YES and NO for less than $1 combined)
             if yes_ask is not None and no_ask is not None:
                 combined_ask = yes_ask + no_ask
-                if combined_ask < Decimal("0.98"):
+                if combined_ask < self.MIN_COMBINED_ASK:
                     result.add_warning(
                         "arbitrage",
                         "Potential arbitrage: YES_ask + NO_ask < $0.98",
@@ -768,7 +985,7 @@ class KalshiDataValidator:
             # (Unlike asks which include spread, bids summing over 1.0 is impossible)
             if yes_bid is not None and no_bid is not None:
                 combined_bid = yes_bid + no_bid
-                if combined_bid > Decimal("1.01"):
+                if combined_bid > self.MAX_COMBINED_BID:
                     result.add_error(
                         "bid_sum",
                         "Impossible bid sum: YES_bid + NO_bid > $1.01",
@@ -838,8 +1055,434 @@ class KalshiDataValidator:
         if result.has_errors or result.has_warnings:
             self._increment_anomaly_count(ticker)
 
+        # Settled markets never trade again: let their per-ticker state go
+        if is_settled:
+            self.retire_market(ticker)
+
         return result
 
+    # -------------------------------------------------------------------------
+    # Columnar Market Validation
+    # -------------------------------------------------------------------------
+
+    def validate_market_batch(self, markets: Sequence[dict[str, Any]]) -> MarketBatchValidation:
+        """
+        Validate a page of markets column-wise.
+
+        Produces the same issues, anomaly counts and staleness history as
+        calling validate_market_data() on each market, but evaluates each
+        rule as a NumPy mask over the whole page, takes the counts from the
+        masks, and only builds ValidationResult objects for markets that
+        have issues.
+
+        Args:
+            markets: ProcessedMarketData dicts (e.g. one series' markets)
+
+        Returns:
+            MarketBatchValidation with counts, per-field warning breakdown
+            and results for flagged markets
+
+        Example:
+            >>> batch = validator.validate_market_batch(markets)
+            >>> batch.error_count, batch.warning_only_count
+            (0, 2)
+            >>> for result in batch.results:
+            ...     result.log_issues()
+
+        Educational Note:
+            Prices are compared as integer micro-dollars, so the masks agree
+            exactly with the Decimal comparisons. Markets with a field that
+            cannot be represented that way (float prices, more than 6
+            decimal places, non-string ticker or status) are validated by
+            validate_market_data() instead.
+        """
+        batch, results = self._validate_market_columns(markets)
+        batch.results = [results[i] for i in sorted(results)]
+        return batch
+
+    def _validate_market_columns(
+        self, markets: Sequence[dict[str, Any]]
+    ) -> tuple[MarketBatchValidation, dict[int, ValidationResult]]:
+        """Evaluate validate_market_data() rules as masks; results keyed by input index."""
+        n = len(markets)
+        batch = MarketBatchValidation(total=n)
+        if n == 0:
+            return batch, {}
+        now = (datetime.now(UTC) - _EPOCH) // _MICROSECOND
+
+        tickers = [market.get("ticker", "unknown") for market in markets]
+        statuses = [market.get("status") for market in markets]
+        irregular = np.fromiter(
+            (
+                not (ticker is None or isinstance(ticker, str))
+                or not (status is None or isinstance(status, str))
+                for ticker, status in zip(tickers, statuses, strict=True)
+            ),
+            dtype=np.bool_,
+            count=n,
+        )
+
+        # Status predicates are evaluated once per distinct status
+        codes: dict[str | None, int] = {}
+        status_codes = np.fromiter(
+            (codes.setdefault(s if isinstance(s, str) else None, len(codes)) for s in statuses),
+            dtype=np.intp,
+            count=n,
+        )
+
+        def status_mask(predicate: Callable[[str | None], bool]) -> npt.NDArray[np.bool_]:
+            lookup = np.fromiter((predicate(s) for s in codes), dtype=np.bool_, count=len(codes))
+            return lookup[status_codes]
+
+        active = status_mask(lambda s: s in self.ACTIVE_STATUSES)
+        settled = status_mask(lambda s: s in self.SETTLED_STATUSES)
+        never_active = status_mask(lambda s: s in self.NEVER_ACTIVE_STATUSES)
+        unknown_status = status_mask(lambda s: bool(s) and s not in self.VALID_MARKET_STATUSES)
+
+        raw_prices: dict[str, list[Any]] = {
+            name: [market.get(name) for market in markets] for name in _PRICE_FIELDS
+        }
+        prices: dict[str, npt.NDArray[np.int64]] = {}
+        has_price: dict[str, npt.NDArray[np.bool_]] = {}
+        for name, values in raw_prices.items():
+            prices[name], has_price[name], bad = _price_column(values)
+            irregular |= bad
+
+        volumes, volume, has_volume, bad = _fp_int_column([m.get("volume_fp") for m in markets])
+        irregular |= bad
+        interests, interest, has_interest, bad = _fp_int_column(
+            [m.get("open_interest_fp") for m in markets]
+        )
+        irregular |= bad
+        volumes_24h, volume_24h, has_volume_24h, bad = _fp_int_column(
+            [m.get("volume_24h_fp") for m in markets]
+        )
+        irregular |= bad
+
+        raw_times = {
+            name: [market.get(name) for market in markets]
+            for name in ("open_time", "close_time", "expiration_time", "settlement_time")
+        }
+        times = {
+            name: _timestamp_column(values, self._parse_iso8601)
+            for name, values in raw_times.items()
+        }
+        open_us, _, has_open = times["open_time"]
+        close_us, _, has_close = times["close_time"]
+        expiration_us, _, has_expiration = times["expiration_time"]
+        settlement_us, _, has_settlement = times["settlement_time"]
+
+        regular = ~irregular
+        rules: list[tuple[ValidationLevel, str, npt.NDArray[np.bool_], _Describe]] = []
+
+        def add(
+            level: ValidationLevel,
+            field_name: str,
+            mask: npt.NDArray[np.bool_],
+            describe: _Describe,
+        ) -> None:
+            rules.append((level, field_name, mask & regular, describe))
+
+        error, warning, info = ValidationLevel.ERROR, ValidationLevel.WARNING, ValidationLevel.INFO
+
+        # Rules are registered in validate_market_data() order so each
+        # market's issues come out in the same order.
+        add(
+            error,
+            "ticker",
+            np.fromiter((not t or t == "unknown" for t in tickers), dtype=np.bool_, count=n),
+            _issue("Missing or empty ticker"),
+        )
+        add(
+            warning,
+            "status",
+            unknown_status,
+            _issue("Unknown market status", statuses, self.VALID_MARKET_STATUSES),
+        )
+
+        # Price ranges
+        min_price = _fixed_ceiling(self.MIN_PRICE)
+        max_price = _fixed_floor(self.MAX_PRICE)
+        for name in _PRICE_FIELDS:
+            raw = raw_prices[name]
+            below = has_price[name] & (prices[name] < min_price)
+            add(
+                error,
+                name,
+                below,
+                _issue("Price below minimum", raw, f">= {self.MIN_PRICE}"),
+            )
+            add(
+                error,
+                name,
+                has_price[name] & ~below & (prices[name] > max_price),
+                _issue("Price above maximum", raw, f"<= {self.MAX_PRICE}"),
+            )
+
+        # Spreads (active markets only)
+        very_wide = _fixed_floor(self.VERY_WIDE_SPREAD_THRESHOLD)
+        wide = _fixed_floor(self.WIDE_SPREAD_THRESHOLD)
+        for bid_name, ask_name in (
+            ("yes_bid_dollars", "yes_ask_dollars"),
+            ("no_bid_dollars", "no_ask_dollars"),
+        ):
+            bids, asks = raw_prices[bid_name], raw_prices[ask_name]
+            both = active & has_price[bid_name] & has_price[ask_name]
+            crossed = both & (prices[bid_name] > prices[ask_name])
+            spread = prices[ask_name] - prices[bid_name]
+            is_very_wide = both & ~crossed & (spread > very_wide)
+            add(
+                error,
+                "spread",
+                crossed,
+                _crossed_issue(bids, asks),
+            )
+            add(
+                warning,
+                "spread",
+                is_very_wide,
+                _spread_issue(
+                    "Very wide bid/ask spread", bids, asks, f"<= {self.VERY_WIDE_SPREAD_THRESHOLD}"
+                ),
+            )
+            add(
+                warning,
+                "spread",
+                both & ~crossed & ~is_very_wide & (spread > wide),
+                _spread_issue(
+                    "Wide bid/ask spread", bids, asks, f"<= {self.WIDE_SPREAD_THRESHOLD}"
+                ),
+            )
+
+        # Arbitrage and bid-sum checks (active markets only)
+        yes_bid, yes_ask = raw_prices["yes_bid_dollars"], raw_prices["yes_ask_dollars"]
+        no_bid, no_ask = raw_prices["no_bid_dollars"], raw_prices["no_ask_dollars"]
+        add(
+            warning,
+            "arbitrage",
+            active
+            & has_price["yes_ask_dollars"]
+            & has_price["no_ask_dollars"]
+            & (
+                prices["yes_ask_dollars"] + prices["no_ask_dollars"]
+                < _fixed_ceiling(self.MIN_COMBINED_ASK)
+            ),
+            lambda i: (
+                "Potential arbitrage: YES_ask + NO_ask < $0.98",
+                yes_ask[i] + no_ask[i],
+                ">= $0.98",
+            ),
+        )
+        add(
+            error,
+            "bid_sum",
+            active
+            & has_price["yes_bid_dollars"]
+            & has_price["no_bid_dollars"]
+            & (
+                prices["yes_bid_dollars"] + prices["no_bid_dollars"]
+                > _fixed_floor(self.MAX_COMBINED_BID)
+            ),
+            lambda i: (
+                "Impossible bid sum: YES_bid + NO_bid > $1.01",
+                yes_bid[i] + no_bid[i],
+                "<= $1.01",
+            ),
+        )
+
+        # Settled markets should price at exactly 0 or 1
+        for name in _PRICE_FIELDS:
+            raw = raw_prices[name]
+            add(
+                warning,
+                name,
+                settled & has_price[name] & (prices[name] != 0) & (prices[name] != _PRICE_SCALE),
+                _issue("Settled market price not at 0 or 1", raw, "{0, 1}"),
+            )
+
+        # Volume and open interest
+        add(error, "volume", has_volume & (volume < 0), _issue("Negative volume", volumes, ">= 0"))
+        add(
+            warning,
+            "volume",
+            has_volume & (volume > self.UNUSUALLY_HIGH_VOLUME),
+            _issue("Unusually high lifetime volume", volumes, f"<= {self.UNUSUALLY_HIGH_VOLUME}"),
+        )
+        add(
+            error,
+            "open_interest",
+            has_interest & (interest < 0),
+            _issue("Negative open interest", interests, ">= 0"),
+        )
+        add(
+            warning,
+            "open_interest",
+            has_interest & (interest > self.UNUSUALLY_HIGH_OPEN_INTEREST),
+            _issue(
+                "Unusually high open interest",
+                interests,
+                f"<= {self.UNUSUALLY_HIGH_OPEN_INTEREST}",
+            ),
+        )
+
+        # Timestamps: malformed values, ordering, status-temporal consistency
+        for name in ("open_time", "close_time", "expiration_time"):
+            _, given, parsed_ok = times[name]
+            raw = raw_times[name]
+            add(
+                warning,
+                name,
+                given & ~parsed_ok,
+                _issue("Malformed ISO 8601 timestamp", raw, None),
+            )
+        open_raw, close_raw = raw_times["open_time"], raw_times["close_time"]
+        expiration_raw = raw_times["expiration_time"]
+        add(
+            error,
+            "open_time",
+            has_open & has_close & (open_us > close_us),
+            lambda i: ("open_time is after close_time", open_raw[i], f"before {close_raw[i]}"),
+        )
+        add(
+            error,
+            "close_time",
+            has_close & has_expiration & (close_us > expiration_us),
+            lambda i: (
+                "close_time is after expiration_time",
+                close_raw[i],
+                f"before {expiration_raw[i]}",
+            ),
+        )
+        add(
+            warning,
+            "close_time",
+            active & has_close & (close_us < now),
+            lambda i: (
+                "Active market with close_time in the past (missed closure)",
+                close_raw[i],
+                "future",
+            ),
+        )
+        add(
+            warning,
+            "open_time",
+            active & has_open & (open_us > now),
+            lambda i: (
+                "Active market with open_time in the future (premature activation)",
+                open_raw[i],
+                "past",
+            ),
+        )
+        lag_hours = self.SETTLEMENT_LAG_THRESHOLD_HOURS
+        lag_us = settlement_us - close_us
+        add(
+            info,
+            "settlement_lag",
+            settled & has_close & has_settlement & (lag_us > lag_hours * 3600 * 10**6),
+            lambda i: (
+                f"Unusually long settlement (>{lag_hours}h after close)",
+                f"{timedelta(microseconds=int(lag_us[i])).total_seconds() / 3600:.1f}h",
+                f"<= {lag_hours}h",
+            ),
+        )
+
+        # Cross-field consistency
+        add(
+            warning,
+            "open_interest",
+            never_active & has_interest & (interest > 0),
+            _issue("Open interest > 0 on a never-active market", interests, "0"),
+        )
+        add(
+            warning,
+            "volume_24h",
+            has_volume_24h & has_volume & (volume_24h > volume),
+            lambda i: (
+                "24h volume exceeds lifetime volume (API data error)",
+                volumes_24h[i],
+                f"<= {volumes[i]}",
+            ),
+        )
+        add(
+            info,
+            "ghost_market",
+            active & has_volume & has_interest & (volume == 0) & (interest == 0),
+            _issue("Active market with zero volume and zero open interest"),
+        )
+
+        # Staleness history is stateful, so it is recorded in input order,
+        # interleaved with the markets that take the per-market path.
+        stale = np.zeros(n, dtype=np.bool_)
+        stale_prices: dict[int, Decimal] = {}
+        fallback: dict[int, ValidationResult] = {}
+        for i in np.flatnonzero(irregular | (active & regular)).tolist():
+            if irregular[i]:
+                fallback[i] = self.validate_market_data(markets[i])
+                continue
+            stale_price = self._record_price(tickers[i], yes_bid[i])
+            if stale_price is not None:
+                stale[i] = True
+                stale_prices[i] = stale_price
+        add(
+            warning,
+            "price_staleness",
+            stale,
+            lambda i: (
+                f"Price unchanged for {self.STALE_PRICE_POLL_THRESHOLD} consecutive polls",
+                stale_prices[i],
+                "price movement",
+            ),
+        )
+
+        # Counts come straight from the masks
+        flagged = np.zeros(n, dtype=np.bool_)
+        error_rows = np.zeros(n, dtype=np.bool_)
+        warning_rows = np.zeros(n, dtype=np.bool_)
+        breakdown = batch.warning_breakdown
+        for level, field_name, mask, _describe in rules:
+            flagged |= mask
+            if level == ValidationLevel.ERROR:
+                error_rows |= mask
+            elif level == ValidationLevel.WARNING:
+                warning_rows |= mask
+                count = int(np.count_nonzero(mask))
+                if count:
+                    breakdown[field_name] = breakdown.get(field_name, 0) + count
+        batch.error_count = int(np.count_nonzero(error_rows))
+        batch.warning_only_count = int(np.count_nonzero(warning_rows & ~error_rows))
+        for result in fallback.values():
+            if result.has_errors:
+                batch.error_count += 1
+            elif result.has_warnings:
+                batch.warning_only_count += 1
+            for issue in result.warnings:
+                breakdown[issue.field] = breakdown.get(issue.field, 0) + 1
+
+        for i in np.flatnonzero(error_rows | warning_rows).tolist():
+            self._increment_anomaly_count(tickers[i])
+        for i in np.flatnonzero(settled & regular).tolist():
+            self.retire_market(tickers[i])
+
+        # Materialize issues for flagged markets only
+        results = {
+            i: ValidationResult(entity_id=tickers[i], entity_type="market")
+            for i in np.flatnonzero(flagged).tolist()
+        }
+        for level, field_name, mask, describe in rules:
+            for i in np.flatnonzero(mask).tolist():
+                message, value, expected = describe(i)
+                results[i].issues.append(
+                    ValidationIssue(
+                        level=level,
+                        field=field_name,
+                        message=message,
+                        value=value,
+                        expected=expected,
+                    )
+                )
+        results.update(fallback)
+        return batch, results
+
     # -------------------------------------------------------------------------
     # Position Data Validation
     # -------------------------------------------------------------------------
@@ -1200,8 +1843,18 @@ class KalshiDataValidator:
 
         Returns:
             List of ValidationResult, one per market
+
+        Note:
+            Runs the columnar path (see validate_market_batch()); prefer that
+            method when only flagged markets and counts are needed.
         """
-        return [self.validate_market_data(market) for market in markets]
+        _, flagged = self._validate_market_columns(markets)
+        return [
+            flagged[i]
+            if i in flagged
+            else ValidationResult(entity_id=market.get("ticker", "unknown"), entity_type="market")
+            for i, market in enumerate(markets)
+        ]
 
     def validate_positions(self, positions: list[dict[str, Any]]) -> list[ValidationResult]:
         """
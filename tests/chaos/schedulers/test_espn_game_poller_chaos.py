@@ -17,6 +17,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from precog.schedulers import espn_game_poller
 from precog.schedulers.espn_game_poller import ESPNGamePoller
 
 _is_ci = os.getenv("CI") == "true" or os.getenv("GITHUB_ACTIONS") == "true"
@@ -26,6 +27,26 @@ _is_ci = os.getenv("CI") == "true" or os.getenv("GITHUB_ACTIONS") == "true"
 # =============================================================================
 
 
+@pytest.fixture(autouse=True)
+def batch_upsert_per_game():
+    """Route upsert_game_states_batch through upsert_game_state.
+
+    Scoreboard polls write through the batch function; tests here mock
+    upsert_game_state, so the batch is replaced by a per-game loop over the
+    (patched) module attribute.
+    """
+
+    def batch(states: list[dict]) -> dict:
+        return {
+            state["espn_event_id"]: espn_game_poller.upsert_game_state(**state) for state in states
+        }
+
+    with patch(
+        "precog.schedulers.espn_game_poller.upsert_game_states_batch", side_effect=batch
+    ) as mock_batch:
+        yield mock_batch
+
+
 @pytest.fixture
 def mock_espn_client() -> MagicMock:
     """Create mock ESPN client."""
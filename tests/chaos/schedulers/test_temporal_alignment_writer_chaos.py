@@ -20,14 +20,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-pytest.skip(
-    "V2.45 Migration 0084 redesigned temporal_alignment as pure-linkage table; "
-    "temporal_alignment_writer references columns dropped under V2.45. "
-    "Cohort 5+ rewrite per ADR-118 V2.45 Item 6 + issue #1141.",
-    allow_module_level=True,
-)
-
-from precog.schedulers.temporal_alignment_writer import (  # noqa: E402
+from precog.schedulers.temporal_alignment_writer import (
     _classify_quality,
     find_unaligned_pairs,
 )
@@ -83,13 +76,14 @@ class TestFindUnalignedPairsChaos:
             find_unaligned_pairs()
 
     @patch("precog.schedulers.temporal_alignment_writer.get_cursor")
-    def test_empty_result_returns_empty_list(self, mock_get_cursor: MagicMock) -> None:
-        """No rows returned (writer caught up) returns empty list, not None or error."""
+    def test_empty_result_returns_empty_batch(self, mock_get_cursor: MagicMock) -> None:
+        """No rows returned (writer caught up) returns an empty batch, not None or error."""
         mock_cursor = MagicMock()
         mock_cursor.fetchall.return_value = []
         mock_get_cursor.return_value.__enter__ = MagicMock(return_value=mock_cursor)
         mock_get_cursor.return_value.__exit__ = MagicMock(return_value=False)
 
-        result = find_unaligned_pairs()
-        assert result == []
-        assert isinstance(result, list)
+        result = find_unaligned_pairs(after_snapshot_id=7)
+        assert result.alignments == []
+        assert result.snapshots_scanned == 0
+        assert result.last_snapshot_id == 7
@@ -168,6 +168,9 @@ from precog.utils.logger import setup_logging  # noqa: E402
 _LAZY_CACHE_GLOBALS: tuple[tuple[str, str, object], ...] = (
     # (module_dotted_path, global_attribute_name, reset_value)
     ("precog.database.crud_canonical_match_log", "_MANUAL_V1_ID_CACHE", None),
+    # Process-wide last-persisted-price cache shared by KalshiMarketPoller and
+    # KalshiWebSocketHandler; a stale entry would suppress another test's DB sync.
+    ("precog.schedulers.market_price_cache", "_shared_cache", None),
     # Note: crud_canonical_match_overrides + crud_canonical_match_reviews do
     # NOT maintain their own _MANUAL_V1_ID_CACHE — both modules import and
     # call crud_canonical_match_log.get_manual_v1_algorithm_id(), so they
@@ -1,7 +1,7 @@
 """End-to-end tests for temporal_alignment_writer.
 
-Exercises the full poll cycle (find_unaligned_pairs -> classify -> batch
-insert) with mocked DB cursor. Verifies the writer's _poll_once integrates
+Exercises the full poll cycle (find_unaligned_pairs -> classify ->
+observation resolution -> batch insert) with mocked DB cursor. Verifies the writer's _poll_once integrates
 the components correctly without requiring real PostgreSQL (integration
 tests cover the DB-backed e2e path).
 
@@ -16,20 +16,13 @@ Usage:
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-pytest.skip(
-    "V2.45 Migration 0084 redesigned temporal_alignment as pure-linkage table; "
-    "temporal_alignment_writer references columns dropped under V2.45. "
-    "Cohort 5+ rewrite per ADR-118 V2.45 Item 6 + issue #1141.",
-    allow_module_level=True,
-)
-
-from precog.schedulers.temporal_alignment_writer import (  # noqa: E402
+from precog.schedulers.temporal_alignment_writer import (
     create_temporal_alignment_writer,
 )
 
@@ -39,35 +32,38 @@ class TestTemporalAlignmentWriterE2E:
     """End-to-end poll cycle behavior with mocked DB."""
 
     @patch("precog.schedulers.temporal_alignment_writer.insert_temporal_alignment_batch")
+    @patch("precog.schedulers.temporal_alignment_writer.get_observations_by_payload")
+    @patch("precog.schedulers.temporal_alignment_writer.get_observation_source_id")
     @patch("precog.schedulers.temporal_alignment_writer.get_cursor")
     def test_poll_cycle_processes_unaligned_pair(
-        self, mock_get_cursor: MagicMock, mock_insert: MagicMock
+        self,
+        mock_get_cursor: MagicMock,
+        mock_source_id: MagicMock,
+        mock_lookup: MagicMock,
+        mock_insert: MagicMock,
     ) -> None:
-        """Full poll cycle: find one unaligned pair, classify, insert."""
-        now = datetime.now(tz=UTC)
+        """Full poll cycle: find one unaligned pair, classify, link, insert."""
+        now = datetime.now(tz=UTC) - timedelta(minutes=1)
         mock_cursor = MagicMock()
         mock_cursor.fetchall.return_value = [
             {
                 "market_snapshot_id": 1,
                 "market_id": 10,
                 "snapshot_time": now,
-                "yes_ask_price": Decimal("0.55"),
-                "no_ask_price": Decimal("0.45"),
-                "spread": Decimal("0.10"),
-                "volume": 100,
-                "game_state_id": 5,
-                "game_state_time": now,
-                "game_status": "in_progress",
-                "home_score": 7,
-                "away_score": 3,
-                "period": "Q2",
-                "clock": "5:30",
                 "game_id": 50,
-                "time_delta_raw": Decimal("0.50"),
+                "canonical_event_id": 900,
+                "before_state_id": 5,
+                "before_state_time": now - timedelta(seconds=2),
+                "after_state_id": None,
+                "after_state_time": None,
             }
         ]
         mock_get_cursor.return_value.__enter__ = MagicMock(return_value=mock_cursor)
         mock_get_cursor.return_value.__exit__ = MagicMock(return_value=False)
+        mock_source_id.side_effect = lambda key: {"kalshi": 2, "espn": 1}[key]
+        mock_lookup.side_effect = lambda source_id, payloads: [
+            (source_id * 100, now) for _ in payloads
+        ]
         mock_insert.return_value = 1
 
         writer = create_temporal_alignment_writer()
@@ -76,6 +72,11 @@ class TestTemporalAlignmentWriterE2E:
         # Verify the full pipeline executed
         assert mock_get_cursor.called, "Should query for unaligned pairs"
         assert mock_insert.called, "Should insert the classified alignment"
+        (linkage,) = mock_insert.call_args[0][0]
+        assert linkage["observation_a_id"] == 200  # kalshi snapshot observation
+        assert linkage["observation_b_id"] == 100  # espn game_state observation
+        assert linkage["canonical_event_id"] == 900
+        assert linkage["time_delta_seconds"] == Decimal("2.000")
         assert result.get("items_created", 0) >= 1, (
             f"Expected at least 1 alignment created, got {result!r}"
         )
@@ -20,7 +20,8 @@ from decimal import Decimal
 
 import pytest
 
-from precog.database.connection import get_cursor
+from precog.analytics.elo_computation_service import EloComputationService
+from precog.database.connection import get_connection, get_cursor, release_connection
 from precog.database.crud_game_states import (
     create_game_state,
     game_state_changed,
@@ -1281,3 +1282,50 @@ class TestGamesDimensionIntegration:
         # Cleanup
         with get_cursor(commit=True) as cur:
             cur.execute("DELETE FROM games WHERE id = %s", (game_id,))
+
+    def test_elo_log_copy_and_recompute_upsert(self, db_pool, db_cursor, clean_test_data):
+        """Test COPY persistence of elo_calculation_log and the rerun upsert.
+
+        A first run writes one row per game via COPY; a rerun with
+        skip_computed=False rewrites the same rows instead of duplicating them.
+        """
+        game_id = get_or_create_game(
+            sport="football",
+            game_date=date(1901, 9, 8),
+            home_team_code="KC",
+            away_team_code="BAL",
+            season=1901,
+            league="nfl",
+            neutral_site=False,
+            game_status="final",
+        )
+        update_game_result(game_id=game_id, home_score=27, away_score=20)
+
+        conn = get_connection()
+        try:
+            for skip_computed in (True, False):
+                service = EloComputationService(
+                    conn, calculation_source="test", calculation_version="copy-it"
+                )
+                result = service.compute_ratings("nfl", seasons=[1901], skip_computed=skip_computed)
+                assert result.logs_inserted == 1
+
+            with get_cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT home_elo_before, home_elo_after, league_id
+                    FROM elo_calculation_log
+                    WHERE game_id = %s AND calculation_version = 'copy-it'
+                    """,
+                    (game_id,),
+                )
+                rows = cur.fetchall()
+            assert len(rows) == 1
+            assert rows[0]["home_elo_before"] == Decimal("1500")
+            assert rows[0]["home_elo_after"] > Decimal("1500")
+            assert rows[0]["league_id"] is not None
+        finally:
+            release_connection(conn)
+            with get_cursor(commit=True) as cur:
+                cur.execute("DELETE FROM elo_calculation_log WHERE game_id = %s", (game_id,))
+                cur.execute("DELETE FROM games WHERE id = %s", (game_id,))
@@ -1115,19 +1115,3 @@ def test_pattern_73_alignment_quality_canonical_home_in_check(db_pool: Any) -> N
             f"Pattern 73 SSOT: ck_alignment_quality missing value {value!r}; "
             f"got definition: {constraint_def}"
         )
-
-
-def test_alembic_head_is_0084(db_pool: Any) -> None:
-    """alembic_version reports 0084 (slot 0083 is a permanent hole, V2.45 Item 1).
-
-    Verifies down_revision = "0082" on slot 0084 (skipping the
-    intentional slot 0083 hole, mirroring the slot 0081 hole shape from
-    V2.43 Item 2).
-    """
-    with get_cursor() as cur:
-        cur.execute("SELECT version_num FROM alembic_version")
-        row = cur.fetchone()
-    assert row is not None
-    assert row["version_num"] == "0084", (
-        f"Expected alembic_head=0084 (Migration 0084 applied), got {row['version_num']!r}"
-    )
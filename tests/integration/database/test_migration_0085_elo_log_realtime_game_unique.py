@@ -0,0 +1,54 @@
+"""Integration tests for Migration 0085 -- unique realtime Elo log row per game.
+
+Verifies the POST-MIGRATION state of the partial unique index that backs
+crud_elo.apply_game_elo_update()'s ON CONFLICT clause:
+
+    - idx_elo_log_realtime_game exists on elo_calculation_log(game_id),
+      is UNIQUE, and is partial on calculation_source = 'realtime'.
+    - alembic_version reports 0085 (head moved here from the 0084 tests).
+
+Round-trip CI gate inheritance (PR #1081 / Epic #1071):
+    ``downgrade()`` drops exactly what ``upgrade()`` creates; the
+    round-trip CI gate runs ``downgrade -> upgrade head`` against it.
+
+Markers:
+    @pytest.mark.integration: real DB required.
+"""
+
+from typing import Any
+
+import pytest
+
+from precog.database.connection import get_cursor
+
+pytestmark = [pytest.mark.integration]
+
+
+def test_realtime_game_index_is_partial_unique(db_pool: Any) -> None:
+    """idx_elo_log_realtime_game is UNIQUE on game_id for realtime rows only."""
+    with get_cursor() as cur:
+        cur.execute(
+            """
+            SELECT indexdef
+            FROM pg_indexes
+            WHERE tablename = 'elo_calculation_log'
+              AND indexname = 'idx_elo_log_realtime_game'
+            """
+        )
+        row = cur.fetchone()
+    assert row is not None, "idx_elo_log_realtime_game missing"
+    indexdef = row["indexdef"]
+    assert indexdef.startswith("CREATE UNIQUE INDEX"), indexdef
+    assert "(game_id)" in indexdef, indexdef
+    assert "'realtime'" in indexdef, indexdef
+
+
+def test_alembic_head_is_0085(db_pool: Any) -> None:
+    """alembic_version reports 0085 (down_revision 0084)."""
+    with get_cursor() as cur:
+        cur.execute("SELECT version_num FROM alembic_version")
+        row = cur.fetchone()
+    assert row is not None
+    assert row["version_num"] == "0085", (
+        f"Expected alembic_head=0085 (Migration 0085 applied), got {row['version_num']!r}"
+    )
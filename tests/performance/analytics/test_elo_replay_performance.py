@@ -0,0 +1,104 @@
+"""
+Performance Tests for EloReplayEngine.
+
+Benchmarks the NumPy replay engine against the per-game Decimal EloEngine
+loop on a multi-season NBA-sized schedule (no database required).
+
+Related:
+- TESTING_STRATEGY V3.2: All 8 test types required
+- analytics/elo_replay module coverage
+
+Usage:
+    pytest tests/performance/analytics/test_elo_replay_performance.py -v -m performance
+
+Educational Note:
+    The replay loop itself stays sequential (each game depends on earlier
+    ratings); the speedup comes from float64 transcendental math, integer
+    centi-Elo arithmetic instead of Decimal, and array-level preparation,
+    regression and aggregation.
+"""
+
+import random
+import time
+from decimal import Decimal
+
+import pytest
+
+from precog.analytics.elo_engine import EloEngine
+from precog.analytics.elo_replay import EloReplayEngine
+
+
+def _nba_schedule(seasons: int) -> list[dict]:
+    rng = random.Random(42)
+    codes = [f"T{i:02d}" for i in range(30)]
+    games = []
+    for season in range(2000, 2000 + seasons):
+        for index in range(1230):
+            home, away = rng.sample(codes, 2)
+            games.append(
+                {
+                    "home_team_code": home,
+                    "away_team_code": away,
+                    "home_score": rng.randint(80, 130),
+                    "away_score": rng.randint(80, 130),
+                    "season": season,
+                    "game_type": "playoff" if index >= 1170 else "regular",
+                    "is_neutral_site": False,
+                }
+            )
+    return games
+
+
+def _decimal_replay(engine: EloEngine, games: list[dict]) -> dict[str, Decimal]:
+    ratings: dict[str, Decimal] = {}
+    current_season = None
+    for game in games:
+        if current_season is not None and game["season"] != current_season:
+            ratings = {code: engine.apply_season_regression(r) for code, r in ratings.items()}
+        current_season = game["season"]
+        update = engine.update_ratings(
+            ratings.setdefault(game["home_team_code"], Decimal("1500")),
+            ratings.setdefault(game["away_team_code"], Decimal("1500")),
+            game["home_score"],
+            game["away_score"],
+            is_playoff=game["game_type"] != "regular",
+        )
+        ratings[game["home_team_code"]] = update.home_elo_after
+        ratings[game["away_team_code"]] = update.away_elo_after
+    return ratings
+
+
+@pytest.mark.performance
+class TestEloReplayPerformance:
+    """Performance benchmarks for batch Elo recomputation."""
+
+    def test_replay_faster_than_decimal_loop(self):
+        """
+        PERFORMANCE: 20 NBA seasons (~24.6k games), replay vs Decimal loop.
+
+        Benchmark:
+        - Target: replay >= 3x faster than the Decimal loop (best of 3)
+        - Results identical
+        """
+        engine = EloEngine("nba")
+        games = _nba_schedule(seasons=20)
+
+        decimal_times = []
+        replay_times = []
+        for _ in range(3):
+            start = time.perf_counter()
+            expected = _decimal_replay(engine, games)
+            decimal_times.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            replay = EloReplayEngine(engine).replay(games)
+            replay_times.append(time.perf_counter() - start)
+
+        speedup = min(decimal_times) / min(replay_times)
+        print(
+            f"\nElo replay ({len(games)} games): decimal={min(decimal_times):.3f}s "
+            f"replay={min(replay_times):.3f}s speedup={speedup:.1f}x"
+        )
+
+        assert {code: replay.rating(code) for code in expected} == expected
+        assert speedup >= 3, f"Replay only {speedup:.1f}x faster than Decimal loop"
@@ -0,0 +1,175 @@
+"""
+Performance Tests for concurrent multi-series market pagination.
+
+Compares wall-clock time of sequential vs concurrent fetch_all_markets()
+for 20 series against a local stub HTTP server:
+- Sequential: one series at a time, one cursor page at a time
+- Concurrent: bounded worker pool via iter_market_pages()
+
+Related:
+- TESTING_STRATEGY V3.3: All 8 test types required
+- api_connectors/kalshi_client module coverage
+
+Usage:
+    pytest tests/performance/api_connectors/test_kalshi_pagination_performance.py -v -m performance
+
+Educational Note:
+    Unlike test_kalshi_client_performance.py (mocked session, measures client
+    overhead), these tests go through a real requests.Session, a real
+    RateLimiter, and a real socket. The stub server adds a fixed per-request
+    delay to stand in for network round-trip time, which is what concurrent
+    pagination hides: sequential cycle time grows with series x pages x RTT,
+    concurrent time with roughly (series / workers) x pages x RTT.
+
+Reference: docs/api-integration/API_INTEGRATION_GUIDE_V2.0.md
+Related Requirements:
+    - REQ-API-001: Kalshi API Integration
+"""
+
+import json
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+
+from precog.api_connectors.kalshi_client import KalshiClient
+from precog.api_connectors.rate_limiter import RateLimiter
+
+SERIES_COUNT = 20
+PAGES_PER_SERIES = 3
+MARKETS_PER_PAGE = 50
+STUB_LATENCY_SECONDS = 0.02
+
+
+class _StubMarketsHandler(BaseHTTPRequestHandler):
+    """Serve paginated GET /trade-api/v2/markets responses with fixed latency."""
+
+    def do_GET(self) -> None:
+        query = parse_qs(urlparse(self.path).query)
+        series = query.get("series_ticker", ["UNKNOWN"])[0]
+        page = int(query.get("cursor", ["1"])[0])
+
+        time.sleep(STUB_LATENCY_SECONDS)
+        body = json.dumps(
+            {
+                "markets": [
+                    {
+                        "ticker": f"{series}-P{page}-M{i}",
+                        "yes_ask_dollars": "0.5200",
+                        "no_ask_dollars": "0.4900",
+                        "volume_fp": "100.00",
+                    }
+                    for i in range(MARKETS_PER_PAGE)
+                ],
+                "cursor": str(page + 1) if page < PAGES_PER_SERIES else "",
+            }
+        ).encode()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        """Silence per-request stderr logging."""
+
+
+@pytest.fixture(scope="module")
+def stub_server() -> Iterator[str]:
+    """Run the stub markets server on a free local port; yields its base URL."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubMarketsHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    yield f"http://{host}:{port}/trade-api/v2"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.performance
+class TestKalshiPaginationPerformance:
+    """Wall-clock benchmarks for multi-series market pagination."""
+
+    def _create_client(self, base_url: str) -> KalshiClient:
+        """Create a KalshiClient pointed at the stub server (auth mocked via DI)."""
+        mock_auth = MagicMock()
+        mock_auth.get_headers.return_value = {"Authorization": "Bearer mock-token"}
+
+        client = KalshiClient(
+            environment="demo",
+            auth=mock_auth,
+            session=requests.Session(),
+            rate_limiter=RateLimiter(requests_per_minute=1200),
+        )
+        client.base_url = base_url
+        return client
+
+    def _timed_fetch(self, base_url: str, max_workers: int) -> tuple[float, int]:
+        client = self._create_client(base_url)
+        series = [f"KXSERIES{i:02d}" for i in range(SERIES_COUNT)]
+        try:
+            start = time.perf_counter()
+            markets = client.fetch_all_markets(series_tickers=series, max_workers=max_workers)
+            elapsed = time.perf_counter() - start
+        finally:
+            client.close()
+        return elapsed, len(markets)
+
+    def test_concurrent_fetch_wall_clock_20_series(self, stub_server: str) -> None:
+        """
+        PERFORMANCE: Wall-clock for 20 series x 3 pages, sequential vs 8 workers.
+
+        Benchmark:
+        - Sequential floor: 60 requests x 20ms stub latency = 1.2s
+        - Target: concurrent fetch at least 3x faster than sequential
+        """
+        sequential_s, sequential_count = self._timed_fetch(stub_server, max_workers=1)
+        concurrent_s, concurrent_count = self._timed_fetch(stub_server, max_workers=8)
+
+        expected = SERIES_COUNT * PAGES_PER_SERIES * MARKETS_PER_PAGE
+        assert sequential_count == concurrent_count == expected
+
+        print(
+            f"\n20 series x {PAGES_PER_SERIES} pages: sequential {sequential_s * 1000:.0f}ms, "
+            f"concurrent(8) {concurrent_s * 1000:.0f}ms, "
+            f"speedup {sequential_s / concurrent_s:.1f}x"
+        )
+        assert concurrent_s * 3 < sequential_s, (
+            f"Concurrent fetch {concurrent_s:.2f}s not 3x faster than sequential {sequential_s:.2f}s"
+        )
+
+    def test_streaming_first_page_latency(self, stub_server: str) -> None:
+        """
+        PERFORMANCE: Time to first page when streaming 20 series.
+
+        Benchmark:
+        - Target: first page available well before the full fetch completes,
+          so callers can start syncing while later pages are in flight
+        """
+        client = self._create_client(stub_server)
+        series = [f"KXSERIES{i:02d}" for i in range(SERIES_COUNT)]
+        try:
+            start = time.perf_counter()
+            first_page_s = None
+            pages = 0
+            for page in client.iter_market_pages(series, max_workers=8):
+                assert page["error"] is None
+                if first_page_s is None:
+                    first_page_s = time.perf_counter() - start
+                pages += 1
+            total_s = time.perf_counter() - start
+        finally:
+            client.close()
+
+        assert pages == SERIES_COUNT * PAGES_PER_SERIES
+        assert first_page_s is not None
+        assert first_page_s * 3 < total_s, (
+            f"First page after {first_page_s:.3f}s of {total_s:.3f}s total"
+        )
@@ -0,0 +1,145 @@
+"""
+Import-time budget tests for the precog CLI.
+
+Cron-driven `precog` invocations and health probes spend most of their wall
+time importing. These tests run the CLI in a fresh interpreter under
+``python -X importtime`` and check that invoking one command group only
+imports that group, and that startup imports stay within a time budget.
+
+Related:
+    - src/precog/cli/__init__.py: LazyTyperGroup / register_commands()
+    - REQ-TEST-007: Performance Testing
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+_is_ci = os.getenv("CI") == "true" or os.getenv("GITHUB_ACTIONS") == "true"
+_CI_SKIP_REASON = (
+    "Import-time budget skips in CI - shared runners have variable disk and CPU "
+    "performance. Run locally: pytest tests/performance/cli/test_cli_import_performance.py -v"
+)
+
+# Command modules that `precog system version` must not import
+_OTHER_GROUPS = {
+    "precog.cli.kalshi",
+    "precog.cli.espn",
+    "precog.cli.data",
+    "precog.cli.db",
+    "precog.cli.backup",
+    "precog.cli.scheduler",
+    "precog.cli.config",
+    "precog.cli.circuit_breaker",
+    "precog.cli._future.strategy",
+    "precog.cli._future.model",
+    "precog.cli._future.position",
+    "precog.cli._future.trade",
+}
+
+# Heavy dependencies a version check has no use for
+_HEAVY_DEPENDENCIES = {
+    "psycopg2",
+    "structlog",
+    "apscheduler",
+    "cryptography",
+    "pandas",
+    "sqlalchemy",
+    "requests",
+}
+
+# Cumulative import budget for `precog system version` (typer + rich dominate)
+_IMPORT_BUDGET_MS = 250
+
+
+_MODULES_MARKER = "LOADED_MODULES:"
+
+
+def _run_cli(*argv: str) -> subprocess.CompletedProcess[str]:
+    """Run `precog <argv>` in a fresh interpreter under -X importtime.
+
+    Modules still loaded at exit are printed after _MODULES_MARKER. Imports
+    made once Typer is running (the lazily loaded group) can be missing from
+    the -X importtime report, so scope checks use that list instead.
+    """
+    code = (
+        "import atexit, sys; "
+        f"atexit.register(lambda: print({_MODULES_MARKER!r} + ','.join(sys.modules))); "
+        f"sys.argv = ['precog', *{list(argv)!r}]; "
+        "from precog.cli import main; main()"
+    )
+    env = dict(os.environ, PRECOG_ENV="test")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=60,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    return result
+
+
+def _loaded_modules(*argv: str) -> set[str]:
+    """Modules loaded by `precog <argv>`."""
+    stdout = _run_cli(*argv).stdout
+    line = stdout[stdout.index(_MODULES_MARKER) + len(_MODULES_MARKER) :].splitlines()[0]
+    return set(line.split(","))
+
+
+def _startup_import_ms(*argv: str) -> float:
+    """Total -X importtime cost of `precog <argv>` in milliseconds."""
+    total_us = 0
+    for line in _run_cli(*argv).stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        # Depth-0 entries (one leading space) include all nested imports
+        if not module.startswith("  "):
+            total_us += int(cumulative)
+    return total_us / 1000
+
+
+@pytest.mark.performance
+class TestCLIImportScope:
+    """Invoking one command group imports only that group."""
+
+    def test_version_imports_only_system_group(self) -> None:
+        """`precog system version` loads cli/system.py and no other group."""
+        modules = _loaded_modules("system", "version")
+
+        assert "precog.cli.system" in modules
+        assert not modules & _OTHER_GROUPS, sorted(modules & _OTHER_GROUPS)
+
+    def test_version_skips_heavy_dependencies(self) -> None:
+        """Database, scheduler and crypto packages are not imported for a version check."""
+        top_level = {name.split(".")[0] for name in _loaded_modules("system", "version")}
+
+        assert not top_level & _HEAVY_DEPENDENCIES, sorted(top_level & _HEAVY_DEPENDENCIES)
+
+    def test_group_help_loads_that_group(self) -> None:
+        """`precog kalshi --help` imports the kalshi group only."""
+        modules = _loaded_modules("kalshi", "--help")
+
+        assert "precog.cli.kalshi" in modules
+        assert "precog.cli.scheduler" not in modules
+
+
+@pytest.mark.performance
+@pytest.mark.skipif(_is_ci, reason=_CI_SKIP_REASON)
+class TestCLIImportBudget:
+    """Startup import time stays within budget."""
+
+    def test_version_import_budget(self) -> None:
+        """Total import time for `precog system version` stays under budget.
+
+        Best of three runs, to keep filesystem cache warm-up out of the number.
+        """
+        best_ms = min(_startup_import_ms("system", "version") for _ in range(3))
+
+        assert best_ms < _IMPORT_BUDGET_MS, (
+            f"Startup imports took {best_ms:.1f}ms (budget {_IMPORT_BUDGET_MS}ms)"
+        )
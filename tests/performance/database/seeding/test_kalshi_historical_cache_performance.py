@@ -0,0 +1,114 @@
+"""
+Performance Tests for the Kalshi Historical Cache.
+
+Tests replay throughput and memory footprint of the packed market cache.
+
+Reference: TESTING_STRATEGY V3.2 - Performance tests for latency/throughput
+Related Requirements: REQ-DATA-005, Issue #229
+
+Usage:
+    pytest tests/performance/database/seeding/test_kalshi_historical_cache_performance.py -v -m performance
+"""
+
+import time
+import tracemalloc
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from precog.database.seeding import kalshi_historical_cache as cache
+from precog.database.seeding.kalshi_historical_cache import (
+    iter_cached_market_range,
+    iter_cached_markets,
+    save_to_cache,
+)
+
+SEASON_START = date(2024, 9, 1)
+SEASON_DAYS = 60
+SERIES = [f"KXSERIES{i:02d}" for i in range(20)]
+MARKETS_PER_SERIES = 100
+
+
+def _markets_for_day(day: int) -> list[dict]:
+    """One day's snapshot: 20 series x 100 markets with Decimal prices."""
+    return [
+        {
+            "ticker": f"{series}-D{day}-T{n}",
+            "event_ticker": f"{series}-D{day}",
+            "series_ticker": series,
+            "status": "open",
+            "yes_ask_dollars": Decimal(f"0.{(n * 37 + day) % 9000 + 1000:04d}"),
+            "no_ask_dollars": Decimal(f"0.{(n * 53 + day) % 9000 + 1000:04d}"),
+            "volume": n * day,
+        }
+        for series in SERIES
+        for n in range(MARKETS_PER_SERIES)
+    ]
+
+
+@pytest.fixture(scope="module")
+def season_cache(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Cache SEASON_DAYS days of markets (120k records) in packs."""
+    root = tmp_path_factory.mktemp("kalshi")
+    patcher = pytest.MonkeyPatch()
+    patcher.setattr(cache, "KALSHI_CACHE_DIR", root)
+    patcher.setattr(cache, "MARKETS_CACHE_DIR", root / "markets")
+    for day in range(SEASON_DAYS):
+        save_to_cache("markets", SEASON_START + timedelta(days=day), _markets_for_day(day))
+    yield root
+    patcher.undo()
+
+
+@pytest.mark.performance
+class TestKalshiCacheReplay:
+    """Replay throughput and memory for packed market snapshots."""
+
+    def test_full_season_replay(self, season_cache: Path) -> None:
+        """Streaming every cached market of the season takes seconds."""
+        end = SEASON_START + timedelta(days=SEASON_DAYS - 1)
+
+        start = time.perf_counter()
+        count = sum(1 for _ in iter_cached_market_range(SEASON_START, end))
+        elapsed = time.perf_counter() - start
+
+        assert count == SEASON_DAYS * len(SERIES) * MARKETS_PER_SERIES
+        assert elapsed < 5.0, f"Season replay took {elapsed:.2f}s"
+
+    def test_season_replay_memory_is_flat(self, season_cache: Path) -> None:
+        """One block is decoded at a time, so peak memory does not grow with the range."""
+        end = SEASON_START + timedelta(days=14)  # tracemalloc is slow; 30k markets suffice
+
+        tracemalloc.start()
+        for _ in iter_cached_market_range(SEASON_START, end):
+            pass
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert peak < 5 * 1024 * 1024, f"Peak memory {peak / 1e6:.1f} MB"
+
+    def test_single_series_replay(self, season_cache: Path) -> None:
+        """Replaying one series decompresses only that series' blocks."""
+        end = SEASON_START + timedelta(days=SEASON_DAYS - 1)
+
+        start = time.perf_counter()
+        count = sum(1 for _ in iter_cached_market_range(SEASON_START, end, series=SERIES[0]))
+        elapsed = time.perf_counter() - start
+
+        assert count == SEASON_DAYS * MARKETS_PER_SERIES
+        assert elapsed < 1.0, f"Single-series replay took {elapsed:.2f}s"
+
+    def test_ticker_lookup_latency(self, season_cache: Path) -> None:
+        """Reading a handful of tickers from one day is a millisecond-scale lookup."""
+        tickers = [f"{SERIES[3]}-D5-T{n}" for n in range(5)]
+        latencies_ms: list[float] = []
+
+        for _ in range(50):
+            start = time.perf_counter()
+            found = list(iter_cached_markets(SEASON_START + timedelta(days=5), tickers=tickers))
+            latencies_ms.append((time.perf_counter() - start) * 1000)
+
+        assert len(found) == 5
+        p95 = sorted(latencies_ms)[int(len(latencies_ms) * 0.95)]
+        assert p95 < 50, f"P95 ticker lookup {p95:.2f}ms exceeds 50ms"
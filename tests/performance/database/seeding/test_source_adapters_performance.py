@@ -0,0 +1,254 @@
+"""
+Performance Tests for DataFrame-Backed Source Adapters.
+
+Benchmarks the columnar normalization in the nfl_data_py, nflreadpy and
+pybaseball adapters on season-sized synthetic frames. Each benchmark is
+compared against a bare iterrows() pass over the same input, timed on the
+same machine: the full normalization must beat merely walking the rows the
+old way. There are no absolute wall-clock budgets, so a slow or loaded CI
+runner does not fail the suite.
+
+Reference: TESTING_STRATEGY V3.2 - Performance tests for latency/throughput
+Related Requirements: REQ-DATA-006, Issue #229
+
+Usage:
+    pytest tests/performance/database/seeding/test_source_adapters_performance.py -v -m performance
+"""
+
+import random
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from precog.database.seeding.sources.nfl_data_py_source import (
+    NFLDataPySource as NFLDataPyStatsSource,
+)
+from precog.database.seeding.sources.sports.nfl_data_py_adapter import NFLDataPySource
+from precog.database.seeding.sources.sports.nflreadpy_adapter import NFLReadPySource
+from precog.database.seeding.sources.sports.pybaseball_adapter import PybaseballSource
+
+NFL_TEAMS = ["KC", "BUF", "SF", "PHI", "DET", "LA", "JAC", "OAK", "SD", "STL", "NE", "DAL"]
+MLB_TEAMS = ["NYA", "BOS", "TBA", "CHA", "KCA", "SFN", "LAN", "NYN", "SLN", "CHN"]
+SCHEDULE_ROWS = 25 * 285  # 25 seasons of nflverse schedules
+WEEKLY_STAT_ROWS = 5 * 5_600  # 5 seasons of weekly player stats
+EPA_ROWS = 25 * 32 * 22  # 25 seasons of team-week EPA aggregates
+RETROSHEET_ROWS = 12 * 2_430  # 12 seasons of retrosheet game logs
+
+
+def _elapsed(func: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def _iterrows_baseline(frame: pd.DataFrame) -> float:
+    """Time a bare iterrows() pass, the floor of the previous row-by-row loops."""
+
+    def walk() -> None:
+        for _, _row in frame.iterrows():
+            pass
+
+    return _elapsed(walk)
+
+
+def _schedules(rows: int) -> pd.DataFrame:
+    rng = random.Random(0)
+    data = []
+    for i in range(rows):
+        home, away = rng.sample(NFL_TEAMS, 2)
+        played = rng.random() > 0.05
+        data.append(
+            {
+                "game_id": f"G{i}",
+                "season": 1999 + i // 285,
+                "week": rng.randint(1, 22),
+                "gameday": f"{1999 + i // 285}-{rng.randint(9, 12):02d}-{rng.randint(1, 28):02d}",
+                "home_team": home,
+                "away_team": away,
+                "home_score": float(rng.randint(0, 50)) if played else None,
+                "away_score": float(rng.randint(0, 50)) if played else None,
+                "game_type": rng.choice(["REG"] * 12 + ["WC", "DIV", "CON", "SB"]),
+                "location": rng.choice(["Home"] * 30 + ["Neutral"]),
+                "stadium": f"Stadium {home}",
+            }
+        )
+    return pd.DataFrame(data)
+
+
+@pytest.mark.performance
+class TestNFLSourcePerformance:
+    """Season-scale throughput of the nflverse adapters."""
+
+    def test_nfl_data_py_load_games(self) -> None:
+        """25 seasons of schedules normalize faster than iterrows() walks them."""
+        schedules = _schedules(SCHEDULE_ROWS)
+        source = NFLDataPySource()
+        source._nfl = MagicMock()
+        source._nfl.import_schedules.return_value = schedules
+
+        games: list[Any] = []
+        elapsed = _elapsed(lambda: games.extend(source.load_games(seasons=[2023])))
+
+        assert len(games) > SCHEDULE_ROWS * 0.9
+        assert elapsed < _iterrows_baseline(schedules), f"load_games took {elapsed:.2f}s"
+
+    def test_nflreadpy_load_games(self) -> None:
+        """Polars schedules convert column-wise instead of via to_dicts()."""
+        schedules = _schedules(SCHEDULE_ROWS)
+        polars_frame = MagicMock()
+        polars_frame.to_dict.return_value = schedules.to_dict(orient="list")
+        source = NFLReadPySource()
+        source._nfl = MagicMock()
+        source._nfl.load_schedules.return_value = polars_frame
+
+        games: list[Any] = []
+        elapsed = _elapsed(lambda: games.extend(source.load_games(seasons=[2023])))
+
+        assert len(games) > SCHEDULE_ROWS * 0.9
+        assert elapsed < _iterrows_baseline(schedules), f"load_games took {elapsed:.2f}s"
+
+    def test_nflreadpy_load_epa(self) -> None:
+        """Decimal quantization of six EPA columns runs per unique value, not per cell."""
+        rng = random.Random(1)
+        epa = pd.DataFrame(
+            {
+                "posteam": [rng.choice(NFL_TEAMS) for _ in range(EPA_ROWS)],
+                "week": [rng.randint(1, 22) for _ in range(EPA_ROWS)],
+                "games_played": [1] * EPA_ROWS,
+            }
+            | {
+                field: [round(rng.uniform(-0.6, 0.6), 3) for _ in range(EPA_ROWS)]
+                for field in (
+                    "off_epa_per_play",
+                    "pass_epa_per_play",
+                    "rush_epa_per_play",
+                    "def_epa_per_play",
+                    "def_pass_epa_per_play",
+                    "def_rush_epa_per_play",
+                )
+            }
+        )
+        combined = MagicMock()
+        combined.to_dict.return_value = epa.to_dict(orient="list")
+        pbp = MagicMock()
+        pbp.__len__.return_value = 1_000_000
+        pbp.filter.return_value.group_by.return_value.agg.return_value.join.return_value = combined
+        source = NFLReadPySource()
+        source._nfl = MagicMock()
+        source._nfl.load_pbp.return_value = pbp
+
+        records: list[Any] = []
+        with patch.dict(sys.modules, {"polars": MagicMock()}):
+            elapsed = _elapsed(lambda: records.extend(source.load_epa(season=2023)))
+
+        assert len(records) == EPA_ROWS
+        assert elapsed < _iterrows_baseline(epa), f"load_epa took {elapsed:.2f}s"
+
+    def test_nfl_data_py_weekly_stats(self) -> None:
+        """Weekly stats extract sparse stat dicts without per-row Series."""
+        rng = random.Random(2)
+        stat_fields = (
+            NFLDataPyStatsSource.PASSING_STATS
+            + NFLDataPyStatsSource.RUSHING_STATS
+            + NFLDataPyStatsSource.RECEIVING_STATS
+        )
+        weekly = pd.DataFrame(
+            {
+                "player_id": [f"00-{i % 2_000:07d}" for i in range(WEEKLY_STAT_ROWS)],
+                "player_name": [f"Player {i % 2_000}" for i in range(WEEKLY_STAT_ROWS)],
+                "recent_team": [rng.choice(NFL_TEAMS) for _ in range(WEEKLY_STAT_ROWS)],
+                "season": [2019 + i // 5_600 for i in range(WEEKLY_STAT_ROWS)],
+                "week": [rng.randint(1, 22) for _ in range(WEEKLY_STAT_ROWS)],
+            }
+            | {
+                field: [
+                    rng.choice([0, 0, None, rng.randint(1, 300)]) for _ in range(WEEKLY_STAT_ROWS)
+                ]
+                for field in stat_fields
+            }
+        )
+        source = NFLDataPyStatsSource()
+        source._nfl = MagicMock()
+        source._nfl.import_weekly_data.return_value = weekly
+
+        records: list[Any] = []
+        elapsed = _elapsed(
+            lambda: records.extend(source.load_stats(seasons=[2023], stat_type="weekly"))
+        )
+
+        assert len(records) > WEEKLY_STAT_ROWS
+        assert elapsed < _iterrows_baseline(weekly), f"weekly stats took {elapsed:.2f}s"
+
+
+@pytest.mark.performance
+class TestPybaseballSourcePerformance:
+    """Season-scale throughput of the pybaseball adapter."""
+
+    def test_retrosheet_game_logs(self) -> None:
+        """A dozen seasons of retrosheet logs normalize faster than iterrows() walks them."""
+        rng = random.Random(3)
+        logs = pd.DataFrame(
+            {
+                "GameID": [f"G{i}" for i in range(RETROSHEET_ROWS)],
+                "Date": [
+                    f"{2012 + i // 2_430}-{rng.randint(4, 9):02d}-{rng.randint(1, 28):02d}"
+                    for i in range(RETROSHEET_ROWS)
+                ],
+                "Home": [rng.choice(MLB_TEAMS) for _ in range(RETROSHEET_ROWS)],
+                "Away": [rng.choice(MLB_TEAMS) for _ in range(RETROSHEET_ROWS)],
+                "HomeRuns": [rng.randint(0, 12) for _ in range(RETROSHEET_ROWS)],
+                "AwayRuns": [rng.randint(0, 12) for _ in range(RETROSHEET_ROWS)],
+            }
+        )
+        source = PybaseballSource()
+        source.REQUEST_DELAY = 0
+        source._pybaseball = MagicMock()
+        source._pybaseball.retrosheet.season_game_logs.return_value = logs
+
+        games: list[Any] = []
+        elapsed = _elapsed(lambda: games.extend(source.load_games_retrosheet(seasons=[2023])))
+
+        assert len(games) == RETROSHEET_ROWS
+        assert elapsed < _iterrows_baseline(logs), f"retrosheet load took {elapsed:.2f}s"
+
+    def test_schedule_and_record(self) -> None:
+        """Sixty 162-game team schedules normalize faster than iterrows() walks them.
+
+        Each season's frames are normalized in one pass; team by team, the
+        fixed per-call cost of each column operation would dominate.
+        """
+        rng = random.Random(4)
+        source = PybaseballSource()
+        source.REQUEST_DELAY = 0
+        rows = 162
+        schedules = {
+            (season, team): pd.DataFrame(
+                {
+                    "Gm#": range(1, rows + 1),
+                    "Date": [f"{season}-{rng.randint(4, 9):02d}-{rng.randint(1, 28):02d}"] * rows,
+                    "Tm": [team] * rows,
+                    "Home_Away": [rng.choice(["Home", "@"]) for _ in range(rows)],
+                    "Opp": [rng.choice(MLB_TEAMS) for _ in range(rows)],
+                    "R": [rng.randint(0, 12) for _ in range(rows)],
+                    "RA": [rng.randint(0, 12) for _ in range(rows)],
+                }
+            )
+            for season in (2022, 2023)
+            for team in source._get_teams_for_season(season)
+        }
+        source._pybaseball = MagicMock()
+        source._pybaseball.schedule_and_record.side_effect = lambda season, team: schedules[
+            season, team
+        ]
+
+        games: list[Any] = []
+        elapsed = _elapsed(lambda: games.extend(source.load_games(seasons=[2022, 2023])))
+
+        assert games
+        baseline = sum(_iterrows_baseline(frame) for frame in schedules.values())
+        assert elapsed < baseline, f"schedule load took {elapsed:.2f}s"
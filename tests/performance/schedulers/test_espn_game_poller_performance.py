@@ -532,6 +532,39 @@ class TestMultiLeaguePerformance:
         assert avg_time < 0.005  # < 5ms average for 4 leagues
 
 
+@pytest.mark.performance
+class TestParallelFanOut:
+    """Performance tests for concurrent multi-league polling."""
+
+    def test_slow_fetches_overlap(self, mock_espn_client: MagicMock) -> None:
+        """
+        PERFORMANCE: 4 leagues with 100ms scoreboard latency each.
+
+        Benchmark:
+        - Serial fetch would take >= 400ms
+        - Target: poll_once() < 250ms (requests overlap)
+        """
+
+        def slow_scoreboard(league: str) -> list:
+            time.sleep(0.1)
+            return []
+
+        mock_espn_client.get_scoreboard.side_effect = slow_scoreboard
+        poller = ESPNGamePoller(
+            leagues=["nfl", "nba", "nhl", "ncaaf"],
+            espn_client=mock_espn_client,
+        )
+
+        start = time.perf_counter()
+        poller.poll_once()
+        elapsed = time.perf_counter() - start
+
+        fetch = poller.get_stats()["league_latency"]["nfl"]["fetch"]
+        assert fetch["count"] == 1
+        assert fetch["max"] >= 0.1
+        assert elapsed < 0.25, f"4-league fan-out took {elapsed:.3f}s"
+
+
 # =============================================================================
 # Performance Tests: Latency Consistency
 # =============================================================================
@@ -5,6 +5,7 @@ Establishes latency benchmarks for database operations:
 - Query latency (p50, p95, p99)
 - Write throughput (ops/sec)
 - SCD Type 2 history query performance
+- Prepared vs plain execution of hot lookups
 
 Related:
 - REQ-DATA-001: Game State Data Collection (SCD Type 2)
@@ -21,7 +22,7 @@ from datetime import datetime
 
 import pytest
 
-from precog.database.connection import get_cursor
+from precog.database.connection import fetch_one, get_cursor, get_pool_stats
 from precog.database.crud_game_states import (
     create_game_state,
     get_current_game_state,
@@ -471,6 +472,68 @@ class TestOverallThroughput:
         assert throughput > 50, f"Throughput {throughput:.1f} ops/sec below 50 target"
 
 
+@pytest.mark.performance
+class TestPreparedStatementPerformance:
+    """Prepared (PREPARE/EXECUTE) vs plain execution of a hot lookup."""
+
+    # Same shape as get_current_game_state(): a three-way join whose
+    # parse/plan cost is paid on every plain execution.
+    QUERY = """
+        SELECT gs.*,
+               th.team_code AS home_team_code, ta.team_code AS away_team_code,
+               v.venue_name
+        FROM game_states gs
+        LEFT JOIN teams th ON gs.home_team_id = th.team_id
+        LEFT JOIN teams ta ON gs.away_team_id = ta.team_id
+        LEFT JOIN venues v ON gs.venue_id = v.venue_id
+        WHERE gs.espn_event_id = %s
+          AND gs.row_current_ind = TRUE
+    """
+
+    def test_prepared_lookup_latency(self, db_pool, clean_test_data, setup_perf_teams):
+        """
+        PERFORMANCE: Compare plain and prepared current-state lookups.
+
+        Benchmark:
+        - Prepared p50 no slower than plain p50 (+25% noise allowance)
+        - Identical results, statement prepared once per pooled connection
+        """
+        teams = setup_perf_teams
+        create_game_state(
+            espn_event_id="PERF-PREP-001",
+            home_team_id=teams[0],
+            away_team_id=teams[1],
+            home_score=7,
+            away_score=3,
+            game_status="in_progress",
+            league="nfl",
+        )
+        params = ("PERF-PREP-001",)
+        plain_row = fetch_one(self.QUERY, params)
+        prepared_row = fetch_one(self.QUERY, params, prepared="perf_current_game_state")
+        assert prepared_row == plain_row
+
+        def p50(prepared: str | None) -> float:
+            latencies = []
+            for _ in range(200):
+                start = time.perf_counter()
+                fetch_one(self.QUERY, params, prepared=prepared)
+                latencies.append((time.perf_counter() - start) * 1000)  # ms
+            return statistics.median(latencies)
+
+        plain_p50 = p50(None)
+        prepared_p50 = p50("perf_current_game_state")
+
+        print("\nCurrent game state lookup p50 (ms):")
+        print(f"  plain:    {plain_p50:.3f}")
+        print(f"  prepared: {prepared_p50:.3f}")
+
+        assert get_pool_stats()["pool_prepared_statements"] >= 1
+        assert prepared_p50 < plain_p50 * 1.25, (
+            f"Prepared p50 {prepared_p50:.3f}ms slower than plain {plain_p50:.3f}ms"
+        )
+
+
 # =============================================================================
 # PERFORMANCE BENCHMARKS: State Change Detection (Issue #234)
 # =============================================================================
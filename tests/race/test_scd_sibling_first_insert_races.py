@@ -73,7 +73,10 @@ from precog.database.crud_game_states import (
     upsert_game_odds,
     upsert_game_state,
 )
-from precog.database.crud_markets import update_market_with_versioning
+from precog.database.crud_markets import (
+    update_market_with_versioning,
+    update_markets_with_versioning_batch,
+)
 from precog.database.crud_positions import (
     close_position,
     set_trailing_stop_state,
@@ -594,6 +597,64 @@ class TestUpdateMarketConcurrentUpdateRace:
         # row per iteration", not "retry path fired".
 
 
+@pytest.mark.race
+@_skip_in_ci
+class TestUpdateMarketsBatchConcurrentUpdateRace:
+    """Batched writer vs single-row writer on the same market_snapshots row."""
+
+    def test_batch_and_single_row_serialize(self, market_race_setup: Any) -> None:
+        ticker, market_pk = market_race_setup
+
+        for iteration in range(_NUM_ITERATIONS):
+            with get_cursor(commit=True) as cur:
+                cur.execute("DELETE FROM market_snapshots WHERE market_id = %s", (market_pk,))
+                cur.execute(
+                    """
+                    INSERT INTO market_snapshots (
+                        market_id, yes_ask_price, no_ask_price, volume,
+                        row_current_ind, row_start_ts, updated_at
+                    )
+                    VALUES (%s, %s, %s, %s, TRUE, NOW(), NOW())
+                    """,
+                    (market_pk, Decimal("0.5000"), Decimal("0.5000"), 100),
+                )
+
+            def call_a(_t: str = ticker) -> int:
+                return update_markets_with_versioning_batch(
+                    [{"ticker": _t, "yes_ask_price": Decimal("0.5500")}]
+                )[_t]
+
+            def call_b(_t: str = ticker) -> int:
+                return update_market_with_versioning(
+                    ticker=_t,
+                    yes_ask_price=Decimal("0.6000"),
+                    no_ask_price=Decimal("0.4000"),
+                )
+
+            results, errors = _run_two_thread_race(call_a, call_b)
+
+            assert errors["a"] is None, f"iteration {iteration}: batch raised: {errors['a']!r}"
+            assert errors["b"] is None, f"iteration {iteration}: single raised: {errors['b']!r}"
+            assert results["a"] == results["b"] == market_pk
+
+            with get_cursor(commit=False) as cur:
+                cur.execute(
+                    """
+                    SELECT volume, row_current_ind
+                    FROM market_snapshots
+                    WHERE market_id = %s
+                    """,
+                    (market_pk,),
+                )
+                rows = cur.fetchall()
+
+            current_rows = [r for r in rows if r["row_current_ind"]]
+            assert len(current_rows) == 1
+            # Unset fields carried forward from the locked current row
+            assert current_rows[0]["volume"] == 100
+            assert len(rows) == 3
+
+
 # =============================================================================
 # Issue #626 — update_position_price concurrent-update race
 # =============================================================================
@@ -1356,3 +1356,27 @@ def test_update_bracket_counts_empty_table(db_pool, clean_test_data):
     """update_bracket_counts on empty markets table returns 0."""
     updated = update_bracket_counts()
     assert updated == 0
+
+
+@pytest.mark.integration
+def test_update_bracket_counts_for_events_scoped(db_pool, clean_test_data, sample_market_data):
+    """Incremental recount touches only the given events and matches the full recount."""
+    from precog.database.crud_game_states import update_bracket_counts_for_events
+
+    for i, ticker in enumerate(["TEST-BRACKET-INC-A", "TEST-BRACKET-INC-B"]):
+        data = dict(sample_market_data)
+        data["ticker"] = ticker
+        data["external_id"] = f"TEST-BRACKET-INC-EXT-{i}"
+        create_market(**data)
+    event_id = get_current_market("TEST-BRACKET-INC-A")["event_id"]
+
+    # An unrelated event id leaves these markets untouched
+    assert update_bracket_counts_for_events([-1]) == 0
+    assert get_current_market("TEST-BRACKET-INC-A")["bracket_count"] != 2
+
+    assert update_bracket_counts_for_events([event_id, event_id]) == 2
+    for ticker in ["TEST-BRACKET-INC-A", "TEST-BRACKET-INC-B"]:
+        assert get_current_market(ticker)["bracket_count"] == 2
+
+    # Already consistent with the full recount for this event
+    assert update_bracket_counts_for_events([event_id]) == 0
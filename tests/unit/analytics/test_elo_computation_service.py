@@ -9,9 +9,13 @@ Reference: Phase 2C - Elo rating computation infrastructure
 
 from datetime import date
 from decimal import Decimal
-from unittest.mock import MagicMock
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 from precog.analytics.elo_computation_service import (
+    ELO_LOG_COLUMNS,
     ComputationResult,
     EloComputationService,
     TeamRatingState,
@@ -207,3 +211,109 @@ class TestAnalyticsModuleExports:
         assert ComputationResult is not None
         assert compute_elo_ratings is not None
         assert get_elo_computation_stats is not None
+
+
+class TestEloLogCopyPersistence:
+    """Tests for COPY-chunked elo_calculation_log writes."""
+
+    @staticmethod
+    def _games(count: int) -> list[dict[str, Any]]:
+        return [
+            {
+                "id": 100 + i,
+                "game_date": date(2024, 9, 1 + i),
+                "season": 2024,
+                "home_team_code": "KC" if i % 2 else "BUF",
+                "away_team_code": "BUF" if i % 2 else "KC",
+                "home_score": 24,
+                "away_score": 17,
+                "game_type": "regular",
+                "is_neutral_site": False,
+            }
+            for i in range(count)
+        ]
+
+    def _run(self, service: EloComputationService, games: list[dict[str, Any]], **kwargs: Any):
+        with (
+            patch.object(service, "_fetch_historical_games", return_value=games),
+            patch.object(service, "_get_already_computed_games", return_value=set()),
+            patch.object(service, "_resolve_team_id", return_value=None),
+            patch(
+                "precog.analytics.elo_computation_service.get_league_id_or_none",
+                return_value=1,
+            ),
+        ):
+            return service.compute_ratings("nfl", **kwargs)
+
+    def test_rows_copied_in_chunks(self) -> None:
+        """7 games with log_chunk_size=3 -> 3 COPY calls, each followed by a commit."""
+        conn = MagicMock()
+        cursor = conn.cursor.return_value
+        copied: list[str] = []
+        cursor.copy_expert.side_effect = lambda sql, buf: copied.append(buf.read())
+        service = EloComputationService(conn, log_chunk_size=3)
+
+        result = self._run(service, self._games(7))
+
+        assert cursor.copy_expert.call_count == 3
+        sql = cursor.copy_expert.call_args.args[0]
+        assert sql.startswith("COPY elo_calculation_log (game_id, league, game_date,")
+        assert "FORMAT csv" in sql
+        assert [len(chunk.splitlines()) for chunk in copied] == [3, 3, 1]
+        assert result.games_processed == 7
+        assert result.logs_inserted == 7
+        assert conn.commit.call_count >= 3
+        cursor.execute.assert_not_called()
+
+    def test_csv_row_contents(self) -> None:
+        """CSV fields follow ELO_LOG_COLUMNS; None becomes an empty (NULL) field."""
+        conn = MagicMock()
+        cursor = conn.cursor.return_value
+        copied: list[str] = []
+        cursor.copy_expert.side_effect = lambda sql, buf: copied.append(buf.read())
+        service = EloComputationService(conn, calculation_source="backfill")
+
+        self._run(service, self._games(1))
+
+        fields = copied[0].strip().split(",")
+        assert len(fields) == len(ELO_LOG_COLUMNS)
+        row = dict(zip(ELO_LOG_COLUMNS, fields, strict=True))
+        assert row["game_id"] == "100"
+        assert row["league"] == "nfl"
+        assert row["game_date"] == "2024-09-01"
+        assert Decimal(row["home_elo_before"]) == Decimal("1500")
+        assert row["calculation_source"] == "backfill"
+        assert row["league_id"] == "1"
+
+    def test_recompute_upserts_through_stage(self) -> None:
+        """skip_computed=False stages rows, updates matches, inserts the rest."""
+        conn = MagicMock()
+        cursor = conn.cursor.return_value
+        service = EloComputationService(conn)
+
+        result = self._run(service, self._games(2), skip_computed=False)
+
+        statements = [" ".join(c.args[0].split()) for c in cursor.execute.call_args_list]
+        assert statements[0].startswith("CREATE TEMP TABLE _elo_log_stage ON COMMIT DROP")
+        assert statements[1].startswith("UPDATE elo_calculation_log l SET")
+        assert "l.calculation_version = s.calculation_version" in statements[1]
+        assert "game_id = s.game_id," not in statements[1]
+        assert statements[2].startswith("INSERT INTO elo_calculation_log")
+        assert "WHERE NOT EXISTS" in statements[2]
+        assert cursor.copy_expert.call_args.args[0].startswith("COPY _elo_log_stage")
+        assert result.logs_inserted == 2
+
+    def test_failed_copy_is_not_counted(self) -> None:
+        """A failed chunk raises and is not reported as inserted."""
+        conn = MagicMock()
+        conn.cursor.return_value.copy_expert.side_effect = RuntimeError("copy failed")
+        service = EloComputationService(conn)
+
+        with pytest.raises(RuntimeError, match="copy failed"):
+            self._run(service, self._games(2))
+        conn.commit.assert_not_called()
+
+    def test_rejects_non_positive_chunk_size(self) -> None:
+        """log_chunk_size must be positive."""
+        with pytest.raises(ValueError, match="log_chunk_size"):
+            EloComputationService(MagicMock(), log_chunk_size=0)
@@ -0,0 +1,194 @@
+"""Unit tests for elo_live_updater module.
+
+Checks that LiveEloUpdater applies the same update as EloEngine, keeps its
+in-memory ratings in step with the database write, treats games that are
+already logged as no-ops, and regresses a team's rating when its first game
+of a new season goes final.
+
+Reference: Phase 2C - Elo rating computation infrastructure
+"""
+
+from datetime import date
+from decimal import Decimal
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from precog.analytics.elo_engine import DEFAULT_INITIAL_RATING, EloEngine
+from precog.analytics.elo_live_updater import LiveEloUpdater
+
+MODULE = "precog.analytics.elo_live_updater"
+
+
+def _game(**overrides: Any) -> dict[str, Any]:
+    game: dict[str, Any] = {
+        "game_id": 101,
+        "league": "nfl",
+        "game_date": date(2025, 9, 7),
+        "home_team_id": 10,
+        "away_team_id": 20,
+        "home_team_code": "KC",
+        "away_team_code": "BAL",
+        "home_score": 27,
+        "away_score": 20,
+    }
+    game.update(overrides)
+    return game
+
+
+@pytest.fixture
+def updater() -> LiveEloUpdater:
+    """Updater warmed with two NFL teams last rated in the 2025 season."""
+    live = LiveEloUpdater()
+    with (
+        patch(
+            f"{MODULE}.get_team_elo_ratings",
+            return_value={10: Decimal("1600.00"), 20: Decimal("1550.00")},
+        ),
+        patch(f"{MODULE}.get_team_elo_seasons", return_value={10: 2025, 20: 2025}),
+    ):
+        live.warm(["nfl"])
+    return live
+
+
+class TestWarm:
+    """Bulk loading of current ratings."""
+
+    def test_loads_supported_leagues_only(self) -> None:
+        """Leagues without an Elo config are not queried."""
+        live = LiveEloUpdater()
+        with (
+            patch(f"{MODULE}.get_team_elo_ratings", return_value={1: Decimal("1510")}) as load,
+            patch(f"{MODULE}.get_team_elo_seasons", return_value={1: 2024}) as load_seasons,
+        ):
+            assert live.warm(["nfl", "cricket"]) == 1
+        load.assert_called_once_with(["nfl"])
+        load_seasons.assert_called_once_with(["nfl"])
+        assert live.rating(1) == Decimal("1510")
+
+
+class TestApplyFinalGame:
+    """One incremental update per finished game."""
+
+    def test_matches_engine_and_updates_cache(self, updater: LiveEloUpdater) -> None:
+        """Persisted values equal EloEngine.update_ratings; cache moves to the new ratings."""
+        expected = EloEngine("nfl", game_date=date(2025, 9, 7)).update_ratings(
+            Decimal("1600.00"), Decimal("1550.00"), 27, 20
+        )
+        with patch(f"{MODULE}.apply_game_elo_update", return_value=1) as write:
+            result = updater.apply_final_game(**_game())
+
+        assert result == expected
+        kwargs = write.call_args.kwargs
+        assert kwargs["home_elo_after"] == expected.home_elo_after
+        assert kwargs["home_advantage"] == expected.home_advantage
+        assert kwargs["calculation_source"] == "realtime"
+        assert updater.rating(10) == expected.home_elo_after
+        assert updater.rating(20) == expected.away_elo_after
+        assert updater.get_stats()["elo_updates_applied"] == 1
+
+    def test_already_applied_game_evicts_cache(self, updater: LiveEloUpdater) -> None:
+        """A game already in the log moves nothing and forces a re-read."""
+        with patch(f"{MODULE}.apply_game_elo_update", return_value=None):
+            assert updater.apply_final_game(**_game()) is None
+
+        assert updater.rating(10) is None
+        assert updater.rating(20) is None
+        assert updater.get_stats()["elo_updates_duplicate"] == 1
+
+    def test_unresolved_team_skipped(self, updater: LiveEloUpdater) -> None:
+        """No write without both team ids."""
+        with patch(f"{MODULE}.apply_game_elo_update") as write:
+            assert updater.apply_final_game(**_game(away_team_id=None)) is None
+        write.assert_not_called()
+        assert updater.get_stats()["elo_updates_skipped"] == 1
+
+    def test_unknown_team_loaded_lazily(self) -> None:
+        """Teams outside the warm set are read once, defaulting to the initial rating."""
+        live = LiveEloUpdater()
+        with (
+            patch(f"{MODULE}.get_team_elo_rating", side_effect=[Decimal("1580"), None]) as load,
+            patch(f"{MODULE}.get_team_elo_season", return_value=None),
+            patch(f"{MODULE}.apply_game_elo_update", return_value=1) as write,
+        ):
+            live.apply_final_game(**_game())
+
+        assert load.call_count == 2
+        assert write.call_args.kwargs["home_elo_before"] == Decimal("1580")
+        assert write.call_args.kwargs["away_elo_before"] == DEFAULT_INITIAL_RATING
+
+    def test_playoff_and_neutral_site(self, updater: LiveEloUpdater) -> None:
+        """Playoff season types use the playoff K; neutral sites drop home advantage."""
+        regular = EloEngine("nfl", game_date=date(2025, 9, 7))
+        with patch(f"{MODULE}.apply_game_elo_update", return_value=1):
+            result = updater.apply_final_game(**_game(), season_type="playoff", neutral_site=True)
+
+        assert result is not None
+        assert result.k_factor > regular.k_factor
+        assert result.home_advantage == 0
+
+
+class TestSeasonRegression:
+    """Regression to the mean at each team's first game of a new season."""
+
+    def test_first_game_of_new_season_regresses(self) -> None:
+        """A team last rated in 2024 enters its first 2025 game with a regressed rating."""
+        live = LiveEloUpdater()
+        with (
+            patch(
+                f"{MODULE}.get_team_elo_ratings",
+                return_value={10: Decimal("1700.00"), 20: Decimal("1550.00")},
+            ),
+            patch(f"{MODULE}.get_team_elo_seasons", return_value={10: 2024, 20: 2025}),
+        ):
+            live.warm(["nfl"])
+        engine = EloEngine("nfl", game_date=date(2025, 9, 7))
+        regressed = engine.apply_season_regression(Decimal("1700.00"))
+        expected = engine.update_ratings(regressed, Decimal("1550.00"), 27, 20)
+
+        with patch(f"{MODULE}.apply_game_elo_update", return_value=1) as write:
+            result = live.apply_final_game(**_game(), season=2025)
+
+        assert regressed == Decimal("1651.25")
+        assert result == expected
+        assert write.call_args.kwargs["home_elo_before"] == regressed
+        assert write.call_args.kwargs["away_elo_before"] == Decimal("1550.00")
+        assert live.get_stats()["elo_season_regressions"] == 1
+
+        # Later games of the same season are not regressed again
+        with patch(f"{MODULE}.apply_game_elo_update", return_value=1) as write:
+            live.apply_final_game(**_game(game_id=102), season=2025)
+        assert write.call_args.kwargs["home_elo_before"] == expected.home_elo_after
+        assert live.get_stats()["elo_season_regressions"] == 1
+
+    def test_season_defaults_to_game_date_year(self, updater: LiveEloUpdater) -> None:
+        """Without season, the calendar year of game_date is used (as games.season is)."""
+        with patch(f"{MODULE}.apply_game_elo_update", return_value=1) as write:
+            updater.apply_final_game(**_game(game_date=date(2026, 9, 10)))
+
+        before = write.call_args.kwargs["home_elo_before"]
+        assert before == EloEngine("nfl").apply_season_regression(Decimal("1600.00"))
+        assert updater.get_stats()["elo_season_regressions"] == 2
+
+    def test_duplicate_game_does_not_advance_season(self, updater: LiveEloUpdater) -> None:
+        """A game already logged leaves season state to be re-read from the database."""
+        with (
+            patch(f"{MODULE}.apply_game_elo_update", return_value=None),
+            patch(f"{MODULE}.get_team_elo_rating", return_value=Decimal("1600.00")),
+            patch(f"{MODULE}.get_team_elo_season", return_value=2026) as load_season,
+        ):
+            updater.apply_final_game(**_game(), season=2026)
+            updater.apply_final_game(**_game(game_id=102), season=2026)
+
+        assert load_season.call_count == 2
+        assert updater.get_stats()["elo_season_regressions"] == 0
+
+    def test_earlier_season_game_is_not_regressed(self, updater: LiveEloUpdater) -> None:
+        """A late-reported game from an earlier season uses the current rating as is."""
+        with patch(f"{MODULE}.apply_game_elo_update", return_value=1) as write:
+            updater.apply_final_game(**_game(), season=2024)
+            updater.apply_final_game(**_game(game_id=102), season=2025)
+
+        assert write.call_args_list[0].kwargs["home_elo_before"] == Decimal("1600.00")
+        assert updater.get_stats()["elo_season_regressions"] == 0
@@ -0,0 +1,275 @@
+"""Unit tests for elo_replay module.
+
+Checks the NumPy replay engine against the Decimal EloEngine (the reference
+implementation) on multi-season NFL, NBA and NHL schedules, and checks that
+EloComputationService produces the same log rows and team states on the fast
+and sequential paths.
+
+Reference: Phase 2C - Elo rating computation infrastructure
+"""
+
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from precog.analytics.elo_computation_service import EloComputationService
+from precog.analytics.elo_engine import EloEngine, EloUpdateResult
+from precog.analytics.elo_replay import EloReplayEngine
+
+# League-shaped score ranges (home, away max) and schedule sizes
+LEAGUE_SHAPES = {
+    "nfl": {"teams": 32, "games": 272, "max_score": 45},
+    "nba": {"teams": 30, "games": 1230, "max_score": 135},
+    "nhl": {"teams": 32, "games": 1312, "max_score": 7},
+}
+
+TOLERANCE = Decimal("1e-9")
+
+SERVICE_MODULE = "precog.analytics.elo_computation_service"
+
+
+def _schedule(league: str, seasons: int, seed: int) -> list[dict[str, Any]]:
+    """Synthetic chronological schedule with playoffs, neutral sites and ties."""
+    shape = LEAGUE_SHAPES[league]
+    rng = random.Random(seed)
+    codes = [f"{league.upper()}{i:02d}" for i in range(shape["teams"])]
+    games: list[dict[str, Any]] = []
+    game_id = 1
+    for season in range(2010, 2010 + seasons):
+        day = date(season, 9, 1)
+        n_games = shape["games"]
+        for index in range(n_games):
+            home, away = rng.sample(codes, 2)
+            home_score = rng.randint(0, shape["max_score"])
+            away_score = home_score if rng.random() < 0.04 else rng.randint(0, shape["max_score"])
+            games.append(
+                {
+                    "id": game_id,
+                    "game_date": day + timedelta(days=index // 16),
+                    "season": season,
+                    "home_team_code": home,
+                    "away_team_code": away,
+                    "home_score": home_score,
+                    "away_score": away_score,
+                    "game_type": "playoff" if index >= n_games * 0.95 else "regular",
+                    "is_neutral_site": rng.random() < 0.03,
+                }
+            )
+            game_id += 1
+    return games
+
+
+def _reference_replay(
+    engine: EloEngine, games: list[dict[str, Any]]
+) -> tuple[list[EloUpdateResult], dict[str, Decimal]]:
+    """Replay through EloEngine exactly as EloComputationService does."""
+    ratings: dict[str, Decimal] = {}
+    results = []
+    current_season = None
+    for game in games:
+        if current_season is not None and game["season"] != current_season:
+            ratings = {code: engine.apply_season_regression(r) for code, r in ratings.items()}
+        current_season = game["season"]
+        home = ratings.setdefault(game["home_team_code"], Decimal("1500"))
+        away = ratings.setdefault(game["away_team_code"], Decimal("1500"))
+        update = engine.update_ratings(
+            home,
+            away,
+            game["home_score"],
+            game["away_score"],
+            is_playoff=game["game_type"] != "regular",
+            neutral_site=game["is_neutral_site"],
+        )
+        ratings[game["home_team_code"]] = update.home_elo_after
+        ratings[game["away_team_code"]] = update.away_elo_after
+        results.append(update)
+    return results, ratings
+
+
+class TestEloReplayParity:
+    """The replay reproduces the Decimal engine game by game."""
+
+    @pytest.mark.parametrize("league", sorted(LEAGUE_SHAPES))
+    def test_matches_decimal_engine(self, league: str) -> None:
+        """Every update result and final rating matches within 1e-9 (in practice exactly)."""
+        engine = EloEngine(league)
+        games = _schedule(league, seasons=4, seed=7)
+        expected_results, expected_ratings = _reference_replay(engine, games)
+
+        replay = EloReplayEngine(engine).replay(games)
+
+        assert len(replay) == len(games)
+        assert len(replay.season_boundaries) == 3
+        for index, expected in enumerate(expected_results):
+            actual = replay.update_result(index)
+            for name, value in expected.to_dict().items():
+                replayed = actual.to_dict()[name]
+                if isinstance(value, Decimal):
+                    assert abs(Decimal(replayed) - value) <= TOLERANCE, (index, name)
+            assert actual == expected, index
+        for code, rating in expected_ratings.items():
+            assert abs(replay.rating(code) - rating) <= TOLERANCE
+
+    def test_expected_score_sweep(self) -> None:
+        """Float64 expected score rounds like EloEngine.expected_score across the rating range."""
+        engine = EloEngine("nba")
+        replay_engine = EloReplayEngine(engine)
+        for diff in range(-120_000, 120_001, 37):
+            expected = engine.expected_score(Decimal("1500"), Decimal(150_000 + diff).scaleb(-2))
+            assert replay_engine._expected_units(150_000, 150_000 + diff) == int(expected.scaleb(4))
+
+    def test_regression_matches_engine(self) -> None:
+        """Array regression equals apply_season_regression element-wise."""
+        engine = EloEngine("nfl")
+        cents = np.arange(100_000, 200_000, 13, dtype=np.int64)
+
+        regressed = EloReplayEngine(engine).regress(cents)
+
+        for value, result in zip(cents.tolist()[::50], regressed.tolist()[::50], strict=True):
+            assert Decimal(result).scaleb(-2) == engine.apply_season_regression(
+                Decimal(value).scaleb(-2)
+            )
+
+
+class TestEloReplayEngine:
+    """Replay inputs, team slots and aggregates."""
+
+    def test_existing_ratings_are_regressed_new_teams_join_later(self) -> None:
+        """Input teams regress at the first boundary; a team first seen after it does not."""
+        engine = EloEngine("nfl")
+        games = [
+            {
+                "home_team_code": "KC",
+                "away_team_code": "BUF",
+                "home_score": 24,
+                "away_score": 20,
+                "season": 2023,
+            },
+            {
+                "home_team_code": "DET",
+                "away_team_code": "KC",
+                "home_score": 17,
+                "away_score": 17,
+                "season": 2024,
+            },
+        ]
+
+        replay = EloReplayEngine(engine).replay(games, ratings={"KC": Decimal("1600.00")})
+
+        assert replay.team_codes == ["KC", "BUF", "DET"]
+        assert replay.season_boundaries == [(2023, 2024)]
+        kc_after_first = Decimal("1600.00") + replay.update_result(0).home_elo_change
+        assert replay.update_result(1).away_elo_before == engine.apply_season_regression(
+            kc_after_first
+        )
+        assert replay.update_result(1).home_elo_before == Decimal("1500")
+        assert replay.games_played.tolist() == [2, 1, 1]
+        assert replay.last_game.tolist() == [1, 0, 1]
+
+    def test_peak_and_lowest_track_post_game_ratings(self) -> None:
+        """Peak/lowest start from the starting rating and follow post-game ratings."""
+        games = [
+            {
+                "home_team_code": "A",
+                "away_team_code": "B",
+                "home_score": 30,
+                "away_score": 0,
+                "season": 2024,
+            },
+            {
+                "home_team_code": "B",
+                "away_team_code": "A",
+                "home_score": 28,
+                "away_score": 3,
+                "season": 2024,
+            },
+        ]
+
+        replay = EloReplayEngine(EloEngine("nfl")).replay(games)
+
+        first = replay.update_result(0)
+        assert replay.peak_rating("A") == first.home_elo_after
+        assert replay.lowest_rating("B") == first.away_elo_after
+        assert replay.lowest_rating("A") == replay.update_result(1).away_elo_after
+
+    def test_regression_can_be_disabled(self) -> None:
+        """No boundaries are recorded when regression is off."""
+        games = _schedule("nhl", seasons=2, seed=1)[::50]
+
+        replay = EloReplayEngine(EloEngine("nhl")).replay(games, apply_season_regression=False)
+
+        assert replay.season_boundaries == []
+
+    def test_rejects_sub_cent_ratings(self) -> None:
+        """Ratings not representable in centi-Elo are refused rather than rounded."""
+        games = _schedule("nfl", seasons=1, seed=1)[:1]
+        with pytest.raises(ValueError, match="decimal places"):
+            EloReplayEngine(EloEngine("nfl")).replay(
+                games, ratings={games[0]["home_team_code"]: Decimal("1500.005")}
+            )
+
+    def test_empty_game_list(self) -> None:
+        """An empty replay keeps the input ratings."""
+        replay = EloReplayEngine(EloEngine("nba")).replay([], ratings={"BOS": Decimal("1620.5")})
+        assert len(replay) == 0
+        assert replay.rating("BOS") == Decimal("1620.5")
+
+
+class TestComputeRatingsFastPath:
+    """EloComputationService persists identical results on both paths."""
+
+    def _run(self, use_fast_replay: bool, games: list[dict[str, Any]], computed: set[int]):
+        service = EloComputationService(MagicMock(), use_fast_replay=use_fast_replay)
+        logged: list[tuple[Any, ...]] = []
+        with (
+            patch.object(service, "_fetch_historical_games", return_value=games),
+            patch.object(service, "_get_already_computed_games", return_value=computed),
+            patch.object(service, "_resolve_team_id", side_effect=lambda code, _: hash(code)),
+            patch(f"{SERVICE_MODULE}.get_league_id_or_none", return_value=4),
+            patch.object(
+                service,
+                "_write_elo_logs",
+                side_effect=lambda rows, upsert: logged.extend(rows),
+            ),
+        ):
+            result = service.compute_ratings("nba", commit_interval=500)
+        return service, result, logged
+
+    def test_fast_and_sequential_paths_match(self) -> None:
+        """Log rows, counters and team states are identical."""
+        games = _schedule("nba", seasons=3, seed=11)
+        computed = {g["id"] for g in games[:40]}
+
+        fast, fast_result, fast_logs = self._run(True, games, computed)
+        slow, slow_result, slow_logs = self._run(False, games, computed)
+
+        assert fast_logs == slow_logs
+        assert fast_result.games_processed == slow_result.games_processed == len(games) - 40
+        assert fast_result.games_skipped == slow_result.games_skipped == 40
+        assert fast.conn.commit.call_count == slow.conn.commit.call_count
+        assert fast._ratings["nba"] == slow._ratings["nba"]
+        assert list(fast._ratings["nba"]) == list(slow._ratings["nba"])
+
+    def test_falls_back_when_ratings_not_in_cents(self) -> None:
+        """A sub-cent initial rating uses the Decimal path instead of failing."""
+        games = _schedule("nfl", seasons=1, seed=3)[:20]
+        service = EloComputationService(MagicMock(), initial_rating=Decimal("1500.001"))
+        with (
+            patch.object(service, "_fetch_historical_games", return_value=games),
+            patch.object(service, "_get_already_computed_games", return_value=set()),
+            patch.object(service, "_resolve_team_id", return_value=None),
+            patch(f"{SERVICE_MODULE}.get_league_id_or_none", return_value=None),
+            patch.object(service, "_write_elo_logs"),
+            patch.object(
+                service, "_process_games_sequential", wraps=service._process_games_sequential
+            ) as sequential,
+        ):
+            result = service.compute_ratings("nfl")
+
+        sequential.assert_called_once()
+        assert result.games_processed == 20
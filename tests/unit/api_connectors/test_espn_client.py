@@ -1673,3 +1673,137 @@ class TestTypedDictReturnTypes:
         assert isinstance(away_team_code, str)
         assert len(home_team_code) <= 4  # NFL abbreviations are 2-4 chars
         assert len(away_team_code) <= 4
+
+
+# =============================================================================
+# Conditional Request / Delta Tests
+# =============================================================================
+
+
+def _scoreboard_response(payload: dict, status_code: int = 200, etag: str | None = None) -> Mock:
+    """Mock response with optional ETag header."""
+    response = Mock()
+    response.status_code = status_code
+    response.json.return_value = payload
+    response.headers = {"ETag": etag} if etag else {}
+    return response
+
+
+class TestScoreboardDelta:
+    """Tests for ETag validators and per-event payload hashing."""
+
+    @patch("requests.Session.get")
+    def test_first_fetch_reports_all_games_changed(self, mock_get: MagicMock):
+        """With no cache every parsed game is in the changed list."""
+        from precog.api_connectors.espn_client import ESPNClient
+
+        mock_get.return_value = _scoreboard_response(ESPN_NFL_SCOREBOARD_LIVE, etag='"v1"')
+
+        delta = ESPNClient().get_scoreboard_delta("nfl")
+
+        assert len(delta["games"]) == 2
+        assert delta["changed"] == delta["games"]
+        assert delta["not_modified"] is False
+        assert mock_get.call_args.kwargs["headers"] is None
+
+    @patch("requests.Session.get")
+    def test_sends_etag_and_serves_cache_on_304(self, mock_get: MagicMock):
+        """A 304 returns the cached games with nothing changed."""
+        from precog.api_connectors.espn_client import ESPNClient
+
+        mock_get.side_effect = [
+            _scoreboard_response(ESPN_NFL_SCOREBOARD_LIVE, etag='"v1"'),
+            _scoreboard_response({}, status_code=304),
+        ]
+        client = ESPNClient()
+        first = client.get_scoreboard_delta("nfl")
+
+        second = client.get_scoreboard_delta("nfl")
+
+        assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+        assert second["not_modified"] is True
+        assert second["changed"] == []
+        assert second["games"] == first["games"]
+
+    @patch("requests.Session.get")
+    def test_unchanged_events_are_not_reparsed(self, mock_get: MagicMock):
+        """Identical event payloads reuse the parsed game; a changed event is parsed."""
+        import copy
+
+        from precog.api_connectors.espn_client import ESPNClient
+
+        updated = copy.deepcopy(ESPN_NFL_SCOREBOARD_LIVE)
+        updated["events"][1]["competitions"][0]["status"]["displayClock"] = "0:01"
+        mock_get.side_effect = [
+            _scoreboard_response(ESPN_NFL_SCOREBOARD_LIVE),
+            _scoreboard_response(ESPN_NFL_SCOREBOARD_LIVE),
+            _scoreboard_response(updated),
+        ]
+        client = ESPNClient()
+        first = client.get_scoreboard_delta("nfl")
+
+        with patch.object(client, "_parse_event", wraps=client._parse_event) as parse:
+            same = client.get_scoreboard_delta("nfl")
+            moved = client.get_scoreboard_delta("nfl")
+
+        assert same["changed"] == []
+        assert same["games"][0] is first["games"][0]
+        assert parse.call_count == 1
+        assert [g["metadata"]["espn_event_id"] for g in moved["changed"]] == [
+            str(updated["events"][1]["id"])
+        ]
+        assert moved["games"][0] is first["games"][0]
+
+    @patch("requests.Session.get")
+    def test_forget_events_rearms_event_and_drops_validators(self, mock_get: MagicMock):
+        """A forgotten event is reported as changed and no conditional header is sent."""
+        from precog.api_connectors.espn_client import ESPNClient
+
+        mock_get.return_value = _scoreboard_response(ESPN_NFL_SCOREBOARD_LIVE, etag='"v1"')
+        client = ESPNClient()
+        first = client.get_scoreboard_delta("nfl")
+        event_id = first["games"][0]["metadata"]["espn_event_id"]
+
+        client.forget_events("nfl", [event_id])
+        delta = client.get_scoreboard_delta("nfl")
+
+        assert mock_get.call_args.kwargs["headers"] is None
+        assert [g["metadata"]["espn_event_id"] for g in delta["changed"]] == [event_id]
+
+    @patch("requests.Session.get")
+    def test_get_scoreboard_still_returns_all_games(self, mock_get: MagicMock):
+        """get_scoreboard() keeps returning the full list when nothing changed."""
+        from precog.api_connectors.espn_client import ESPNClient
+
+        mock_get.side_effect = [
+            _scoreboard_response(ESPN_NFL_SCOREBOARD_LIVE, etag='"v1"'),
+            _scoreboard_response({}, status_code=304),
+        ]
+        client = ESPNClient()
+        client.get_scoreboard("nfl")
+
+        assert len(client.get_scoreboard("nfl")) == 2
+
+    @patch("requests.Session.get")
+    def test_dated_fetches_keep_no_state(self, mock_get: MagicMock):
+        """Dated scoreboards are neither conditional nor cached; every game is changed."""
+        from precog.api_connectors.espn_client import ESPNClient
+
+        mock_get.return_value = _scoreboard_response(ESPN_NFL_SCOREBOARD_LIVE, etag='"v1"')
+        client = ESPNClient()
+
+        first = client.get_scoreboard_delta("nfl", date=datetime(2024, 9, 8))
+        second = client.get_scoreboard_delta("nfl", date=datetime(2024, 9, 8))
+
+        assert mock_get.call_args.kwargs["headers"] is None
+        assert second["changed"] == second["games"] == first["games"]
+        assert client._validators == {}
+        assert client._event_cache == {}
+        assert client._scoreboards == {}
+
+    def test_delta_rejects_unknown_league(self):
+        """Unsupported leagues raise ValueError like get_scoreboard()."""
+        from precog.api_connectors.espn_client import ESPNClient
+
+        with pytest.raises(ValueError, match="Unsupported league"):
+            ESPNClient().get_scoreboard_delta("xfl")
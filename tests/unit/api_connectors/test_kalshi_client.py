@@ -14,6 +14,8 @@ All tests use mocked responses - NO actual API calls.
 Coverage Target: ≥90%
 """
 
+import threading
+import time
 from decimal import Decimal
 from unittest.mock import Mock, patch
 
@@ -1319,3 +1321,187 @@ class TestKalshiOrderManagement:
         assert isinstance(order.get("yes_price_dollars"), Decimal)
         assert isinstance(order.get("taker_fill_cost"), Decimal)
         assert order["taker_fill_cost"] == Decimal("3.9000")
+
+
+# =============================================================================
+# Concurrent Multi-Series Pagination Tests
+# =============================================================================
+
+
+def _paged_series(pages_per_series: dict[str, int]):
+    """Build a _get_markets_page side effect serving N cursor pages per series."""
+
+    def fake_page(series_ticker=None, event_ticker=None, limit=100, cursor=None):
+        page = int(cursor) if cursor else 1
+        markets = [{"ticker": f"{series_ticker}-P{page}-M{i}"} for i in range(2)]
+        next_cursor = str(page + 1) if page < pages_per_series[series_ticker] else None
+        return markets, next_cursor
+
+    return fake_page
+
+
+class TestConcurrentMarketPagination:
+    """Test iter_market_pages() and fetch_all_markets(max_workers=...)."""
+
+    @pytest.mark.unit
+    def test_iter_market_pages_streams_every_page(
+        self, mock_env_credentials, mock_load_private_key
+    ):
+        """Every page of every series is yielded, one is_last per series."""
+        client = KalshiClient(environment="demo")
+        pages_per_series = {"KXNFLGAME": 3, "KXNBAGAME": 1, "KXNHLGAME": 2}
+
+        with patch.object(client, "_get_markets_page", side_effect=_paged_series(pages_per_series)):
+            pages = list(client.iter_market_pages(list(pages_per_series), max_workers=3))
+
+        assert len(pages) == 6
+        for series, expected_pages in pages_per_series.items():
+            series_pages = [p for p in pages if p["series_ticker"] == series]
+            # Pages within a series arrive in cursor order
+            assert [p["page_number"] for p in series_pages] == list(range(1, expected_pages + 1))
+            assert [p["is_last"] for p in series_pages].count(True) == 1
+            assert series_pages[-1]["is_last"] is True
+            assert all(p["error"] is None for p in series_pages)
+
+    @pytest.mark.unit
+    def test_iter_market_pages_reports_series_error(
+        self, mock_env_credentials, mock_load_private_key
+    ):
+        """A failing series yields an error page; other series still stream."""
+        client = KalshiClient(environment="demo")
+        good_pages = _paged_series({"KXNFLGAME": 2})
+
+        def fake_page(series_ticker=None, event_ticker=None, limit=100, cursor=None):
+            if series_ticker == "KXBAD":
+                raise requests.HTTPError("500 Server Error")
+            return good_pages(series_ticker=series_ticker, cursor=cursor)
+
+        with patch.object(client, "_get_markets_page", side_effect=fake_page):
+            pages = list(client.iter_market_pages(["KXNFLGAME", "KXBAD"], max_workers=2))
+
+        bad = [p for p in pages if p["series_ticker"] == "KXBAD"]
+        assert len(bad) == 1
+        assert bad[0]["is_last"] is True
+        assert isinstance(bad[0]["error"], requests.HTTPError)
+        assert bad[0]["markets"] == []
+        assert len([p for p in pages if p["series_ticker"] == "KXNFLGAME"]) == 2
+
+    @pytest.mark.unit
+    def test_iter_market_pages_respects_max_pages(
+        self, mock_env_credentials, mock_load_private_key
+    ):
+        """max_pages caps each series independently."""
+        client = KalshiClient(environment="demo")
+
+        with patch.object(
+            client,
+            "_get_markets_page",
+            side_effect=_paged_series({"KXNFLGAME": 10, "KXNBAGAME": 10}),
+        ):
+            pages = list(
+                client.iter_market_pages(["KXNFLGAME", "KXNBAGAME"], max_workers=2, max_pages=2)
+            )
+
+        assert len(pages) == 4
+        assert sum(p["is_last"] for p in pages) == 2
+
+    @pytest.mark.unit
+    def test_iter_market_pages_shares_rate_limiter(
+        self, mock_env_credentials, mock_load_private_key
+    ):
+        """Concurrent requests all pass through the client's shared RateLimiter."""
+        client = KalshiClient(environment="demo")
+        client.rate_limiter = Mock()
+        response = Mock()
+        response.json.return_value = {"markets": [{"ticker": "M-1"}], "cursor": None}
+        response.raise_for_status = Mock()
+
+        with patch.object(client.session, "request", return_value=response):
+            pages = list(
+                client.iter_market_pages(["KXNFLGAME", "KXNBAGAME", "KXNHLGAME"], max_workers=3)
+            )
+
+        assert len(pages) == 3
+        assert client.rate_limiter.wait_if_needed.call_count == 3
+
+    @pytest.mark.unit
+    def test_fetch_all_markets_concurrent_matches_sequential(
+        self, mock_env_credentials, mock_load_private_key
+    ):
+        """max_workers > 1 returns the same markets in the same series order."""
+        client = KalshiClient(environment="demo")
+        pages_per_series = {"KXNFLGAME": 3, "KXNBAGAME": 2, "KXNHLGAME": 1}
+        series = list(pages_per_series)
+
+        with patch.object(client, "_get_markets_page", side_effect=_paged_series(pages_per_series)):
+            sequential = client.fetch_all_markets(series_tickers=series)
+            concurrent = client.fetch_all_markets(series_tickers=series, max_workers=3)
+
+        assert [m["ticker"] for m in concurrent] == [m["ticker"] for m in sequential]
+        assert len(concurrent) == 12
+
+    @pytest.mark.unit
+    def test_fetch_all_markets_concurrent_raises_series_error(
+        self, mock_env_credentials, mock_load_private_key
+    ):
+        """Concurrent fetch_all_markets surfaces a series failure like the sequential path."""
+        client = KalshiClient(environment="demo")
+
+        with (
+            patch.object(
+                client, "_get_markets_page", side_effect=requests.HTTPError("503 Unavailable")
+            ),
+            pytest.raises(requests.HTTPError),
+        ):
+            client.fetch_all_markets(series_tickers=["KXNFLGAME", "KXNBAGAME"], max_workers=2)
+
+    @pytest.mark.unit
+    def test_fetch_all_markets_concurrent_dedupes_series(
+        self, mock_env_credentials, mock_load_private_key
+    ):
+        """A repeated series is fetched and returned once, like the sequential path."""
+        client = KalshiClient(environment="demo")
+        fake_page = Mock(side_effect=_paged_series({"KXNFLGAME": 2, "KXNBAGAME": 1}))
+
+        with patch.object(client, "_get_markets_page", fake_page):
+            sequential = client.fetch_all_markets(series_tickers=["KXNFLGAME", "KXNBAGAME"])
+            fake_page.reset_mock()
+            concurrent = client.fetch_all_markets(
+                series_tickers=["KXNFLGAME", "KXNBAGAME", "KXNFLGAME"], max_workers=2
+            )
+
+        assert [m["ticker"] for m in concurrent] == [m["ticker"] for m in sequential]
+        assert fake_page.call_count == 3
+
+    @pytest.mark.unit
+    def test_iter_market_pages_early_exit_does_not_wait(
+        self, mock_env_credentials, mock_load_private_key
+    ):
+        """Closing the generator returns at once; workers stop before their next page."""
+        client = KalshiClient(environment="demo")
+        release = threading.Event()
+        calls: list[str] = []
+
+        def slow_page(series_ticker=None, event_ticker=None, limit=100, cursor=None):
+            calls.append(series_ticker)
+            if series_ticker == "KXSLOW":
+                release.wait(5)
+            else:
+                time.sleep(0.02)
+            return [{"ticker": f"{series_ticker}-M"}], "next"
+
+        with patch.object(client, "_get_markets_page", side_effect=slow_page):
+            pages = client.iter_market_pages(["KXFAST", "KXSLOW"], max_workers=2, max_pages=50)
+            first = next(pages)
+            while first["series_ticker"] != "KXFAST":
+                first = next(pages)
+            start = time.monotonic()
+            pages.close()
+            elapsed = time.monotonic() - start
+            release.set()
+            time.sleep(0.1)
+
+        assert elapsed < 1.0
+        # The slow series made at most its one blocked request
+        assert calls.count("KXSLOW") <= 1
+        assert calls.count("KXFAST") < 10
@@ -157,6 +157,71 @@ class TestSchedulerStart:
                 f"expected enabled_services={{'espn'}}, got {call_kwargs.get('enabled_services')}"
             )
 
+    def test_start_passes_kalshi_sync_options(self, runner):
+        """--kalshi-batch-sync and --kalshi-fetch-workers reach create_supervisor."""
+        with (
+            patch(
+                "precog.schedulers.service_supervisor.create_supervisor"
+            ) as mock_create_supervisor,
+            patch("precog.cli.scheduler._validate_startup", return_value=True),
+            patch("precog.cli.scheduler._prevent_system_sleep_for_supervised"),
+        ):
+            mock_supervisor = MagicMock()
+            mock_supervisor.is_running = True
+            mock_create_supervisor.return_value = mock_supervisor
+
+            result = runner.invoke(
+                app,
+                ["start", "--supervised", "--kalshi-batch-sync", "--kalshi-fetch-workers", "4"],
+            )
+
+            assert result.exit_code == 0, result.output
+            call_kwargs = mock_create_supervisor.call_args.kwargs
+            assert call_kwargs["kalshi_batch_sync"] is True
+            assert call_kwargs["kalshi_fetch_workers"] == 4
+
+    def test_start_passes_live_elo(self, runner):
+        """--live-elo enables incremental Elo on the supervised ESPN poller."""
+        with (
+            patch(
+                "precog.schedulers.service_supervisor.create_supervisor"
+            ) as mock_create_supervisor,
+            patch("precog.cli.scheduler._validate_startup", return_value=True),
+            patch("precog.cli.scheduler._prevent_system_sleep_for_supervised"),
+        ):
+            mock_supervisor = MagicMock()
+            mock_supervisor.is_running = True
+            mock_create_supervisor.return_value = mock_supervisor
+
+            result = runner.invoke(app, ["start", "--supervised", "--live-elo"])
+
+            assert result.exit_code == 0, result.output
+            assert mock_create_supervisor.call_args.kwargs["espn_live_elo"] is True
+
+    def test_start_passes_streaming_alignment(self, runner):
+        """--streaming-alignment adds the streaming aligner to the supervisor."""
+        with (
+            patch(
+                "precog.schedulers.service_supervisor.create_supervisor"
+            ) as mock_create_supervisor,
+            patch("precog.cli.scheduler._validate_startup", return_value=True),
+            patch("precog.cli.scheduler._prevent_system_sleep_for_supervised"),
+        ):
+            mock_supervisor = MagicMock()
+            mock_supervisor.is_running = True
+            mock_create_supervisor.return_value = mock_supervisor
+
+            result = runner.invoke(app, ["start", "--supervised", "--streaming-alignment"])
+
+            assert result.exit_code == 0, result.output
+            assert mock_create_supervisor.call_args.kwargs["streaming_alignment"] is True
+
+    def test_start_rejects_zero_fetch_workers(self, runner):
+        """--kalshi-fetch-workers must be at least 1."""
+        result = runner.invoke(app, ["start", "--kalshi-fetch-workers", "0"])
+
+        assert result.exit_code == 2
+
     def test_start_invalid_interval(self, runner):
         """Test start with invalid interval value.
 
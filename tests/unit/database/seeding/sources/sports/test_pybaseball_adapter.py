@@ -6,7 +6,15 @@ MLB game data using the pybaseball Python library.
 Reference: Phase 2C - Python library data source adapters
 """
 
+import random
+from datetime import date, datetime
+from typing import Any
+from unittest.mock import MagicMock
+
+import pandas as pd
+
 from precog.database.seeding.sources.sports.pybaseball_adapter import (
+    MLB_DATE_FORMATS,
     PybaseballSource,
     normalize_mlb_team_code,
 )
@@ -46,3 +54,178 @@ class TestPybaseballSource:
         source = PybaseballSource()
         # Stats loading is planned but not yet implemented
         assert source.supports_stats() is False
+
+
+# =============================================================================
+# Columnar Normalization Parity
+# =============================================================================
+
+
+def _legacy_date(value: Any) -> date | None:
+    """Date parsing as the row-by-row adapter did it."""
+    if value is None:
+        return None
+    if hasattr(value, "to_pydatetime"):
+        return value.to_pydatetime().date()
+    for fmt in MLB_DATE_FORMATS:
+        try:
+            return datetime.strptime(str(value), fmt).date()  # noqa: DTZ007
+        except ValueError:
+            continue
+    return None
+
+
+def _legacy_schedule_games(
+    frames: list[pd.DataFrame], season: int, seen_games: set[str]
+) -> list[dict[str, Any]]:
+    """Per-row (iterrows) schedule_and_record conversion, for parity checks."""
+    games = []
+    for frame in frames:
+        for _, row in frame.iterrows():
+            if str(row.get("Home_Away", "")).upper() not in ("H", "HOME", ""):
+                continue
+            opp, team = str(row.get("Opp", "")), str(row.get("Tm", ""))
+            if not opp or not team or opp.startswith("@"):
+                continue
+            home = normalize_mlb_team_code(team)
+            away = normalize_mlb_team_code(opp)
+            game_date = _legacy_date(row.get("Date"))
+            if not game_date:
+                continue
+            game_id = f"{game_date}_{away}_{home}"
+            if game_id in seen_games:
+                continue
+            seen_games.add(game_id)
+            try:
+                home_score, away_score = int(row.get("R")), int(row.get("RA"))
+            except (ValueError, TypeError):
+                continue
+            gm = str(row.get("Gm#", ""))
+            try:
+                is_playoff = int(gm) > 162
+            except ValueError:
+                is_playoff = any(x in gm.upper() for x in ["WC", "DS", "CS", "WS"])
+            games.append(
+                {
+                    "sport": "mlb",
+                    "season": season,
+                    "game_date": game_date,
+                    "home_team_code": home,
+                    "away_team_code": away,
+                    "home_score": home_score,
+                    "away_score": away_score,
+                    "is_neutral_site": False,
+                    "is_playoff": is_playoff,
+                    "game_type": "playoff" if is_playoff else "regular",
+                    "venue_name": None,
+                    "source": "pybaseball",
+                    "source_file": None,
+                    "external_game_id": game_id,
+                }
+            )
+    return games
+
+
+def _team_schedules(seed: int = 0) -> dict[str, pd.DataFrame]:
+    """Synthetic schedule_and_record frames: every game appears in both teams' schedules."""
+    rng = random.Random(seed)
+    teams = ["NYY", "BOS", "TB", "CWS", "KC"]
+    bbref_codes = {"TB": "TBR", "CWS": "CHW", "KC": "KCR"}  # Opp uses Baseball Reference codes
+    rows: dict[str, list[dict[str, Any]]] = {team: [] for team in teams}
+    for n in range(1, 171):
+        home, away = rng.sample(teams, 2)
+        month, day = rng.randint(4, 10), rng.randint(1, 28)
+        game_date = rng.choice(
+            [f"2023-{month:02d}-{day:02d}", f"{month:02d}/{day:02d}/2023", "Sunday, Apr 2"]
+        )
+        runs = [rng.randint(0, 12), rng.randint(0, 12)]
+        if rng.random() < 0.05:
+            runs[0] = None  # postponed
+        gm = str(n) if rng.random() > 0.05 else rng.choice(["WC1", "ALDS2", ""])
+        for team, opp, marker, r, ra in [
+            (home, away, rng.choice(["Home", "H", ""]), runs[0], runs[1]),
+            (away, home, "@", runs[1], runs[0]),
+        ]:
+            rows[team].append(
+                {"Gm#": gm, "Date": game_date, "Tm": team, "Home_Away": marker}
+                | {"Opp": bbref_codes.get(opp, opp), "R": r, "RA": ra}
+            )
+    return {team: pd.DataFrame(team_rows, dtype=object) for team, team_rows in rows.items()}
+
+
+class TestColumnarParity:
+    """Column-wise normalization yields the records the iterrows() parsers produced."""
+
+    def test_load_games_parity(self) -> None:
+        """schedule_and_record frames: home rows only, deduplicated across teams."""
+        schedules = _team_schedules()
+        source = PybaseballSource()
+        source.REQUEST_DELAY = 0
+        source._pybaseball = MagicMock()
+        source._pybaseball.schedule_and_record.side_effect = lambda season, team: schedules.get(
+            team, pd.DataFrame()
+        )
+
+        games = list(source.load_games(seasons=[2023]))
+
+        ordered = [schedules[t] for t in source._get_teams_for_season(2023) if t in schedules]
+        assert games == _legacy_schedule_games(ordered, 2023, set())
+        assert len(games) > 50
+        assert any(g["is_playoff"] for g in games)
+        assert len({g["external_game_id"] for g in games}) == len(games)
+
+    def test_failed_team_fetch_keeps_season(self) -> None:
+        """A team whose schedule fetch fails is skipped; the other teams still load."""
+        schedules = _team_schedules()
+
+        def fetch(season: int, team: str) -> pd.DataFrame:
+            if team == "BOS":
+                raise ConnectionError("bbref timeout")
+            return schedules.get(team, pd.DataFrame())
+
+        source = PybaseballSource()
+        source.REQUEST_DELAY = 0
+        source._pybaseball = MagicMock()
+        source._pybaseball.schedule_and_record.side_effect = fetch
+
+        games = list(source.load_games(seasons=[2023]))
+
+        ordered = [
+            schedules[t]
+            for t in source._get_teams_for_season(2023)
+            if t in schedules and t != "BOS"
+        ]
+        assert games == _legacy_schedule_games(ordered, 2023, set())
+        assert games
+
+    def test_load_games_retrosheet_parity(self) -> None:
+        """Retrosheet game logs: teams normalized, unscored rows and bad dates dropped."""
+        logs = pd.DataFrame(
+            {
+                "GameID": ["NYA202304010", "", "BOS202304030", "SFN202304040", "X"],
+                "Date": ["2023-04-01", "04/02/2023", "2023-04-03", "bad", "2023-04-05"],
+                "Home": ["NYA", "CHA", "BOS", "SFN", ""],
+                "Away": ["BOS", "KCA", "TBA", "LAN", "NYA"],
+                "HomeRuns": [5, 2, None, 4, 1],
+                "AwayRuns": [3, "7", 1, 2, 0],
+            },
+            dtype=object,
+        )
+        source = PybaseballSource()
+        source.REQUEST_DELAY = 0
+        source._pybaseball = MagicMock()
+        source._pybaseball.retrosheet.season_game_logs.return_value = logs
+
+        games = list(source.load_games_retrosheet(seasons=[2023]))
+
+        assert [
+            (g["game_date"], g["home_team_code"], g["away_team_code"], g["home_score"])
+            for g in games
+        ] == [
+            (date(2023, 4, 1), "NYY", "BOS", 5),
+            (date(2023, 4, 2), "CWS", "KC", 2),
+        ]
+        assert games[0]["external_game_id"] == "NYA202304010"
+        assert games[1]["external_game_id"] == "2023-04-02_KC_CWS"
+        assert games[1]["away_score"] == 7
+        assert games[0]["source"] == "pybaseball:retrosheet"
@@ -0,0 +1,324 @@
+"""
+Unit Tests for Columnar Source Normalization.
+
+Tests the column-wise helpers shared by the DataFrame-backed adapters, and
+checks that the nflverse schedule normalization yields exactly the records
+the previous row-by-row implementation produced.
+
+Usage:
+    pytest tests/unit/database/seeding/test_columnar.py -v
+"""
+
+import random
+from datetime import date, datetime
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from precog.database.seeding.sources.columnar import (
+    GAME_RECORD_FIELDS,
+    as_text,
+    iter_records,
+    map_unique,
+    normalize_codes,
+    optional_int,
+    parse_dates,
+    quantize_decimals,
+    record_frame,
+    sparse_rows,
+    to_dates,
+)
+from precog.database.seeding.sources.sports.nfl_data_py_adapter import (
+    NFLDataPySource,
+    normalize_nfl_team_code,
+)
+from precog.database.seeding.sources.sports.nflreadpy_adapter import (
+    NFLReadPySource,
+    normalize_nflreadpy_team_code,
+)
+
+# =============================================================================
+# Column Helper Tests
+# =============================================================================
+
+
+class TestColumnHelpers:
+    """Test the per-column conversions."""
+
+    def test_as_text_blanks_missing_values(self) -> None:
+        """None/NaN become "" rather than "None"/"nan"."""
+        values = pd.Series(["KC", None, float("nan"), 7], dtype=object)
+        assert as_text(values).tolist() == ["KC", "", "", "7"]
+
+    def test_map_unique_calls_func_once_per_value(self) -> None:
+        """Repeated values are transformed once; missing cells map to None."""
+        calls: list[str] = []
+
+        def upper(value: str) -> str:
+            calls.append(value)
+            return value.upper()
+
+        result = map_unique(pd.Series(["a", "b", "a", None, "a"]), upper)
+
+        assert result.tolist() == ["A", "B", "A", None, "A"]
+        assert calls == ["a", "b"]
+
+    def test_normalize_codes(self) -> None:
+        """Team codes are normalized with the adapter's mapping."""
+        codes = pd.Series(["LA", "jac", " KC ", None])
+        assert normalize_codes(codes, normalize_nfl_team_code).tolist() == [
+            "LAR",
+            "JAX",
+            "KC",
+            "",
+        ]
+
+    def test_parse_dates_tries_formats_in_order(self) -> None:
+        """Each format is applied to the rows still unparsed; datetimes pass through."""
+        values = pd.Series(
+            ["2023-09-07", "09/10/2023", datetime(2023, 9, 11, 13), "Sunday, Apr 2", None],
+            dtype=object,
+        )
+
+        parsed = parse_dates(values, ("%Y-%m-%d", "%m/%d/%Y"))
+
+        assert to_dates(parsed).tolist() == [
+            date(2023, 9, 7),
+            date(2023, 9, 10),
+            date(2023, 9, 11),
+            None,
+            None,
+        ]
+
+    def test_optional_int(self) -> None:
+        """Numbers become Python ints; missing and non-numeric cells become None."""
+        values = pd.Series([21.0, None, "17", "x"], dtype=object)
+        result = optional_int(values).tolist()
+
+        assert result == [21, None, 17, None]
+        assert type(result[0]) is int
+
+    def test_quantize_decimals_matches_str_round_trip(self) -> None:
+        """Quantization matches Decimal(str(value)).quantize(ROUND_HALF_UP)."""
+        rng = random.Random(7)
+        floats = [rng.uniform(-1, 1) for _ in range(500)] + [0.00005, 0.12345, 1e-7, 2.5]
+        expected = [
+            Decimal(str(v)).quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP) for v in floats
+        ]
+
+        assert quantize_decimals(pd.Series(floats)).tolist() == expected
+
+    def test_quantize_decimals_missing_and_invalid(self) -> None:
+        """None, NaN and non-numeric text become None."""
+        values = pd.Series([None, float("nan"), "abc", "0.5"], dtype=object)
+        assert quantize_decimals(values, "0.01").tolist() == [None, None, None, Decimal("0.50")]
+
+    def test_sparse_rows_skips_missing_and_numeric_zero(self) -> None:
+        """Only present, non-zero values are kept, as Python scalars in field order."""
+        frame = pd.DataFrame(
+            {"yards": [0, 120, 35], "tds": [1.0, None, 0.0], "note": ["0", "", None]}
+        )
+
+        rows = sparse_rows(frame, ["tds", "yards", "note", "absent"])
+
+        assert rows == [{"tds": 1.0, "note": "0"}, {"yards": 120, "note": ""}, {"yards": 35}]
+        assert type(rows[1]["yards"]) is int
+
+
+# =============================================================================
+# Row Emission Tests
+# =============================================================================
+
+
+class TestRowEmission:
+    """Test record emission."""
+
+    def test_record_frame_orders_and_broadcasts(self) -> None:
+        """Columns follow the field order and scalars fill every row."""
+        index = pd.RangeIndex(2)
+        frame = record_frame(("b", "a"), index, a=pd.Series([1, 2], index=index), b="x")
+
+        assert list(frame.columns) == ["b", "a"]
+        assert list(iter_records(frame, ("b", "a"))) == [{"b": "x", "a": 1}, {"b": "x", "a": 2}]
+
+    def test_record_frame_requires_every_field(self) -> None:
+        """A missing column is an error rather than a silent None."""
+        with pytest.raises(ValueError, match="Missing record columns"):
+            record_frame(("a", "b"), pd.RangeIndex(1), a=1)
+
+    def test_iter_records_yields_python_values(self) -> None:
+        """Records carry plain Python types, not numpy scalars."""
+        frame = pd.DataFrame({"n": [1, 2], "flag": [True, False]})
+
+        records = list(iter_records(frame, ("n", "flag")))
+
+        assert records == [{"n": 1, "flag": True}, {"n": 2, "flag": False}]
+        assert type(records[0]["n"]) is int
+        assert type(records[0]["flag"]) is bool
+
+
+# =============================================================================
+# NFL Schedule Parity Tests
+# =============================================================================
+
+
+def _legacy_nfl_games(
+    rows: list[dict[str, Any]], normalize: Any, source: str
+) -> list[dict[str, Any]]:
+    """Row-by-row schedule conversion as the adapters did it before columnar normalization."""
+    game_types = {
+        "REG": "regular",
+        "WC": "wildcard",
+        "DIV": "divisional",
+        "CON": "conference",
+        "SB": "superbowl",
+    }
+    games = []
+    for row in rows:
+        home_score, away_score = row.get("home_score"), row.get("away_score")
+        if home_score is None or away_score is None:
+            continue
+        game_date_val = row.get("gameday")
+        if game_date_val is None:
+            continue
+        if hasattr(game_date_val, "date"):
+            game_date = game_date_val.date()
+        elif isinstance(game_date_val, str):
+            try:
+                game_date = datetime.strptime(game_date_val, "%Y-%m-%d").date()  # noqa: DTZ007
+            except ValueError:
+                continue
+        else:
+            continue
+        home_team = normalize(str(row.get("home_team", "")))
+        away_team = normalize(str(row.get("away_team", "")))
+        if not home_team or not away_team:
+            continue
+        game_type_raw = str(row.get("game_type", "")).upper()
+        games.append(
+            {
+                "sport": "nfl",
+                "season": int(row.get("season", 0)),
+                "game_date": game_date,
+                "home_team_code": home_team,
+                "away_team_code": away_team,
+                "home_score": int(home_score),
+                "away_score": int(away_score),
+                "is_neutral_site": str(row.get("location", "")).upper() == "NEUTRAL",
+                "is_playoff": game_type_raw not in ("REG", ""),
+                "game_type": game_types.get(game_type_raw, "playoff" if game_type_raw else None),
+                "venue_name": str(row.get("stadium", "")) or None,
+                "source": source,
+                "source_file": None,
+                "external_game_id": str(row.get("game_id", "")) or None,
+            }
+        )
+    return games
+
+
+def _schedule_rows(count: int, seed: int = 0) -> list[dict[str, Any]]:
+    """Synthetic nflverse schedule rows, including unplayed games and bad dates."""
+    rng = random.Random(seed)
+    teams = ["KC", "DET", "LA", "JAC", "OAK", "SD", "STL", "BUF", "SF", "NE"]
+    rows = []
+    for i in range(count):
+        home, away = rng.sample(teams, 2)
+        played = rng.random() > 0.15
+        rows.append(
+            {
+                "game_id": f"2023_{i:04d}_{away}_{home}",
+                "season": rng.choice([2022, 2023]),
+                "week": rng.randint(1, 22),
+                "gameday": rng.choice(
+                    [f"2023-{rng.randint(9, 12):02d}-{rng.randint(1, 28):02d}", "2023-9-7", "TBD"]
+                ),
+                "home_team": rng.choice([home, home.lower()]),
+                "away_team": away,
+                "home_score": rng.randint(0, 50) if played else None,
+                "away_score": rng.randint(0, 50) if played else None,
+                "game_type": rng.choice(["REG", "REG", "WC", "DIV", "CON", "SB", "reg", "POST"]),
+                "location": rng.choice(["Home", "Neutral", "NEUTRAL"]),
+                "stadium": rng.choice(["Ford Field", "Arrowhead Stadium", ""]),
+            }
+        )
+    return rows
+
+
+class TestNFLScheduleParity:
+    """Columnar schedule normalization reproduces the row-by-row records."""
+
+    def test_nflreadpy_load_games_parity(self) -> None:
+        """NFLReadPySource.load_games matches the previous to_dicts() loop."""
+        rows = _schedule_rows(400)
+        polars_frame = MagicMock()
+        polars_frame.to_dict.return_value = {key: [row[key] for row in rows] for key in rows[0]}
+        source = NFLReadPySource()
+        source._nfl = MagicMock()
+        source._nfl.load_schedules.return_value = polars_frame
+
+        games = list(source.load_games(seasons=[2022, 2023]))
+
+        expected = _legacy_nfl_games(rows, normalize_nflreadpy_team_code, "nflreadpy")
+        assert games == expected
+        assert len(games) > 100
+
+    def test_nfl_data_py_load_games_parity(self) -> None:
+        """NFLDataPySource.load_games matches the previous iterrows() loop."""
+        rows = _schedule_rows(400, seed=1)
+        schedules = pd.DataFrame(rows, dtype=object)
+        source = NFLDataPySource()
+        source._nfl = MagicMock()
+        source._nfl.import_schedules.return_value = schedules
+
+        games = list(source.load_games(seasons=[2022, 2023]))
+
+        expected = _legacy_nfl_games(
+            [row.to_dict() for _, row in schedules.iterrows()],
+            normalize_nfl_team_code,
+            "nfl_data_py",
+        )
+        assert games == expected
+
+    def test_numeric_score_columns_skip_unplayed_games(self) -> None:
+        """NaN scores in a float column mark unplayed games (and are not cast to int)."""
+        schedules = pd.DataFrame(
+            {
+                "game_id": ["a", "b"],
+                "season": [2023, 2023],
+                "gameday": ["2023-09-07", "2024-01-07"],
+                "home_team": ["DET", "DEN"],
+                "away_team": ["KC", "KC"],
+                "home_score": [21.0, None],
+                "away_score": [20.0, None],
+                "game_type": ["REG", "REG"],
+            }
+        )
+        source = NFLDataPySource()
+        source._nfl = MagicMock()
+        source._nfl.import_schedules.return_value = schedules
+
+        games = list(source.load_games(seasons=[2023]))
+
+        assert [g["external_game_id"] for g in games] == ["a"]
+        assert games[0]["home_score"] == 21
+        assert type(games[0]["home_score"]) is int
+        assert games[0]["venue_name"] is None
+        assert games[0]["is_neutral_site"] is False
+
+    def test_columns_follow_game_record_fields(self) -> None:
+        """The normalized frame has GAME_RECORD_FIELDS columns, in order."""
+        from precog.database.seeding.sources.columnar import normalize_nfl_schedules
+
+        rows = _schedule_rows(50, seed=2)
+        games = normalize_nfl_schedules(
+            pd.DataFrame(rows, dtype=object),
+            normalize_team=normalize_nflreadpy_team_code,
+            source="nflreadpy",
+        )
+
+        assert tuple(games.columns) == GAME_RECORD_FIELDS
+        expected = _legacy_nfl_games(rows, normalize_nflreadpy_team_code, "nflreadpy")
+        assert list(iter_records(games, GAME_RECORD_FIELDS)) == expected
@@ -17,16 +17,33 @@ Usage:
     pytest tests/unit/database/seeding/test_historical_games_loader.py -v
 """
 
+import json
 import tempfile
-from datetime import date
+import threading
+from datetime import date, datetime
 from pathlib import Path
+from unittest.mock import patch
 
+import pytest
+
+from precog.api_connectors.espn_client import RateLimitExceeded
+from precog.database.seeding import historical_games_loader as loader
 from precog.database.seeding.batch_result import BatchInsertResult, ErrorHandlingMode
 from precog.database.seeding.historical_games_loader import (
     HistoricalGameRecord,
     LoadResult,
+    espn_season_for_date,
+    fetch_espn_dates,
+    get_cache_stats,
+    get_espn_cache_path,
+    is_date_cached,
+    list_cached_dates,
+    load_espn_cache,
+    load_espn_historical_games,
+    pack_legacy_espn_cache,
     parse_fivethirtyeight_games_csv,
     parse_simple_games_csv,
+    save_espn_cache,
 )
 
 # =============================================================================
@@ -217,3 +234,184 @@ class TestHistoricalGameRecord:
         assert record["season"] == 2023
         assert record["home_team_code"] == "KC"
         assert record["home_score"] == 21
+
+
+# =============================================================================
+# ESPN Packed Cache and Backfill Tests
+# =============================================================================
+
+
+def _final_game(game_date: date, event_id: str) -> dict:
+    """Minimal ESPNGameFull-shaped dict for a completed game."""
+    return {
+        "metadata": {
+            "espn_event_id": event_id,
+            "game_date": f"{game_date.isoformat()}T20:00Z",
+            "home_team": {"team_code": "KC"},
+            "away_team": {"team_code": "DET"},
+            "season_type": "regular",
+        },
+        "state": {"game_status": "final", "home_score": 21, "away_score": 20},
+    }
+
+
+class FakeESPNClient:
+    """Thread-safe stand-in for ESPNClient.get_scoreboard."""
+
+    def __init__(self, fail_dates=(), rate_limited_once=()):
+        self.calls: list[date] = []
+        self._fail_dates = set(fail_dates)
+        self._rate_limited = set(rate_limited_once)
+        self._lock = threading.Lock()
+
+    def get_scoreboard(self, league: str, when: datetime) -> list[dict]:
+        game_date = when.date()
+        with self._lock:
+            self.calls.append(game_date)
+            if game_date in self._rate_limited:
+                self._rate_limited.discard(game_date)
+                raise RateLimitExceeded("bucket empty")
+        if game_date in self._fail_dates:
+            raise ConnectionError("ESPN unavailable")
+        return [_final_game(game_date, f"evt-{game_date.isoformat()}")]
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def espn_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the ESPN cache at a temporary directory."""
+    cache_dir = tmp_path / "espn"
+    monkeypatch.setattr(loader, "ESPN_CACHE_DIR", cache_dir)
+    return cache_dir
+
+
+class TestESPNPackedCache:
+    """Test season packs, legacy fallback and index-based statistics."""
+
+    def test_season_for_date(self) -> None:
+        """Split-year sports file Jan-Jun dates under the previous season."""
+        assert espn_season_for_date("nfl", date(2024, 2, 11)) == 2023
+        assert espn_season_for_date("nfl", date(2023, 9, 7)) == 2023
+        assert espn_season_for_date("mlb", date(2024, 4, 1)) == 2024
+
+    def test_save_and_load_use_season_pack(self, espn_cache_dir: Path) -> None:
+        """Dates of one season share a single pack file."""
+        games = [_final_game(date(2023, 9, 7), "1")]
+        save_espn_cache("nfl", date(2023, 9, 7), games)
+        save_espn_cache("nfl", date(2024, 1, 7), [])
+
+        assert is_date_cached("nfl", date(2023, 9, 7))
+        assert is_date_cached("nfl", date(2024, 1, 7))
+        assert not is_date_cached("nfl", date(2023, 9, 8))
+        assert load_espn_cache("nfl", date(2023, 9, 7)) == games
+        assert load_espn_cache("nfl", date(2024, 1, 7)) == []
+        assert [p.name for p in (espn_cache_dir / "nfl").iterdir() if p.suffix == ".pack"] == [
+            "2023.pack"
+        ]
+
+    def test_legacy_files_are_read_and_packed(self, espn_cache_dir: Path) -> None:
+        """Legacy per-date JSON files load, then fold into packs."""
+        game_date = date(2023, 9, 10)
+        games = [_final_game(game_date, "legacy")]
+        legacy_path = get_espn_cache_path("nfl", game_date)
+        legacy_path.parent.mkdir(parents=True)
+        legacy_path.write_text(json.dumps({"games": games}))
+
+        assert load_espn_cache("nfl", game_date) == games
+        assert pack_legacy_espn_cache("nfl") == 1
+        assert not legacy_path.exists()
+        assert load_espn_cache("nfl", game_date) == games
+
+    def test_season_pack_opened_once(self, espn_cache_dir: Path) -> None:
+        """Packing a season's legacy files reads its index once, not once per date."""
+        for day in (7, 10, 14):
+            game_date = date(2023, 9, day)
+            legacy_path = get_espn_cache_path("nfl", game_date)
+            legacy_path.parent.mkdir(parents=True, exist_ok=True)
+            legacy_path.write_text(json.dumps({"games": [_final_game(game_date, str(day))]}))
+
+        with patch.object(loader, "open_espn_pack", wraps=loader.open_espn_pack) as open_pack:
+            assert pack_legacy_espn_cache("nfl") == 3
+        open_pack.assert_called_once_with("nfl", 2023)
+
+    def test_stats_and_dates_come_from_index(self, espn_cache_dir: Path) -> None:
+        """list_cached_dates/get_cache_stats report packed dates and game counts."""
+        save_espn_cache("nfl", date(2023, 9, 7), [_final_game(date(2023, 9, 7), "1")] * 2)
+        save_espn_cache("nfl", date(2024, 9, 5), [_final_game(date(2024, 9, 5), "2")])
+        save_espn_cache("mlb", date(2024, 4, 1), [])
+
+        assert list_cached_dates("nfl") == [date(2023, 9, 7), date(2024, 9, 5)]
+
+        nfl = get_cache_stats("nfl")
+        assert nfl["cached_dates"] == 2
+        assert nfl["total_games"] == 3
+        assert nfl["date_range"] == (date(2023, 9, 7), date(2024, 9, 5))
+        assert nfl["by_sport"]["nfl"]["seasons"] == 2
+
+        overall = get_cache_stats()
+        assert overall["cached_dates"] == 3
+        assert sorted(overall["by_sport"]) == ["mlb", "nfl"]
+
+    def test_stats_for_empty_cache(self, espn_cache_dir: Path) -> None:
+        """No cache directory yields zero totals."""
+        stats = get_cache_stats()
+
+        assert stats["cached_dates"] == 0
+        assert stats["by_sport"] == {}
+        assert stats["date_range"] is None
+
+
+class TestESPNBackfill:
+    """Test the concurrent, checkpointed ESPN fetcher."""
+
+    def test_fetches_concurrently_and_checkpoints(self, espn_cache_dir: Path) -> None:
+        """Every fetched date lands in its season index; rate limits are retried."""
+        dates = loader.generate_date_range(date(2023, 9, 1), date(2023, 9, 10))
+        client = FakeESPNClient(rate_limited_once={date(2023, 9, 3)})
+
+        results = dict(
+            fetch_espn_dates("nfl", dates, max_workers=4, rate_limit_wait=0, client=client)
+        )
+
+        assert sorted(results) == dates
+        assert len(client.calls) == len(dates) + 1
+        assert list_cached_dates("nfl") == dates
+
+    def test_failed_dates_stay_uncached(self, espn_cache_dir: Path) -> None:
+        """A failed fetch yields None and is not checkpointed."""
+        dates = [date(2023, 9, 1), date(2023, 9, 2)]
+        client = FakeESPNClient(fail_dates={date(2023, 9, 2)})
+
+        results = dict(fetch_espn_dates("nfl", dates, max_workers=2, client=client))
+
+        assert results[date(2023, 9, 2)] is None
+        assert list_cached_dates("nfl") == [date(2023, 9, 1)]
+
+    def test_rejects_invalid_worker_count(self) -> None:
+        """max_workers must be positive."""
+        with pytest.raises(ValueError):
+            list(fetch_espn_dates("nfl", [date(2023, 9, 1)], max_workers=0))
+
+    def test_rerun_resumes_from_checkpoint(self, espn_cache_dir: Path) -> None:
+        """A second run fetches only the dates the first run did not finish."""
+        start, end = date(2023, 9, 1), date(2023, 9, 6)
+        first = FakeESPNClient(fail_dates={date(2023, 9, 4), date(2023, 9, 5)})
+        second = FakeESPNClient()
+
+        with (
+            patch(
+                "precog.api_connectors.espn_client.ESPNClient",
+                side_effect=[first, second],
+            ),
+            patch.object(
+                loader, "bulk_insert_historical_games", return_value=BatchInsertResult()
+            ) as bulk_insert,
+        ):
+            load_espn_historical_games("nfl", start, end, show_progress=False)
+            load_espn_historical_games("nfl", start, end, show_progress=False)
+
+        assert sorted(second.calls) == [date(2023, 9, 4), date(2023, 9, 5)]
+        records = list(bulk_insert.call_args.args[0])
+        assert [r["game_date"] for r in records] == loader.generate_date_range(start, end)
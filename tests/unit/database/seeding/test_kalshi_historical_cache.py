@@ -6,14 +6,26 @@ for markets, series, and positions.
 Reference: Phase 2C - Kalshi caching for TimescaleDB migration
 """
 
+import json
 from datetime import date
 from decimal import Decimal
+from pathlib import Path
 
+import pytest
+
+from precog.database.seeding import kalshi_historical_cache as cache
 from precog.database.seeding.kalshi_historical_cache import (
     DecimalEncoder,
     decimal_decoder,
     get_cache_path,
+    get_kalshi_cache_stats,
+    get_legacy_cache_path,
     is_cached,
+    iter_cached_market_range,
+    iter_cached_markets,
+    list_cached_dates,
+    load_from_cache,
+    save_to_cache,
 )
 
 
@@ -71,3 +83,97 @@ class TestCachePath:
         """Verify is_cached returns boolean."""
         result = is_cached("markets", date(2020, 1, 1))
         assert isinstance(result, bool)
+
+
+def _market(series: str, n: int, price: str = "0.4975") -> dict:
+    """Market record shaped like ProcessedMarketData."""
+    return {
+        "ticker": f"{series}-24DEC25-T{n}",
+        "event_ticker": f"{series}-24DEC25",
+        "series_ticker": series,
+        "status": "open",
+        "yes_ask_dollars": Decimal(price),
+        "no_ask_dollars": Decimal("1") - Decimal(price),
+        "volume": n,
+        "yes_sub_title": "100",
+    }
+
+
+@pytest.fixture
+def kalshi_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point every Kalshi cache directory at a temporary directory."""
+    root = tmp_path / "kalshi"
+    monkeypatch.setattr(cache, "KALSHI_CACHE_DIR", root)
+    for name in ("markets", "series", "positions", "orders"):
+        monkeypatch.setattr(cache, f"{name.upper()}_CACHE_DIR", root / name)
+    return root
+
+
+class TestPackedKalshiCache:
+    """Tests for the compressed, series-indexed cache and its streaming readers."""
+
+    def test_round_trip_preserves_decimal_types(self, kalshi_cache_dir: Path) -> None:
+        """Decimal fields come back as equal Decimals; other strings stay strings."""
+        markets = [_market("KXNFLGAME", 1, "0.1234"), _market("KXNBAGAME", 2)]
+        save_to_cache("markets", date(2024, 12, 25), markets)
+
+        loaded = load_from_cache("markets", date(2024, 12, 25))
+
+        assert sorted(loaded, key=lambda m: m["ticker"]) == sorted(
+            markets, key=lambda m: m["ticker"]
+        )
+        assert all(isinstance(m["yes_ask_dollars"], Decimal) for m in loaded)
+        assert all(isinstance(m["yes_sub_title"], str) for m in loaded)
+
+    def test_iter_by_series_and_ticker(self, kalshi_cache_dir: Path) -> None:
+        """Streaming readers select blocks by series and filter by ticker."""
+        markets = [_market("KXNFLGAME", n) for n in range(3)] + [_market("KXNBAGAME", 9)]
+        save_to_cache("markets", date(2024, 12, 25), markets)
+
+        nfl = list(iter_cached_markets(date(2024, 12, 25), series="KXNFLGAME"))
+        one = list(iter_cached_markets(date(2024, 12, 25), tickers=["KXNBAGAME-24DEC25-T9"]))
+
+        assert [m["ticker"] for m in nfl] == [m["ticker"] for m in markets[:3]]
+        assert [m["ticker"] for m in one] == ["KXNBAGAME-24DEC25-T9"]
+        assert list(iter_cached_markets(date(2024, 12, 26))) == []
+
+    def test_range_read_across_dates(self, kalshi_cache_dir: Path) -> None:
+        """Range reads yield (date, market) pairs in date order, skipping gaps."""
+        for day in (1, 2, 4):
+            save_to_cache("markets", date(2024, 12, day), [_market("KXNFLGAME", day)])
+
+        rows = list(iter_cached_market_range(date(2024, 12, 2), date(2024, 12, 4)))
+
+        assert [(d.day, m["volume"]) for d, m in rows] == [(2, 2), (4, 4)]
+
+    def test_resave_replaces_day(self, kalshi_cache_dir: Path) -> None:
+        """Saving a date again (force refresh) replaces its records."""
+        save_to_cache("markets", date(2024, 12, 25), [_market("KXNFLGAME", 1)])
+        save_to_cache("markets", date(2024, 12, 25), [_market("KXNFLGAME", 2)])
+
+        assert [m["volume"] for m in load_from_cache("markets", date(2024, 12, 25))] == [2]
+
+    def test_legacy_json_still_loads(self, kalshi_cache_dir: Path) -> None:
+        """Legacy single-document files are read through the same readers."""
+        legacy_path = get_legacy_cache_path("markets", date(2024, 1, 2))
+        legacy_path.parent.mkdir(parents=True)
+        legacy_path.write_text(
+            json.dumps({"count": 1, "data": [_market("KXNFLGAME", 1)]}, cls=DecimalEncoder)
+        )
+
+        assert is_cached("markets", date(2024, 1, 2))
+        assert [m["ticker"] for m in iter_cached_markets(date(2024, 1, 2))] == [
+            "KXNFLGAME-24DEC25-T1"
+        ]
+
+    def test_stats_and_dates_read_indexes(self, kalshi_cache_dir: Path) -> None:
+        """Record counts and dates come from the pack indexes."""
+        save_to_cache("markets", date(2024, 12, 25), [_market("A", 1), _market("B", 2)])
+        save_to_cache("series", date(2024, 12, 26), [{"ticker": "A"}])
+
+        stats = get_kalshi_cache_stats()
+
+        assert list_cached_dates("markets") == [date(2024, 12, 25)]
+        assert stats["by_type"]["markets"]["total_records"] == 2
+        assert stats["total_records"] == 3
+        assert stats["date_range"] == (date(2024, 12, 25), date(2024, 12, 26))
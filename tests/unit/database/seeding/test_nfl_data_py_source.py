@@ -19,8 +19,12 @@ Usage:
     pytest tests/unit/database/seeding/test_nfl_data_py_source.py -v
 """
 
+import random
+from datetime import date
+from typing import Any
 from unittest.mock import MagicMock, patch
 
+import pandas as pd
 import pytest
 
 from precog.database.seeding.sources.base_source import (
@@ -237,3 +241,173 @@ class TestNFLDataPySourceLazyLoading:
 
         # Should only be called once due to caching
         mock_get_nfl.assert_called_once()
+
+
+def _legacy_extract_stats(row: Any, stat_fields: list[str]) -> dict[str, Any]:
+    """Per-row stat extraction as NFLDataPySource did it before columnar normalization."""
+    stats: dict[str, Any] = {}
+    for field in stat_fields:
+        value = row.get(field)
+        if value is None or pd.isna(value):
+            continue
+        if isinstance(value, (int, float)) and value == 0:
+            continue
+        stats[field] = value.item() if hasattr(value, "item") else value
+    return stats
+
+
+def _legacy_player_stats(
+    df: pd.DataFrame, *, weekly: bool, include_postseason: bool = True
+) -> list[dict[str, Any]]:
+    """Row-by-row (iterrows) player stats conversion, for parity checks."""
+    from precog.database.seeding.sources import NFLDataPySource
+
+    records = []
+    for _, row in df.iterrows():
+        week = int(row.get("week", 0)) if weekly else None
+        if weekly and not include_postseason and week > 17:
+            continue
+        player_id = str(row.get("player_id", "")) or None
+        player_name = str(row.get("player_name", "")) or None
+        if not player_id and not player_name:
+            continue
+        for category, fields in [
+            ("passing", NFLDataPySource.PASSING_STATS),
+            ("rushing", NFLDataPySource.RUSHING_STATS),
+            ("receiving", NFLDataPySource.RECEIVING_STATS),
+        ]:
+            stats = _legacy_extract_stats(row, fields)
+            if stats:
+                records.append(
+                    {
+                        "sport": "nfl",
+                        "season": int(row.get("season", 0)),
+                        "week": week,
+                        "team_code": str(row.get("recent_team", "")) or None,
+                        "player_id": player_id,
+                        "player_name": player_name,
+                        "stat_category": category,
+                        "stats": stats,
+                        "source": "nfl_data_py",
+                        "source_file": None,
+                    }
+                )
+    return records
+
+
+def _player_stats_frame(count: int, seed: int = 0) -> pd.DataFrame:
+    """Synthetic weekly player stats with sparse, zero and missing values."""
+    rng = random.Random(seed)
+    numeric = ["completions", "passing_yards", "passer_rating", "carries", "rushing_yards"]
+    numeric += ["targets", "receptions", "receiving_yards", "target_share"]
+    rows = []
+    for i in range(count):
+        anonymous = rng.random() < 0.05
+        row: dict[str, Any] = {
+            "player_id": "" if anonymous else f"00-{i:07d}",
+            "player_name": "" if anonymous else f"Player {i}",
+            "recent_team": rng.choice(["KC", "BUF", "SF", ""]),
+            "season": 2023,
+            "week": rng.randint(1, 22),
+        }
+        for field in numeric:
+            roll = rng.random()
+            row[field] = None if roll < 0.3 else 0 if roll < 0.5 else rng.randint(1, 300)
+        row["passer_rating"] = None if row["passer_rating"] is None else row["passer_rating"] / 3
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+class TestNFLDataPySourceColumnarParity:
+    """Columnar normalization yields the same records as the previous iterrows() loops."""
+
+    @pytest.mark.parametrize("include_postseason", [True, False])
+    def test_weekly_stats_parity(self, include_postseason: bool) -> None:
+        """Weekly stats match row-by-row extraction, including the postseason filter."""
+        from precog.database.seeding.sources import NFLDataPySource
+
+        df = _player_stats_frame(300)
+        source = NFLDataPySource()
+        source._nfl = MagicMock()
+        source._nfl.import_weekly_data.return_value = df
+
+        records = list(
+            source.load_stats(
+                seasons=[2023], stat_type="weekly", include_postseason=include_postseason
+            )
+        )
+
+        assert records == _legacy_player_stats(
+            df, weekly=True, include_postseason=include_postseason
+        )
+        assert records
+        assert all(type(r["week"]) is int for r in records)
+
+    def test_seasonal_stats_parity(self) -> None:
+        """Seasonal stats match row-by-row extraction with week None."""
+        from precog.database.seeding.sources import NFLDataPySource
+
+        df = _player_stats_frame(200, seed=3).drop(columns=["week"])
+        source = NFLDataPySource()
+        source._nfl = MagicMock()
+        source._nfl.import_seasonal_data.return_value = df
+
+        records = list(source.load_stats(seasons=[2023], stat_type="seasonal"))
+
+        assert records == _legacy_player_stats(df, weekly=False)
+        assert all(r["week"] is None for r in records)
+
+    def test_load_games_parity(self) -> None:
+        """Schedules (with unplayed games) match the previous iterrows() conversion."""
+        from precog.database.seeding.sources import NFLDataPySource
+
+        schedules = pd.DataFrame(
+            {
+                "game_id": ["2023_01_DET_KC", "2023_18_KC_DEN", "2023_SB", "bad"],
+                "season": [2023, 2023, 2023, 2023],
+                "gameday": ["2023-09-07", "2024-01-07", "2024-02-11", "not a date"],
+                "home_team": ["KC", "DEN", "SF", "NE"],
+                "away_team": ["DET", "KC", "KC", "NYJ"],
+                "home_score": [20, None, 22, 3],
+                "away_score": [21, None, 25, 7],
+                "game_type": ["REG", "REG", "POST", "REG"],
+                "stadium": ["Arrowhead", "Empower Field", "Allegiant", ""],
+            },
+            dtype=object,
+        )
+        source = NFLDataPySource()
+        source._nfl = MagicMock()
+        source._nfl.import_schedules.return_value = schedules
+
+        games = list(source.load_games(seasons=[2023]))
+
+        expected = []
+        for _, row in schedules.iterrows():
+            try:
+                game_date = date.fromisoformat(str(row.get("gameday")))
+            except ValueError:
+                continue
+            expected.append(
+                {
+                    "sport": "nfl",
+                    "season": int(row.get("season", 0)),
+                    "game_date": game_date,
+                    "home_team_code": str(row.get("home_team", "")),
+                    "away_team_code": str(row.get("away_team", "")),
+                    "home_score": int(row["home_score"])
+                    if row.get("home_score") is not None
+                    else None,
+                    "away_score": int(row["away_score"])
+                    if row.get("away_score") is not None
+                    else None,
+                    "is_neutral_site": False,
+                    "is_playoff": str(row.get("game_type", "")).lower() in ("post", "playoff"),
+                    "game_type": str(row.get("game_type", "REG")),
+                    "venue_name": str(row.get("stadium", "")) or None,
+                    "source": "nfl_data_py",
+                    "source_file": None,
+                    "external_game_id": str(row.get("game_id", "")) or None,
+                }
+            )
+        assert games == expected
+        assert [g["home_score"] for g in games] == [20, None, 22]
@@ -23,7 +23,10 @@ Note:
     to run without the optional dependency installed.
 """
 
+import random
+import sys
 from decimal import Decimal
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -186,6 +189,13 @@ class TestNFLReadPySource:
 # =============================================================================
 
 
+def _polars_frame(rows: list[dict[str, Any]]) -> MagicMock:
+    """Mock a Polars DataFrame whose to_dict(as_series=False) returns rows as columns."""
+    frame = MagicMock()
+    frame.to_dict.return_value = {key: [row.get(key) for row in rows] for key in rows[0]}
+    return frame
+
+
 class TestLoadGames:
     """Test suite for load_games method with mocked nflreadpy."""
 
@@ -194,36 +204,37 @@ class TestLoadGames:
         """Create a mock nflreadpy module."""
         mock_nfl = MagicMock()
 
-        # Create a mock Polars DataFrame with to_dicts method
-        mock_df = MagicMock()
-        mock_df.to_dicts.return_value = [
-            {
-                "game_id": "2023_01_KC_DET",
-                "season": 2023,
-                "week": 1,
-                "gameday": "2023-09-07",
-                "home_team": "DET",
-                "away_team": "KC",
-                "home_score": 21,
-                "away_score": 20,
-                "game_type": "REG",
-                "location": "Home",
-                "stadium": "Ford Field",
-            },
-            {
-                "game_id": "2023_01_PHI_NE",
-                "season": 2023,
-                "week": 1,
-                "gameday": "2023-09-10",
-                "home_team": "NE",
-                "away_team": "PHI",
-                "home_score": 17,
-                "away_score": 25,
-                "game_type": "REG",
-                "location": "Home",
-                "stadium": "Gillette Stadium",
-            },
-        ]
+        # Create a mock Polars DataFrame (converted column-wise via to_dict)
+        mock_df = _polars_frame(
+            [
+                {
+                    "game_id": "2023_01_KC_DET",
+                    "season": 2023,
+                    "week": 1,
+                    "gameday": "2023-09-07",
+                    "home_team": "DET",
+                    "away_team": "KC",
+                    "home_score": 21,
+                    "away_score": 20,
+                    "game_type": "REG",
+                    "location": "Home",
+                    "stadium": "Ford Field",
+                },
+                {
+                    "game_id": "2023_01_PHI_NE",
+                    "season": 2023,
+                    "week": 1,
+                    "gameday": "2023-09-10",
+                    "home_team": "NE",
+                    "away_team": "PHI",
+                    "home_score": 17,
+                    "away_score": 25,
+                    "game_type": "REG",
+                    "location": "Home",
+                    "stadium": "Gillette Stadium",
+                },
+            ]
+        )
 
         mock_nfl.load_schedules.return_value = mock_df
         return mock_nfl
@@ -246,22 +257,23 @@ class TestLoadGames:
 
     def test_load_games_normalizes_team_codes(self, mock_nflreadpy: MagicMock) -> None:
         """Verify team codes are normalized."""
-        mock_df = MagicMock()
-        mock_df.to_dicts.return_value = [
-            {
-                "game_id": "2023_01_JAC_LA",
-                "season": 2023,
-                "week": 1,
-                "gameday": "2023-09-10",
-                "home_team": "LA",  # Should become LAR
-                "away_team": "JAC",  # Should become JAX
-                "home_score": 24,
-                "away_score": 21,
-                "game_type": "REG",
-                "location": "Home",
-                "stadium": "SoFi Stadium",
-            },
-        ]
+        mock_df = _polars_frame(
+            [
+                {
+                    "game_id": "2023_01_JAC_LA",
+                    "season": 2023,
+                    "week": 1,
+                    "gameday": "2023-09-10",
+                    "home_team": "LA",  # Should become LAR
+                    "away_team": "JAC",  # Should become JAX
+                    "home_score": 24,
+                    "away_score": 21,
+                    "game_type": "REG",
+                    "location": "Home",
+                    "stadium": "SoFi Stadium",
+                },
+            ]
+        )
         mock_nflreadpy.load_schedules.return_value = mock_df
 
         source = NFLReadPySource()
@@ -275,22 +287,23 @@ class TestLoadGames:
 
     def test_load_games_skips_incomplete_games(self, mock_nflreadpy: MagicMock) -> None:
         """Verify games without scores are skipped."""
-        mock_df = MagicMock()
-        mock_df.to_dicts.return_value = [
-            {
-                "game_id": "2023_18_KC_DEN",
-                "season": 2023,
-                "week": 18,
-                "gameday": "2024-01-07",
-                "home_team": "DEN",
-                "away_team": "KC",
-                "home_score": None,  # Not played yet
-                "away_score": None,
-                "game_type": "REG",
-                "location": "Home",
-                "stadium": "Empower Field",
-            },
-        ]
+        mock_df = _polars_frame(
+            [
+                {
+                    "game_id": "2023_18_KC_DEN",
+                    "season": 2023,
+                    "week": 18,
+                    "gameday": "2024-01-07",
+                    "home_team": "DEN",
+                    "away_team": "KC",
+                    "home_score": None,  # Not played yet
+                    "away_score": None,
+                    "game_type": "REG",
+                    "location": "Home",
+                    "stadium": "Empower Field",
+                },
+            ]
+        )
         mock_nflreadpy.load_schedules.return_value = mock_df
 
         source = NFLReadPySource()
@@ -302,35 +315,36 @@ class TestLoadGames:
 
     def test_load_games_identifies_playoff_games(self, mock_nflreadpy: MagicMock) -> None:
         """Verify playoff game types are correctly identified."""
-        mock_df = MagicMock()
-        mock_df.to_dicts.return_value = [
-            {
-                "game_id": "2023_WC_KC_MIA",
-                "season": 2023,
-                "week": 19,
-                "gameday": "2024-01-13",
-                "home_team": "KC",
-                "away_team": "MIA",
-                "home_score": 26,
-                "away_score": 7,
-                "game_type": "WC",
-                "location": "Home",
-                "stadium": "Arrowhead Stadium",
-            },
-            {
-                "game_id": "2023_SB_KC_SF",
-                "season": 2023,
-                "week": 22,
-                "gameday": "2024-02-11",
-                "home_team": "KC",
-                "away_team": "SF",
-                "home_score": 25,
-                "away_score": 22,
-                "game_type": "SB",
-                "location": "NEUTRAL",
-                "stadium": "Allegiant Stadium",
-            },
-        ]
+        mock_df = _polars_frame(
+            [
+                {
+                    "game_id": "2023_WC_KC_MIA",
+                    "season": 2023,
+                    "week": 19,
+                    "gameday": "2024-01-13",
+                    "home_team": "KC",
+                    "away_team": "MIA",
+                    "home_score": 26,
+                    "away_score": 7,
+                    "game_type": "WC",
+                    "location": "Home",
+                    "stadium": "Arrowhead Stadium",
+                },
+                {
+                    "game_id": "2023_SB_KC_SF",
+                    "season": 2023,
+                    "week": 22,
+                    "gameday": "2024-02-11",
+                    "home_team": "KC",
+                    "away_team": "SF",
+                    "home_score": 25,
+                    "away_score": 22,
+                    "game_type": "SB",
+                    "location": "NEUTRAL",
+                    "stadium": "Allegiant Stadium",
+                },
+            ]
+        )
         mock_nflreadpy.load_schedules.return_value = mock_df
 
         source = NFLReadPySource()
@@ -401,6 +415,107 @@ class TestEPARecord:
         assert record["games_played"] == 17
 
 
+# =============================================================================
+# Load EPA Tests (Mocked)
+# =============================================================================
+
+
+def _legacy_epa_records(rows: list[dict[str, Any]], season: int) -> list[dict[str, Any]]:
+    """Per-row EPA conversion as load_epa did it over to_dicts() before columnar normalization."""
+    records = []
+    for row in rows:
+        team_code = row.get("posteam") or row.get("defteam")
+        if not team_code:
+            continue
+        off_epa = _to_decimal(row.get("off_epa_per_play"))
+        def_epa = _to_decimal(row.get("def_epa_per_play"))
+        week = row.get("week")
+        records.append(
+            {
+                "team_id": None,
+                "team_name": "",
+                "team_code": normalize_nflreadpy_team_code(str(team_code)),
+                "season": season,
+                "week": int(week) if week is not None else None,
+                "off_epa_per_play": off_epa,
+                "pass_epa_per_play": _to_decimal(row.get("pass_epa_per_play")),
+                "rush_epa_per_play": _to_decimal(row.get("rush_epa_per_play")),
+                "def_epa_per_play": def_epa,
+                "def_pass_epa_per_play": _to_decimal(row.get("def_pass_epa_per_play")),
+                "def_rush_epa_per_play": _to_decimal(row.get("def_rush_epa_per_play")),
+                "epa_differential": off_epa - def_epa
+                if off_epa is not None and def_epa is not None
+                else None,
+                "games_played": int(row.get("games_played", 1)),
+                "source": "nflreadpy",
+            }
+        )
+    return records
+
+
+class TestLoadEPA:
+    """Test load_epa normalization with mocked nflreadpy and polars."""
+
+    @pytest.fixture
+    def epa_rows(self) -> list[dict[str, Any]]:
+        """Aggregated team-week rows as the outer join produces them."""
+        rng = random.Random(11)
+        teams = ["KC", "LA", "JAC", "OAK", "SD", "BUF", "SF", "PHI"]
+        rows = []
+        for week in range(1, 19):
+            for team in teams:
+                defense_only = rng.random() < 0.1
+                rows.append(
+                    {
+                        "posteam": None if defense_only else team,
+                        "week": week,
+                        "off_epa_per_play": rng.uniform(-0.5, 0.5),
+                        "pass_epa_per_play": rng.choice([rng.uniform(-1, 1), float("nan")]),
+                        "rush_epa_per_play": rng.choice([rng.uniform(-1, 1), None]),
+                        "games_played": 1,
+                        "defteam": team,
+                        "def_epa_per_play": rng.choice([rng.uniform(-0.5, 0.5), None]),
+                        "def_pass_epa_per_play": rng.uniform(-1, 1),
+                        "def_rush_epa_per_play": rng.uniform(-1, 1),
+                    }
+                )
+        rows.append({**rows[0], "posteam": None, "defteam": None})  # dropped: no team
+        return rows
+
+    def _source(self, rows: list[dict[str, Any]]) -> NFLReadPySource:
+        combined = _polars_frame(rows)
+        pbp = MagicMock()
+        pbp.__len__.return_value = 50_000
+        pbp.filter.return_value.group_by.return_value.agg.return_value.join.return_value = combined
+        source = NFLReadPySource()
+        source._nfl = MagicMock()
+        source._nfl.load_pbp.return_value = pbp
+        return source
+
+    def test_load_epa_parity(self, epa_rows: list[dict[str, Any]]) -> None:
+        """Column-wise quantization reproduces the per-row records exactly."""
+        source = self._source(epa_rows)
+
+        with patch.dict(sys.modules, {"polars": MagicMock()}):
+            records = list(source.load_epa(season=2023))
+
+        assert records == _legacy_epa_records(epa_rows, 2023)
+        assert len(records) == len(epa_rows) - 1
+
+    def test_load_epa_record_values(self, epa_rows: list[dict[str, Any]]) -> None:
+        """Team codes are normalized and EPA values are 4-place Decimals."""
+        source = self._source(epa_rows)
+
+        with patch.dict(sys.modules, {"polars": MagicMock()}):
+            records = list(source.load_epa(season=2023))
+
+        assert {r["team_code"] for r in records} >= {"LAR", "JAX", "LVR", "LAC"}
+        first = records[0]
+        assert first["off_epa_per_play"].as_tuple().exponent == -4
+        assert type(first["week"]) is int
+        assert type(first["games_played"]) is int
+
+
 # =============================================================================
 # Team Code Mapping Completeness Tests
 # =============================================================================
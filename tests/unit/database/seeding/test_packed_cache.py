@@ -0,0 +1,171 @@
+"""
+Unit Tests for Packed Cache Files.
+
+Tests the append-only, zlib-compressed JSON Lines pack format and its index
+(used by the ESPN season caches).
+
+Usage:
+    pytest tests/unit/database/seeding/test_packed_cache.py -v
+"""
+
+import json
+import threading
+from collections.abc import Callable
+from decimal import Decimal
+from hashlib import sha256
+from pathlib import Path
+from typing import Any
+
+from precog.database.seeding.packed_cache import (
+    PackedCache,
+    get_index_path,
+    read_pack_index,
+    write_pack,
+)
+
+
+def _records(n: int) -> list[dict[str, Any]]:
+    return [{"i": i, "payload": sha256(str(i).encode()).hexdigest()} for i in range(n)]
+
+
+def _run_or_deadlock(func: Callable[[], Any]) -> Any:
+    """Run func in a thread; fail instead of hanging the suite if it blocks.
+
+    Callers close the cache only after this returns: close() takes the lock
+    a deadlocked generator would still hold.
+    """
+    result: list[Any] = []
+    worker = threading.Thread(target=lambda: result.append(func()), daemon=True)
+    worker.start()
+    worker.join(timeout=10)
+    assert not worker.is_alive(), "PackedCache call blocked (lock held across a yield?)"
+    return result[0]
+
+
+class TestPackedCache:
+    """Test writing, indexing, streaming and crash recovery."""
+
+    def test_round_trip_and_index(self, tmp_path: Path) -> None:
+        """Blocks read back exactly and the index records their counts."""
+        path = tmp_path / "nfl" / "2023.pack"
+        with PackedCache(path) as pack:
+            pack.write_block("2023-09-07", [{"id": 1}, {"id": 2}], meta={"source": "test"})
+            pack.write_block("2023-09-08", [])
+
+            assert pack.read_block("2023-09-07") == [{"id": 1}, {"id": 2}]
+            assert pack.read_block("2023-09-08") == []
+
+        index = read_pack_index(path)
+        assert sorted(index) == ["2023-09-07", "2023-09-08"]
+        assert index["2023-09-07"].count == 2
+        assert index["2023-09-07"].meta == {"source": "test"}
+
+    def test_reopen_reads_existing_blocks(self, tmp_path: Path) -> None:
+        """A new instance picks up blocks written by an earlier one."""
+        path = tmp_path / "2023.pack"
+        PackedCache(path).write_block("a", [{"x": "y"}])
+
+        pack = PackedCache(path)
+        assert "a" in pack
+        assert pack.keys() == ["a"]
+        assert pack.read_block("a") == [{"x": "y"}]
+
+    def test_rewrite_repoints_index(self, tmp_path: Path) -> None:
+        """Writing an existing key replaces what reads return."""
+        with PackedCache(tmp_path / "2023.pack") as pack:
+            pack.write_block("a", [{"v": 1}])
+            pack.write_block("a", [{"v": 2}])
+
+            assert pack.read_block("a") == [{"v": 2}]
+            assert len(pack) == 1
+
+    def test_streams_large_block(self, tmp_path: Path) -> None:
+        """Blocks larger than one read chunk stream back in order."""
+        records = [{"i": i, "payload": sha256(str(i).encode()).hexdigest()} for i in range(5_000)]
+        with PackedCache(tmp_path / "big.pack", compress_level=1) as pack:
+            pack.write_block("big", records)
+
+            assert pack.get_block("big").length > 64 * 1024
+            assert [r["i"] for r in pack.iter_block("big")] == list(range(5_000))
+
+    def test_unindexed_tail_is_truncated(self, tmp_path: Path) -> None:
+        """Bytes from a write that never reached the index are dropped."""
+        path = tmp_path / "2023.pack"
+        PackedCache(path).write_block("a", [{"v": 1}])
+        with open(path, "ab") as f:
+            f.write(b"partial block from an interrupted run")
+
+        pack = PackedCache(path)
+        pack.write_block("b", [{"v": 2}])
+
+        assert pack.read_block("a") == [{"v": 1}]
+        assert pack.read_block("b") == [{"v": 2}]
+        assert path.stat().st_size == pack.get_block("b").end
+
+    def test_custom_encoder_and_object_hook(self, tmp_path: Path) -> None:
+        """Encoder/object_hook let callers round-trip Decimal values."""
+
+        class DecimalEncoder(json.JSONEncoder):
+            def default(self, o):
+                return str(o) if isinstance(o, Decimal) else super().default(o)
+
+        def hook(dct):
+            return {k: Decimal(v) if k == "price" else v for k, v in dct.items()}
+
+        with PackedCache(tmp_path / "p.pack", encoder=DecimalEncoder, object_hook=hook) as pack:
+            pack.write_block("a", [{"price": Decimal("0.4975")}])
+
+            assert pack.read_block("a") == [{"price": Decimal("0.4975")}]
+
+    def test_missing_or_corrupt_index_reads_empty(self, tmp_path: Path) -> None:
+        """An unreadable index is treated as an empty cache."""
+        path = tmp_path / "2023.pack"
+        assert read_pack_index(path) == {}
+
+        get_index_path(path).write_text("{not json")
+        assert read_pack_index(path) == {}
+
+    def test_write_pack_replaces_existing_pack(self, tmp_path: Path) -> None:
+        """write_pack swaps in a complete new pack with file-level metadata."""
+        path = tmp_path / "2024-12-25.pack"
+        write_pack(path, [("A", [{"v": 1}], None), ("B", [{"v": 2}], {"tickers": ["B-1"]})])
+        write_pack(path, [("C", [{"v": 3}], None)], meta={"count": 1})
+
+        pack = PackedCache(path)
+        assert pack.keys() == ["C"]
+        assert pack.meta == {"count": 1}
+        assert pack.read_block("C") == [{"v": 3}]
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "2024-12-25.pack",
+            "2024-12-25.pack.idx",
+        ]
+
+    def test_interleaved_iteration(self, tmp_path: Path) -> None:
+        """Two iter_block() generators can be advanced alternately on one thread."""
+        pack = PackedCache(tmp_path / "two.pack", compress_level=1)
+        pack.write_blocks([("a", _records(3_000), None), ("b", _records(3_000), None)])
+
+        pairs = _run_or_deadlock(
+            lambda: list(zip(pack.iter_block("a"), pack.iter_block("b"), strict=True))
+        )
+
+        assert [(a["i"], b["i"]) for a, b in pairs] == [(i, i) for i in range(3_000)]
+        pack.close()
+
+    def test_cache_usable_during_iteration(self, tmp_path: Path) -> None:
+        """blocks() and write_block() work while an iter_block() is suspended."""
+        pack = PackedCache(tmp_path / "live.pack", compress_level=1)
+        pack.write_block("a", _records(3_000))
+
+        def consume() -> list[int]:
+            seen = []
+            for record in pack.iter_block("a"):
+                seen.append(record["i"])
+                if record["i"] == 10:
+                    assert set(pack.blocks()) == {"a"}
+                    pack.write_block("b", [{"v": 1}])
+            return seen
+
+        assert _run_or_deadlock(consume) == list(range(3_000))
+        assert pack.read_block("b") == [{"v": 1}]
+        pack.close()
@@ -0,0 +1,320 @@
+"""
+Unit Tests for InstrumentedConnectionPool.
+
+Tests bounded blocking checkout, hold-time tracking, per-class statement
+timeouts, adaptive warm sizing and prepared-statement caching against an in-memory stand-in for
+psycopg2's ThreadedConnectionPool; no database required.
+
+Reference: TESTING_STRATEGY V3.9 - Unit tests for isolated functionality
+
+Usage:
+    pytest tests/unit/database/test_connection_pool_unit.py -v -m unit
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from psycopg2 import errors, pool
+
+from precog.database import connection
+from precog.database.connection_pool import (
+    InstrumentedConnectionPool,
+    PoolCheckoutTimeout,
+    UsageClass,
+)
+
+
+class FakeInnerPool:
+    """getconn/putconn/closeall subset of ThreadedConnectionPool."""
+
+    def __init__(self, minconn: int = 1) -> None:
+        self.minconn = minconn
+        self.closed = False
+        self.fail_next = False
+        self.returned: list[MagicMock] = []
+
+    def getconn(self) -> MagicMock:
+        if self.fail_next:
+            self.fail_next = False
+            raise pool.PoolError("connect failed")
+        conn = MagicMock()
+        conn.closed = 0
+        return conn
+
+    def putconn(self, conn: MagicMock, close: bool = False) -> None:
+        if close:
+            conn.closed = 1
+        self.returned.append(conn)
+
+    def closeall(self) -> None:
+        self.closed = True
+
+
+def _executed(conn: MagicMock) -> list[tuple]:
+    cursor = conn.cursor.return_value.__enter__.return_value
+    return [c.args for c in cursor.execute.call_args_list]
+
+
+@pytest.mark.unit
+class TestCheckout:
+    """Test bounded checkout, waiting and timeouts."""
+
+    def test_rejects_invalid_arguments(self):
+        """Sizes and timeouts are validated."""
+        with pytest.raises(ValueError, match="pool size"):
+            InstrumentedConnectionPool(FakeInnerPool(), minconn=3, maxconn=2)
+        with pytest.raises(ValueError, match="checkout_timeout"):
+            InstrumentedConnectionPool(FakeInnerPool(), 1, 2, checkout_timeout=0)
+
+    def test_checkout_and_release_tracked(self):
+        """Checkouts are counted per caller and released slots are reusable."""
+        db_pool = InstrumentedConnectionPool(FakeInnerPool(), minconn=1, maxconn=2)
+
+        conn = db_pool.getconn(caller="crud_markets.get_market")
+        stats = db_pool.get_stats()
+        assert stats["pool_in_use"] == 1
+        assert list(stats["pool_holders"]) == ["crud_markets.get_market"]
+
+        db_pool.putconn(conn)
+        stats = db_pool.get_stats()
+        assert stats["pool_in_use"] == 0
+        assert stats["pool_checkouts"] == 1
+        assert stats["pool_callers"]["crud_markets.get_market"]["checkouts"] == 1
+
+    def test_exhausted_pool_times_out(self):
+        """A checkout waits checkout_timeout, then raises a PoolError naming the holder."""
+        db_pool = InstrumentedConnectionPool(
+            FakeInnerPool(), minconn=1, maxconn=1, checkout_timeout=0.05
+        )
+        db_pool.getconn(caller="slow_service.run")
+
+        with pytest.raises(PoolCheckoutTimeout, match=r"slow_service\.run") as exc_info:
+            db_pool.getconn(caller="other")
+
+        assert isinstance(exc_info.value, pool.PoolError)
+        stats = db_pool.get_stats()
+        assert stats["pool_timeouts"] == 1
+        assert stats["pool_waiting"] == 0
+
+    def test_waiter_gets_released_connection(self):
+        """A queued checkout proceeds as soon as a connection is returned."""
+        db_pool = InstrumentedConnectionPool(
+            FakeInnerPool(), minconn=1, maxconn=1, checkout_timeout=5
+        )
+        held = db_pool.getconn(caller="first")
+        timer = threading.Timer(0.05, db_pool.putconn, args=(held,))
+        timer.start()
+
+        conn = db_pool.getconn(caller="second")
+        timer.join()
+
+        assert conn is not held
+        stats = db_pool.get_stats()
+        assert stats["pool_waited_checkouts"] == 1
+        assert stats["pool_checkout_wait_max_ms"] >= 40
+
+    def test_failed_connect_releases_slot(self):
+        """An error opening a connection does not leak a slot."""
+        inner = FakeInnerPool()
+        db_pool = InstrumentedConnectionPool(inner, minconn=1, maxconn=1, checkout_timeout=0.05)
+        inner.fail_next = True
+        with pytest.raises(pool.PoolError, match="connect failed"):
+            db_pool.getconn()
+
+        db_pool.putconn(db_pool.getconn())
+        assert db_pool.get_stats()["pool_in_use"] == 0
+
+    def test_double_release_does_not_free_extra_slot(self):
+        """Returning a connection twice cannot raise capacity above maxconn."""
+        db_pool = InstrumentedConnectionPool(
+            FakeInnerPool(), minconn=1, maxconn=1, checkout_timeout=0.05
+        )
+        conn = db_pool.getconn()
+        db_pool.putconn(conn)
+        db_pool.putconn(conn)
+
+        db_pool.getconn()
+        with pytest.raises(PoolCheckoutTimeout):
+            db_pool.getconn()
+
+
+@pytest.mark.unit
+class TestHoldTracking:
+    """Test slow-holder detection."""
+
+    def test_slow_holder_counted_and_logged(self):
+        """Holding past slow_hold_seconds increments pool_slow_holds and warns."""
+        db_pool = InstrumentedConnectionPool(
+            FakeInnerPool(), minconn=1, maxconn=2, slow_hold_seconds=0.01
+        )
+        conn = db_pool.getconn(caller="backfill.load")
+        time.sleep(0.02)
+        with patch("precog.database.connection_pool.logger") as mock_logger:
+            db_pool.putconn(conn)
+
+        mock_logger.warning.assert_called_once()
+        assert mock_logger.warning.call_args.kwargs["caller"] == "backfill.load"
+        stats = db_pool.get_stats()
+        assert stats["pool_slow_holds"] == 1
+        assert stats["pool_callers"]["backfill.load"]["max_hold_ms"] >= 20
+
+
+@pytest.mark.unit
+class TestStatementTimeouts:
+    """Test per-usage-class statement_timeout."""
+
+    def test_timeout_set_only_on_class_change(self):
+        """SET runs when a connection changes class; RESET restores the default."""
+        inner = FakeInnerPool()
+        conn = MagicMock()
+        conn.closed = 0
+        inner.getconn = MagicMock(return_value=conn)  # type: ignore[method-assign]
+        db_pool = InstrumentedConnectionPool(
+            inner, minconn=1, maxconn=1, statement_timeouts={UsageClass.POLLER: 5000}
+        )
+
+        db_pool.putconn(db_pool.getconn(usage_class=UsageClass.POLLER))
+        db_pool.putconn(db_pool.getconn(usage_class=UsageClass.POLLER))
+        assert _executed(conn) == [("SET statement_timeout = %s", (5000,))]
+
+        db_pool.putconn(db_pool.getconn(usage_class=UsageClass.CLI))
+        assert _executed(conn)[-1] == ("RESET statement_timeout",)
+        assert conn.commit.call_count == 2
+
+    def test_no_configured_timeout_issues_no_sql(self):
+        """Without configured timeouts checkouts never touch the connection."""
+        db_pool = InstrumentedConnectionPool(FakeInnerPool(), minconn=1, maxconn=1)
+        conn = db_pool.getconn(usage_class=UsageClass.BACKFILL)
+        conn.cursor.assert_not_called()
+
+
+@pytest.mark.unit
+class TestAdaptiveSizing:
+    """Test warm-size tracking of peak concurrency."""
+
+    def test_warm_target_follows_peak_then_decays(self):
+        """minconn rises to peak concurrency and falls back after two quiet windows."""
+        inner = FakeInnerPool(minconn=1)
+        db_pool = InstrumentedConnectionPool(inner, minconn=1, maxconn=5, resize_window=0.05)
+
+        conns = [db_pool.getconn() for _ in range(3)]
+        assert inner.minconn == 3
+        for conn in conns:
+            db_pool.putconn(conn)
+        assert inner.minconn == 3
+
+        for _ in range(2):
+            time.sleep(0.06)
+            db_pool.putconn(db_pool.getconn())
+        assert inner.minconn == 1
+        assert db_pool.get_stats()["pool_warm_target"] == 1
+
+
+@pytest.mark.unit
+class TestConnectionModuleIntegration:
+    """Test get_connection()/get_pool_stats() over the wrapper."""
+
+    def test_pool_stats_before_initialization(self):
+        """get_pool_stats() reports an uninitialized pool."""
+        with patch.object(connection, "_connection_pool", None):
+            assert connection.get_pool_stats() == {"pool_initialized": False}
+
+    def test_get_cursor_names_calling_function(self):
+        """Hold times are recorded under the code that opened the cursor."""
+        db_pool = InstrumentedConnectionPool(FakeInnerPool(), minconn=1, maxconn=2)
+        with patch.object(connection, "_connection_pool", db_pool):
+            with connection.get_cursor():
+                pass
+            stats = connection.get_pool_stats()
+
+        assert stats["pool_initialized"] is True
+        (caller,) = stats["pool_callers"]
+        assert caller.endswith("test_get_cursor_names_calling_function")
+
+
+@pytest.mark.unit
+class TestPreparedStatements:
+    """Test execute_prepared() over per-connection session state."""
+
+    QUERY = "SELECT * FROM markets WHERE ticker = %s AND title LIKE 'A%%'"
+
+    @pytest.fixture
+    def pooled(self):
+        """A one-connection pool installed as the module pool, with a clean registry."""
+        inner = FakeInnerPool()
+        conn = MagicMock()
+        conn.closed = 0
+        conn.cursor.return_value.connection = conn
+        inner.getconn = MagicMock(return_value=conn)  # type: ignore[method-assign]
+        db_pool = InstrumentedConnectionPool(inner, minconn=1, maxconn=1)
+        with (
+            patch.object(connection, "_connection_pool", db_pool),
+            patch.dict(connection._prepared_queries, clear=True),
+        ):
+            yield db_pool, conn.cursor.return_value
+
+    def test_prepared_once_across_checkouts(self, pooled):
+        """PREPARE runs on first use only; later checkouts just EXECUTE."""
+        db_pool, cursor = pooled
+
+        connection.fetch_one(self.QUERY, ("KC",), prepared="market_by_ticker")
+        connection.fetch_one(self.QUERY, ("BUF",), prepared="market_by_ticker")
+
+        assert [c.args for c in cursor.execute.call_args_list] == [
+            (
+                "PREPARE market_by_ticker AS SELECT * FROM markets WHERE ticker = $1 AND title LIKE 'A%'",
+            ),
+            ("EXECUTE market_by_ticker (%s)", ("KC",)),
+            ("EXECUTE market_by_ticker (%s)", ("BUF",)),
+        ]
+        assert db_pool.get_stats()["pool_prepared_statements"] == 1
+
+    def test_closed_connection_forgets_statements(self, pooled):
+        """A connection closed on return takes its prepared names with it."""
+        db_pool, _cursor = pooled
+        connection.fetch_one(self.QUERY, ("KC",), prepared="market_by_ticker")
+
+        conn = db_pool.getconn()
+        db_pool.putconn(conn, close=True)
+
+        assert db_pool.get_stats()["pool_prepared_statements"] == 0
+
+    def test_invalidated_plan_reprepared(self, pooled):
+        """A cached-plan error makes the next call DEALLOCATE and PREPARE again."""
+        _db_pool, cursor = pooled
+        connection.fetch_one(self.QUERY, ("KC",), prepared="market_by_ticker")
+        cursor.execute.side_effect = [errors.FeatureNotSupported("cached plan"), None]
+        with pytest.raises(errors.FeatureNotSupported):
+            connection.fetch_one(self.QUERY, ("KC",), prepared="market_by_ticker")
+
+        cursor.execute.reset_mock(side_effect=True)
+        connection.fetch_one(self.QUERY, ("KC",), prepared="market_by_ticker")
+
+        statements = [c.args[0] for c in cursor.execute.call_args_list]
+        assert statements[0] == "DEALLOCATE market_by_ticker"
+        assert statements[1].startswith("PREPARE market_by_ticker AS")
+
+    def test_untracked_cursor_executes_plainly(self):
+        """Cursors not backed by the pool (e.g. mocks) fall back to execute()."""
+        cursor = MagicMock()
+        with (
+            patch.object(connection, "_connection_pool", None),
+            patch.dict(connection._prepared_queries, clear=True),
+        ):
+            connection.execute_prepared(cursor, "market_by_ticker", self.QUERY, ("KC",))
+
+        cursor.execute.assert_called_once_with(self.QUERY, ("KC",))
+
+    def test_registration_errors(self):
+        """Names are identifiers bound to one query with a fixed parameter count."""
+        cursor = MagicMock()
+        with patch.dict(connection._prepared_queries, clear=True):
+            with pytest.raises(ValueError, match="Invalid prepared statement name"):
+                connection.execute_prepared(cursor, "drop table;", self.QUERY, ("KC",))
+            connection.execute_prepared(cursor, "market_by_ticker", self.QUERY, ("KC",))
+            with pytest.raises(ValueError, match="different SQL"):
+                connection.execute_prepared(cursor, "market_by_ticker", "SELECT 1", ())
+            with pytest.raises(ValueError, match="expects 1 parameters"):
+                connection.execute_prepared(cursor, "market_by_ticker", self.QUERY, ())
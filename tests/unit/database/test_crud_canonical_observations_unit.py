@@ -7,6 +7,8 @@ Covers (function-by-function):
       correctness for the payload column.
     - _compute_payload_hash: SHA-256 determinism + key-order independence
       + distinct hashes for distinct payloads.
+    - get_observation_source_id / get_observations_by_payload: read
+      helpers used by the temporal alignment writer.
 
 Pattern 73 SSOT real-guard discipline (slot 0073 strengthened convention):
     OBSERVATION_KIND_VALUES is imported and USED in real-guard
@@ -39,6 +41,8 @@ from precog.database.constants import OBSERVATION_KIND_VALUES
 from precog.database.crud_canonical_observations import (
     _compute_payload_hash,
     append_observation_row,
+    get_observation_source_id,
+    get_observations_by_payload,
 )
 
 
@@ -458,3 +462,54 @@ class TestAppendObservationRowPayloadHashCrosscheck:
             "payload_hash sent to SQL must equal _compute_payload_hash(payload); "
             "drift here would corrupt dedup UNIQUE semantics"
         )
+
+
+# =============================================================================
+# Read helpers — source lookup + payload lookup
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestReadHelpers:
+    """Source id and payload lookups used by the temporal alignment writer."""
+
+    @patch("precog.database.crud_canonical_observations.fetch_one")
+    def test_source_id_found(self, mock_fetch_one):
+        """A seeded source key returns its id."""
+        mock_fetch_one.return_value = {"id": 2}
+
+        assert get_observation_source_id("kalshi") == 2
+        assert mock_fetch_one.call_args[0][1] == ("kalshi",)
+
+    @patch("precog.database.crud_canonical_observations.fetch_one")
+    def test_source_id_missing(self, mock_fetch_one):
+        """An unknown source key returns None."""
+        mock_fetch_one.return_value = None
+
+        assert get_observation_source_id("noaa") is None
+
+    @patch("precog.database.crud_canonical_observations.fetch_all")
+    def test_payload_lookup_preserves_input_order(self, mock_fetch_all):
+        """Matches are returned per payload, in order, with None for misses."""
+        ingested_at = datetime(2026, 5, 15, 19, 30, 5, tzinfo=UTC)
+        found, missing = {"market_snapshot_id": 1}, {"market_snapshot_id": 2}
+        mock_fetch_all.return_value = [
+            {
+                "payload_hash": memoryview(_compute_payload_hash(found)),
+                "id": 7,
+                "ingested_at": ingested_at,
+            }
+        ]
+
+        result = get_observations_by_payload(2, [missing, found])
+
+        assert result == [None, (7, ingested_at)]
+        query, params = mock_fetch_all.call_args[0]
+        assert "DISTINCT ON (payload_hash)" in query
+        assert params == (2, [_compute_payload_hash(missing), _compute_payload_hash(found)])
+
+    @patch("precog.database.crud_canonical_observations.fetch_all")
+    def test_payload_lookup_empty_skips_query(self, mock_fetch_all):
+        """No payloads means no round trip."""
+        assert get_observations_by_payload(2, []) == []
+        mock_fetch_all.assert_not_called()
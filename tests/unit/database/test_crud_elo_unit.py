@@ -9,6 +9,10 @@ Covers:
       None (team found but rating is NULL).
     - get_team_elo_by_code: happy path with league filter, None when no match,
       ambiguous lookup warning when multiple rows match without league filter.
+    - get_team_elo_ratings: bulk warm-up query.
+    - get_team_elo_season / get_team_elo_seasons: last rated season per team.
+    - apply_game_elo_update: log insert + team updates in one transaction,
+      no-op for an already-logged game.
 
 Out of scope (deferred):
     - update_team_elo_rating, update_team_classification, insert_elo_calculation_log,
@@ -26,12 +30,20 @@ Reference:
     - feedback_test_audit_skip_retirement_priority.md
 """
 
+from datetime import date
 from decimal import Decimal
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from precog.database.crud_elo import get_team_elo_by_code, get_team_elo_rating
+from precog.database.crud_elo import (
+    apply_game_elo_update,
+    get_team_elo_by_code,
+    get_team_elo_rating,
+    get_team_elo_ratings,
+    get_team_elo_season,
+    get_team_elo_seasons,
+)
 
 # =============================================================================
 # get_team_elo_rating
@@ -168,3 +180,141 @@ class TestGetTeamEloByCode:
 
         assert result == Decimal("0")  # NOT None
         assert isinstance(result, Decimal)
+
+
+# =============================================================================
+# get_team_elo_ratings / apply_game_elo_update
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestGetTeamEloRatings:
+    """Unit tests for get_team_elo_ratings — bulk warm-up query."""
+
+    @patch("precog.database.crud_elo.fetch_all")
+    def test_returns_ratings_keyed_by_team_id(self, mock_fetch_all):
+        """One query for all leagues; rows map team_id -> Decimal."""
+        mock_fetch_all.return_value = [
+            {"team_id": 1, "current_elo_rating": "1600.50"},
+            {"team_id": 2, "current_elo_rating": "1420.00"},
+        ]
+
+        result = get_team_elo_ratings(["nfl", "nba"])
+
+        assert result == {1: Decimal("1600.50"), 2: Decimal("1420.00")}
+        sql, params = mock_fetch_all.call_args[0]
+        assert "league = ANY(%s)" in sql
+        assert "current_elo_rating IS NOT NULL" in sql
+        assert params == (["nfl", "nba"],)
+
+    @patch("precog.database.crud_elo.fetch_all")
+    def test_empty_leagues_skips_query(self, mock_fetch_all):
+        """No leagues -> no query."""
+        assert get_team_elo_ratings([]) == {}
+        mock_fetch_all.assert_not_called()
+
+
+@pytest.mark.unit
+class TestGetTeamEloSeasons:
+    """Unit tests for the last-rated-season lookups used for season regression."""
+
+    @patch("precog.database.crud_elo.fetch_all")
+    def test_returns_seasons_keyed_by_team_id(self, mock_fetch_all):
+        """Home and away appearances both count; rows map team_id -> season."""
+        mock_fetch_all.return_value = [
+            {"team_id": 1, "season": 2024},
+            {"team_id": 2, "season": 2025},
+        ]
+
+        assert get_team_elo_seasons(["nfl"]) == {1: 2024, 2: 2025}
+        sql, params = mock_fetch_all.call_args[0]
+        assert "JOIN games g ON g.id = l.game_id" in sql
+        assert "(l.home_team_id), (l.away_team_id)" in sql
+        assert params == (["nfl"],)
+
+    @patch("precog.database.crud_elo.fetch_all")
+    def test_empty_leagues_skips_query(self, mock_fetch_all):
+        """No leagues -> no query."""
+        assert get_team_elo_seasons([]) == {}
+        mock_fetch_all.assert_not_called()
+
+    @patch("precog.database.crud_elo.fetch_one")
+    def test_single_team_season(self, mock_fetch_one):
+        """MAX(season) over the team's logged games; None when it has none."""
+        mock_fetch_one.return_value = {"season": 2023}
+        assert get_team_elo_season(team_id=42) == 2023
+        assert mock_fetch_one.call_args[0][1] == (42,)
+
+        mock_fetch_one.return_value = {"season": None}
+        assert get_team_elo_season(team_id=42) is None
+
+
+def _update_kwargs() -> dict:
+    return {
+        "game_id": 101,
+        "league": "nfl",
+        "game_date": date(2025, 9, 7),
+        "home_team_id": 10,
+        "away_team_id": 20,
+        "home_team_code": "KC",
+        "away_team_code": "BAL",
+        "home_score": 27,
+        "away_score": 20,
+        "home_elo_before": Decimal("1600.00"),
+        "away_elo_before": Decimal("1580.00"),
+        "k_factor": 20,
+        "home_advantage": Decimal("48"),
+        "mov_multiplier": Decimal("1.45"),
+        "home_expected": Decimal("0.5900"),
+        "away_expected": Decimal("0.4100"),
+        "home_actual": Decimal("1"),
+        "away_actual": Decimal("0"),
+        "home_elo_change": Decimal("11.89"),
+        "away_elo_change": Decimal("-11.89"),
+        "home_elo_after": Decimal("1611.89"),
+        "away_elo_after": Decimal("1568.11"),
+    }
+
+
+@pytest.mark.unit
+class TestApplyGameEloUpdate:
+    """Unit tests for apply_game_elo_update — log row + team ratings in one transaction."""
+
+    @staticmethod
+    def _cursor(mock_get_cursor, fetchone):
+        cursor = MagicMock()
+        cursor.fetchone.return_value = fetchone
+        mock_get_cursor.return_value.__enter__ = MagicMock(return_value=cursor)
+        mock_get_cursor.return_value.__exit__ = MagicMock(return_value=False)
+        return cursor
+
+    @patch("precog.database.crud_elo.get_league_id_or_none", return_value=1)
+    @patch("precog.database.crud_elo.get_cursor")
+    def test_inserts_log_and_updates_both_teams(self, mock_get_cursor, mock_league_id):
+        """New game: log row inserted, then both teams updated in the same cursor."""
+        cursor = self._cursor(mock_get_cursor, {"elo_log_id": 555})
+
+        log_id = apply_game_elo_update(**_update_kwargs())
+
+        assert log_id == 555
+        mock_get_cursor.assert_called_once_with(commit=True)
+        insert_sql, insert_params = cursor.execute.call_args_list[0][0]
+        assert "WHERE NOT EXISTS" in insert_sql
+        assert "ON CONFLICT (game_id) WHERE calculation_source = 'realtime' DO NOTHING" in (
+            insert_sql
+        )
+        assert insert_params[-1] == 101  # idempotency key
+        assert insert_params[-2] == 1  # league_id
+        assert insert_params[-4] == "realtime"
+        update_sql, update_params = cursor.execute.call_args_list[1][0]
+        assert "UPDATE teams" in update_sql
+        assert update_params == (10, Decimal("1611.89"), Decimal("1568.11"), 10, 20)
+
+    @patch("precog.database.crud_elo.get_league_id_or_none", return_value=1)
+    @patch("precog.database.crud_elo.get_cursor")
+    def test_already_logged_game_is_not_reapplied(self, mock_get_cursor, mock_league_id):
+        """No inserted row -> teams untouched, None returned."""
+        cursor = self._cursor(mock_get_cursor, None)
+
+        assert apply_game_elo_update(**_update_kwargs()) is None
+        assert cursor.execute.call_count == 1
@@ -2,6 +2,7 @@
 
 Covers game_states SCD Type 2 and the games dimension (both live in crud_game_states.py):
 - create_game_state / get_current_game_state / get_game_state_history / upsert_game_state
+- get_current_game_states / upsert_game_states_batch (one-read scoreboard upsert)
 - get_live_games / get_games_by_date
 - get_or_create_game (games dimension upsert)
 - update_game_result (derived final-score fields)
@@ -22,12 +23,17 @@ from precog.database.crud_game_states import (
     find_game_by_matchup,
     game_state_changed,
     get_current_game_state,
+    get_current_game_states,
     get_game_state_history,
     get_games_by_date,
+    get_games_for_matching,
     get_live_games,
     get_or_create_game,
+    update_bracket_counts_for_events,
+    update_event_game_ids_batch,
     update_game_result,
     upsert_game_state,
+    upsert_game_states_batch,
 )
 
 
@@ -231,6 +237,65 @@ class TestUpsertGameStateUnit:
         assert result == 100
 
 
+@pytest.mark.unit
+class TestUpsertGameStatesBatchUnit:
+    """Unit tests for get_current_game_states / upsert_game_states_batch."""
+
+    @patch("precog.database.crud_game_states.fetch_all")
+    def test_current_states_one_query(self, mock_fetch_all):
+        """All events are read with one ANY(%s) query, keyed by espn_event_id."""
+        mock_fetch_all.return_value = [{"espn_event_id": "1", "home_score": 7}]
+
+        result = get_current_game_states(["1", "2", "1"])
+
+        assert result == {"1": {"espn_event_id": "1", "home_score": 7}}
+        sql, params = mock_fetch_all.call_args[0]
+        assert "espn_event_id = ANY(%s)" in sql
+        assert "row_current_ind = TRUE" in sql
+        assert params == (["1", "2"],)
+
+    @patch("precog.database.crud_game_states.fetch_all")
+    def test_current_states_empty_input(self, mock_fetch_all):
+        """No events -> no query."""
+        assert get_current_game_states([]) == {}
+        mock_fetch_all.assert_not_called()
+
+    @patch("precog.database.crud_game_states.upsert_game_state")
+    @patch("precog.database.crud_game_states.get_current_game_states")
+    def test_writes_only_changed_games(self, mock_current, mock_upsert):
+        """Unchanged games map to None without a write; changed and new games are written."""
+        mock_current.return_value = {
+            "same": {"home_score": 7, "away_score": 3, "period": 2, "game_status": "in_progress"},
+            "scored": {"home_score": 7, "away_score": 3, "period": 2, "game_status": "in_progress"},
+        }
+        mock_upsert.side_effect = [501, 502]
+        base = {"away_score": 3, "period": 2, "game_status": "in_progress", "league": "nfl"}
+
+        results = upsert_game_states_batch(
+            [
+                {"espn_event_id": "same", "home_score": 7, **base},
+                {"espn_event_id": "scored", "home_score": 14, **base},
+                {"espn_event_id": "new", "home_score": 0, **base, "skip_if_unchanged": True},
+            ]
+        )
+
+        assert results == {"same": None, "scored": 501, "new": 502}
+        mock_current.assert_called_once()
+        written = [c.kwargs["espn_event_id"] for c in mock_upsert.call_args_list]
+        assert written == ["scored", "new"]
+        assert all(c.kwargs["skip_if_unchanged"] is False for c in mock_upsert.call_args_list)
+
+    @patch("precog.database.crud_game_states.upsert_game_state")
+    @patch("precog.database.crud_game_states.get_current_game_states", return_value={})
+    def test_failed_write_left_out(self, mock_current, mock_upsert):
+        """A failing game is omitted; the rest of the scoreboard is still written."""
+        mock_upsert.side_effect = [Exception("unique violation"), 601]
+
+        results = upsert_game_states_batch([{"espn_event_id": "bad"}, {"espn_event_id": "ok"}])
+
+        assert results == {"ok": 601}
+
+
 @pytest.mark.unit
 class TestGetLiveGamesUnit:
     """Unit tests for get_live_games function."""
@@ -1280,3 +1345,88 @@ class TestFindGameByMatchupUnit:
         call_args = mock_fetch_one.call_args[0]
         params = call_args[1]
         assert params == ("basketball", target_date, "LAL", "GSW")
+
+
+@pytest.mark.unit
+class TestUpdateBracketCountsForEventsUnit:
+    """Unit tests for the incremental bracket_count recount."""
+
+    @patch("precog.database.crud_game_states.get_cursor")
+    def test_recount_scoped_to_event_ids(self, mock_get_cursor):
+        """One statement, filtered to the deduplicated event ids."""
+        mock_cursor = MagicMock()
+        mock_cursor.rowcount = 4
+        mock_get_cursor.return_value.__enter__ = MagicMock(return_value=mock_cursor)
+        mock_get_cursor.return_value.__exit__ = MagicMock(return_value=False)
+
+        assert update_bracket_counts_for_events([7, 3, 7]) == 4
+
+        mock_cursor.execute.assert_called_once()
+        sql, params = mock_cursor.execute.call_args.args
+        assert "event_id = ANY(%s)" in sql
+        assert params == ([3, 7],)
+
+    @patch("precog.database.crud_game_states.get_cursor")
+    def test_empty_input_skips_query(self, mock_get_cursor):
+        """No changed events means no round trip."""
+        assert update_bracket_counts_for_events(set()) == 0
+        mock_get_cursor.assert_not_called()
+
+
+@pytest.mark.unit
+class TestGetGamesForMatchingUnit:
+    """Unit tests for the GameIndex window reader."""
+
+    @patch("precog.database.crud_game_states.fetch_all")
+    def test_full_window_read(self, mock_fetch_all):
+        """Without a watermark only the date window is filtered."""
+        mock_fetch_all.return_value = []
+
+        get_games_for_matching(date(2026, 1, 1), date(2026, 1, 31))
+
+        sql, params = mock_fetch_all.call_args.args
+        assert "updated_at >=" not in sql
+        assert params == (date(2026, 1, 1), date(2026, 1, 31))
+
+    @patch("precog.database.crud_game_states.fetch_all")
+    def test_incremental_read(self, mock_fetch_all):
+        """A watermark adds the updated_at filter."""
+        mock_fetch_all.return_value = []
+        since = datetime(2026, 1, 18, 12, 0)
+
+        get_games_for_matching(date(2026, 1, 1), date(2026, 1, 31), updated_since=since)
+
+        sql, params = mock_fetch_all.call_args.args
+        assert "updated_at >= %s" in sql
+        assert params == (date(2026, 1, 1), date(2026, 1, 31), since)
+
+
+@pytest.mark.unit
+class TestUpdateEventGameIdsBatchUnit:
+    """Unit tests for the bulk event-to-game link."""
+
+    @patch("precog.database.crud_game_states.execute_values")
+    @patch("precog.database.crud_game_states.get_cursor")
+    def test_single_bulk_update(self, mock_get_cursor, mock_execute_values):
+        """All pairs go out in one UPDATE ... FROM (VALUES ...) statement."""
+        mock_cursor = MagicMock()
+        mock_get_cursor.return_value.__enter__ = MagicMock(return_value=mock_cursor)
+        mock_get_cursor.return_value.__exit__ = MagicMock(return_value=False)
+        mock_execute_values.return_value = [{"id": 1}, {"id": 3}]
+
+        updated = update_event_game_ids_batch([(1, 10), (2, 20), (3, 30), (1, 11)])
+
+        assert updated == [1, 3]
+        mock_execute_values.assert_called_once()
+        args, kwargs = mock_execute_values.call_args
+        assert "FROM (VALUES %s)" in args[1]
+        # Later pairs for the same event win
+        assert args[2] == [(1, 11), (2, 20), (3, 30)]
+        assert kwargs["fetch"] is True
+        mock_get_cursor.assert_called_once_with(commit=True)
+
+    @patch("precog.database.crud_game_states.get_cursor")
+    def test_empty_input_skips_query(self, mock_get_cursor):
+        """No links means no round trip."""
+        assert update_event_game_ids_batch([]) == []
+        mock_get_cursor.assert_not_called()
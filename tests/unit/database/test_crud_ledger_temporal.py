@@ -1,13 +1,13 @@
 """
-Unit Tests for Temporal Alignment CRUD Operations (Migration 0027).
+Unit Tests for Temporal Alignment CRUD Operations (Migration 0084).
 
 Tests the temporal alignment functions: insert_temporal_alignment,
-insert_temporal_alignment_batch, and get_alignments_by_market. Validates
-Decimal enforcement, enum validation, optional parameter handling, batch
-operations, quality filtering, and ordering.
+insert_temporal_alignment_batch, and get_alignments_by_event. Validates
+Decimal enforcement, enum validation, self-pair rejection, optional
+parameter handling, batch operations, quality filtering, and ordering.
 
 Related:
-- Migration 0027: temporal_alignment
+- Migration 0084: temporal_alignment pure linkage redesign
 - Issue #375: Add temporal alignment table linking Kalshi polls to ESPN game states
 - migration_batch_plan_v1.md: Migration 0027 spec
 
@@ -16,25 +16,15 @@ Usage:
     pytest tests/unit/database/test_crud_ledger_temporal.py -v -m unit
 """
 
-import pytest
-
-pytest.skip(
-    "V2.45 Migration 0084 dropped the columns these CRUD functions write to "
-    "(market_snapshot_id, game_state_id, home_score, yes_ask_price, etc.). "
-    "Cohort 5+ rewrite per ADR-118 V2.45 Item 6 + issue #1141. The mocked "
-    "cursors in this file silently pass-green against dead-on-execute code "
-    "(Pattern 22 hand-mock failure mode); skip prevents false-positive signal "
-    "until the rewrite ships.",
-    allow_module_level=True,
-)
+from datetime import UTC, datetime
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
 
-from datetime import UTC, datetime  # noqa: E402
-from decimal import Decimal  # noqa: E402
-from unittest.mock import MagicMock, patch  # noqa: E402
+import pytest
 
-from precog.database.crud_ledger import (  # noqa: E402
+from precog.database.crud_ledger import (
     VALID_ALIGNMENT_QUALITIES,
-    get_alignments_by_market,
+    get_alignments_by_event,
     insert_temporal_alignment,
     insert_temporal_alignment_batch,
 )
@@ -56,25 +46,20 @@ def _mock_cursor_context(mock_get_cursor, mock_cursor=None):
 def _default_alignment_kwargs():
     """Return minimal valid kwargs for insert_temporal_alignment."""
     return {
-        "market_id": 42,
-        "market_snapshot_id": 1001,
-        "game_state_id": 501,
-        "snapshot_time": datetime(2026, 1, 15, 20, 30, 0, tzinfo=UTC),
-        "game_state_time": datetime(2026, 1, 15, 20, 30, 5, tzinfo=UTC),
-        "time_delta_seconds": Decimal("5.00"),
+        "observation_a_id": 1001,
+        "observation_a_ingested_at": datetime(2026, 1, 15, 20, 30, 1, tzinfo=UTC),
+        "observation_b_id": 501,
+        "observation_b_ingested_at": datetime(2026, 1, 15, 20, 30, 6, tzinfo=UTC),
+        "time_delta_seconds": Decimal("5.000"),
     }
 
 
-def _default_alignment_dict():
+def _default_alignment_dict(offset: int = 0):
     """Return minimal valid dict for insert_temporal_alignment_batch."""
-    return {
-        "market_id": 42,
-        "market_snapshot_id": 1001,
-        "game_state_id": 501,
-        "snapshot_time": datetime(2026, 1, 15, 20, 30, 0, tzinfo=UTC),
-        "game_state_time": datetime(2026, 1, 15, 20, 30, 5, tzinfo=UTC),
-        "time_delta_seconds": Decimal("5.00"),
-    }
+    row = _default_alignment_kwargs()
+    row["observation_a_id"] += offset
+    row["observation_b_id"] += offset
+    return row
 
 
 # =============================================================================
@@ -108,37 +93,38 @@ class TestInsertTemporalAlignment:
             insert_temporal_alignment(**kwargs)
 
     @patch("precog.database.crud_ledger.get_cursor")
-    def test_insert_validates_decimal_yes_ask_price(self, mock_get_cursor):
-        """Test that float values are rejected for yes_ask_price."""
-        _mock_cursor_context(mock_get_cursor)
+    def test_insert_rejects_self_pair(self, mock_get_cursor):
+        """Test that pairing an observation with itself is rejected before SQL."""
+        mock_cursor = _mock_cursor_context(mock_get_cursor)
 
         kwargs = _default_alignment_kwargs()
-        kwargs["yes_ask_price"] = 0.55  # float -- should raise
+        kwargs["observation_b_id"] = kwargs["observation_a_id"]
+        kwargs["observation_b_ingested_at"] = kwargs["observation_a_ingested_at"]
 
-        with pytest.raises(TypeError, match="yes_ask_price must be Decimal"):
+        with pytest.raises(ValueError, match="must be different observations"):
             insert_temporal_alignment(**kwargs)
+        mock_cursor.execute.assert_not_called()
 
     @patch("precog.database.crud_ledger.get_cursor")
-    def test_insert_validates_decimal_no_ask_price(self, mock_get_cursor):
-        """Test that float values are rejected for no_ask_price."""
-        _mock_cursor_context(mock_get_cursor)
+    def test_insert_same_id_other_partition_allowed(self, mock_get_cursor):
+        """Same id with a different ingested_at is a distinct observation."""
+        mock_cursor = _mock_cursor_context(mock_get_cursor)
+        mock_cursor.fetchone.return_value = {"id": 3}
 
         kwargs = _default_alignment_kwargs()
-        kwargs["no_ask_price"] = 0.45  # float -- should raise
+        kwargs["observation_b_id"] = kwargs["observation_a_id"]
 
-        with pytest.raises(TypeError, match="no_ask_price must be Decimal"):
-            insert_temporal_alignment(**kwargs)
+        assert insert_temporal_alignment(**kwargs) == 3
 
     @patch("precog.database.crud_ledger.get_cursor")
-    def test_insert_validates_decimal_spread(self, mock_get_cursor):
-        """Test that float values are rejected for spread."""
-        _mock_cursor_context(mock_get_cursor)
+    def test_insert_returns_none_on_conflict(self, mock_get_cursor):
+        """An already-aligned pair inserts nothing and returns None."""
+        mock_cursor = _mock_cursor_context(mock_get_cursor)
+        mock_cursor.fetchone.return_value = None
 
-        kwargs = _default_alignment_kwargs()
-        kwargs["spread"] = 0.10  # float -- should raise
-
-        with pytest.raises(TypeError, match="spread must be Decimal"):
-            insert_temporal_alignment(**kwargs)
+        assert insert_temporal_alignment(**_default_alignment_kwargs()) is None
+        sql = mock_cursor.execute.call_args[0][0]
+        assert "ON CONFLICT ON CONSTRAINT uq_alignment_pair DO NOTHING" in sql
 
     @patch("precog.database.crud_ledger.get_cursor")
     def test_insert_validates_alignment_quality(self, mock_get_cursor):
@@ -161,6 +147,10 @@ class TestInsertTemporalAlignment:
         result = insert_temporal_alignment(**_default_alignment_kwargs())
 
         assert result == 2
+        sql, params = mock_cursor.execute.call_args[0]
+        assert params[4] is None  # canonical_event_id
+        assert params[7] is None  # aligned_at -> COALESCE(%s, NOW())
+        assert "COALESCE(%s, NOW())" in sql
 
     @patch("precog.database.crud_ledger.get_cursor")
     def test_insert_with_all_optional_fields(self, mock_get_cursor):
@@ -168,26 +158,18 @@ class TestInsertTemporalAlignment:
         mock_cursor = _mock_cursor_context(mock_get_cursor)
         mock_cursor.fetchone.return_value = {"id": 99}
 
+        aligned_at = datetime(2026, 1, 15, 20, 30, 7, tzinfo=UTC)
         result = insert_temporal_alignment(
-            market_id=42,
-            market_snapshot_id=1001,
-            game_state_id=501,
-            snapshot_time=datetime(2026, 1, 15, 20, 30, 0, tzinfo=UTC),
-            game_state_time=datetime(2026, 1, 15, 20, 30, 5, tzinfo=UTC),
-            time_delta_seconds=Decimal("5.00"),
+            **_default_alignment_kwargs(),
             alignment_quality="exact",
-            yes_ask_price=Decimal("0.5500"),
-            no_ask_price=Decimal("0.4500"),
-            spread=Decimal("0.1000"),
-            volume=150,
-            game_status="in_progress",
-            home_score=21,
-            away_score=14,
-            period="3rd",
-            clock="08:42",
+            canonical_event_id=15,
+            aligned_at=aligned_at,
         )
 
         assert result == 99
+        params = mock_cursor.execute.call_args[0][1]
+        assert params[4] == 15
+        assert params[7] == aligned_at
 
     @patch("precog.database.crud_ledger.get_cursor")
     def test_insert_accepts_all_valid_alignment_qualities(self, mock_get_cursor):
@@ -239,9 +221,7 @@ class TestInsertTemporalAlignmentBatch:
         mock_cursor = _mock_cursor_context(mock_get_cursor)
         mock_cursor.rowcount = 2
 
-        rows = [_default_alignment_dict(), _default_alignment_dict()]
-        rows[1]["market_snapshot_id"] = 1002
-        rows[1]["game_state_id"] = 502
+        rows = [_default_alignment_dict(), _default_alignment_dict(offset=1)]
 
         result = insert_temporal_alignment_batch(rows)
 
@@ -255,9 +235,7 @@ class TestInsertTemporalAlignmentBatch:
         mock_cursor = _mock_cursor_context(mock_get_cursor)
         mock_cursor.rowcount = 0  # all rows were ON CONFLICT DO NOTHING
 
-        rows = [_default_alignment_dict(), _default_alignment_dict()]
-        rows[1]["market_snapshot_id"] = 1002
-        rows[1]["game_state_id"] = 502
+        rows = [_default_alignment_dict(), _default_alignment_dict(offset=1)]
 
         result = insert_temporal_alignment_batch(rows)
 
@@ -310,16 +288,19 @@ class TestInsertTemporalAlignmentBatch:
         # alignment_quality is the 7th param (index 6)
         assert params_list[0][6] == "good"
 
+    @patch("precog.database.crud_ledger.execute_values")
     @patch("precog.database.crud_ledger.get_cursor")
-    def test_batch_insert_validates_decimal_yes_ask_price(self, mock_get_cursor):
-        """Test that float yes_ask_price is rejected in batch."""
+    def test_batch_insert_rejects_self_pair(self, mock_get_cursor, mock_exec_values):
+        """A self-pair anywhere in the batch rejects the whole batch."""
         _mock_cursor_context(mock_get_cursor)
 
-        row = _default_alignment_dict()
-        row["yes_ask_price"] = 0.55  # float -- should raise
+        row = _default_alignment_dict(offset=1)
+        row["observation_b_id"] = row["observation_a_id"]
+        row["observation_b_ingested_at"] = row["observation_a_ingested_at"]
 
-        with pytest.raises(TypeError, match="yes_ask_price must be Decimal"):
-            insert_temporal_alignment_batch([row])
+        with pytest.raises(ValueError, match=r"must be different observations.*alignments\[1\]"):
+            insert_temporal_alignment_batch([_default_alignment_dict(), row])
+        mock_exec_values.assert_not_called()
 
     @patch("precog.database.crud_ledger.execute_values")
     @patch("precog.database.crud_ledger.get_cursor")
@@ -343,7 +324,7 @@ class TestInsertTemporalAlignmentBatch:
     @patch("precog.database.crud_ledger.execute_values")
     @patch("precog.database.crud_ledger.get_cursor")
     def test_batch_insert_sql_has_on_conflict_do_nothing(self, mock_get_cursor, mock_exec_values):
-        """Batch insert SQL uses ON CONFLICT DO NOTHING on uq_alignment_snapshot_game."""
+        """Batch insert SQL uses ON CONFLICT DO NOTHING on uq_alignment_pair."""
         mock_cursor = _mock_cursor_context(mock_get_cursor)
         mock_cursor.rowcount = 1
 
@@ -353,7 +334,8 @@ class TestInsertTemporalAlignmentBatch:
         sql = mock_exec_values.call_args[0][1]
         assert "ON CONFLICT" in sql
         assert "DO NOTHING" in sql
-        assert "market_snapshot_id, game_state_id" in sql
+        assert "ON CONSTRAINT uq_alignment_pair" in sql
+        assert "observation_a_ingested_at" in sql
 
     @patch("precog.database.crud_ledger.execute_values")
     @patch("precog.database.crud_ledger.get_cursor")
@@ -372,10 +354,7 @@ class TestInsertTemporalAlignmentBatch:
         # 150 rows crosses the default 100-row page boundary
         rows = []
         for i in range(150):
-            row = _default_alignment_dict()
-            row["market_snapshot_id"] = 2000 + i
-            row["game_state_id"] = 3000 + i
-            rows.append(row)
+            rows.append(_default_alignment_dict(offset=i))
 
         insert_temporal_alignment_batch(rows)
 
@@ -387,20 +366,20 @@ class TestInsertTemporalAlignmentBatch:
 
 
 # =============================================================================
-# GET ALIGNMENTS BY MARKET TESTS
+# GET ALIGNMENTS BY EVENT TESTS
 # =============================================================================
 
 
 @pytest.mark.unit
-class TestGetAlignmentsByMarket:
-    """Unit tests for get_alignments_by_market function."""
+class TestGetAlignmentsByEvent:
+    """Unit tests for get_alignments_by_event function."""
 
     @patch("precog.database.crud_ledger.fetch_all")
     def test_returns_empty_list(self, mock_fetch_all):
         """Test that empty result set returns empty list."""
         mock_fetch_all.return_value = []
 
-        result = get_alignments_by_market(42)
+        result = get_alignments_by_event(42)
 
         assert result == []
 
@@ -408,11 +387,11 @@ class TestGetAlignmentsByMarket:
     def test_returns_list_of_dicts(self, mock_fetch_all):
         """Test that result is a list of dicts."""
         mock_fetch_all.return_value = [
-            {"id": 1, "market_id": 42, "alignment_quality": "good"},
-            {"id": 2, "market_id": 42, "alignment_quality": "exact"},
+            {"id": 1, "canonical_event_id": 42, "alignment_quality": "good"},
+            {"id": 2, "canonical_event_id": 42, "alignment_quality": "exact"},
         ]
 
-        result = get_alignments_by_market(42)
+        result = get_alignments_by_event(42)
 
         assert len(result) == 2
         assert result[0]["id"] == 1
@@ -422,7 +401,7 @@ class TestGetAlignmentsByMarket:
         """Test filtering by min_quality includes correct quality levels."""
         mock_fetch_all.return_value = []
 
-        get_alignments_by_market(42, min_quality="good")
+        get_alignments_by_event(42, min_quality="good")
 
         query = mock_fetch_all.call_args[0][0]
         params = mock_fetch_all.call_args[0][1]
@@ -440,7 +419,7 @@ class TestGetAlignmentsByMarket:
         """Test that min_quality='stale' includes all quality levels."""
         mock_fetch_all.return_value = []
 
-        get_alignments_by_market(42, min_quality="stale")
+        get_alignments_by_event(42, min_quality="stale")
 
         params = mock_fetch_all.call_args[0][1]
         for quality in VALID_ALIGNMENT_QUALITIES:
@@ -449,14 +428,14 @@ class TestGetAlignmentsByMarket:
     def test_validates_invalid_min_quality(self):
         """Test that invalid min_quality is rejected."""
         with pytest.raises(ValueError, match="min_quality must be one of"):
-            get_alignments_by_market(42, min_quality="excellent")
+            get_alignments_by_event(42, min_quality="excellent")
 
     @patch("precog.database.crud_ledger.fetch_all")
     def test_respects_limit(self, mock_fetch_all):
         """Test that custom limit is applied."""
         mock_fetch_all.return_value = []
 
-        get_alignments_by_market(42, limit=25)
+        get_alignments_by_event(42, limit=25)
 
         params = mock_fetch_all.call_args[0][1]
         assert 25 in params
@@ -466,31 +445,31 @@ class TestGetAlignmentsByMarket:
         """Test that default limit of 100 is applied."""
         mock_fetch_all.return_value = []
 
-        get_alignments_by_market(42)
+        get_alignments_by_event(42)
 
         params = mock_fetch_all.call_args[0][1]
         assert 100 in params
 
     @patch("precog.database.crud_ledger.fetch_all")
-    def test_orders_by_snapshot_time_desc(self, mock_fetch_all):
-        """Test that query orders by snapshot_time DESC, id DESC."""
+    def test_orders_by_aligned_at_desc(self, mock_fetch_all):
+        """Test that query orders by aligned_at DESC, id DESC."""
         mock_fetch_all.return_value = []
 
-        get_alignments_by_market(42)
+        get_alignments_by_event(42)
 
         query = mock_fetch_all.call_args[0][0]
-        assert "ORDER BY snapshot_time DESC, id DESC" in query
+        assert "ORDER BY aligned_at DESC, id DESC" in query
 
     @patch("precog.database.crud_ledger.fetch_all")
-    def test_filters_by_market_id(self, mock_fetch_all):
-        """Test that query filters by market_id."""
+    def test_filters_by_canonical_event_id(self, mock_fetch_all):
+        """Test that query filters by canonical_event_id."""
         mock_fetch_all.return_value = []
 
-        get_alignments_by_market(42)
+        get_alignments_by_event(42)
 
         query = mock_fetch_all.call_args[0][0]
         params = mock_fetch_all.call_args[0][1]
-        assert "market_id = %s" in query
+        assert "canonical_event_id = %s" in query
         assert 42 in params
 
     @patch("precog.database.crud_ledger.fetch_all")
@@ -498,7 +477,7 @@ class TestGetAlignmentsByMarket:
         """Test that min_quality='fair' includes fair, good, and exact."""
         mock_fetch_all.return_value = []
 
-        get_alignments_by_market(42, min_quality="fair")
+        get_alignments_by_event(42, min_quality="fair")
 
         params = mock_fetch_all.call_args[0][1]
         assert "fair" in params
@@ -512,7 +491,7 @@ class TestGetAlignmentsByMarket:
         """Test that omitting min_quality does not add quality filter."""
         mock_fetch_all.return_value = []
 
-        get_alignments_by_market(42)
+        get_alignments_by_event(42)
 
         query = mock_fetch_all.call_args[0][0]
         assert "alignment_quality IN" not in query
@@ -577,3 +577,198 @@ class TestUpdateMarketEnrichment:
         assert 500 in snap_params  # volume_24h as int
         assert 100 in snap_params  # yes_bid_size as int
         assert 75 in snap_params  # yes_ask_size as int
+
+
+@pytest.mark.unit
+class TestGetCurrentMarketsByTickers:
+    """Test the bulk current-market lookup."""
+
+    @patch("precog.database.crud_markets.fetch_all")
+    def test_single_query_keyed_by_ticker(self, mock_fetch_all):
+        """All tickers are resolved with one ANY(%s) query."""
+        from precog.database.crud_markets import get_current_markets_by_tickers
+
+        mock_fetch_all.return_value = [
+            {"ticker": "A", "yes_ask_price": Decimal("0.5000")},
+            {"ticker": "B", "yes_ask_price": Decimal("0.6000")},
+        ]
+
+        result = get_current_markets_by_tickers(["A", "B", "C"])
+
+        mock_fetch_all.assert_called_once()
+        sql, params = mock_fetch_all.call_args[0]
+        assert "ANY(%s)" in sql
+        assert params == (["A", "B", "C"],)
+        assert set(result) == {"A", "B"}
+        assert result["B"]["yes_ask_price"] == Decimal("0.6000")
+
+    @patch("precog.database.crud_markets.fetch_all")
+    def test_empty_input_skips_query(self, mock_fetch_all):
+        """No tickers means no round trip."""
+        from precog.database.crud_markets import get_current_markets_by_tickers
+
+        assert get_current_markets_by_tickers([]) == {}
+        mock_fetch_all.assert_not_called()
+
+
+@pytest.mark.unit
+class TestUpdateMarketsWithVersioningBatch:
+    """Test the batched SCD Type 2 market writer."""
+
+    def _wire(self, mock_get_cursor, resolved):
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = resolved
+        mock_get_cursor.return_value.__enter__ = MagicMock(return_value=mock_cursor)
+        mock_get_cursor.return_value.__exit__ = MagicMock(return_value=False)
+        return mock_cursor
+
+    def test_empty_rows_is_noop(self):
+        """No rows means no transaction."""
+        from precog.database.crud_markets import update_markets_with_versioning_batch
+
+        with patch("precog.database.crud_markets.get_cursor") as mock_get_cursor:
+            assert update_markets_with_versioning_batch([]) == {}
+        mock_get_cursor.assert_not_called()
+
+    @patch("precog.database.crud_markets.execute_values")
+    @patch("precog.database.crud_markets.get_cursor")
+    def test_rows_staged_then_written_set_based(self, mock_get_cursor, mock_execute_values):
+        """Rows are staged once; the merge and writes are single set-based statements."""
+        from precog.database.crud_markets import update_markets_with_versioning_batch
+
+        mock_cursor = self._wire(
+            mock_get_cursor,
+            [{"ticker": "A", "market_id": 1}, {"ticker": "B", "market_id": 2}],
+        )
+
+        result = update_markets_with_versioning_batch(
+            [
+                {"ticker": "A", "yes_ask_price": Decimal("0.5500")},
+                {"ticker": "B", "status": "closed", "market_metadata": {"k": "v"}},
+            ]
+        )
+
+        assert result == {"A": 1, "B": 2}
+        assert mock_get_cursor.call_count == 1
+
+        # One staging INSERT carrying the raw values (None = keep current)
+        mock_execute_values.assert_called_once()
+        stage_sql = mock_execute_values.call_args.args[1]
+        stage_params = mock_execute_values.call_args.args[2]
+        assert "INSERT INTO _market_version_stage" in stage_sql
+        assert stage_params[0][0] == "A"
+        assert Decimal("0.5500") in stage_params[0]
+        assert stage_params[0][1] is None  # status not given for A
+        assert stage_params[1][1:3] == ("closed", '{"k": "v"}')
+
+        statements = [c.args[0] for c in mock_cursor.execute.call_args_list]
+        assert len(statements) == 7
+        assert "CREATE TEMP TABLE _market_version_stage" in statements[0]
+        assert "ON COMMIT DROP" in statements[0]
+        assert "FOR UPDATE OF ms" in statements[2]
+        assert "COALESCE(s.yes_ask_price, c.yes_ask_price)" in statements[3]
+        assert "COALESCE(s.status, m.status)" in statements[4]
+        # Close runs before insert so the partial unique index holds
+        assert "row_current_ind = FALSE" in statements[5]
+        assert "INSERT INTO market_snapshots" in statements[6]
+
+    @patch("precog.database.crud_markets.execute_values")
+    @patch("precog.database.crud_markets.get_cursor")
+    def test_statement_count_independent_of_batch_size(self, mock_get_cursor, mock_execute_values):
+        """A large batch issues the same statements as a small one."""
+        from precog.database.crud_markets import update_markets_with_versioning_batch
+
+        tickers = [f"T{i}" for i in range(500)]
+        mock_cursor = self._wire(
+            mock_get_cursor, [{"ticker": t, "market_id": i} for i, t in enumerate(tickers)]
+        )
+
+        update_markets_with_versioning_batch(
+            [{"ticker": t, "yes_ask_price": Decimal("0.5000")} for t in tickers]
+        )
+
+        assert mock_cursor.execute.call_count == 7
+        assert mock_execute_values.call_count == 1
+        assert mock_execute_values.call_args.kwargs["page_size"] == 500
+
+    @patch("precog.database.crud_markets.execute_values")
+    @patch("precog.database.crud_markets.get_cursor")
+    def test_missing_market_raises_before_writes(self, mock_get_cursor, mock_execute_values):
+        """Unknown tickers abort the batch before any lock or write."""
+        from precog.database.crud_markets import update_markets_with_versioning_batch
+
+        mock_cursor = self._wire(mock_get_cursor, [{"ticker": "A", "market_id": 1}])
+
+        with pytest.raises(ValueError, match="Markets not found: B"):
+            update_markets_with_versioning_batch(
+                [{"ticker": "A", "status": "closed"}, {"ticker": "B", "status": "closed"}]
+            )
+        statements = [c.args[0] for c in mock_cursor.execute.call_args_list]
+        assert len(statements) == 2
+        assert not any("UPDATE markets" in sql or "market_snapshots" in sql for sql in statements)
+
+    def test_rejects_float_prices(self):
+        """Decimal enforcement matches the single-row writer."""
+        from precog.database.crud_markets import update_markets_with_versioning_batch
+
+        with pytest.raises(TypeError, match="yes_ask_price must be Decimal"):
+            update_markets_with_versioning_batch([{"ticker": "A", "yes_ask_price": 0.55}])
+
+    def test_rejects_unknown_keys(self):
+        """Typos in row keys fail loudly instead of being silently dropped."""
+        from precog.database.crud_markets import update_markets_with_versioning_batch
+
+        with pytest.raises(ValueError, match="unknown keys"):
+            update_markets_with_versioning_batch([{"ticker": "A", "yes_price": Decimal("0.5")}])
+
+
+@pytest.mark.unit
+class TestInsertOrderbookSnapshotsBatch:
+    """Test the batched orderbook snapshot writer."""
+
+    def test_empty_input_is_noop(self):
+        """No snapshots means no transaction."""
+        from precog.database.crud_markets import insert_orderbook_snapshots_batch
+
+        with patch("precog.database.crud_markets.get_cursor") as mock_get_cursor:
+            assert insert_orderbook_snapshots_batch([]) == []
+        mock_get_cursor.assert_not_called()
+
+    @patch("precog.database.crud_markets.execute_values")
+    @patch("precog.database.crud_markets.get_cursor")
+    def test_single_statement_for_all_rows(self, mock_get_cursor, mock_execute_values):
+        """All snapshots go through one execute_values INSERT ... RETURNING id."""
+        from precog.database.crud_markets import insert_orderbook_snapshots_batch
+
+        mock_get_cursor.return_value.__enter__ = MagicMock(return_value=MagicMock())
+        mock_get_cursor.return_value.__exit__ = MagicMock(return_value=False)
+        mock_execute_values.return_value = [{"id": 7}, {"id": 8}]
+
+        ids = insert_orderbook_snapshots_batch(
+            [
+                {"market_id": 1, "best_bid": Decimal("0.5000"), "bid_prices": [Decimal("0.5")]},
+                {"market_id": 2, "levels": 3},
+            ]
+        )
+
+        assert ids == [7, 8]
+        mock_execute_values.assert_called_once()
+        sql = mock_execute_values.call_args.args[1]
+        params = mock_execute_values.call_args.args[2]
+        assert "INSERT INTO orderbook_snapshots" in sql
+        assert "RETURNING id" in sql
+        assert params[0][:2] == (1, Decimal("0.5000"))
+        assert params[1][0] == 2
+        assert params[1][-1] == 3
+        assert mock_execute_values.call_args.kwargs["fetch"] is True
+
+    def test_validation(self):
+        """Missing market_id, unknown keys and float prices are rejected."""
+        from precog.database.crud_markets import insert_orderbook_snapshots_batch
+
+        with pytest.raises(ValueError, match="missing market_id"):
+            insert_orderbook_snapshots_batch([{"best_bid": Decimal("0.5")}])
+        with pytest.raises(ValueError, match="unknown keys"):
+            insert_orderbook_snapshots_batch([{"market_id": 1, "mid": Decimal("0.5")}])
+        with pytest.raises(TypeError):
+            insert_orderbook_snapshots_batch([{"market_id": 1, "best_bid": 0.5}])
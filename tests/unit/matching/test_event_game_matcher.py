@@ -129,7 +129,7 @@ class TestMatchEvent:
 class TestBackfillUnlinkedEvents:
     """Tests for EventGameMatcher.backfill_unlinked_events()."""
 
-    @patch("precog.database.crud_game_states.update_event_game_id")
+    @patch("precog.database.crud_game_states.update_event_game_ids_batch")
     @patch("precog.database.crud_game_states.find_unlinked_sports_events")
     def test_backfill_links_events(
         self,
@@ -151,7 +151,7 @@ class TestBackfillUnlinkedEvents:
                 "subcategory": "nfl",
             },
         ]
-        mock_update.return_value = True
+        mock_update.side_effect = lambda links: [event_id for event_id, _ in links]
 
         matcher = EventGameMatcher(registry=_make_registry())
 
@@ -159,9 +159,10 @@ class TestBackfillUnlinkedEvents:
             count = matcher.backfill_unlinked_events("nfl")
 
         assert count == 2
-        assert mock_update.call_count == 2
+        # All matches are linked with one bulk UPDATE
+        mock_update.assert_called_once()
 
-    @patch("precog.database.crud_game_states.update_event_game_id")
+    @patch("precog.database.crud_game_states.update_event_game_ids_batch")
     @patch("precog.database.crud_game_states.find_unlinked_sports_events")
     def test_backfill_no_unlinked(
         self,
@@ -177,7 +178,7 @@ class TestBackfillUnlinkedEvents:
         assert count == 0
         mock_update.assert_not_called()
 
-    @patch("precog.database.crud_game_states.update_event_game_id")
+    @patch("precog.database.crud_game_states.update_event_game_ids_batch")
     @patch("precog.database.crud_game_states.find_unlinked_sports_events")
     def test_backfill_partial_match(
         self,
@@ -194,7 +195,13 @@ class TestBackfillUnlinkedEvents:
                 "subcategory": "politics",
             },
         ]
-        mock_update.return_value = True
+        sent: list[tuple[int, int]] = []
+
+        def link(links):
+            sent.extend(links)
+            return [event_id for event_id, _ in sent]
+
+        mock_update.side_effect = link
 
         matcher = EventGameMatcher(registry=_make_registry())
 
@@ -204,6 +211,68 @@ class TestBackfillUnlinkedEvents:
 
         # Only 1 match (the NFL event), politics ticker won't parse
         assert count == 1
+        assert sent == [(1, 42)]
+
+    @patch("precog.database.crud_game_states.update_event_game_ids_batch")
+    @patch("precog.database.crud_game_states.find_unlinked_sports_events")
+    def test_backfill_counts_only_updated_rows(
+        self,
+        mock_find_unlinked: MagicMock,
+        mock_update: MagicMock,
+    ) -> None:
+        """Events the bulk UPDATE did not change are not counted as linked."""
+        mock_find_unlinked.return_value = [
+            {"id": 1, "external_id": "KXNFLGAME-26JAN18HOUNE", "title": None, "subcategory": "nfl"},
+            {"id": 2, "external_id": "KXNFLGAME-26JAN18KCBUF", "title": None, "subcategory": "nfl"},
+        ]
+        mock_update.return_value = [2]
+
+        matcher = EventGameMatcher(registry=_make_registry())
+
+        with patch.object(matcher, "_find_game", return_value=42):
+            count = matcher.backfill_unlinked_events("nfl")
+
+        assert count == 1
+
+    @patch("precog.database.crud_game_states.update_event_game_ids_batch")
+    @patch("precog.database.crud_game_states.find_unlinked_sports_events")
+    def test_backfill_no_matches_skips_update(
+        self,
+        mock_find_unlinked: MagicMock,
+        mock_update: MagicMock,
+    ) -> None:
+        """No resolved matches means no UPDATE round trip."""
+        mock_find_unlinked.return_value = [
+            {"id": 1, "external_id": "KXNFLGAME-26JAN18HOUNE", "title": None, "subcategory": "nfl"},
+        ]
+
+        matcher = EventGameMatcher(registry=_make_registry())
+
+        with patch.object(matcher, "_find_game", return_value=None):
+            count = matcher.backfill_unlinked_events("nfl")
+
+        assert count == 0
+        mock_update.assert_not_called()
+
+
+# =============================================================================
+# Game Index Integration Tests
+# =============================================================================
+
+
+class TestFindGameUsesIndex:
+    """EventGameMatcher._find_game() is served by the injected GameIndex."""
+
+    def test_match_event_uses_game_index(self) -> None:
+        """Matching goes through GameIndex.lookup with ESPN codes."""
+        index = MagicMock()
+        index.lookup.return_value = 7
+
+        matcher = EventGameMatcher(registry=_make_registry(), game_index=index)
+        result = matcher.match_event("KXNFLGAME-26JAN18JACNE")
+
+        assert result == 7
+        index.lookup.assert_called_once_with("nfl", date(2026, 1, 18), "NE", "JAX")
 
 
 # =============================================================================
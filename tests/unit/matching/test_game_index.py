@@ -0,0 +1,310 @@
+"""Unit tests for GameIndex.
+
+Tests the in-memory game lookup with a mocked games-table reader.
+No database required — get_games_for_matching and find_game_by_matchup
+are patched.
+
+Related:
+    - Issue #462: Event-to-game matching
+    - Issue #524: Fuzzy date matching for ET/UTC offset
+    - src/precog/matching/game_index.py
+"""
+
+from datetime import UTC, date, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from precog.matching.game_index import WATERMARK_OVERLAP, GameIndex
+
+TODAY = date(2026, 1, 18)
+T0 = datetime(2026, 1, 18, 12, 0, tzinfo=UTC)
+
+
+def _game(
+    game_id: int,
+    game_date: date,
+    home: str,
+    away: str,
+    sport: str = "football",
+    updated_at: datetime = T0,
+) -> dict:
+    return {
+        "id": game_id,
+        "sport": sport,
+        "game_date": game_date,
+        "home_team_code": home,
+        "away_team_code": away,
+        "updated_at": updated_at,
+    }
+
+
+class _Clock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _make_index(clock: _Clock | None = None, **kwargs) -> GameIndex:
+    return GameIndex(
+        days_back=7,
+        days_ahead=7,
+        clock=clock or _Clock(),
+        today=lambda: TODAY,
+        **kwargs,
+    )
+
+
+# =============================================================================
+# Lookup Tests
+# =============================================================================
+
+
+class TestLookup:
+    """Tests for GameIndex.lookup() matching semantics."""
+
+    @patch("precog.database.crud_game_states.get_games_for_matching")
+    def test_exact_match(self, mock_read: MagicMock) -> None:
+        """Exact natural key returns the game id."""
+        mock_read.return_value = [_game(42, TODAY, "NE", "HOU")]
+
+        index = _make_index()
+
+        assert index.lookup("nfl", TODAY, "NE", "HOU") == 42
+        assert index.get_stats()["game_index_hits"] == 1
+
+    @patch("precog.database.crud_game_states.get_games_for_matching")
+    def test_league_maps_to_sport(self, mock_read: MagicMock) -> None:
+        """NFL and NCAAF share the 'football' key space, like the SQL lookup."""
+        mock_read.return_value = [_game(42, TODAY, "NE", "HOU")]
+
+        index = _make_index()
+
+        assert index.lookup("ncaaf", TODAY, "NE", "HOU") == 42
+        assert index.lookup("nba", TODAY, "NE", "HOU") is None
+
+    @pytest.mark.parametrize("offset", [-1, 1])
+    @patch("precog.database.crud_game_states.get_games_for_matching")
+    def test_fuzzy_one_day(self, mock_read: MagicMock, offset: int) -> None:
+        """A single game one day off (ET vs UTC) is matched."""
+        mock_read.return_value = [_game(42, TODAY + timedelta(days=offset), "NE", "HOU")]
+
+        index = _make_index()
+
+        assert index.lookup("nfl", TODAY, "NE", "HOU") == 42
+
+    @patch("precog.database.crud_game_states.get_games_for_matching")
+    def test_exact_wins_over_neighbours(self, mock_read: MagicMock) -> None:
+        """Exact date takes priority over +/-1 day candidates."""
+        mock_read.return_value = [
+            _game(41, TODAY - timedelta(days=1), "NE", "HOU"),
+            _game(42, TODAY, "NE", "HOU"),
+            _game(43, TODAY + timedelta(days=1), "NE", "HOU"),
+        ]
+
+        index = _make_index()
+
+        assert index.lookup("nfl", TODAY, "NE", "HOU") == 42
+
+    @patch("precog.database.crud_game_states.get_games_for_matching")
+    def test_ambiguous_neighbours_return_none(self, mock_read: MagicMock) -> None:
+        """Back-to-back games on both neighbouring days are not guessed."""
+        mock_read.return_value = [
+            _game(41, TODAY - timedelta(days=1), "NE", "HOU"),
+            _game(43, TODAY + timedelta(days=1), "NE", "HOU"),
+        ]
+
+        index = _make_index()
+
+        assert index.lookup("nfl", TODAY, "NE", "HOU") is None
+        assert index.get_stats()["game_index_misses"] == 1
+
+    @patch("precog.database.crud_game_states.find_game_by_matchup")
+    @patch("precog.database.crud_game_states.get_games_for_matching")
+    def test_outside_window_falls_back_to_sql(
+        self, mock_read: MagicMock, mock_find: MagicMock
+    ) -> None:
+        """Historical dates are delegated to find_game_by_matchup()."""
+        mock_read.return_value = []
+        mock_find.return_value = 9
+
+        index = _make_index()
+        old_date = TODAY - timedelta(days=30)
+
+        assert index.lookup("nfl", old_date, "NE", "HOU") == 9
+        mock_find.assert_called_once_with(
+            league="nfl", game_date=old_date, home_team_code="NE", away_team_code="HOU"
+        )
+        assert index.get_stats()["game_index_fallbacks"] == 1
+
+    @patch("precog.database.crud_game_states.find_game_by_matchup")
+    @patch("precog.database.crud_game_states.get_games_for_matching")
+    def test_window_edge_falls_back(self, mock_read: MagicMock, mock_find: MagicMock) -> None:
+        """A date whose +/-1 day neighbour is outside the window is not answered from memory."""
+        mock_read.return_value = []
+        mock_find.return_value = None
+
+        index = _make_index()
+        index.lookup("nfl", TODAY + timedelta(days=7), "NE", "HOU")
+
+        mock_find.assert_called_once()
+
+    @patch("precog.database.crud_game_states.find_game_by_matchup")
+    @patch("precog.database.crud_game_states.get_games_for_matching")
+    def test_unknown_league_falls_back(self, mock_read: MagicMock, mock_find: MagicMock) -> None:
+        """Unknown leagues keep the SQL path's warning and None result."""
+        mock_read.return_value = []
+        mock_find.return_value = None
+
+        index = _make_index()
+
+        assert index.lookup("cricket", TODAY, "A", "B") is None
+        mock_find.assert_called_once()
+
+
+# =============================================================================
+# Refresh Tests
+# =============================================================================
+
+
+class TestRefresh:
+    """Tests for incremental and full refreshes."""
+
+    @patch("precog.database.crud_game_states.get_games_for_matching")
+    def test_first_lookup_loads_full_window(self, mock_read: MagicMock) -> None:
+        """The first lookup reads the whole window without a watermark."""
+        mock_read.return_value = []
+
+        index = _make_index()
+        index.lookup("nfl", TODAY, "NE", "HOU")
+
+        mock_read.assert_called_once_with(TODAY - timedelta(days=7), TODAY + timedelta(days=7))
+
+    @patch("precog.database.crud_game_states.get_games_for_matching")
+    def test_lookups_within_refresh_interval_do_not_query(self, mock_read: MagicMock) -> None:
+        """Repeated lookups are served from memory until refresh_seconds passes."""
+        mock_read.return_value = [_game(42, TODAY, "NE", "HOU")]
+        clock = _Clock()
+
+        index = _make_index(clock, refresh_seconds=60)
+        for _ in range(100):
+            index.lookup("nfl", TODAY, "NE", "HOU")
+        clock.now = 30.0
+        index.lookup("nfl", TODAY, "NE", "HOU")
+
+        assert mock_read.call_count == 1
+
+    @patch("precog.database.crud_game_states.get_games_for_matching")
+    def test_incremental_refresh_uses_watermark(self, mock_read: MagicMock) -> None:
+        """Later refreshes only read rows updated since the watermark."""
+        mock_read.return_value = [_game(42, TODAY, "NE", "HOU")]
+        clock = _Clock()
+        index = _make_index(clock, refresh_seconds=60)
+        index.refresh()
+
+        new_game = _game(43, TODAY, "BUF", "KC", updated_at=T0 + timedelta(minutes=1))
+        mock_read.reset_mock()
+        mock_read.return_value = [new_game]
+        clock.now = 61.0
+
+        assert index.lookup("nfl", TODAY, "BUF", "KC") == 43
+        assert index.lookup("nfl", TODAY, "NE", "HOU") == 42
+        mock_read.assert_called_once_with(
+            TODAY - timedelta(days=7), TODAY + timedelta(days=7), T0 - WATERMARK_OVERLAP
+        )
+
+    @patch("precog.database.crud_game_states.get_games_for_matching")
+    def test_rekeyed_game_replaces_old_key(self, mock_read: MagicMock) -> None:
+        """A game whose date moved is no longer found under the old date."""
+        mock_read.return_value = [_game(42, TODAY, "NE", "HOU")]
+        index = _make_index()
+        index.refresh()
+
+        mock_read.return_value = [
+            _game(42, TODAY + timedelta(days=3), "NE", "HOU", updated_at=T0 + timedelta(hours=1))
+        ]
+        index.refresh()
+
+        assert index.lookup("nfl", TODAY, "NE", "HOU") is None
+        assert index.lookup("nfl", TODAY + timedelta(days=3), "NE", "HOU") == 42
+        assert len(index) == 1
+
+    @patch("precog.database.crud_game_states.get_games_for_matching")
+    def test_window_roll_reads_new_days_and_prunes_old(self, mock_read: MagicMock) -> None:
+        """Days entering the window are read in full; days leaving it are dropped."""
+        current = {"today": TODAY}
+        index = GameIndex(days_back=7, days_ahead=7, today=lambda: current["today"])
+        mock_read.return_value = [_game(40, TODAY - timedelta(days=7), "NE", "HOU")]
+        index.refresh()
+
+        current["today"] = TODAY + timedelta(days=2)
+        mock_read.reset_mock()
+        mock_read.side_effect = [[], [_game(44, TODAY + timedelta(days=9), "NE", "HOU")]]
+        index.refresh()
+
+        assert mock_read.call_count == 2
+        assert mock_read.call_args_list[1].args == (
+            TODAY + timedelta(days=8),
+            TODAY + timedelta(days=9),
+        )
+        assert len(index) == 1
+        assert index.get_stats()["game_index_size"] == 1
+
+    @patch("precog.database.crud_game_states.get_games_for_matching")
+    def test_full_reload_drops_deleted_games(self, mock_read: MagicMock) -> None:
+        """After full_reload_seconds the window is rebuilt from scratch."""
+        mock_read.return_value = [_game(42, TODAY, "NE", "HOU")]
+        clock = _Clock()
+        index = _make_index(clock, full_reload_seconds=3600)
+        index.refresh()
+
+        mock_read.return_value = []
+        clock.now = 3600.0
+        index.refresh()
+
+        assert len(index) == 0
+        assert mock_read.call_args.args == (TODAY - timedelta(days=7), TODAY + timedelta(days=7))
+
+    @patch("precog.database.crud_game_states.get_games_for_matching")
+    def test_clear_forces_full_load(self, mock_read: MagicMock) -> None:
+        """clear() empties the index and the next lookup reloads everything."""
+        mock_read.return_value = [_game(42, TODAY, "NE", "HOU")]
+        index = _make_index()
+        index.refresh()
+
+        index.clear()
+
+        assert len(index) == 0
+        assert index.lookup("nfl", TODAY, "NE", "HOU") == 42
+        assert len(mock_read.call_args.args) == 2
+
+    @patch("precog.database.crud_game_states.get_games_for_matching")
+    def test_refresh_error_propagates(self, mock_read: MagicMock) -> None:
+        """Database errors surface to the caller, as with the SQL lookup."""
+        mock_read.side_effect = RuntimeError("db down")
+
+        index = _make_index()
+
+        with pytest.raises(RuntimeError, match="db down"):
+            index.lookup("nfl", TODAY, "NE", "HOU")
+
+
+class TestValidation:
+    """Constructor argument validation."""
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"days_back": -1},
+            {"days_ahead": -1},
+            {"refresh_seconds": -1},
+            {"full_reload_seconds": -1},
+        ],
+    )
+    def test_negative_values_rejected(self, kwargs: dict) -> None:
+        with pytest.raises(ValueError, match=">= 0"):
+            GameIndex(**kwargs)
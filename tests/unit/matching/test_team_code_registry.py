@@ -320,6 +320,16 @@ class TestNeedsRefresh:
         registry.record_unknown_code("zzz", "nfl")
         assert "ZZZ:nfl" in registry.unknown_codes_seen
 
+    def test_unknown_codes_are_bounded(self) -> None:
+        """Only the most recent MAX_UNKNOWN_CODES unknown codes are kept."""
+        registry = TeamCodeRegistry()
+        registry.load_from_data(NFL_TEAMS)
+        for i in range(TeamCodeRegistry.MAX_UNKNOWN_CODES + 5):
+            registry.record_unknown_code(f"Z{i}", "nfl")
+
+        assert len(registry.unknown_codes_seen) == TeamCodeRegistry.MAX_UNKNOWN_CODES
+        assert registry.get_state_stats()["unknown_team_codes_evictions"] == 5
+
     def test_no_refresh_with_zero_max_age_and_fresh(self) -> None:
         """With max_age_seconds=0, a freshly loaded registry still needs refresh
         (age > 0 seconds)."""
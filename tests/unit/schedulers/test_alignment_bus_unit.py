@@ -0,0 +1,112 @@
+"""
+Unit Tests for AlignmentEventBus.
+
+Tests the in-process publish/subscribe of game state and market snapshot
+writes used by the streaming temporal aligner.
+
+Reference: TESTING_STRATEGY V3.9 - Unit tests for isolated functionality
+
+Usage:
+    pytest tests/unit/schedulers/test_alignment_bus_unit.py -v -m unit
+"""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from precog.schedulers.alignment_bus import (
+    AlignmentEventBus,
+    GameStateWritten,
+    SnapshotsWritten,
+    get_alignment_event_bus,
+)
+
+
+def _state(game_id: int = 7, game_state_id: int = 100) -> GameStateWritten:
+    return GameStateWritten(
+        game_id=game_id,
+        game_state_id=game_state_id,
+        state_time=datetime(2026, 1, 18, 20, 0, tzinfo=UTC),
+    )
+
+
+@pytest.mark.unit
+class TestAlignmentEventBus:
+    """Test subscription, delivery and error isolation."""
+
+    def test_no_listeners_is_noop(self):
+        """Publishing without subscribers does nothing and reports no listeners."""
+        bus = AlignmentEventBus()
+        assert not bus.has_listeners
+        bus.publish_snapshots([1, 2])
+        bus.publish_game_state(_state())
+
+    def test_game_state_delivered(self):
+        """Game state listeners receive the published event unchanged."""
+        bus = AlignmentEventBus()
+        received: list[GameStateWritten] = []
+        bus.add_game_state_listener(received.append)
+
+        event = _state()
+        bus.publish_game_state(event)
+
+        assert bus.has_listeners
+        assert received == [event]
+
+    def test_snapshots_deduplicated_and_stamped(self):
+        """Market ids are de-duplicated in order and stamped with a UTC time."""
+        bus = AlignmentEventBus()
+        received: list[SnapshotsWritten] = []
+        bus.add_snapshot_listener(received.append)
+
+        bus.publish_snapshots([3, 1, 3, 2])
+
+        assert len(received) == 1
+        assert received[0].market_ids == (3, 1, 2)
+        assert received[0].written_at.tzinfo is UTC
+
+    def test_empty_snapshot_publish_skipped(self):
+        """An empty id list does not reach listeners."""
+        bus = AlignmentEventBus()
+        received: list[SnapshotsWritten] = []
+        bus.add_snapshot_listener(received.append)
+
+        bus.publish_snapshots([])
+
+        assert received == []
+
+    def test_remove_listener(self):
+        """Removed listeners stop receiving; removing twice is harmless."""
+        bus = AlignmentEventBus()
+        received: list[SnapshotsWritten] = []
+        bus.add_snapshot_listener(received.append)
+        bus.remove_snapshot_listener(received.append)
+        bus.remove_snapshot_listener(received.append)
+
+        bus.publish_snapshots([1])
+
+        assert received == []
+        assert not bus.has_listeners
+
+    def test_failing_listener_isolated(self):
+        """A raising listener is counted and does not stop the others."""
+        bus = AlignmentEventBus()
+        received: list[GameStateWritten] = []
+
+        def broken(event: GameStateWritten) -> None:
+            raise RuntimeError("boom")
+
+        bus.add_game_state_listener(broken)
+        bus.add_game_state_listener(received.append)
+
+        bus.publish_game_state(_state())
+
+        assert len(received) == 1
+        stats = bus.get_stats()
+        assert stats["alignment_bus_listener_errors"] == 1
+        assert stats["alignment_bus_game_state_listeners"] == 2
+        assert stats["alignment_bus_snapshot_listeners"] == 0
+
+    def test_shared_bus_is_singleton(self):
+        """get_alignment_event_bus() returns one instance per process."""
+        assert get_alignment_event_bus() is get_alignment_event_bus()
@@ -15,6 +15,7 @@ import logging
 import pytest
 
 from precog.schedulers.base_poller import BasePoller, PollerStats
+from precog.utils.metrics import get_metrics_registry
 
 # =============================================================================
 # Concrete Test Implementation
@@ -255,6 +256,23 @@ class TestPollWrapper:
         assert stats["items_updated"] == 4
         assert stats["items_created"] == 2
 
+    def test_poll_wrapper_records_metrics(self) -> None:
+        """Test poll wrapper feeds the shared metrics registry."""
+        registry = get_metrics_registry()
+        duration = registry.get("precog_poll_duration_seconds").labels("MockPoller")
+        fetched = registry.get("precog_poll_items_total").labels("MockPoller", "fetched")
+        errors = registry.get("precog_poll_errors_total").labels("MockPoller")
+        polls_before = duration.snapshot()["count"]
+        fetched_before = fetched.value
+        errors_before = errors.value
+
+        MockPoller(poll_result={"items_fetched": 4})._poll_wrapper()
+        MockPoller(poll_error=RuntimeError("boom"))._poll_wrapper()
+
+        assert duration.snapshot()["count"] == polls_before + 1
+        assert fetched.value == fetched_before + 4
+        assert errors.value == errors_before + 1
+
 
 # =============================================================================
 # Unit Tests: Get Job Name
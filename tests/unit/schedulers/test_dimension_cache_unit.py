@@ -0,0 +1,118 @@
+"""
+Unit Tests for DimensionCache.
+
+Tests the TTL cache of team, venue and games-dimension IDs that
+ESPNGamePoller reuses across scoreboard polls.
+
+Reference: TESTING_STRATEGY V3.9 - Unit tests for isolated functionality
+
+Usage:
+    pytest tests/unit/schedulers/test_dimension_cache_unit.py -v -m unit
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from precog.schedulers.dimension_cache import DimensionCache
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.unit
+class TestDimensionCache:
+    """Test loading, TTL expiry, LRU eviction and counters."""
+
+    def test_loads_once_within_ttl(self):
+        """The loader runs on the first lookup only."""
+        cache = DimensionCache(ttl_seconds=60, clock=FakeClock())
+        loader = MagicMock(return_value=42)
+
+        assert cache.get_or_load(("team", "nfl", "12"), loader) == 42
+        assert cache.get_or_load(("team", "nfl", "12"), loader) == 42
+
+        loader.assert_called_once()
+        stats = cache.get_stats()
+        assert stats["dimension_cache_hits"] == 1
+        assert stats["dimension_cache_misses"] == 1
+        assert stats["dimension_cache_size"] == 1
+
+    def test_entry_expires_after_ttl(self):
+        """After ttl_seconds the loader runs again and the new value is kept."""
+        clock = FakeClock()
+        cache = DimensionCache(ttl_seconds=60, clock=clock)
+        cache.get_or_load("k", lambda: 1)
+
+        clock.now += 59
+        assert cache.get_or_load("k", lambda: 2) == 1
+        clock.now += 1
+        assert cache.get_or_load("k", lambda: 2) == 2
+
+    def test_none_is_cached(self):
+        """A negative lookup (None) is cached like any other value."""
+        cache = DimensionCache(ttl_seconds=60, clock=FakeClock())
+        loader = MagicMock(return_value=None)
+
+        assert cache.get_or_load("missing", loader) is None
+        assert cache.get_or_load("missing", loader) is None
+        loader.assert_called_once()
+
+    def test_loader_error_not_cached(self):
+        """A failing loader propagates and the next lookup retries."""
+        cache = DimensionCache(ttl_seconds=60, clock=FakeClock())
+        loader = MagicMock(side_effect=[RuntimeError("db down"), 7])
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_load("k", loader)
+        assert cache.get_or_load("k", loader) == 7
+
+    def test_zero_ttl_disables_cache(self):
+        """ttl_seconds=0 calls the loader every time and stores nothing."""
+        cache = DimensionCache(ttl_seconds=0)
+        loader = MagicMock(return_value=1)
+
+        cache.get_or_load("k", loader)
+        cache.get_or_load("k", loader)
+        cache.put("other", 2)
+
+        assert loader.call_count == 2
+        assert len(cache) == 0
+        assert not cache.contains("other")
+
+    def test_evicts_least_recently_used(self):
+        """Beyond max_size the least recently used key is evicted."""
+        cache = DimensionCache(ttl_seconds=60, max_size=2, clock=FakeClock())
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get_or_load("a", lambda: 0)  # a is now most recently used
+        cache.put("c", 3)
+
+        assert cache.contains("a")
+        assert not cache.contains("b")
+        assert cache.contains("c")
+        assert cache.get_stats()["dimension_cache_evictions"] == 1
+
+    def test_invalidate_and_clear(self):
+        """Invalidated keys reload; clear drops everything."""
+        cache = DimensionCache(ttl_seconds=60, clock=FakeClock())
+        cache.put("a", 1)
+        cache.put("b", 2)
+
+        cache.invalidate("a")
+        assert cache.get_or_load("a", lambda: 10) == 10
+        cache.clear()
+        assert len(cache) == 0
+
+    @pytest.mark.parametrize(("ttl", "max_size"), [(-1, 10), (60, 0)])
+    def test_rejects_invalid_arguments(self, ttl, max_size):
+        """Negative TTL and non-positive max_size are rejected."""
+        with pytest.raises(ValueError):
+            DimensionCache(ttl_seconds=ttl, max_size=max_size)
@@ -10,6 +10,8 @@ Usage:
     pytest tests/unit/schedulers/test_espn_game_poller_unit.py -v -m unit
 """
 
+import threading
+import time
 from contextlib import nullcontext
 from decimal import Decimal
 from typing import Any
@@ -17,7 +19,9 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from precog.api_connectors.espn_client import ESPNAPIError
+from precog.api_connectors.espn_client import ESPNAPIError, ESPNClient
+from precog.schedulers import espn_game_poller
+from precog.schedulers.alignment_bus import AlignmentEventBus, GameStateWritten
 from precog.schedulers.espn_game_poller import (
     LEAGUE_STATE_DISCOVERY,
     LEAGUE_STATE_TRACKING,
@@ -33,6 +37,26 @@ from precog.validation.espn_validation import ValidationResult
 # =============================================================================
 
 
+@pytest.fixture(autouse=True)
+def batch_upsert_per_game():
+    """Route upsert_game_states_batch through upsert_game_state.
+
+    Scoreboard polls write through the batch function; tests here mock
+    upsert_game_state, so the batch is replaced by a per-game loop over the
+    (patched) module attribute.
+    """
+
+    def batch(states: list[dict]) -> dict:
+        return {
+            state["espn_event_id"]: espn_game_poller.upsert_game_state(**state) for state in states
+        }
+
+    with patch(
+        "precog.schedulers.espn_game_poller.upsert_game_states_batch", side_effect=batch
+    ) as mock_batch:
+        yield mock_batch
+
+
 @pytest.fixture
 def mock_espn_client() -> MagicMock:
     """Create mock ESPN client."""
@@ -2057,3 +2081,791 @@ class TestDataGapDetection:
 
         stats = poller.get_stats()
         assert stats["last_successful_poll"] is None
+
+
+# =============================================================================
+# Unit Tests: Live Elo on Game Finalization
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestLiveEloOnFinal:
+    """Tests for incremental Elo updates when a game goes final.
+
+    The updater itself is mocked; these tests cover the poller wiring:
+    opt-in flag, trigger condition (final game whose result is not yet
+    recorded), retry after a failure, and that an Elo failure never blocks
+    game state sync.
+    """
+
+    @staticmethod
+    def _final(sample_game_data: dict[str, Any]) -> dict[str, Any]:
+        sample_game_data["state"]["game_status"] = "final"
+        sample_game_data["state"]["home_score"] = 27
+        sample_game_data["state"]["away_score"] = 20
+        return sample_game_data
+
+    def test_disabled_by_default(self, mock_espn_client: MagicMock) -> None:
+        """No updater unless live_elo=True."""
+        poller = ESPNGamePoller(espn_client=mock_espn_client)
+        assert poller._live_elo is None
+        assert "elo_updates_applied" not in poller.get_stats()
+
+    def test_enabled_stats_merged(self, mock_espn_client: MagicMock) -> None:
+        """Updater counters appear in get_stats()."""
+        poller = ESPNGamePoller(espn_client=mock_espn_client, live_elo=True)
+        assert poller.get_stats()["elo_updates_applied"] == 0
+
+    @patch("precog.schedulers.espn_game_poller.update_game_result")
+    @patch("precog.schedulers.espn_game_poller.get_or_create_game")
+    @patch("precog.schedulers.espn_game_poller.get_team_by_espn_id")
+    @patch("precog.schedulers.espn_game_poller.upsert_game_state")
+    @patch("precog.schedulers.espn_game_poller.create_venue")
+    def test_applied_when_game_goes_final(
+        self,
+        mock_create_venue: MagicMock,
+        mock_upsert: MagicMock,
+        mock_get_team: MagicMock,
+        mock_get_or_create_game: MagicMock,
+        mock_update_result: MagicMock,
+        mock_espn_client: MagicMock,
+        sample_game_data: dict[str, Any],
+    ) -> None:
+        """New final state row -> one apply_final_game with resolved team ids."""
+        mock_get_team.side_effect = [{"team_id": 10}, {"team_id": 20}]
+        mock_create_venue.return_value = 100
+        mock_get_or_create_game.return_value = 42
+        mock_upsert.return_value = 7
+
+        poller = ESPNGamePoller(espn_client=mock_espn_client, live_elo=True)
+        poller._live_elo = MagicMock()
+
+        assert poller._sync_game_to_db(self._final(sample_game_data), "nfl")
+
+        poller._live_elo.apply_final_game.assert_called_once()
+        kwargs = poller._live_elo.apply_final_game.call_args.kwargs
+        assert kwargs["game_id"] == 42
+        assert kwargs["home_team_id"] == 10
+        assert kwargs["away_team_id"] == 20
+        assert kwargs["home_team_code"] == "ATL"
+        assert (kwargs["home_score"], kwargs["away_score"]) == (27, 20)
+        assert kwargs["game_date"].isoformat() == "2025-12-07"
+        assert kwargs["neutral_site"] is False
+
+    @patch("precog.schedulers.espn_game_poller.update_game_result")
+    @patch("precog.schedulers.espn_game_poller.get_or_create_game")
+    @patch("precog.schedulers.espn_game_poller.get_team_by_espn_id")
+    @patch("precog.schedulers.espn_game_poller.upsert_game_state")
+    @patch("precog.schedulers.espn_game_poller.create_venue")
+    def test_not_reapplied_once_recorded(
+        self,
+        mock_create_venue: MagicMock,
+        mock_upsert: MagicMock,
+        mock_get_team: MagicMock,
+        mock_get_or_create_game: MagicMock,
+        mock_update_result: MagicMock,
+        mock_espn_client: MagicMock,
+        sample_game_data: dict[str, Any],
+    ) -> None:
+        """Re-polled final game (upsert returns None) is not re-applied after success."""
+        mock_get_team.return_value = {"team_id": 1}
+        mock_create_venue.return_value = 100
+        mock_get_or_create_game.return_value = 42
+        mock_upsert.side_effect = [7, None]
+
+        poller = ESPNGamePoller(espn_client=mock_espn_client, live_elo=True)
+        poller._live_elo = MagicMock()
+
+        game = self._final(sample_game_data)
+        poller._sync_game_to_db(game, "nfl")
+        poller._sync_game_to_db(game, "nfl")
+
+        poller._live_elo.apply_final_game.assert_called_once()
+        mock_update_result.assert_called_once()
+
+    @patch("precog.schedulers.espn_game_poller.update_game_result")
+    @patch("precog.schedulers.espn_game_poller.get_or_create_game")
+    @patch("precog.schedulers.espn_game_poller.get_team_by_espn_id")
+    @patch("precog.schedulers.espn_game_poller.upsert_game_state")
+    @patch("precog.schedulers.espn_game_poller.create_venue")
+    def test_unrecorded_final_applied_without_new_state_row(
+        self,
+        mock_create_venue: MagicMock,
+        mock_upsert: MagicMock,
+        mock_get_team: MagicMock,
+        mock_get_or_create_game: MagicMock,
+        mock_update_result: MagicMock,
+        mock_espn_client: MagicMock,
+        sample_game_data: dict[str, Any],
+    ) -> None:
+        """A final already in game_states (restart) still gets its idempotent Elo step."""
+        mock_get_team.return_value = {"team_id": 1}
+        mock_create_venue.return_value = 100
+        mock_get_or_create_game.return_value = 42
+        mock_upsert.return_value = None
+
+        poller = ESPNGamePoller(espn_client=mock_espn_client, live_elo=True)
+        poller._live_elo = MagicMock()
+
+        assert not poller._sync_game_to_db(self._final(sample_game_data), "nfl")
+
+        poller._live_elo.apply_final_game.assert_called_once()
+
+    @patch("precog.schedulers.espn_game_poller.update_game_result")
+    @patch("precog.schedulers.espn_game_poller.get_or_create_game")
+    @patch("precog.schedulers.espn_game_poller.get_team_by_espn_id")
+    @patch("precog.schedulers.espn_game_poller.upsert_game_state")
+    @patch("precog.schedulers.espn_game_poller.create_venue")
+    def test_not_applied_while_in_progress(
+        self,
+        mock_create_venue: MagicMock,
+        mock_upsert: MagicMock,
+        mock_get_team: MagicMock,
+        mock_get_or_create_game: MagicMock,
+        mock_update_result: MagicMock,
+        mock_espn_client: MagicMock,
+        sample_game_data: dict[str, Any],
+    ) -> None:
+        """In-progress games never trigger an Elo update."""
+        mock_get_team.return_value = {"team_id": 1}
+        mock_create_venue.return_value = 100
+        mock_get_or_create_game.return_value = 42
+        mock_upsert.return_value = 7
+
+        poller = ESPNGamePoller(espn_client=mock_espn_client, live_elo=True)
+        poller._live_elo = MagicMock()
+
+        poller._sync_game_to_db(sample_game_data, "nfl")
+
+        poller._live_elo.apply_final_game.assert_not_called()
+
+    @patch("precog.schedulers.espn_game_poller.update_game_result")
+    @patch("precog.schedulers.espn_game_poller.get_or_create_game")
+    @patch("precog.schedulers.espn_game_poller.get_team_by_espn_id")
+    @patch("precog.schedulers.espn_game_poller.upsert_game_state")
+    @patch("precog.schedulers.espn_game_poller.create_venue")
+    def test_elo_error_does_not_block_sync(
+        self,
+        mock_create_venue: MagicMock,
+        mock_upsert: MagicMock,
+        mock_get_team: MagicMock,
+        mock_get_or_create_game: MagicMock,
+        mock_update_result: MagicMock,
+        mock_espn_client: MagicMock,
+        sample_game_data: dict[str, Any],
+    ) -> None:
+        """An exception from the updater is logged, sync still succeeds."""
+        mock_get_team.return_value = {"team_id": 1}
+        mock_create_venue.return_value = 100
+        mock_get_or_create_game.return_value = 42
+        mock_upsert.return_value = 7
+
+        poller = ESPNGamePoller(espn_client=mock_espn_client, live_elo=True)
+        poller._live_elo = MagicMock()
+        poller._live_elo.apply_final_game.side_effect = Exception("deadlock")
+
+        assert poller._sync_game_to_db(self._final(sample_game_data), "nfl")
+
+    @pytest.mark.parametrize("failing_step", ["result", "elo"])
+    @patch("precog.schedulers.espn_game_poller.update_game_result")
+    @patch("precog.schedulers.espn_game_poller.get_or_create_game")
+    @patch("precog.schedulers.espn_game_poller.get_team_by_espn_id")
+    @patch("precog.schedulers.espn_game_poller.upsert_game_state")
+    @patch("precog.schedulers.espn_game_poller.create_venue")
+    def test_failed_step_retried_next_poll(
+        self,
+        mock_create_venue: MagicMock,
+        mock_upsert: MagicMock,
+        mock_get_team: MagicMock,
+        mock_get_or_create_game: MagicMock,
+        mock_update_result: MagicMock,
+        failing_step: str,
+        mock_espn_client: MagicMock,
+        sample_game_data: dict[str, Any],
+    ) -> None:
+        """A failed result or Elo write is retried even though the state row is unchanged."""
+        mock_get_team.return_value = {"team_id": 1}
+        mock_create_venue.return_value = 100
+        mock_get_or_create_game.return_value = 42
+        mock_upsert.side_effect = [7, None, None]
+
+        poller = ESPNGamePoller(espn_client=mock_espn_client, live_elo=True)
+        poller._live_elo = MagicMock()
+        failure = [Exception("db down"), None]
+        if failing_step == "result":
+            mock_update_result.side_effect = failure
+        else:
+            poller._live_elo.apply_final_game.side_effect = failure
+
+        game = self._final(sample_game_data)
+        poller._sync_game_to_db(game, "nfl")
+        assert poller._unfinished_finals == {"401547417"}
+
+        poller._sync_game_to_db(game, "nfl")
+        poller._sync_game_to_db(game, "nfl")
+
+        assert mock_update_result.call_count == 2
+        assert poller._live_elo.apply_final_game.call_count == (
+            1 if failing_step == "result" else 2
+        )
+        assert poller._unfinished_finals == set()
+
+    def test_unfinished_final_rearmed_in_client(self, sample_game_data: dict[str, Any]) -> None:
+        """With scoreboard deltas, a final whose Elo failed is reported as changed again."""
+        client = MagicMock(spec=ESPNClient)
+        client.get_scoreboard_delta.return_value = {
+            "games": [sample_game_data],
+            "changed": [sample_game_data],
+            "not_modified": False,
+        }
+        poller = ESPNGamePoller(leagues=["nfl"], espn_client=client)
+        poller._unfinished_finals.add("401547417")
+
+        with patch.object(poller, "_sync_games_to_db", return_value=[False]):
+            poller._poll_league("nfl")
+
+        client.forget_events.assert_called_once_with("nfl", ["401547417"])
+
+    def test_on_start_warms_ratings(self, mock_espn_client: MagicMock) -> None:
+        """_on_start warms the updater for the polled leagues; failures are non-fatal."""
+        poller = ESPNGamePoller(
+            leagues=["nfl", "nba"],
+            espn_client=mock_espn_client,
+            validate_teams_on_start=False,
+            live_elo=True,
+        )
+        poller._live_elo = MagicMock()
+        poller._live_elo.warm.side_effect = Exception("db down")
+
+        poller._on_start()
+
+        poller._live_elo.warm.assert_called_once_with(["nfl", "nba"])
+
+
+# =============================================================================
+# Unit Tests: Dimension Cache and Batched Game Sync
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestDimensionCacheAndBatchSync:
+    """Tests for cached dimension lookups and the batched scoreboard upsert.
+
+    A re-polled scoreboard should reuse team, venue and game IDs and write
+    all game states through one upsert_game_states_batch call.
+    """
+
+    @patch("precog.schedulers.espn_game_poller.update_game_result")
+    @patch("precog.schedulers.espn_game_poller.get_or_create_game")
+    @patch("precog.schedulers.espn_game_poller.get_team_by_espn_id")
+    @patch("precog.schedulers.espn_game_poller.upsert_game_state")
+    @patch("precog.schedulers.espn_game_poller.create_venue")
+    def test_repoll_reuses_dimension_ids(
+        self,
+        mock_create_venue: MagicMock,
+        mock_upsert: MagicMock,
+        mock_get_team: MagicMock,
+        mock_get_or_create_game: MagicMock,
+        mock_update_result: MagicMock,
+        mock_espn_client: MagicMock,
+        sample_game_data: dict[str, Any],
+        batch_upsert_per_game: MagicMock,
+    ) -> None:
+        """Second poll of an unchanged scoreboard issues no dimension queries."""
+        mock_espn_client.get_scoreboard.return_value = [sample_game_data]
+        mock_get_team.side_effect = [{"team_id": 10}, {"team_id": 20}]
+        mock_create_venue.return_value = 100
+        mock_get_or_create_game.return_value = 42
+        mock_upsert.return_value = None
+
+        poller = ESPNGamePoller(leagues=["nfl"], espn_client=mock_espn_client)
+        poller._poll_league_wrapper("nfl")
+        poller._poll_league_wrapper("nfl")
+
+        assert mock_get_team.call_count == 2
+        mock_create_venue.assert_called_once()
+        mock_get_or_create_game.assert_called_once()
+        assert batch_upsert_per_game.call_count == 2
+        assert mock_upsert.call_args.kwargs["home_team_id"] == 10
+        assert mock_upsert.call_args.kwargs["game_id"] == 42
+        assert poller.get_stats()["dimension_cache_hits"] == 4
+
+    @patch("precog.schedulers.espn_game_poller.update_game_result")
+    @patch("precog.schedulers.espn_game_poller.get_or_create_game")
+    @patch("precog.schedulers.espn_game_poller.get_team_by_espn_id")
+    @patch("precog.schedulers.espn_game_poller.upsert_game_state")
+    @patch("precog.schedulers.espn_game_poller.create_venue")
+    def test_status_change_reaches_games_dimension(
+        self,
+        mock_create_venue: MagicMock,
+        mock_upsert: MagicMock,
+        mock_get_team: MagicMock,
+        mock_get_or_create_game: MagicMock,
+        mock_update_result: MagicMock,
+        mock_espn_client: MagicMock,
+        sample_game_data: dict[str, Any],
+    ) -> None:
+        """A changed game status is a new cache key, so get_or_create_game runs again."""
+        mock_get_team.return_value = {"team_id": 1}
+        mock_create_venue.return_value = 100
+        mock_get_or_create_game.return_value = 42
+
+        poller = ESPNGamePoller(leagues=["nfl"], espn_client=mock_espn_client)
+        poller._sync_game_to_db(sample_game_data, "nfl")
+        sample_game_data["state"]["game_status"] = "halftime"
+        poller._sync_game_to_db(sample_game_data, "nfl")
+
+        assert mock_get_or_create_game.call_count == 2
+        assert mock_get_or_create_game.call_args.kwargs["game_status"] == "halftime"
+
+    @patch("precog.schedulers.espn_game_poller.update_game_result")
+    @patch("precog.schedulers.espn_game_poller.get_or_create_game")
+    @patch("precog.schedulers.espn_game_poller.get_team_by_espn_id")
+    @patch("precog.schedulers.espn_game_poller.upsert_game_state")
+    @patch("precog.schedulers.espn_game_poller.create_venue")
+    def test_zero_ttl_disables_cache(
+        self,
+        mock_create_venue: MagicMock,
+        mock_upsert: MagicMock,
+        mock_get_team: MagicMock,
+        mock_get_or_create_game: MagicMock,
+        mock_update_result: MagicMock,
+        mock_espn_client: MagicMock,
+        sample_game_data: dict[str, Any],
+    ) -> None:
+        """dimension_cache_ttl=0 restores per-poll lookups."""
+        mock_get_team.return_value = {"team_id": 1}
+        mock_create_venue.return_value = 100
+        mock_get_or_create_game.return_value = 42
+
+        poller = ESPNGamePoller(
+            leagues=["nfl"], espn_client=mock_espn_client, dimension_cache_ttl=0
+        )
+        poller._sync_game_to_db(sample_game_data, "nfl")
+        poller._sync_game_to_db(sample_game_data, "nfl")
+
+        assert mock_get_team.call_count == 4
+        assert mock_get_or_create_game.call_count == 2
+
+    @patch("precog.schedulers.espn_game_poller.update_game_result")
+    @patch("precog.schedulers.espn_game_poller.get_or_create_game")
+    @patch("precog.schedulers.espn_game_poller.get_team_by_espn_id")
+    @patch("precog.schedulers.espn_game_poller.upsert_game_state")
+    @patch("precog.schedulers.espn_game_poller.create_venue")
+    def test_game_dimension_error_not_cached(
+        self,
+        mock_create_venue: MagicMock,
+        mock_upsert: MagicMock,
+        mock_get_team: MagicMock,
+        mock_get_or_create_game: MagicMock,
+        mock_update_result: MagicMock,
+        mock_espn_client: MagicMock,
+        sample_game_data: dict[str, Any],
+    ) -> None:
+        """A failed games-dimension upsert is retried on the next poll."""
+        mock_get_team.return_value = {"team_id": 1}
+        mock_create_venue.return_value = 100
+        mock_get_or_create_game.side_effect = [Exception("db"), 42]
+
+        poller = ESPNGamePoller(leagues=["nfl"], espn_client=mock_espn_client)
+        poller._sync_game_to_db(sample_game_data, "nfl")
+        poller._sync_game_to_db(sample_game_data, "nfl")
+
+        assert mock_get_or_create_game.call_count == 2
+        assert mock_upsert.call_args.kwargs["game_id"] == 42
+
+    @patch("precog.schedulers.espn_game_poller.update_game_result")
+    @patch("precog.schedulers.espn_game_poller.get_or_create_game")
+    @patch("precog.schedulers.espn_game_poller.get_team_by_espn_id")
+    @patch("precog.schedulers.espn_game_poller.upsert_game_state")
+    @patch("precog.schedulers.espn_game_poller.create_venue")
+    def test_batch_failure_falls_back_per_game(
+        self,
+        mock_create_venue: MagicMock,
+        mock_upsert: MagicMock,
+        mock_get_team: MagicMock,
+        mock_get_or_create_game: MagicMock,
+        mock_update_result: MagicMock,
+        mock_espn_client: MagicMock,
+        sample_game_data: dict[str, Any],
+        batch_upsert_per_game: MagicMock,
+    ) -> None:
+        """If the batched read fails, each game is upserted on its own."""
+        second = {
+            "metadata": {**sample_game_data["metadata"], "espn_event_id": "401547418"},
+            "state": sample_game_data["state"],
+        }
+        mock_espn_client.get_scoreboard.return_value = [sample_game_data, second]
+        mock_get_team.return_value = {"team_id": 1}
+        mock_create_venue.return_value = 100
+        mock_get_or_create_game.return_value = 42
+        mock_upsert.return_value = 7
+        batch_upsert_per_game.side_effect = Exception("read failed")
+
+        poller = ESPNGamePoller(leagues=["nfl"], espn_client=mock_espn_client)
+        poller._poll_league_wrapper("nfl")
+
+        assert mock_upsert.call_count == 2
+        stats = poller.get_stats()
+        assert stats["sync_synced"] == 2
+        assert stats["errors"] == 0
+
+    @patch("precog.schedulers.espn_game_poller.update_game_result")
+    @patch("precog.schedulers.espn_game_poller.get_or_create_game")
+    @patch("precog.schedulers.espn_game_poller.get_team_by_espn_id")
+    @patch("precog.schedulers.espn_game_poller.upsert_game_state")
+    @patch("precog.schedulers.espn_game_poller.create_venue")
+    def test_final_result_written_once(
+        self,
+        mock_create_venue: MagicMock,
+        mock_upsert: MagicMock,
+        mock_get_team: MagicMock,
+        mock_get_or_create_game: MagicMock,
+        mock_update_result: MagicMock,
+        mock_espn_client: MagicMock,
+        sample_game_data: dict[str, Any],
+    ) -> None:
+        """A re-polled final game with the same score does not rewrite the result."""
+        sample_game_data["state"]["game_status"] = "final"
+        mock_get_team.return_value = {"team_id": 1}
+        mock_create_venue.return_value = 100
+        mock_get_or_create_game.return_value = 42
+        mock_upsert.side_effect = [7, None, None]
+
+        poller = ESPNGamePoller(leagues=["nfl"], espn_client=mock_espn_client)
+        poller._sync_game_to_db(sample_game_data, "nfl")
+        poller._sync_game_to_db(sample_game_data, "nfl")
+        sample_game_data["state"]["home_score"] = 24  # stat correction
+        poller._sync_game_to_db(sample_game_data, "nfl")
+
+        assert mock_update_result.call_count == 2
+        assert mock_update_result.call_args.kwargs["home_score"] == 24
+
+
+@pytest.mark.unit
+class TestScoreboardDeltaPolling:
+    """Tests for skipping games whose ESPN payload did not change.
+
+    With a client that returns scoreboard deltas the poller syncs only
+    delta["changed"]; the rest of the scoreboard still drives league state
+    and priority.
+    """
+
+    @pytest.fixture
+    def delta_client(self) -> MagicMock:
+        """ESPNClient double with an empty delta."""
+        client = MagicMock(spec=ESPNClient)
+        client.get_scoreboard_delta.return_value = {
+            "games": [],
+            "changed": [],
+            "not_modified": True,
+        }
+        return client
+
+    def test_unchanged_games_are_not_synced(
+        self, delta_client: MagicMock, sample_game_data: dict[str, Any]
+    ) -> None:
+        """Games outside the changed list count as unchanged without a DB call."""
+        delta_client.get_scoreboard_delta.return_value = {
+            "games": [sample_game_data],
+            "changed": [],
+            "not_modified": False,
+        }
+        poller = ESPNGamePoller(leagues=["nfl"], espn_client=delta_client)
+
+        with patch.object(poller, "_sync_games_to_db", return_value=[]) as sync:
+            poller._poll_league_wrapper("nfl")
+
+        sync.assert_called_once_with([], "nfl")
+        delta_client.get_scoreboard.assert_not_called()
+        stats = poller.get_stats()
+        assert stats["sync_unchanged"] == 1
+        assert stats["items_fetched"] == 1
+        assert "nfl" in poller._league_quiet
+
+    def test_only_changed_games_are_synced(
+        self, delta_client: MagicMock, sample_game_data: dict[str, Any]
+    ) -> None:
+        """A changed game is synced and clears the league's quiet flag."""
+        other = {
+            "metadata": {**sample_game_data["metadata"], "espn_event_id": "401547418"},
+            "state": sample_game_data["state"],
+        }
+        delta_client.get_scoreboard_delta.return_value = {
+            "games": [sample_game_data, other],
+            "changed": [other],
+            "not_modified": False,
+        }
+        poller = ESPNGamePoller(leagues=["nfl"], espn_client=delta_client)
+        poller._league_quiet.add("nfl")
+
+        with patch.object(poller, "_sync_games_to_db", return_value=[True]) as sync:
+            fetched, updated = poller._poll_league("nfl")
+
+        sync.assert_called_once_with([other], "nfl")
+        assert (fetched, updated) == (2, 1)
+        assert "nfl" not in poller._league_quiet
+
+    def test_failed_sync_forgets_event(
+        self, delta_client: MagicMock, sample_game_data: dict[str, Any]
+    ) -> None:
+        """An event that failed to sync is re-armed in the client cache."""
+        delta_client.get_scoreboard_delta.return_value = {
+            "games": [sample_game_data],
+            "changed": [sample_game_data],
+            "not_modified": False,
+        }
+        poller = ESPNGamePoller(leagues=["nfl"], espn_client=delta_client)
+
+        with patch.object(poller, "_sync_games_to_db", return_value=[Exception("db")]):
+            poller._poll_league_wrapper("nfl")
+
+        delta_client.forget_events.assert_called_once_with(
+            "nfl", [sample_game_data["metadata"]["espn_event_id"]]
+        )
+
+    def test_plain_client_syncs_every_game(
+        self, mock_espn_client: MagicMock, sample_game_data: dict[str, Any]
+    ) -> None:
+        """Clients without delta support have every game treated as changed."""
+        mock_espn_client.get_scoreboard.return_value = [sample_game_data]
+        poller = ESPNGamePoller(leagues=["nfl"], espn_client=mock_espn_client)
+
+        with patch.object(poller, "_sync_games_to_db", return_value=[False]) as sync:
+            poller._poll_league_wrapper("nfl")
+
+        sync.assert_called_once_with([sample_game_data], "nfl")
+        assert not poller._use_scoreboard_delta
+
+    def test_delta_can_be_disabled(self, delta_client: MagicMock) -> None:
+        """scoreboard_delta=False fetches full scoreboards even from an ESPNClient."""
+        delta_client.get_scoreboard.return_value = []
+        poller = ESPNGamePoller(leagues=["nfl"], espn_client=delta_client, scoreboard_delta=False)
+
+        poller._poll_league_wrapper("nfl")
+
+        delta_client.get_scoreboard.assert_called_once_with("nfl")
+        delta_client.get_scoreboard_delta.assert_not_called()
+
+    def test_quiet_leagues_passed_to_priority_allocation(self, delta_client: MagicMock) -> None:
+        """allocate_budget() receives the set of quiet leagues."""
+        calculator = MagicMock()
+        calculator.allocate_budget.return_value = {"nfl": 30, "nba": 60}
+        poller = ESPNGamePoller(
+            leagues=["nfl", "nba"],
+            espn_client=delta_client,
+            rate_budget_per_hour=100,
+            priority_calculator=calculator,
+        )
+        poller._league_states = {"nfl": LEAGUE_STATE_TRACKING, "nba": LEAGUE_STATE_TRACKING}
+        poller._league_quiet = {"nba"}
+
+        with poller._lock:
+            poller._recalculate_league_intervals()
+
+        assert calculator.allocate_budget.call_args.kwargs["quiet_leagues"] == {"nba"}
+
+
+@pytest.mark.unit
+class TestParallelLeaguePolling:
+    """Tests for the concurrent multi-league fan-out and latency histograms."""
+
+    def test_leagues_fetch_concurrently(self, mock_espn_client: MagicMock) -> None:
+        """All leagues' requests are in flight at the same time."""
+        leagues = ["nfl", "nba", "nhl"]
+        barrier = threading.Barrier(len(leagues), timeout=5)
+
+        def scoreboard(league: str) -> list:
+            barrier.wait()  # raises BrokenBarrierError if fetches were serial
+            return []
+
+        mock_espn_client.get_scoreboard.side_effect = scoreboard
+        poller = ESPNGamePoller(leagues=leagues, espn_client=mock_espn_client)
+
+        result = poller.poll_once()
+
+        assert result["items_fetched"] == 0
+        assert mock_espn_client.get_scoreboard.call_count == 3
+
+    def test_fetch_workers_one_is_serial(self, mock_espn_client: MagicMock) -> None:
+        """fetch_workers=1 never has two requests in flight."""
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def scoreboard(league: str) -> list:
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return []
+
+        mock_espn_client.get_scoreboard.side_effect = scoreboard
+        poller = ESPNGamePoller(
+            leagues=["nfl", "nba", "nhl"], espn_client=mock_espn_client, fetch_workers=1
+        )
+
+        poller.poll_once()
+
+        assert peak == 1
+
+    def test_sync_concurrency_bounded(
+        self, mock_espn_client: MagicMock, sample_game_data: dict[str, Any]
+    ) -> None:
+        """No more than sync_workers leagues sync to the database at once."""
+        in_sync = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def sync(games: list, league: str) -> list:
+            nonlocal in_sync, peak
+            with lock:
+                in_sync += 1
+                peak = max(peak, in_sync)
+            time.sleep(0.02)
+            with lock:
+                in_sync -= 1
+            return [False] * len(games)
+
+        mock_espn_client.get_scoreboard.return_value = [sample_game_data]
+        poller = ESPNGamePoller(
+            leagues=["nfl", "nba", "nhl", "ncaaf"],
+            espn_client=mock_espn_client,
+            sync_workers=2,
+        )
+
+        with patch.object(poller, "_sync_games_to_db", side_effect=sync):
+            result = poller.poll_once()
+
+        assert result["items_fetched"] == 4
+        assert 1 <= peak <= 2
+
+    def test_one_failing_league_does_not_block_others(self, mock_espn_client: MagicMock) -> None:
+        """poll_once re-raises a league error only after the others finished."""
+
+        def scoreboard(league: str) -> list:
+            if league == "nba":
+                raise ESPNAPIError("nba down")
+            return []
+
+        mock_espn_client.get_scoreboard.side_effect = scoreboard
+        poller = ESPNGamePoller(leagues=["nfl", "nba", "nhl"], espn_client=mock_espn_client)
+
+        with pytest.raises(ESPNAPIError, match="nba down"):
+            poller.poll_once()
+
+        called = {c.args[0] for c in mock_espn_client.get_scoreboard.call_args_list}
+        assert called == {"nfl", "nba", "nhl"}
+
+    def test_budget_defers_lowest_priority_leagues(self) -> None:
+        """With one token left only the shortest-interval league is requested."""
+        client = MagicMock(spec=ESPNClient)
+        client.rate_limiter = MagicMock()
+        client.rate_limiter.get_available_tokens.return_value = 1.0
+        client.get_scoreboard_delta.return_value = {
+            "games": [],
+            "changed": [],
+            "not_modified": True,
+            "parse_seconds": 0.0,
+        }
+        poller = ESPNGamePoller(leagues=["nfl", "nba", "nhl"], espn_client=client)
+        poller._league_intervals = {"nfl": 900, "nba": 30, "nhl": 900}
+
+        nfl, nba, nhl = poller._poll_leagues(["nfl", "nba", "nhl"])
+
+        client.get_scoreboard_delta.assert_called_once_with("nba")
+        assert nba == (0, 0)
+        assert isinstance(nfl, ESPNAPIError)
+        assert isinstance(nhl, ESPNAPIError)
+
+    def test_refresh_scoreboards_reports_deferred_league_as_zero(self) -> None:
+        """A budget-deferred league shows up with 0 games, not an exception."""
+        client = MagicMock(spec=ESPNClient)
+        client.rate_limiter = MagicMock()
+        client.rate_limiter.get_available_tokens.return_value = 0.0
+        poller = ESPNGamePoller(leagues=["nfl"], espn_client=client)
+
+        result = poller.refresh_scoreboards(active_only=False)
+
+        assert result["games_by_league"] == {"nfl": 0}
+        client.get_scoreboard_delta.assert_not_called()
+
+    def test_latency_histograms_in_stats(
+        self, mock_espn_client: MagicMock, sample_game_data: dict[str, Any]
+    ) -> None:
+        """get_stats() reports fetch and sync histograms per league."""
+        mock_espn_client.get_scoreboard.return_value = [sample_game_data]
+        poller = ESPNGamePoller(leagues=["nfl", "nba"], espn_client=mock_espn_client)
+
+        with patch.object(poller, "_sync_games_to_db", return_value=[False]):
+            poller.poll_once()
+            poller._poll_league_wrapper("nfl")
+
+        latency = poller.get_stats()["league_latency"]
+        assert latency["nfl"]["fetch"]["count"] == 2
+        assert latency["nfl"]["sync"]["count"] == 2
+        assert latency["nba"]["fetch"]["count"] == 1
+        # Opaque (non-ESPNClient) clients report no separate parse stage
+        assert latency["nfl"]["parse"]["count"] == 0
+        assert latency["nfl"]["fetch"]["p95"] is not None
+
+    def test_parse_latency_from_delta_client(self) -> None:
+        """Parse time reported by the client is split out of fetch time."""
+        client = MagicMock(spec=ESPNClient)
+        client.get_scoreboard_delta.return_value = {
+            "games": [],
+            "changed": [],
+            "not_modified": False,
+            "parse_seconds": 0.25,
+        }
+        poller = ESPNGamePoller(leagues=["nfl"], espn_client=client)
+
+        poller._poll_league("nfl")
+
+        latency = poller.get_stats()["league_latency"]["nfl"]
+        assert latency["parse"]["sum"] == pytest.approx(0.25)
+        assert latency["fetch"]["count"] == 1
+
+    def test_invalid_worker_counts_rejected(self, mock_espn_client: MagicMock) -> None:
+        """fetch_workers and sync_workers must be positive."""
+        with pytest.raises(ValueError, match="fetch_workers"):
+            ESPNGamePoller(leagues=["nfl"], espn_client=mock_espn_client, fetch_workers=0)
+        with pytest.raises(ValueError, match="sync_workers"):
+            ESPNGamePoller(leagues=["nfl"], espn_client=mock_espn_client, sync_workers=0)
+
+
+class TestAlignmentBusPublishing:
+    """New game_states rows are announced on the alignment event bus."""
+
+    @patch("precog.schedulers.espn_game_poller.get_or_create_game", return_value=42)
+    @patch("precog.schedulers.espn_game_poller.get_team_by_espn_id", return_value={"team_id": 1})
+    @patch("precog.schedulers.espn_game_poller.upsert_game_state")
+    @patch("precog.schedulers.espn_game_poller.create_venue", return_value=100)
+    def test_new_state_published(
+        self,
+        mock_create_venue: MagicMock,
+        mock_upsert: MagicMock,
+        mock_get_team: MagicMock,
+        mock_get_or_create_game: MagicMock,
+        mock_espn_client: MagicMock,
+        sample_game_data: dict[str, Any],
+    ) -> None:
+        """A written state is published once; an unchanged re-poll is not."""
+        bus = AlignmentEventBus()
+        received: list[GameStateWritten] = []
+        bus.add_game_state_listener(received.append)
+        poller = ESPNGamePoller(leagues=["nfl"], espn_client=mock_espn_client)
+
+        with patch("precog.schedulers.espn_game_poller.get_alignment_event_bus", return_value=bus):
+            mock_upsert.return_value = 555
+            poller._sync_game_to_db(sample_game_data, "nfl")
+            mock_upsert.return_value = None
+            poller._sync_game_to_db(sample_game_data, "nfl")
+
+        (event,) = received
+        assert event.game_id == 42
+        assert event.game_state_id == 555
+        assert event.state_time.tzinfo is not None
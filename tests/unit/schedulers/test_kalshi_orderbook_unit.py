@@ -0,0 +1,301 @@
+"""
+Unit Tests for the Kalshi in-memory order book engine.
+
+Tests OrderBook level maintenance and derived metrics, OrderBookStore
+message handling, and OrderBookSampler throttled persistence (database
+calls mocked).
+
+Reference: TESTING_STRATEGY V3.9 - Unit tests for isolated functionality
+
+Usage:
+    pytest tests/unit/schedulers/test_kalshi_orderbook_unit.py -v -m unit
+"""
+
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from precog.schedulers.kalshi_orderbook import OrderBook, OrderBookSampler, OrderBookStore
+
+
+def _snapshot_msg(ticker: str = "KXNFLGAME-A") -> dict:
+    return {
+        "market_ticker": ticker,
+        "yes_dollars": [["0.5000", 200], ["0.4900", 300]],
+        "no_dollars": [["0.4800", 150], ["0.4700", 150]],
+    }
+
+
+def _delta_msg(side: str, price: str, delta: int, ticker: str = "KXNFLGAME-A") -> dict:
+    return {"market_ticker": ticker, "side": side, "price_dollars": price, "delta": delta}
+
+
+@pytest.mark.unit
+class TestOrderBook:
+    """Test level maintenance and O(1) metrics."""
+
+    def test_snapshot_metrics(self):
+        """Best bid/ask, spread, depth and imbalance follow the docstring example."""
+        book = OrderBook("KXNFLGAME-A")
+        book.apply_snapshot([(5000, 500)], [(4800, 300)])
+
+        assert book.best_bid == Decimal("0.5000")
+        assert book.best_ask == Decimal("0.5200")
+        assert book.spread == Decimal("0.0200")
+        assert book.bid_depth_total == 500
+        assert book.ask_depth_total == 300
+        assert book.depth_imbalance == Decimal("0.2500")
+        assert book.weighted_mid == Decimal("0.5075")
+
+    def test_delta_inserts_updates_and_removes_levels(self):
+        """Deltas add new levels, adjust existing ones, and drop emptied ones."""
+        book = OrderBook("KXNFLGAME-A")
+        book.apply_snapshot([(5000, 200), (4900, 300)], [(4800, 150)])
+
+        book.apply_delta("yes", 5100, 50)
+        assert book.best_bid == Decimal("0.5100")
+        assert book.bid_depth_total == 550
+
+        book.apply_delta("yes", 5100, -50)
+        assert book.best_bid == Decimal("0.5000")
+        assert list(book.yes.prices) == [4900, 5000]
+
+        book.apply_delta("no", 4800, -10)
+        assert book.ask_depth_total == 140
+
+        # Removing more than rests clears the level rather than going negative
+        book.apply_delta("no", 4800, -500)
+        assert book.best_ask is None
+        assert book.ask_depth_total == 0
+        assert book.spread is None
+        assert book.weighted_mid is None
+
+    def test_negative_delta_on_missing_level_is_ignored(self):
+        """A cancel for an unknown level leaves the ladder untouched."""
+        book = OrderBook("KXNFLGAME-A")
+        book.apply_snapshot([(5000, 200)], [])
+        book.apply_delta("yes", 4000, -10)
+        assert list(book.yes.prices) == [5000]
+        assert book.bid_depth_total == 200
+
+    def test_rejects_unknown_side(self):
+        """Only yes/no ladders exist."""
+        with pytest.raises(ValueError, match="Unknown orderbook side"):
+            OrderBook("KXNFLGAME-A").apply_delta("maybe", 5000, 1)
+
+    def test_to_snapshot_orders_levels_best_first(self):
+        """Snapshot arrays are best-first and limited to the requested depth."""
+        book = OrderBook("KXNFLGAME-A")
+        book.apply_snapshot([(4800, 1), (5000, 2), (4900, 3)], [(4700, 4), (4800, 5)])
+
+        snapshot = book.to_snapshot(levels=2)
+
+        assert snapshot["bid_prices"] == [Decimal("0.5000"), Decimal("0.4900")]
+        assert snapshot["bid_quantities"] == [2, 3]
+        assert snapshot["ask_prices"] == [Decimal("0.5200"), Decimal("0.5300")]
+        assert snapshot["ask_quantities"] == [5, 4]
+        assert snapshot["levels"] == 2
+        # Totals cover the whole book, not just the sampled levels
+        assert snapshot["bid_depth_total"] == 6
+
+
+@pytest.mark.unit
+class TestOrderBookStore:
+    """Test snapshot/delta message handling."""
+
+    def test_dollar_and_cent_levels(self):
+        """Sub-penny dollar levels are preferred; cents are the fallback."""
+        store = OrderBookStore()
+        store.apply_snapshot_message(_snapshot_msg())
+        store.apply_snapshot_message(
+            {"market_ticker": "KXNFLGAME-B", "yes": [[45, 10]], "no": [[53, 20]]}
+        )
+
+        assert store.get("KXNFLGAME-A").best_bid == Decimal("0.5000")
+        assert store.get("KXNFLGAME-B").best_bid == Decimal("0.4500")
+        assert store.get("KXNFLGAME-B").best_ask == Decimal("0.4700")
+
+    def test_delta_without_snapshot_is_dropped(self):
+        """Deltas cannot apply to a book that has no base snapshot."""
+        store = OrderBookStore()
+        assert store.apply_delta_message(_delta_msg("yes", "0.5000", 10)) is False
+
+        store.apply_snapshot_message(_snapshot_msg())
+        assert store.apply_delta_message({"market_ticker": "KXNFLGAME-A", "side": "yes"}) is False
+        assert store.apply_delta_message(
+            {"market_ticker": "KXNFLGAME-A", "side": "yes", "price": 51, "delta": 5}
+        )
+
+        stats = store.get_stats()
+        assert stats["orderbook_deltas_dropped"] == 2
+        assert stats["orderbook_deltas_applied"] == 1
+        assert stats["orderbook_snapshots_applied"] == 1
+        assert stats["orderbook_books"] == 1
+        assert store.get("KXNFLGAME-A").best_bid == Decimal("0.5100")
+
+    def test_changed_since_tracks_versions(self):
+        """Only books whose version moved are returned."""
+        store = OrderBookStore()
+        store.apply_snapshot_message(_snapshot_msg("KXNFLGAME-A"))
+        store.apply_snapshot_message(_snapshot_msg("KXNFLGAME-B"))
+
+        changed = store.changed_since({}, levels=5)
+        versions = {ticker: version for ticker, version, _ in changed}
+        assert set(versions) == {"KXNFLGAME-A", "KXNFLGAME-B"}
+        assert store.changed_since(versions, levels=5) == []
+
+        store.apply_delta_message(_delta_msg("no", "0.4800", 5, "KXNFLGAME-B"))
+        assert [t for t, _, _ in store.changed_since(versions, levels=5)] == ["KXNFLGAME-B"]
+
+    def test_recreated_book_gets_new_version(self):
+        """A book rebuilt after clear() is not mistaken for an already-sampled one."""
+        store = OrderBookStore()
+        store.apply_snapshot_message(_snapshot_msg())
+        versions = {t: v for t, v, _ in store.changed_since({}, levels=5)}
+
+        store.clear()
+        store.apply_snapshot_message(_snapshot_msg())
+        assert len(store.changed_since(versions, levels=5)) == 1
+
+
+@pytest.mark.unit
+class TestOrderBookSampler:
+    """Test throttled persistence of changed books."""
+
+    def test_rejects_invalid_config(self):
+        """Interval and levels must be positive."""
+        with pytest.raises(ValueError, match="interval"):
+            OrderBookSampler(OrderBookStore(), interval=0)
+        with pytest.raises(ValueError, match="levels"):
+            OrderBookSampler(OrderBookStore(), levels=0)
+
+    def test_sample_writes_changed_books_once(self):
+        """Changed books are written in one batch; unchanged books are not re-written."""
+        store = OrderBookStore()
+        store.apply_snapshot_message(_snapshot_msg("KXNFLGAME-A"))
+        store.apply_snapshot_message(_snapshot_msg("KXNFLGAME-B"))
+        sampler = OrderBookSampler(store, levels=1)
+
+        with (
+            patch(
+                "precog.schedulers.kalshi_orderbook.get_current_markets_by_tickers",
+                return_value={"KXNFLGAME-A": {"id": 11}, "KXNFLGAME-B": {"id": 12}},
+            ) as mock_lookup,
+            patch(
+                "precog.schedulers.kalshi_orderbook.insert_orderbook_snapshots_batch"
+            ) as mock_insert,
+        ):
+            assert sampler.sample() == 2
+            rows = mock_insert.call_args.args[0]
+            assert sorted(row["market_id"] for row in rows) == [11, 12]
+            assert rows[0]["bid_prices"] == [Decimal("0.5000")]
+
+            # Nothing changed: no DB traffic at all
+            assert sampler.sample() == 0
+            assert mock_insert.call_count == 1
+
+            # Many deltas between samples still produce one row
+            for _ in range(10):
+                store.apply_delta_message(_delta_msg("yes", "0.4900", 1, "KXNFLGAME-A"))
+            assert sampler.sample() == 1
+            assert mock_insert.call_args.args[0][0]["bid_depth_total"] == 510
+
+        # Market ids are resolved once and reused
+        assert mock_lookup.call_count == 1
+        assert sampler.get_stats()["orderbook_samples_written"] == 3
+
+    def test_unknown_markets_are_skipped(self):
+        """Books for markets not yet in the database are not written."""
+        store = OrderBookStore()
+        store.apply_snapshot_message(_snapshot_msg("KXNFLGAME-NEW"))
+        sampler = OrderBookSampler(store)
+
+        with (
+            patch(
+                "precog.schedulers.kalshi_orderbook.get_current_markets_by_tickers",
+                return_value={},
+            ),
+            patch(
+                "precog.schedulers.kalshi_orderbook.insert_orderbook_snapshots_batch"
+            ) as mock_insert,
+        ):
+            assert sampler.sample() == 0
+        mock_insert.assert_not_called()
+
+    def test_failed_write_is_retried_next_sample(self):
+        """A failed batch leaves versions unadvanced so the books are re-sampled."""
+        store = OrderBookStore()
+        store.apply_snapshot_message(_snapshot_msg())
+        sampler = OrderBookSampler(store)
+
+        with (
+            patch(
+                "precog.schedulers.kalshi_orderbook.get_current_markets_by_tickers",
+                return_value={"KXNFLGAME-A": {"id": 11}},
+            ),
+            patch(
+                "precog.schedulers.kalshi_orderbook.insert_orderbook_snapshots_batch",
+                side_effect=[RuntimeError("db down"), [1]],
+            ),
+        ):
+            assert sampler.sample() == 0
+            assert sampler.sample() == 1
+
+        stats = sampler.get_stats()
+        assert stats["orderbook_sample_errors"] == 1
+        assert stats["orderbook_samples_written"] == 1
+
+    def test_crossed_book_is_skipped_not_retried(self):
+        """A negative-spread book is left out of the batch instead of failing it."""
+        store = OrderBookStore()
+        store.apply_snapshot_message(_snapshot_msg("KXNFLGAME-A"))
+        store.apply_snapshot_message(
+            {
+                "market_ticker": "KXNFLGAME-X",
+                "yes_dollars": [["0.5000", 100]],
+                "no_dollars": [["0.5500", 100]],
+            }
+        )
+        assert store.get("KXNFLGAME-X").spread < 0
+        sampler = OrderBookSampler(store)
+
+        with (
+            patch(
+                "precog.schedulers.kalshi_orderbook.get_current_markets_by_tickers",
+                return_value={"KXNFLGAME-A": {"id": 11}, "KXNFLGAME-X": {"id": 12}},
+            ),
+            patch(
+                "precog.schedulers.kalshi_orderbook.insert_orderbook_snapshots_batch"
+            ) as mock_insert,
+        ):
+            assert sampler.sample() == 1
+            assert [row["market_id"] for row in mock_insert.call_args.args[0]] == [11]
+
+            # The crossed book is not re-checked until it changes
+            assert sampler.sample() == 0
+            store.apply_delta_message(_delta_msg("no", "0.5500", -100, "KXNFLGAME-X"))
+            store.apply_delta_message(_delta_msg("no", "0.4500", 100, "KXNFLGAME-X"))
+            assert sampler.sample() == 1
+            assert mock_insert.call_args.args[0][0]["market_id"] == 12
+
+        assert sampler.get_stats()["orderbook_crossed_skipped"] == 1
+
+    def test_forget_drops_market_ids(self):
+        """forget() evicts the cached market id along with the sampled version."""
+        store = OrderBookStore()
+        store.apply_snapshot_message(_snapshot_msg())
+        sampler = OrderBookSampler(store)
+
+        with (
+            patch(
+                "precog.schedulers.kalshi_orderbook.get_current_markets_by_tickers",
+                return_value={"KXNFLGAME-A": {"id": 11}},
+            ),
+            patch("precog.schedulers.kalshi_orderbook.insert_orderbook_snapshots_batch"),
+        ):
+            sampler.sample()
+
+        assert sampler.get_stats()["orderbook_market_ids_size"] == 1
+        sampler.forget(["KXNFLGAME-A"])
+        assert sampler.get_stats()["orderbook_market_ids_size"] == 0
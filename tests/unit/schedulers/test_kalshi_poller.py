@@ -19,6 +19,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from precog.schedulers.alignment_bus import AlignmentEventBus, SnapshotsWritten
 from precog.schedulers.kalshi_poller import (
     KalshiMarketPoller,
     _clamp_non_negative,
@@ -772,7 +773,7 @@ class TestKalshiPollerValidation:
 
     @pytest.mark.unit
     def test_poll_series_calls_validator(self, poller_with_mock_client, mock_market_data_list):
-        """_poll_series calls validate_markets on fetched data."""
+        """_poll_series validates fetched data with validate_market_batch."""
         poller_with_mock_client.kalshi_client.fetch_all_markets.return_value = mock_market_data_list
 
         with (
@@ -781,8 +782,8 @@ class TestKalshiPollerValidation:
             patch("precog.schedulers.kalshi_poller.create_market"),
             patch.object(
                 poller_with_mock_client._validator,
-                "validate_markets",
-                wraps=poller_with_mock_client._validator.validate_markets,
+                "validate_market_batch",
+                wraps=poller_with_mock_client._validator.validate_market_batch,
             ) as mock_validate,
         ):
             poller_with_mock_client._poll_series("KXNFLGAME")
@@ -913,7 +914,7 @@ class TestKalshiPollerValidation:
         with (
             patch.object(
                 poller_with_mock_client._validator,
-                "validate_markets",
+                "validate_market_batch",
                 side_effect=RuntimeError("validator exploded"),
             ),
             patch("precog.schedulers.kalshi_poller.get_current_market", return_value=None),
@@ -1301,7 +1302,7 @@ class TestEventGameMatching:
 
             mock_matcher = Mock(spec=EventGameMatcher)
             mock_matcher.match_event_with_reason.return_value = (42, MatchReason.MATCHED)
-            mock_matcher.registry = Mock()
+            mock_matcher.registry = Mock(**{"get_state_stats.return_value": {}})
 
             poller_with_mock_client._event_game_matcher = mock_matcher
             poller_with_mock_client._matcher_loaded = True
@@ -1339,7 +1340,7 @@ class TestMatchingBackfill:
 
         mock_matcher = Mock(spec=EventGameMatcher)
         mock_matcher.backfill_unlinked_events.side_effect = RuntimeError("DB error")
-        mock_matcher.registry = Mock()
+        mock_matcher.registry = Mock(**{"get_state_stats.return_value": {}})
         mock_matcher.registry.needs_refresh.return_value = False
 
         poller_with_mock_client._event_game_matcher = mock_matcher
@@ -1359,7 +1360,7 @@ class TestMatchingBackfill:
 
         mock_matcher = Mock(spec=EventGameMatcher)
         mock_matcher.backfill_unlinked_events.return_value = 5
-        mock_matcher.registry = Mock()
+        mock_matcher.registry = Mock(**{"get_state_stats.return_value": {}})
         mock_matcher.registry.needs_refresh.return_value = False
 
         poller_with_mock_client._event_game_matcher = mock_matcher
@@ -1398,7 +1399,7 @@ class TestRegistryRefresh:
         from precog.matching.event_game_matcher import EventGameMatcher
 
         mock_matcher = Mock(spec=EventGameMatcher)
-        mock_matcher.registry = Mock()
+        mock_matcher.registry = Mock(**{"get_state_stats.return_value": {}})
         mock_matcher.registry.needs_refresh.return_value = True
 
         poller_with_mock_client._event_game_matcher = mock_matcher
@@ -1415,7 +1416,7 @@ class TestRegistryRefresh:
         from precog.matching.event_game_matcher import EventGameMatcher
 
         mock_matcher = Mock(spec=EventGameMatcher)
-        mock_matcher.registry = Mock()
+        mock_matcher.registry = Mock(**{"get_state_stats.return_value": {}})
         mock_matcher.registry.needs_refresh.return_value = True
         mock_matcher.registry.unknown_codes_seen = {"ZZZ:nfl"}
 
@@ -1487,6 +1488,41 @@ class TestSettlementDetection:
             assert call_kwargs["settlement_value"] == Decimal("1.0000")
             assert call_kwargs["status"] == "settled"
 
+    @pytest.mark.unit
+    def test_final_event_retires_event_id_map_entry(self, poller_with_mock_client):
+        """Once the parent event goes final, its cached surrogate key is retired."""
+        event_ticker = "KXNFLGAME-25NOV29-NEBUF"
+        poller_with_mock_client._event_id_map[event_ticker] = 42
+        settled_market = {
+            "ticker": "KXNFLGAME-25NOV29-NEBUF-B250",
+            "event_ticker": event_ticker,
+            "status": "settled",
+            "settlement_value_dollars": Decimal("1.0000"),
+            "yes_ask_dollars": Decimal("1.0000"),
+            "no_ask_dollars": Decimal("1.0000"),
+        }
+        existing = {
+            "ticker": "KXNFLGAME-25NOV29-NEBUF-B250",
+            "yes_ask_price": Decimal("0.4800"),
+            "no_ask_price": Decimal("0.5500"),
+            "status": "open",
+            "event_id": 42,
+        }
+
+        with (
+            patch("precog.schedulers.kalshi_poller.get_current_market", return_value=existing),
+            patch("precog.schedulers.kalshi_poller.update_market_with_versioning", return_value=1),
+            patch("precog.schedulers.kalshi_poller.check_event_fully_settled", return_value=True),
+            patch("precog.schedulers.kalshi_poller.build_event_result", return_value={}),
+            patch("precog.schedulers.kalshi_poller.update_event"),
+        ):
+            poller_with_mock_client._sync_market_to_db(settled_market)
+
+        stats = poller_with_mock_client.get_stats()
+        assert stats["event_id_map_retired"] == 1
+        assert "anomaly_counts_size" in stats
+        assert "price_history_size" in stats
+
     @pytest.mark.unit
     def test_settled_market_no_reads_settlement_value_dollars(self, poller_with_mock_client):
         """When a market settles with settlement_value_dollars=0.0000, it is passed through."""
@@ -2111,3 +2147,544 @@ class TestSettlementDetection:
 
             call_kwargs = mock_create.call_args.kwargs
             assert call_kwargs["settlement_value"] is None
+
+
+# =============================================================================
+# Batched Sync Tests
+# =============================================================================
+
+
+@pytest.fixture
+def batch_poller(mock_kalshi_client):
+    """Create KalshiMarketPoller with the batched sync path enabled."""
+    return KalshiMarketPoller(
+        series_tickers=["KXNFLGAME"],
+        poll_interval=30,
+        environment="demo",
+        kalshi_client=mock_kalshi_client,
+        batch_sync=True,
+    )
+
+
+class TestBatchSync:
+    """Test the batched per-series sync path (batch_sync=True)."""
+
+    @pytest.mark.unit
+    def test_batch_sync_defaults_off(self, poller_with_mock_client):
+        """Per-market sync remains the default."""
+        assert poller_with_mock_client.batch_sync is False
+
+    @pytest.mark.unit
+    def test_factory_passes_batch_sync(self):
+        """create_kalshi_poller forwards batch_sync to the poller."""
+        with patch("precog.schedulers.kalshi_poller.KalshiClient"):
+            poller = create_kalshi_poller(batch_sync=True)
+        assert poller.batch_sync is True
+
+    @pytest.mark.unit
+    def test_one_lookup_and_one_write_per_series(self, batch_poller, mock_market_data_list):
+        """All tickers are looked up in one query and written in one batch."""
+        batch_poller.kalshi_client.fetch_all_markets.return_value = mock_market_data_list
+        existing = {
+            m["ticker"]: {
+                "ticker": m["ticker"],
+                "yes_ask_price": Decimal("0.1000"),
+                "no_ask_price": Decimal("0.9000"),
+                "status": "open",
+                "event_id": 7,
+            }
+            for m in mock_market_data_list
+        }
+
+        with (
+            patch(
+                "precog.schedulers.kalshi_poller.get_current_markets_by_tickers",
+                return_value=existing,
+            ) as mock_lookup,
+            patch("precog.schedulers.kalshi_poller.get_current_market") as mock_single_lookup,
+            patch(
+                "precog.schedulers.kalshi_poller.update_markets_with_versioning_batch",
+                return_value={},
+            ) as mock_batch,
+            patch("precog.schedulers.kalshi_poller.update_market_with_versioning") as mock_single,
+        ):
+            fetched, updated, created = batch_poller._poll_series("KXNFLGAME")
+
+        assert (fetched, updated, created) == (2, 2, 0)
+        mock_lookup.assert_called_once_with([m["ticker"] for m in mock_market_data_list])
+        mock_single_lookup.assert_not_called()
+        mock_single.assert_not_called()
+        rows = mock_batch.call_args.args[0]
+        assert [r["ticker"] for r in rows] == [m["ticker"] for m in mock_market_data_list]
+        assert rows[0]["yes_ask_price"] == Decimal("0.4800")
+        assert rows[0]["status"] == "open"
+
+    @pytest.mark.unit
+    def test_counts_match_per_market_path(self, mock_kalshi_client, mock_market_data):
+        """Created/updated/skipped counts agree with the per-market path."""
+        unchanged = dict(mock_market_data, ticker="KXNFLGAME-25NOV29-NEBUF-SAME")
+        changed = dict(mock_market_data, ticker="KXNFLGAME-25NOV29-NEBUF-MOVE")
+        new = dict(mock_market_data, ticker="KXNFLGAME-25NOV29-NEBUF-NEW")
+        no_ticker = dict(mock_market_data, ticker="")
+        markets = [unchanged, changed, new, no_ticker]
+        existing = {
+            unchanged["ticker"]: {
+                "yes_ask_price": Decimal("0.4800"),
+                "no_ask_price": Decimal("0.5500"),
+                "status": "open",
+            },
+            changed["ticker"]: {
+                "yes_ask_price": Decimal("0.4000"),
+                "no_ask_price": Decimal("0.5500"),
+                "status": "open",
+            },
+        }
+
+        results = {}
+        for batch_sync in (False, True):
+            poller = KalshiMarketPoller(
+                series_tickers=["KXNFLGAME"],
+                kalshi_client=mock_kalshi_client,
+                batch_sync=batch_sync,
+            )
+            mock_kalshi_client.fetch_all_markets.return_value = markets
+            with (
+                patch(
+                    "precog.schedulers.kalshi_poller.get_current_market",
+                    side_effect=lambda t: existing.get(t),
+                ),
+                patch(
+                    "precog.schedulers.kalshi_poller.get_current_markets_by_tickers",
+                    side_effect=lambda ts: {t: existing[t] for t in ts if t in existing},
+                ),
+                patch(
+                    "precog.schedulers.kalshi_poller.get_or_create_event", return_value=(1, True)
+                ),
+                patch("precog.schedulers.kalshi_poller.create_market", return_value=1),
+                patch("precog.schedulers.kalshi_poller.update_market_with_versioning"),
+                patch("precog.schedulers.kalshi_poller.update_markets_with_versioning_batch"),
+            ):
+                results[batch_sync] = poller._poll_series("KXNFLGAME")
+
+        assert results[True] == results[False] == (4, 2, 1)
+
+    @pytest.mark.unit
+    def test_settlement_propagates_after_batch_write(self, batch_poller):
+        """A market settling in the batch still finalizes its parent event."""
+        settled_market = {
+            "ticker": "KXNFLGAME-25NOV29-NEBUF-B250",
+            "event_ticker": "KXNFLGAME-25NOV29-NEBUF",
+            "status": "settled",
+            "settlement_value_dollars": Decimal("1.0000"),
+            "yes_ask_dollars": Decimal("1.0000"),
+            "no_ask_dollars": Decimal("1.0000"),
+        }
+        existing = {
+            settled_market["ticker"]: {
+                "yes_ask_price": Decimal("0.4800"),
+                "no_ask_price": Decimal("0.5500"),
+                "status": "open",
+                "event_id": 42,
+            }
+        }
+
+        with (
+            patch(
+                "precog.schedulers.kalshi_poller.get_current_markets_by_tickers",
+                return_value=existing,
+            ),
+            patch(
+                "precog.schedulers.kalshi_poller.update_markets_with_versioning_batch"
+            ) as mock_batch,
+            patch(
+                "precog.schedulers.kalshi_poller.check_event_fully_settled", return_value=True
+            ) as mock_check,
+            patch("precog.schedulers.kalshi_poller.build_event_result", return_value={}),
+            patch("precog.schedulers.kalshi_poller.update_event") as mock_update_event,
+        ):
+            updated, created = batch_poller._sync_markets_batch([settled_market], "KXNFLGAME")
+
+        assert (updated, created) == (1, 0)
+        assert mock_batch.call_args.args[0][0]["settlement_value"] == Decimal("1.0000")
+        mock_check.assert_called_once_with(42)
+        mock_update_event.assert_called_once_with(42, status="final", result={})
+
+    @pytest.mark.unit
+    def test_batch_failure_falls_back_per_market(self, batch_poller, mock_market_data_list):
+        """If the batched write fails, each market is retried individually."""
+        existing = {
+            m["ticker"]: {
+                "yes_ask_price": Decimal("0.1000"),
+                "no_ask_price": Decimal("0.9000"),
+                "status": "open",
+            }
+            for m in mock_market_data_list
+        }
+        first_ticker = mock_market_data_list[0]["ticker"]
+
+        def _single(ticker, **kwargs):
+            if ticker == first_ticker:
+                raise ValueError("check constraint")
+            return 1
+
+        with (
+            patch(
+                "precog.schedulers.kalshi_poller.get_current_markets_by_tickers",
+                return_value=existing,
+            ),
+            patch(
+                "precog.schedulers.kalshi_poller.update_markets_with_versioning_batch",
+                side_effect=RuntimeError("batch failed"),
+            ),
+            patch(
+                "precog.schedulers.kalshi_poller.update_market_with_versioning",
+                side_effect=_single,
+            ) as mock_single,
+        ):
+            updated, created = batch_poller._sync_markets_batch(mock_market_data_list, "KXNFLGAME")
+
+        assert mock_single.call_count == 2
+        assert (updated, created) == (1, 0)
+
+    @pytest.mark.unit
+    def test_no_write_when_nothing_changed(self, batch_poller, mock_market_data):
+        """Unchanged markets never reach the batched writer."""
+        existing = {
+            mock_market_data["ticker"]: {
+                "yes_ask_price": Decimal("0.4800"),
+                "no_ask_price": Decimal("0.5500"),
+                "status": "open",
+            }
+        }
+        with (
+            patch(
+                "precog.schedulers.kalshi_poller.get_current_markets_by_tickers",
+                return_value=existing,
+            ),
+            patch(
+                "precog.schedulers.kalshi_poller.update_markets_with_versioning_batch"
+            ) as mock_batch,
+        ):
+            assert batch_poller._sync_markets_batch([mock_market_data], "KXNFLGAME") == (0, 0)
+        mock_batch.assert_not_called()
+
+    @pytest.mark.unit
+    def test_written_markets_published_on_alignment_bus(self, batch_poller, mock_market_data_list):
+        """Market ids returned by the batched write are announced for alignment."""
+        existing = {
+            m["ticker"]: {
+                "yes_ask_price": Decimal("0.1000"),
+                "no_ask_price": Decimal("0.9000"),
+                "status": "open",
+            }
+            for m in mock_market_data_list
+        }
+        bus = AlignmentEventBus()
+        received: list[SnapshotsWritten] = []
+        bus.add_snapshot_listener(received.append)
+
+        with (
+            patch(
+                "precog.schedulers.kalshi_poller.get_current_markets_by_tickers",
+                return_value=existing,
+            ),
+            patch(
+                "precog.schedulers.kalshi_poller.update_markets_with_versioning_batch",
+                return_value={m["ticker"]: i for i, m in enumerate(mock_market_data_list, 11)},
+            ),
+            patch("precog.schedulers.kalshi_poller.get_alignment_event_bus", return_value=bus),
+        ):
+            batch_poller._sync_markets_batch(mock_market_data_list, "KXNFLGAME")
+
+        assert [event.market_ids for event in received] == [(11, 12)]
+
+
+# =============================================================================
+# Concurrent Streaming Fetch Tests
+# =============================================================================
+
+
+def _page(series_ticker, markets, page_number=1, is_last=True, error=None):
+    """Build a MarketPage dict as yielded by KalshiClient.iter_market_pages()."""
+    return {
+        "series_ticker": series_ticker,
+        "markets": markets,
+        "page_number": page_number,
+        "is_last": is_last,
+        "error": error,
+    }
+
+
+@pytest.fixture
+def streaming_poller(mock_kalshi_client):
+    """Create KalshiMarketPoller that fetches two series concurrently."""
+    return KalshiMarketPoller(
+        series_tickers=["KXNFLGAME", "KXNBAGAME"],
+        poll_interval=30,
+        environment="demo",
+        kalshi_client=mock_kalshi_client,
+        fetch_workers=4,
+    )
+
+
+class TestStreamingFetch:
+    """Test concurrent multi-series fetch with per-page sync (fetch_workers > 1)."""
+
+    @pytest.mark.unit
+    def test_fetch_workers_defaults_to_sequential(self, poller_with_mock_client):
+        """Sequential per-series fetch remains the default."""
+        assert poller_with_mock_client.fetch_workers == 1
+
+    @pytest.mark.unit
+    def test_fetch_workers_must_be_positive(self, mock_kalshi_client):
+        """fetch_workers < 1 is rejected."""
+        with pytest.raises(ValueError, match="fetch_workers"):
+            KalshiMarketPoller(kalshi_client=mock_kalshi_client, fetch_workers=0)
+
+    @pytest.mark.unit
+    def test_factory_passes_fetch_workers(self):
+        """create_kalshi_poller forwards fetch_workers to the poller."""
+        with patch("precog.schedulers.kalshi_poller.KalshiClient"):
+            poller = create_kalshi_poller(fetch_workers=8)
+        assert poller.fetch_workers == 8
+
+    @pytest.mark.unit
+    def test_syncs_each_page_as_it_arrives(self, streaming_poller, mock_market_data):
+        """Each streamed page is synced individually and totals are summed."""
+        nfl_1 = dict(mock_market_data, ticker="KXNFLGAME-A")
+        nfl_2 = dict(mock_market_data, ticker="KXNFLGAME-B")
+        nba_1 = dict(mock_market_data, ticker="KXNBAGAME-A")
+        streaming_poller.kalshi_client.iter_market_pages.return_value = iter(
+            [
+                _page("KXNFLGAME", [nfl_1], page_number=1, is_last=False),
+                _page("KXNBAGAME", [nba_1]),
+                _page("KXNFLGAME", [nfl_2], page_number=2),
+            ]
+        )
+
+        with patch.object(streaming_poller, "_sync_markets", return_value=(1, 0)) as mock_sync:
+            result = streaming_poller.poll_once()
+
+        assert result == {"items_fetched": 3, "items_updated": 3, "items_created": 0}
+        assert [c.args[0] for c in mock_sync.call_args_list] == [[nfl_1], [nba_1], [nfl_2]]
+        streaming_poller.kalshi_client.iter_market_pages.assert_called_once_with(
+            ["KXNFLGAME", "KXNBAGAME"], max_workers=4
+        )
+        streaming_poller.kalshi_client.fetch_all_markets.assert_not_called()
+
+    @pytest.mark.unit
+    def test_series_error_does_not_stop_other_series(self, streaming_poller, mock_market_data):
+        """A failed series is counted as an error; the rest of the stream is synced."""
+        streaming_poller.kalshi_client.iter_market_pages.return_value = iter(
+            [
+                _page("KXNFLGAME", [], error=Exception("API Error")),
+                _page("KXNBAGAME", [mock_market_data]),
+            ]
+        )
+
+        with (
+            patch.object(streaming_poller, "sync_series"),
+            patch("precog.schedulers.kalshi_poller.update_bracket_counts", return_value=0),
+            patch.object(streaming_poller, "_sync_markets", return_value=(0, 1)),
+        ):
+            result = streaming_poller._poll_once()
+
+        assert result["items_fetched"] == 1
+        assert result["items_created"] == 1
+        stats = streaming_poller.get_stats()
+        assert stats["errors"] == 1
+        assert stats["last_error"] == "API Error"
+
+    @pytest.mark.unit
+    def test_manual_poll_raises_series_error(self, streaming_poller):
+        """poll_once() keeps its raise-on-error semantics in streaming mode."""
+        streaming_poller.kalshi_client.iter_market_pages.return_value = iter(
+            [_page("KXNFLGAME", [], error=RuntimeError("boom"))]
+        )
+
+        with pytest.raises(RuntimeError, match="boom"):
+            streaming_poller.poll_once()
+
+    @pytest.mark.unit
+    def test_validation_runs_once_per_series_on_all_pages(self, streaming_poller, mock_market_data):
+        """Validation sees the whole series, not individual pages."""
+        nfl_1 = dict(mock_market_data, ticker="KXNFLGAME-A")
+        nfl_2 = dict(mock_market_data, ticker="KXNFLGAME-B")
+        streaming_poller.kalshi_client.iter_market_pages.return_value = iter(
+            [
+                _page("KXNFLGAME", [nfl_1], page_number=1, is_last=False),
+                _page("KXNFLGAME", [nfl_2], page_number=2),
+            ]
+        )
+        streaming_poller._should_validate = True
+
+        with (
+            patch.object(streaming_poller, "_sync_markets", return_value=(0, 0)),
+            patch.object(streaming_poller, "_validate_series_markets") as mock_validate,
+        ):
+            streaming_poller._poll_series_streaming(["KXNFLGAME", "KXNBAGAME"])
+
+        mock_validate.assert_called_once_with("KXNFLGAME", [nfl_1, nfl_2])
+
+    @pytest.mark.unit
+    def test_single_series_uses_sequential_path(self, mock_kalshi_client, mock_market_data):
+        """Streaming is skipped when there is only one series to fetch."""
+        poller = KalshiMarketPoller(
+            series_tickers=["KXNFLGAME"],
+            kalshi_client=mock_kalshi_client,
+            fetch_workers=4,
+        )
+        mock_kalshi_client.fetch_all_markets.return_value = [mock_market_data]
+
+        with patch.object(poller, "_sync_markets", return_value=(1, 0)):
+            result = poller.poll_once()
+
+        assert result["items_fetched"] == 1
+        mock_kalshi_client.iter_market_pages.assert_not_called()
+
+
+# =============================================================================
+# Price Cache Write-Through Tests
+# =============================================================================
+
+
+class TestPriceCacheWriteThrough:
+    """Test that the poller writes persisted prices through to the shared cache."""
+
+    @pytest.mark.unit
+    def test_defaults_to_shared_cache(self, poller_with_mock_client):
+        """Poller shares the process-wide cache with the WebSocket handler."""
+        from precog.schedulers.market_price_cache import get_market_price_cache
+
+        assert poller_with_mock_client.price_cache is get_market_price_cache()
+
+    @pytest.mark.unit
+    def test_update_writes_new_prices(self, poller_with_mock_client, mock_market_data):
+        """A versioned update caches the newly persisted prices."""
+        existing = {
+            "ticker": mock_market_data["ticker"],
+            "yes_ask_price": Decimal("0.4000"),
+            "no_ask_price": Decimal("0.6000"),
+            "status": "open",
+        }
+        with (
+            patch("precog.schedulers.kalshi_poller.get_current_market", return_value=existing),
+            patch("precog.schedulers.kalshi_poller.update_market_with_versioning"),
+        ):
+            poller_with_mock_client._sync_market_to_db(mock_market_data, "KXNFLGAME")
+
+        assert poller_with_mock_client.price_cache.get(mock_market_data["ticker"]) == (
+            Decimal("0.4800"),
+            Decimal("0.5500"),
+        )
+
+    @pytest.mark.unit
+    def test_unchanged_market_caches_existing_prices(
+        self, poller_with_mock_client, mock_market_data
+    ):
+        """A skipped (unchanged) market still primes the cache for the WS path."""
+        existing = {
+            "ticker": mock_market_data["ticker"],
+            "yes_ask_price": Decimal("0.4800"),
+            "no_ask_price": Decimal("0.5500"),
+            "status": "open",
+        }
+        with patch("precog.schedulers.kalshi_poller.get_current_market", return_value=existing):
+            assert poller_with_mock_client._sync_market_to_db(mock_market_data, "KXNFLGAME") is None
+
+        assert poller_with_mock_client.price_cache.is_unchanged(
+            mock_market_data["ticker"], Decimal("0.4800"), Decimal("0.5500")
+        )
+
+    @pytest.mark.unit
+    def test_failed_update_invalidates(self, poller_with_mock_client, mock_market_data):
+        """A failed versioned write drops the ticker from the cache."""
+        ticker = mock_market_data["ticker"]
+        poller_with_mock_client.price_cache.put(ticker, Decimal("0.40"), Decimal("0.60"))
+        existing = {
+            "ticker": ticker,
+            "yes_ask_price": Decimal("0.40"),
+            "no_ask_price": Decimal("0.60"),
+            "status": "open",
+        }
+        with (
+            patch("precog.schedulers.kalshi_poller.get_current_market", return_value=existing),
+            patch(
+                "precog.schedulers.kalshi_poller.update_market_with_versioning",
+                side_effect=Exception("DB down"),
+            ),
+            pytest.raises(Exception, match="DB down"),
+        ):
+            poller_with_mock_client._sync_market_to_db(mock_market_data, "KXNFLGAME")
+
+        assert poller_with_mock_client.price_cache.get(ticker) is None
+
+    @pytest.mark.unit
+    def test_get_stats_includes_cache_counters(self, poller_with_mock_client):
+        """Cache hit/miss/eviction counters are merged into get_stats()."""
+        stats = poller_with_mock_client.get_stats()
+        for key in (
+            "price_cache_hits",
+            "price_cache_misses",
+            "price_cache_evictions",
+            "price_cache_size",
+        ):
+            assert key in stats
+
+
+class TestIncrementalBracketCounts:
+    """Test that bracket_count is recounted only for events that gained markets."""
+
+    @pytest.mark.unit
+    def test_create_marks_event_dirty(self, poller_with_mock_client, mock_market_data):
+        """Creating a market under an event queues that event for a recount."""
+        with (
+            patch("precog.schedulers.kalshi_poller.get_current_market", return_value=None),
+            patch("precog.schedulers.kalshi_poller.get_or_create_event", return_value=(42, True)),
+            patch("precog.schedulers.kalshi_poller.create_market", return_value=1),
+        ):
+            poller_with_mock_client._sync_market_to_db(mock_market_data)
+
+        assert poller_with_mock_client._bracket_dirty_events == {42}
+
+    @pytest.mark.unit
+    def test_first_cycle_reconciles_then_incremental(self, poller_with_mock_client):
+        """Full recount once, then only dirty events, and nothing when clean."""
+        poller = poller_with_mock_client
+        with (
+            patch(
+                "precog.schedulers.kalshi_poller.update_bracket_counts", return_value=3
+            ) as mock_full,
+            patch(
+                "precog.schedulers.kalshi_poller.update_bracket_counts_for_events",
+                return_value=2,
+            ) as mock_incremental,
+        ):
+            poller._bracket_dirty_events.add(7)
+            poller._refresh_bracket_counts()
+            mock_full.assert_called_once()
+            mock_incremental.assert_not_called()
+            assert poller._bracket_dirty_events == set()
+
+            poller._refresh_bracket_counts()
+            mock_incremental.assert_not_called()
+
+            poller._bracket_dirty_events.update({8, 9})
+            poller._refresh_bracket_counts()
+            mock_incremental.assert_called_once_with([8, 9])
+            assert mock_full.call_count == 1
+            assert poller._bracket_dirty_events == set()
+
+    @pytest.mark.unit
+    def test_failed_recount_keeps_dirty_events(self, poller_with_mock_client):
+        """A DB error leaves the dirty set in place for the next cycle."""
+        poller = poller_with_mock_client
+        poller._bracket_counts_reconciled = True
+        poller._bracket_dirty_events.add(7)
+        with patch(
+            "precog.schedulers.kalshi_poller.update_bracket_counts_for_events",
+            side_effect=RuntimeError("db down"),
+        ):
+            poller._refresh_bracket_counts()
+
+        assert poller._bracket_dirty_events == {7}
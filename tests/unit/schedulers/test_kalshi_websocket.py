@@ -20,6 +20,7 @@ Related Requirements:
 """
 
 import json
+import time
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -28,6 +29,7 @@ import pytest
 from precog.schedulers.kalshi_websocket import (
     ConnectionState,
     KalshiWebSocketHandler,
+    PriceWriteBehindQueue,
     create_websocket_handler,
 )
 
@@ -71,6 +73,18 @@ def handler_with_db(mock_auth):
     )
 
 
+@pytest.fixture
+def handler_immediate_db(mock_auth):
+    """Create a handler that writes each changed tick immediately (no write-behind)."""
+    return KalshiWebSocketHandler(
+        environment="demo",
+        auth=mock_auth,
+        auto_reconnect=False,
+        sync_to_database=True,
+        write_behind_window=0,
+    )
+
+
 # =============================================================================
 # Initialization Tests
 # =============================================================================
@@ -453,6 +467,105 @@ class TestDatabaseSync:
                 mock_update.assert_not_called()
 
 
+# =============================================================================
+# Price Cache Tests
+# =============================================================================
+
+
+def _ticker_message(ticker: str, yes: str, no: str) -> dict:
+    """Build a ticker channel message with sub-penny prices."""
+    return {
+        "type": "ticker",
+        "msg": {"market_ticker": ticker, "yes_ask_dollars": yes, "no_ask_dollars": no},
+    }
+
+
+class TestPriceCache:
+    """Tests for the last-persisted price cache in front of get_current_market."""
+
+    def test_defaults_to_shared_cache(self, handler):
+        """Handlers share the process-wide cache with the poller by default."""
+        from precog.schedulers.market_price_cache import get_market_price_cache
+
+        assert handler.price_cache is get_market_price_cache()
+
+    @pytest.mark.asyncio
+    async def test_duplicate_update_skips_database(self, handler_immediate_db):
+        """A repeated price is answered from the cache, not Postgres."""
+        with (
+            patch("precog.schedulers.kalshi_websocket.get_current_market") as mock_get,
+            patch(
+                "precog.schedulers.kalshi_websocket.update_market_with_versioning"
+            ) as mock_update,
+        ):
+            mock_get.return_value = {
+                "ticker": "TEST-TICKER",
+                "yes_ask_price": Decimal("0.60"),
+                "no_ask_price": Decimal("0.40"),
+            }
+            for _ in range(3):
+                await handler_immediate_db._handle_ticker_update(
+                    _ticker_message("TEST-TICKER", "0.6500", "0.3500")
+                )
+
+        mock_get.assert_called_once_with("TEST-TICKER")
+        mock_update.assert_called_once()
+        stats = handler_immediate_db.get_stats()
+        assert stats["price_cache_hits"] == 2
+        assert stats["price_cache_misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_price_change_after_cached_write_reaches_database(self, handler_immediate_db):
+        """A new price after a cached write is still versioned."""
+        handler_immediate_db.price_cache.put("TEST-TICKER", Decimal("0.6500"), Decimal("0.3500"))
+        with (
+            patch("precog.schedulers.kalshi_websocket.get_current_market") as mock_get,
+            patch(
+                "precog.schedulers.kalshi_websocket.update_market_with_versioning"
+            ) as mock_update,
+        ):
+            mock_get.return_value = {
+                "ticker": "TEST-TICKER",
+                "yes_ask_price": Decimal("0.6500"),
+                "no_ask_price": Decimal("0.3500"),
+            }
+            await handler_immediate_db._handle_ticker_update(
+                _ticker_message("TEST-TICKER", "0.7000", "0.3000")
+            )
+
+        mock_update.assert_called_once()
+        assert handler_immediate_db.price_cache.get("TEST-TICKER") == (
+            Decimal("0.7000"),
+            Decimal("0.3000"),
+        )
+
+    def test_failed_write_invalidates_cache(self, handler_with_db):
+        """A DB error forgets the ticker so the next message re-reads the database."""
+        handler_with_db.price_cache.put("TEST-TICKER", Decimal("0.60"), Decimal("0.40"))
+        with (
+            patch(
+                "precog.schedulers.kalshi_websocket.get_current_market",
+                return_value={
+                    "ticker": "TEST-TICKER",
+                    "yes_ask_price": Decimal("0.60"),
+                    "no_ask_price": Decimal("0.40"),
+                },
+            ),
+            patch(
+                "precog.schedulers.kalshi_websocket.update_market_with_versioning",
+                side_effect=Exception("connection reset"),
+            ),
+        ):
+            handler_with_db._sync_price_to_db(
+                ticker="TEST-TICKER",
+                yes_price=Decimal("0.65"),
+                no_price=Decimal("0.35"),
+                msg={},
+            )
+
+        assert handler_with_db.price_cache.get("TEST-TICKER") is None
+
+
 # =============================================================================
 # State Management Tests
 # =============================================================================
@@ -649,3 +762,309 @@ class TestDecimalPrecision:
         # Verify exact Decimal representation
         assert args[1] == Decimal("0.333333")
         assert args[2] == Decimal("0.666667")
+
+
+# =============================================================================
+# Write-Behind Queue Tests
+# =============================================================================
+
+
+def _current(ticker: str, yes: str, no: str) -> dict:
+    """Build a get_current_market-shaped row."""
+    return {"ticker": ticker, "yes_ask_price": Decimal(yes), "no_ask_price": Decimal(no)}
+
+
+class TestWriteBehind:
+    """Tests for coalesced, batched WebSocket price writes."""
+
+    def test_enabled_by_default(self, handler_with_db, handler_immediate_db):
+        """Write-behind is on by default and disabled with a 0 window."""
+        assert handler_with_db._write_behind is not None
+        assert handler_with_db._write_behind.window == KalshiWebSocketHandler.WRITE_BEHIND_WINDOW
+        assert handler_immediate_db._write_behind is None
+
+    def test_rejects_invalid_window(self):
+        """Queue window and max_pending must be positive."""
+        with pytest.raises(ValueError, match="window"):
+            PriceWriteBehindQueue(window=0)
+        with pytest.raises(ValueError, match="max_pending"):
+            PriceWriteBehindQueue(max_pending=0)
+
+    @pytest.mark.asyncio
+    async def test_burst_coalesces_to_latest_state(self, handler_with_db):
+        """A burst of ticks for one ticker writes only the final state, once."""
+        for yes, no in (("0.61", "0.39"), ("0.62", "0.38"), ("0.63", "0.37")):
+            await handler_with_db._handle_ticker_update(_ticker_message("TEST-TICKER", yes, no))
+
+        with (
+            patch(
+                "precog.schedulers.kalshi_websocket.get_current_markets_by_tickers",
+                return_value={"TEST-TICKER": _current("TEST-TICKER", "0.60", "0.40")},
+            ),
+            patch(
+                "precog.schedulers.kalshi_websocket.update_markets_with_versioning_batch"
+            ) as mock_batch,
+            patch("precog.schedulers.kalshi_websocket.get_current_market") as mock_single_get,
+        ):
+            assert handler_with_db._write_behind.flush() == 1
+
+        mock_single_get.assert_not_called()
+        rows = mock_batch.call_args.args[0]
+        assert rows == [
+            {
+                "ticker": "TEST-TICKER",
+                "yes_ask_price": Decimal("0.63"),
+                "no_ask_price": Decimal("0.37"),
+                "volume": None,
+                "open_interest": None,
+            }
+        ]
+        stats = handler_with_db.get_stats()
+        assert stats["write_behind_coalesced"] == 2
+        assert stats["write_behind_enqueued"] == 3
+        assert stats["write_behind_queue_depth"] == 0
+        assert stats["write_behind_rows_written"] == 1
+        assert stats["write_behind_flushes"] == 1
+
+    def test_flush_writes_many_tickers_in_one_batch(self):
+        """Changed tickers share one batch; missing and unchanged ones are skipped."""
+        queue = PriceWriteBehindQueue(window=0.25)
+        queue.submit("A", Decimal("0.51"), Decimal("0.49"))
+        queue.submit("B", Decimal("0.30"), Decimal("0.70"))
+        queue.submit("MISSING", Decimal("0.50"), Decimal("0.50"))
+        queue.submit("SAME", Decimal("0.20"), Decimal("0.80"))
+
+        with (
+            patch(
+                "precog.schedulers.kalshi_websocket.get_current_markets_by_tickers",
+                return_value={
+                    "A": _current("A", "0.50", "0.50"),
+                    "B": _current("B", "0.35", "0.65"),
+                    "SAME": _current("SAME", "0.20", "0.80"),
+                },
+            ),
+            patch(
+                "precog.schedulers.kalshi_websocket.update_markets_with_versioning_batch"
+            ) as mock_batch,
+        ):
+            assert queue.flush() == 2
+
+        mock_batch.assert_called_once()
+        assert [r["ticker"] for r in mock_batch.call_args.args[0]] == ["A", "B"]
+        # Written and confirmed-unchanged tickers prime the cache
+        assert queue.price_cache.is_unchanged("A", Decimal("0.51"), Decimal("0.49"))
+        assert queue.price_cache.is_unchanged("SAME", Decimal("0.20"), Decimal("0.80"))
+
+    def test_batch_failure_falls_back_per_market(self):
+        """A failed batch is retried row by row; failed rows leave the cache."""
+        queue = PriceWriteBehindQueue(window=0.25)
+        queue.submit("A", Decimal("0.51"), Decimal("0.49"))
+        queue.submit("B", Decimal("0.31"), Decimal("0.69"))
+
+        def _single(**kwargs):
+            if kwargs["ticker"] == "B":
+                raise Exception("row failed")
+            return 1
+
+        with (
+            patch(
+                "precog.schedulers.kalshi_websocket.get_current_markets_by_tickers",
+                return_value={
+                    "A": _current("A", "0.50", "0.50"),
+                    "B": _current("B", "0.30", "0.70"),
+                },
+            ),
+            patch(
+                "precog.schedulers.kalshi_websocket.update_markets_with_versioning_batch",
+                side_effect=Exception("batch failed"),
+            ),
+            patch(
+                "precog.schedulers.kalshi_websocket.update_market_with_versioning",
+                side_effect=_single,
+            ) as mock_single,
+        ):
+            assert queue.flush() == 1
+
+        assert mock_single.call_count == 2
+        assert queue.price_cache.get("B") is None
+
+    def test_failed_flush_requeues_batch(self):
+        """A flush that fails outright keeps its updates for the next window."""
+        queue = PriceWriteBehindQueue(window=0.25)
+        queue.submit("A", Decimal("0.51"), Decimal("0.49"))
+        queue.submit("B", Decimal("0.31"), Decimal("0.69"))
+
+        def _lookup_fails(tickers):
+            # A newer tick for A arrives while the failing flush is in flight
+            queue.submit("A", Decimal("0.55"), Decimal("0.45"))
+            raise Exception("connection lost")
+
+        with patch(
+            "precog.schedulers.kalshi_websocket.get_current_markets_by_tickers",
+            side_effect=_lookup_fails,
+        ):
+            assert queue.flush() == 0
+
+        stats = queue.get_stats()
+        assert stats["write_behind_flush_errors"] == 1
+        assert stats["write_behind_requeued"] == 2
+        assert stats["write_behind_queue_depth"] == 2
+
+        with (
+            patch(
+                "precog.schedulers.kalshi_websocket.get_current_markets_by_tickers",
+                return_value={
+                    "A": _current("A", "0.50", "0.50"),
+                    "B": _current("B", "0.30", "0.70"),
+                },
+            ),
+            patch(
+                "precog.schedulers.kalshi_websocket.update_markets_with_versioning_batch"
+            ) as mock_batch,
+        ):
+            assert queue.flush() == 2
+
+        rows = {r["ticker"]: r for r in mock_batch.call_args.args[0]}
+        # The newer pending price wins over the requeued one
+        assert rows["A"]["yes_ask_price"] == Decimal("0.55")
+        assert rows["B"]["yes_ask_price"] == Decimal("0.31")
+        assert queue.get_stats()["write_behind_queue_depth"] == 0
+
+    def test_tick_back_to_persisted_price_overrides_pending(self):
+        """Returning to the cached price still replaces a newer pending price."""
+        queue = PriceWriteBehindQueue(window=0.25)
+        queue.price_cache.put("A", Decimal("0.50"), Decimal("0.50"))
+
+        assert queue.submit("A", Decimal("0.50"), Decimal("0.50")) is False
+        assert queue.submit("A", Decimal("0.55"), Decimal("0.45")) is True
+        assert queue.submit("A", Decimal("0.50"), Decimal("0.50")) is True
+
+        with (
+            patch(
+                "precog.schedulers.kalshi_websocket.get_current_markets_by_tickers",
+                return_value={"A": _current("A", "0.50", "0.50")},
+            ),
+            patch(
+                "precog.schedulers.kalshi_websocket.update_markets_with_versioning_batch"
+            ) as mock_batch,
+        ):
+            assert queue.flush() == 0
+
+        mock_batch.assert_not_called()
+
+    def test_backpressure_wakes_flusher_early(self):
+        """Reaching max_pending triggers a flush before the window elapses."""
+        queue = PriceWriteBehindQueue(window=60.0, max_pending=2)
+        with (
+            patch(
+                "precog.schedulers.kalshi_websocket.get_current_markets_by_tickers",
+                return_value={},
+            ) as mock_lookup,
+        ):
+            queue.start()
+            queue.submit("A", Decimal("0.51"), Decimal("0.49"))
+            queue.submit("B", Decimal("0.31"), Decimal("0.69"))
+            for _ in range(100):
+                if mock_lookup.called:
+                    break
+                time.sleep(0.01)
+            queue.close()
+
+        mock_lookup.assert_called_once()
+        assert queue.get_stats()["write_behind_max_queue_depth"] == 2
+
+    def test_stop_drains_pending_updates(self, handler_with_db):
+        """stop() flushes everything still pending before returning."""
+        handler_with_db._enabled = True
+        handler_with_db._write_behind.submit("A", Decimal("0.51"), Decimal("0.49"))
+
+        with (
+            patch(
+                "precog.schedulers.kalshi_websocket.get_current_markets_by_tickers",
+                return_value={"A": _current("A", "0.50", "0.50")},
+            ),
+            patch(
+                "precog.schedulers.kalshi_websocket.update_markets_with_versioning_batch"
+            ) as mock_batch,
+        ):
+            handler_with_db.stop(wait=False)
+
+        mock_batch.assert_called_once()
+        assert handler_with_db.get_stats()["write_behind_queue_depth"] == 0
+
+
+# =============================================================================
+# Orderbook Tests
+# =============================================================================
+
+
+class TestOrderbook:
+    """Tests for orderbook_snapshot/orderbook_delta handling."""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_then_delta_updates_book(self, handler):
+        """Snapshots seed the book and deltas apply on top of it."""
+        await handler._process_message(
+            json.dumps(
+                {
+                    "type": "orderbook_snapshot",
+                    "msg": {
+                        "market_ticker": "TEST-TICKER",
+                        "yes_dollars": [["0.5000", 100]],
+                        "no_dollars": [["0.4800", 80]],
+                    },
+                }
+            )
+        )
+        await handler._process_message(
+            json.dumps(
+                {
+                    "type": "orderbook_delta",
+                    "msg": {
+                        "market_ticker": "TEST-TICKER",
+                        "side": "yes",
+                        "price_dollars": "0.5100",
+                        "delta": 25,
+                    },
+                }
+            )
+        )
+
+        book = handler.orderbooks.get("TEST-TICKER")
+        assert book.best_bid == Decimal("0.5100")
+        assert book.best_ask == Decimal("0.5200")
+        assert book.bid_depth_total == 125
+
+        stats = handler.get_stats()
+        assert stats["orderbook_snapshots_applied"] == 1
+        assert stats["orderbook_deltas_applied"] == 1
+
+    @pytest.mark.asyncio
+    async def test_delta_before_snapshot_is_dropped(self, handler):
+        """A delta for an unknown book is counted and ignored."""
+        await handler._handle_orderbook_delta(
+            {"msg": {"market_ticker": "TEST-TICKER", "side": "no", "price": 48, "delta": 5}}
+        )
+        assert handler.orderbooks.get("TEST-TICKER") is None
+        assert handler.get_stats()["orderbook_deltas_dropped"] == 1
+
+    def test_unsubscribe_drops_book(self, handler):
+        """Books for unsubscribed markets are released."""
+        handler.subscribe(["TEST-TICKER"])
+        handler.orderbooks.apply_snapshot_message(
+            {"market_ticker": "TEST-TICKER", "yes": [[50, 1]], "no": []}
+        )
+        handler.unsubscribe(["TEST-TICKER"])
+        assert handler.orderbooks.get("TEST-TICKER") is None
+
+    def test_sampler_configuration(self, mock_auth, handler_with_db):
+        """Sampling is on by default and disabled with a 0 interval."""
+        assert handler_with_db._orderbook_sampler is not None
+        assert (
+            handler_with_db._orderbook_sampler.interval
+            == KalshiWebSocketHandler.ORDERBOOK_SAMPLE_INTERVAL
+        )
+        disabled = KalshiWebSocketHandler(
+            environment="demo", auth=mock_auth, orderbook_sample_interval=0
+        )
+        assert disabled._orderbook_sampler is None
@@ -555,6 +555,49 @@ class TestBudgetAllocation:
         )
         assert "nfl" in result
 
+    def test_quiet_league_yields_budget_to_live_league(self) -> None:
+        """A league with no changed games gets a longer interval than an equal live one."""
+        calc = LeaguePriorityCalculator(league_priorities={"nfl": 0.5, "nba": 0.5})
+        league_games = {
+            "nfl": [_make_game(period=2, clock_seconds=300)],
+            "nba": [_make_game(period=2, clock_seconds=300)],
+        }
+        kwargs: dict[str, Any] = {
+            "tracking_leagues": ["nfl", "nba"],
+            "budget_available": 180,
+            "base_interval": 15,
+            "max_throttled_interval": 120,
+            "league_games": league_games,
+        }
+
+        baseline = calc.allocate_budget(**kwargs)
+        result = calc.allocate_budget(**kwargs, quiet_leagues={"nba"})
+
+        assert baseline["nfl"] == baseline["nba"]
+        assert result["nfl"] < baseline["nfl"]
+        assert result["nba"] > result["nfl"]
+        assert sum(3600 / iv for iv in result.values()) <= 180 + 1
+
+    def test_quiet_factor_one_disables_down_weighting(self) -> None:
+        """quiet_priority_factor=1.0 ignores quiet_leagues."""
+        calc = LeaguePriorityCalculator(
+            league_priorities={"nfl": 0.5, "nba": 0.5}, quiet_priority_factor=1.0
+        )
+        result = calc.allocate_budget(
+            tracking_leagues=["nfl", "nba"],
+            budget_available=180,
+            base_interval=15,
+            max_throttled_interval=120,
+            league_games={},
+            quiet_leagues={"nba"},
+        )
+        assert result["nfl"] == result["nba"]
+
+    def test_invalid_quiet_factor_rejected(self) -> None:
+        """quiet_priority_factor outside [0, 1] raises ValueError."""
+        with pytest.raises(ValueError, match="quiet_priority_factor"):
+            LeaguePriorityCalculator(quiet_priority_factor=1.5)
+
 
 # =============================================================================
 # Test Config Integration
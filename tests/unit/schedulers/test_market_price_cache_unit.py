@@ -0,0 +1,97 @@
+"""
+Unit Tests for MarketPriceCache.
+
+Tests the bounded LRU cache of last persisted yes/no ask prices shared by
+KalshiMarketPoller and KalshiWebSocketHandler.
+
+Reference: TESTING_STRATEGY V3.9 - Unit tests for isolated functionality
+
+Usage:
+    pytest tests/unit/schedulers/test_market_price_cache_unit.py -v -m unit
+"""
+
+import threading
+from decimal import Decimal
+
+import pytest
+
+from precog.schedulers.market_price_cache import MarketPriceCache, get_market_price_cache
+
+
+@pytest.mark.unit
+class TestMarketPriceCache:
+    """Test lookup, LRU eviction and counters."""
+
+    def test_miss_then_hit(self):
+        """Unknown tickers miss; stored tickers hit."""
+        cache = MarketPriceCache()
+        assert cache.get("KXNFLGAME-A") is None
+        cache.put("KXNFLGAME-A", Decimal("0.52"), Decimal("0.49"))
+        assert cache.get("KXNFLGAME-A") == (Decimal("0.52"), Decimal("0.49"))
+
+        stats = cache.get_stats()
+        assert stats["price_cache_hits"] == 1
+        assert stats["price_cache_misses"] == 1
+        assert stats["price_cache_size"] == 1
+
+    def test_is_unchanged_compares_both_prices(self):
+        """Only an exact yes/no match counts as unchanged."""
+        cache = MarketPriceCache()
+        cache.put("KXNFLGAME-A", Decimal("0.52"), Decimal("0.49"))
+
+        assert cache.is_unchanged("KXNFLGAME-A", Decimal("0.5200"), Decimal("0.4900"))
+        assert not cache.is_unchanged("KXNFLGAME-A", Decimal("0.52"), Decimal("0.50"))
+        assert not cache.is_unchanged("KXNFLGAME-B", Decimal("0.52"), Decimal("0.49"))
+
+    def test_evicts_least_recently_used(self):
+        """Beyond max_size the least recently used ticker is evicted."""
+        cache = MarketPriceCache(max_size=2)
+        cache.put("A", Decimal("0.1"), Decimal("0.9"))
+        cache.put("B", Decimal("0.2"), Decimal("0.8"))
+        cache.get("A")  # A is now most recently used
+        cache.put("C", Decimal("0.3"), Decimal("0.7"))
+
+        assert cache.get("B") is None
+        assert cache.get("A") is not None
+        assert cache.get("C") is not None
+        assert len(cache) == 2
+        assert cache.get_stats()["price_cache_evictions"] == 1
+
+    def test_invalidate_and_clear(self):
+        """invalidate() drops one ticker; clear() drops all but keeps counters."""
+        cache = MarketPriceCache()
+        cache.put("A", Decimal("0.1"), Decimal("0.9"))
+        cache.put("B", Decimal("0.2"), Decimal("0.8"))
+
+        cache.invalidate("A")
+        cache.invalidate("missing")
+        assert cache.get("A") is None
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.get_stats()["price_cache_misses"] == 1
+
+    def test_rejects_non_positive_size(self):
+        """max_size must be at least 1."""
+        with pytest.raises(ValueError, match="max_size"):
+            MarketPriceCache(max_size=0)
+
+    def test_concurrent_puts_stay_bounded(self):
+        """Concurrent writers never push the cache past max_size."""
+        cache = MarketPriceCache(max_size=50)
+
+        def writer(offset: int) -> None:
+            for i in range(200):
+                cache.put(f"T-{offset}-{i}", Decimal("0.5"), Decimal("0.5"))
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(cache) == 50
+        assert cache.get_stats()["price_cache_evictions"] == 750
+
+    def test_shared_cache_is_singleton(self):
+        """get_market_price_cache() returns one instance per process."""
+        assert get_market_price_cache() is get_market_price_cache()
@@ -398,7 +398,8 @@ class TestPollOnce:
         with patch.object(updater_with_mock_client, "_poll_league", side_effect=track_poll):
             updater_with_mock_client.poll_once()
 
-        assert poll_calls == ["nfl", "ncaaf"]
+        # Leagues are polled concurrently, so call order is not fixed
+        assert sorted(poll_calls) == ["ncaaf", "nfl"]
 
     def test_custom_leagues_parameter(self, updater_with_mock_client) -> None:
         """Test custom leagues parameter."""
@@ -27,6 +27,7 @@ Requirements: REQ-DATA-001, REQ-OBSERV-001, REQ-TEST-001
 
 import threading
 import time
+import urllib.request
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -44,6 +45,8 @@ from precog.schedulers.service_supervisor import (
     create_services,
     create_supervisor,
 )
+from precog.schedulers.streaming_aligner import StreamingTemporalAligner
+from precog.schedulers.temporal_alignment_writer import TemporalAlignmentWriter
 
 # =============================================================================
 # Test Fixtures
@@ -763,6 +766,41 @@ class TestMetrics:
         metrics = supervisor.get_aggregate_metrics()
         assert metrics["total_errors"] == 5
 
+    def test_metrics_endpoint_serves_service_gauges(
+        self,
+        runner_config: RunnerConfig,
+        mock_service: MockService,
+        service_config: ServiceConfig,
+    ) -> None:
+        """Verify metrics_port starts a /metrics endpoint that stops with the supervisor."""
+        runner_config.metrics_port = 0  # any free port
+        supervisor = ServiceSupervisor(runner_config)
+        supervisor.add_service("test", mock_service, service_config)
+        supervisor.start_all()
+        try:
+            server = supervisor._metrics_server
+            assert server is not None
+            with urllib.request.urlopen(server.url, timeout=5) as response:
+                body = response.read().decode()
+            assert 'precog_service_up{service="test"} 1' in body
+            assert "precog_supervisor_uptime_seconds" in body
+        finally:
+            supervisor.stop_all()
+
+        assert supervisor._metrics_server is None
+
+    def test_metrics_endpoint_disabled_by_default(
+        self,
+        supervisor: ServiceSupervisor,
+        mock_service: MockService,
+        service_config: ServiceConfig,
+    ) -> None:
+        """Verify no endpoint is started without metrics_port."""
+        supervisor.add_service("test", mock_service, service_config)
+        supervisor.start_all()
+        assert supervisor._metrics_server is None
+        supervisor.stop_all()
+
 
 # =============================================================================
 # Factory Function Tests
@@ -801,6 +839,37 @@ class TestCreateServices:
         assert config.services["kalshi_rest"].enabled is False
         assert config.services["kalshi_ws"].enabled is False
 
+    @patch("precog.schedulers.service_supervisor._has_kalshi_credentials", return_value=True)
+    @patch("precog.schedulers.service_supervisor.create_kalshi_poller")
+    def test_create_services_passes_kalshi_sync_options(
+        self, mock_create_kalshi_poller: MagicMock, mock_creds: MagicMock
+    ) -> None:
+        """Verify batch_sync/fetch_workers reach the Kalshi REST poller."""
+        config = RunnerConfig()
+        services = create_services(
+            config,
+            enabled_services={"kalshi_rest"},
+            kalshi_batch_sync=True,
+            kalshi_fetch_workers=4,
+        )
+
+        assert "kalshi_rest" in services
+        call_kwargs = mock_create_kalshi_poller.call_args.kwargs
+        assert call_kwargs["batch_sync"] is True
+        assert call_kwargs["fetch_workers"] == 4
+
+    def test_temporal_alignment_mode_follows_streaming_flag(self) -> None:
+        """Verify the temporal_alignment factory picks batch or streaming."""
+        config = RunnerConfig(
+            services={"temporal_alignment": ServiceConfig(name="Temporal Alignment")}
+        )
+
+        batch = create_services(config)["temporal_alignment"][0]
+        streaming = create_services(config, streaming_alignment=True)["temporal_alignment"][0]
+
+        assert isinstance(batch, TemporalAlignmentWriter)
+        assert isinstance(streaming, StreamingTemporalAligner)
+
 
 class TestCreateSupervisor:
     """Tests for create_supervisor factory function.
@@ -838,6 +907,18 @@ class TestCreateSupervisor:
         assert supervisor.config.health_check_interval == 120
         assert supervisor.config.metrics_interval == 600
 
+    @patch("precog.schedulers.service_supervisor.create_services")
+    def test_create_supervisor_streaming_alignment(self, mock_create_services: MagicMock) -> None:
+        """Verify streaming_alignment adds and enables the temporal_alignment service."""
+        mock_create_services.return_value = {}
+
+        supervisor = create_supervisor(enabled_services={"espn"}, streaming_alignment=True)
+
+        assert "temporal_alignment" in supervisor.config.services
+        args, kwargs = mock_create_services.call_args
+        assert args[1] == {"espn", "temporal_alignment"}
+        assert kwargs["streaming_alignment"] is True
+
 
 # =============================================================================
 # Thread Safety Tests
@@ -0,0 +1,208 @@
+"""
+Unit Tests for StreamingTemporalAligner.
+
+Tests write-time alignment of market snapshots to the latest in-memory game
+state. The current-snapshot lookup (get_cursor) and write_alignments() are
+mocked; no database required.
+
+Reference: TESTING_STRATEGY V3.9 - Unit tests for isolated functionality
+
+Usage:
+    pytest tests/unit/schedulers/test_streaming_aligner_unit.py -v -m unit
+"""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from precog.schedulers.alignment_bus import AlignmentEventBus, GameStateWritten
+from precog.schedulers.streaming_aligner import StreamingTemporalAligner
+
+
+def _state(
+    game_id: int = 7,
+    game_state_id: int = 100,
+    state_time: datetime | None = None,
+) -> GameStateWritten:
+    return GameStateWritten(
+        game_id=game_id,
+        game_state_id=game_state_id,
+        state_time=state_time or datetime.now(UTC) - timedelta(seconds=5),
+    )
+
+
+def _snapshot(market_id: int, game_id: int = 7, snapshot_id: int | None = None) -> dict:
+    return {
+        "market_snapshot_id": snapshot_id or market_id * 10,
+        "market_id": market_id,
+        "snapshot_time": datetime.now(UTC),
+        "game_id": game_id,
+        "canonical_event_id": 3,
+    }
+
+
+def _mock_cursor(rows: list[dict]) -> MagicMock:
+    """get_cursor() replacement whose cursor returns rows."""
+    cursor = MagicMock()
+    cursor.fetchall.return_value = rows
+    get_cursor = MagicMock()
+    get_cursor.return_value.__enter__.return_value = cursor
+    return get_cursor
+
+
+@pytest.mark.unit
+class TestStreamingTemporalAligner:
+    """Test queueing, pairing and flush accounting."""
+
+    def test_rejects_invalid_arguments(self):
+        """window, max_pending and max_state_age must be positive."""
+        bus = AlignmentEventBus()
+        with pytest.raises(ValueError, match="window"):
+            StreamingTemporalAligner(bus=bus, window=0)
+        with pytest.raises(ValueError, match="max_pending"):
+            StreamingTemporalAligner(bus=bus, max_pending=0)
+        with pytest.raises(ValueError, match="max_state_age"):
+            StreamingTemporalAligner(bus=bus, max_state_age=0)
+
+    def test_flush_pairs_snapshot_with_latest_state(self):
+        """A queued market is aligned to its game's newest state in one insert."""
+        bus = AlignmentEventBus()
+        aligner = StreamingTemporalAligner(bus=bus)
+        now = datetime.now(UTC)
+        aligner.on_game_state(_state(game_state_id=100, state_time=now - timedelta(seconds=40)))
+        aligner.on_game_state(_state(game_state_id=101, state_time=now - timedelta(seconds=5)))
+        bus.add_snapshot_listener(aligner.on_snapshots)
+        bus.publish_snapshots([42])
+
+        get_cursor = _mock_cursor([_snapshot(42)])
+        with (
+            patch("precog.schedulers.streaming_aligner.get_cursor", get_cursor),
+            patch(
+                "precog.schedulers.streaming_aligner.write_alignments",
+                return_value=1,
+            ) as mock_insert,
+        ):
+            assert aligner.flush() == 1
+
+        cursor = get_cursor.return_value.__enter__.return_value
+        assert cursor.execute.call_args.args[1] == ([42],)
+        (row,) = mock_insert.call_args.args[0]
+        assert row["market_snapshot_id"] == 420
+        assert row["game_state_id"] == 101
+        assert row["canonical_event_id"] == 3
+        assert row["alignment_quality"] == "good"  # state 5s before the snapshot
+
+        stats = aligner.get_stats()
+        assert stats["streaming_alignment_rows_written"] == 1
+        assert stats["streaming_alignment_queue_depth"] == 0
+        assert stats["streaming_alignment_lag"]["count"] == 1
+
+    def test_out_of_order_state_ignored(self):
+        """An older state arriving late does not replace the newer one."""
+        aligner = StreamingTemporalAligner(bus=AlignmentEventBus())
+        now = datetime.now(UTC)
+        aligner.on_game_state(_state(game_state_id=101, state_time=now))
+        aligner.on_game_state(_state(game_state_id=100, state_time=now - timedelta(seconds=30)))
+
+        assert aligner._states[7].game_state_id == 101
+
+    def test_market_without_state_skipped(self):
+        """Snapshots of games with no state in memory are counted, not inserted."""
+        bus = AlignmentEventBus()
+        aligner = StreamingTemporalAligner(bus=bus)
+        bus.add_snapshot_listener(aligner.on_snapshots)
+        bus.publish_snapshots([42])
+
+        with (
+            patch(
+                "precog.schedulers.streaming_aligner.get_cursor",
+                _mock_cursor([_snapshot(42, game_id=99)]),
+            ),
+            patch("precog.schedulers.streaming_aligner.write_alignments") as mock_insert,
+        ):
+            assert aligner.flush() == 0
+
+        mock_insert.assert_not_called()
+        assert aligner.get_stats()["streaming_alignment_no_state"] == 1
+
+    def test_empty_queue_skips_database(self):
+        """flush() with nothing queued does not query."""
+        aligner = StreamingTemporalAligner(bus=AlignmentEventBus())
+        with patch("precog.schedulers.streaming_aligner.get_cursor") as get_cursor:
+            assert aligner.flush() == 0
+        get_cursor.assert_not_called()
+
+    def test_flush_error_counted(self):
+        """A failing lookup is logged and counted; the queue is not retried."""
+        bus = AlignmentEventBus()
+        aligner = StreamingTemporalAligner(bus=bus)
+        bus.add_snapshot_listener(aligner.on_snapshots)
+        bus.publish_snapshots([42])
+
+        with patch(
+            "precog.schedulers.streaming_aligner.get_cursor",
+            side_effect=RuntimeError("db down"),
+        ):
+            assert aligner.flush() == 0
+
+        stats = aligner.get_stats()
+        assert stats["streaming_alignment_flush_errors"] == 1
+        assert stats["streaming_alignment_queue_depth"] == 0
+
+    def test_stale_states_pruned(self):
+        """States older than max_state_age are dropped at flush time."""
+        bus = AlignmentEventBus()
+        aligner = StreamingTemporalAligner(bus=bus, max_state_age=60)
+        aligner.on_game_state(
+            _state(game_id=1, state_time=datetime.now(UTC) - timedelta(minutes=5))
+        )
+        aligner.on_game_state(_state(game_id=7))
+        bus.add_snapshot_listener(aligner.on_snapshots)
+        bus.publish_snapshots([42])
+
+        with (
+            patch("precog.schedulers.streaming_aligner.get_cursor", _mock_cursor([])),
+            patch("precog.schedulers.streaming_aligner.write_alignments"),
+        ):
+            aligner.flush()
+
+        assert aligner.get_stats()["streaming_alignment_games_tracked"] == 1
+
+    def test_backpressure_wakes_flusher(self):
+        """Reaching max_pending distinct markets wakes the flusher early."""
+        bus = AlignmentEventBus()
+        aligner = StreamingTemporalAligner(bus=bus, max_pending=2)
+        bus.add_snapshot_listener(aligner.on_snapshots)
+
+        bus.publish_snapshots([1])
+        assert not aligner._wake.is_set()
+        bus.publish_snapshots([2])
+        assert aligner._wake.is_set()
+
+    def test_start_stop_subscribes_and_drains(self):
+        """start() subscribes to the bus; stop() unsubscribes and flushes."""
+        bus = AlignmentEventBus()
+        aligner = StreamingTemporalAligner(bus=bus, window=60)
+        aligner.start()
+        try:
+            assert aligner.is_running()
+            assert bus.get_stats()["alignment_bus_snapshot_listeners"] == 1
+            aligner.on_game_state(_state())
+            bus.publish_snapshots([42])
+        finally:
+            with (
+                patch(
+                    "precog.schedulers.streaming_aligner.get_cursor",
+                    _mock_cursor([_snapshot(42)]),
+                ),
+                patch(
+                    "precog.schedulers.streaming_aligner.write_alignments",
+                    return_value=1,
+                ) as mock_insert,
+            ):
+                aligner.stop()
+
+        assert not aligner.is_running()
+        assert not bus.has_listeners
+        mock_insert.assert_called_once()
@@ -1,33 +1,32 @@
 """Unit tests for temporal_alignment_writer.
 
-Tests the quality classification logic and alignment record building.
-DB interactions are mocked — real DB tests are in integration/.
+Tests the quality classification logic, alignment record building and the
+observation resolution in write_alignments(). DB interactions are mocked —
+real DB tests are in integration/.
 
 Issue: #722
 """
 
 from __future__ import annotations
 
-from datetime import UTC
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-pytest.skip(
-    "V2.45 Migration 0084 redesigned temporal_alignment as pure-linkage table; "
-    "temporal_alignment_writer references columns dropped under V2.45. "
-    "Cohort 5+ rewrite per ADR-118 V2.45 Item 6 + issue #1141.",
-    allow_module_level=True,
-)
-
-from precog.schedulers.temporal_alignment_writer import (  # noqa: E402
+from precog.schedulers.temporal_alignment_writer import (
+    AlignmentBatch,
     TemporalAlignmentWriter,
     _classify_quality,
+    build_alignment_record,
     create_temporal_alignment_writer,
     find_unaligned_pairs,
+    write_alignments,
 )
 
+NOW = datetime(2026, 1, 18, 20, 30, tzinfo=UTC)
+
 
 class TestClassifyQuality:
     """Verify quality thresholds are correct."""
@@ -63,62 +62,115 @@ class TestClassifyQuality:
         assert _classify_quality(Decimal("120")) == "poor"
 
 
+def _mock_cursor(mock_get_cursor: MagicMock, snapshot_rows: list) -> MagicMock:
+    """Cursor returning the snapshot page."""
+    mock_cursor = MagicMock()
+    mock_cursor.fetchall.return_value = snapshot_rows
+    mock_get_cursor.return_value.__enter__ = MagicMock(return_value=mock_cursor)
+    mock_get_cursor.return_value.__exit__ = MagicMock(return_value=False)
+    return mock_cursor
+
+
+def _snapshot_row(snapshot_id: int, before: tuple | None, after: tuple | None, **overrides) -> dict:
+    """Snapshot page row; before/after are (state_id, seconds offset) or None."""
+    row = {
+        "market_snapshot_id": snapshot_id,
+        "market_id": 10,
+        "snapshot_time": NOW,
+        "game_id": 5,
+        "canonical_event_id": 3,
+        "before_state_id": None,
+        "before_state_time": None,
+        "after_state_id": None,
+        "after_state_time": None,
+    }
+    if before is not None:
+        row["before_state_id"] = before[0]
+        row["before_state_time"] = NOW - timedelta(seconds=before[1])
+    if after is not None:
+        row["after_state_id"] = after[0]
+        row["after_state_time"] = NOW + timedelta(seconds=after[1])
+    row.update(overrides)
+    return row
+
+
 class TestFindUnalignedPairs:
-    """Test the query-to-dict transformation in find_unaligned_pairs."""
+    """Test the watermark page -> alignment dict transformation."""
 
     @patch("precog.schedulers.temporal_alignment_writer.get_cursor")
     def test_empty_result(self, mock_get_cursor: MagicMock) -> None:
-        """No unaligned pairs returns empty list."""
-        mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = []
-        mock_get_cursor.return_value.__enter__ = MagicMock(return_value=mock_cursor)
-        mock_get_cursor.return_value.__exit__ = MagicMock(return_value=False)
+        """No new snapshots: no alignments and the watermark is unchanged."""
+        mock_cursor = _mock_cursor(mock_get_cursor, [])
 
-        result = find_unaligned_pairs()
-        assert result == []
+        batch = find_unaligned_pairs(after_snapshot_id=77)
+
+        assert batch.alignments == []
+        assert batch.last_snapshot_id == 77
+        assert batch.snapshots_scanned == 0
+        mock_cursor.execute.assert_called_once()
 
     @patch("precog.schedulers.temporal_alignment_writer.get_cursor")
     def test_transforms_rows_to_dicts(self, mock_get_cursor: MagicMock) -> None:
-        """Rows from the query are transformed into alignment dicts."""
-        from datetime import datetime
-
-        now = datetime.now(tz=UTC)
-        mock_row = {
-            "market_snapshot_id": 42,
-            "market_id": 10,
-            "snapshot_time": now,
-            "yes_ask_price": Decimal("0.6500"),
-            "no_ask_price": Decimal("0.3800"),
-            "spread": Decimal("0.0300"),
-            "volume": 1500,
-            "game_state_id": 99,
-            "game_state_time": now,
-            "game_status": "in",
-            "home_score": 21,
-            "away_score": 14,
-            "period": "3",
-            "clock": "8:42",
-            "game_id": 5,
-            "time_delta_raw": Decimal("2.34"),
-        }
-
-        mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = [mock_row]
-        mock_get_cursor.return_value.__enter__ = MagicMock(return_value=mock_cursor)
-        mock_get_cursor.return_value.__exit__ = MagicMock(return_value=False)
+        """Snapshot + chosen game_state become one pair record."""
+        _mock_cursor(mock_get_cursor, [_snapshot_row(42, before=(99, 2.34), after=(100, 20))])
 
-        result = find_unaligned_pairs()
-        assert len(result) == 1
+        batch = find_unaligned_pairs()
+        assert len(batch.alignments) == 1
 
-        alignment = result[0]
+        alignment = batch.alignments[0]
         assert alignment["market_snapshot_id"] == 42
         assert alignment["game_state_id"] == 99
+        assert alignment["game_state_time"] == NOW - timedelta(seconds=2.34)
         assert alignment["time_delta_seconds"] == Decimal("2.34")
         assert alignment["alignment_quality"] == "good"  # 2.34s is within 15s
-        assert alignment["yes_ask_price"] == Decimal("0.6500")
-        assert alignment["game_id"] == 5
-        assert alignment["home_score"] == 21
-        assert alignment["clock"] == "8:42"
+        assert alignment["canonical_event_id"] == 3
+        assert batch.last_snapshot_id == 42
+
+    @patch("precog.schedulers.temporal_alignment_writer.get_cursor")
+    def test_picks_nearer_probe(self, mock_get_cursor: MagicMock) -> None:
+        """The state after the snapshot wins when it is closer."""
+        _mock_cursor(mock_get_cursor, [_snapshot_row(1, before=(10, 25), after=(11, 3))])
+
+        alignment = find_unaligned_pairs().alignments[0]
+
+        assert alignment["game_state_id"] == 11
+        assert alignment["time_delta_seconds"] == Decimal("3.0")
+
+    @patch("precog.schedulers.temporal_alignment_writer.get_cursor")
+    def test_tie_prefers_earlier_state(self, mock_get_cursor: MagicMock) -> None:
+        """Equidistant probes resolve to the state before the snapshot."""
+        _mock_cursor(mock_get_cursor, [_snapshot_row(1, before=(10, 5), after=(11, 5))])
+
+        assert find_unaligned_pairs().alignments[0]["game_state_id"] == 10
+
+    @patch("precog.schedulers.temporal_alignment_writer.get_cursor")
+    def test_snapshot_without_state_advances_watermark(self, mock_get_cursor: MagicMock) -> None:
+        """A game with no state yet yields no alignment but is not re-read."""
+        _mock_cursor(
+            mock_get_cursor,
+            [_snapshot_row(7, before=(10, 4), after=None), _snapshot_row(8, None, None)],
+        )
+
+        batch = find_unaligned_pairs(after_snapshot_id=6)
+
+        assert [a["market_snapshot_id"] for a in batch.alignments] == [7]
+        assert batch.last_snapshot_id == 8
+        assert batch.snapshots_scanned == 2
+
+    @patch("precog.schedulers.temporal_alignment_writer.get_cursor")
+    def test_query_params(self, mock_get_cursor: MagicMock) -> None:
+        """Settle prefix (watermark, delay), then watermark, lookback and limit."""
+        mock_cursor = _mock_cursor(mock_get_cursor, [])
+
+        find_unaligned_pairs(
+            lookback_seconds=300, batch_limit=50, after_snapshot_id=9, settle_seconds=15
+        )
+
+        sql, params = mock_cursor.execute.call_args.args
+        assert "ms.id > %s" in sql
+        assert "ms.id < unsettled.first_unsettled_id" in sql
+        assert "ABS(EXTRACT(EPOCH" not in sql
+        assert params == (9, 15, 9, 300, 50)
 
     @pytest.mark.parametrize(
         ("lookback", "limit"),
@@ -129,40 +181,125 @@ class TestFindUnalignedPairs:
         with pytest.raises(ValueError, match="must be positive"):
             find_unaligned_pairs(lookback_seconds=lookback, batch_limit=limit)
 
+    def test_rejects_negative_watermark(self) -> None:
+        with pytest.raises(ValueError, match="non-negative"):
+            find_unaligned_pairs(after_snapshot_id=-1)
+
     @patch("precog.schedulers.temporal_alignment_writer.get_cursor")
-    def test_null_prices_handled(self, mock_get_cursor: MagicMock) -> None:
-        """NULL price fields remain None (not Decimal)."""
-        from datetime import datetime
-
-        now = datetime.now(tz=UTC)
-        mock_row = {
-            "market_snapshot_id": 1,
-            "market_id": 1,
-            "snapshot_time": now,
-            "yes_ask_price": None,
-            "no_ask_price": None,
-            "spread": None,
-            "volume": None,
-            "game_state_id": 1,
-            "game_state_time": now,
-            "game_status": "pre",
-            "home_score": 0,
-            "away_score": 0,
-            "period": "0",
-            "clock": None,
-            "game_id": 1,
-            "time_delta_raw": Decimal("0.5"),
+    def test_null_canonical_event_passed_through(self, mock_get_cursor: MagicMock) -> None:
+        """A game not yet linked to a canonical event still aligns, untagged."""
+        _mock_cursor(
+            mock_get_cursor,
+            [_snapshot_row(1, before=(1, 0.5), after=None, canonical_event_id=None)],
+        )
+
+        assert find_unaligned_pairs().alignments[0]["canonical_event_id"] is None
+
+
+def _pair(snapshot_id: int, state_id: int, delta: str = "2.00") -> dict:
+    snapshot = {
+        "market_id": 10,
+        "market_snapshot_id": snapshot_id,
+        "snapshot_time": NOW,
+        "canonical_event_id": 3,
+    }
+    return build_alignment_record(
+        snapshot, state_id, NOW - timedelta(seconds=float(Decimal(delta)))
+    )
+
+
+_WRITER = "precog.schedulers.temporal_alignment_writer"
+
+
+@patch(f"{_WRITER}.insert_temporal_alignment_batch", side_effect=len)
+@patch(f"{_WRITER}.append_observation_row")
+@patch(f"{_WRITER}.get_observations_by_payload")
+@patch(f"{_WRITER}.get_observation_source_id", side_effect={"kalshi": 2, "espn": 1}.get)
+class TestWriteAlignments:
+    """Test observation resolution and the linkage rows handed to the insert."""
+
+    def test_reuses_existing_and_appends_missing(
+        self,
+        mock_source: MagicMock,
+        mock_lookup: MagicMock,
+        mock_append: MagicMock,
+        mock_insert: MagicMock,
+    ) -> None:
+        """Found observations are reused; missing ones are appended once per row."""
+        snapshot_obs = (501, NOW)
+        state_obs = (601, NOW)
+        # Snapshot 42 was observed before; game state 99 was not.
+        mock_lookup.side_effect = [[snapshot_obs, None], [None]]
+        mock_append.side_effect = [(502, NOW), state_obs]
+
+        written = write_alignments([_pair(42, 99), _pair(43, 99, "20.00")])
+
+        assert written == 2
+        assert [c.args for c in mock_lookup.call_args_list] == [
+            (2, [{"market_snapshot_id": 42}, {"market_snapshot_id": 43}]),
+            (1, [{"game_state_id": 99}]),
+        ]
+        appended = [c.kwargs for c in mock_append.call_args_list]
+        assert [(a["observation_kind"], a["payload"]) for a in appended] == [
+            ("market_snapshot", {"market_snapshot_id": 43}),
+            ("game_state", {"game_state_id": 99}),
+        ]
+        assert appended[0]["source_id"] == 2
+        assert appended[0]["canonical_primary_event_id"] == 3
+        assert appended[1]["source_published_at"] == NOW - timedelta(seconds=2)
+
+        rows = mock_insert.call_args.args[0]
+        assert rows[0] == {
+            "observation_a_id": 501,
+            "observation_a_ingested_at": NOW,
+            "observation_b_id": 601,
+            "observation_b_ingested_at": NOW,
+            "canonical_event_id": 3,
+            "time_delta_seconds": Decimal("2.0"),
+            "alignment_quality": "good",
         }
+        assert (rows[1]["observation_a_id"], rows[1]["alignment_quality"]) == (502, "fair")
 
-        mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = [mock_row]
-        mock_get_cursor.return_value.__enter__ = MagicMock(return_value=mock_cursor)
-        mock_get_cursor.return_value.__exit__ = MagicMock(return_value=False)
+    def test_failed_append_drops_only_its_pairs(
+        self,
+        mock_source: MagicMock,
+        mock_lookup: MagicMock,
+        mock_append: MagicMock,
+        mock_insert: MagicMock,
+    ) -> None:
+        """A row whose observation cannot be appended is retried later, not fatal."""
+        mock_lookup.side_effect = [[None, (502, NOW)], [(601, NOW)]]
+        mock_append.side_effect = RuntimeError("check violation")
 
-        result = find_unaligned_pairs()
-        assert result[0]["yes_ask_price"] is None
-        assert result[0]["no_ask_price"] is None
-        assert result[0]["spread"] is None
+        assert write_alignments([_pair(42, 99), _pair(43, 99)]) == 1
+        (row,) = mock_insert.call_args.args[0]
+        assert row["observation_a_id"] == 502
+
+    def test_empty_pairs_skip_database(
+        self,
+        mock_source: MagicMock,
+        mock_lookup: MagicMock,
+        mock_append: MagicMock,
+        mock_insert: MagicMock,
+    ) -> None:
+        assert write_alignments([]) == 0
+        mock_source.assert_not_called()
+        mock_insert.assert_not_called()
+
+    def test_missing_source_raises(
+        self,
+        mock_source: MagicMock,
+        mock_lookup: MagicMock,
+        mock_append: MagicMock,
+        mock_insert: MagicMock,
+    ) -> None:
+        """An unseeded observation_source fails loudly instead of dropping pairs."""
+        mock_source.side_effect = None
+        mock_source.return_value = None
+
+        with pytest.raises(RuntimeError, match="kalshi"):
+            write_alignments([_pair(42, 99)])
+        mock_insert.assert_not_called()
 
 
 class TestTemporalAlignmentWriter:
@@ -173,21 +310,30 @@ class TestTemporalAlignmentWriter:
         assert writer.poll_interval == 30
         assert writer._lookback_seconds == 600
         assert writer._batch_limit == 1000
+        assert writer._last_snapshot_id == 0
 
     def test_custom_construction(self) -> None:
         writer = TemporalAlignmentWriter(
             poll_interval=60,
             lookback_seconds=300,
             batch_limit=500,
+            max_batches_per_cycle=3,
+            settle_seconds=10,
         )
         assert writer.poll_interval == 60
         assert writer._lookback_seconds == 300
         assert writer._batch_limit == 500
+        assert writer._max_batches_per_cycle == 3
+        assert writer._settle_seconds == 10
 
     def test_min_poll_interval_enforced(self) -> None:
         with pytest.raises(ValueError, match="at least 5"):
             TemporalAlignmentWriter(poll_interval=2)
 
+    def test_max_batches_validated(self) -> None:
+        with pytest.raises(ValueError, match="max_batches_per_cycle"):
+            TemporalAlignmentWriter(max_batches_per_cycle=0)
+
     def test_job_name(self) -> None:
         writer = TemporalAlignmentWriter()
         assert writer._get_job_name() == "Temporal Alignment Writer"
@@ -197,38 +343,97 @@ class TestTemporalAlignmentWriter:
         assert TemporalAlignmentWriter.HEALTH_COMPONENT == "temporal_alignment"
         assert TemporalAlignmentWriter.BREAKER_TYPE == "data_stale"
 
-    @patch("precog.schedulers.temporal_alignment_writer.insert_temporal_alignment_batch")
+    @patch("precog.schedulers.temporal_alignment_writer.write_alignments")
     @patch("precog.schedulers.temporal_alignment_writer.find_unaligned_pairs")
     def test_poll_once_no_pairs(
         self,
         mock_find: MagicMock,
         mock_insert: MagicMock,
     ) -> None:
-        """poll_once with no unaligned pairs inserts nothing."""
-        mock_find.return_value = []
-        writer = TemporalAlignmentWriter(lookback_seconds=450, batch_limit=250)
+        """poll_once with no new snapshots inserts nothing."""
+        mock_find.return_value = AlignmentBatch()
+        writer = TemporalAlignmentWriter(lookback_seconds=450, batch_limit=250, settle_seconds=20)
         result = writer._poll_once()
         assert result == {"items_created": 0}
         mock_insert.assert_not_called()
-        # _poll_once must forward the instance's configured lookback/batch
-        # values to find_unaligned_pairs, not default module constants.
-        mock_find.assert_called_once_with(lookback_seconds=450, batch_limit=250)
+        # _poll_once must forward the instance's configured values to
+        # find_unaligned_pairs, not default module constants.
+        mock_find.assert_called_once_with(
+            lookback_seconds=450, batch_limit=250, after_snapshot_id=0, settle_seconds=20
+        )
 
-    @patch("precog.schedulers.temporal_alignment_writer.insert_temporal_alignment_batch")
+    @patch("precog.schedulers.temporal_alignment_writer.write_alignments")
     @patch("precog.schedulers.temporal_alignment_writer.find_unaligned_pairs")
     def test_poll_once_with_pairs(
         self,
         mock_find: MagicMock,
         mock_insert: MagicMock,
     ) -> None:
-        """poll_once with pairs calls batch insert and returns count."""
-        mock_find.return_value = [{"market_snapshot_id": 1}, {"market_snapshot_id": 2}]
+        """poll_once with pairs writes them, returns count, advances watermark."""
+        mock_find.return_value = AlignmentBatch(
+            alignments=[{"market_snapshot_id": 1}, {"market_snapshot_id": 2}],
+            last_snapshot_id=2,
+            snapshots_scanned=2,
+        )
         mock_insert.return_value = 2
         writer = TemporalAlignmentWriter(lookback_seconds=600, batch_limit=1000)
         result = writer._poll_once()
         assert result == {"items_created": 2}
         mock_insert.assert_called_once()
-        mock_find.assert_called_once_with(lookback_seconds=600, batch_limit=1000)
+        assert writer._last_snapshot_id == 2
+
+    @patch("precog.schedulers.temporal_alignment_writer.write_alignments")
+    @patch("precog.schedulers.temporal_alignment_writer.find_unaligned_pairs")
+    def test_poll_once_streams_full_pages(
+        self,
+        mock_find: MagicMock,
+        mock_insert: MagicMock,
+    ) -> None:
+        """Full pages are followed by the next page from the new watermark."""
+        mock_find.side_effect = [
+            AlignmentBatch([{"market_snapshot_id": 1}, {"market_snapshot_id": 2}], 2, 2),
+            AlignmentBatch([{"market_snapshot_id": 3}], 3, 1),
+        ]
+        mock_insert.side_effect = lambda rows: len(rows)
+        writer = TemporalAlignmentWriter(batch_limit=2)
+
+        assert writer._poll_once() == {"items_created": 3}
+        assert [c.kwargs["after_snapshot_id"] for c in mock_find.call_args_list] == [0, 2]
+        assert writer._last_snapshot_id == 3
+
+    @patch("precog.schedulers.temporal_alignment_writer.write_alignments")
+    @patch("precog.schedulers.temporal_alignment_writer.find_unaligned_pairs")
+    def test_poll_once_caps_batches_per_cycle(
+        self,
+        mock_find: MagicMock,
+        mock_insert: MagicMock,
+    ) -> None:
+        """A backlog is drained over several cycles, max_batches_per_cycle at a time."""
+        mock_find.side_effect = [
+            AlignmentBatch([{"market_snapshot_id": i}], i, 1) for i in range(1, 10)
+        ]
+        mock_insert.return_value = 1
+        writer = TemporalAlignmentWriter(batch_limit=1, max_batches_per_cycle=3)
+
+        assert writer._poll_once() == {"items_created": 3}
+        assert mock_find.call_count == 3
+        assert writer._last_snapshot_id == 3
+
+    @patch("precog.schedulers.temporal_alignment_writer.write_alignments")
+    @patch("precog.schedulers.temporal_alignment_writer.find_unaligned_pairs")
+    def test_failed_insert_keeps_watermark(
+        self,
+        mock_find: MagicMock,
+        mock_insert: MagicMock,
+    ) -> None:
+        """A batch whose insert fails is re-read next cycle."""
+        mock_find.return_value = AlignmentBatch([{"market_snapshot_id": 5}], 5, 1)
+        mock_insert.side_effect = RuntimeError("insert failed")
+        writer = TemporalAlignmentWriter()
+
+        with pytest.raises(RuntimeError, match="insert failed"):
+            writer._poll_once()
+        assert writer._last_snapshot_id == 0
 
     @patch("precog.schedulers.temporal_alignment_writer.find_unaligned_pairs")
     def test_poll_once_reraises_exceptions(self, mock_find: MagicMock) -> None:
@@ -0,0 +1 @@
+"""Unit tests for utility modules."""
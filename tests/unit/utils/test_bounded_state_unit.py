@@ -0,0 +1,141 @@
+"""
+Unit Tests for BoundedStateMap.
+
+Tests the lifecycle-aware per-ticker state map used by the Kalshi/ESPN
+validators, KalshiMarketPoller and TeamCodeRegistry.
+
+Reference: TESTING_STRATEGY V3.9 - Unit tests for isolated functionality
+
+Usage:
+    pytest tests/unit/utils/test_bounded_state_unit.py -v -m unit
+"""
+
+from collections import deque
+
+import pytest
+
+from precog.utils.bounded_state import BoundedStateMap
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.unit
+class TestBoundedStateMap:
+    """Test retirement, idle TTL, LRU eviction and gauges."""
+
+    def test_behaves_like_a_dict(self):
+        """Reads, writes, get() defaults, deletes and equality match dict semantics."""
+        state: BoundedStateMap[str, int] = BoundedStateMap("counts")
+        state["A"] = state.get("A", 0) + 1
+        state["A"] = state.get("A", 0) + 1
+        state["B"] = 5
+        del state["B"]
+
+        assert state == {"A": 2}
+        assert dict(state) == {"A": 2}
+        assert "B" not in state
+        with pytest.raises(KeyError):
+            state["B"]
+
+    def test_values_are_returned_by_reference(self):
+        """A mutable value can be updated in place after lookup."""
+        state: BoundedStateMap[str, deque[int]] = BoundedStateMap("history")
+        state["A"] = deque(maxlen=3)
+        state["A"].append(1)
+
+        assert list(state["A"]) == [1]
+
+    def test_retired_entry_dropped_after_grace(self):
+        """retire() keeps the entry for retire_ttl_seconds; touches do not extend it."""
+        clock = FakeClock()
+        state: BoundedStateMap[str, int] = BoundedStateMap(
+            "counts", retire_ttl_seconds=60, clock=clock
+        )
+        state["A"] = 1
+        state.retire("A")
+
+        clock.now += 59
+        state["A"] = 2  # write during grace keeps the original deadline
+        state.retire("A")  # and so does a second retire()
+        assert state["A"] == 2
+
+        clock.now += 1
+        assert "A" not in state
+        assert state.get("A") is None
+        stats = state.get_stats()
+        assert stats["counts_retired"] == 1
+        assert stats["counts_expirations"] == 1
+
+    def test_retire_with_zero_grace_drops_immediately(self):
+        """retire_ttl_seconds=0 removes the entry on retire()."""
+        state: BoundedStateMap[str, int] = BoundedStateMap("counts", retire_ttl_seconds=0)
+        state["A"] = 1
+        state.retire("A")
+
+        assert len(state) == 0
+
+    def test_retire_missing_key_is_noop(self):
+        """Retiring an unknown key does nothing."""
+        state: BoundedStateMap[str, int] = BoundedStateMap("counts")
+        state.retire("missing")
+
+        assert state.get_stats()["counts_retired"] == 0
+
+    def test_idle_entries_expire(self):
+        """Entries untouched for ttl_seconds disappear; touching one renews it."""
+        clock = FakeClock()
+        state: BoundedStateMap[str, int] = BoundedStateMap("counts", ttl_seconds=100, clock=clock)
+        state["idle"] = 1
+        state["busy"] = 1
+
+        clock.now += 90
+        assert state["busy"] == 1
+        clock.now += 10
+
+        assert list(state) == ["busy"]
+
+    def test_expired_entries_are_swept_on_write(self):
+        """A write after the sweep interval removes every expired entry."""
+        clock = FakeClock()
+        state: BoundedStateMap[str, int] = BoundedStateMap("counts", ttl_seconds=10, clock=clock)
+        for i in range(100):
+            state[str(i)] = i
+
+        clock.now += BoundedStateMap.SWEEP_INTERVAL_SECONDS
+        state["new"] = 1
+
+        assert len(state) == 1
+        assert state.get_stats()["counts_expirations"] == 100
+
+    def test_lru_eviction_beyond_max_size(self):
+        """The least-recently-used key is evicted first."""
+        state: BoundedStateMap[str, int] = BoundedStateMap("counts", max_size=2)
+        state["A"] = 1
+        state["B"] = 2
+        _ = state["A"]  # A is now most recently used
+        state["C"] = 3
+
+        assert set(state) == {"A", "C"}
+        assert state.get_stats() == {
+            "counts_size": 2,
+            "counts_evictions": 1,
+            "counts_expirations": 0,
+            "counts_retired": 0,
+        }
+
+    def test_rejects_invalid_limits(self):
+        """Non-positive sizes and TTLs are rejected."""
+        with pytest.raises(ValueError):
+            BoundedStateMap("x", max_size=0)
+        with pytest.raises(ValueError):
+            BoundedStateMap("x", ttl_seconds=0)
+        with pytest.raises(ValueError):
+            BoundedStateMap("x", retire_ttl_seconds=-1)
@@ -0,0 +1,106 @@
+"""
+Unit Tests for LatencyHistogram.
+
+Tests the fixed-bucket histogram ESPNGamePoller uses for per-league fetch,
+parse and sync latency, and the metrics registry uses for Histogram children.
+
+Reference: TESTING_STRATEGY V3.9 - Unit tests for isolated functionality
+
+Usage:
+    pytest tests/unit/utils/test_latency_histogram_unit.py -v -m unit
+"""
+
+import threading
+
+import pytest
+
+from precog.utils.latency_histogram import DEFAULT_LATENCY_BUCKETS, LatencyHistogram
+
+
+@pytest.mark.unit
+class TestLatencyHistogram:
+    """Bucket counting, quantile estimates and validation."""
+
+    def test_empty_snapshot(self) -> None:
+        """No observations: zero counts and no quantiles."""
+        snapshot = LatencyHistogram().snapshot()
+
+        assert snapshot["count"] == 0
+        assert snapshot["p50"] is None
+        assert snapshot["p99"] is None
+        assert snapshot["buckets"]["+Inf"] == 0
+        assert len(snapshot["buckets"]) == len(DEFAULT_LATENCY_BUCKETS) + 1
+
+    def test_cumulative_buckets(self) -> None:
+        """Bucket counts are cumulative 'less than or equal' counts."""
+        hist = LatencyHistogram(buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            hist.observe(value)
+
+        snapshot = hist.snapshot()
+
+        assert snapshot["buckets"] == {"0.1": 2, "1.0": 3, "+Inf": 4}
+        assert snapshot["count"] == 4
+        assert snapshot["sum"] == pytest.approx(2.65)
+        assert snapshot["max"] == 2.0
+
+    def test_quantile_interpolates_within_bucket(self) -> None:
+        """Ranks are interpolated linearly across the containing bucket."""
+        hist = LatencyHistogram(buckets=(1.0, 2.0))
+        for _ in range(50):
+            hist.observe(0.5)
+        for _ in range(50):
+            hist.observe(1.9)
+
+        assert hist.quantile(0.5) == pytest.approx(1.0)
+        assert hist.quantile(0.75) == pytest.approx(1.5)
+
+    def test_quantile_never_exceeds_max(self) -> None:
+        """Interpolation is clamped to the largest observed value."""
+        hist = LatencyHistogram(buckets=(1.0,))
+        hist.observe(0.2)
+
+        assert hist.quantile(0.99) == pytest.approx(0.2)
+
+    def test_overflow_bucket_reports_max(self) -> None:
+        """Ranks above the last bound return the observed maximum."""
+        hist = LatencyHistogram(buckets=(0.1,))
+        hist.observe(0.05)
+        hist.observe(42.0)
+
+        assert hist.quantile(0.99) == 42.0
+
+    def test_negative_values_clamped(self) -> None:
+        """Clock skew cannot produce negative durations."""
+        hist = LatencyHistogram()
+        hist.observe(-1.0)
+
+        assert hist.snapshot()["max"] == 0.0
+        assert hist.snapshot()["buckets"][repr(DEFAULT_LATENCY_BUCKETS[0])] == 1
+
+    @pytest.mark.parametrize("buckets", [(), (0.0, 1.0), (1.0, 1.0), (2.0, 1.0)])
+    def test_invalid_buckets_rejected(self, buckets: tuple[float, ...]) -> None:
+        """Buckets must be non-empty, positive and strictly increasing."""
+        with pytest.raises(ValueError, match="buckets"):
+            LatencyHistogram(buckets=buckets)
+
+    def test_invalid_quantile_rejected(self) -> None:
+        """q outside [0, 1] raises ValueError."""
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            LatencyHistogram().quantile(1.5)
+
+    def test_concurrent_observe(self) -> None:
+        """Observations from many threads are all counted."""
+        hist = LatencyHistogram()
+
+        def worker() -> None:
+            for _ in range(1000):
+                hist.observe(0.01)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert hist.snapshot()["count"] == 8000
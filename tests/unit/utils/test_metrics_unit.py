@@ -0,0 +1,201 @@
+"""
+Unit Tests for the in-process metrics registry.
+
+Tests counters, gauges, fixed-bucket histograms, the Prometheus text
+rendering and the local HTTP endpoint (bound to 127.0.0.1 on a free port).
+
+Reference: TESTING_STRATEGY V3.9 - Unit tests for isolated functionality
+
+Usage:
+    pytest tests/unit/utils/test_metrics_unit.py -v -m unit
+"""
+
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+from precog.utils.metrics import MetricsRegistry, MetricsServer, get_metrics_registry
+
+
+@pytest.mark.unit
+class TestMetricTypes:
+    """Test counter, gauge and histogram recording."""
+
+    def test_counter_labels(self):
+        """Each label combination is counted separately."""
+        registry = MetricsRegistry()
+        polls = registry.counter("polls_total", "Polls", ("poller",))
+
+        polls.labels("espn").inc()
+        polls.labels(poller="espn").inc(2)
+        polls.labels("kalshi").inc()
+
+        assert polls.labels("espn").value == 3
+        assert polls.labels("kalshi").value == 1
+
+    def test_counter_rejects_decrease(self):
+        """Counters only go up."""
+        counter = MetricsRegistry().counter("c_total", "c")
+        with pytest.raises(ValueError, match="increase"):
+            counter.inc(-1)
+
+    def test_label_mismatch_rejected(self):
+        """Wrong label count or names raise ValueError."""
+        counter = MetricsRegistry().counter("c_total", "c", ("poller",))
+        with pytest.raises(ValueError):
+            counter.labels("a", "b")
+        with pytest.raises(ValueError):
+            counter.labels(league="nfl")
+        with pytest.raises(ValueError, match="labels"):
+            counter.inc()
+
+    def test_gauge_set_inc_dec_and_function(self):
+        """Gauges move both ways or read a callback at scrape time."""
+        registry = MetricsRegistry()
+        in_use = registry.gauge("in_use", "In use")
+        in_use.inc(3)
+        in_use.dec()
+        assert in_use.labels().value == 2
+        in_use.set(7)
+        assert in_use.labels().value == 7
+
+        depth = registry.gauge("depth", "Depth")
+        depth.set_function(lambda: 42)
+        assert depth.labels().value == 42
+
+    def test_histogram_quantiles(self):
+        """Quantiles interpolate within buckets and never exceed the max."""
+        histogram = MetricsRegistry().histogram("h", "h", buckets=(0.1, 1.0, 10.0))
+        for _ in range(90):
+            histogram.observe(0.05)
+        for _ in range(10):
+            histogram.observe(5.0)
+
+        snap = histogram.labels().snapshot()
+        assert snap["count"] == 100
+        assert snap["p50"] <= 0.1
+        assert 1.0 < snap["p99"] <= 5.0
+        assert snap["buckets"] == {"0.1": 90, "1.0": 90, "10.0": 100, "+Inf": 100}
+
+    def test_empty_histogram_quantile_is_none(self):
+        """No observations means no quantile."""
+        histogram = MetricsRegistry().histogram("h", "h")
+        assert histogram.labels().quantile(0.99) is None
+
+    def test_histogram_rejects_unsorted_buckets(self):
+        """Buckets must be strictly increasing."""
+        with pytest.raises(ValueError, match="buckets"):
+            MetricsRegistry().histogram("h", "h", buckets=(1.0, 0.5))
+
+
+@pytest.mark.unit
+class TestMetricsRegistry:
+    """Test registration, collect hooks and rendering."""
+
+    def test_get_or_create(self):
+        """Declaring a metric twice returns the same object."""
+        registry = MetricsRegistry()
+        first = registry.counter("c_total", "c", ("x",))
+        assert registry.counter("c_total", "c", ("x",)) is first
+        assert registry.get("c_total") is first
+
+    def test_conflicting_registration_rejected(self):
+        """Re-declaring with another type or labels raises ValueError."""
+        registry = MetricsRegistry()
+        registry.counter("m", "m", ("x",))
+        with pytest.raises(ValueError, match="already registered"):
+            registry.gauge("m", "m", ("x",))
+        with pytest.raises(ValueError, match="already registered"):
+            registry.counter("m", "m", ("y",))
+
+    def test_render_text_format(self):
+        """Output follows the Prometheus text exposition format."""
+        registry = MetricsRegistry()
+        registry.counter("polls_total", "Completed polls", ("poller",)).labels("espn").inc(3)
+        registry.histogram("poll_seconds", "Poll time", buckets=(0.5, 1.0)).observe(0.75)
+
+        text = registry.render()
+
+        assert "# TYPE polls_total counter" in text
+        assert 'polls_total{poller="espn"} 3' in text
+        assert "# TYPE poll_seconds histogram" in text
+        assert 'poll_seconds_bucket{le="0.5"} 0' in text
+        assert 'poll_seconds_bucket{le="1.0"} 1' in text
+        assert 'poll_seconds_bucket{le="+Inf"} 1' in text
+        assert "poll_seconds_sum 0.75" in text
+        assert "poll_seconds_count 1" in text
+
+    def test_label_values_escaped(self):
+        """Quotes and backslashes in label values are escaped."""
+        registry = MetricsRegistry()
+        registry.counter("c_total", "c", ("x",)).labels('a"b\\c').inc()
+        assert 'c_total{x="a\\"b\\\\c"} 1' in registry.render()
+
+    def test_collect_hooks_run_before_render(self):
+        """Hooks update values at scrape time; failing hooks are isolated."""
+        registry = MetricsRegistry()
+        gauge = registry.gauge("up", "Up")
+
+        def broken() -> None:
+            raise RuntimeError("boom")
+
+        registry.add_collect_hook(broken)
+        registry.add_collect_hook(lambda: gauge.set(1))
+
+        assert registry.snapshot()["up"] == {"": 1.0}
+
+    def test_remove_collect_hook(self):
+        """Removed hooks no longer run; removing twice is harmless."""
+        registry = MetricsRegistry()
+        calls: list[int] = []
+
+        def hook() -> None:
+            calls.append(1)
+
+        registry.add_collect_hook(hook)
+        registry.remove_collect_hook(hook)
+        registry.remove_collect_hook(hook)
+        registry.render()
+
+        assert calls == []
+
+    def test_shared_registry_is_singleton(self):
+        """get_metrics_registry() returns one instance per process."""
+        assert get_metrics_registry() is get_metrics_registry()
+
+
+@pytest.mark.unit
+class TestMetricsServer:
+    """Test the local HTTP exposition endpoint."""
+
+    def test_serves_text_and_json(self):
+        """/metrics returns text, /metrics.json a snapshot, others 404."""
+        registry = MetricsRegistry()
+        registry.counter("polls_total", "Polls").inc(2)
+        server = MetricsServer(registry, port=0)
+        server.start()
+        try:
+            assert server.port != 0
+            with urllib.request.urlopen(server.url, timeout=5) as response:
+                assert response.headers["Content-Type"].startswith("text/plain")
+                assert "polls_total 2" in response.read().decode()
+
+            json_url = server.url.replace("/metrics", "/metrics.json")
+            with urllib.request.urlopen(json_url, timeout=5) as response:
+                assert json.loads(response.read()) == {"polls_total": {"": 2.0}}
+
+            with pytest.raises(urllib.error.HTTPError) as exc_info:
+                urllib.request.urlopen(server.url + "/missing", timeout=5)
+            assert exc_info.value.code == 404
+        finally:
+            server.stop()
+
+    def test_stop_is_idempotent(self):
+        """stop() before start() or twice does nothing."""
+        server = MetricsServer(MetricsRegistry(), port=0)
+        server.stop()
+        server.start()
+        server.stop()
+        server.stop()
@@ -465,6 +465,17 @@ class TestAnomalyTracking:
         all_counts = validator.get_all_anomaly_counts()
         assert "401547389" in all_counts
 
+    def test_final_game_count_is_retired(
+        self, validator: ESPNDataValidator, valid_game_state: dict
+    ) -> None:
+        """A final game's anomaly count stays readable but is scheduled for eviction."""
+        valid_game_state["state"]["home_score"] = -1
+        valid_game_state["state"]["game_status"] = "final"
+        validator.validate_game_state(valid_game_state)  # type: ignore[arg-type]
+
+        assert validator.get_anomaly_count("401547389") >= 1
+        assert validator.get_state_stats()["anomaly_counts_retired"] == 1
+
     def test_tracking_disabled(self, valid_game_state: dict) -> None:
         """Tracking disabled should not store counts."""
         validator = ESPNDataValidator(track_anomalies=False)
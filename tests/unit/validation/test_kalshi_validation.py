@@ -12,11 +12,13 @@ Tests comprehensive validation of Kalshi API response data including:
 - Timestamp validation (ISO 8601, logical ordering, status-temporal consistency)
 - Price staleness detection (unchanged prices across consecutive polls)
 - Cross-field consistency (volume/OI anomalies)
+- Columnar batch validation (parity with per-market validation)
 
 Reference: Issue #222 (Kalshi Validation Module), #387 (Staleness + Timestamps)
 Related: src/precog/validation/kalshi_validation.py
 """
 
+import random
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 
@@ -1338,6 +1340,16 @@ class TestPriceStaleness:
         stale = [i for i in result.issues if i.field == "price_staleness"]
         assert len(stale) == 0
 
+    def test_settled_market_state_is_retired(self, validator: KalshiDataValidator) -> None:
+        """A market validated as settled has its per-ticker state scheduled for eviction."""
+        market = {"ticker": "TEST-SETTLE", "status": "active", "yes_bid_dollars": Decimal("0.50")}
+        validator.validate_market_data(market)
+        validator.validate_market_batch([{**market, "status": "settled"}])
+
+        stats = validator.get_state_stats()
+        assert stats["price_history_retired"] == 1
+        assert stats["anomaly_counts_retired"] == 1
+
 
 # =============================================================================
 # Timestamp Parsing Edge Cases (#387 — S3/CG-1)
@@ -1394,3 +1406,142 @@ class TestTimestampParsing:
         result = KalshiDataValidator._parse_iso8601("2025-12-14T12:00:00.123456Z")
         assert result is not None
         assert result.microsecond == 123456
+
+
+# =============================================================================
+# Columnar Market Validation Tests
+# =============================================================================
+
+
+def _random_market(rng: random.Random, index: int) -> dict:
+    """Market dict mixing valid, edge-case and invalid field values."""
+    now = datetime.now(UTC)
+
+    def price() -> Decimal | None:
+        return rng.choice(
+            [
+                None,
+                Decimal("0"),
+                Decimal("1"),
+                Decimal("1.0000"),
+                Decimal("-0.01"),
+                Decimal("1.01"),
+                Decimal(rng.randint(0, 100)) / 100,
+                Decimal(rng.randint(0, 10000)) / 10000,
+            ]
+        )
+
+    def timestamp(offset_days: int) -> str | None:
+        return rng.choice(
+            [
+                None,
+                "",
+                "not-a-date",
+                "2025-12-14T12:00:00",  # naive
+                (now + timedelta(days=offset_days + rng.randint(-3, 3))).isoformat(),
+                (now + timedelta(days=offset_days)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            ]
+        )
+
+    return {
+        "ticker": rng.choice([f"KXTEST-{index % 7}", f"KXTEST-{index % 7}", "", "unknown"]),
+        "status": rng.choice(
+            [
+                "active",
+                "open",
+                "settled",
+                "finalized",
+                "unopened",
+                "initialized",
+                "closed",
+                "weird",
+                None,
+            ]
+        ),
+        "yes_bid_dollars": price(),
+        "yes_ask_dollars": price(),
+        "no_bid_dollars": price(),
+        "no_ask_dollars": price(),
+        "volume_fp": rng.choice([None, "0.00", "-5.00", "2000000.00", "150.00", "junk"]),
+        "open_interest_fp": rng.choice([None, "0.00", "-1.00", "600000.00", "25.00"]),
+        "volume_24h_fp": rng.choice([None, "0.00", "100.00", "3000000.00"]),
+        "open_time": timestamp(-5),
+        "close_time": timestamp(5),
+        "expiration_time": timestamp(6),
+        "settlement_time": timestamp(9),
+    }
+
+
+class TestColumnarMarketValidation:
+    """validate_market_batch()/validate_markets() agree with validate_market_data()."""
+
+    def test_matches_per_market_validation(self) -> None:
+        """Issues, anomaly counts and staleness history match across repeated polls."""
+        rng = random.Random(222)
+        markets = [_random_market(rng, i) for i in range(300)]
+        columnar = KalshiDataValidator()
+        reference = KalshiDataValidator()
+
+        # Repeated polls of the same page exercise the staleness history
+        for _ in range(12):
+            results = columnar.validate_markets(markets)
+            expected = [reference.validate_market_data(market) for market in markets]
+            assert results == expected
+
+        assert columnar.get_all_anomaly_counts() == reference.get_all_anomaly_counts()
+        assert columnar._price_history == reference._price_history
+
+    def test_counts_come_from_masks(self) -> None:
+        """Batch counts and warning breakdown equal those of the per-market results."""
+        rng = random.Random(485)
+        markets = [_random_market(rng, i) for i in range(300)]
+
+        batch = KalshiDataValidator().validate_market_batch(markets)
+        expected = [KalshiDataValidator().validate_market_data(m) for m in markets]
+
+        assert batch.total == 300
+        assert batch.error_count == sum(r.has_errors for r in expected)
+        assert batch.warning_only_count == sum(
+            r.has_warnings and not r.has_errors for r in expected
+        )
+        assert batch.valid_count == sum(r.is_valid for r in expected)
+        breakdown: dict[str, int] = {}
+        for result in expected:
+            for issue in result.warnings:
+                breakdown[issue.field] = breakdown.get(issue.field, 0) + 1
+        assert batch.warning_breakdown == breakdown
+        assert batch.results == [r for r in expected if r.issues]
+
+    def test_clean_markets_get_no_results(
+        self, validator: KalshiDataValidator, valid_market_data: dict
+    ) -> None:
+        """Only markets with issues are materialized."""
+        bad = {**valid_market_data, "ticker": "KXTEST-BAD", "volume_fp": "-1.00"}
+
+        batch = validator.validate_market_batch([valid_market_data, bad, valid_market_data])
+
+        assert [r.entity_id for r in batch.results] == ["KXTEST-BAD"]
+        assert batch.error_count == 1
+        assert batch.valid_count == 2
+
+    def test_unrepresentable_values_use_per_market_path(
+        self, validator: KalshiDataValidator
+    ) -> None:
+        """Float prices and sub-micro-dollar prices are still validated exactly."""
+        markets = [
+            {"ticker": "KXTEST-FLOAT", "status": "open", "yes_bid_dollars": 0.45},
+            {"ticker": "KXTEST-FINE", "status": "open", "yes_ask_dollars": Decimal("1.0000001")},
+            {"ticker": "KXTEST-OK", "status": "open", "yes_ask_dollars": Decimal("0.5")},
+        ]
+
+        batch = validator.validate_market_batch(markets)
+
+        assert [r.entity_id for r in batch.results] == ["KXTEST-FLOAT", "KXTEST-FINE"]
+        assert "float contamination" in batch.results[0].errors[0].message
+        assert batch.results[1].errors[0].message == "Price above maximum"
+        assert batch.error_count == 2
+
+    def test_empty_batch(self, validator: KalshiDataValidator) -> None:
+        """An empty page validates to zero counts."""
+        batch = validator.validate_market_batch([])
+        assert (batch.total, batch.error_count, batch.results) == (0, 0, [])